@@ -0,0 +1,97 @@
+"""Add health_check_rollups table for portable health downsampling
+
+Revision ID: 38
+Revises: 37
+Create Date: 2026-01-14 10:30:00.000000
+
+Migration 32 only provides hourly aggregates and retention when TimescaleDB
+is installed. This table backs the database-agnostic rollup job, which
+builds 1-minute, 1-hour and 1-day min/avg/max buckets for CPU, memory and
+uptime on SQLite, plain PostgreSQL and TimescaleDB alike.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "38"
+down_revision: str | None = "37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add health_check_rollups table."""
+
+    op.create_table(
+        "health_check_rollups",
+        sa.Column("device_id", sa.String(length=64), nullable=False),
+        sa.Column(
+            "resolution",
+            sa.String(length=8),
+            nullable=False,
+            comment="Rollup tier: 1m/1h/1d",
+        ),
+        sa.Column(
+            "bucket_start",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Bucket start (UTC)",
+        ),
+        sa.Column(
+            "sample_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Raw samples aggregated into bucket",
+        ),
+        sa.Column("cpu_min", sa.Float(), nullable=True),
+        sa.Column("cpu_avg", sa.Float(), nullable=True),
+        sa.Column("cpu_max", sa.Float(), nullable=True),
+        sa.Column(
+            "memory_min", sa.Float(), nullable=True, comment="Minimum memory usage percent"
+        ),
+        sa.Column(
+            "memory_avg", sa.Float(), nullable=True, comment="Average memory usage percent"
+        ),
+        sa.Column(
+            "memory_max", sa.Float(), nullable=True, comment="Maximum memory usage percent"
+        ),
+        sa.Column("uptime_min", sa.BigInteger(), nullable=True),
+        sa.Column("uptime_avg", sa.Float(), nullable=True),
+        sa.Column("uptime_max", sa.BigInteger(), nullable=True),
+        # Standard timestamp fields (inherited from Base in model)
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="Record creation timestamp",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="Record last update timestamp",
+        ),
+        sa.ForeignKeyConstraint(["device_id"], ["devices.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("device_id", "resolution", "bucket_start"),
+    )
+
+    # Retention deletes and the rollup watermark lookup filter by tier + bucket
+    op.create_index(
+        "idx_healthrollup_resolution_bucket",
+        "health_check_rollups",
+        ["resolution", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - remove health_check_rollups table."""
+
+    op.drop_index("idx_healthrollup_resolution_bucket", "health_check_rollups")
+    op.drop_table("health_check_rollups")
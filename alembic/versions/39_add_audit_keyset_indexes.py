@@ -0,0 +1,63 @@
+"""Add composite audit_events indexes for keyset pagination
+
+Revision ID: 39
+Revises: 38
+Create Date: 2026-01-15 09:00:00.000000
+
+Audit event listing pages on (timestamp DESC, id DESC). These indexes match
+the filter combinations used by the admin UI and compliance exports
+(unfiltered, per device, per tool, per user), so each page is an index
+range scan instead of a sort over every matching row.
+
+The single-column timestamp, device_id, tool_name and user_id indexes are
+leading prefixes of the new composites, so they are dropped.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "39"
+down_revision: str | None = "38"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Single-column indexes made redundant by the composites: (name, column).
+# ix_* names come from ``index=True`` columns created by create_all.
+REDUNDANT_INDEXES: tuple[tuple[str, str], ...] = (
+    ("idx_audit_timestamp", "timestamp"),
+    ("idx_audit_tool", "tool_name"),
+    ("idx_audit_user_id", "user_id"),
+    ("ix_audit_events_timestamp", "timestamp"),
+    ("ix_audit_events_device_id", "device_id"),
+    ("ix_audit_events_tool_name", "tool_name"),
+    ("ix_audit_events_user_id", "user_id"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add composite audit_events indexes."""
+    op.create_index("idx_audit_timestamp_id", "audit_events", ["timestamp", "id"])
+    op.create_index(
+        "idx_audit_device_timestamp", "audit_events", ["device_id", "timestamp", "id"]
+    )
+    op.create_index(
+        "idx_audit_tool_timestamp", "audit_events", ["tool_name", "timestamp", "id"]
+    )
+    op.create_index(
+        "idx_audit_user_timestamp", "audit_events", ["user_id", "timestamp", "id"]
+    )
+    for name, _column in REDUNDANT_INDEXES:
+        op.drop_index(name, "audit_events", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade database schema - restore single-column indexes, drop composites."""
+    for name, column in REDUNDANT_INDEXES:
+        op.create_index(name, "audit_events", [column], if_not_exists=True)
+    op.drop_index("idx_audit_user_timestamp", "audit_events")
+    op.drop_index("idx_audit_tool_timestamp", "audit_events")
+    op.drop_index("idx_audit_device_timestamp", "audit_events")
+    op.drop_index("idx_audit_timestamp_id", "audit_events")
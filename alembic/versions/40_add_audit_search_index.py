@@ -0,0 +1,134 @@
+"""Add full-text search index for audit events
+
+Revision ID: 40
+Revises: 39
+Create Date: 2026-01-15 14:00:00.000000
+
+Replaces the CAST(meta AS TEXT) ILIKE scan used by audit search:
+- PostgreSQL: generated ``search_vector`` tsvector column with a GIN index
+- SQLite: ``audit_events_fts`` FTS5 shadow table kept in sync by triggers
+
+Both index tool name, device, user identity, error message and metadata.
+AuditService detects the index at query time and falls back to ILIKE when
+it is absent, so the migration is safe to apply at any point.
+
+Free-text search changes from substring to whole-word (token) matching once
+this is applied: "time" no longer matches "timeout".
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "40"
+down_revision: str | None = "39"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE audit_events ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector(
+            'simple',
+            coalesce(tool_name, '') || ' ' ||
+            coalesce(device_id, '') || ' ' ||
+            coalesce(user_id, '') || ' ' ||
+            coalesce(user_sub, '') || ' ' ||
+            coalesce(user_email, '') || ' ' ||
+            coalesce(error_message, '') || ' ' ||
+            coalesce(meta::text, '')
+        )
+    ) STORED
+    """,
+    "CREATE INDEX idx_audit_search_vector ON audit_events USING GIN (search_vector)",
+]
+
+_POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS idx_audit_search_vector",
+    "ALTER TABLE audit_events DROP COLUMN IF EXISTS search_vector",
+]
+
+# audit_events has a string primary key, so its implicit rowid is not stable
+# (VACUUM may renumber it). FTS5 rows therefore carry the event id in an
+# UNINDEXED column and searches join on audit_events.id. The row body
+# mirrors the PostgreSQL tsvector expression.
+_SQLITE_ROW = """
+    new.id,
+    coalesce(new.tool_name, ''),
+    coalesce(new.device_id, ''),
+    coalesce(new.user_id, '') || ' ' || coalesce(new.user_sub, '') || ' ' ||
+        coalesce(new.user_email, ''),
+    coalesce(new.error_message, '') || ' ' || coalesce(new.meta, '')
+"""
+
+_SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE audit_events_fts USING fts5(
+        event_id UNINDEXED, tool_name, device_id, actor, body
+    )
+    """,
+    f"""
+    CREATE TRIGGER audit_events_fts_insert AFTER INSERT ON audit_events BEGIN
+        INSERT INTO audit_events_fts (event_id, tool_name, device_id, actor, body)
+        VALUES ({_SQLITE_ROW});
+    END
+    """,
+    # Audit events are immutable, so these only fire on manual maintenance
+    """
+    CREATE TRIGGER audit_events_fts_delete AFTER DELETE ON audit_events BEGIN
+        DELETE FROM audit_events_fts WHERE event_id = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER audit_events_fts_update AFTER UPDATE ON audit_events BEGIN
+        DELETE FROM audit_events_fts WHERE event_id = old.id;
+        INSERT INTO audit_events_fts (event_id, tool_name, device_id, actor, body)
+        VALUES ({_SQLITE_ROW});
+    END
+    """,
+    # Backfill existing events
+    """
+    INSERT INTO audit_events_fts (event_id, tool_name, device_id, actor, body)
+    SELECT
+        id,
+        coalesce(tool_name, ''),
+        coalesce(device_id, ''),
+        coalesce(user_id, '') || ' ' || coalesce(user_sub, '') || ' ' ||
+            coalesce(user_email, ''),
+        coalesce(error_message, '') || ' ' || coalesce(meta, '')
+    FROM audit_events
+    """,
+]
+
+_SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS audit_events_fts_update",
+    "DROP TRIGGER IF EXISTS audit_events_fts_delete",
+    "DROP TRIGGER IF EXISTS audit_events_fts_insert",
+    "DROP TABLE IF EXISTS audit_events_fts",
+]
+
+
+def _statements(upgrade: bool) -> list[str]:
+    """Get the DDL statements for the current database dialect."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        return _POSTGRES_UPGRADE if upgrade else _POSTGRES_DOWNGRADE
+    if dialect == "sqlite":
+        return _SQLITE_UPGRADE if upgrade else _SQLITE_DOWNGRADE
+    return []
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add audit full-text search index."""
+    for statement in _statements(upgrade=True):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade database schema - drop audit full-text search index."""
+    for statement in _statements(upgrade=False):
+        op.execute(statement)
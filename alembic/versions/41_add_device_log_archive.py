@@ -0,0 +1,192 @@
+"""Add device log archive tables with topic and full-text indexes
+
+Revision ID: 41
+Revises: 40
+Create Date: 2026-01-16 09:00:00.000000
+
+RouterOS keeps only a small in-memory log. The log archive stores entries
+pulled by the log archive job (or received over syslog):
+- device_logs: one row per entry, partitioned logically by ``day`` (days
+  since the epoch) so searches prune to the days they cover and retention
+  deletes whole days
+- device_log_topics: one row per entry topic, indexed by topic and day
+- Message full-text index: a generated ``message_vector`` tsvector column
+  with a GIN index on PostgreSQL, an FTS5 external-content table (no copy
+  of the message text) kept in sync by triggers on SQLite
+
+LogArchiveService detects the full-text index at query time and falls back
+to ILIKE when it is absent.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "41"
+down_revision: str | None = "40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE device_logs ADD COLUMN message_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(message, ''))) STORED
+    """,
+    "CREATE INDEX idx_device_log_message_vector ON device_logs USING GIN (message_vector)",
+]
+
+_POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS idx_device_log_message_vector",
+    "ALTER TABLE device_logs DROP COLUMN IF EXISTS message_vector",
+]
+
+# External-content FTS5 table: the index references device_logs rows by
+# rowid (= device_logs.id) instead of storing a second copy of each message
+_SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE device_logs_fts USING fts5(
+        message, content='device_logs', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER device_logs_fts_insert AFTER INSERT ON device_logs BEGIN
+        INSERT INTO device_logs_fts (rowid, message) VALUES (new.id, new.message);
+    END
+    """,
+    """
+    CREATE TRIGGER device_logs_fts_delete AFTER DELETE ON device_logs BEGIN
+        INSERT INTO device_logs_fts (device_logs_fts, rowid, message)
+        VALUES ('delete', old.id, old.message);
+    END
+    """,
+    """
+    CREATE TRIGGER device_logs_fts_update AFTER UPDATE ON device_logs BEGIN
+        INSERT INTO device_logs_fts (device_logs_fts, rowid, message)
+        VALUES ('delete', old.id, old.message);
+        INSERT INTO device_logs_fts (rowid, message) VALUES (new.id, new.message);
+    END
+    """,
+    "INSERT INTO device_logs_fts (device_logs_fts) VALUES ('rebuild')",
+]
+
+_SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS device_logs_fts_update",
+    "DROP TRIGGER IF EXISTS device_logs_fts_delete",
+    "DROP TRIGGER IF EXISTS device_logs_fts_insert",
+    "DROP TABLE IF EXISTS device_logs_fts",
+]
+
+
+def _timestamp_columns() -> list[sa.Column]:
+    """Standard timestamp fields (inherited from Base in model)."""
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="Record creation timestamp",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="Record last update timestamp",
+        ),
+    ]
+
+
+def _full_text_statements(upgrade: bool) -> list[str]:
+    """Get the full-text index DDL for the current database dialect."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        return _POSTGRES_UPGRADE if upgrade else _POSTGRES_DOWNGRADE
+    if dialect == "sqlite":
+        return _SQLITE_UPGRADE if upgrade else _SQLITE_DOWNGRADE
+    return []
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add device log archive tables."""
+    log_id_type = sa.BigInteger().with_variant(sa.Integer(), "sqlite")
+
+    op.create_table(
+        "device_logs",
+        sa.Column("id", log_id_type, autoincrement=True, nullable=False),
+        sa.Column("device_id", sa.String(length=64), nullable=False),
+        sa.Column(
+            "day",
+            sa.Integer(),
+            nullable=False,
+            comment="Partition key: days since 1970-01-01 (UTC)",
+        ),
+        sa.Column(
+            "logged_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Entry time (device clock, UTC)",
+        ),
+        sa.Column(
+            "topics",
+            sa.String(length=255),
+            nullable=False,
+            server_default="",
+            comment="Comma-separated topics",
+        ),
+        sa.Column("message", sa.Text(), nullable=False, server_default=""),
+        sa.Column(
+            "source",
+            sa.String(length=8),
+            nullable=False,
+            server_default="poll",
+            comment="Ingest path: poll/syslog",
+        ),
+        *_timestamp_columns(),
+        sa.ForeignKeyConstraint(["device_id"], ["devices.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_device_log_day_device", "device_logs", ["day", "device_id"])
+    op.create_index(
+        "idx_device_log_device_logged_at", "device_logs", ["device_id", "logged_at"]
+    )
+    op.create_index("idx_device_log_logged_at", "device_logs", ["logged_at"])
+
+    op.create_table(
+        "device_log_topics",
+        sa.Column("log_id", log_id_type, nullable=False),
+        sa.Column("topic", sa.String(length=32), nullable=False),
+        sa.Column(
+            "day",
+            sa.Integer(),
+            nullable=False,
+            comment="Copy of device_logs.day for pruning",
+        ),
+        *_timestamp_columns(),
+        sa.ForeignKeyConstraint(["log_id"], ["device_logs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("log_id", "topic"),
+    )
+    op.create_index("idx_device_log_topic_topic_day", "device_log_topics", ["topic", "day"])
+    op.create_index("idx_device_log_topic_day", "device_log_topics", ["day"])
+
+    for statement in _full_text_statements(upgrade=True):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade database schema - remove device log archive tables."""
+    for statement in _full_text_statements(upgrade=False):
+        op.execute(statement)
+
+    op.drop_index("idx_device_log_topic_day", "device_log_topics")
+    op.drop_index("idx_device_log_topic_topic_day", "device_log_topics")
+    op.drop_table("device_log_topics")
+
+    op.drop_index("idx_device_log_logged_at", "device_logs")
+    op.drop_index("idx_device_log_device_logged_at", "device_logs")
+    op.drop_index("idx_device_log_day_device", "device_logs")
+    op.drop_table("device_logs")
@@ -12,7 +12,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 
 from routeros_mcp.api.admin_models import (
     DeviceCreateRequest,
@@ -22,11 +22,34 @@ from routeros_mcp.api.admin_models import (
     UserCreateRequest,
     UserUpdateRequest,
 )
+from routeros_mcp.infra.device_registry import get_device_registry
+from routeros_mcp.infra.observability import metrics
 from routeros_mcp.mcp.errors import DeviceNotFoundError, EnvironmentMismatchError, ValidationError
 
-# Maximum number of audit events to export to CSV in a single request
-# Large exports may cause memory issues and timeouts
-MAX_AUDIT_EXPORT_LIMIT = 10000
+# (CSV header, event key) pairs for /api/audit/events/export
+AUDIT_EXPORT_COLUMNS = [
+    ("Timestamp", "timestamp"),
+    ("User Email", "user_email"),
+    ("User Role", "user_role"),
+    ("User ID", "user_id"),
+    ("Approver ID", "approver_id"),
+    ("Approval Request ID", "approval_request_id"),
+    ("Device ID", "device_id"),
+    ("Environment", "environment"),
+    ("Tool Name", "tool_name"),
+    ("Tool Tier", "tool_tier"),
+    ("Action", "action"),
+    ("Success", "success"),
+    ("Result Summary", "result_summary"),
+    ("Error Message", "error_message"),
+    ("Correlation ID", "correlation_id"),
+]
+
+# Streamed export formats: (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
 
 logger = logging.getLogger(__name__)
 
@@ -441,6 +464,11 @@ async def delete_device(
             await device_service.session.delete(device_orm)
             await device_service.session.commit()
 
+        registry = get_device_registry()
+        if registry is not None:
+            registry.remove(device_id)
+        metrics.forget_device(device_id)
+
         logger.info(
             "Deleted device",
             extra={"device_id": device_id, "device_name": device.name},
@@ -955,28 +983,36 @@ async def list_audit_events(
     user_id: str | None = None,
     approver_id: str | None = None,
     approval_request_id: str | None = None,
+    cursor: str | None = None,
     user: dict[str, Any] = Depends(get_current_user_dep()),
     audit_service: Any = Depends(get_audit_service),
 ) -> JSONResponse:
     """List audit events with filtering and pagination.
 
+    Prefer ``cursor`` over ``page`` for deep paging: pass the ``next_cursor``
+    of the previous response to continue without an OFFSET scan. Cursor
+    responses omit ``total``, ``page`` and ``total_pages``. Offset responses
+    flag an estimated or briefly cached ``total`` with ``total_approximate``.
+
     Args:
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored when cursor is given)
         page_size: Number of events per page (max 100)
         device_id: Filter by device ID
         tool_name: Filter by tool name
         success: Filter by success status
         date_from: Filter events from this date (ISO format)
         date_to: Filter events to this date (ISO format)
-        search: Search in event details
+        search: Search words (whole words once the search index exists) plus
+            optional tool:/device:/user: terms
         user_id: Filter by user ID who performed the action (Phase 5)
         approver_id: Filter by approver ID (Phase 5)
         approval_request_id: Filter by approval request ID (Phase 5)
+        cursor: Keyset cursor from a previous response's next_cursor
         user: Current authenticated user
         audit_service: Audit service dependency
 
     Returns:
-        JSON with events and pagination info
+        JSON with events, pagination info and next_cursor
     """
     try:
         # Validate and limit page size
@@ -999,10 +1035,17 @@ async def list_audit_events(
             user_id=user_id,
             approver_id=approver_id,
             approval_request_id=approval_request_id,
+            cursor=cursor,
         )
 
         return JSONResponse(content=result)
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
     except HTTPException:
         raise
     except Exception as e:
@@ -1031,10 +1074,15 @@ async def export_audit_events(
     user_id: str | None = None,
     approver_id: str | None = None,
     approval_request_id: str | None = None,
+    format: str = "csv",
+    compression: str | None = None,
     user: dict[str, Any] = Depends(get_current_user_dep()),
     audit_service: Any = Depends(get_audit_service),
 ) -> Any:
-    """Export audit events to CSV.
+    """Export audit events to CSV or NDJSON.
+
+    Rows are streamed from a database cursor into the response as they are
+    encoded, so exports are not capped and memory use stays constant.
 
     Args:
         device_id: Filter by device ID
@@ -1042,31 +1090,38 @@ async def export_audit_events(
         success: Filter by success status
         date_from: Filter events from this date (ISO format)
         date_to: Filter events to this date (ISO format)
-        search: Search in event details
+        search: Search words (whole words once the search index exists) plus
+            optional tool:/device:/user: terms
         user_id: Filter by user ID who performed the action (Phase 5)
         approver_id: Filter by approver ID (Phase 5)
         approval_request_id: Filter by approval request ID (Phase 5)
+        format: Export format ('csv' or 'ndjson')
+        compression: Optional compression ('gzip')
         user: Current authenticated user
         audit_service: Audit service dependency
 
     Returns:
-        CSV file download
+        Streaming file download
     """
     try:
-        import csv
-        import io
+        from routeros_mcp.infra.export import encode_csv, encode_ndjson
 
-        from fastapi.responses import StreamingResponse
+        if format not in EXPORT_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid format. Must be 'csv' or 'ndjson'",
+            )
+        if compression not in (None, "gzip"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid compression. Must be 'gzip'",
+            )
 
         # Parse date filters
         date_from_dt = _parse_iso_date(date_from, "date_from")
         date_to_dt = _parse_iso_date(date_to, "date_to")
 
-        # Query all matching events (no pagination for export)
-        # Note: Large exports are limited to MAX_AUDIT_EXPORT_LIMIT to prevent memory/timeout issues
-        result = await audit_service.list_events(
-            page=1,
-            page_size=MAX_AUDIT_EXPORT_LIMIT,
+        events = audit_service.stream_events(
             device_id=device_id,
             tool_name=tool_name,
             success=success,
@@ -1078,62 +1133,13 @@ async def export_audit_events(
             approval_request_id=approval_request_id,
         )
 
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "Timestamp",
-                "User Email",
-                "User Role",
-                "User ID",
-                "Approver ID",
-                "Approval Request ID",
-                "Device ID",
-                "Environment",
-                "Tool Name",
-                "Tool Tier",
-                "Action",
-                "Success",
-                "Result Summary",
-                "Error Message",
-                "Correlation ID",
-            ]
-        )
-
-        # Write rows
-        for event in result["events"]:
-            writer.writerow(
-                [
-                    event["timestamp"],
-                    event["user_email"] or "",
-                    event["user_role"],
-                    event["user_id"] or "",
-                    event["approver_id"] or "",
-                    event["approval_request_id"] or "",
-                    event["device_id"] or "",
-                    event["environment"] or "",
-                    event["tool_name"],
-                    event["tool_tier"],
-                    event["action"],
-                    "Success" if event["success"] else "Failure",
-                    event["result_summary"] or "",
-                    event["error_message"] or "",
-                    event["correlation_id"] or "",
-                ]
-            )
+        if format == "csv":
+            body = encode_csv(_csv_audit_rows(events), AUDIT_EXPORT_COLUMNS)
+        else:
+            body = encode_ndjson(events)
 
-        # Return CSV as download
-        output.seek(0)
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=audit_events_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.csv"
-            },
-        )
+        filename = f"audit_events_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}"
+        return _export_response(body, format, compression, filename, "audit events export")
 
     except HTTPException:
         raise
@@ -1152,6 +1158,59 @@ async def export_audit_events(
         )
 
 
+async def _csv_audit_rows(events: Any) -> Any:
+    """Render streamed audit events for CSV (Success/Failure instead of booleans)."""
+    async for event in events:
+        event["success"] = "Success" if event["success"] else "Failure"
+        yield event
+
+
+def _export_response(
+    body: Any,
+    format: str,
+    compression: str | None,
+    filename: str,
+    description: str,
+) -> Any:
+    """Build a streaming download response for an encoded export body.
+
+    Args:
+        body: Async iterator of encoded text chunks
+        format: Export format key in EXPORT_FORMATS
+        compression: None or 'gzip'
+        filename: Download file name without extension
+        description: Export name used in error logs
+
+    Returns:
+        StreamingResponse with attachment headers
+    """
+    from routeros_mcp.infra.export import gzip_chunks
+
+    media_type, extension = EXPORT_FORMATS[format]
+
+    async def logged(chunks: Any) -> Any:
+        # Headers are already sent once streaming starts; log failures instead
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming {description}: {e}", exc_info=True)
+            raise
+
+    if compression == "gzip":
+        content = logged(gzip_chunks(body))
+        media_type = "application/gzip"
+        extension = f"{extension}.gz"
+    else:
+        content = logged(body)
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}.{extension}"},
+    )
+
+
 @router.get("/api/audit/filters")
 async def get_audit_filters(
     user: dict[str, Any] = Depends(get_current_user_dep()),
@@ -1524,13 +1583,17 @@ async def compliance_audit_export(
     tool_name: str | None = None,
     user_id: str | None = None,
     format: str = "json",
-    limit: int = 10000,
+    limit: int | None = None,
+    compression: str | None = None,
     user: dict[str, Any] = Depends(get_current_user_dep()),
     compliance_service: Any = Depends(get_compliance_service),
 ) -> Any:
     """Export audit events for compliance reporting.
 
-    Supports both JSON and CSV formats for audit log exports.
+    Supports JSON, CSV and NDJSON formats for audit log exports. CSV and
+    NDJSON are streamed from a database cursor, so they are uncapped by
+    default and can cover full years; JSON is a single document and keeps
+    the 10000-event default.
 
     Args:
         date_from: Start date for filtering (ISO format)
@@ -1538,13 +1601,14 @@ async def compliance_audit_export(
         device_id: Filter by device ID
         tool_name: Filter by tool name
         user_id: Filter by user ID
-        format: Export format ('json' or 'csv')
-        limit: Maximum number of events to export (default: 10000)
+        format: Export format ('json', 'csv' or 'ndjson')
+        limit: Maximum number of events to export (JSON default: 10000)
+        compression: Optional compression for CSV/NDJSON ('gzip')
         user: Current authenticated user (must have admin or auditor role)
         compliance_service: Compliance service dependency
 
     Returns:
-        JSON object with audit events or CSV file download
+        JSON object with audit events or streamed CSV/NDJSON file download
 
     Raises:
         HTTPException: If unauthorized or date parsing fails
@@ -1563,36 +1627,47 @@ async def compliance_audit_export(
         date_to_dt = _parse_iso_date(date_to, "date_to")
 
         # Validate format parameter
-        if format not in ["json", "csv"]:
+        if format != "json" and format not in EXPORT_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid format. Must be 'json', 'csv' or 'ndjson'",
+            )
+        if compression not in (None, "gzip"):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid format. Must be 'json' or 'csv'",
+                detail="Invalid compression. Must be 'gzip'",
+            )
+
+        if format == "json":
+            result = await compliance_service.export_audit_events(
+                date_from=date_from_dt,
+                date_to=date_to_dt,
+                device_id=device_id,
+                tool_name=tool_name,
+                user_id=user_id,
+                format=format,
+                limit=limit if limit is not None else 10000,
             )
+            return JSONResponse(content=result)
+
+        from routeros_mcp.domain.services.compliance import COMPLIANCE_EXPORT_COLUMNS
+        from routeros_mcp.infra.export import encode_csv, encode_ndjson
 
-        # Get audit events
-        result = await compliance_service.export_audit_events(
+        events = compliance_service.stream_audit_events(
             date_from=date_from_dt,
             date_to=date_to_dt,
             device_id=device_id,
             tool_name=tool_name,
             user_id=user_id,
-            format=format,
             limit=limit,
         )
-
-        # Return appropriate response based on format
         if format == "csv":
-            from fastapi.responses import StreamingResponse
-
-            return StreamingResponse(
-                iter([result]),
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f"attachment; filename=compliance_audit_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.csv"
-                },
-            )
+            body = encode_csv(events, COMPLIANCE_EXPORT_COLUMNS)
         else:
-            return JSONResponse(content=result)
+            body = encode_ndjson(events)
+
+        filename = f"compliance_audit_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}"
+        return _export_response(body, format, compression, filename, "compliance audit export")
 
     except HTTPException:
         raise
@@ -12,16 +12,24 @@ import time
 from pathlib import Path
 from typing import Any
 
-from fastapi import Body, Depends, FastAPI, HTTPException, Request, status
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST
 from fastapi.staticfiles import StaticFiles
 from authlib.integrations.starlette_client import OAuth
 from authlib.jose import jwt
 from authlib.jose.errors import JoseError
 
 from routeros_mcp.config import Settings
-from routeros_mcp.infra.observability import get_metrics_text, record_auth_check
+from routeros_mcp.infra.observability import (
+    configure_metrics,
+    get_device_metrics,
+    get_device_metrics_text,
+    get_metrics_text,
+    record_auth_check,
+)
+from routeros_mcp.infra.observability.exposition import MetricsExposition, accepts_gzip
 from routeros_mcp.infra.observability.logging import get_correlation_id, set_correlation_id
 from routeros_mcp.security.auth import AuthenticationError
 
@@ -293,14 +301,65 @@ def create_http_app(settings: Settings) -> FastAPI:  # pragma: no cover
         return result.to_dict()
 
     # Metrics endpoint (Prometheus format)
+    configure_metrics(
+        per_device=settings.metrics_per_device,
+        group_by_tags=[
+            key.strip() for key in settings.metrics_group_by_tags.split(",") if key.strip()
+        ],
+    )
+
+    exposition = MetricsExposition(
+        ttl_seconds=settings.metrics_cache_ttl_seconds,
+        render=get_metrics_text,
+    )
+
     @app.get("/metrics")
-    async def metrics() -> PlainTextResponse:
+    async def metrics(request: Request) -> Response:
         """Prometheus metrics endpoint.
 
+        Device health is exported as fleet aggregates; per-device series
+        are only included when metrics_per_device is enabled. The payload
+        is rendered in a worker thread, shared by scrapes within
+        metrics_cache_ttl_seconds and gzip-compressed when the scraper
+        accepts it.
+
         Returns:
             Metrics in Prometheus text format
         """
-        return PlainTextResponse(get_metrics_text())
+        use_gzip = accepts_gzip(request.headers.get("accept-encoding"))
+        headers = {"Vary": "Accept-Encoding"}
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        return Response(
+            await exposition.get(gzip_encoded=use_gzip),
+            media_type=CONTENT_TYPE_LATEST,
+            headers=headers,
+        )
+
+    @app.get("/metrics/devices")
+    async def device_metrics(
+        page: int = Query(default=1, ge=1),
+        page_size: int | None = Query(default=None, ge=1, le=10000),
+    ) -> PlainTextResponse:
+        """Per-device Prometheus series, one page of devices at a time.
+
+        Query Parameters:
+            page: 1-based page number (devices ordered by ID)
+            page_size: Devices per page (default: metrics_device_page_size)
+
+        Returns:
+            Per-device metrics in Prometheus text format, with the
+            X-Total-Devices and X-Total-Pages headers
+        """
+        size = page_size or settings.metrics_device_page_size
+        store = get_device_metrics()
+        return PlainTextResponse(
+            get_device_metrics_text(page=page, page_size=size),
+            headers={
+                "X-Total-Devices": str(store.device_count),
+                "X-Total-Pages": str(store.page_count(size)),
+            },
+        )
 
     # User info endpoint (authenticated)
     @app.get("/api/user")
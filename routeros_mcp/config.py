@@ -111,6 +111,13 @@ class Settings(BaseSettings):
         description="Debounce interval for batching SSE updates",
     )
 
+    sse_log_update_interval_seconds: float = Field(
+        default=5.0,
+        ge=1.0,
+        le=300.0,
+        description="Poll interval of the log tailer feeding device://{id}/logs subscriptions",
+    )
+
     # ========================================
     # Database Configuration
     # ========================================
@@ -242,6 +249,37 @@ class Settings(BaseSettings):
         "Set to False for self-signed certificates (lab environments only)",
     )
 
+    ssh_pool_enabled: bool = Field(
+        default=True,
+        description="Share authenticated SSH connections per device instead of "
+        "connecting for every SSH fallback",
+    )
+
+    ssh_pool_max_connections: int = Field(
+        default=64,
+        ge=1,
+        le=1000,
+        description="Max pooled SSH connections (all devices)",
+    )
+
+    ssh_pool_max_sessions: int = Field(
+        default=128,
+        ge=1,
+        le=5000,
+        description="Max concurrent SSH command channels/CLI sessions (all devices)",
+    )
+
+    ssh_pool_idle_timeout_seconds: int = Field(
+        default=300, ge=5, le=3600, description="Close pooled SSH connections idle this long"
+    )
+
+    log_tail_buffer_size: int = Field(
+        default=1000,
+        ge=10,
+        le=100000,
+        description="Parsed log entries kept per device for incremental log tailing",
+    )
+
     # ========================================
     # Health Checks & Metrics
     # ========================================
@@ -255,7 +293,298 @@ class Settings(BaseSettings):
     )
 
     metrics_collection_interval_seconds: int = Field(
-        default=300, ge=60, le=3600, description="Metrics collection interval"
+        default=300,
+        ge=60,
+        le=3600,
+        description="Metrics collection interval (interface traffic counter sampling)",
+    )
+
+    interface_traffic_enabled: bool = Field(
+        default=True,
+        description=(
+            "Sample interface counters of watched devices in the background and "
+            "answer traffic rates from memory"
+        ),
+    )
+
+    interface_traffic_history_samples: int = Field(
+        default=60,
+        ge=2,
+        le=1440,
+        description="Interface counter samples kept per interface",
+    )
+
+    metrics_per_device: bool = Field(
+        default=False,
+        description=(
+            "Include per-device series in /metrics (series count grows with the fleet; "
+            "/metrics/devices serves them page by page either way)"
+        ),
+    )
+
+    metrics_group_by_tags: str = Field(
+        default="",
+        description=(
+            "Comma-separated device tag keys to break fleet metrics down by "
+            "(in addition to environment and hardware model)"
+        ),
+    )
+
+    metrics_device_page_size: int = Field(
+        default=500,
+        ge=10,
+        le=10000,
+        description="Devices per page of /metrics/devices",
+    )
+
+    metrics_cache_ttl_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=60.0,
+        description=(
+            "Seconds a rendered /metrics payload is shared between scrapes "
+            "(0 renders on every scrape)"
+        ),
+    )
+
+    # ========================================
+    # Reachability Mesh
+    # ========================================
+
+    reachability_mesh_enabled: bool = Field(
+        default=False,
+        description="Ping the mesh targets from the mesh devices in the background",
+    )
+
+    reachability_mesh_devices: str = Field(
+        default="",
+        description="Comma-separated device IDs the mesh pings from",
+    )
+
+    reachability_mesh_targets: str = Field(
+        default="",
+        description="Comma-separated IPs or hostnames every mesh device pings",
+    )
+
+    reachability_mesh_interval_seconds: int = Field(
+        default=300,
+        ge=30,
+        le=3600,
+        description="Interval in which every mesh pair is probed once",
+    )
+
+    reachability_mesh_ping_count: int = Field(
+        default=3,
+        ge=1,
+        le=10,
+        description="Pings per mesh probe",
+    )
+
+    reachability_mesh_history_samples: int = Field(
+        default=288,
+        ge=2,
+        le=10080,
+        description="Probes kept per mesh pair",
+    )
+
+    # ========================================
+    # Health History Rollups
+    # ========================================
+
+    health_rollup_enabled: bool = Field(
+        default=True,
+        description="Enable periodic 1m/1h/1d downsampling of health_checks",
+    )
+
+    health_rollup_interval_seconds: int = Field(
+        default=60,
+        ge=30,
+        le=3600,
+        description="Interval between health rollup job runs",
+    )
+
+    health_raw_retention_days: int | None = Field(
+        default=None,
+        ge=1,
+        le=365,
+        description=(
+            "Days of raw health_checks rows to keep (older rows are deleted); "
+            "unset keeps raw rows indefinitely"
+        ),
+    )
+
+    health_rollup_1m_retention_days: int = Field(
+        default=14,
+        ge=1,
+        le=365,
+        description="Days of 1-minute health rollups to keep",
+    )
+
+    health_rollup_1h_retention_days: int = Field(
+        default=180,
+        ge=1,
+        le=3650,
+        description="Days of 1-hour health rollups to keep",
+    )
+
+    health_rollup_1d_retention_days: int = Field(
+        default=1825,
+        ge=1,
+        le=3650,
+        description="Days of 1-day health rollups to keep",
+    )
+
+    # ========================================
+    # Log Archive
+    # ========================================
+
+    log_archive_enabled: bool = Field(
+        default=False,
+        description="Periodically pull new log entries from every device into the log archive",
+    )
+
+    log_archive_interval_seconds: int = Field(
+        default=60,
+        ge=10,
+        le=3600,
+        description="Interval between log archive ingest runs",
+    )
+
+    log_archive_max_concurrent_devices: int = Field(
+        default=10,
+        ge=1,
+        le=200,
+        description="Devices polled concurrently by the log archive job",
+    )
+
+    log_archive_retention_days: int = Field(
+        default=30,
+        ge=1,
+        le=3650,
+        description="Days of archived log entries to keep (older days are deleted)",
+    )
+
+    log_archive_syslog_enabled: bool = Field(
+        default=False,
+        description="Accept RouterOS remote (syslog) logging into the log archive",
+    )
+
+    log_archive_syslog_host: str = Field(
+        default="127.0.0.1",
+        description="Syslog UDP bind address (0.0.0.0 for all interfaces)",
+    )
+
+    log_archive_syslog_port: int = Field(
+        default=5514, ge=1, le=65535, description="Syslog UDP port"
+    )
+
+    # ========================================
+    # Plan Execution
+    # ========================================
+
+    plan_apply_max_concurrency: int = Field(
+        default=5,
+        ge=1,
+        le=50,
+        description="Maximum devices a plan apply works on concurrently",
+    )
+
+    plan_apply_batch_size: int = Field(
+        default=0,
+        ge=0,
+        le=500,
+        description="Devices per batch for single-tool plan applies (0 = one batch)",
+    )
+
+    plan_apply_max_failures: int = Field(
+        default=0,
+        ge=0,
+        le=500,
+        description="Failed devices that stop a plan apply from starting more (0 = never)",
+    )
+
+    # ========================================
+    # Fleet Reads
+    # ========================================
+
+    fleet_read_max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum devices a fleet-wide read tool queries concurrently",
+    )
+
+    fleet_read_max_devices: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Maximum devices one fleet-wide read tool call may select",
+    )
+
+    # ========================================
+    # Host Locator
+    # ========================================
+
+    host_locator_enabled: bool = Field(
+        default=False,
+        description="Index ARP, DHCP lease and bridge host tables of the fleet in the background",
+    )
+
+    host_locator_interval_seconds: int = Field(
+        default=300,
+        ge=30,
+        le=3600,
+        description="Interval between host locator polls of every eligible device",
+    )
+
+    host_locator_retention_seconds: int = Field(
+        default=86400,
+        ge=300,
+        le=604800,
+        description="Seconds a host sighting stays in the index after it was last seen",
+    )
+
+    host_locator_redis_persistence: bool = Field(
+        default=False,
+        description=(
+            "Persist host sightings per device in the Redis resource cache "
+            "(requires redis_cache_enabled) so restarts keep last known locations"
+        ),
+    )
+
+    # ========================================
+    # Topology Graph
+    # ========================================
+
+    topology_enabled: bool = Field(
+        default=False,
+        description=(
+            "Build a fleet topology graph from interfaces, bridge ports, IP addresses "
+            "and neighbours, refreshed in the background and by fresh service reads"
+        ),
+    )
+
+    topology_interval_seconds: int = Field(
+        default=600,
+        ge=60,
+        le=86400,
+        description="Interval between topology refreshes of every eligible device",
+    )
+
+    # ========================================
+    # Device Registry Configuration
+    # ========================================
+
+    device_registry_enabled: bool = Field(
+        default=True,
+        description="Serve device lookups from an in-memory registry loaded at startup",
+    )
+
+    device_registry_sync_interval_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=3600,
+        description="Seconds between registry syncs picking up other replicas' changes (0 = off)",
     )
 
     # ========================================
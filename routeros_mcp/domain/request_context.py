@@ -0,0 +1,133 @@
+"""Request-scoped memoization of device lookups and authorization decisions.
+
+A single tool call resolves the same device several times: the tool loads it
+for the authorization check, the domain service loads it again to validate
+the target, and DeviceService.get_rest_client loads it once more before
+selecting credentials. A RequestContext, carried by a context variable for
+the lifetime of one MCP request, memoizes those lookups so each call needs a
+single device fetch.
+
+The scope is opened by RequestContextMiddleware around every tool call and
+resource read. Code running outside a scope (background jobs, CLI, tests)
+sees no context and always queries the database.
+
+Example:
+    with request_scope() as context:
+        device = await device_service.get_device("dev-lab-01")  # DB query
+        device = await device_service.get_device("dev-lab-01")  # memoized
+        print(context.hits, context.misses)  # 1 1
+"""
+
+import contextvars
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from routeros_mcp.domain.models import Device
+
+
+@dataclass(frozen=True)
+class CredentialRecord:
+    """Detached copy of an active credential row (secrets stay encrypted).
+
+    Attributes:
+        username: Credential username
+        encrypted_secret: Encrypted password (empty for key-based credentials)
+        private_key: Encrypted SSH private key, if any
+    """
+
+    username: str
+    encrypted_secret: str
+    private_key: str | None = None
+
+
+@dataclass
+class RequestContext:
+    """Per-request memo of devices, credentials and authorization decisions.
+
+    Credential lookups are memoized negatively as well (a missing credential
+    is stored as None), so a fallback chain such as SSH key then password
+    queries each credential type at most once.
+
+    Attributes:
+        devices: Device domain models by device ID
+        credentials: Active credentials (or None) by (device_id, credential_type)
+        authorizations: Authorization outcome by decision key; None means
+            allowed, a string is the denial message
+        hits: Lookups served from the memo
+        misses: Lookups that had to query the database
+    """
+
+    devices: dict[str, Device] = field(default_factory=dict)
+    credentials: dict[tuple[str, str], CredentialRecord | None] = field(default_factory=dict)
+    authorizations: dict[tuple[Any, ...], str | None] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+    def get_device(self, device_id: str) -> Device | None:
+        """Return a memoized device, counting the hit or miss."""
+        device = self.devices.get(device_id)
+        if device is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return device
+
+    def has_credential(self, device_id: str, credential_type: str) -> bool:
+        """Whether a credential lookup (including a negative one) is memoized."""
+        found = (device_id, credential_type) in self.credentials
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+    def forget_device(self, device_id: str) -> None:
+        """Drop everything memoized for a device after it was modified."""
+        self.devices.pop(device_id, None)
+        for key in [key for key in self.credentials if key[0] == device_id]:
+            del self.credentials[key]
+        for key in [key for key in self.authorizations if device_id in key]:
+            del self.authorizations[key]
+
+
+# Context variable holding the active request scope (async-safe)
+request_context_var: contextvars.ContextVar[RequestContext | None] = contextvars.ContextVar(
+    "request_context",
+    default=None,
+)
+
+
+def get_request_context() -> RequestContext | None:
+    """Get the active request context, or None outside a request scope."""
+    return request_context_var.get()
+
+
+@contextmanager
+def request_scope() -> Iterator[RequestContext]:
+    """Open a request scope, reusing the enclosing one when nested.
+
+    Yields:
+        The active RequestContext
+    """
+    current = request_context_var.get()
+    if current is not None:
+        yield current
+        return
+
+    context = RequestContext()
+    token = request_context_var.set(context)
+    try:
+        yield context
+    finally:
+        request_context_var.reset(token)
+
+
+__all__ = [
+    "CredentialRecord",
+    "RequestContext",
+    "get_request_context",
+    "request_context_var",
+    "request_scope",
+]
@@ -14,6 +14,7 @@ Services in this package:
 - DNSNTPService: DNS and NTP configuration operations
 - RoutingService: Routing table operations
 - FirewallLogsService: Firewall rules and system logs operations
+- FleetReadService: Read-only queries fanned out across many devices
 - PlanService: Plan/apply workflow for multi-device changes
 - JobService: Job execution and coordination
 """
@@ -22,6 +23,7 @@ from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.services.diagnostics import DiagnosticsService
 from routeros_mcp.domain.services.dns_ntp import DNSNTPService
 from routeros_mcp.domain.services.firewall_logs import FirewallLogsService
+from routeros_mcp.domain.services.fleet_read import FleetReadService
 from routeros_mcp.domain.services.health import HealthService
 from routeros_mcp.domain.services.interface import InterfaceService
 from routeros_mcp.domain.services.ip import IPService
@@ -35,6 +37,7 @@ __all__ = [
     "DiagnosticsService",
     "DNSNTPService",
     "FirewallLogsService",
+    "FleetReadService",
     "HealthService",
     "InterfaceService",
     "IPService",
@@ -3,11 +3,30 @@
 Provides business logic for audit event queries with filtering and pagination.
 """
 
+import base64
+import binascii
+import json
 import logging
+import shlex
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import String, and_, cast, desc, func, or_, select
+from sqlalchemy import (
+    String,
+    and_,
+    cast,
+    desc,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.infra.db.models import AuditEvent as AuditEventORM
@@ -15,13 +34,143 @@ from routeros_mcp.infra.db.models import AuditEvent as AuditEventORM
 logger = logging.getLogger(__name__)
 
 
+# Field prefixes accepted in audit search queries (e.g. "tool:dns/* timeout")
+AUDIT_SEARCH_FIELDS = ("tool", "device", "user")
+
+# Offset-page totals are reused for this long per filter combination
+AUDIT_COUNT_CACHE_TTL_SECONDS = 30.0
+
+# Upper bound on cached filter combinations
+AUDIT_COUNT_CACHE_SIZE = 256
+
+# Cached totals: filter key -> (expires_at, total)
+_count_cache: OrderedDict[tuple[Any, ...], tuple[float, int]] = OrderedDict()
+
+
+def reset_audit_count_cache() -> None:
+    """Clear cached audit event totals (primarily for testing)."""
+    _count_cache.clear()
+
+
+@dataclass
+class AuditSearchQuery:
+    """Audit search query split into field-scoped values and free-text terms.
+
+    Values of the same field are OR'ed; fields and free text are AND'ed.
+    A trailing ``*`` on a field value makes it a prefix match.
+    """
+
+    tool: list[str] = field(default_factory=list)
+    device: list[str] = field(default_factory=list)
+    user: list[str] = field(default_factory=list)
+    terms: list[str] = field(default_factory=list)
+
+
+def parse_audit_search(query: str) -> AuditSearchQuery:
+    """Parse an audit search string.
+
+    Examples:
+        ``tool:firewall/* device:dev-lab-01 timeout`` matches events of any
+        firewall tool on dev-lab-01 whose details mention "timeout".
+        Quoted values keep spaces: ``user:"ops@example.com" "rule added"``.
+
+    Args:
+        query: Raw search string
+
+    Returns:
+        Parsed AuditSearchQuery
+    """
+    try:
+        tokens = shlex.split(query)
+    except ValueError:
+        # Unbalanced quotes - treat the query as plain whitespace-separated words
+        tokens = query.split()
+
+    parsed = AuditSearchQuery()
+    for token in tokens:
+        name, sep, value = token.partition(":")
+        if sep and value and name.lower() in AUDIT_SEARCH_FIELDS:
+            getattr(parsed, name.lower()).append(value)
+        elif token:
+            parsed.terms.append(token)
+
+    return parsed
+
+
+def _match_value(column: Any, value: str) -> Any:
+    """Equality match, or prefix match when value ends with ``*``."""
+    if value.endswith("*"):
+        return column.startswith(value.rstrip("*"), autoescape=True)
+    return column == value
+
+
+def _event_to_dict(event: AuditEventORM) -> dict[str, Any]:
+    """Convert an audit event row to its API dictionary form."""
+    return {
+        "id": event.id,
+        "timestamp": event.timestamp.isoformat(),
+        "user_sub": event.user_sub,
+        "user_email": event.user_email,
+        "user_role": event.user_role,
+        "user_id": event.user_id,
+        "approver_id": event.approver_id,
+        "approval_request_id": event.approval_request_id,
+        "device_id": event.device_id,
+        "environment": event.environment,
+        "action": event.action,
+        "tool_name": event.tool_name,
+        "tool_tier": event.tool_tier,
+        "success": event.result == "SUCCESS",
+        "error_message": event.error_message,
+        "parameters": event.meta.get("parameters") if event.meta else None,
+        "result_summary": event.meta.get("result_summary") if event.meta else None,
+        "correlation_id": event.meta.get("correlation_id") if event.meta else None,
+    }
+
+
+def encode_audit_cursor(timestamp: datetime, event_id: str) -> str:
+    """Encode a keyset pagination cursor for audit event listing.
+
+    Args:
+        timestamp: Timestamp of the last event on the current page
+        event_id: ID of the last event on the current page
+
+    Returns:
+        URL-safe opaque cursor string
+    """
+    payload = {"t": timestamp.isoformat(), "i": event_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_audit_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by :func:`encode_audit_cursor`.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (timestamp, event_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        return datetime.fromisoformat(payload["t"]), str(payload["i"])
+    except (AttributeError, binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid audit cursor: {e}") from e
+
+
 class AuditService:
     """Service for querying audit events.
 
     Responsibilities:
     - Query audit events with filtering
-    - Pagination support
-    - Search functionality
+    - Offset and keyset (cursor) pagination support
+    - Streaming iteration for exports
+    - Full-text search with field-scoped terms
 
     Example:
         async with get_session() as session:
@@ -43,6 +192,7 @@ class AuditService:
             session: Database session
         """
         self.session = session
+        self._search_index_available: bool | None = None
 
     async def list_events(
         self,
@@ -57,26 +207,259 @@ class AuditService:
         user_id: str | None = None,
         approver_id: str | None = None,
         approval_request_id: str | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """List audit events with filters and pagination.
 
+        Events are ordered newest first by (timestamp, id). Passing the
+        ``next_cursor`` of a previous result continues after its last event
+        with a keyset seek instead of an OFFSET, so deep pages cost the same
+        as the first one. Cursor pages skip the COUNT(*) and carry no
+        ``total``, ``total_pages`` or ``page``: a count taken on the first
+        page goes stale as events are written, and page numbers have no
+        meaning once paging by position.
+
+        Offset pages report an approximate ``total`` (``total_approximate``
+        is True) unless the page itself reaches the end of the results:
+        unfiltered PostgreSQL queries use the planner's row estimate, and
+        other counts are cached per filter for AUDIT_COUNT_CACHE_TTL_SECONDS,
+        so reloading the first page does not rescan the table.
+
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, used for OFFSET when no cursor is given)
             page_size: Number of events per page
             device_id: Filter by device ID
             tool_name: Filter by tool name
             success: Filter by success status
             date_from: Filter events from this date
             date_to: Filter events to this date
-            search: Search in event details (result_summary, error_message, parameters)
+            search: Search query: free text plus optional tool:/device:/user: terms
             user_id: Filter by user ID who performed the action (Phase 5)
             approver_id: Filter by approver ID (Phase 5)
             approval_request_id: Filter by approval request ID (Phase 5)
+            cursor: Opaque cursor from a previous result's ``next_cursor``
+
+        Returns:
+            Dictionary with events, ``page_size`` and ``next_cursor``, plus
+            ``total``, ``total_approximate``, ``page`` and ``total_pages`` for
+            offset pages
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        conditions = await self._build_conditions(
+            device_id=device_id,
+            tool_name=tool_name,
+            success=success,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            user_id=user_id,
+            approver_id=approver_id,
+            approval_request_id=approval_request_id,
+        )
+
+        page_conditions = list(conditions)
+        offset = 0
+
+        if cursor:
+            after_timestamp, after_id = decode_audit_cursor(cursor)
+            page_conditions.append(
+                tuple_(AuditEventORM.timestamp, AuditEventORM.id) < tuple_(after_timestamp, after_id)
+            )
+        else:
+            offset = (page - 1) * page_size
+
+        # Query one extra row to know whether another page exists
+        stmt = select(AuditEventORM).order_by(
+            desc(AuditEventORM.timestamp), desc(AuditEventORM.id)
+        )
+        if page_conditions:
+            stmt = stmt.where(and_(*page_conditions))
+        stmt = stmt.limit(page_size + 1).offset(offset)
+
+        result = await self.session.execute(stmt)
+        events = list(result.scalars().all())
+
+        next_cursor = None
+        if len(events) > page_size:
+            events = events[:page_size]
+            last = events[-1]
+            next_cursor = encode_audit_cursor(last.timestamp, last.id)
+
+        response: dict[str, Any] = {
+            "events": [_event_to_dict(event) for event in events],
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
+        if cursor:
+            return response
+
+        if next_cursor is None and (events or offset == 0):
+            # The page reaches the end of the results: the total is exact
+            total = offset + len(events)
+            approximate = False
+        else:
+            count_key = (
+                device_id,
+                tool_name,
+                success,
+                date_from,
+                date_to,
+                search,
+                user_id,
+                approver_id,
+                approval_request_id,
+            )
+            total = await self._approximate_total(conditions, count_key)
+            # Never report fewer events than this page has already shown
+            total = max(total, offset + len(events) + (1 if next_cursor else 0))
+            approximate = True
+
+        # Calculate pagination
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+
+        return {
+            **response,
+            "total": total,
+            "total_approximate": approximate,
+            "page": page,
+            "total_pages": total_pages,
+        }
+
+    async def _approximate_total(self, conditions: list[Any], count_key: tuple[Any, ...]) -> int:
+        """Count matching events, avoiding a COUNT(*) scan where possible.
+
+        Args:
+            conditions: Filter conditions from _build_conditions
+            count_key: Hashable filter values keying the count cache
+
+        Returns:
+            Estimated or recently counted number of matching events
+        """
+        now = time.monotonic()
+        cached = _count_cache.get(count_key)
+        if cached is not None and cached[0] > now:
+            _count_cache.move_to_end(count_key)
+            return cached[1]
+
+        total: int | None = None
+        if not conditions and self.session.get_bind().dialect.name == "postgresql":
+            # Planner statistics; reltuples is -1 until the table is analyzed
+            result = await self.session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'audit_events'")
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate >= 0:
+                total = int(estimate)
+
+        if total is None:
+            count_stmt = select(func.count()).select_from(AuditEventORM)
+            if conditions:
+                count_stmt = count_stmt.where(and_(*conditions))
+            total_result = await self.session.execute(count_stmt)
+            total = total_result.scalar() or 0
+
+        _count_cache[count_key] = (now + AUDIT_COUNT_CACHE_TTL_SECONDS, total)
+        _count_cache.move_to_end(count_key)
+        while len(_count_cache) > AUDIT_COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
+        return total
+
+    async def stream_events(
+        self,
+        device_id: str | None = None,
+        tool_name: str | None = None,
+        success: bool | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        search: str | None = None,
+        user_id: str | None = None,
+        approver_id: str | None = None,
+        approval_request_id: str | None = None,
+        limit: int | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream matching audit events, newest first, without loading them all.
+
+        Rows are read through a server-side cursor in ``batch_size`` chunks
+        (``yield_per``), so memory stays flat for exports of any size.
+
+        Args:
+            device_id: Filter by device ID
+            tool_name: Filter by tool name
+            success: Filter by success status
+            date_from: Filter events from this date
+            date_to: Filter events to this date
+            search: Search query (see parse_audit_search)
+            user_id: Filter by user ID who performed the action
+            approver_id: Filter by approver ID
+            approval_request_id: Filter by approval request ID
+            limit: Maximum number of events (None for all)
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Event dictionaries in the same shape as list_events
+        """
+        conditions = await self._build_conditions(
+            device_id=device_id,
+            tool_name=tool_name,
+            success=success,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            user_id=user_id,
+            approver_id=approver_id,
+            approval_request_id=approval_request_id,
+        )
+
+        stmt = select(AuditEventORM).order_by(
+            desc(AuditEventORM.timestamp), desc(AuditEventORM.id)
+        )
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.stream_scalars(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        try:
+            async for event in result:
+                yield _event_to_dict(event)
+                # Exported rows are never revisited; keep the identity map small
+                self.session.expunge(event)
+        finally:
+            await result.close()
+
+    async def _build_conditions(
+        self,
+        device_id: str | None = None,
+        tool_name: str | None = None,
+        success: bool | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        search: str | None = None,
+        user_id: str | None = None,
+        approver_id: str | None = None,
+        approval_request_id: str | None = None,
+    ) -> list[Any]:
+        """Build WHERE conditions for audit event filters.
+
+        Args:
+            device_id: Filter by device ID
+            tool_name: Filter by tool name
+            success: Filter by success status
+            date_from: Filter events from this date
+            date_to: Filter events to this date
+            search: Search query (see parse_audit_search)
+            user_id: Filter by user ID who performed the action
+            approver_id: Filter by approver ID
+            approval_request_id: Filter by approval request ID
 
         Returns:
-            Dictionary with events, pagination info
+            List of SQLAlchemy conditions (empty when unfiltered)
         """
-        # Build filter conditions
         conditions = []
 
         if device_id:
@@ -105,11 +488,68 @@ class AuditService:
             conditions.append(AuditEventORM.approval_request_id == approval_request_id)
 
         if search:
-            # Search in error_message and meta (as JSON string)
-            # Note: Casting JSON to string for search can be inefficient for large datasets
-            # Consider using database-specific JSON search operators (e.g., PostgreSQL's jsonb_path_query)
-            # or creating a GIN index on meta for better performance if this becomes a bottleneck
-            search_pattern = f"%{search}%"
+            conditions.extend(await self._search_conditions(parse_audit_search(search)))
+
+        return conditions
+
+    async def _search_conditions(self, query: AuditSearchQuery) -> list[Any]:
+        """Build WHERE conditions for a parsed search query.
+
+        Field-scoped values filter on the indexed columns directly. Free-text
+        terms use the full-text index added by migration 40 (tsvector on
+        PostgreSQL, FTS5 on SQLite), falling back to ILIKE when it is absent.
+        The index matches whole words, so "time" does not match "timeout"
+        there, while the ILIKE fallback matches substrings.
+
+        Args:
+            query: Parsed search query
+
+        Returns:
+            List of SQLAlchemy conditions
+        """
+        conditions = []
+
+        if query.tool:
+            conditions.append(
+                or_(*(_match_value(AuditEventORM.tool_name, v) for v in query.tool))
+            )
+
+        if query.device:
+            conditions.append(
+                or_(*(_match_value(AuditEventORM.device_id, v) for v in query.device))
+            )
+
+        if query.user:
+            user_matches = []
+            for value in query.user:
+                user_matches.append(_match_value(AuditEventORM.user_id, value))
+                user_matches.append(_match_value(AuditEventORM.user_sub, value))
+                # user_email is not indexed; only consider it for email-like values
+                if "@" in value:
+                    user_matches.append(_match_value(AuditEventORM.user_email, value))
+            conditions.append(or_(*user_matches))
+
+        if not query.terms:
+            return conditions
+
+        dialect_name = self.session.get_bind().dialect.name
+        if await self._has_search_index(dialect_name):
+            if dialect_name == "postgresql":
+                conditions.append(
+                    literal_column("audit_events.search_vector").op("@@")(
+                        func.plainto_tsquery("simple", " ".join(query.terms))
+                    )
+                )
+            else:
+                # Each term is an FTS5 string (phrase), implicitly AND'ed
+                fts_query = " ".join('"' + t.replace('"', '""') + '"' for t in query.terms)
+                matches = text(
+                    "SELECT event_id FROM audit_events_fts WHERE audit_events_fts MATCH :fts_query"
+                ).bindparams(fts_query=fts_query)
+                conditions.append(AuditEventORM.id.in_(matches))
+        else:
+            # No full-text index yet (migration 40 not applied): scan with ILIKE
+            search_pattern = f"%{' '.join(query.terms)}%"
             conditions.append(
                 or_(
                     AuditEventORM.error_message.ilike(search_pattern),
@@ -117,59 +557,37 @@ class AuditService:
                 )
             )
 
-        # Count total matching events
-        count_stmt = select(func.count()).select_from(AuditEventORM)
-        if conditions:
-            count_stmt = count_stmt.where(and_(*conditions))
+        return conditions
 
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar() or 0
+    async def _has_search_index(self, dialect_name: str) -> bool:
+        """Check whether the audit full-text index (migration 40) exists.
 
-        # Calculate pagination
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        offset = (page - 1) * page_size
+        Args:
+            dialect_name: SQLAlchemy dialect name
 
-        # Query events
-        stmt = select(AuditEventORM).order_by(desc(AuditEventORM.timestamp))
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
-        stmt = stmt.limit(page_size).offset(offset)
+        Returns:
+            True if full-text search can be used
+        """
+        if self._search_index_available is not None:
+            return self._search_index_available
 
-        result = await self.session.execute(stmt)
-        events = result.scalars().all()
-
-        # Convert to dict format
-        events_data = [
-            {
-                "id": event.id,
-                "timestamp": event.timestamp.isoformat(),
-                "user_sub": event.user_sub,
-                "user_email": event.user_email,
-                "user_role": event.user_role,
-                "user_id": event.user_id,
-                "approver_id": event.approver_id,
-                "approval_request_id": event.approval_request_id,
-                "device_id": event.device_id,
-                "environment": event.environment,
-                "action": event.action,
-                "tool_name": event.tool_name,
-                "tool_tier": event.tool_tier,
-                "success": event.result == "SUCCESS",
-                "error_message": event.error_message,
-                "parameters": event.meta.get("parameters") if event.meta else None,
-                "result_summary": event.meta.get("result_summary") if event.meta else None,
-                "correlation_id": event.meta.get("correlation_id") if event.meta else None,
-            }
-            for event in events
-        ]
+        if dialect_name == "postgresql":
+            stmt = text(
+                "SELECT count(*) FROM information_schema.columns "
+                "WHERE table_name = 'audit_events' AND column_name = 'search_vector'"
+            )
+        elif dialect_name == "sqlite":
+            stmt = text(
+                "SELECT count(*) FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'audit_events_fts'"
+            )
+        else:
+            self._search_index_available = False
+            return False
 
-        return {
-            "events": events_data,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": total_pages,
-        }
+        result = await self.session.execute(stmt)
+        self._search_index_available = bool(result.scalar())
+        return self._search_index_available
 
     async def get_unique_devices(self) -> list[str]:
         """Get list of unique device IDs that have audit events.
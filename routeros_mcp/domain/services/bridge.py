@@ -17,6 +17,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.domain.utils import parse_routeros_bool
+from routeros_mcp.infra.routeros.cli_parser import iter_print_records
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
@@ -24,9 +26,22 @@ from routeros_mcp.infra.routeros.exceptions import (
     RouterOSTimeoutError,
 )
 from routeros_mcp.infra.routeros.rest_client import RouterOSRestClient
+from routeros_mcp.infra.routeros.topology import observe_device_facts
 
 logger = logging.getLogger(__name__)
 
+# Bridge properties kept from SSH detail output
+_BRIDGE_FIELDS = frozenset({
+    "name", "mtu", "actual_mtu", "l2mtu", "mac_address",
+    "protocol_mode", "fast_forward", "igmp_snooping",
+    "vlan_filtering", "arp", "comment", "auto_mac",
+    "ageing_time", "priority", "max_message_age",
+    "forward_delay", "transmit_hold_count",
+})
+
+# Defaults for the bridge port columns after HW, in print order
+_BRIDGE_PORT_COLUMN_DEFAULTS = ["none", "no", "no", "no", "auto", "auto", "1", "admit-all"]
+
 
 class BridgeService:
     """Service for RouterOS bridge operations.
@@ -34,6 +49,7 @@ class BridgeService:
     Responsibilities:
     - Query bridge list and configuration
     - Retrieve bridge ports and their assignments
+    - List learned bridge hosts (MAC address table)
     - Query VLAN configuration on bridges
     - Normalize RouterOS responses to domain models
 
@@ -46,6 +62,9 @@ class BridgeService:
 
             # Get bridge ports
             ports = await service.list_bridge_ports("dev-lab-01")
+
+            # Get learned hosts (MAC address table)
+            hosts = await service.list_bridge_hosts("dev-lab-01")
     """
 
     def __init__(
@@ -161,7 +180,7 @@ class BridgeService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/interface/bridge/print")
+            output = await ssh_client.execute("/interface/bridge/print terse without-paging")
             return self._parse_bridge_print_output(output)
         finally:
             await ssh_client.close()
@@ -170,7 +189,8 @@ class BridgeService:
     def _parse_bridge_print_output(output: str) -> list[dict[str, Any]]:
         """Parse /interface/bridge/print output into bridge list.
 
-        Handles RouterOS multi-line detail format with continuation lines.
+        Handles ``print terse`` output (one line of key=value pairs per bridge)
+        and the multi-line detail format with continuation lines.
         RouterOS output format:
         Flags: D - dynamic; X - disabled, R - running
          0  R name="bridge-lan" mtu=auto actual-mtu=1500 l2mtu=1514 arp=enabled arp-timeout=auto
@@ -181,145 +201,43 @@ class BridgeService:
         """
         bridges: list[dict[str, Any]] = []
 
-        lines = output.strip().split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Skip empty lines and header lines
-            if not line.strip() or line.strip().startswith("Flags:") or line.strip().startswith("Columns:"):
-                i += 1
-                continue
+        for record in iter_print_records(output, flag_chars="RDSX"):
+            bridge_data: dict[str, Any] = {
+                "id": record.id,
+                "disabled": "D" in record.flags or "X" in record.flags,
+                "running": "R" in record.flags,
+                # Defaults
+                "name": "",
+                "mtu": "auto",
+                "actual_mtu": 1500,
+                "l2mtu": 1514,
+                "mac_address": "",
+                "protocol_mode": "rstp",
+                "fast_forward": True,
+                "vlan_filtering": False,
+                "arp": "enabled",
+                "arp_timeout": "auto",
+                "auto_mac": True,
+                "ageing_time": "5m",
+                "priority": "0x8000",
+                "comment": "",
+            }
 
-            # Parse data line (starts with ID number, potentially with leading spaces)
-            stripped = line.lstrip()
-            if stripped and stripped[0].isdigit():
-                # This is a data line for a bridge entry
-                parts = stripped.split()
-                if not parts:
-                    i += 1
+            for key, value in record.values.items():
+                key_lower = key.lower().replace("-", "_")
+                if key_lower not in _BRIDGE_FIELDS:
                     continue
+                # Convert yes/no to boolean
+                if value in ("yes", "true"):
+                    bridge_data[key_lower] = True
+                elif value in ("no", "false"):
+                    bridge_data[key_lower] = False
+                elif key_lower == "actual_mtu" and value.isdigit():
+                    bridge_data[key_lower] = int(value)
+                else:
+                    bridge_data[key_lower] = value
 
-                try:
-                    # Format: [id] [flags] [comment*] key=value key=value ...
-                    bridge_id = parts[0]
-                    flags = ""
-                    idx = 1
-
-                    # Check if second part is a flag (single letter like R, D, etc.)
-                    if len(parts) > 1 and len(parts[1]) == 1 and parts[1] in "RDSX":
-                        flags = parts[1]
-                        idx = 2
-
-                    # Skip comment if present (starts with ;;;)
-                    if len(parts) > idx and parts[idx].startswith(";;;"):
-                        idx += 1
-                        # Collect rest of comment line until we find key=value
-                        while idx < len(parts) and "=" not in parts[idx]:
-                            idx += 1
-
-                    # Parse key=value pairs on this line
-                    bridge_data = {
-                        "id": bridge_id,
-                        "disabled": "D" in flags or "X" in flags,
-                        "running": "R" in flags,
-                        # Defaults
-                        "name": "",
-                        "mtu": "auto",
-                        "actual_mtu": 1500,
-                        "l2mtu": 1514,
-                        "mac_address": "",
-                        "protocol_mode": "rstp",
-                        "fast_forward": True,
-                        "vlan_filtering": False,
-                        "arp": "enabled",
-                        "arp_timeout": "auto",
-                        "auto_mac": True,
-                        "ageing_time": "5m",
-                        "priority": "0x8000",
-                        "comment": "",
-                    }
-
-                    # Parse key=value pairs on this line
-                    for part in parts[idx:]:
-                        if "=" in part:
-                            key, value = part.split("=", 1)
-                            # Remove quotes if present
-                            value = value.strip('"')
-                            # Store known fields
-                            key_lower = key.lower().replace("-", "_")
-                            if key_lower in [
-                                "name", "mtu", "actual_mtu", "l2mtu", "mac_address",
-                                "protocol_mode", "fast_forward", "igmp_snooping",
-                                "vlan_filtering", "arp", "comment", "auto_mac",
-                                "ageing_time", "priority", "max_message_age",
-                                "forward_delay", "transmit_hold_count"
-                            ]:
-                                # Convert yes/no to boolean
-                                if value in ("yes", "true"):
-                                    bridge_data[key_lower] = True
-                                elif value in ("no", "false"):
-                                    bridge_data[key_lower] = False
-                                elif key_lower == "actual_mtu" and value.isdigit():
-                                    bridge_data[key_lower] = int(value)
-                                else:
-                                    bridge_data[key_lower] = value
-
-                    bridges.append(bridge_data)
-                    i += 1
-
-                    # Process continuation lines (lines that start with spaces and are part of this bridge)
-                    while i < len(lines):
-                        continuation_line = lines[i]
-                        # Continuation lines start with spaces and don't start a new entry (no leading digit after lstrip)
-                        if continuation_line.startswith(" ") or continuation_line.startswith("\t"):
-                            stripped_cont = continuation_line.lstrip()
-                            # If after stripping leading space it doesn't start with a digit, it's a continuation
-                            if stripped_cont and not stripped_cont[0].isdigit():
-                                # This is a continuation line - parse key=value pairs
-                                # Skip if this is a comment line (;;;)
-                                if ";;;" not in stripped_cont:
-                                    parts_cont = stripped_cont.split()
-                                    current_bridge = bridges[-1]
-                                    for part in parts_cont:
-                                        if "=" in part:
-                                            key, value = part.split("=", 1)
-                                            # Remove quotes if present
-                                            value = value.strip('"')
-                                            # Store known fields
-                                            key_lower = key.lower().replace("-", "_")
-                                            if key_lower in [
-                                                "name", "mtu", "actual_mtu", "l2mtu", "mac_address",
-                                                "protocol_mode", "fast_forward", "igmp_snooping",
-                                                "vlan_filtering", "arp", "comment", "auto_mac",
-                                                "ageing_time", "priority", "max_message_age",
-                                                "forward_delay", "transmit_hold_count"
-                                            ]:
-                                                # Convert yes/no to boolean
-                                                if value in ("yes", "true"):
-                                                    current_bridge[key_lower] = True
-                                                elif value in ("no", "false"):
-                                                    current_bridge[key_lower] = False
-                                                elif key_lower == "actual_mtu" and value.isdigit():
-                                                    current_bridge[key_lower] = int(value)
-                                                else:
-                                                    current_bridge[key_lower] = value
-                                i += 1
-                            else:
-                                # This is a new entry, break the continuation loop
-                                break
-                        else:
-                            # Empty line or next section
-                            if not continuation_line.strip():
-                                i += 1
-                            break
-
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Failed to parse bridge line: {line!r}: {e}")
-                    i += 1
-            else:
-                # Skip non-data lines
-                i += 1
+            bridges.append(bridge_data)
 
         return bridges
 
@@ -347,6 +265,7 @@ class BridgeService:
                 port["transport"] = "rest"
                 port["fallback_used"] = False
                 port["rest_error"] = None
+            observe_device_facts(self.settings, device_id, bridge_ports=ports)
             return ports
         except (
             RouterOSTimeoutError,
@@ -367,6 +286,7 @@ class BridgeService:
                     port["transport"] = "ssh"
                     port["fallback_used"] = True
                     port["rest_error"] = str(rest_exc)
+                observe_device_facts(self.settings, device_id, bridge_ports=ports)
                 return ports
             except Exception as ssh_exc:
                 logger.error(
@@ -421,7 +341,7 @@ class BridgeService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/interface/bridge/port/print")
+            output = await ssh_client.execute("/interface/bridge/port/print terse without-paging")
             return self._parse_bridge_port_print_output(output)
         finally:
             await ssh_client.close()
@@ -437,139 +357,218 @@ class BridgeService:
          #     INTERFACE  BRIDGE      HW   HORIZON  TRUSTED  FAST-LEAVE  BPDU-GUARD  EDGE  POINT-TO-POINT  PVID  FRAME-TYPES
          0   H ether2     bridge-lan  yes  none     no       no          yes         auto  auto              20  admit-all
          1 I H ether3     bridge-lan  yes  none     no       no          yes         auto  auto              30  admit-all
+
+        ``print terse`` rows carry the same columns as key=value pairs:
+         0 I H interface=ether3 bridge=bridge-lan horizon=none learn=auto trusted=no pvid=30 ...
         """
         ports: list[dict[str, Any]] = []
 
-        # Skip header lines
-        lines = output.strip().split("\n")
-        for line in lines:
-            # Skip header/metadata/comment lines
-            if (
-                not line.strip()
-                or line.startswith("Flags:")
-                or line.startswith("Columns:")
-                or line.startswith("#")
-                or line.startswith(";;;")
-            ):
+        for record in iter_print_records(output, flag_chars="HIDhid", multiline=False):
+            if record.values:
+                if "interface" not in record.values:
+                    continue
+                ports.append(BridgeService._bridge_port_from_values(record.id, record.flags, record.values))
                 continue
 
-            # Parse data lines (start with number, potentially with flags)
-            parts = line.split()
-            if not parts or not parts[0][0].isdigit():
+            # Format: [flags...] [interface] [bridge] [hw] [horizon] [trusted] [fast-leave] [bpdu-guard] [edge] [point-to-point] [pvid] [frame-types]
+            parts = record.tokens
+
+            # Flags can be spread over several tokens ("I H")
+            flags = record.flags
+            while parts and len(parts[0]) <= 2 and all(c in "HIDhid" for c in parts[0]):
+                flags += parts.pop(0)
+
+            if len(parts) < 2:
                 continue
+            interface, bridge = parts[0], parts[1]
+            columns = parts[2:]
+
+            # The HW column can be empty (missing), so only consume it when present
+            hw = False
+            if columns and columns[0] in ("yes", "no"):
+                hw = columns.pop(0) == "yes"
+
+            (
+                horizon,
+                trusted,
+                fast_leave,
+                bpdu_guard,
+                edge,
+                point_to_point,
+                pvid,
+                frame_types,
+            ) = (columns + _BRIDGE_PORT_COLUMN_DEFAULTS[len(columns) :])[:8]
+
+            ports.append({
+                "id": record.id,
+                "interface": interface,
+                "bridge": bridge,
+                "disabled": "I" in flags,  # INACTIVE flag = disabled
+                "dynamic": "D" in flags,  # DYNAMIC flag
+                "hw": hw,  # The HW column value (yes/no)
+                "hw_offload_flag": "H" in flags,  # The H flag in the left margin
+                "pvid": int(pvid) if pvid.isdigit() else 1,
+                "priority": "0x80",  # Default
+                "path_cost": 10,  # Default
+                "horizon": horizon,
+                "edge": edge,
+                "point_to_point": point_to_point,
+                "learn": "auto",  # Default
+                "trusted": trusted == "yes",
+                "frame_types": frame_types,
+                "bpdu_guard": bpdu_guard == "yes",
+                "fast_leave": fast_leave == "yes",
+                "ingress_filtering": False,  # Default
+                "tag_stacking": False,  # Default
+                "comment": "",
+            })
 
+        return ports
+
+    @staticmethod
+    def _bridge_port_from_values(port_id: str, flags: str, values: dict[str, str]) -> dict[str, Any]:
+        """Build a port dict from ``print terse`` key=value pairs."""
+        pvid = values.get("pvid", "1")
+        return {
+            "id": port_id,
+            "interface": values["interface"],
+            "bridge": values.get("bridge", ""),
+            "disabled": "I" in flags or "X" in flags,
+            "dynamic": "D" in flags,
+            "hw": values.get("hw") == "yes",
+            "hw_offload_flag": "H" in flags,
+            "pvid": int(pvid) if pvid.isdigit() else 1,
+            "priority": values.get("priority", "0x80"),
+            "path_cost": int(values["path-cost"]) if values.get("path-cost", "").isdigit() else 10,
+            "horizon": values.get("horizon", "none"),
+            "edge": values.get("edge", "auto"),
+            "point_to_point": values.get("point-to-point", "auto"),
+            "learn": values.get("learn", "auto"),
+            "trusted": values.get("trusted") == "yes",
+            "frame_types": values.get("frame-types", "admit-all"),
+            "bpdu_guard": values.get("bpdu-guard") == "yes",
+            "fast_leave": values.get("fast-leave") == "yes",
+            "ingress_filtering": values.get("ingress-filtering") == "yes",
+            "tag_stacking": values.get("tag-stacking") == "yes",
+            "comment": values.get("comment", ""),
+        }
+
+
+    async def list_bridge_hosts(
+        self,
+        device_id: str,
+    ) -> list[dict[str, Any]]:
+        """List learned bridge hosts (the bridge FDB) with REST→SSH fallback.
+
+        Args:
+            device_id: Device identifier
+
+        Returns:
+            List of bridge host dictionaries (MAC address, port, bridge, VLAN)
+
+        Raises:
+            DeviceNotFoundError: If device doesn't exist
+        """
+        await self.device_service.get_device(device_id)
+
+        try:
+            hosts = await self._list_bridge_hosts_via_rest(device_id)
+            for host in hosts:
+                host["transport"] = "rest"
+                host["fallback_used"] = False
+                host["rest_error"] = None
+            return hosts
+        except Exception as rest_exc:
+            logger.warning(
+                f"REST bridge host listing failed, attempting SSH fallback: {rest_exc}",
+                extra={"device_id": device_id},
+            )
             try:
-                # Format: [id] [flags...] [interface] [bridge] [hw] [horizon] [trusted] [fast-leave] [bpdu-guard] [edge] [point-to-point] [pvid] [frame-types]
-                idx = 0
+                hosts = await self._list_bridge_hosts_via_ssh(device_id)
+                for host in hosts:
+                    host["transport"] = "ssh"
+                    host["fallback_used"] = True
+                    host["rest_error"] = str(rest_exc)
+                return hosts
+            except Exception as ssh_exc:
+                logger.error(
+                    "Both REST and SSH bridge host listing failed",
+                    exc_info=ssh_exc,
+                    extra={"device_id": device_id, "rest_error": str(rest_exc)},
+                )
+                raise RuntimeError(
+                    f"Bridge host listing failed via REST and SSH: "
+                    f"rest_error={rest_exc}, ssh_error={ssh_exc}"
+                ) from ssh_exc
 
-                # First part is always the ID
-                port_id = parts[0]
-                idx = 1
+    async def _list_bridge_hosts_via_rest(self, device_id: str) -> list[dict[str, Any]]:
+        """Fetch bridge hosts via REST API."""
+        client = await self.device_service.get_rest_client(device_id)
 
-                # Parse flags (can be single or multiple letters: I, D, H, or combinations like "I H", "ID", "IH", etc.)
-                flags = ""
-                while idx < len(parts) and all(c in "HIDhid " for c in parts[idx]) and len(parts[idx]) <= 2:
-                    flags += parts[idx].replace(" ", "")
-                    idx += 1
+        try:
+            hosts_data = await client.get("/rest/interface/bridge/host")
 
-                # Extract interface name
-                if idx >= len(parts):
-                    continue
-                interface = parts[idx]
-                idx += 1
+            result: list[dict[str, Any]] = []
+            if isinstance(hosts_data, list):
+                for host in hosts_data:
+                    if isinstance(host, dict):
+                        # REST returns flags as "true"/"false" and vid as a string
+                        vid = str(host.get("vid", ""))
+                        result.append({
+                            "id": host.get(".id", ""),
+                            "mac_address": host.get("mac-address", ""),
+                            "on_interface": host.get("on-interface", ""),
+                            "bridge": host.get("bridge", ""),
+                            "vid": int(vid) if vid.isdigit() else None,
+                            "dynamic": parse_routeros_bool(host.get("dynamic")),
+                            "local": parse_routeros_bool(host.get("local")),
+                            "external": parse_routeros_bool(host.get("external")),
+                            "disabled": parse_routeros_bool(host.get("disabled")),
+                        })
 
-                # Extract bridge name
-                if idx >= len(parts):
-                    continue
-                bridge = parts[idx]
-                idx += 1
-
-                # Parse remaining columns: hw, horizon, trusted, fast-leave, bpdu-guard, edge, point-to-point, pvid, frame-types
-                # The HW column can be empty (missing), so we need to detect it intelligently
-                hw = False
-                horizon = "none"
-                trusted = False
-                fast_leave = False
-                bpdu_guard = False
-                edge = "auto"
-                point_to_point = "auto"
-                pvid = 1
-                frame_types = "admit-all"
-
-                # Check if next column is HW (yes/no)
-                if idx < len(parts) and parts[idx] in ("yes", "no"):
-                    hw = parts[idx] == "yes"
-                    idx += 1
-                # If not, HW column is empty/missing, so we don't consume a part
-
-                # Now parse the remaining columns in order
-                if idx < len(parts):
-                    horizon = parts[idx]
-                    idx += 1
-
-                if idx < len(parts):
-                    trusted = parts[idx] == "yes"
-                    idx += 1
-
-                if idx < len(parts):
-                    fast_leave = parts[idx] == "yes"
-                    idx += 1
-
-                if idx < len(parts):
-                    bpdu_guard = parts[idx] == "yes"
-                    idx += 1
-
-                if idx < len(parts):
-                    edge = parts[idx]
-                    idx += 1
-
-                if idx < len(parts):
-                    point_to_point = parts[idx]
-                    idx += 1
-
-                if idx < len(parts):
-                    pvid = int(parts[idx]) if parts[idx].isdigit() else 1
-                    idx += 1
-
-                if idx < len(parts):
-                    frame_types = parts[idx]
-                    idx += 1
-
-                # Determine status flags from flags string
-                # I = INACTIVE, D = DYNAMIC, H = HW-OFFLOAD
-                inactive = "I" in flags
-                dynamic = "D" in flags
-                hw_offload_flag = "H" in flags
-
-                ports.append({
-                    "id": port_id,
-                    "interface": interface,
-                    "bridge": bridge,
-                    "disabled": inactive,  # INACTIVE flag = disabled
-                    "dynamic": dynamic,  # DYNAMIC flag
-                    "hw": hw,  # The HW column value (yes/no)
-                    "hw_offload_flag": hw_offload_flag,  # The H flag in the left margin
-                    "pvid": pvid,
-                    "priority": "0x80",  # Default
-                    "path_cost": 10,  # Default
-                    "horizon": horizon,
-                    "edge": edge,
-                    "point_to_point": point_to_point,
-                    "learn": "auto",  # Default
-                    "trusted": trusted,
-                    "frame_types": frame_types,
-                    "bpdu_guard": bpdu_guard,
-                    "fast_leave": fast_leave,
-                    "ingress_filtering": False,  # Default
-                    "tag_stacking": False,  # Default
-                    "comment": "",
-                })
-
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse bridge port line: {line!r}: {e}")
-                continue
+            return result
 
-        return ports
+        finally:
+            await client.close()
+
+    async def _list_bridge_hosts_via_ssh(self, device_id: str) -> list[dict[str, Any]]:
+        """Fetch bridge hosts via SSH CLI."""
+        ssh_client = await self.device_service.get_ssh_client(device_id)
+
+        try:
+            output = await ssh_client.execute("/interface/bridge/host/print terse without-paging")
+            return self._parse_bridge_host_print_output(output)
+        finally:
+            await ssh_client.close()
+
+    @staticmethod
+    def _parse_bridge_host_print_output(output: str) -> list[dict[str, Any]]:
+        """Parse /interface/bridge/host/print terse output into host list.
+
+        RouterOS output format (one host per line):
+        Flags: X - disabled, I - invalid; D - dynamic; L - local; E - external
+         0  D  mac-address=18:FD:74:7C:7B:4F vid=20 on-interface=ether2 bridge=bridge-lan
+         1 DL  mac-address=78:9A:18:A2:F3:D3 on-interface=bridge-lan bridge=bridge-lan
+        """
+        hosts: list[dict[str, Any]] = []
+
+        for record in iter_print_records(output, flag_chars="XIDLE", multiline=False):
+            if "mac-address" not in record.values:
+                continue
+            vid = record.values.get("vid", "")
+            hosts.append({
+                "id": record.id,
+                "mac_address": record.values["mac-address"],
+                "on_interface": record.values.get("on-interface", ""),
+                "bridge": record.values.get("bridge", ""),
+                "vid": int(vid) if vid.isdigit() else None,
+                "dynamic": "D" in record.flags,
+                "local": "L" in record.flags,
+                "external": "E" in record.flags,
+                "disabled": "X" in record.flags,
+            })
+
+        return hosts
 
 
 class BridgePlanService:
@@ -749,6 +748,7 @@ class BridgePlanService:
         device_environment: str = "lab",
         is_stp_change: bool = False,
         is_vlan_filtering_change: bool = False,
+        isolated_devices: int = 0,
     ) -> str:
         """Assess risk level for a bridge operation.
 
@@ -758,6 +758,8 @@ class BridgePlanService:
           - STP/RSTP/MSTP parameter changes
           - VLAN filtering changes
           - Port removal from production bridge
+          - Topology graph shows devices or L2 neighbours reachable only
+            through the interface a removal or settings change affects
         - Medium risk:
           - Lab/staging environments
           - Port additions
@@ -768,6 +770,10 @@ class BridgePlanService:
             device_environment: Device environment (lab/staging/prod)
             is_stp_change: Whether operation modifies STP settings
             is_vlan_filtering_change: Whether operation modifies VLAN filtering
+            isolated_devices: Devices and L2 neighbours the topology graph
+                reports cut off if the changed interface goes down (only
+                meaningful for port removal and bridge settings changes;
+                adding a port cuts nothing off)
 
         Returns:
             Risk level: "medium" or "high"
@@ -785,6 +791,10 @@ class BridgePlanService:
             logger.info("High risk: VLAN filtering changes affect network segmentation")
             return "high"
 
+        if isolated_devices > 0:
+            logger.info(f"High risk: {isolated_devices} device(s) reachable only via this change")
+            return "high"
+
         if operation == "remove_bridge_port":
             logger.info("High risk: port removal may disrupt connectivity")
             return "high"
@@ -1,7 +1,7 @@
 """Compliance reporting service for audit logs, approvals, and policy violations.
 
 This service provides read-only compliance reporting endpoints for:
-- Audit log exports (CSV/JSON)
+- Audit log exports (CSV/JSON, streamed CSV/NDJSON)
 - Approval decision summaries
 - Policy violations (authorization failures)
 - Role assignment audit trails
@@ -15,6 +15,7 @@ See Phase 5 #11 requirements for detailed specifications.
 import csv
 import io
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, Literal
 
@@ -26,6 +27,27 @@ from routeros_mcp.infra.db.models import AuditEvent as AuditEventORM
 
 logger = logging.getLogger(__name__)
 
+# (CSV header, event key) pairs for compliance audit exports
+COMPLIANCE_EXPORT_COLUMNS = [
+    ("ID", "id"),
+    ("Timestamp", "timestamp"),
+    ("User Sub", "user_sub"),
+    ("User Email", "user_email"),
+    ("User Role", "user_role"),
+    ("User ID", "user_id"),
+    ("Approver ID", "approver_id"),
+    ("Approval Request ID", "approval_request_id"),
+    ("Device ID", "device_id"),
+    ("Environment", "environment"),
+    ("Action", "action"),
+    ("Tool Name", "tool_name"),
+    ("Tool Tier", "tool_tier"),
+    ("Plan ID", "plan_id"),
+    ("Job ID", "job_id"),
+    ("Result", "result"),
+    ("Error Message", "error_message"),
+]
+
 
 class ComplianceService:
     """Service for compliance reporting and audit analysis.
@@ -57,6 +79,9 @@ class ComplianceService:
     ) -> dict[str, Any] | str:
         """Export audit events for compliance reporting.
 
+        Builds the whole export in memory; use :meth:`stream_audit_events`
+        for unbounded exports.
+
         Args:
             date_from: Start date for filtering (inclusive)
             date_to: End date for filtering (inclusive)
@@ -70,53 +95,16 @@ class ComplianceService:
             For JSON: Dictionary with events array and metadata
             For CSV: CSV string with headers and event data
         """
-        # Build query
-        query = select(AuditEventORM).order_by(desc(AuditEventORM.timestamp))
-
-        conditions = []
-        if date_from:
-            conditions.append(AuditEventORM.timestamp >= date_from)
-        if date_to:
-            conditions.append(AuditEventORM.timestamp <= date_to)
-        if device_id:
-            conditions.append(AuditEventORM.device_id == device_id)
-        if tool_name:
-            conditions.append(AuditEventORM.tool_name == tool_name)
-        if user_id:
-            conditions.append(AuditEventORM.user_id == user_id)
-
-        if conditions:
-            query = query.where(and_(*conditions))
-
-        query = query.limit(limit)
-
-        # Execute query
-        result = await self.session.execute(query)
-        events = result.scalars().all()
-
-        # Convert to data format
-        # Note: meta field is excluded from export to prevent accidental exposure of sensitive data
         events_data = [
-            {
-                "id": event.id,
-                "timestamp": event.timestamp.isoformat(),
-                "user_sub": event.user_sub,
-                "user_email": event.user_email,
-                "user_role": event.user_role,
-                "user_id": event.user_id,
-                "approver_id": event.approver_id,
-                "approval_request_id": event.approval_request_id,
-                "device_id": event.device_id,
-                "environment": event.environment,
-                "action": event.action,
-                "tool_name": event.tool_name,
-                "tool_tier": event.tool_tier,
-                "plan_id": event.plan_id,
-                "job_id": event.job_id,
-                "result": event.result,
-                "error_message": event.error_message,
-            }
-            for event in events
+            event
+            async for event in self.stream_audit_events(
+                date_from=date_from,
+                date_to=date_to,
+                device_id=device_id,
+                tool_name=tool_name,
+                user_id=user_id,
+                limit=limit,
+            )
         ]
 
         if format == "csv":
@@ -134,6 +122,87 @@ class ComplianceService:
                 },
             }
 
+    async def stream_audit_events(
+        self,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        device_id: str | None = None,
+        tool_name: str | None = None,
+        user_id: str | None = None,
+        limit: int | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream audit events for compliance export, newest first.
+
+        Rows are read through a server-side cursor in ``batch_size`` chunks
+        (``yield_per``), so a full year of events can be exported with
+        constant memory.
+
+        Args:
+            date_from: Start date for filtering (inclusive)
+            date_to: End date for filtering (inclusive)
+            device_id: Filter by device ID
+            tool_name: Filter by tool name
+            user_id: Filter by user ID
+            limit: Maximum number of events (None for all)
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Event dictionaries (meta excluded)
+        """
+        query = select(AuditEventORM).order_by(
+            desc(AuditEventORM.timestamp), desc(AuditEventORM.id)
+        )
+
+        conditions = []
+        if date_from:
+            conditions.append(AuditEventORM.timestamp >= date_from)
+        if date_to:
+            conditions.append(AuditEventORM.timestamp <= date_to)
+        if device_id:
+            conditions.append(AuditEventORM.device_id == device_id)
+        if tool_name:
+            conditions.append(AuditEventORM.tool_name == tool_name)
+        if user_id:
+            conditions.append(AuditEventORM.user_id == user_id)
+
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await self.session.stream_scalars(
+            query.execution_options(yield_per=batch_size)
+        )
+        try:
+            async for event in result:
+                # Note: meta field is excluded from export to prevent accidental
+                # exposure of sensitive data
+                yield {
+                    "id": event.id,
+                    "timestamp": event.timestamp.isoformat(),
+                    "user_sub": event.user_sub,
+                    "user_email": event.user_email,
+                    "user_role": event.user_role,
+                    "user_id": event.user_id,
+                    "approver_id": event.approver_id,
+                    "approval_request_id": event.approval_request_id,
+                    "device_id": event.device_id,
+                    "environment": event.environment,
+                    "action": event.action,
+                    "tool_name": event.tool_name,
+                    "tool_tier": event.tool_tier,
+                    "plan_id": event.plan_id,
+                    "job_id": event.job_id,
+                    "result": event.result,
+                    "error_message": event.error_message,
+                }
+                # Exported rows are never revisited; keep the identity map small
+                self.session.expunge(event)
+        finally:
+            await result.close()
+
     def _export_events_csv(self, events: list[dict[str, Any]]) -> str:
         """Convert events to CSV format.
 
@@ -147,49 +216,14 @@ class ComplianceService:
         writer = csv.writer(output)
 
         # Write header
-        writer.writerow(
-            [
-                "ID",
-                "Timestamp",
-                "User Sub",
-                "User Email",
-                "User Role",
-                "User ID",
-                "Approver ID",
-                "Approval Request ID",
-                "Device ID",
-                "Environment",
-                "Action",
-                "Tool Name",
-                "Tool Tier",
-                "Plan ID",
-                "Job ID",
-                "Result",
-                "Error Message",
-            ]
-        )
+        writer.writerow([header for header, _key in COMPLIANCE_EXPORT_COLUMNS])
 
         # Write rows with consistent null handling
         for event in events:
             writer.writerow(
                 [
-                    event.get("id", ""),
-                    event.get("timestamp", ""),
-                    event.get("user_sub", ""),
-                    event.get("user_email") or "",
-                    event.get("user_role", ""),
-                    event.get("user_id") or "",
-                    event.get("approver_id") or "",
-                    event.get("approval_request_id") or "",
-                    event.get("device_id") or "",
-                    event.get("environment") or "",
-                    event.get("action", ""),
-                    event.get("tool_name", ""),
-                    event.get("tool_tier", ""),
-                    event.get("plan_id") or "",
-                    event.get("job_id") or "",
-                    event.get("result", ""),
-                    event.get("error_message") or "",
+                    "" if event.get(key) is None else event[key]
+                    for _header, key in COMPLIANCE_EXPORT_COLUMNS
                 ]
             )
 
@@ -27,8 +27,10 @@ from routeros_mcp.domain.models import (
 from routeros_mcp.domain.models import (
     Device as DeviceDomain,
 )
+from routeros_mcp.domain.request_context import CredentialRecord, get_request_context
 from routeros_mcp.infra.db.models import Credential as CredentialORM
 from routeros_mcp.infra.db.models import Device as DeviceORM
+from routeros_mcp.infra.device_registry import get_device_registry
 from routeros_mcp.infra.observability import metrics
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSAuthenticationError,
@@ -45,6 +47,7 @@ from routeros_mcp.infra.routeros.exceptions import (
 )
 from routeros_mcp.infra.routeros.rest_client import RouterOSRestClient
 from routeros_mcp.infra.routeros.ssh_client import RouterOSSSHClient
+from routeros_mcp.infra.routeros.ssh_pool import get_ssh_pool
 from routeros_mcp.mcp.errors import (
     AuthenticationError,
     DeviceNotFoundError,
@@ -169,6 +172,7 @@ class DeviceService:
         self.session.add(device_orm)
         await self.session.commit()
         await self.session.refresh(device_orm)
+        self._record_device_change(device_orm)
 
         logger.info(
             "Registered device",
@@ -260,16 +264,36 @@ class DeviceService:
                 data={"device_id": device_id, "reason": "not_in_scope"},
             )
 
-        result = await self.session.execute(select(DeviceORM).where(DeviceORM.id == device_id))
-        device_orm = result.scalar_one_or_none()
+        # Within a tool call the device row is fetched once and memoized
+        context = get_request_context()
+        if context is not None:
+            cached = context.get_device(device_id)
+            if cached is not None:
+                return cached
 
-        if not device_orm:
-            raise DeviceNotFoundError(
-                f"Device '{device_id}' not found",
-                data={"device_id": device_id},
+        registry = get_device_registry()
+        device = registry.get(device_id) if registry is not None else None
+
+        if device is None:
+            result = await self.session.execute(
+                select(DeviceORM).where(DeviceORM.id == device_id)
             )
+            device_orm = result.scalar_one_or_none()
 
-        return DeviceDomain.model_validate(device_orm)
+            if not device_orm:
+                raise DeviceNotFoundError(
+                    f"Device '{device_id}' not found",
+                    data={"device_id": device_id},
+                )
+
+            device = DeviceDomain.model_validate(device_orm)
+            # Registered by another replica since the last registry sync
+            if registry is not None:
+                registry.upsert(device)
+
+        if context is not None:
+            context.devices[device_id] = device
+        return device
 
     async def list_devices(
         self,
@@ -288,6 +312,15 @@ class DeviceService:
         Returns:
             List of devices (filtered by scope if provided)
         """
+        registry = get_device_registry()
+        if registry is not None:
+            devices: list[DeviceDomain] = registry.find(
+                environment=environment,
+                status=status,
+                device_ids=allowed_device_ids or None,
+            )
+            return devices
+
         query = select(DeviceORM)
 
         if environment:
@@ -342,6 +375,7 @@ class DeviceService:
 
         await self.session.commit()
         await self.session.refresh(device_orm)
+        self._record_device_change(device_orm)
 
         logger.info(
             "Updated device",
@@ -452,6 +486,7 @@ class DeviceService:
 
         self.session.add(credential_orm)
         await self.session.commit()
+        self._forget_device(credential_data.device_id)
 
         logger.info(
             "Added credential",
@@ -493,14 +528,7 @@ class DeviceService:
         device = await self.get_device(device_id)
 
         # Get REST credentials (no fallback)
-        result = await self.session.execute(
-            select(CredentialORM).where(
-                CredentialORM.device_id == device_id,
-                CredentialORM.credential_type == REST_KIND,
-                CredentialORM.active == True,  # noqa: E712
-            )
-        )
-        credential = result.scalar_one_or_none()
+        credential = await self._get_active_credential(device_id, REST_KIND)
 
         if not credential:
             raise AuthenticationError(
@@ -539,7 +567,9 @@ class DeviceService:
     ) -> RouterOSSSHClient:
         """Get SSH client for device with decrypted credentials.
 
-        Caller must close the returned client (`await client.close()`).
+        Caller must close the returned client (`await client.close()`). When
+        the SSH pool is initialized the client leases the device's shared
+        connection, and closing it returns the connection to the pool.
 
         Phase 4: Supports both SSH key and password authentication.
         Tries routeros_ssh_key first, falls back to ssh password if not found.
@@ -547,14 +577,7 @@ class DeviceService:
         device = await self.get_device(device_id)
 
         # Phase 4: Try SSH key credential first
-        result = await self.session.execute(
-            select(CredentialORM).where(
-                CredentialORM.device_id == device_id,
-                CredentialORM.credential_type == "routeros_ssh_key",
-                CredentialORM.active == True,  # noqa: E712
-            )
-        )
-        key_credential = result.scalar_one_or_none()
+        key_credential = await self._get_active_credential(device_id, "routeros_ssh_key")
 
         if key_credential:
             # Check if private_key is actually present
@@ -586,6 +609,7 @@ class DeviceService:
                         private_key=private_key,
                         timeout_seconds=self.settings.routeros_rest_timeout_seconds,
                         max_retries=self.settings.routeros_retry_attempts,
+                        pool=get_ssh_pool(),
                     )
                     logger.info(
                         f"SSH client created with key authentication for device '{device_id}'"
@@ -593,14 +617,7 @@ class DeviceService:
                     return client
 
         # Fallback to password-based SSH authentication
-        result = await self.session.execute(
-            select(CredentialORM).where(
-                CredentialORM.device_id == device_id,
-                CredentialORM.credential_type == SSH_KIND,
-                CredentialORM.active == True,  # noqa: E712
-            )
-        )
-        credential = result.scalar_one_or_none()
+        credential = await self._get_active_credential(device_id, SSH_KIND)
 
         if not credential:
             raise AuthenticationError(
@@ -626,10 +643,68 @@ class DeviceService:
             password=password,
             timeout_seconds=self.settings.routeros_rest_timeout_seconds,
             max_retries=self.settings.routeros_retry_attempts,
+            pool=get_ssh_pool(),
         )
 
         return client
 
+    async def _get_active_credential(
+        self,
+        device_id: str,
+        credential_type: str,
+    ) -> CredentialRecord | None:
+        """Load the active credential of a type, memoized per request.
+
+        Args:
+            device_id: Device identifier
+            credential_type: Credential type (rest, ssh, routeros_ssh_key)
+
+        Returns:
+            Detached credential record, or None if no active credential exists
+        """
+        context = get_request_context()
+        key = (device_id, credential_type)
+        if context is not None and context.has_credential(device_id, credential_type):
+            return context.credentials[key]
+
+        result = await self.session.execute(
+            select(CredentialORM).where(
+                CredentialORM.device_id == device_id,
+                CredentialORM.credential_type == credential_type,
+                CredentialORM.active == True,  # noqa: E712
+            )
+        )
+        credential_orm = result.scalar_one_or_none()
+        credential = (
+            CredentialRecord(
+                username=credential_orm.username,
+                encrypted_secret=credential_orm.encrypted_secret,
+                private_key=credential_orm.private_key,
+            )
+            if credential_orm
+            else None
+        )
+
+        if context is not None:
+            context.credentials[key] = credential
+        return credential
+
+    @staticmethod
+    def _forget_device(device_id: str) -> None:
+        """Drop request-scoped memoized state for a modified device."""
+        context = get_request_context()
+        if context is not None:
+            context.forget_device(device_id)
+
+    def _record_device_change(self, device_orm: DeviceORM) -> None:
+        """Write a committed (and refreshed) device row through to the registry."""
+        self._forget_device(device_orm.id)
+        if device_orm.status == "decommissioned":
+            metrics.forget_device(device_orm.id)
+        registry = get_device_registry()
+        if registry is not None:
+            registry.upsert(DeviceDomain.model_validate(device_orm))
+
     async def check_connectivity(
         self,
         device_id: str,
@@ -680,6 +755,8 @@ class DeviceService:
                 device_orm = result.scalar_one()
                 device_orm.last_seen_at = datetime.now(UTC)
                 await self.session.commit()
+                await self.session.refresh(device_orm)
+                self._record_device_change(device_orm)
 
                 meta.update(
                     {
@@ -742,6 +819,8 @@ class DeviceService:
             device_orm = result.scalar_one()
             device_orm.last_seen_at = datetime.now(UTC)
             await self.session.commit()
+            await self.session.refresh(device_orm)
+            self._record_device_change(device_orm)
 
             meta.update(
                 {
@@ -9,7 +9,6 @@ import hashlib
 import ipaddress
 import json
 import logging
-import shlex
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -18,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.routeros.cli_parser import iter_print_records
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
@@ -28,6 +28,14 @@ from routeros_mcp.infra.routeros.rest_client import RouterOSRestClient
 
 logger = logging.getLogger(__name__)
 
+# Over SSH, RouterOS may emit a shortened lease table which omits STATUS/LAST-SEEN
+# columns. Terse output always carries them as key=value pairs, and proplist
+# narrows it to the fields we map (named the same on RouterOS v6 and v7).
+_LEASE_PRINT_COMMAND = (
+    "/ip/dhcp-server/lease/print terse without-paging "
+    "proplist=address,mac-address,host-name,server,status,last-seen,comment"
+)
+
 
 class DHCPService:
     """Service for RouterOS DHCP operations.
@@ -174,57 +182,9 @@ class DHCPService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/dhcp-server/print")
-
-            # Parse /ip/dhcp-server/print output (standard table format)
-            # Format:
-            # Columns: NAME, INTERFACE, ADDRESS-POOL, LEASE-TIME
-            # # NAME                 INTERFACE       ADDRESS-POOL         LEASE-TIME
-            # 0 dhcp-vlan20-mgmt     vlan20-mgmt     pool-vlan20-mgmt     30m
-            servers = []
-            lines = output.strip().split("\n")
-
-            for line in lines:
-                # Skip empty lines, Columns header, and comment lines
-                if not line.strip() or line.startswith("Columns:") or line.startswith("#") or line.startswith("Flags:"):
-                    continue
+            output = await ssh_client.execute("/ip/dhcp-server/print terse without-paging")
 
-                parts = line.split()
-                if not parts:
-                    continue
-
-                try:
-                    # Standard format: [id] [name] [interface] [address_pool] [lease_time]
-                    # Example: 0 dhcp-vlan20-mgmt vlan20-mgmt pool-vlan20-mgmt 30m
-                    # IDs are numeric (0, 1, 2, ...)
-                    if not parts[0][0].isdigit():
-                        # Might have flags (X for disabled, D for dynamic, etc.)
-                        # Skip flags for now, parse from position 1
-                        if len(parts) < 2 or not parts[1][0].isdigit():
-                            continue
-                        parts = parts[1:]
-
-                    # After ensuring first part is ID
-                    if len(parts) >= 5:
-                        # id, name, interface, address_pool, lease_time
-                        name = parts[1]
-                        interface = parts[2]
-                        address_pool = parts[3]
-                        lease_time = parts[4]
-                        disabled = False  # No explicit disabled flag in standard output
-
-                        server_data = {
-                            "name": name,
-                            "interface": interface,
-                            "address_pool": address_pool,
-                            "lease_time": lease_time,
-                            "disabled": disabled,
-                        }
-                        servers.append(server_data)
-
-                except (IndexError, ValueError) as e:
-                    logger.debug("Failed to parse DHCP server line: %s", line, exc_info=e)
-                    continue
+            servers = self._parse_dhcp_server_print_output(output)
 
             return {
                 "servers": servers,
@@ -234,6 +194,44 @@ class DHCPService:
         finally:
             await ssh_client.close()
 
+    @staticmethod
+    def _parse_dhcp_server_print_output(output: str) -> list[dict[str, Any]]:
+        """Parse /ip/dhcp-server/print output (standard table format).
+
+        Format:
+        Columns: NAME, INTERFACE, ADDRESS-POOL, LEASE-TIME
+        # NAME                 INTERFACE       ADDRESS-POOL         LEASE-TIME
+        0 dhcp-vlan20-mgmt     vlan20-mgmt     pool-vlan20-mgmt     30m
+        """
+        servers: list[dict[str, Any]] = []
+
+        for record in iter_print_records(output, flag_chars="XDI", multiline=False):
+            if record.values:
+                if "name" not in record.values:
+                    continue
+                servers.append({
+                    "name": record.values["name"],
+                    "interface": record.values.get("interface", ""),
+                    "address_pool": record.values.get("address-pool", ""),
+                    "lease_time": record.values.get("lease-time", ""),
+                    "disabled": "X" in record.flags,
+                })
+                continue
+
+            # [name] [interface] [address_pool] [lease_time]
+            if len(record.tokens) < 4:
+                continue
+            name, interface, address_pool, lease_time = record.tokens[:4]
+            servers.append({
+                "name": name,
+                "interface": interface,
+                "address_pool": address_pool,
+                "lease_time": lease_time,
+                "disabled": "X" in record.flags,
+            })
+
+        return servers
+
     async def get_dhcp_leases(
         self,
         device_id: str,
@@ -366,130 +364,60 @@ class DHCPService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            # Over SSH, RouterOS may emit a shortened table which omits STATUS/LAST-SEEN columns.
-            # Using 'detail' ensures we can reliably extract status=bound and last-seen values.
-            # Use without-paging to avoid truncation.
-            output = await ssh_client.execute("/ip/dhcp-server/lease/print detail without-paging")
-
-            # Parse /ip/dhcp-server/lease/print detail output.
-            # Example block:
-            #   0   ;;; cAP ac (RBcAPGi-5acD2nD)
-            #        address=192.168.20.251 mac-address=... server=... status=bound ... last-seen=13m43s
-            #        host-name="ap-cAP-ac"
-            #
-            #   4 D address=192.168.20.248 mac-address=... status=bound ... last-seen=9m56s
-            active_leases = []
-            normalized = output.replace("\r", "")
-            lines = normalized.splitlines()
-
-            current: dict[str, Any] = {}
-            current_flags = ""
+            output = await ssh_client.execute(_LEASE_PRINT_COMMAND)
 
-            def flush_current() -> None:
-                nonlocal current, current_flags
-                if not current:
-                    return
+            active_leases = self._parse_dhcp_lease_detail_output(output)
 
-                status = current.get("status", "")
-                if status == "bound":
-                    lease_data = {
-                        "address": current.get("address", ""),
-                        "mac_address": current.get("mac-address", ""),
-                        "host_name": current.get("host-name", ""),
-                        "server": current.get("server", ""),
-                        "status": status,
-                        "last_seen": current.get("last-seen", ""),
-                    }
-
-                    comment = current.get("comment", "")
-                    if comment:
-                        lease_data["comment"] = comment
+            return {
+                "leases": active_leases,
+                "total_count": len(active_leases),
+            }
 
-                    if "D" in current_flags:
-                        lease_data["dynamic"] = True
+        finally:
+            await ssh_client.close()
 
-                    # Ensure required fields exist before adding.
-                    if lease_data["address"] and lease_data["mac_address"] and lease_data["server"]:
-                        active_leases.append(lease_data)
+    @staticmethod
+    def _parse_dhcp_lease_detail_output(output: str) -> list[dict[str, Any]]:
+        """Parse /ip/dhcp-server/lease/print terse or detail output into bound leases.
 
-                current = {}
-                current_flags = ""
+        Terse rows hold one lease per line:
+          4 D address=192.168.20.248 mac-address=... status=bound last-seen=9m56s
 
-            for line in lines:
-                stripped = line.strip()
+        Detail example block:
+          0   ;;; cAP ac (RBcAPGi-5acD2nD)
+               address=192.168.20.251 mac-address=... server=... status=bound ... last-seen=13m43s
+               host-name="ap-cAP-ac"
 
-                if not stripped:
-                    flush_current()
-                    continue
+          4 D address=192.168.20.248 mac-address=... status=bound ... last-seen=9m56s
+        """
+        active_leases: list[dict[str, Any]] = []
 
-                # Detail header line example:
-                #   0   ;;; Comment
-                #   4 D address=... mac-address=...
-                if stripped.startswith("Flags:"):
-                    # Header line in detail output; ignore.
-                    continue
+        for record in iter_print_records(output.replace("\r", ""), flag_chars="XDRB*"):
+            status = record.values.get("status", "")
+            if status != "bound":
+                continue
 
-                # New record begins with numeric id.
-                if stripped[0].isdigit():
-                    flush_current()
-
-                    # Split the beginning into id + optional flags.
-                    parts = stripped.split(None, 2)
-                    if not parts:
-                        continue
-
-                    # parts[0] is record id (unused)
-                    remainder = ""
-                    if len(parts) >= 2 and len(parts[1]) <= 3 and parts[1][0] in {"*", "X", "D", "R", "B"}:
-                        current_flags = parts[1]
-                        remainder = parts[2] if len(parts) == 3 else ""
-                    else:
-                        current_flags = ""
-                        remainder = parts[1] if len(parts) >= 2 else ""
-                        if len(parts) == 3:
-                            remainder = parts[1] + " " + parts[2]
-
-                    # Extract comment if present on the header line.
-                    if ";;;" in remainder:
-                        comment_idx = remainder.find(";;;")
-                        current["comment"] = remainder[comment_idx + 3 :].strip()
-                        remainder = remainder[:comment_idx].strip()
-
-                    # Parse any key=value tokens that also appear on the header line.
-                    if remainder:
-                        try:
-                            tokens = shlex.split(remainder)
-                        except ValueError:
-                            tokens = remainder.split()
-                        for token in tokens:
-                            if "=" not in token:
-                                continue
-                            k, v = token.split("=", 1)
-                            current[k] = v
+            lease_data: dict[str, Any] = {
+                "address": record.values.get("address", ""),
+                "mac_address": record.values.get("mac-address", ""),
+                "host_name": record.values.get("host-name", ""),
+                "server": record.values.get("server", ""),
+                "status": status,
+                "last_seen": record.values.get("last-seen", ""),
+            }
 
-                    continue
+            comment = record.values.get("comment") or record.comment
+            if comment:
+                lease_data["comment"] = comment
 
-                # Continuation lines are key=value tokens (often indented).
-                try:
-                    tokens = shlex.split(stripped)
-                except ValueError:
-                    tokens = stripped.split()
-                for token in tokens:
-                    if "=" not in token:
-                        continue
-                    k, v = token.split("=", 1)
-                    current[k] = v
-
-            # Flush last block.
-            flush_current()
+            if "D" in record.flags:
+                lease_data["dynamic"] = True
 
-            return {
-                "leases": active_leases,
-                "total_count": len(active_leases),
-            }
+            # Ensure required fields exist before adding.
+            if lease_data["address"] and lease_data["mac_address"] and lease_data["server"]:
+                active_leases.append(lease_data)
 
-        finally:
-            await ssh_client.close()
+        return active_leases
 
 
 class DHCPPlanService:
@@ -1,16 +1,21 @@
 """Diagnostics service for network diagnostic operations.
 
-Provides operations for running RouterOS diagnostic tools like ping and traceroute.
+Provides operations for running RouterOS diagnostic tools like ping and traceroute,
+and ping sweeps from many devices to many targets into a loss/latency matrix.
 """
 
+import asyncio
 import logging
 import re
+from array import array
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.observability.stats import finite_or_none
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
@@ -28,6 +33,159 @@ MAX_TRACEROUTE_COUNT = 3
 DEFAULT_TRACEROUTE_HOPS = 30  # Default max hops for traceroute
 MIN_BANDWIDTH_TEST_DURATION = 5  # Minimum bandwidth test duration (seconds)
 MAX_BANDWIDTH_TEST_DURATION = 60  # Maximum bandwidth test duration (seconds)
+MAX_SWEEP_PAIRS = 1000  # Maximum device x target pairs per ping sweep
+
+# Callback receiving each sweep cell result with (completed, total) pairs
+SweepResultCallback = Callable[[dict[str, Any], int, int], Awaitable[None]]
+
+_NAN = float("nan")
+
+
+class PingSweepMatrix:
+    """Loss/latency matrix of a ping sweep (devices x targets).
+
+    Each statistic is one flat row-major array over all pairs
+    (``index = device_index * len(targets) + target_index``): packet
+    counts as ``array("H")``, loss and RTTs as ``array("f")`` with NaN for
+    pairs without a result, traceroute hop counts as ``array("h")`` with -1
+    when no traceroute ran. Errors and traceroute hops are kept sparsely
+    per pair.
+    """
+
+    def __init__(self, device_ids: Sequence[str], targets: Sequence[str]) -> None:
+        """Initialize an empty matrix.
+
+        Args:
+            device_ids: Source devices (rows)
+            targets: Target addresses (columns)
+        """
+        self.device_ids = list(device_ids)
+        self.targets = list(targets)
+        size = len(self.device_ids) * len(self.targets)
+        self.packets_sent = array("H", bytes(2 * size))
+        self.packets_received = array("H", bytes(2 * size))
+        self.loss_percent = array("f", [_NAN]) * size
+        self.min_rtt_ms = array("f", [_NAN]) * size
+        self.avg_rtt_ms = array("f", [_NAN]) * size
+        self.max_rtt_ms = array("f", [_NAN]) * size
+        self.hop_count = array("h", [-1]) * size
+        self.errors: dict[int, str] = {}
+        self.hops: dict[int, list[dict[str, Any]]] = {}
+        self.completed = 0
+
+    def __len__(self) -> int:
+        return len(self.device_ids) * len(self.targets)
+
+    def index(self, device_index: int, target_index: int) -> int:
+        """Flat array index of a pair."""
+        return device_index * len(self.targets) + target_index
+
+    def set_ping(self, index: int, result: dict[str, Any]) -> None:
+        """Store a ping result (DiagnosticsService ping dict) for a pair."""
+        self.packets_sent[index] = result["packets_sent"]
+        self.packets_received[index] = result["packets_received"]
+        self.loss_percent[index] = result["packet_loss_percent"]
+        if result["packets_received"]:
+            self.min_rtt_ms[index] = result["min_rtt_ms"]
+            self.avg_rtt_ms[index] = result["avg_rtt_ms"]
+            self.max_rtt_ms[index] = result["max_rtt_ms"]
+        self.completed += 1
+
+    def set_traceroute(self, index: int, hops: list[dict[str, Any]]) -> None:
+        """Store the traceroute hops of a pair."""
+        self.hop_count[index] = len(hops)
+        self.hops[index] = hops
+
+    def set_error(self, index: int, error: str) -> None:
+        """Record a pair whose ping failed."""
+        self.errors[index] = error
+        self.completed += 1
+
+    def cell(self, index: int) -> dict[str, Any]:
+        """Result of one pair as a dict."""
+        device_index, target_index = divmod(index, len(self.targets))
+        cell: dict[str, Any] = {
+            "device_id": self.device_ids[device_index],
+            "target": self.targets[target_index],
+            "packets_sent": self.packets_sent[index],
+            "packets_received": self.packets_received[index],
+            "packet_loss_percent": finite_or_none(self.loss_percent[index]),
+            "min_rtt_ms": finite_or_none(self.min_rtt_ms[index]),
+            "avg_rtt_ms": finite_or_none(self.avg_rtt_ms[index]),
+            "max_rtt_ms": finite_or_none(self.max_rtt_ms[index]),
+        }
+        if self.hop_count[index] >= 0:
+            cell["hop_count"] = self.hop_count[index]
+            cell["hops"] = self.hops.get(index, [])
+        if index in self.errors:
+            cell["error"] = self.errors[index]
+        return cell
+
+    def _rows(self, column: array) -> list[list[float | None]]:
+        width = len(self.targets)
+        return [
+            [finite_or_none(value) for value in column[start : start + width]]
+            for start in range(0, len(column), width)
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        """Pair counts by outcome and the worst targets."""
+        width = len(self.targets) or 1
+        answered = [
+            index
+            for index, sent in enumerate(self.packets_sent)
+            if sent and index not in self.errors
+        ]
+        unreachable = [index for index in answered if self.packets_received[index] == 0]
+        lossy = [
+            index
+            for index in answered
+            if self.packets_received[index] and self.loss_percent[index] > 0
+        ]
+        per_target_loss: dict[str, list[float]] = {}
+        for index in answered:
+            per_target_loss.setdefault(self.targets[index % width], []).append(
+                self.loss_percent[index]
+            )
+        return {
+            "pairs": len(self),
+            "completed": self.completed,
+            "reachable_pairs": len(answered) - len(unreachable),
+            "lossy_pairs": len(lossy),
+            "unreachable_pairs": len(unreachable),
+            "error_pairs": len(self.errors),
+            "unreachable_targets": sorted(
+                target
+                for target, losses in per_target_loss.items()
+                if all(loss >= 100 for loss in losses)
+            ),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Matrix as nested lists (rows are devices, columns are targets)."""
+        result: dict[str, Any] = {
+            "devices": self.device_ids,
+            "targets": self.targets,
+            "packet_loss_percent": self._rows(self.loss_percent),
+            "avg_rtt_ms": self._rows(self.avg_rtt_ms),
+            "min_rtt_ms": self._rows(self.min_rtt_ms),
+            "max_rtt_ms": self._rows(self.max_rtt_ms),
+            "errors": [
+                {
+                    "device_id": self.device_ids[index // len(self.targets)],
+                    "target": self.targets[index % len(self.targets)],
+                    "error": error,
+                }
+                for index, error in sorted(self.errors.items())
+            ],
+        }
+        if self.hops:
+            width = len(self.targets)
+            result["hop_count"] = [
+                [count if count >= 0 else None for count in self.hop_count[start : start + width]]
+                for start in range(0, len(self.hop_count), width)
+            ]
+        return result
 
 
 class DiagnosticsService:
@@ -523,6 +681,144 @@ class DiagnosticsService:
 
         return hops
 
+    async def ping_sweep(
+        self,
+        device_ids: Sequence[str],
+        targets: Sequence[str],
+        count: int = 4,
+        interval_ms: int = 1000,
+        packet_size: int = 64,
+        traceroute: bool = False,
+        max_hops: int = DEFAULT_TRACEROUTE_HOPS,
+        on_result: SweepResultCallback | None = None,
+    ) -> PingSweepMatrix:
+        """Ping many targets from many devices concurrently.
+
+        Each device gets one REST client; its pings (and traceroutes) run
+        concurrently up to ``routeros_max_concurrent_per_device``, and
+        devices run in parallel, so a sweep takes about
+        ``ceil(targets / limit) x count x interval`` instead of
+        ``devices x targets x count x interval``. Pairs fail individually:
+        a device without a REST client, or a failed ping, is recorded as an
+        error in the matrix without stopping the sweep (there is no SSH
+        fallback per pair).
+
+        Args:
+            device_ids: Source devices
+            targets: Target IPs or hostnames
+            count: Pings per pair (1-100)
+            interval_ms: Interval between pings in milliseconds
+            packet_size: ICMP packet size in bytes
+            traceroute: Also run a traceroute per pair
+            max_hops: Traceroute maximum hops (1-64)
+            on_result: Awaited with each pair result as it completes
+
+        Returns:
+            PingSweepMatrix with a result or error for every pair
+
+        Raises:
+            ValidationError: If limits are exceeded or a device does not exist
+        """
+        from routeros_mcp.mcp.errors import ValidationError
+
+        device_ids = list(dict.fromkeys(device_ids))
+        targets = list(dict.fromkeys(targets))
+        if not device_ids or not targets:
+            raise ValidationError("Ping sweep needs at least one device and one target")
+        if len(device_ids) * len(targets) > MAX_SWEEP_PAIRS:
+            raise ValidationError(
+                f"Ping sweep cannot exceed {MAX_SWEEP_PAIRS} device x target pairs",
+                data={
+                    "devices": len(device_ids),
+                    "targets": len(targets),
+                    "max_pairs": MAX_SWEEP_PAIRS,
+                },
+            )
+        if not 1 <= count <= MAX_PING_COUNT:
+            raise ValidationError(
+                f"Ping count must be between 1 and {MAX_PING_COUNT}",
+                data={"requested_count": count, "max_count": MAX_PING_COUNT},
+            )
+        if traceroute and not 1 <= max_hops <= MAX_TRACEROUTE_HOPS:
+            raise ValidationError(
+                f"Traceroute max_hops must be between 1 and {MAX_TRACEROUTE_HOPS}",
+                data={"requested_max_hops": max_hops, "max_hops": MAX_TRACEROUTE_HOPS},
+            )
+
+        # The session is not safe for concurrent use: resolve devices and
+        # clients one by one before fanning out
+        for device_id in device_ids:
+            await self.device_service.get_device(device_id)
+        clients: dict[str, Any] = {}
+        client_errors: dict[str, str] = {}
+        for device_id in device_ids:
+            try:
+                clients[device_id] = await self.device_service.get_rest_client(device_id)
+            except Exception as exc:  # noqa: BLE001
+                client_errors[device_id] = str(exc)
+
+        matrix = PingSweepMatrix(device_ids, targets)
+        total = len(matrix)
+        ping_params = {"count": count, "interval": f"{interval_ms}ms", "size": packet_size}
+        trace_params: dict[str, Any] = {"count": 1}
+        if max_hops != DEFAULT_TRACEROUTE_HOPS:
+            trace_params["max-hops"] = max_hops
+
+        async def report(index: int) -> None:
+            if on_result is not None:
+                await on_result(matrix.cell(index), matrix.completed, total)
+
+        async def sweep_pair(
+            client: Any, semaphore: asyncio.Semaphore, index: int, target: str
+        ) -> None:
+            try:
+                async with semaphore:
+                    ping_data = await client.post(
+                        "/rest/tool/ping", {"address": target, **ping_params}
+                    )
+                    result = self._parse_rest_ping_result(target, ping_data)
+                    hops = None
+                    if traceroute:
+                        trace_data = await client.post(
+                            "/rest/tool/traceroute", {"address": target, **trace_params}
+                        )
+                        hops = self._parse_rest_traceroute(trace_data)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(
+                    "Ping sweep pair failed",
+                    extra={"target": target, "error": str(exc)},
+                )
+                matrix.set_error(index, str(exc) or type(exc).__name__)
+            else:
+                if hops is not None:
+                    matrix.set_traceroute(index, hops)
+                matrix.set_ping(index, result)
+            await report(index)
+
+        async def sweep_device(device_index: int, device_id: str) -> None:
+            client = clients.get(device_id)
+            if client is None:
+                for target_index in range(len(targets)):
+                    index = matrix.index(device_index, target_index)
+                    matrix.set_error(index, client_errors[device_id])
+                    await report(index)
+                return
+            semaphore = asyncio.Semaphore(self.settings.routeros_max_concurrent_per_device)
+            try:
+                await asyncio.gather(
+                    *(
+                        sweep_pair(client, semaphore, matrix.index(device_index, column), target)
+                        for column, target in enumerate(targets)
+                    )
+                )
+            finally:
+                await client.close()
+
+        await asyncio.gather(
+            *(sweep_device(index, device_id) for index, device_id in enumerate(device_ids))
+        )
+        return matrix
+
     async def test_bandwidth(
         self,
         device_id: str,
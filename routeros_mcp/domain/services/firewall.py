@@ -4,24 +4,62 @@ Provides operations for querying and managing RouterOS firewall configuration,
 including filter rules, NAT rules, and address lists.
 """
 
+import asyncio
+import inspect
+import ipaddress
 import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.domain.utils import parse_routeros_bool
 from routeros_mcp.infra.observability import metrics
 
 logger = logging.getLogger(__name__)
 
+ADDRESS_LIST_PATH = "/rest/ip/firewall/address-list"
+
+# Operations gathered per progress step during address-list sync
+ADDRESS_LIST_SYNC_BATCH_SIZE = 200
+
+# Addresses listed per direction in sync previews and error reports
+ADDRESS_LIST_SAMPLE_SIZE = 20
+
+SyncProgressCallback = Callable[[int, int], Awaitable[None] | None]
+
+
+def normalize_list_address(address: str) -> str:
+    """Normalize an address-list address to the form RouterOS stores.
+
+    RouterOS drops the prefix for single hosts ("10.0.0.1/32" is stored as
+    "10.0.0.1") and keeps network addresses in CIDR form. Values that are not
+    IP addresses (e.g. DNS names on RouterOS v7) are returned unchanged.
+
+    Args:
+        address: IP address, CIDR network or hostname
+
+    Returns:
+        Canonical address string used as the sync index key
+    """
+    try:
+        network = ipaddress.ip_network(address.strip(), strict=False)
+    except ValueError:
+        return address.strip()
+    if network.prefixlen == network.max_prefixlen:
+        return str(network.network_address)
+    return str(network)
+
 
 class FirewallService:
     """Service for RouterOS firewall operations.
 
     Responsibilities:
     - Query firewall configuration
-    - Manage MCP-owned address lists
+    - Manage MCP-owned address lists (single entries and bulk sync)
     - Normalize RouterOS responses to domain models
 
     Example:
@@ -73,7 +111,9 @@ class FirewallService:
         client = await self.device_service.get_rest_client(device_id)
 
         try:
-            address_lists = await client.get("/rest/ip/firewall/address-list")
+            # Let RouterOS filter by list so only the requested list is transferred
+            params = {"list": list_name} if list_name else None
+            address_lists = await client.get(ADDRESS_LIST_PATH, params=params)
 
             # Normalize address list data
             result: list[dict[str, Any]] = []
@@ -90,8 +130,8 @@ class FirewallService:
                             "address": entry.get("address", ""),
                             "comment": entry.get("comment", ""),
                             "timeout": entry.get("timeout", ""),
-                            "disabled": entry.get("disabled", False),
-                            "dynamic": entry.get("dynamic", False),
+                            "disabled": parse_routeros_bool(entry.get("disabled")),
+                            "dynamic": parse_routeros_bool(entry.get("dynamic")),
                         })
 
             return result
@@ -203,7 +243,7 @@ class FirewallService:
                 if timeout:
                     payload["timeout"] = timeout
 
-                result = await client.put("/rest/ip/firewall/address-list", payload)
+                result = await client.put(ADDRESS_LIST_PATH, payload)
                 result_id = result.get(".id", "") if isinstance(result, dict) else ""
 
                 logger.info(
@@ -225,7 +265,7 @@ class FirewallService:
                 }
 
             else:  # remove
-                await client.delete(f"/rest/ip/firewall/address-list/{entry_id}")
+                await client.delete(f"{ADDRESS_LIST_PATH}/{entry_id}")
 
                 logger.info(
                     f"Removed {address} from address list '{list_name}'",
@@ -248,6 +288,170 @@ class FirewallService:
         finally:
             await client.close()
 
+    async def sync_address_list(
+        self,
+        device_id: str,
+        list_name: str,
+        addresses: Iterable[str],
+        comment: str = "",
+        dry_run: bool = False,
+        on_progress: SyncProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """Make an MCP-owned address list match a desired set of addresses.
+
+        The list is fetched once (filtered server-side by name) and indexed by
+        normalized address. Adds and removals are computed with set
+        differences and applied with at most
+        ``routeros_max_concurrent_per_device`` REST calls in flight. Dynamic
+        entries are never removed.
+
+        Args:
+            device_id: Device identifier
+            list_name: Address list name (must start with 'mcp-')
+            addresses: Desired IP addresses or networks
+            comment: Optional comment for added entries
+            dry_run: If True, only compute the diff without applying it
+            on_progress: Optional callback receiving (completed, total)
+                operation counts after each batch
+
+        Returns:
+            Dictionary with diff counts, applied counts, errors and timings
+
+        Raises:
+            DeviceNotFoundError: If device doesn't exist
+            InvalidListNameError: If list name doesn't start with 'mcp-'
+            ValueError: If any desired address is invalid
+        """
+        from routeros_mcp.security.safeguards import (
+            validate_ip_address_format,
+            validate_mcp_owned_list,
+        )
+
+        validate_mcp_owned_list(list_name)
+
+        desired: set[str] = set()
+        for address in addresses:
+            validate_ip_address_format(address)
+            desired.add(normalize_list_address(address))
+
+        started = time.perf_counter()
+        await self.device_service.get_device(device_id)
+        client = await self.device_service.get_rest_client(device_id)
+
+        try:
+            entries = await client.get(ADDRESS_LIST_PATH, params={"list": list_name})
+            fetched = time.perf_counter()
+
+            # Index by address; duplicates of an address are surplus entries
+            # (REST returns "dynamic" as the string "true"/"false")
+            current: dict[str, dict[str, Any]] = {}
+            dynamic: set[str] = set()
+            duplicates: list[tuple[str, str]] = []
+            for entry in entries if isinstance(entries, list) else []:
+                if not isinstance(entry, dict) or entry.get("list") != list_name:
+                    continue
+                key = normalize_list_address(str(entry.get("address", "")))
+                is_dynamic = parse_routeros_bool(entry.get("dynamic"))
+                if key in current:
+                    if not is_dynamic:
+                        duplicates.append((key, entry.get(".id", "")))
+                    continue
+                current[key] = entry
+                if is_dynamic:
+                    dynamic.add(key)
+
+            to_add = sorted(desired - current.keys())
+            to_remove = sorted(current.keys() - desired - dynamic)
+            diffed = time.perf_counter()
+
+            result: dict[str, Any] = {
+                "device_id": device_id,
+                "list_name": list_name,
+                "dry_run": dry_run,
+                "desired_count": len(desired),
+                "current_count": len(current),
+                "to_add": len(to_add),
+                "to_remove": len(to_remove) + len(duplicates),
+                "unchanged": len(desired & current.keys()),
+                "sample_add": to_add[:ADDRESS_LIST_SAMPLE_SIZE],
+                "sample_remove": to_remove[:ADDRESS_LIST_SAMPLE_SIZE],
+                "added": 0,
+                "removed": 0,
+                "error_count": 0,
+                "errors": [],
+                "changed": False,
+            }
+
+            if dry_run:
+                result["timing"] = self._sync_timing(started, fetched, diffed, diffed)
+                return result
+
+            operations: list[tuple[str, str, str]] = [("add", address, "") for address in to_add]
+            operations += [("remove", key, current[key].get(".id", "")) for key in to_remove]
+            operations += [("remove", key, entry_id) for key, entry_id in duplicates]
+
+            semaphore = asyncio.Semaphore(self.settings.routeros_max_concurrent_per_device)
+
+            async def apply(action: str, address: str, entry_id: str) -> None:
+                async with semaphore:
+                    try:
+                        if action == "add":
+                            payload = {"list": list_name, "address": address}
+                            if comment:
+                                payload["comment"] = comment
+                            await client.put(ADDRESS_LIST_PATH, payload)
+                            result["added"] += 1
+                        else:
+                            await client.delete(f"{ADDRESS_LIST_PATH}/{entry_id}")
+                            result["removed"] += 1
+                    except Exception as e:
+                        result["error_count"] += 1
+                        if len(result["errors"]) < ADDRESS_LIST_SAMPLE_SIZE:
+                            result["errors"].append(
+                                {"action": action, "address": address, "error": str(e)}
+                            )
+
+            for offset in range(0, len(operations), ADDRESS_LIST_SYNC_BATCH_SIZE):
+                batch = operations[offset : offset + ADDRESS_LIST_SYNC_BATCH_SIZE]
+                await asyncio.gather(*(apply(*operation) for operation in batch))
+                if on_progress is not None:
+                    outcome = on_progress(offset + len(batch), len(operations))
+                    if inspect.isawaitable(outcome):
+                        await outcome
+
+            result["changed"] = bool(result["added"] or result["removed"])
+            result["timing"] = self._sync_timing(started, fetched, diffed, time.perf_counter())
+
+            logger.info(
+                f"Synced address list '{list_name}': +{result['added']} -{result['removed']}",
+                extra={
+                    "device_id": device_id,
+                    "list_name": list_name,
+                    "error_count": result["error_count"],
+                    "apply_ms": result["timing"]["apply_ms"],
+                },
+            )
+
+            if result["changed"] and self.settings.mcp_resource_cache_auto_invalidate:
+                await self._invalidate_firewall_cache(device_id)
+
+            return result
+
+        finally:
+            await client.close()
+
+    @staticmethod
+    def _sync_timing(
+        started: float, fetched: float, diffed: float, finished: float
+    ) -> dict[str, float]:
+        """Build the per-phase timing breakdown for an address-list sync."""
+        return {
+            "fetch_ms": round((fetched - started) * 1000, 1),
+            "diff_ms": round((diffed - fetched) * 1000, 1),
+            "apply_ms": round((finished - diffed) * 1000, 1),
+            "total_ms": round((finished - started) * 1000, 1),
+        }
+
     async def _invalidate_firewall_cache(self, device_id: str) -> None:
         """Invalidate firewall-related cache entries for a device.
 
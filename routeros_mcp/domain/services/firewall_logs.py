@@ -11,6 +11,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.routeros.cli_parser import iter_print_records
+from routeros_mcp.infra.routeros.log_tail import (
+    LogEntry,
+    LogTailer,
+    get_log_tailer,
+    parse_log_time,
+)
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
@@ -23,6 +30,60 @@ logger = logging.getLogger(__name__)
 # Safety limits
 MAX_LOG_ENTRIES = 1000
 
+# Flags printed after the rule number (X disabled, I invalid, D dynamic)
+_RULE_FLAG_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Column order of filter/NAT tables printed without key=value pairs
+_FILTER_COLUMN_FIELDS = (
+    "chain",
+    "action",
+    "protocol",
+    "dst_port",
+    "src_port",
+    "src_address",
+    "dst_address",
+)
+_NAT_COLUMN_FIELDS = ("chain", "action", "in_interface", "out_interface", "to_addresses")
+
+_NAT_FIELD_MAP = {
+    "chain": "chain",
+    "action": "action",
+    "out-interface": "out_interface",
+    "in-interface": "in_interface",
+    "out-interface-list": "out_interface_list",
+    "in-interface-list": "in_interface_list",
+    "to-addresses": "to_addresses",
+    "to-ports": "to_ports",
+    "src-address": "src_address",
+    "dst-address": "dst_address",
+    "src-address-list": "src_address_list",
+    "dst-address-list": "dst_address_list",
+    "src-address-type": "src_address_type",
+    "dst-address-type": "dst_address_type",
+    "protocol": "protocol",
+    "src-port": "src_port",
+    "dst-port": "dst_port",
+    "comment": "comment",
+}
+
+# Address-list properties are named the same on RouterOS v6 and v7, so the
+# printed columns can be narrowed with proplist
+_ADDRESS_LIST_PRINT_COMMAND = (
+    "/ip/firewall/address-list/print terse without-paging proplist=list,address,timeout,comment"
+)
+
+# /log/print line shapes
+_LOG_DATE_TIME_RE = re.compile(
+    r"(?P<date>\d{4}-\d{2}-\d{2})\s+(?P<time>\d{2}:\d{2}:\d{2})\s+(?P<topics>\S+)"
+    r"(?:\s+(?P<message>.*))?$"
+)
+_LOG_ID_TIME_RE = re.compile(
+    r"(?P<id>\S+)\s+(?P<time>\d{2}:\d{2}:\d{2})(?:\s+(?P<topics>\S+))?(?:\s+(?P<message>.*))?$"
+)
+_LOG_TIME_RE = re.compile(
+    r"(?P<time>\d{2}:\d{2}:\d{2})(?:\s+(?P<topics>\S+))?(?:\s+(?P<message>.*))?$"
+)
+
 
 class FirewallLogsService:
     """Service for RouterOS firewall and logging operations.
@@ -148,12 +209,7 @@ class FirewallLogsService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/firewall/filter/print")
-            # DEBUG: Log first 500 chars of raw output
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Raw SSH output (first 500 chars): {repr(output[:500])}")
-            logger.debug(f"First 5 lines:\n" + "\n".join(repr(line) for line in output.split("\n")[:5]))
+            output = await ssh_client.execute("/ip/firewall/filter/print terse without-paging")
             return self._parse_firewall_filter_print_output(output)
         finally:
             await ssh_client.close()
@@ -161,109 +217,31 @@ class FirewallLogsService:
     @staticmethod
     def _parse_firewall_filter_print_output(output: str) -> list[dict[str, Any]]:
         """Parse /ip/firewall/filter/print output (supports mixed column and key=value formats)."""
-        import shlex
-
         rules: list[dict[str, Any]] = []
-        current_rule: dict[str, Any] | None = None
-
-        def flush_current() -> None:
-            if current_rule is None:
-                return
-
-            for key, default in (
-                ("id", ""),
-                ("chain", ""),
-                ("action", ""),
-                ("protocol", ""),
-                ("dst_port", ""),
-                ("src_port", ""),
-                ("src_address", ""),
-                ("dst_address", ""),
-                ("comment", ""),
-                ("disabled", False),
-            ):
-                current_rule.setdefault(key, default)
-
-            current_rule.pop("_raw", None)
-            rules.append(current_rule.copy())
-
-        for raw_line in output.strip().split("\n"):
-            line = raw_line.strip()
-            if not line or line.startswith("Flags:") or line.startswith("#"):
-                continue
-
-            # Start of a new rule if line begins with id (digit or *)
-            if line[0].isdigit() or line[0] == "*":
-                flush_current()
-
-                # Strip inline comment first
-                comment = ""
-                if ";;;" in line:
-                    comment = line.split(";;;", 1)[1].strip()
-                    line = line.split(";;;", 1)[0].strip()
-
-                parts = line.split()
-                rule_id = parts[0]
-                flags = ""
-                cursor = 1
-                if len(parts) > 1 and re.fullmatch(r"[A-ZIXD]+", parts[1]):
-                    flags = parts[1]
-                    cursor = 2
-
-                disabled = "X" in flags or "D" in flags or "d" in flags
-
-                current_rule = {
-                    "id": rule_id,
-                    "disabled": disabled,
-                    "comment": comment,
-                    "chain": "",
-                    "action": "",
-                    "protocol": "",
-                    "dst_port": "",
-                    "src_port": "",
-                    "src_address": "",
-                    "dst_address": "",
-                }
-
-                remainder_tokens = parts[cursor:]
-                kv_tokens = [t for t in remainder_tokens if "=" in t]
-
-                if kv_tokens:
-                    for token in kv_tokens:
-                        key, value = token.split("=", 1)
-                        FirewallLogsService._assign_token(current_rule, key, value)
-                elif remainder_tokens:
-                    # Column mode: CHAIN ACTION PROTOCOL DST-PORT SRC-PORT SRC-ADDRESS DST-ADDRESS
-                    field_order = [
-                        "chain",
-                        "action",
-                        "protocol",
-                        "dst_port",
-                        "src_port",
-                        "src_address",
-                        "dst_address",
-                    ]
-                    for idx, field in enumerate(field_order):
-                        if idx < len(remainder_tokens):
-                            current_rule[field] = remainder_tokens[idx]
 
-                continue
+        for record in iter_print_records(output, flag_chars=_RULE_FLAG_CHARS):
+            rule: dict[str, Any] = {
+                "id": record.id,
+                "disabled": "X" in record.flags or "D" in record.flags,
+                "comment": record.comment,
+                "chain": "",
+                "action": "",
+                "protocol": "",
+                "dst_port": "",
+                "src_port": "",
+                "src_address": "",
+                "dst_address": "",
+            }
+
+            if record.values:
+                for key, value in record.values.items():
+                    FirewallLogsService._assign_token(rule, key, value)
+            else:
+                # Column mode: CHAIN ACTION PROTOCOL DST-PORT SRC-PORT SRC-ADDRESS DST-ADDRESS
+                rule.update(zip(_FILTER_COLUMN_FIELDS, record.tokens))
 
-            if current_rule is None:
-                continue
+            rules.append(rule)
 
-            # Continuation line: expect key=value tokens
-            try:
-                tokens = shlex.split(line)
-            except ValueError:
-                tokens = line.split()
-            for token in tokens:
-                if "=" not in token:
-                    continue
-                key, value = token.split("=", 1)
-                FirewallLogsService._assign_token(current_rule, key, value)
-
-        flush_current()
         return rules
 
     @staticmethod
@@ -277,8 +255,6 @@ class FirewallLogsService:
         }
 
         normalized_key = key_map.get(key, key)
-        if normalized_key == "comment" and len(value) >= 2 and value[0] == value[-1] == '"':
-            value = value[1:-1]
 
         if normalized_key in {"chain", "action", "protocol", "dst_port", "src_port", "src_address", "dst_address", "comment"}:
             rule[normalized_key] = value
@@ -384,114 +360,39 @@ class FirewallLogsService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/firewall/nat/print")
+            output = await ssh_client.execute("/ip/firewall/nat/print terse without-paging")
             return self._parse_firewall_nat_print_output(output)
         finally:
             await ssh_client.close()
 
     @staticmethod
     def _parse_firewall_nat_print_output(output: str) -> list[dict[str, Any]]:
-        """Parse /ip/firewall/nat/print output."""
+        """Parse /ip/firewall/nat/print output (rules may span multiple indented lines)."""
         rules: list[dict[str, Any]] = []
 
-        # Group lines per rule (rules may span multiple indented lines)
-        current: list[str] = []
-        for line in output.strip().split("\n"):
-            stripped = line.strip()
-            if not stripped or stripped.startswith("Flags:") or stripped.startswith("#"):
-                continue
-
-            # New rule starts when line begins with id (digits or *id)
-            if re.match(r"^[0-9*]", stripped):
-                if current:
-                    parsed = FirewallLogsService._parse_single_nat_rule(current)
-                    if parsed:
-                        rules.append(parsed)
-                current = [stripped]
+        for record in iter_print_records(output, flag_chars=_RULE_FLAG_CHARS):
+            rule: dict[str, Any] = {field: "" for field in _NAT_FIELD_MAP.values()}
+            rule.update({
+                "id": record.id,
+                "comment": record.comment,
+                "disabled": "X" in record.flags or "D" in record.flags,
+            })
+
+            if record.values:
+                for key, value in record.values.items():
+                    target = _NAT_FIELD_MAP.get(key)
+                    if target:
+                        rule[target] = value
             else:
-                if current:
-                    current.append(stripped)
-
-        if current:
-            parsed = FirewallLogsService._parse_single_nat_rule(current)
-            if parsed:
-                rules.append(parsed)
-
-        return rules
-
-    @staticmethod
-    def _parse_single_nat_rule(lines: list[str]) -> dict[str, Any] | None:
-        """Parse a single NAT rule represented by one or more lines."""
-        first = lines[0]
-
-        # Extract id and optional flags
-        m = re.match(r"^(?P<id>[0-9A-Za-z*]+)\s*(?P<flags>[A-ZIXD]*)\s*(?P<rest>.*)$", first)
-        if not m:
-            return None
-
-        rule_id = m.group("id")
-        flags = m.group("flags") or ""
-        rest = m.group("rest")
-
-        disabled = "X" in flags or "D" in flags or "d" in flags
-
-        comment = ""
-        if ";;;" in first:
-            comment = first.split(";;;", 1)[1].strip()
-
-        # Collect tokens key=value from all lines (including first remainder)
-        tokens_text = " ".join([rest] + lines[1:])
-        tokens = [t for t in tokens_text.split() if "=" in t]
-
-        field_map = {
-            "chain": "chain",
-            "action": "action",
-            "out-interface": "out_interface",
-            "in-interface": "in_interface",
-            "out-interface-list": "out_interface_list",
-            "in-interface-list": "in_interface_list",
-            "to-addresses": "to_addresses",
-            "to-ports": "to_ports",
-            "src-address": "src_address",
-            "dst-address": "dst_address",
-            "src-address-list": "src_address_list",
-            "dst-address-list": "dst_address_list",
-            "src-address-type": "src_address_type",
-            "dst-address-type": "dst_address_type",
-            "protocol": "protocol",
-            "src-port": "src_port",
-            "dst-port": "dst_port",
-        }
-
-        rule: dict[str, Any] = {v: "" for v in field_map.values()}
-        rule.update({"id": rule_id, "comment": comment, "disabled": disabled})
-
-        if tokens:
-            for tok in tokens:
-                key, val = tok.split("=", 1)
-                target = field_map.get(key)
-                if target:
-                    rule[target] = val
-        else:
-            # Column-aligned output without key=value
-            words = rest.split()
-            field_order = [
-                "chain",
-                "action",
-                "in_interface",
-                "out_interface",
-                "to_addresses",
-            ]
-            for idx, field in enumerate(field_order):
-                if idx < len(words):
-                    rule[field] = words[idx]
-
-            if len(words) > len(field_order):
-                trailing_comment = " ".join(words[len(field_order):]).strip()
+                # Column-aligned output without key=value
+                rule.update(zip(_NAT_COLUMN_FIELDS, record.tokens))
+                trailing_comment = " ".join(record.tokens[len(_NAT_COLUMN_FIELDS) :])
                 if trailing_comment:
                     rule["comment"] = trailing_comment
 
-        return rule
+            rules.append(rule)
+
+        return rules
 
     async def list_address_lists(
         self,
@@ -590,7 +491,7 @@ class FirewallLogsService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/firewall/address-list/print")
+            output = await ssh_client.execute(_ADDRESS_LIST_PRINT_COMMAND)
             entries = self._parse_address_list_print_output(output)
             
             # Filter by list_name if provided
@@ -603,45 +504,35 @@ class FirewallLogsService:
 
     @staticmethod
     def _parse_address_list_print_output(output: str) -> list[dict[str, Any]]:
-        """Parse /ip/firewall/address-list/print output."""
+        """Parse /ip/firewall/address-list/print output (terse or table format)."""
         entries: list[dict[str, Any]] = []
 
-        lines = output.strip().split("\n")
-        for line in lines:
-            if not line.strip() or line.startswith("Flags:") or line.startswith("#"):
+        for record in iter_print_records(output, flag_chars="DXdr", multiline=False):
+            if record.values:
+                if "address" not in record.values:
+                    continue
+                entries.append({
+                    "id": record.id,
+                    "list": record.values.get("list", ""),
+                    "address": record.values["address"],
+                    "comment": record.values.get("comment", record.comment),
+                    "timeout": record.values.get("timeout", ""),
+                    "disabled": "X" in record.flags,
+                })
                 continue
 
-            parts = line.split()
-            if not parts or not (parts[0][0] == "*" or parts[0][0].isdigit()):
+            # Parse: [list] [address]
+            if len(record.tokens) < 2:
                 continue
 
-            try:
-                idx = 0
-                flags = ""
-
-                if len(parts) > 1 and len(parts[1]) == 1 and parts[1] in "DXdr":
-                    flags = parts[1]
-                    idx = 2
-                else:
-                    idx = 1
-
-                # Parse: [id] [flags?] [list] [address]
-                if len(parts) > idx + 1:
-                    entry_id = parts[0]
-                    list_name = parts[idx]
-                    address = parts[idx + 1]
-
-                    entries.append({
-                        "id": entry_id,
-                        "list": list_name,
-                        "address": address,
-                        "comment": "",
-                        "timeout": "",
-                        "disabled": "D" in flags or "d" in flags,
-                    })
-            except (IndexError, ValueError) as e:
-                logger.debug(f"Failed to parse address list line: {line}", exc_info=e)
-                continue
+            entries.append({
+                "id": record.id,
+                "list": record.tokens[0],
+                "address": record.tokens[1],
+                "comment": record.comment,
+                "timeout": "",
+                "disabled": "D" in record.flags.upper(),
+            })
 
         return entries
 
@@ -653,6 +544,7 @@ class FirewallLogsService:
         start_time: str | None = None,
         end_time: str | None = None,
         message: str | None = None,
+        tail: bool = False,
     ) -> tuple[list[dict[str, Any]], int]:
         """Retrieve recent system logs with optional filtering with REST→SSH fallback.
 
@@ -660,9 +552,15 @@ class FirewallLogsService:
             device_id: Device identifier
             limit: Maximum number of entries to return (max 1000)
             topics: Optional list of topics to filter by
+            start_time: Optional inclusive lower time bound
+            end_time: Optional inclusive upper time bound
+            message: Optional case-insensitive message substring
+            tail: Fetch only entries newer than the device's tail cursor and
+                answer from the per-device buffer (newest ``limit`` matches)
 
         Returns:
-            Tuple of (log_entries, total_count)
+            Tuple of (log_entries, total_count). In tail mode total_count is
+            the number of buffered entries for the device.
 
         Raises:
             DeviceNotFoundError: If device doesn't exist
@@ -678,6 +576,12 @@ class FirewallLogsService:
                 data={"requested_limit": limit, "max_limit": MAX_LOG_ENTRIES},
             )
 
+        if tail:
+            await self.tail_logs(device_id)
+            tailer = get_log_tailer()
+            tailed = tailer.query(device_id, limit, topics, start_time, end_time, message)
+            return [entry.to_dict() for entry in tailed], tailer.buffered(device_id)
+
         try:
             entries, total = await self._get_recent_logs_via_rest(device_id, limit, topics)
             for entry in entries:
@@ -781,99 +685,54 @@ class FirewallLogsService:
         limit: int = 100,
         topics: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Parse /log/print output."""
+        """Parse /log/print output.
+
+        Accepted line shapes:
+        - date + time: ``2025-12-11 22:52:33 system,info msg``
+        - id + time: ``*l1 00:00:01 topics msg``
+        - time only: ``00:00:01 topics msg``
+        """
         entries: list[dict[str, Any]] = []
-        date_regex = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-        time_regex = re.compile(r"^\d{2}:\d{2}:\d{2}$")
 
-        lines = output.strip().split("\n")
-        for raw_line in lines:
+        for raw_line in output.splitlines():
             line = raw_line.strip()
             if not line or line.startswith("Flags:") or line.startswith("#"):
                 continue
 
-            if len(entries) >= limit:
-                break
+            match = (
+                _LOG_DATE_TIME_RE.match(line)
+                or _LOG_ID_TIME_RE.match(line)
+                or _LOG_TIME_RE.match(line)
+            )
+            if match is None:
+                logger.debug("Skipping unparsable log line: %s", line)
+                continue
 
-            try:
-                entry_id = ""
-                entry_time = ""
-                entry_topics_str = ""
-                message = ""
-
-                # Variant 1: date + time present (e.g., 2025-12-11 22:52:33 system,info msg)
-                parts = line.split(maxsplit=3)
-                if (
-                    len(parts) >= 3
-                    and date_regex.match(parts[0])
-                    and time_regex.match(parts[1])
-                ):
-                    entry_time = f"{parts[0]} {parts[1]}"
-                    entry_id = entry_time
-                    entry_topics_str = parts[2]
-                    message = parts[3] if len(parts) > 3 else ""
-                else:
-                    # Variant 2: optional id then time (e.g., *l1 00:00:01 topics msg)
-                    # Variant 3: time-only (e.g., 00:00:01 topics msg)
-                    parts = line.split(maxsplit=2)
-                    if len(parts) >= 2 and time_regex.match(parts[1]):
-                        entry_id = parts[0]
-                        entry_time = parts[1]
-                        entry_topics_str = parts[2] if len(parts) > 2 else ""
-                    elif time_regex.match(parts[0]):
-                        entry_id = parts[0]
-                        entry_time = parts[0]
-                        entry_topics_str = parts[1] if len(parts) > 1 else ""
-                        message = parts[2] if len(parts) > 2 else ""
-                    else:
-                        # Unknown format; skip
-                        logger.debug("Skipping unparsable log line: %s", line)
-                        continue
-
-                    # If message not already set, split topics from message for variant 2
-                    if not message and entry_topics_str:
-                        topic_and_msg = entry_topics_str.split(maxsplit=1)
-                        entry_topics_str = topic_and_msg[0]
-                        message = topic_and_msg[1] if len(topic_and_msg) > 1 else ""
-
-                entry_topics_list = [t.strip() for t in entry_topics_str.split(",") if t.strip()]
-
-                # Filter by topics if provided
-                if topics and not any(t in entry_topics_list for t in topics):
-                    continue
+            fields = match.groupdict()
+            entry_time = fields["time"]
+            if fields.get("date"):
+                entry_time = f"{fields['date']} {entry_time}"
+            entry_topics_list = [t for t in (fields["topics"] or "").split(",") if t]
 
-                entries.append({
-                    "id": entry_id,
-                    "time": entry_time,
-                    "topics": entry_topics_list,
-                    "message": message.rstrip("\r"),
-                })
-            except (IndexError, ValueError) as e:
-                logger.debug(f"Failed to parse log line: {line}", exc_info=e)
+            # Filter by topics if provided
+            if topics and not any(t in entry_topics_list for t in topics):
                 continue
 
+            entries.append({
+                "id": fields.get("id") or entry_time,
+                "time": entry_time,
+                "topics": entry_topics_list,
+                "message": fields["message"] or "",
+            })
+            if len(entries) >= limit:
+                break
+
         return entries
 
     @staticmethod
     def _parse_time(value: str):
         """Attempt to parse a RouterOS log time string into datetime; return None if unknown."""
-        from datetime import datetime
-
-        if not value:
-            return None
-
-        candidates = [
-            "%Y-%m-%d %H:%M:%S",
-            "%b/%d/%Y %H:%M:%S",
-            "%B/%d/%Y %H:%M:%S",
-            "%H:%M:%S",
-        ]
-        for fmt in candidates:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-        return None
+        return parse_log_time(value) if value else None
 
     def _filter_logs(
         self,
@@ -912,6 +771,96 @@ class FirewallLogsService:
 
         return filtered
 
+    async def tail_logs(self, device_id: str, tailer: LogTailer | None = None) -> list[LogEntry]:
+        """Fetch log entries newer than the device's tail cursor with REST→SSH fallback.
+
+        New entries are added to the per-device ring buffer of the global
+        LogTailer, which also backs ``device://{id}/logs`` subscriptions.
+
+        Args:
+            device_id: Device identifier
+            tailer: Tailer holding the cursor to read from (default: the
+                global tailer)
+
+        Returns:
+            Entries not seen before, oldest first
+
+        Raises:
+            RuntimeError: If both REST and SSH fail
+        """
+        tailer = tailer or get_log_tailer()
+        try:
+            items = await self._fetch_new_logs_via_rest(device_id, tailer)
+            return tailer.ingest(device_id, items, transport="rest")
+        except Exception as rest_exc:
+            logger.warning(
+                f"REST log tail failed, attempting SSH fallback: {rest_exc}",
+                extra={"device_id": device_id},
+            )
+            try:
+                entries = await self._fetch_logs_via_ssh(device_id)
+                return tailer.ingest(
+                    device_id, entries, transport="ssh", rest_error=str(rest_exc)
+                )
+            except Exception as ssh_exc:
+                logger.error(
+                    "Both REST and SSH log tail failed",
+                    exc_info=ssh_exc,
+                    extra={"device_id": device_id, "rest_error": str(rest_exc)},
+                )
+                raise RuntimeError(
+                    f"Log tail failed via REST and SSH: "
+                    f"rest_error={rest_exc}, ssh_error={ssh_exc}"
+                ) from ssh_exc
+
+    async def _fetch_new_logs_via_rest(
+        self, device_id: str, tailer: LogTailer
+    ) -> list[dict[str, Any]]:
+        """Fetch log items from the tail cursor onwards via REST.
+
+        Queries ``.id`` at or above the cursor; the cursor entry itself must
+        come back, otherwise it was rotated out or the device rebooted and
+        the full buffer is fetched to resynchronize. Devices that reject the
+        query are remembered and always get the full buffer (the tailer still
+        drops entries it has already seen).
+        """
+        cursor = tailer.cursor(device_id)
+        client = await self.device_service.get_rest_client(device_id)
+
+        try:
+            if cursor is not None and tailer.supports_query(device_id):
+                try:
+                    items = await client.post(
+                        "/rest/log/print",
+                        {".query": [f".id={cursor}", f">.id={cursor}", "#|"]},
+                    )
+                except RouterOSClientError as e:
+                    logger.info(
+                        f"Log query rejected, tailing from full log fetches: {e}",
+                        extra={"device_id": device_id},
+                    )
+                    tailer.disable_query(device_id)
+                else:
+                    if isinstance(items, list) and any(
+                        isinstance(item, dict) and item.get(".id") == cursor for item in items
+                    ):
+                        return items
+
+            logs_data = await client.get("/rest/log")
+            return logs_data if isinstance(logs_data, list) else []
+        finally:
+            await client.close()
+
+    async def _fetch_logs_via_ssh(self, device_id: str) -> list[dict[str, Any]]:
+        """Fetch the whole log buffer via SSH CLI (no incremental filter)."""
+        ssh_client = await self.device_service.get_ssh_client(device_id)
+
+        try:
+            output = await ssh_client.execute("/log/print")
+            return self._parse_log_print_output(output, limit=output.count("\n") + 1)
+        finally:
+            await ssh_client.close()
+
     async def get_logging_config(
         self,
         device_id: str,
@@ -1000,7 +949,7 @@ class FirewallLogsService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/system/logging/print")
+            output = await ssh_client.execute("/system/logging/print terse without-paging")
             return self._parse_logging_config_print_output(output)
         finally:
             await ssh_client.close()
@@ -1010,39 +959,25 @@ class FirewallLogsService:
         """Parse /system/logging/print output."""
         configs: list[dict[str, Any]] = []
 
-        lines = output.strip().split("\n")
-        for line in lines:
-            if not line.strip() or line.startswith("Flags:") or line.startswith("#"):
+        for record in iter_print_records(output, flag_chars="DXdr", multiline=False):
+            if record.values:
+                configs.append({
+                    "topics": [
+                        t.strip() for t in record.values.get("topics", "").split(",") if t.strip()
+                    ],
+                    "action": record.values.get("action", ""),
+                    "prefix": record.values.get("prefix", ""),
+                })
                 continue
 
-            parts = line.split()
-            if not parts or not (parts[0][0] == "*" or parts[0][0].isdigit()):
+            # Parse: [topics] [action]
+            if len(record.tokens) < 2:
                 continue
 
-            try:
-                idx = 0
-                flags = ""
-
-                if len(parts) > 1 and len(parts[1]) == 1 and parts[1] in "DXdr":
-                    flags = parts[1]
-                    idx = 2
-                else:
-                    idx = 1
-
-                # Parse: [id] [flags?] [topics] [action]
-                if len(parts) > idx + 1:
-                    topics_str = parts[idx]
-                    action = parts[idx + 1]
-
-                    topics_list = [t.strip() for t in topics_str.split(",") if t.strip()]
-
-                    configs.append({
-                        "topics": topics_list,
-                        "action": action,
-                        "prefix": "",  # Not shown in simple print
-                    })
-            except (IndexError, ValueError) as e:
-                logger.debug(f"Failed to parse logging config line: {line}", exc_info=e)
-                continue
+            configs.append({
+                "topics": [t.strip() for t in record.tokens[0].split(",") if t.strip()],
+                "action": record.tokens[1],
+                "prefix": "",  # Not shown in simple print
+            })
 
         return configs
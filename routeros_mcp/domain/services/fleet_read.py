@@ -0,0 +1,246 @@
+"""Fleet-wide read-only queries across many devices.
+
+Read tools take a single ``device_id``, so finding a MAC address or lease
+anywhere in the network takes one tool call per device, each with its own
+device lookup and authorization check. FleetReadService does it in one call:
+
+- Devices are selected by IDs, environment and/or tags with a single
+  device query (the device registry when available)
+- The whole selection is authorized in one pass; denied or unknown devices
+  are reported per device instead of failing the call
+- The per-device read fans out through PlanExecutor (bounded parallelism,
+  per-device progress events); each device gets its own short-lived
+  session because sessions are not safe for concurrent use
+- Results are merged, every item tagged with its ``device_id``, and
+  failures are reported per device alongside the successes
+
+Example:
+    service = FleetReadService(session_factory, settings)
+    selection = await service.select_devices(
+        environment="prod", tags={"site": "dc1"}, tool_name="fleet/get-arp-table"
+    )
+    result = await service.read(
+        selection, lambda session, device_id: IPService(session, settings).get_arp_table(device_id)
+    )
+"""
+
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.models import Device as DeviceDomain
+from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.domain.services.plan_executor import PlanExecutor, ProgressCallback
+from routeros_mcp.infra.db.session import DatabaseSessionManager
+from routeros_mcp.mcp.errors import ValidationError, map_exception_to_error
+from routeros_mcp.security.authz import AuthorizationError, ToolTier, check_tool_authorization
+
+logger = logging.getLogger(__name__)
+
+# Per-device read: called with a session of its own and the device ID
+DeviceRead = Callable[[AsyncSession, str], Awaitable[list[dict[str, Any]]]]
+
+
+@dataclass
+class FleetSelection:
+    """Devices selected for a fleet read.
+
+    Attributes:
+        devices: Authorized devices, ordered by device ID
+        errors: Requested devices that were not found or not authorized
+    """
+
+    devices: list[DeviceDomain] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def device_ids(self) -> list[str]:
+        return [device.id for device in self.devices]
+
+
+@dataclass
+class FleetReadResult:
+    """Merged outcome of a fleet read.
+
+    Attributes:
+        items: Items of every device, each tagged with ``device_id``
+        device_counts: Item count per successful device
+        errors: Devices that failed (selection or read), with the error
+    """
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+    device_counts: dict[str, int] = field(default_factory=dict)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        """Compact counts for tool metadata."""
+        return {
+            "devices_total": len(self.device_counts) + len(self.errors),
+            "devices_succeeded": len(self.device_counts),
+            "devices_failed": len(self.errors),
+            "items_total": len(self.items),
+        }
+
+
+class FleetReadService:
+    """Select, authorize and query many devices with one read."""
+
+    def __init__(self, session_factory: DatabaseSessionManager, settings: Settings) -> None:
+        """Initialize fleet read service.
+
+        Args:
+            session_factory: Database session factory (one session per device read)
+            settings: Application settings
+        """
+        self.session_factory = session_factory
+        self.settings = settings
+
+    async def select_devices(
+        self,
+        device_ids: Sequence[str] | None = None,
+        environment: str | None = None,
+        tags: dict[str, str] | None = None,
+        tool_name: str | None = None,
+        tool_tier: ToolTier = ToolTier.FUNDAMENTAL,
+    ) -> FleetSelection:
+        """Resolve a device selection and authorize it in one pass.
+
+        Selectors combine: explicit IDs, narrowed by environment and tags
+        when given. Selections by environment or tags alone skip
+        decommissioned devices.
+
+        Args:
+            device_ids: Explicit device IDs
+            environment: Environment to match
+            tags: Tag key/value pairs every device must have
+            tool_name: Tool name for authorization error messages
+            tool_tier: Tier the read runs at
+
+        Returns:
+            FleetSelection with authorized devices and per-device errors
+
+        Raises:
+            ValidationError: If no selector is given or the selection is too large
+        """
+        requested = list(dict.fromkeys(device_ids or []))
+        if not requested and environment is None and not tags:
+            raise ValidationError(
+                "Select devices by device_ids, environment or tags",
+                data={"tool_name": tool_name},
+            )
+
+        async with self.session_factory.session() as session:
+            devices = await DeviceService(session, self.settings).list_devices(
+                environment=environment,
+                allowed_device_ids=requested or None,
+            )
+
+        selection = FleetSelection()
+        if requested:
+            found = {device.id for device in devices}
+            for device_id in requested:
+                if device_id not in found:
+                    selection.errors.append(
+                        {
+                            "device_id": device_id,
+                            "error": "Device not found"
+                            + (f" in environment {environment}" if environment else ""),
+                        }
+                    )
+        else:
+            devices = [device for device in devices if device.status != "decommissioned"]
+        if tags:
+            devices = [
+                device
+                for device in devices
+                if all((device.tags or {}).get(key) == value for key, value in tags.items())
+            ]
+
+        if len(devices) > self.settings.fleet_read_max_devices:
+            raise ValidationError(
+                f"Selection matches {len(devices)} devices; fleet reads are limited to "
+                f"{self.settings.fleet_read_max_devices}",
+                data={
+                    "matched_devices": len(devices),
+                    "max_devices": self.settings.fleet_read_max_devices,
+                },
+            )
+
+        for device in sorted(devices, key=lambda d: d.id):
+            try:
+                check_tool_authorization(
+                    device_environment=device.environment,
+                    service_environment=self.settings.environment,
+                    tool_tier=tool_tier,
+                    allow_advanced_writes=device.allow_advanced_writes,
+                    allow_professional_workflows=device.allow_professional_workflows,
+                    device_id=device.id,
+                    tool_name=tool_name,
+                )
+            except AuthorizationError as e:
+                selection.errors.append({"device_id": device.id, "error": str(e)})
+                continue
+            selection.devices.append(device)
+
+        return selection
+
+    async def read(
+        self,
+        selection: FleetSelection,
+        read: DeviceRead,
+        on_progress: ProgressCallback | None = None,
+    ) -> FleetReadResult:
+        """Run a per-device read across the selection concurrently.
+
+        Args:
+            selection: Devices from select_devices (its errors are carried over)
+            read: Async callable returning the items of one device
+            on_progress: PlanExecutor progress callback (per-device completion)
+
+        Returns:
+            FleetReadResult with merged items in device order
+        """
+        items_by_device: dict[str, list[dict[str, Any]]] = {}
+
+        async def read_device(device_id: str) -> dict[str, Any]:
+            try:
+                async with self.session_factory.session() as session:
+                    items_by_device[device_id] = await read(session, device_id)
+            except Exception as e:
+                error = map_exception_to_error(e)
+                logger.warning(
+                    f"Fleet read failed for device {device_id}: {error.message}",
+                    extra={"device_id": device_id},
+                )
+                return {"device_id": device_id, "status": "failed", "error": error.message}
+            return {"device_id": device_id, "status": "success"}
+
+        executor = PlanExecutor(
+            max_concurrency=self.settings.fleet_read_max_concurrency,
+            on_progress=on_progress,
+        )
+        execution = await executor.run(selection.device_ids, read_device)
+
+        result = FleetReadResult(errors=list(selection.errors))
+        for device_result in execution.device_results:
+            device_id = device_result["device_id"]
+            if device_id not in items_by_device:
+                result.errors.append({"device_id": device_id, "error": device_result["error"]})
+                continue
+            device_items = items_by_device[device_id]
+            result.device_counts[device_id] = len(device_items)
+            result.items.extend({"device_id": device_id, **item} for item in device_items)
+
+        return result
+
+
+__all__ = [
+    "DeviceRead",
+    "FleetReadResult",
+    "FleetReadService",
+    "FleetSelection",
+]
@@ -11,9 +11,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import HealthCheckResult, HealthSummary
+from routeros_mcp.domain.request_context import get_request_context
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.utils import parse_routeros_uptime
+from routeros_mcp.infra.device_registry import get_device_registry
 from routeros_mcp.infra.db.models import HealthCheck as HealthCheckORM
+from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,7 @@ class HealthService:
     - Run health checks on individual devices
     - Compute fleet-wide health summaries
     - Store health check results in database
+    - Record results in the fleet metrics snapshot
     - Determine health status based on thresholds
 
     Example:
@@ -179,6 +184,17 @@ class HealthService:
         # Store health check result
         await self._store_health_check(result)
 
+        # Keep the fleet metrics snapshot current for fleet-wide queries
+        get_fleet_metrics().record_health(device, result)
+        metrics.record_health_check(
+            device_id=device_id,
+            environment=getattr(device, "environment", None) or "unknown",
+            status=result.status,
+            cpu_percent=result.cpu_usage_percent,
+            memory_percent=result.memory_usage_percent,
+            uptime_seconds=result.uptime_seconds,
+        )
+
         # Update adaptive polling state based on health check result (Phase 4)
         # Skip if session is None (happens in some test scenarios)
         if self.session is not None:
@@ -645,6 +661,26 @@ class HealthService:
         )
         await self.session.execute(stmt)
         await self.session.commit()
+
+        # Keep a request-scoped device memo from serving the pre-update row
+        context = get_request_context()
+        if context is not None:
+            context.forget_device(device_id)
+
+        # Write the new polling state through to the device registry
+        registry = get_device_registry()
+        cached_device = registry.get(device_id) if registry is not None else None
+        if registry is not None and cached_device is not None:
+            registry.upsert(
+                cached_device.model_copy(
+                    update={
+                        "health_status": new_health_status,
+                        "consecutive_healthy_checks": new_consecutive_healthy,
+                        "polling_interval_seconds": new_interval,
+                        "last_backoff_at": new_last_backoff_at,
+                    }
+                )
+            )
         
         logger.debug(
             "Adaptive polling state updated",
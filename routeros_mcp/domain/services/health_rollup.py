@@ -0,0 +1,664 @@
+"""Health history downsampling, rollup and series queries.
+
+Builds 1-minute, 1-hour and 1-day min/avg/max rollups of health_checks on any
+supported database, enforces tiered retention, and serves history queries
+from the finest tier whose retention and point budget fit the requested
+window. Bucketed series with percentiles are aggregated in SQL directly from
+health_checks. TimescaleDB deployments keep their continuous aggregate
+(migration 32); this service is what keeps SQLite and plain PostgreSQL
+history bounded.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from routeros_mcp.config import Settings
+from routeros_mcp.infra.db.models import HealthCheck as HealthCheckORM
+from routeros_mcp.infra.db.models import HealthCheckRollup as HealthCheckRollupORM
+from routeros_mcp.infra.db.timeseries import epoch_bucket, floor_datetime, from_epoch
+
+logger = logging.getLogger(__name__)
+
+# Default number of points a history query aims to return at most
+DEFAULT_MAX_POINTS = 500
+
+
+@dataclass(frozen=True)
+class RollupTier:
+    """Rollup resolution tier.
+
+    Attributes:
+        name: Resolution label stored in health_check_rollups.resolution
+        bucket_seconds: Bucket width in seconds
+        source: Tier this tier is built from ("raw" means health_checks)
+    """
+
+    name: str
+    bucket_seconds: int
+    source: str
+
+
+# Candidate bucket widths for raw health series, fine -> coarse
+SERIES_BUCKET_SECONDS: tuple[int, ...] = (60, 300, 900, 3600, 21600, 86400)
+
+# Ordered fine -> coarse; each tier is built from the previous one
+ROLLUP_TIERS: tuple[RollupTier, ...] = (
+    RollupTier(name="1m", bucket_seconds=60, source="raw"),
+    RollupTier(name="1h", bucket_seconds=3600, source="1m"),
+    RollupTier(name="1d", bucket_seconds=86400, source="1h"),
+)
+
+
+def select_bucket_seconds(
+    start: datetime, end: datetime, max_points: int = DEFAULT_MAX_POINTS
+) -> int:
+    """Pick the finest series bucket width that keeps a window under max_points.
+
+    Args:
+        start: Window start
+        end: Window end
+        max_points: Maximum number of buckets wanted
+
+    Returns:
+        Bucket width in seconds (coarsest candidate if none fit)
+    """
+    window_seconds = max((end - start).total_seconds(), 0)
+    for bucket_seconds in SERIES_BUCKET_SECONDS:
+        if window_seconds / bucket_seconds <= max_points:
+            return bucket_seconds
+    return SERIES_BUCKET_SECONDS[-1]
+
+
+class HealthRollupService:
+    """Service for building and querying health check rollups.
+
+    Example:
+        async with session_factory.session() as session:
+            service = HealthRollupService(session, settings)
+
+            # Scheduled job
+            await service.build_rollups()
+            await service.apply_retention()
+
+            # 7-day CPU/memory history for one device
+            history = await service.get_health_history(
+                "dev-lab-01", start=now - timedelta(days=7), end=now
+            )
+    """
+
+    def __init__(self, session: AsyncSession, settings: Settings) -> None:
+        """Initialize health rollup service.
+
+        Args:
+            session: Database session
+            settings: Application settings
+        """
+        self.session = session
+        self.settings = settings
+
+    def retention_for(self, resolution: str) -> timedelta:
+        """Get retention period for a rollup tier.
+
+        Args:
+            resolution: "1m", "1h" or "1d"
+
+        Returns:
+            Retention period
+
+        Raises:
+            ValueError: If resolution is unknown
+        """
+        days = {
+            "1m": self.settings.health_rollup_1m_retention_days,
+            "1h": self.settings.health_rollup_1h_retention_days,
+            "1d": self.settings.health_rollup_1d_retention_days,
+        }.get(resolution)
+        if days is None:
+            raise ValueError(f"Unknown rollup resolution: {resolution}")
+        return timedelta(days=days)
+
+    def raw_retention(self) -> timedelta | None:
+        """Get retention period for raw health_checks rows.
+
+        Returns:
+            Retention period, or None when raw rows are kept indefinitely
+        """
+        days = self.settings.health_raw_retention_days
+        return timedelta(days=days) if days is not None else None
+
+    async def build_rollups(self, now: datetime | None = None) -> dict[str, int]:
+        """Build or refresh rollups for every tier.
+
+        Each tier is rebuilt incrementally from its watermark (the latest
+        bucket already present, which may still have been partial) up to
+        ``now``. The first run backfills as far as the tier's retention.
+
+        Args:
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Mapping of resolution -> number of buckets written
+        """
+        now = now or datetime.now(UTC)
+        written: dict[str, int] = {}
+
+        for tier in ROLLUP_TIERS:
+            start = await self._get_rebuild_start(tier, now)
+            rows = await self._aggregate_tier(tier, start)
+
+            await self.session.execute(
+                delete(HealthCheckRollupORM).where(
+                    HealthCheckRollupORM.resolution == tier.name,
+                    HealthCheckRollupORM.bucket_start >= start,
+                )
+            )
+            if rows:
+                await self.session.execute(insert(HealthCheckRollupORM), rows)
+            written[tier.name] = len(rows)
+
+        await self.session.commit()
+
+        logger.debug("Health rollups built", extra={"buckets_written": written})
+        return written
+
+    async def apply_retention(self, now: datetime | None = None) -> dict[str, int]:
+        """Delete raw health checks and rollups older than their retention.
+
+        Should run after :meth:`build_rollups` so raw rows are aggregated
+        before they are removed. Raw rows are only deleted when
+        ``health_raw_retention_days`` is set.
+
+        Args:
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Mapping of resolution ("raw", "1m", "1h", "1d") -> rows deleted
+        """
+        now = now or datetime.now(UTC)
+        deleted: dict[str, int] = {}
+
+        deleted["raw"] = 0
+        raw_retention = self.raw_retention()
+        if raw_retention is not None:
+            result = await self.session.execute(
+                delete(HealthCheckORM).where(HealthCheckORM.timestamp < now - raw_retention)
+            )
+            deleted["raw"] = int(getattr(result, "rowcount", 0) or 0)
+
+        for tier in ROLLUP_TIERS:
+            result = await self.session.execute(
+                delete(HealthCheckRollupORM).where(
+                    HealthCheckRollupORM.resolution == tier.name,
+                    HealthCheckRollupORM.bucket_start < now - self.retention_for(tier.name),
+                )
+            )
+            deleted[tier.name] = int(getattr(result, "rowcount", 0) or 0)
+
+        await self.session.commit()
+
+        logger.debug("Health retention applied", extra={"rows_deleted": deleted})
+        return deleted
+
+    def select_resolution(
+        self,
+        start: datetime,
+        end: datetime,
+        max_points: int = DEFAULT_MAX_POINTS,
+        now: datetime | None = None,
+    ) -> RollupTier:
+        """Pick the rollup tier used to answer a history query.
+
+        Walks tiers from fine to coarse and returns the first one whose
+        retention still covers ``start`` and whose bucket count over the
+        window fits in ``max_points``. Long windows therefore land on the
+        hourly or daily tier and stay cheap regardless of raw row volume.
+
+        Args:
+            start: Window start
+            end: Window end
+            max_points: Maximum number of buckets wanted
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Selected rollup tier (the coarsest tier if none fits)
+        """
+        now = now or datetime.now(UTC)
+        window_seconds = max((end - start).total_seconds(), 0)
+
+        for tier in ROLLUP_TIERS:
+            covers_window = start >= now - self.retention_for(tier.name)
+            point_count = window_seconds / tier.bucket_seconds
+            if covers_window and point_count <= max_points:
+                return tier
+
+        return ROLLUP_TIERS[-1]
+
+    async def get_health_history(
+        self,
+        device_id: str,
+        start: datetime,
+        end: datetime | None = None,
+        max_points: int = DEFAULT_MAX_POINTS,
+        resolution: str | None = None,
+    ) -> dict[str, Any]:
+        """Get downsampled health history for a device.
+
+        Args:
+            device_id: Device identifier
+            start: Window start
+            end: Window end (defaults to now)
+            max_points: Maximum number of buckets wanted (used for tier selection)
+            resolution: Force a tier ("1m", "1h", "1d") instead of auto-selecting
+
+        Returns:
+            Dictionary with the chosen resolution and a list of bucket points
+
+        Raises:
+            ValueError: If resolution is not a known rollup tier
+        """
+        now = datetime.now(UTC)
+        end = end or now
+
+        if resolution is None:
+            tier = self.select_resolution(start, end, max_points=max_points, now=now)
+        else:
+            matches = [t for t in ROLLUP_TIERS if t.name == resolution]
+            if not matches:
+                raise ValueError(f"Unknown rollup resolution: {resolution}")
+            tier = matches[0]
+
+        stmt = (
+            select(HealthCheckRollupORM)
+            .where(
+                HealthCheckRollupORM.device_id == device_id,
+                HealthCheckRollupORM.resolution == tier.name,
+                HealthCheckRollupORM.bucket_start >= floor_datetime(start, tier.bucket_seconds),
+                HealthCheckRollupORM.bucket_start <= end,
+            )
+            .order_by(HealthCheckRollupORM.bucket_start)
+        )
+        result = await self.session.execute(stmt)
+        rollups = result.scalars().all()
+
+        points = [
+            {
+                "bucket_start": floor_datetime(r.bucket_start, tier.bucket_seconds).isoformat(),
+                "sample_count": r.sample_count,
+                "cpu": {"min": r.cpu_min, "avg": r.cpu_avg, "max": r.cpu_max},
+                "memory": {"min": r.memory_min, "avg": r.memory_avg, "max": r.memory_max},
+                "uptime": {"min": r.uptime_min, "avg": r.uptime_avg, "max": r.uptime_max},
+            }
+            for r in rollups
+        ]
+
+        return {
+            "device_id": device_id,
+            "resolution": tier.name,
+            "bucket_seconds": tier.bucket_seconds,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "points": points,
+            "count": len(points),
+        }
+
+    async def get_health_series(
+        self,
+        device_id: str,
+        start: datetime,
+        end: datetime | None = None,
+        bucket_seconds: int | None = None,
+        max_points: int = DEFAULT_MAX_POINTS,
+        now: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Get a bucketed health series for a device.
+
+        Windows within raw retention are aggregated in SQL from health_checks
+        over the (device_id, timestamp) index, including a nearest-rank p95
+        of CPU and memory. Windows starting before raw retention (when
+        ``health_raw_retention_days`` is set) are re-bucketed from the
+        rollup tables instead; rollups carry no percentiles, so the p95
+        columns are null there. Results are column-oriented: one array per
+        metric, aligned with ``columns["bucket_start"]``.
+
+        Args:
+            device_id: Device identifier
+            start: Window start
+            end: Window end (defaults to now)
+            bucket_seconds: Bucket width; chosen from SERIES_BUCKET_SECONDS when omitted
+            max_points: Maximum number of buckets wanted (used for auto bucket width)
+            now: Reference time for retention checks (defaults to current UTC time)
+
+        Returns:
+            Dictionary with the source ("raw" or a rollup tier), the bucket
+            width and per-metric column arrays
+
+        Raises:
+            ValueError: If bucket_seconds is not positive
+        """
+        now = now or datetime.now(UTC)
+        end = end or now
+
+        if bucket_seconds is None:
+            bucket_seconds = select_bucket_seconds(start, end, max_points=max_points)
+        elif bucket_seconds <= 0:
+            raise ValueError(f"Invalid bucket width: {bucket_seconds}")
+
+        raw_retention = self.raw_retention()
+        if raw_retention is not None and start < now - raw_retention:
+            return await self._get_rollup_series(device_id, start, end, bucket_seconds, now)
+
+        dialect_name = self.session.get_bind().dialect.name
+        hc = HealthCheckORM
+        memory_pct = _memory_percent()
+
+        samples = (
+            select(
+                epoch_bucket(hc.timestamp, bucket_seconds, dialect_name).label("bucket"),
+                hc.cpu_usage_percent.label("cpu"),
+                memory_pct.label("memory"),
+            )
+            .where(
+                hc.device_id == device_id,
+                hc.timestamp >= start,
+                hc.timestamp < end,
+            )
+            .subquery("samples")
+        )
+        by_bucket = samples.c.bucket
+        ranked = select(
+            samples.c.bucket,
+            samples.c.cpu,
+            samples.c.memory,
+            func.row_number()
+            .over(partition_by=by_bucket, order_by=samples.c.cpu.asc().nulls_last())
+            .label("cpu_rank"),
+            func.count(samples.c.cpu).over(partition_by=by_bucket).label("cpu_count"),
+            func.row_number()
+            .over(partition_by=by_bucket, order_by=samples.c.memory.asc().nulls_last())
+            .label("memory_rank"),
+            func.count(samples.c.memory).over(partition_by=by_bucket).label("memory_count"),
+        ).subquery("ranked")
+
+        stmt = (
+            select(
+                ranked.c.bucket,
+                func.count(),
+                func.min(ranked.c.cpu),
+                func.avg(ranked.c.cpu),
+                func.max(ranked.c.cpu),
+                _nearest_rank_p95(ranked.c.cpu, ranked.c.cpu_rank, ranked.c.cpu_count),
+                func.min(ranked.c.memory),
+                func.avg(ranked.c.memory),
+                func.max(ranked.c.memory),
+                _nearest_rank_p95(ranked.c.memory, ranked.c.memory_rank, ranked.c.memory_count),
+            )
+            .group_by(ranked.c.bucket)
+            .order_by(ranked.c.bucket)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        names = (
+            "cpu_min",
+            "cpu_avg",
+            "cpu_max",
+            "cpu_p95",
+            "memory_min",
+            "memory_avg",
+            "memory_max",
+            "memory_p95",
+        )
+        columns: dict[str, list[Any]] = {
+            "bucket_start": [from_epoch(row[0]).isoformat() for row in rows],
+            "sample_count": [int(row[1]) for row in rows],
+        }
+        for offset, name in enumerate(names, start=2):
+            columns[name] = [_round(row[offset]) for row in rows]
+
+        return {
+            "device_id": device_id,
+            "source": "raw",
+            "bucket_seconds": bucket_seconds,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "count": len(rows),
+            "columns": columns,
+        }
+
+    async def _get_rollup_series(
+        self,
+        device_id: str,
+        start: datetime,
+        end: datetime,
+        bucket_seconds: int,
+        now: datetime,
+    ) -> dict[str, Any]:
+        """Re-bucket rollups into a health series shaped like the raw series.
+
+        Uses the finest tier no wider than ``bucket_seconds`` whose retention
+        covers ``start`` (the coarsest such tier if none does).
+
+        Args:
+            device_id: Device identifier
+            start: Window start
+            end: Window end
+            bucket_seconds: Requested bucket width
+            now: Reference time for retention checks
+
+        Returns:
+            Dictionary in the same shape as :meth:`get_health_series`
+        """
+        candidates = [t for t in ROLLUP_TIERS if t.bucket_seconds <= bucket_seconds]
+        candidates = candidates or [ROLLUP_TIERS[0]]
+        tier = next(
+            (t for t in candidates if start >= now - self.retention_for(t.name)),
+            candidates[-1],
+        )
+        bucket_seconds = max(bucket_seconds, tier.bucket_seconds)
+
+        dialect_name = self.session.get_bind().dialect.name
+        src = HealthCheckRollupORM
+        bucket = epoch_bucket(src.bucket_start, bucket_seconds, dialect_name).label("bucket")
+        stmt = (
+            select(
+                bucket,
+                func.sum(src.sample_count),
+                func.min(src.cpu_min),
+                _weighted_avg(src.cpu_avg, src.sample_count),
+                func.max(src.cpu_max),
+                func.min(src.memory_min),
+                _weighted_avg(src.memory_avg, src.sample_count),
+                func.max(src.memory_max),
+            )
+            .where(
+                src.device_id == device_id,
+                src.resolution == tier.name,
+                src.bucket_start >= floor_datetime(start, tier.bucket_seconds),
+                src.bucket_start < end,
+            )
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        columns: dict[str, list[Any]] = {
+            "bucket_start": [from_epoch(row[0]).isoformat() for row in rows],
+            "sample_count": [int(row[1] or 0) for row in rows],
+        }
+        for offset, name in enumerate(("cpu_min", "cpu_avg", "cpu_max"), start=2):
+            columns[name] = [_round(row[offset]) for row in rows]
+        columns["cpu_p95"] = [None] * len(rows)
+        for offset, name in enumerate(("memory_min", "memory_avg", "memory_max"), start=5):
+            columns[name] = [_round(row[offset]) for row in rows]
+        columns["memory_p95"] = [None] * len(rows)
+
+        return {
+            "device_id": device_id,
+            "source": tier.name,
+            "bucket_seconds": bucket_seconds,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "count": len(rows),
+            "columns": columns,
+        }
+
+    async def _get_rebuild_start(self, tier: RollupTier, now: datetime) -> datetime:
+        """Determine where an incremental rebuild of a tier starts.
+
+        Args:
+            tier: Rollup tier
+            now: Reference time
+
+        Returns:
+            Bucket-aligned rebuild start
+        """
+        result = await self.session.execute(
+            select(func.max(HealthCheckRollupORM.bucket_start)).where(
+                HealthCheckRollupORM.resolution == tier.name
+            )
+        )
+        watermark = result.scalar_one_or_none()
+        if watermark is None:
+            watermark = now - self.retention_for(tier.name)
+
+        return floor_datetime(watermark, tier.bucket_seconds)
+
+    async def _aggregate_tier(
+        self, tier: RollupTier, start: datetime
+    ) -> list[dict[str, Any]]:
+        """Aggregate source rows into tier buckets starting at ``start``.
+
+        Args:
+            tier: Rollup tier to build
+            start: Bucket-aligned start time
+
+        Returns:
+            Rollup row values ready for a bulk insert
+        """
+        dialect_name = self.session.get_bind().dialect.name
+
+        if tier.source == "raw":
+            hc = HealthCheckORM
+            bucket = epoch_bucket(hc.timestamp, tier.bucket_seconds, dialect_name).label("bucket")
+            memory_pct = _memory_percent()
+            stmt = (
+                select(
+                    hc.device_id,
+                    bucket,
+                    func.count(hc.id),
+                    func.min(hc.cpu_usage_percent),
+                    func.avg(hc.cpu_usage_percent),
+                    func.max(hc.cpu_usage_percent),
+                    func.min(memory_pct),
+                    func.avg(memory_pct),
+                    func.max(memory_pct),
+                    func.min(hc.uptime_seconds),
+                    func.avg(hc.uptime_seconds),
+                    func.max(hc.uptime_seconds),
+                )
+                .where(hc.timestamp >= start)
+                .group_by(hc.device_id, bucket)
+            )
+        else:
+            src = HealthCheckRollupORM
+            bucket = epoch_bucket(src.bucket_start, tier.bucket_seconds, dialect_name).label(
+                "bucket"
+            )
+            stmt = (
+                select(
+                    src.device_id,
+                    bucket,
+                    func.sum(src.sample_count),
+                    func.min(src.cpu_min),
+                    _weighted_avg(src.cpu_avg, src.sample_count),
+                    func.max(src.cpu_max),
+                    func.min(src.memory_min),
+                    _weighted_avg(src.memory_avg, src.sample_count),
+                    func.max(src.memory_max),
+                    func.min(src.uptime_min),
+                    _weighted_avg(src.uptime_avg, src.sample_count),
+                    func.max(src.uptime_max),
+                )
+                .where(src.resolution == tier.source, src.bucket_start >= start)
+                .group_by(src.device_id, bucket)
+            )
+
+        result = await self.session.execute(stmt)
+
+        return [
+            {
+                "device_id": row[0],
+                "resolution": tier.name,
+                "bucket_start": from_epoch(row[1]),
+                "sample_count": int(row[2] or 0),
+                "cpu_min": _as_float(row[3]),
+                "cpu_avg": _as_float(row[4]),
+                "cpu_max": _as_float(row[5]),
+                "memory_min": _as_float(row[6]),
+                "memory_avg": _as_float(row[7]),
+                "memory_max": _as_float(row[8]),
+                "uptime_min": _as_int(row[9]),
+                "uptime_avg": _as_float(row[10]),
+                "uptime_max": _as_int(row[11]),
+            }
+            for row in result.all()
+        ]
+
+
+def _memory_percent() -> Any:
+    """Memory usage percent of a health_checks row (NULL when total is unknown)."""
+    hc = HealthCheckORM
+    return case(
+        (
+            hc.memory_total_bytes > 0,
+            hc.memory_used_bytes * 100.0 / hc.memory_total_bytes,
+        ),
+        else_=None,
+    )
+
+
+def _nearest_rank_p95(value: Any, rank: Any, count: Any) -> Any:
+    """95th percentile (nearest-rank) of ``value`` within a GROUP BY bucket.
+
+    ``rank`` is a 1-based ROW_NUMBER() ordered by ``value`` (NULLs last) and
+    ``count`` the number of non-NULL values in the bucket, so the percentile
+    row is rank ceil(0.95 * count), written with integer arithmetic.
+    """
+    return func.max(case((rank == (count * 95 + 99) // 100, value), else_=None))
+
+
+def _weighted_avg(avg_column: Any, count_column: Any) -> Any:
+    """Sample-weighted average of finer-tier averages, ignoring NULL buckets."""
+    weight = case((avg_column.is_not(None), count_column), else_=None)
+    return func.sum(avg_column * count_column) / func.nullif(func.sum(weight), 0)
+
+
+def _as_float(value: Any) -> float | None:
+    """Convert a SQL aggregate (possibly Decimal) to float."""
+    return float(value) if value is not None else None
+
+
+def _round(value: Any) -> float | None:
+    """Convert a SQL aggregate to float rounded for compact series output."""
+    return round(float(value), 2) if value is not None else None
+
+
+def _as_int(value: Any) -> int | None:
+    """Convert a SQL aggregate to int."""
+    return int(value) if value is not None else None
+
+
+__all__ = [
+    "DEFAULT_MAX_POINTS",
+    "HealthRollupService",
+    "ROLLUP_TIERS",
+    "RollupTier",
+    "SERIES_BUCKET_SECONDS",
+    "select_bucket_seconds",
+]
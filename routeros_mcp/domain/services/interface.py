@@ -4,22 +4,47 @@ Provides operations for querying RouterOS interface information,
 including status, statistics, and configuration.
 """
 
+import asyncio
 import logging
+import re
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.routeros.cli_parser import iter_print_records, parse_key_value_output
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
     RouterOSServerError,
     RouterOSTimeoutError,
 )
+from routeros_mcp.infra.routeros.topology import observe_device_facts
+from routeros_mcp.infra.routeros.traffic_counters import COUNTER_FIELDS, get_traffic_store
 
 logger = logging.getLogger(__name__)
 
+# Monitor-traffic rate such as "3 707", "38.2Mbps" or "0bps" (spaces removed)
+_RATE_RE = re.compile(r"([0-9]*\.?[0-9]+)([kmg]?)(?:bps)?")
+_RATE_MULTIPLIERS = {"": 1, "k": 1_000, "m": 1_000_000, "g": 1_000_000_000}
+
+# Interfaces sampled per monitor-traffic request (comma-separated list)
+MONITOR_TRAFFIC_BATCH_SIZE = 64
+
+
+def _to_int(value: str, default: int) -> int:
+    """Integer value of a RouterOS numeric field, or ``default`` when absent."""
+    return int(value) if value.isdigit() else default
+
+
+def _parse_rate(value: str) -> int:
+    """Convert a monitor-traffic value with optional unit suffix to an int."""
+    match = _RATE_RE.fullmatch(value.lower().replace(" ", ""))
+    if match is None:
+        return 0
+    return int(float(match.group(1)) * _RATE_MULTIPLIERS[match.group(2)])
+
 
 class InterfaceService:
     """Service for RouterOS interface operations.
@@ -95,6 +120,7 @@ class InterfaceService:
             # Cache the result
             if self.settings.redis_cache_enabled:
                 await self._set_to_cache(device_id, interfaces)
+            observe_device_facts(self.settings, device_id, interfaces=interfaces)
 
             return interfaces
         except (
@@ -120,6 +146,7 @@ class InterfaceService:
                 # Cache the result
                 if self.settings.redis_cache_enabled:
                     await self._set_to_cache(device_id, interfaces)
+                observe_device_facts(self.settings, device_id, interfaces=interfaces)
 
                 return interfaces
             except Exception as ssh_exc:
@@ -169,7 +196,7 @@ class InterfaceService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/interface/print")
+            output = await ssh_client.execute("/interface/print terse without-paging")
             return self._parse_interface_print_output(output)
         finally:
             await ssh_client.close()
@@ -178,8 +205,14 @@ class InterfaceService:
     def _parse_interface_print_output(output: str) -> list[dict[str, Any]]:
         """Parse /interface/print output into interface list.
 
-        Handles RouterOS standard table format with flags in left margin.
-        RouterOS output format:
+        Handles ``print terse`` output (one ``key=value`` row per interface, as
+        requested by the SSH fallback) and the standard table format with
+        flags in left margin.
+
+        Terse output format:
+         0  R name=ether1 default-name=ether1 type=ether mtu=1500 actual-mtu=1500 l2mtu=1514
+
+        Table output format:
         Flags: D - DYNAMIC; R - RUNNING; S - SLAVE
         Columns: NAME, TYPE, ACTUAL-MTU, L2MTU, MAX-L2MTU, MAC-ADDRESS
          #     NAME              TYPE      ACTUAL-MTU  L2MTU  MAX-L2MTU  MAC-ADDRESS
@@ -188,89 +221,52 @@ class InterfaceService:
         """
         interfaces: list[dict[str, Any]] = []
 
-        # Skip header lines (Flags:, Columns:, blank line, column headers with #)
-        lines = output.strip().split("\n")
-        for line in lines:
-            # Skip header/metadata lines
-            if not line.strip() or line.startswith("Flags:") or line.startswith("Columns:") or line.startswith("#"):
+        for record in iter_print_records(output, flag_chars="DRSXdrsx", multiline=False):
+            if record.values:
+                values = record.values
+                mtu = _to_int(values.get("actual-mtu") or values.get("mtu", ""), 1500)
+                interfaces.append({
+                    "id": record.id,
+                    "name": values.get("name", ""),
+                    "type": values.get("type", ""),
+                    "running": "R" in record.flags,
+                    "disabled": "X" in record.flags,
+                    "comment": values.get("comment", record.comment),
+                    "mtu": mtu,
+                    "actual_mtu": mtu,
+                    "l2mtu": _to_int(values.get("l2mtu", ""), 1514),
+                    "max_l2mtu": _to_int(values.get("max-l2mtu", ""), 9796),
+                    "mac_address": values.get("mac-address", ""),
+                })
                 continue
 
-            # Parse data lines (start with number, potentially with flags)
-            parts = line.split()
-            if not parts or not parts[0][0].isdigit():
+            # Format: [name] [type] [actual-mtu] [l2mtu] [max-l2mtu] [mac-address]
+            if len(record.tokens) < 2:
                 continue
 
-            try:
-                # Format: [id] [flags*] [name] [type] [actual-mtu] [l2mtu] [max-l2mtu] [mac-address]
-                # Flags are single uppercase letters: D, R, S, X
-                idx = 0
-
-                # First part is always the ID
-                iface_id = parts[0]
-                idx = 1
-
-                # Check if second part contains flags (one or more flag characters)
-                flags = ""
-                if len(parts) > 1 and all(c in "DRSXdrsx " for c in parts[1]):
-                    # Parts[1] may contain flags like "R", "RS", "D S", etc.
-                    flags = parts[1].replace(" ", "")
-                    idx = 2
-
-                # Extract fields: name, type, and optional numeric fields
-                if len(parts) > idx + 1:
-                    name = parts[idx]
-                    iface_type = parts[idx + 1]
-
-                    # Remaining parts are numeric fields and MAC address
-                    # Format: [actual-mtu] [l2mtu] [max-l2mtu] [mac-address]
-                    remaining = parts[idx + 2:]
-
-                    # Try to extract MTU fields and MAC address from remaining fields
-                    actual_mtu = 1500  # Default
-                    l2mtu = 1514  # Default
-                    max_l2mtu = 9796  # Default
-                    mac_address = ""
-
-                    # Extract numeric fields in order
-                    numeric_idx = 0
-                    for field in remaining:
-                        try:
-                            # Try to parse as integer
-                            value = int(field)
-                            if numeric_idx == 0:
-                                actual_mtu = value
-                            elif numeric_idx == 1:
-                                l2mtu = value
-                            elif numeric_idx == 2:
-                                max_l2mtu = value
-                            numeric_idx += 1
-                        except ValueError:
-                            # Not a number, might be MAC address
-                            if ":" in field and len(field) > 5:
-                                mac_address = field
-
-                    # Determine running and disabled status from flags
-                    # R = running, D = disabled
-                    running = "R" in flags
-                    disabled = "D" in flags
-
-                    interfaces.append({
-                        "id": iface_id,
-                        "name": name,
-                        "type": iface_type,
-                        "running": running,
-                        "disabled": disabled,
-                        "comment": "",
-                        "mtu": actual_mtu,
-                        "actual_mtu": actual_mtu,
-                        "l2mtu": l2mtu,
-                        "max_l2mtu": max_l2mtu,
-                        "mac_address": mac_address,
-                    })
-            except (IndexError, ValueError) as e:  # pragma: no cover
-                # Skip lines that don't parse properly
-                logger.debug(f"Failed to parse interface line: {line}", exc_info=e)
-                continue
+            name, iface_type, *remaining = record.tokens
+
+            # MTU fields in order (defaults when RouterOS omits them), then MAC
+            mtus = [1500, 1514, 9796]
+            numeric = [int(field) for field in remaining if field.isdigit()][:3]
+            mtus[: len(numeric)] = numeric
+            mac_address = next(
+                (field for field in remaining if ":" in field and len(field) > 5), ""
+            )
+
+            interfaces.append({
+                "id": record.id,
+                "name": name,
+                "type": iface_type,
+                "running": "R" in record.flags,
+                "disabled": "D" in record.flags,
+                "comment": record.comment,
+                "mtu": mtus[0],
+                "actual_mtu": mtus[0],
+                "l2mtu": mtus[1],
+                "max_l2mtu": mtus[2],
+                "mac_address": mac_address,
+            })
 
         return interfaces
 
@@ -372,7 +368,7 @@ class InterfaceService:
 
         try:
             # Get all interfaces and find by ID
-            output = await ssh_client.execute("/interface/print")
+            output = await ssh_client.execute("/interface/print terse without-paging")
             interfaces = self._parse_interface_print_output(output)
 
             for iface in interfaces:
@@ -392,6 +388,13 @@ class InterfaceService:
     ) -> list[dict[str, Any]]:
         """Get real-time traffic statistics for interfaces with REST→SSH fallback.
 
+        Reading stats marks the device as watched, so the interface traffic
+        collector samples its counters every
+        ``metrics_collection_interval_seconds``. Once two fresh samples exist,
+        rates are answered from memory (``source: "counters"``) without
+        asking the router to run ``monitor-traffic``; until then the live
+        path below is used.
+
         Args:
             device_id: Device identifier
             interface_names: Optional list of interface names to filter
@@ -404,6 +407,22 @@ class InterfaceService:
         """
         await self.device_service.get_device(device_id)
 
+        if self.settings.interface_traffic_enabled:
+            store = get_traffic_store()
+            store.watch(device_id)
+            cached = store.rates(
+                device_id,
+                interface_names,
+                max_age=2 * self.settings.metrics_collection_interval_seconds,
+            )
+            if cached is not None:
+                for stat in cached:
+                    stat["source"] = "counters"
+                    stat["transport"] = "rest"
+                    stat["fallback_used"] = False
+                    stat["rest_error"] = None
+                return cached
+
         try:
             stats = await self._get_interface_stats_via_rest(device_id, interface_names)
             # Add transport metadata
@@ -443,46 +462,109 @@ class InterfaceService:
                     f"rest_error={rest_exc}, ssh_error={ssh_exc}"
                 ) from ssh_exc
 
+    async def collect_traffic_counters(self, device_id: str) -> int:
+        """Sample cumulative interface counters into the traffic counter store.
+
+        Reads ``/rest/interface`` restricted to the name and counter fields,
+        bypassing the interface list cache.
+
+        Args:
+            device_id: Device identifier
+
+        Returns:
+            Number of interfaces sampled
+        """
+        client = await self.device_service.get_rest_client(device_id)
+
+        try:
+            interfaces_data = await client.get(
+                "/rest/interface",
+                params={".proplist": ",".join(("name", *COUNTER_FIELDS))},
+            )
+        finally:
+            await client.close()
+
+        if not isinstance(interfaces_data, list):
+            return 0
+        return get_traffic_store().record(
+            device_id, [iface for iface in interfaces_data if isinstance(iface, dict)]
+        )
+
     async def _get_interface_stats_via_rest(
         self,
         device_id: str,
         interface_names: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Fetch interface stats via REST API."""
+        """Fetch interface stats via REST API.
+
+        RouterOS samples every interface of a comma-separated list in one
+        ``monitor-traffic once`` call, so interfaces are requested in batches
+        of ``MONITOR_TRAFFIC_BATCH_SIZE`` instead of one round trip (and one
+        sampling period) each. Interfaces a batch did not return, e.g. when
+        one unknown name fails the whole batch, are retried one per request,
+        concurrently up to ``routeros_max_concurrent_per_device``.
+        """
         client = await self.device_service.get_rest_client(device_id)
 
         try:
-            # RouterOS monitor-traffic streams unless "once" is supplied. If no
-            # interface list is provided, fetch names first to issue per-interface
-            # one-shot requests.
+            # If no interface list is provided, fetch names first
             target_interfaces = interface_names
             if not target_interfaces:
                 interfaces = await self.list_interfaces(device_id)
                 target_interfaces = [iface["name"] for iface in interfaces if iface.get("name")]
-
-            result: list[dict[str, Any]] = []
-
-            # Issue one-shot monitor requests per interface to avoid streaming timeouts.
-            for name in target_interfaces or []:
-                stats_data = await client.get(
-                    "/rest/interface/monitor-traffic",
-                    params={
-                        "interface": name,
-                        "once": "true",
-                        "without-paging": "true",
-                    },
-                )
-
+            names = list(dict.fromkeys(target_interfaces or []))
+
+            semaphore = asyncio.Semaphore(self.settings.routeros_max_concurrent_per_device)
+
+            async def monitor(batch: list[str]) -> list[dict[str, Any]]:
+                async with semaphore:
+                    stats_data = await client.get(
+                        "/rest/interface/monitor-traffic",
+                        params={
+                            "interface": ",".join(batch),
+                            "once": "true",
+                            "without-paging": "true",
+                        },
+                    )
                 # API may return a dict for single interface or list; normalize to list
-                candidates: list[dict[str, Any]] = []
                 if isinstance(stats_data, list):
-                    candidates = [s for s in stats_data if isinstance(s, dict)]
-                elif isinstance(stats_data, dict):
-                    candidates = [stats_data]
+                    return [s for s in stats_data if isinstance(s, dict)]
+                if isinstance(stats_data, dict):
+                    return [stats_data]
+                return []
+
+            sampled: dict[str, dict[str, Any]] = {}
+            if len(names) > 1:
+                batches = [
+                    names[i : i + MONITOR_TRAFFIC_BATCH_SIZE]
+                    for i in range(0, len(names), MONITOR_TRAFFIC_BATCH_SIZE)
+                ]
+                outcomes = await asyncio.gather(
+                    *(monitor(batch) for batch in batches), return_exceptions=True
+                )
+                for batch, outcome in zip(batches, outcomes, strict=True):
+                    if isinstance(outcome, BaseException):
+                        logger.debug(
+                            f"Batched monitor-traffic failed, retrying per interface: {outcome}",
+                            extra={"device_id": device_id, "interface_count": len(batch)},
+                        )
+                        continue
+                    requested = set(batch)
+                    for stat in outcome:
+                        name = stat.get("name")
+                        if name in requested and name not in sampled:
+                            sampled[name] = stat
+
+            missing = [name for name in names if name not in sampled]
+            single_results = await asyncio.gather(*(monitor([name]) for name in missing))
+            singles = dict(zip(missing, single_results, strict=True))
 
+            result: list[dict[str, Any]] = []
+            for name in names:
+                candidates = [sampled[name]] if name in sampled else singles[name]
                 for stat in candidates:
                     # Respect filter if provided explicitly (defensive for weird responses)
-                    if interface_names and stat.get("name") not in interface_names:
+                    if interface_names and stat.get("name", name) not in interface_names:
                         continue
 
                     result.append({
@@ -508,28 +590,39 @@ class InterfaceService:
 
         try:
             # Get interface list first
-            output = await ssh_client.execute("/interface/print")
+            output = await ssh_client.execute("/interface/print terse without-paging")
             interfaces = self._parse_interface_print_output(output)
 
             result: list[dict[str, Any]] = []
 
             # If no specific interface names requested, get stats for all running interfaces
             target_interfaces = interface_names if interface_names else None
+            names = [
+                iface["name"]
+                for iface in interfaces
+                if iface.get("name")
+                and (not target_interfaces or iface["name"] in target_interfaces)
+            ]
+
+            # One CLI session for all interfaces; if the batch aborts, fall back
+            # to per-interface commands so one bad interface does not zero the rest
+            commands = [f"/interface/monitor-traffic {name} once" for name in names]
+            try:
+                batch_outputs: list[str] | None = await ssh_client.execute_many(commands)
+            except Exception as e:
+                logger.debug(
+                    f"Batched monitor-traffic failed, retrying per interface: {e}",
+                    extra={"device_id": device_id},
+                )
+                batch_outputs = None
 
-            for iface in interfaces:
-                name = iface.get("name")
-                if not name:
-                    continue
-
-                # Filter by interface_names if provided
-                if target_interfaces and name not in target_interfaces:
-                    continue
-
+            for index, name in enumerate(names):
                 # Get traffic stats for this interface using monitor-traffic once
                 try:
-                    stats_output = await ssh_client.execute(
-                        f"/interface/monitor-traffic {name} once"
-                    )
+                    if batch_outputs is not None:
+                        stats_output = batch_outputs[index]
+                    else:
+                        stats_output = await ssh_client.execute(commands[index])
                     stats = self._parse_monitor_traffic_output(stats_output)
                     stats["name"] = name
                 except Exception as e:
@@ -569,54 +662,16 @@ class InterfaceService:
           fp-tx-bits-per-second:      0bps
       tx-queue-drops-per-second:         0
         """
-        stats: dict[str, Any] = {
-            "rx_bits_per_second": 0,
-            "tx_bits_per_second": 0,
-            "rx_packets_per_second": 0,
-            "tx_packets_per_second": 0,
+        values = {key.lower(): value for key, value in parse_key_value_output(output).items()}
+
+        # Exact keys only, so fast-path (fp-*) variants are not picked up
+        return {
+            "rx_bits_per_second": _parse_rate(values.get("rx-bits-per-second", "")),
+            "tx_bits_per_second": _parse_rate(values.get("tx-bits-per-second", "")),
+            "rx_packets_per_second": _parse_rate(values.get("rx-packets-per-second", "")),
+            "tx_packets_per_second": _parse_rate(values.get("tx-packets-per-second", "")),
         }
 
-        for line in output.strip().split("\n"):
-            line = line.strip()
-            if not line or ":" not in line:
-                continue
-
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-
-            # Convert value to number, handling unit suffixes (kbps, Mbps, etc.) and spaces
-            def parse_value(val: str) -> float:
-                val = val.lower().strip()
-                # Remove spaces from numbers (e.g., "3 707" -> "3707")
-                val = val.replace(" ", "")
-
-                if "kbps" in val:
-                    return float(val.replace("kbps", "")) * 1000
-                elif "mbps" in val:
-                    return float(val.replace("mbps", "")) * 1_000_000
-                elif "gbps" in val:
-                    return float(val.replace("gbps", "")) * 1_000_000_000
-                elif "bps" in val:
-                    return float(val.replace("bps", ""))
-                else:
-                    try:
-                        return float(val)
-                    except ValueError:
-                        return 0
-
-            # Use exact key matching to avoid matching fast-path (fp-*) variants
-            if key == "rx-packets-per-second":
-                stats["rx_packets_per_second"] = int(float(parse_value(value)))
-            elif key == "rx-bits-per-second":
-                stats["rx_bits_per_second"] = int(float(parse_value(value)))
-            elif key == "tx-packets-per-second":
-                stats["tx_packets_per_second"] = int(float(parse_value(value)))
-            elif key == "tx-bits-per-second":
-                stats["tx_bits_per_second"] = int(float(parse_value(value)))
-
-        return stats
-
 
     async def _get_from_cache(self, device_id: str) -> list[dict[str, Any]] | None:
         """Get interface data from Redis cache.
@@ -11,12 +11,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.routeros.cli_parser import iter_print_records
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
     RouterOSServerError,
     RouterOSTimeoutError,
 )
+from routeros_mcp.infra.routeros.topology import observe_device_facts
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +93,7 @@ class IPService:
             # Cache the result
             if self.settings.redis_cache_enabled:
                 await self._set_to_cache(device_id, addresses)
+            observe_device_facts(self.settings, device_id, ip_addresses=addresses)
 
             return addresses
         except (
@@ -116,6 +119,7 @@ class IPService:
                 # Cache the result
                 if self.settings.redis_cache_enabled:
                     await self._set_to_cache(device_id, addresses)
+                observe_device_facts(self.settings, device_id, ip_addresses=addresses)
 
                 return addresses
             except Exception as ssh_exc:
@@ -162,7 +166,7 @@ class IPService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/address/print")
+            output = await ssh_client.execute("/ip/address/print terse without-paging")
             return self._parse_ip_address_print_output(output)
         finally:
             await ssh_client.close()
@@ -171,8 +175,11 @@ class IPService:
     def _parse_ip_address_print_output(output: str) -> list[dict[str, Any]]:
         """Parse /ip/address/print output into address list.
 
-        Handles RouterOS standard table format with key: value pairs.
-        Expects output like:
+        Handles ``print terse`` output, where flags follow RouterOS semantics
+        (X - disabled, I - invalid, D - dynamic):
+         0   address=192.168.1.10/24 network=192.168.1.0/24 interface=ether1
+
+        and the standard table format. Expects output like:
         Flags: D - disabled, X - invalid, I - interface, A - arp
          #    ADDRESS            NETWORK         INTERFACE
          *1   192.168.1.10/24    192.168.1.0/24  ether1
@@ -180,57 +187,38 @@ class IPService:
         """
         addresses: list[dict[str, Any]] = []
 
-        lines = output.strip().split("\n")
-        for line in lines:
-            # Skip header/metadata lines
-            if not line.strip() or line.startswith("Flags:") or line.startswith("#"):
+        for record in iter_print_records(output, flag_chars="DXIAdrxia", multiline=False):
+            if record.values:
+                if "address" not in record.values:
+                    continue
+                addresses.append({
+                    "id": record.id,
+                    "address": record.values["address"],
+                    "network": record.values.get("network", ""),
+                    "interface": record.values.get("interface", ""),
+                    "disabled": "X" in record.flags,
+                    "comment": record.values.get("comment", record.comment),
+                    "dynamic": "D" in record.flags,
+                    "invalid": "I" in record.flags,
+                })
                 continue
 
-            # Parse data lines (RouterOS IDs start with * or are numbers)
-            parts = line.split()
-            if not parts:
+            # Fields: [address] [network] [interface]
+            if len(record.tokens) < 3:
                 continue
 
-            # Check if first part is an ID (starts with * or digit)
-            first_char = parts[0][0]
-            if not (first_char == "*" or first_char.isdigit()):
-                continue
-
-            try:
-                idx = 0
-                flags = ""
-
-                # First part is always ID (*1, *2, or 0, 1, etc.)
-                # Second part might be flags (single letters like D, X, etc.)
-                # or might be address if no flags
-                addr_id = parts[0]
-
-                # Check if second part is flags (single letter flag chars)
-                if len(parts) > 1 and len(parts[1]) == 1 and parts[1] in "DXIAdrxia":
-                    flags = parts[1]
-                    idx = 2  # Address is at idx 2
-                else:
-                    idx = 1  # Address is at idx 1
-
-                # Extract fields: [id] [flags?] [address] [network] [interface]
-                if len(parts) > idx + 2:
-                    address = parts[idx]
-                    network = parts[idx + 1]
-                    interface = parts[idx + 2]
-
-                    addresses.append({
-                        "id": addr_id,
-                        "address": address,
-                        "network": network,
-                        "interface": interface,
-                        "disabled": "D" in flags or "d" in flags,
-                        "comment": "",  # Not shown in simple print
-                        "dynamic": False,  # Can't determine from simple print
-                        "invalid": "I" in flags or "X" in flags or "i" in flags or "x" in flags,
-                    })
-            except (IndexError, ValueError) as e:
-                logger.debug(f"Failed to parse IP address line: {line}", exc_info=e)
-                continue
+            address, network, interface = record.tokens[:3]
+            flags = record.flags.upper()
+            addresses.append({
+                "id": record.id,
+                "address": address,
+                "network": network,
+                "interface": interface,
+                "disabled": "D" in flags,
+                "comment": record.comment,
+                "dynamic": False,  # Can't determine from simple print
+                "invalid": "I" in flags or "X" in flags,
+            })
 
         return addresses
 
@@ -328,7 +316,7 @@ class IPService:
 
         try:
             # Get all addresses and find by ID
-            output = await ssh_client.execute("/ip/address/print")
+            output = await ssh_client.execute("/ip/address/print terse without-paging")
             addresses = self._parse_ip_address_print_output(output)
 
             for addr in addresses:
@@ -429,7 +417,7 @@ class IPService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/arp/print")
+            output = await ssh_client.execute("/ip/arp/print terse without-paging")
             return self._parse_arp_table_print_output(output)
         finally:
             await ssh_client.close()
@@ -447,59 +435,156 @@ class IPService:
         1 DC 192.168.20.248  00:E0:4C:34:5D:51  vlan20-mgmt  reachable
         
         Format: [id] [flags] [address] [mac-address] [interface] [status]
+
+        ``print terse`` rows carry the same fields as ``key=value`` pairs;
+        ``status`` is only printed by RouterOS v7.
         """
         arp_entries: list[dict[str, Any]] = []
 
-        lines = output.strip().split("\n")
-        for line in lines:
-            # Skip header/metadata lines
-            if not line.strip() or line.startswith("Flags:") or line.startswith("#") or line.startswith("Columns:"):
+        for record in iter_print_records(output, multiline=False):
+            if record.values:
+                if "address" not in record.values:
+                    continue
+                arp_entries.append({
+                    "address": record.values["address"],
+                    "mac_address": record.values.get("mac-address", ""),
+                    "interface": record.values.get("interface", ""),
+                    "status": record.values.get("status", ""),
+                    "comment": record.values.get("comment", record.comment),
+                })
                 continue
 
-            # Parse data lines (RouterOS IDs start with * or are numbers)
-            parts = line.split()
-            if not parts:
+            # Fields: [address] [mac-address] [interface] [status?]
+            if len(record.tokens) < 3:
                 continue
 
-            # Check if first part is an ID (starts with * or digit)
-            first_char = parts[0][0]
-            if not (first_char == "*" or first_char.isdigit()):
-                continue
+            address, mac_address, interface = record.tokens[:3]
+            arp_entries.append({
+                "address": address,
+                "mac_address": mac_address,
+                "interface": interface,
+                "status": record.tokens[3] if len(record.tokens) > 3 else "",
+                "comment": record.comment,
+            })
+
+        return arp_entries
+
+    async def list_neighbors(
+        self,
+        device_id: str,
+    ) -> list[dict[str, Any]]:
+        """List discovered L2 neighbours (MNDP/CDP/LLDP) with REST→SSH fallback.
+
+        Args:
+            device_id: Device identifier
+
+        Returns:
+            List of neighbour dictionaries (local interface, remote MAC,
+            identity, platform and the remote port in ``interface_name``)
+
+        Raises:
+            DeviceNotFoundError: If device doesn't exist
+        """
+        await self.device_service.get_device(device_id)
 
+        try:
+            neighbors = await self._list_neighbors_via_rest(device_id)
+            # Add transport metadata
+            for neighbor in neighbors:
+                neighbor["transport"] = "rest"
+                neighbor["fallback_used"] = False
+                neighbor["rest_error"] = None
+            observe_device_facts(self.settings, device_id, neighbors=neighbors)
+            return neighbors
+        except (
+            RouterOSTimeoutError,
+            RouterOSNetworkError,
+            RouterOSServerError,
+            RouterOSClientError,
+            Exception,
+        ) as rest_exc:
+            logger.warning(
+                f"REST neighbor listing failed, attempting SSH fallback: {rest_exc}",
+                extra={"device_id": device_id},
+            )
+            # Try SSH fallback
             try:
-                # Format: [id] [flags] [address] [mac-address] [interface] [status]
-                # parts[0] = id (e.g., "0", "*1")
-                # parts[1] = flags (e.g., "DC", "D", "C")
-                # parts[2] = address (IP)
-                # parts[3] = mac-address
-                # parts[4] = interface
-                # parts[5] = status (optional)
-
-                idx = 1  # Start after ID
-
-                # Check if second part looks like flags (all uppercase letters)
-                if len(parts) > 1 and parts[1].isalpha() and parts[1].isupper():
-                    idx = 2  # Skip flags, start from address
-
-                # Extract fields: [id] [flags?] [address] [mac-address] [interface] [status?]
-                if len(parts) > idx + 2:
-                    address = parts[idx]
-                    mac_address = parts[idx + 1]
-                    interface = parts[idx + 2]
-                    status = parts[idx + 3] if len(parts) > idx + 3 else ""
-
-                    arp_entries.append({
-                        "address": address,
-                        "mac_address": mac_address,
-                        "interface": interface,
-                        "status": status,
-                        "comment": "",  # Not shown in simple print
-                    })
-            except (IndexError, ValueError) as e:
-                logger.debug(f"Failed to parse ARP line: {line}", exc_info=e)
-                continue
+                neighbors = await self._list_neighbors_via_ssh(device_id)
+                # Add transport metadata
+                for neighbor in neighbors:
+                    neighbor["transport"] = "ssh"
+                    neighbor["fallback_used"] = True
+                    neighbor["rest_error"] = str(rest_exc)
+                observe_device_facts(self.settings, device_id, neighbors=neighbors)
+                return neighbors
+            except Exception as ssh_exc:
+                logger.error(
+                    "Both REST and SSH neighbor listing failed",
+                    exc_info=ssh_exc,
+                    extra={"device_id": device_id, "rest_error": str(rest_exc)},
+                )
+                raise RuntimeError(
+                    f"Neighbor listing failed via REST and SSH: "
+                    f"rest_error={rest_exc}, ssh_error={ssh_exc}"
+                ) from ssh_exc
 
-        return arp_entries
+    async def _list_neighbors_via_rest(self, device_id: str) -> list[dict[str, Any]]:
+        """Fetch discovered neighbours via REST API."""
+        client = await self.device_service.get_rest_client(device_id)
+
+        try:
+            neighbor_data = await client.get("/rest/ip/neighbor")
+
+            result: list[dict[str, Any]] = []
+            if isinstance(neighbor_data, list):
+                for entry in neighbor_data:
+                    if isinstance(entry, dict):
+                        result.append(self._normalize_neighbor(entry))
+
+            return result
+
+        finally:
+            await client.close()
+
+    async def _list_neighbors_via_ssh(self, device_id: str) -> list[dict[str, Any]]:
+        """Fetch discovered neighbours via SSH CLI."""
+        ssh_client = await self.device_service.get_ssh_client(device_id)
+
+        try:
+            output = await ssh_client.execute("/ip/neighbor/print terse without-paging")
+            return self._parse_neighbor_print_output(output)
+        finally:
+            await ssh_client.close()
+
+    @staticmethod
+    def _normalize_neighbor(entry: dict[str, Any]) -> dict[str, Any]:
+        """Neighbour fields from a REST item or ``print terse`` key=value pairs."""
+        return {
+            "interface": entry.get("interface", ""),
+            "address": entry.get("address", ""),
+            "mac_address": entry.get("mac-address", ""),
+            "identity": entry.get("identity", ""),
+            "platform": entry.get("platform", ""),
+            "board": entry.get("board", ""),
+            "version": entry.get("version", ""),
+            "interface_name": entry.get("interface-name", ""),
+        }
+
+    @staticmethod
+    def _parse_neighbor_print_output(output: str) -> list[dict[str, Any]]:
+        """Parse /ip/neighbor/print terse output into neighbours.
+
+        Expects one ``print terse`` row per neighbour, e.g.:
+        0 interface=ether2 mac-address=48:8F:5A:00:00:01 identity=sw1 interface-name=ether1
+
+        Rows without ``key=value`` pairs are skipped; the table format
+        truncates identities and has no remote port.
+        """
+        return [
+            IPService._normalize_neighbor(record.values)
+            for record in iter_print_records(output, multiline=False)
+            if "interface" in record.values
+        ]
 
     async def add_secondary_address(
         self,
@@ -0,0 +1,432 @@
+"""Persistent, searchable archive of RouterOS device logs.
+
+RouterOS keeps only a small in-memory log (1000 lines by default), so
+entries older than a few hours are usually gone by the time someone looks
+for them. The archive stores entries pulled by the log archive job (through
+the per-device log tailer, so each run transfers only new lines) or pushed
+by devices over syslog, and serves fleet-wide searches.
+
+Storage layout (migration 41):
+- device_logs rows carry ``day`` (days since the epoch, UTC). Every search
+  adds a ``day BETWEEN`` predicate for its time range, so only the days the
+  range covers are read, and retention deletes whole days.
+- device_log_topics indexes each entry topic by (topic, day).
+- Messages are full-text indexed (tsvector on PostgreSQL, FTS5 on SQLite);
+  searches fall back to ILIKE when the index is absent.
+"""
+
+import logging
+import shlex
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, insert, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from routeros_mcp.config import Settings
+from routeros_mcp.infra.db.models import DeviceLog as DeviceLogORM
+from routeros_mcp.infra.db.models import DeviceLogTopic as DeviceLogTopicORM
+from routeros_mcp.infra.routeros.log_tail import LogEntry
+
+logger = logging.getLogger(__name__)
+
+# Safety limits for logs/search
+MAX_SEARCH_RESULTS = 1000
+DEFAULT_SEARCH_WINDOW = timedelta(hours=24)
+
+# Entries are inserted in chunks to bound statement size
+INSERT_CHUNK_SIZE = 500
+
+_SECONDS_PER_DAY = 86400
+
+# Longest topic kept in the topic index (device_log_topics.topic)
+_MAX_TOPIC_LENGTH = 32
+
+
+def epoch_day(value: datetime) -> int:
+    """Partition key for a timestamp: whole days since 1970-01-01 UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp()) // _SECONDS_PER_DAY
+
+
+def resolve_log_time(entry: LogEntry, now: datetime) -> datetime:
+    """Turn the time a device printed into an absolute UTC timestamp.
+
+    RouterOS prints ``HH:MM:SS`` for today's entries and ``mon/dd HH:MM:SS``
+    (v6) for older ones, so the missing date or year is taken from ``now``,
+    stepping back a day or a year when that would put the entry in the
+    future. Device clocks are assumed to run in UTC; unparsable times are
+    archived at ``now``.
+
+    Args:
+        entry: Parsed log entry
+        now: Ingest time (timezone-aware UTC)
+
+    Returns:
+        Timezone-aware UTC timestamp
+    """
+    parsed = entry.timestamp
+    if parsed is None:
+        return now
+
+    if parsed.year == 1900:
+        if "/" in entry.time:
+            try:
+                parsed = parsed.replace(year=now.year)
+            except ValueError:  # Feb 29 printed without a year
+                return now
+            if parsed.replace(tzinfo=UTC) > now + timedelta(days=1):
+                parsed = parsed.replace(year=now.year - 1)
+        else:
+            parsed = datetime.combine(now.date(), parsed.time())
+            if parsed.replace(tzinfo=UTC) > now + timedelta(minutes=5):
+                parsed -= timedelta(days=1)
+
+    return parsed.replace(tzinfo=UTC) if parsed.tzinfo is None else parsed.astimezone(UTC)
+
+
+def parse_search_terms(query: str | None) -> list[str]:
+    """Split a message query into words and quoted phrases."""
+    if not query:
+        return []
+    try:
+        return [term for term in shlex.split(query) if term]
+    except ValueError:
+        # Unbalanced quotes - treat the query as plain whitespace-separated words
+        return query.split()
+
+
+class LogArchiveService:
+    """Service for archiving and searching device logs.
+
+    Example:
+        async with session_factory.session() as session:
+            archive = LogArchiveService(session, settings)
+
+            # Scheduled job (entries from FirewallLogsService.tail_logs,
+            # read through the archive's own tailer)
+            await archive.archive_entries("dev-lab-01", new_entries)
+            await archive.apply_retention()
+
+            # Fleet-wide search
+            result = await archive.search(query="login failure", topics=["system"])
+    """
+
+    def __init__(self, session: AsyncSession, settings: Settings) -> None:
+        """Initialize log archive service.
+
+        Args:
+            session: Database session
+            settings: Application settings
+        """
+        self.session = session
+        self.settings = settings
+        self._search_index_available: bool | None = None
+
+    async def archive_entries(
+        self,
+        device_id: str,
+        entries: Sequence[LogEntry],
+        source: str = "poll",
+        now: datetime | None = None,
+        skip_archived: bool = True,
+    ) -> int:
+        """Store log entries for a device.
+
+        With ``skip_archived``, polled entries older than the newest archived
+        entry of the device are skipped, as are the first entries at that
+        same instant, as many as are already archived for it (the batch is
+        oldest first, so those are the archived ones). This keeps a restart
+        (which empties the in-memory tail cursor and re-reads the whole
+        device buffer) from archiving duplicates without dropping distinct
+        entries that repeat a message within one second.
+
+        Args:
+            device_id: Device identifier
+            entries: Entries oldest first
+            source: Ingest path ("poll" or "syslog")
+            now: Ingest time used to complete partial device times
+            skip_archived: Drop polled entries the archive already holds; pass
+                False when the batch was read after a live tail cursor and
+                holds only unseen entries
+
+        Returns:
+            Number of entries stored
+        """
+        if not entries:
+            return 0
+        now = now or datetime.now(UTC)
+
+        rows: list[dict[str, Any]] = []
+        for entry in entries:
+            logged_at = resolve_log_time(entry, now)
+            rows.append({
+                "device_id": device_id,
+                "day": epoch_day(logged_at),
+                "logged_at": logged_at,
+                "topics": ",".join(entry.topics)[:255],
+                "message": entry.message,
+                "source": source,
+                "_topics": entry.topics,
+            })
+
+        if source == "poll" and skip_archived:
+            rows = await self._drop_archived(device_id, rows)
+
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            await self._insert_chunk(rows[start : start + INSERT_CHUNK_SIZE])
+
+        await self.session.commit()
+        return len(rows)
+
+    async def _drop_archived(
+        self, device_id: str, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Remove rows already covered by the device's newest archived entry."""
+        latest = (
+            await self.session.execute(
+                select(func.max(DeviceLogORM.logged_at)).where(
+                    DeviceLogORM.device_id == device_id
+                )
+            )
+        ).scalar()
+        if latest is None:
+            return rows
+        if latest.tzinfo is None:
+            latest = latest.replace(tzinfo=UTC)
+
+        # Device times have one-second resolution: match entries at the newest
+        # instant by position, not by message, so repeated messages survive
+        already_archived = (
+            await self.session.execute(
+                select(func.count(DeviceLogORM.id)).where(
+                    DeviceLogORM.device_id == device_id,
+                    DeviceLogORM.logged_at == latest,
+                )
+            )
+        ).scalar_one()
+
+        kept: list[dict[str, Any]] = []
+        for row in rows:
+            if row["logged_at"] > latest:
+                kept.append(row)
+            elif row["logged_at"] == latest:
+                if already_archived > 0:
+                    already_archived -= 1
+                else:
+                    kept.append(row)
+        return kept
+
+    async def _insert_chunk(self, rows: list[dict[str, Any]]) -> None:
+        """Insert entry rows and their topic index rows."""
+        if not rows:
+            return
+
+        values = [{key: value for key, value in row.items() if key != "_topics"} for row in rows]
+        table = DeviceLogORM.__table__
+        if self.session.get_bind().dialect.name == "sqlite":
+            # sort_by_parameter_order degrades to one INSERT per row on SQLite.
+            # A single multi-row INSERT assigns ascending rowids in VALUES
+            # order (one writer at a time), so sorted IDs follow the rows.
+            result = await self.session.execute(insert(table).returning(table.c.id), values)
+            log_ids = sorted(result.scalars().all())
+        else:
+            result = await self.session.execute(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True), values
+            )
+            log_ids = list(result.scalars().all())
+
+        topic_rows = [
+            {"log_id": log_id, "topic": topic[:_MAX_TOPIC_LENGTH], "day": row["day"]}
+            for log_id, row in zip(log_ids, rows, strict=True)
+            for topic in dict.fromkeys(row["_topics"])
+        ]
+        if topic_rows:
+            await self.session.execute(insert(DeviceLogTopicORM), topic_rows)
+
+    async def search(
+        self,
+        query: str | None = None,
+        topics: Sequence[str] | None = None,
+        device_ids: Sequence[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """Search archived log entries across devices, newest first.
+
+        Args:
+            query: Words and quoted phrases that must all appear in the message
+            topics: Match entries having any of these topics
+            device_ids: Restrict to these devices (default: all devices)
+            start: Range start (default: 24 hours before ``end``)
+            end: Range end (default: now)
+            limit: Maximum entries returned (max 1000)
+
+        Returns:
+            Dictionary with entries, count, truncated flag and the searched range
+
+        Raises:
+            ValidationError: If limit or the time range is invalid
+        """
+        from routeros_mcp.mcp.errors import ValidationError
+
+        if limit < 1 or limit > MAX_SEARCH_RESULTS:
+            raise ValidationError(
+                f"Search limit must be between 1 and {MAX_SEARCH_RESULTS}",
+                data={"requested_limit": limit, "max_limit": MAX_SEARCH_RESULTS},
+            )
+
+        end = end or datetime.now(UTC)
+        start = start or end - DEFAULT_SEARCH_WINDOW
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=UTC)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=UTC)
+        if start > end:
+            raise ValidationError(
+                "Search start must not be after end",
+                data={"start": start.isoformat(), "end": end.isoformat()},
+            )
+
+        first_day, last_day = epoch_day(start), epoch_day(end)
+        conditions: list[Any] = [
+            DeviceLogORM.day.between(first_day, last_day),
+            DeviceLogORM.logged_at >= start,
+            DeviceLogORM.logged_at <= end,
+        ]
+
+        if device_ids:
+            conditions.append(DeviceLogORM.device_id.in_(list(device_ids)))
+
+        if topics:
+            conditions.append(
+                DeviceLogORM.id.in_(
+                    select(DeviceLogTopicORM.log_id).where(
+                        DeviceLogTopicORM.topic.in_(list(topics)),
+                        DeviceLogTopicORM.day.between(first_day, last_day),
+                    )
+                )
+            )
+
+        terms = parse_search_terms(query)
+        if terms:
+            conditions.extend(await self._message_conditions(terms))
+
+        stmt = (
+            select(DeviceLogORM)
+            .where(*conditions)
+            .order_by(DeviceLogORM.logged_at.desc(), DeviceLogORM.id.desc())
+            .limit(limit + 1)
+        )
+        rows = (await self.session.execute(stmt)).scalars().all()
+        truncated = len(rows) > limit
+
+        entries = [
+            {
+                "id": row.id,
+                "device_id": row.device_id,
+                "time": row.logged_at.isoformat(),
+                "topics": [t for t in row.topics.split(",") if t],
+                "message": row.message,
+                "source": row.source,
+            }
+            for row in rows[:limit]
+        ]
+        return {
+            "entries": entries,
+            "count": len(entries),
+            "truncated": truncated,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "days_scanned": last_day - first_day + 1,
+        }
+
+    async def _message_conditions(self, terms: list[str]) -> list[Any]:
+        """Build message match conditions (full-text index, else ILIKE)."""
+        dialect_name = self.session.get_bind().dialect.name
+        if await self._has_search_index(dialect_name):
+            if dialect_name == "postgresql":
+                return [
+                    literal_column("device_logs.message_vector").op("@@")(
+                        func.plainto_tsquery("simple", " ".join(terms))
+                    )
+                ]
+            # Each term is an FTS5 string (phrase), implicitly AND'ed
+            fts_query = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+            matches = text(
+                "SELECT rowid FROM device_logs_fts WHERE device_logs_fts MATCH :fts_query"
+            ).bindparams(fts_query=fts_query)
+            return [DeviceLogORM.id.in_(matches)]
+
+        # No full-text index yet (migration 41 not applied): scan with ILIKE
+        return [DeviceLogORM.message.ilike(f"%{term}%") for term in terms]
+
+    async def _has_search_index(self, dialect_name: str) -> bool:
+        """Check whether the message full-text index (migration 41) exists.
+
+        Args:
+            dialect_name: SQLAlchemy dialect name
+
+        Returns:
+            True if full-text search can be used
+        """
+        if self._search_index_available is not None:
+            return self._search_index_available
+
+        if dialect_name == "postgresql":
+            stmt = text(
+                "SELECT count(*) FROM information_schema.columns "
+                "WHERE table_name = 'device_logs' AND column_name = 'message_vector'"
+            )
+        elif dialect_name == "sqlite":
+            stmt = text(
+                "SELECT count(*) FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'device_logs_fts'"
+            )
+        else:
+            self._search_index_available = False
+            return False
+
+        result = await self.session.execute(stmt)
+        self._search_index_available = bool(result.scalar())
+        return self._search_index_available
+
+    async def apply_retention(self, now: datetime | None = None) -> int:
+        """Delete archived days older than ``log_archive_retention_days``.
+
+        Args:
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Number of log entries deleted
+        """
+        now = now or datetime.now(UTC)
+        cutoff_day = epoch_day(now - timedelta(days=self.settings.log_archive_retention_days))
+
+        await self.session.execute(
+            delete(DeviceLogTopicORM).where(DeviceLogTopicORM.day < cutoff_day)
+        )
+        result = await self.session.execute(
+            delete(DeviceLogORM).where(DeviceLogORM.day < cutoff_day)
+        )
+        await self.session.commit()
+
+        deleted = int(getattr(result, "rowcount", 0) or 0)
+        logger.debug(
+            "Log archive retention applied",
+            extra={"cutoff_day": cutoff_day, "rows_deleted": deleted},
+        )
+        return deleted
+
+
+__all__ = [
+    "DEFAULT_SEARCH_WINDOW",
+    "MAX_SEARCH_RESULTS",
+    "LogArchiveService",
+    "epoch_day",
+    "parse_search_terms",
+    "resolve_log_time",
+]
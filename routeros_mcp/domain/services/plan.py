@@ -20,6 +20,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import PlanStatus
+from routeros_mcp.domain.services.plan_executor import (
+    SKIPPED_STATUS,
+    PlanExecutor,
+    health_check_gate,
+)
 from routeros_mcp.infra.db.models import AuditEvent as AuditEventModel
 from routeros_mcp.infra.db.models import Device as DeviceModel
 from routeros_mcp.infra.db.models import Plan as PlanModel
@@ -1224,7 +1229,8 @@ class PlanService:
 
         This method implements Phase 4 staged rollout:
         1. Divides devices into batches based on plan.batch_size
-        2. Applies changes to batch devices in parallel
+        2. Applies changes to batch devices in parallel, bounded by
+           plan_apply_max_concurrency (see PlanExecutor)
         3. Runs health checks after each batch completes
         4. Halts rollout if devices are degraded (CPU ≥80%, memory ≥85%)
         5. Triggers rollback if rollback_on_failure=true
@@ -1241,7 +1247,6 @@ class PlanService:
         Raises:
             ValueError: If plan not found, not approved, or validation fails
         """
-        import asyncio
         from routeros_mcp.domain.services.dns_ntp import DNSNTPService
         from routeros_mcp.domain.services.health import HealthService
 
@@ -1338,7 +1343,7 @@ class PlanService:
                 },
             )
 
-            # Define device application function outside the batch loop
+            # Per-device worker run by the shared plan executor
             async def apply_to_device(device_id: str) -> dict[str, Any]:
                 """Apply changes to a single device."""
                 device_result: dict[str, Any] = {
@@ -1402,168 +1407,117 @@ class PlanService:
 
                 return device_result
 
-            # Process batches sequentially
-            for batch_idx, batch in enumerate(batches):
-                batch_number = batch["batch_number"]
-                batch_device_ids = batch["device_ids"]
-
-                logger.info(
-                    f"Processing batch {batch_number}/{len(batches)}",
-                    extra={
-                        "plan_id": plan_id,
-                        "batch_number": batch_number,
-                        "device_count": len(batch_device_ids),
-                    },
-                )
-
-                # Update device statuses to "applying" for this batch
-                for device_id in batch_device_ids:
+            async def mark_batch_applying(event: dict[str, Any]) -> None:
+                """Persist "applying" statuses before each batch starts."""
+                if event["event"] != "batch_started":
+                    return
+                for device_id in event["device_ids"]:
                     device_statuses[device_id] = "applying"
                 plan.device_statuses = device_statuses
                 await self.session.commit()
 
-                # Apply to all devices in batch in parallel
-                apply_tasks = [apply_to_device(device_id) for device_id in batch_device_ids]
-                batch_results = await asyncio.gather(*apply_tasks, return_exceptions=False)
-
-                # Update execution results with batch results
-                for device_result in batch_results:
-                    device_id = device_result["device_id"]
-                    execution_results["devices"][device_id] = device_result
-
-                    if device_result["status"] == "applied":
-                        execution_results["summary"]["applied"] += 1
-                    elif device_result["status"] == "failed":
-                        execution_results["summary"]["failed"] += 1
-
-                # Save device statuses and previous state to plan
+            async def batch_health_gate(batch_device_ids: list[str]) -> list[str]:
+                """Persist batch results, then return degraded/unreachable devices."""
                 plan.device_statuses = device_statuses
                 plan.changes["previous_state"] = previous_state
                 await self.session.commit()
 
-                # Check if any devices failed in this batch
-                failed_devices = [
-                    device_id
-                    for device_id in batch_device_ids
-                    if device_statuses[device_id] == "failed"
-                ]
-
-                if failed_devices:
-                    logger.warning(
-                        f"Batch {batch_number} had {len(failed_devices)} failed devices",
-                        extra={
-                            "plan_id": plan_id,
-                            "batch_number": batch_number,
-                            "failed_devices": failed_devices,
-                        },
-                    )
-                    # Continue to health checks even with failures
-
-                # Run health checks on batch devices
                 logger.info(
-                    f"Running health checks on batch {batch_number}",
-                    extra={"plan_id": plan_id, "batch_number": batch_number},
+                    "Running health checks on batch devices",
+                    extra={"plan_id": plan_id, "device_ids": batch_device_ids},
                 )
+                unhealthy: list[str] = await health_check_gate(health_service)(batch_device_ids)
+                return unhealthy
+
+            # Batches run sequentially; devices within a batch run in parallel,
+            # bounded by plan_apply_max_concurrency
+            executor = PlanExecutor.from_settings(
+                self.settings,
+                health_gate=batch_health_gate,
+                on_progress=mark_batch_applying,
+                batch_pause_seconds=plan.pause_seconds_between_batches,
+            )
+            execution = await executor.run(
+                [batch["device_ids"] for batch in batches], apply_to_device
+            )
 
-                health_results = await health_service.run_batch_health_checks(
-                    device_ids=batch_device_ids,
-                    cpu_threshold=80.0,
-                    memory_threshold=85.0,
+            for device_result in execution.device_results:
+                if device_result["status"] == SKIPPED_STATUS:
+                    continue
+                execution_results["devices"][device_result["device_id"]] = device_result
+                if device_result["status"] == "applied":
+                    execution_results["summary"]["applied"] += 1
+                elif device_result["status"] == "failed":
+                    execution_results["summary"]["failed"] += 1
+            execution_results["batches_completed"] = execution.batches_completed
+            plan.device_statuses = device_statuses
+            plan.changes["previous_state"] = previous_state
+
+            if execution.halted:
+                # Health gate or failure threshold stopped the rollout
+                logger.error(
+                    f"Staged rollout halted for plan {plan_id}: {execution.halt_reason}",
+                    extra={
+                        "plan_id": plan_id,
+                        "batches_completed": execution.batches_completed,
+                        "degraded_devices": execution.unhealthy_devices,
+                    },
                 )
 
-                # Check for degraded or unreachable devices
-                degraded_devices = [
-                    device_id
-                    for device_id, health in health_results.items()
-                    if health.status in ["degraded", "unreachable"]
-                ]
-
-                if degraded_devices:
-                    # Health checks failed - halt rollout
-                    logger.error(
-                        f"Health checks failed for {len(degraded_devices)} devices in batch {batch_number}",
-                        extra={
-                            "plan_id": plan_id,
-                            "batch_number": batch_number,
-                            "degraded_devices": degraded_devices,
-                        },
-                    )
+                execution_results["status"] = "halted"
+                execution_results["halt_reason"] = execution.halt_reason
 
-                    execution_results["status"] = "halted"
-                    execution_results["halt_reason"] = (
-                        f"Health checks failed for devices: {', '.join(degraded_devices)}"
+                # Trigger rollback if enabled (before setting plan to FAILED)
+                if plan.rollback_on_failure:
+                    logger.info(
+                        f"Triggering rollback for plan {plan_id}",
+                        extra={"plan_id": plan_id, "reason": "health_check_failed"},
                     )
-                    execution_results["batches_completed"] = batch_number
 
-                    # Trigger rollback if enabled (before setting plan to FAILED)
-                    if plan.rollback_on_failure:
-                        logger.info(
-                            f"Triggering rollback for plan {plan_id}",
-                            extra={"plan_id": plan_id, "reason": "health_check_failed"},
+                    try:
+                        rollback_results = await self.rollback_plan(
+                            plan_id=plan_id,
+                            reason="health_check_failed",
+                            triggered_by=applied_by,
+                            dns_ntp_service=dns_ntp_service,
                         )
 
-                        try:
-                            rollback_results = await self.rollback_plan(
-                                plan_id=plan_id,
-                                reason="health_check_failed",
-                                triggered_by=applied_by,
-                                dns_ntp_service=dns_ntp_service,
-                            )
-
-                            # Update execution results with rollback info
-                            execution_results["rollback"] = rollback_results
-                            execution_results["summary"]["rolled_back"] = rollback_results[
-                                "summary"
-                            ]["success"]
+                        # Update execution results with rollback info
+                        execution_results["rollback"] = rollback_results
+                        execution_results["summary"]["rolled_back"] = rollback_results[
+                            "summary"
+                        ]["success"]
 
-                        except Exception as rollback_error:
-                            logger.error(
-                                f"Rollback failed for plan {plan_id}: {rollback_error}",
-                                extra={"plan_id": plan_id},
-                            )
-                            execution_results["rollback_error"] = str(rollback_error)
-                            # Ensure plan does not remain in EXECUTING state if rollback fails
-                            plan.status = PlanStatus.FAILED.value
-                            await self.session.commit()
-                    else:
-                        # Update plan status to failed (only if not rolling back)
+                    except Exception as rollback_error:
+                        logger.error(
+                            f"Rollback failed for plan {plan_id}: {rollback_error}",
+                            extra={"plan_id": plan_id},
+                        )
+                        execution_results["rollback_error"] = str(rollback_error)
+                        # Ensure plan does not remain in EXECUTING state if rollback fails
                         plan.status = PlanStatus.FAILED.value
                         await self.session.commit()
-
-                    # Log audit event for halted execution
-                    self._log_audit_event(
-                        action="PLAN_EXECUTION_HALTED",
-                        user_sub=applied_by,
-                        plan_id=plan_id,
-                        tool_name=plan.tool_name,
-                        result="FAILURE",
-                        error_message=execution_results["halt_reason"],
-                        metadata={
-                            "batches_completed": batch_number,
-                            "degraded_devices": degraded_devices,
-                        },
-                    )
+                else:
+                    # Update plan status to failed (only if not rolling back)
+                    plan.status = PlanStatus.FAILED.value
                     await self.session.commit()
 
-                    return execution_results
-
-                # All devices healthy - mark batch as complete
-                execution_results["batches_completed"] = batch_number
-
-                logger.info(
-                    f"Batch {batch_number} completed successfully",
-                    extra={"plan_id": plan_id, "batch_number": batch_number},
+                # Log audit event for halted execution
+                self._log_audit_event(
+                    action="PLAN_EXECUTION_HALTED",
+                    user_sub=applied_by,
+                    plan_id=plan_id,
+                    tool_name=plan.tool_name,
+                    result="FAILURE",
+                    error_message=execution_results["halt_reason"],
+                    metadata={
+                        "batches_completed": execution.batches_completed,
+                        "degraded_devices": execution.unhealthy_devices,
+                    },
                 )
+                await self.session.commit()
 
-                # Pause between batches (except after last batch)
-                if batch_idx < len(batches) - 1:
-                    pause_seconds = plan.pause_seconds_between_batches
-                    if pause_seconds > 0:
-                        logger.info(
-                            f"Pausing {pause_seconds}s before next batch",
-                            extra={"plan_id": plan_id, "pause_seconds": pause_seconds},
-                        )
-                        await asyncio.sleep(pause_seconds)
+                return execution_results
 
             # All batches completed successfully
             execution_results["status"] = "completed"
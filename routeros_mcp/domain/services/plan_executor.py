@@ -0,0 +1,386 @@
+"""Shared execution engine for plan apply workflows.
+
+Every plan type (firewall, routing, wireless, bridge, DHCP, DNS/NTP rollout)
+applies changes per device: snapshot, apply, verify, optionally roll back.
+PlanExecutor runs those per-device workers across a device list with:
+
+- Bounded parallelism (asyncio.Semaphore) instead of a sequential loop
+- Batches with an optional health gate evaluated after each batch
+- A fail-fast threshold that stops scheduling new devices
+- Per-device progress callbacks for streaming status to clients
+
+The engine is transport-agnostic: workers and gates are plain coroutines,
+so MCP tools and PlanService share the same scheduling semantics.
+
+Example:
+    executor = PlanExecutor.from_settings(
+        settings,
+        health_gate=health_check_gate(HealthService(session, settings)),
+        on_progress=reporter,
+    )
+    result = await executor.run(device_ids, apply_device)
+    if result.halted:
+        logger.warning(result.halt_reason)
+"""
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from routeros_mcp.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Device result statuses that count as a successful apply
+SUCCESS_STATUSES = frozenset({"success", "applied"})
+
+# Status assigned to devices never started because execution halted. Distinct
+# from worker statuses such as "skipped" (DHCP mock apply), which count as
+# attempted-but-not-successful.
+SKIPPED_STATUS = "not_attempted"
+
+DeviceWorker = Callable[[str], Awaitable[dict[str, Any]]]
+HealthGate = Callable[[list[str]], Awaitable[list[str]]]
+ProgressCallback = Callable[[dict[str, Any]], Awaitable[None] | None]
+
+
+def split_batches(device_ids: Sequence[str], batch_size: int) -> list[list[str]]:
+    """Split device IDs into ordered batches.
+
+    Args:
+        device_ids: Device identifiers in rollout order
+        batch_size: Devices per batch (0 or less: a single batch)
+
+    Returns:
+        List of device ID batches
+    """
+    if batch_size <= 0:
+        return [list(device_ids)] if device_ids else []
+    return [list(device_ids[i : i + batch_size]) for i in range(0, len(device_ids), batch_size)]
+
+
+def context_progress_reporter(ctx: Any) -> ProgressCallback | None:
+    """Adapt an MCP request context to a PlanExecutor progress callback.
+
+    Args:
+        ctx: FastMCP Context (or any object with ``report_progress``), or None
+
+    Returns:
+        Progress callback forwarding device events as MCP progress
+        notifications, or None when no context is available
+    """
+    if ctx is None:
+        return None
+
+    async def report(event: dict[str, Any]) -> None:
+        if event["event"] != "device_completed":
+            return
+        await ctx.report_progress(
+            progress=event["completed"],
+            total=event["total"],
+            message=f"{event['device_id']}: {event['status']}",
+        )
+
+    return report
+
+
+def health_check_gate(
+    health_service: Any,
+    cpu_threshold: float = 80.0,
+    memory_threshold: float = 85.0,
+) -> HealthGate:
+    """Health gate backed by HealthService batch health checks.
+
+    Args:
+        health_service: HealthService (or any object with
+            ``run_batch_health_checks``)
+        cpu_threshold: CPU usage percentage above which a device is degraded
+        memory_threshold: Memory usage percentage above which a device is degraded
+
+    Returns:
+        Gate returning the batch devices reported degraded or unreachable
+    """
+
+    async def gate(device_ids: list[str]) -> list[str]:
+        health_results = await health_service.run_batch_health_checks(
+            device_ids=device_ids,
+            cpu_threshold=cpu_threshold,
+            memory_threshold=memory_threshold,
+        )
+        return [
+            device_id
+            for device_id, health in health_results.items()
+            if health.status in ("degraded", "unreachable")
+        ]
+
+    return gate
+
+
+@dataclass
+class PlanExecutionResult:
+    """Outcome of a PlanExecutor run.
+
+    Attributes:
+        device_results: Per-device result dicts in input order
+        batches_completed: Batches whose devices finished applying
+        batches_total: Number of batches scheduled
+        halted: Whether execution stopped before all devices were attempted
+        halt_reason: Human-readable reason when halted
+        unhealthy_devices: Devices reported by the health gate
+    """
+
+    device_results: list[dict[str, Any]] = field(default_factory=list)
+    batches_completed: int = 0
+    batches_total: int = 0
+    halted: bool = False
+    halt_reason: str | None = None
+    unhealthy_devices: list[str] = field(default_factory=list)
+
+    @property
+    def successful_devices(self) -> list[str]:
+        """Devices whose worker reported a success status."""
+        return [r["device_id"] for r in self.device_results if r["status"] in SUCCESS_STATUSES]
+
+    @property
+    def failed_devices(self) -> list[str]:
+        """Devices that were attempted but did not succeed."""
+        return [
+            r["device_id"]
+            for r in self.device_results
+            if r["status"] not in SUCCESS_STATUSES and r["status"] != SKIPPED_STATUS
+        ]
+
+    @property
+    def skipped_devices(self) -> list[str]:
+        """Devices never attempted because execution halted."""
+        return [r["device_id"] for r in self.device_results if r["status"] == SKIPPED_STATUS]
+
+    def summary(self) -> dict[str, Any]:
+        """Compact counts for tool metadata."""
+        return {
+            "total": len(self.device_results),
+            "successful": len(self.successful_devices),
+            "failed": len(self.failed_devices),
+            "skipped": len(self.skipped_devices),
+            "batches_completed": self.batches_completed,
+            "batches_total": self.batches_total,
+            "halted": self.halted,
+            "halt_reason": self.halt_reason,
+        }
+
+
+class PlanExecutor:
+    """Concurrency-bounded, batch-gated executor for per-device plan workers.
+
+    Devices within a batch run in parallel, at most ``max_concurrency`` at a
+    time. After each batch the optional health gate receives the devices
+    attempted in that batch and returns any that are unhealthy; a non-empty
+    answer halts the rollout. Independently, once ``max_failures`` devices
+    have failed no new devices are started. Devices already in flight always
+    run to completion so their own snapshot/rollback handling is not cut off.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        batch_size: int = 0,
+        max_failures: int = 0,
+        health_gate: HealthGate | None = None,
+        on_progress: ProgressCallback | None = None,
+        batch_pause_seconds: float = 0,
+    ) -> None:
+        """Initialize plan executor.
+
+        Args:
+            max_concurrency: Maximum devices applied at the same time
+            batch_size: Devices per batch when batches are derived from a
+                flat device list (0: a single batch)
+            max_failures: Failed devices that halt execution (0: never)
+            health_gate: Async callable returning unhealthy device IDs
+                for a completed batch
+            on_progress: Callback receiving progress event dicts
+            batch_pause_seconds: Pause between batches
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.max_failures = max_failures
+        self.health_gate = health_gate
+        self.on_progress = on_progress
+        self.batch_pause_seconds = batch_pause_seconds
+
+    @classmethod
+    def from_settings(cls, settings: Settings, **overrides: Any) -> "PlanExecutor":
+        """Create an executor using the plan_apply_* settings.
+
+        Args:
+            settings: Application settings
+            **overrides: Constructor arguments taking precedence over settings
+
+        Returns:
+            Configured PlanExecutor
+        """
+        options: dict[str, Any] = {
+            "max_concurrency": settings.plan_apply_max_concurrency,
+            "batch_size": settings.plan_apply_batch_size,
+            "max_failures": settings.plan_apply_max_failures,
+        }
+        options.update(overrides)
+        return cls(**options)
+
+    async def run(
+        self,
+        devices: Sequence[str] | Sequence[Sequence[str]],
+        worker: DeviceWorker,
+    ) -> PlanExecutionResult:
+        """Apply a worker to every device, batch by batch.
+
+        Args:
+            devices: Flat device ID list (split using batch_size) or
+                pre-computed batches of device IDs
+            worker: Async callable applying the plan to one device and
+                returning a result dict with at least a ``status`` key
+
+        Returns:
+            PlanExecutionResult with per-device results in input order
+        """
+        if devices and not isinstance(devices[0], str):
+            batches = [list(batch) for batch in devices]
+        else:
+            batches = split_batches(list(devices), self.batch_size)  # type: ignore[arg-type]
+
+        all_device_ids = [device_id for batch in batches for device_id in batch]
+        total = len(all_device_ids)
+        results: dict[str, dict[str, Any]] = {}
+        execution = PlanExecutionResult(batches_total=len(batches))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        failures = 0
+
+        async def run_device(device_id: str, batch_number: int) -> None:
+            nonlocal failures
+            async with semaphore:
+                if execution.halted:
+                    return
+                try:
+                    device_result = await worker(device_id)
+                except Exception as e:
+                    logger.error(
+                        f"Plan worker failed for device {device_id}: {e}",
+                        exc_info=True,
+                        extra={"device_id": device_id},
+                    )
+                    device_result = {"device_id": device_id, "status": "failed", "error": str(e)}
+
+            device_result.setdefault("device_id", device_id)
+            results[device_id] = device_result
+
+            if device_result["status"] not in SUCCESS_STATUSES:
+                failures += 1
+                if self.max_failures and failures >= self.max_failures and not execution.halted:
+                    execution.halted = True
+                    execution.halt_reason = (
+                        f"Failure threshold reached: {failures} device(s) failed "
+                        f"(max_failures={self.max_failures})"
+                    )
+
+            await self._emit(
+                {
+                    "event": "device_completed",
+                    "device_id": device_id,
+                    "status": device_result["status"],
+                    "batch": batch_number,
+                    "completed": len(results),
+                    "total": total,
+                }
+            )
+
+        for batch_index, batch in enumerate(batches):
+            batch_number = batch_index + 1
+            if execution.halted:
+                break
+
+            logger.info(
+                f"Executing plan batch {batch_number}/{len(batches)}",
+                extra={"batch_number": batch_number, "device_count": len(batch)},
+            )
+            await self._emit(
+                {
+                    "event": "batch_started",
+                    "batch": batch_number,
+                    "device_ids": list(batch),
+                    "completed": len(results),
+                    "total": total,
+                }
+            )
+            await asyncio.gather(*(run_device(device_id, batch_number) for device_id in batch))
+            execution.batches_completed = batch_number
+
+            if self.health_gate is not None and not execution.halted:
+                # Failed devices are checked too: a partial apply can still
+                # leave a device degraded
+                attempted = [device_id for device_id in batch if device_id in results]
+                unhealthy = await self.health_gate(attempted) if attempted else []
+                if unhealthy:
+                    execution.halted = True
+                    execution.unhealthy_devices = list(unhealthy)
+                    execution.halt_reason = (
+                        f"Health checks failed for devices: {', '.join(unhealthy)}"
+                    )
+
+            await self._emit(
+                {
+                    "event": "batch_completed",
+                    "batch": batch_number,
+                    "completed": len(results),
+                    "total": total,
+                    "halted": execution.halted,
+                }
+            )
+
+            if (
+                not execution.halted
+                and batch_index < len(batches) - 1
+                and self.batch_pause_seconds > 0
+            ):
+                await asyncio.sleep(self.batch_pause_seconds)
+
+        for device_id in all_device_ids:
+            execution.device_results.append(
+                results.get(device_id)
+                or {
+                    "device_id": device_id,
+                    "status": SKIPPED_STATUS,
+                    "message": f"Not attempted: {execution.halt_reason}",
+                }
+            )
+
+        return execution
+
+    async def _emit(self, event: dict[str, Any]) -> None:
+        """Deliver a progress event, never letting callback errors abort a rollout."""
+        if self.on_progress is None:
+            return
+        try:
+            outcome = self.on_progress(event)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.warning(f"Plan progress callback failed: {e}")
+
+
+__all__ = [
+    "SKIPPED_STATUS",
+    "SUCCESS_STATUSES",
+    "PlanExecutionResult",
+    "PlanExecutor",
+    "context_progress_reporter",
+    "health_check_gate",
+    "split_batches",
+]
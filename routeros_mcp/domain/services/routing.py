@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.routeros.cli_parser import PrintRecord, iter_print_records
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
@@ -19,6 +20,28 @@ from routeros_mcp.infra.routeros.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Route flags, including RouterOS v6 lower-case ones ("DAc", "ADo")
+ROUTE_FLAG_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz+*"
+
+# Lower-case column names some builds print instead of a "#" header row
+_ROUTE_HEADER_TOKENS = frozenset(
+    {"dst-address", "pref-src", "gateway", "distance", "routing-table", "routingtable"}
+)
+
+
+def _is_route_header(record: PrintRecord) -> bool:
+    """Whether a parsed row is really a column header such as ``dst-address gateway``."""
+    seen = False
+    for token in (record.flags, *record.tokens):
+        for piece in token.replace("/", " ").split():
+            word = piece.strip(",:").lower()
+            if not word:
+                continue
+            if word not in _ROUTE_HEADER_TOKENS:
+                return False
+            seen = True
+    return seen
+
 
 class RoutingService:
     """Service for RouterOS routing operations.
@@ -175,7 +198,7 @@ class RoutingService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/route/print")
+            output = await ssh_client.execute("/ip/route/print terse without-paging")
             routes_list = self._parse_route_print_output(output)
 
             # Analyze routes by type
@@ -204,130 +227,81 @@ class RoutingService:
 
     @staticmethod
     def _parse_route_print_output(output: str) -> list[dict[str, Any]]:
-        """Parse /ip/route/print output."""
-        routes: list[dict[str, Any]] = []
-
-        header_tokens = {
-            "dst-address",
-            "pref-src",
-            "gateway",
-            "distance",
-            "routing-table",
-            "routingtable",
-        }
-
-        def _looks_like_header(parts: list[str]) -> bool:
-            normalized: list[str] = []
-            for token in parts:
-                token_clean = token.strip().strip(",").strip(":")
-                if not token_clean:
-                    continue
-                token_clean = token_clean.replace("/", " ")
-                for piece in token_clean.split():
-                    piece_clean = piece.strip().strip(",").strip(":").lower()
-                    if piece_clean:
-                        normalized.append(piece_clean)
+        """Parse /ip/route/print output.
 
-            return bool(normalized) and all(piece in header_tokens for piece in normalized)
+        Handles ``print terse`` rows (``routing-table`` on v7, ``routing-mark``
+        on v6):
+         0 As  dst-address=0.0.0.0/0 routing-table=main gateway=10.0.0.1 distance=1
 
-        lines = output.strip().split("\n")
+        and the standard table format, where columns are identified by position.
+        """
+        routes: list[dict[str, Any]] = []
         route_counter = 0  # Generate synthetic IDs if not in output
-        for line in lines:
-            stripped = line.strip()
-            if (
-                not stripped
-                or stripped.startswith("Flags:")
-                or stripped.startswith("#")
-                or stripped.lower().startswith("columns:")
-                or stripped.lower().startswith("dst-address")
-                or (
-                    "distance" in stripped.lower()
-                    and "gateway" in stripped.lower()
-                    and "/" not in stripped
-                )
-            ):
-                continue
-
-            parts = line.split()
-            if not parts:
-                continue
 
-            if _looks_like_header(parts):
-                continue
-
-            try:
-                route_id = ""
-                flags = ""
-                idx = 0
-
-                parts_lower0 = parts[0].lower()
-                if parts_lower0 in {"gateway", "dst-address", "distance", "routing-table"}:
-                    continue
-
-                # Pattern A: numeric or * index followed by optional flags
-                if parts[0][0].isdigit() or parts[0].startswith("*"):
-                    route_id = parts[0]
-                    idx = 1
-                    if idx < len(parts) and any(ch.isalpha() for ch in parts[idx]):
-                        flags = parts[idx]
-                        idx += 1
-                # Pattern B: flags-only (common in compact /ip/route/print)
-                elif any(ch.isalpha() for ch in parts[0]) and "/" not in parts[0]:
-                    flags = parts[0]
-                    idx = 1
-
-                # Generate synthetic ID if not present
-                if not route_id:
-                    route_id = f"*{route_counter}"
-                    route_counter += 1
-                elif parts[0][0].isdigit() or parts[0].startswith("*"):
-                    # Extract numeric part for counter
-                    try:
-                        num = int(parts[0].lstrip("*"))
-                        route_counter = max(route_counter, num + 1)
-                    except ValueError:
-                        pass
-
-                # Now expect: dst-address gateway [routing-table] distance
-                if len(parts) <= idx + 1:
+        # Compact /ip/route/print rows may omit the item number ("DAc 10.0.0.0/24 ...")
+        for record in iter_print_records(
+            output, flag_chars=ROUTE_FLAG_CHARS, multiline=False, require_id=False
+        ):
+            if record.values:
+                if "dst-address" not in record.values:
                     continue
-
-                dst_address = parts[idx]
-
-                # Take tokens after dst for further parsing
-                remainder = parts[idx + 1 :]
-                distance_token = remainder[-1] if remainder else "0"
-                try:
-                    distance_val = int(distance_token)
-                    remainder = remainder[:-1]
-                except ValueError:
-                    distance_val = 0
-
-                routing_table = ""
-                # If we have multiple tokens remaining after stripping distance,
-                # RouterOS often prints: <gateway> <routing-table>. When only a
-                # single token remains, treat it as the gateway even if it
-                # contains letters (e.g., gateway=ether1).
-                if len(remainder) >= 2 and any(ch.isalpha() for ch in remainder[-1]):
-                    routing_table = remainder[-1]
-                    remainder = remainder[:-1]
-
-                gateway = remainder[-1] if remainder else ""
-
+                route_id = record.id or f"*{route_counter}"
+                route_counter += 1
+                flags = record.flags.upper()
+                distance = record.values.get("distance", "")
                 routes.append({
                     "id": route_id,
-                    "dst_address": dst_address,
-                    "gateway": gateway,
-                    "routing_table": routing_table,
-                    "distance": distance_val,
-                    "static": "S" in flags or "s" in flags,
-                    "dynamic": "D" in flags or "d" in flags,
-                    "connected": "C" in flags or "c" in flags,
+                    "dst_address": record.values["dst-address"],
+                    "gateway": record.values.get("gateway", ""),
+                    "routing_table": record.values.get(
+                        "routing-table", record.values.get("routing-mark", "")
+                    ),
+                    "distance": int(distance) if distance.isdigit() else 0,
+                    "static": "S" in flags,
+                    "dynamic": "D" in flags,
+                    "connected": "C" in flags,
                 })
-            except (IndexError, ValueError) as e:  # pragma: no cover
-                logger.debug(f"Failed to parse route line: {line}", exc_info=e)
                 continue
 
+            if _is_route_header(record):
+                continue
+
+            # Now expect: dst-address gateway [routing-table] distance
+            if len(record.tokens) < 2:
+                continue
+
+            route_id = record.id
+            if not route_id:
+                route_id = f"*{route_counter}"
+                route_counter += 1
+            elif route_id.lstrip("*").isdigit():
+                route_counter = max(route_counter, int(route_id.lstrip("*")) + 1)
+
+            dst_address, *remainder = record.tokens
+            distance_val = 0
+            if remainder and remainder[-1].isdigit():
+                distance_val = int(remainder.pop())
+
+            routing_table = ""
+            # If we have multiple tokens remaining after stripping distance,
+            # RouterOS often prints: <gateway> <routing-table>. When only a
+            # single token remains, treat it as the gateway even if it
+            # contains letters (e.g., gateway=ether1).
+            if len(remainder) >= 2 and any(ch.isalpha() for ch in remainder[-1]):
+                routing_table = remainder.pop()
+
+            flags = record.flags.upper()
+            routes.append({
+                "id": route_id,
+                "dst_address": dst_address,
+                "gateway": remainder[-1] if remainder else "",
+                "routing_table": routing_table,
+                "distance": distance_val,
+                "static": "S" in flags,
+                "dynamic": "D" in flags,
+                "connected": "C" in flags,
+            })
+
         return routes
 
     async def get_route(
@@ -425,7 +399,7 @@ class RoutingService:
         ssh_client = await self.device_service.get_ssh_client(device_id)
 
         try:
-            output = await ssh_client.execute("/ip/route/print")
+            output = await ssh_client.execute("/ip/route/print terse without-paging")
             routes = self._parse_route_print_output(output)
 
             # Try to match by ID first
@@ -31,6 +31,7 @@ from routeros_mcp.infra.observability import metrics
 from routeros_mcp.infra.routeros.exceptions import RouterOSNetworkError
 from routeros_mcp.infra.routeros.rest_client import RouterOSRestClient
 from routeros_mcp.infra.routeros.ssh_client import RouterOSSSHClient
+from routeros_mcp.infra.routeros.ssh_pool import get_ssh_pool
 from routeros_mcp.mcp.errors import ValidationError
 from routeros_mcp.security.crypto import decrypt_string
 
@@ -273,24 +274,18 @@ class SnapshotService:
             duration=capture_duration,
         )
         
-        metrics.snapshot_capture_total.labels(
+        metrics.record_snapshot_result(
             device_id=device.id,
             kind=kind,
             source=source or "unknown",
             status="success",
-        ).inc()
-
-        metrics.snapshot_size_bytes.labels(
+        )
+        metrics.record_snapshot_size(
             device_id=device.id,
             kind=kind,
-        ).observe(len(config_bytes))
-
-        # Observe compression ratio (compressed size / original size) when original size is non-zero
-        if len(config_bytes) > 0:
-            metrics.snapshot_compression_ratio.labels(
-                device_id=device.id,
-                kind=kind,
-            ).observe(len(compressed_data) / len(config_bytes))
+            size_bytes=len(config_bytes),
+            compressed_size_bytes=len(compressed_data),
+        )
 
         # Update snapshot age (0 seconds for newly captured)
         metrics.update_snapshot_age(
@@ -521,6 +516,7 @@ class SnapshotService:
             username=username,
             password=password,
             timeout_seconds=60.0,  # Exports can take time on large configs
+            pool=get_ssh_pool(),
         )
 
         try:
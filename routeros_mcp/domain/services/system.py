@@ -14,6 +14,7 @@ from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import SystemResource
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.utils import parse_routeros_uptime
+from routeros_mcp.infra.routeros.cli_parser import iter_value_blocks, parse_key_value_output
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
@@ -289,17 +290,7 @@ class SystemService:
     @staticmethod
     def _parse_clock_print_output(output: str) -> dict[str, Any]:
         """Parse /system/clock/print output (key: value format)."""
-        result = {}
-        for line in output.splitlines():
-            line = line.strip()
-            if ':' not in line:
-                continue
-            key, _, value = line.partition(':')
-            key = key.strip()
-            value = value.strip()
-            if key and value:
-                result[key] = value
-        return result
+        return dict(parse_key_value_output(output, keep_empty=False))
 
     @staticmethod
     def _parse_as_value_blocks(output: str) -> list[dict[str, Any]]:
@@ -318,82 +309,7 @@ class SystemService:
         key2=value4
         """
 
-        def _strip_quotes(value: str) -> str:
-            v = value.strip()
-            if len(v) >= 2 and v[0] == '"' and v[-1] == '"':
-                return v[1:-1]
-            return v
-
-        def _parse_kv_pairs_from_line(line: str) -> dict[str, str]:
-            """Parse a single RouterOS CLI line that may contain multiple key=value pairs.
-
-            RouterOS frequently emits one of these shapes:
-            - multi-line: `key=value` per line (one record)
-            - single-line per row: `0 name=routeros version=7.20.6 build-time=2025-12-04 12:00:39`
-
-            Values may contain spaces (e.g., build-time), so we treat tokens without
-            `=` as continuations of the previous value.
-            """
-            pairs: dict[str, str] = {}
-            tokens = line.strip().split()
-            current_key: str | None = None
-            current_val_tokens: list[str] = []
-
-            def flush_pair() -> None:
-                nonlocal current_key, current_val_tokens
-                if current_key is None:
-                    return
-                pairs[current_key] = _strip_quotes(" ".join(current_val_tokens).strip())
-                current_key = None
-                current_val_tokens = []
-
-            for tok in tokens:
-                if "=" in tok:
-                    # Start of a new key=value; close previous if present.
-                    flush_pair()
-                    key, val = tok.split("=", 1)
-                    # Ignore positional index tokens which sometimes appear as `0`.
-                    if key.isdigit():
-                        continue
-                    current_key = key
-                    current_val_tokens = [val]
-                else:
-                    if current_key is not None:
-                        current_val_tokens.append(tok)
-
-            flush_pair()
-            return pairs
-
-        blocks: list[dict[str, Any]] = []
-        current: dict[str, Any] = {}
-
-        def flush_current() -> None:
-            nonlocal current
-            if current:
-                blocks.append(current)
-                current = {}
-
-        for raw_line in output.splitlines():
-            line = raw_line.strip()
-            if not line:
-                flush_current()
-                continue
-            if "=" not in line:
-                continue
-
-            kvs = _parse_kv_pairs_from_line(line)
-            if not kvs:
-                continue
-
-            current.update(kvs)
-
-            # Heuristic: if a single line produced multiple key/value pairs,
-            # it's very likely a complete record (e.g., one table row).
-            if len(kvs) > 1:
-                flush_current()
-
-        flush_current()
-        return blocks
+        return list(iter_value_blocks(output))
 
     @staticmethod
     def _parse_system_package_print_table(output: str) -> list[dict[str, Any]]:
@@ -496,8 +412,15 @@ class SystemService:
         ssh_client = await self.device_service.get_ssh_client(device.id)
 
         try:
-            # Use standard print format (key: value) consistently
-            output = await ssh_client.execute("/system/resource/print")
+            # Resource and identity in one CLI session when possible
+            identity_output: str | None = None
+            try:
+                output, identity_output = await ssh_client.execute_many(
+                    ["/system/resource/print", "/system/identity/print"]
+                )
+            except Exception:
+                # Use standard print format (key: value) consistently
+                output = await ssh_client.execute("/system/resource/print")
             resource_raw = self._parse_ssh_resource_output(output)
             resource_data = self._coerce_resource_values(resource_raw)
 
@@ -507,7 +430,8 @@ class SystemService:
             # Try to retrieve identity over SSH; fall back to stored device identity
             identity = device.system_identity or "Unknown"
             try:
-                identity_output = await ssh_client.execute("/system/identity/print")
+                if identity_output is None:
+                    identity_output = await ssh_client.execute("/system/identity/print")
                 identity_kv = self._parse_ssh_kv_output(identity_output)
                 identity = identity_kv.get("name", identity) or device.system_identity or "Unknown"
             except Exception as identity_exc:  # pragma: no cover - best-effort
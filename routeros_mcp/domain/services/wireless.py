@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.routeros.cli_parser import PrintRecord, iter_print_records
 from routeros_mcp.infra.routeros.exceptions import (
     RouterOSClientError,
     RouterOSNetworkError,
@@ -21,6 +22,9 @@ from routeros_mcp.infra.routeros.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Flags printed after the row number in CAPsMAN tables
+_CAPSMAN_FLAG_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
 
 class WirelessService:
     """Service for RouterOS wireless operations.
@@ -339,11 +343,11 @@ class WirelessService:
             # RouterOS can expose WiFi either via legacy 'wireless' package or the newer 'wifi' package.
             # Try legacy first for backwards compatibility, then fall back to 'wifi'.
             try:
-                output = await ssh_client.execute("/interface/wireless/print")
+                output = await ssh_client.execute("/interface/wireless/print terse without-paging")
                 return self._parse_wireless_print_output(output)
             except Exception as e1:
                 try:
-                    output = await ssh_client.execute("/interface/wifi/print")
+                    output = await ssh_client.execute("/interface/wifi/print terse without-paging")
                     return self._parse_wireless_print_output(output)
                 except Exception as e2:
                     # If wireless is not present on the device, treat as no interfaces.
@@ -358,77 +362,65 @@ class WirelessService:
     def _parse_wireless_print_output(output: str) -> list[dict[str, Any]]:
         """Parse /interface/wireless/print output into interface list.
 
-        Handles RouterOS standard table format with flags in left margin.
+        Handles ``print terse`` output (legacy ``wireless`` and v7 ``wifi``
+        property names) and the standard table format with flags in left margin.
         """
         interfaces: list[dict[str, Any]] = []
 
-        # Skip header lines
-        lines = output.strip().split("\n")
-        for line in lines:
-            # Skip header/metadata lines
-            if (
-                not line.strip()
-                or line.startswith("Flags:")
-                or line.startswith("Columns:")
-                or line.startswith("#")
-            ):
+        for record in iter_print_records(output, flag_chars="DRSXdrsx", multiline=False):
+            if record.values:
+                interfaces.append(WirelessService._wireless_interface_from_values(record))
                 continue
 
-            # Parse data lines (start with number, potentially with flags)
-            parts = line.split()
-            if not parts or not parts[0][0].isdigit():
-                continue
-
-            try:
-                # Format: [id] [flags*] [name] [ssid] [frequency] [band] ...
-                idx = 0
-
-                # First part is always the ID
-                iface_id = parts[0]
-                idx = 1
-
-                # Check if second part contains flags
-                flags = ""
-                if len(parts) > 1 and all(c in "DRSXdrsx " for c in parts[1]):
-                    flags = parts[1].replace(" ", "")
-                    idx = 2
-
-                # Extract fields
-                if len(parts) > idx:
-                    name = parts[idx] if idx < len(parts) else ""
-                    ssid = parts[idx + 1] if idx + 1 < len(parts) else ""
-                    frequency = parts[idx + 2] if idx + 2 < len(parts) else ""
-                    band = parts[idx + 3] if idx + 3 < len(parts) else ""
-
-                    # Determine running and disabled status from flags
-                    # R = running, X = disabled, D = dynamic
-                    running = "R" in flags
-                    disabled = "X" in flags
-
-                    interfaces.append({
-                        "id": iface_id,
-                        "name": name,
-                        "ssid": ssid,
-                        "frequency": frequency,
-                        "band": band,
-                        "channel_width": "",
-                        "tx_power": "",
-                        "tx_power_mode": "",
-                        "mode": "",
-                        "running": running,
-                        "disabled": disabled,
-                        "comment": "",
-                        "mac_address": "",
-                        "registered_clients": 0,
-                        "authenticated_clients": 0,
-                    })
-            except (IndexError, ValueError) as e:
-                # Skip lines that don't parse properly
-                logger.debug(f"Failed to parse wireless interface line: {line}", exc_info=e)
+            # Format: [name] [ssid] [frequency] [band] ...
+            if not record.tokens:
                 continue
+            name, ssid, frequency, band = (record.tokens + ["", "", ""])[:4]
+
+            # Determine running and disabled status from flags
+            # R = running, X = disabled, D = dynamic
+            interfaces.append({
+                "id": record.id,
+                "name": name,
+                "ssid": ssid,
+                "frequency": frequency,
+                "band": band,
+                "channel_width": "",
+                "tx_power": "",
+                "tx_power_mode": "",
+                "mode": "",
+                "running": "R" in record.flags,
+                "disabled": "X" in record.flags,
+                "comment": "",
+                "mac_address": "",
+                "registered_clients": 0,
+                "authenticated_clients": 0,
+            })
 
         return interfaces
 
+    @staticmethod
+    def _wireless_interface_from_values(record: PrintRecord) -> dict[str, Any]:
+        """Build an interface dict from a ``print terse`` row."""
+        values = record.values
+        return {
+            "id": record.id,
+            "name": values.get("name", ""),
+            "ssid": values.get("ssid", values.get("configuration.ssid", "")),
+            "frequency": values.get("frequency", values.get("channel.frequency", "")),
+            "band": values.get("band", values.get("channel.band", "")),
+            "channel_width": values.get("channel-width", values.get("channel.width", "")),
+            "tx_power": values.get("tx-power", ""),
+            "tx_power_mode": values.get("tx-power-mode", ""),
+            "mode": values.get("mode", values.get("configuration.mode", "")),
+            "running": "R" in record.flags,
+            "disabled": "X" in record.flags,
+            "comment": values.get("comment", ""),
+            "mac_address": values.get("mac-address", ""),
+            "registered_clients": 0,
+            "authenticated_clients": 0,
+        }
+
     async def get_wireless_clients(
         self,
         device_id: str,
@@ -539,11 +531,11 @@ class WirelessService:
         try:
             # Try legacy wireless registration-table first, then RouterOS v7 wifi package.
             try:
-                output = await ssh_client.execute("/interface/wireless/registration-table/print")
+                output = await ssh_client.execute("/interface/wireless/registration-table/print terse without-paging")
                 return self._parse_wireless_clients_output(output)
             except Exception as e1:
                 try:
-                    output = await ssh_client.execute("/interface/wifi/registration-table/print")
+                    output = await ssh_client.execute("/interface/wifi/registration-table/print terse without-paging")
                     return self._parse_wireless_clients_output(output)
                 except Exception as e2:
                     # If wireless is not present on the device, treat as no connected clients.
@@ -559,61 +551,52 @@ class WirelessService:
     def _parse_wireless_clients_output(output: str) -> list[dict[str, Any]]:
         """Parse /interface/wireless/registration-table/print output.
 
-        Handles RouterOS standard table format.
+        Handles ``print terse`` output and the standard table format.
         """
         clients: list[dict[str, Any]] = []
 
-        # Skip header lines
-        lines = output.strip().split("\n")
-        for line in lines:
-            # Skip header/metadata lines
-            if (
-                not line.strip()
-                or line.startswith("Flags:")
-                or line.startswith("Columns:")
-                or line.startswith("#")
-            ):
-                continue
-
-            # Parse data lines
-            parts = line.split()
-            if not parts or not parts[0][0].isdigit():
-                continue
-
-            try:
-                # Extract available fields
-                idx = 0
-                client_id = parts[0]
-                idx = 1
-
-                # Check for flags
-                if len(parts) > 1 and all(c in "DRSXdrsx " for c in parts[1]):
-                    idx = 2
-
-                # Extract fields (format varies by RouterOS version)
-                interface = parts[idx] if idx < len(parts) else ""
-                mac_address = parts[idx + 1] if idx + 1 < len(parts) else ""
-                signal_strength_str = parts[idx + 2] if idx + 2 < len(parts) else ""
-
+        for record in iter_print_records(output, flag_chars="DRSXdrsx", multiline=False):
+            if record.values:
+                values = record.values
                 clients.append({
-                    "id": client_id,
-                    "interface": interface,
-                    "mac_address": mac_address,
-                    "signal_strength": WirelessService._parse_signal_strength(signal_strength_str),
-                    "signal_to_noise": 0,
-                    "tx_rate": "",
-                    "rx_rate": "",
-                    "uptime": "",
+                    "id": record.id,
+                    "interface": values.get("interface", ""),
+                    "mac_address": values.get("mac-address", ""),
+                    # "signal" on the v7 wifi package, "signal-strength" on wireless
+                    "signal_strength": WirelessService._parse_signal_strength(
+                        values.get("signal-strength", values.get("signal", ""))
+                    ),
+                    "signal_to_noise": WirelessService._parse_snr(
+                        values.get("signal-to-noise", "")
+                    ),
+                    "tx_rate": WirelessService._parse_rate(values.get("tx-rate", "")),
+                    "rx_rate": WirelessService._parse_rate(values.get("rx-rate", "")),
+                    "uptime": values.get("uptime", ""),
                     "bytes_sent": 0,
                     "bytes_received": 0,
                     "packets_sent": 0,
                     "packets_received": 0,
                 })
-            except (IndexError, ValueError) as e:
-                # Skip lines that don't parse properly
-                logger.debug(f"Failed to parse wireless client line: {line}", exc_info=e)
                 continue
 
+            # Extract fields (format varies by RouterOS version)
+            interface, mac_address, signal_strength_str = (record.tokens + ["", "", ""])[:3]
+
+            clients.append({
+                "id": record.id,
+                "interface": interface,
+                "mac_address": mac_address,
+                "signal_strength": WirelessService._parse_signal_strength(signal_strength_str),
+                "signal_to_noise": 0,
+                "tx_rate": "",
+                "rx_rate": "",
+                "uptime": "",
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "packets_sent": 0,
+                "packets_received": 0,
+            })
+
         return clients
 
     @staticmethod
@@ -628,11 +611,11 @@ class WirelessService:
         if isinstance(value, int):
             return value
 
-        # Parse string like "-65dBm" or "-65"
+        # Parse string like "-65dBm", "-65" or "-65@HT20-7" (v6 terse, with rate)
         try:
-            value_str = str(value).strip().lower()
+            value_str = str(value).strip().lower().partition("@")[0]
             # Remove "dbm" suffix if present
-            value_str = value_str.replace("dbm", "").replace("@", "").strip()
+            value_str = value_str.replace("dbm", "").strip()
             return int(value_str)
         except (ValueError, AttributeError):
             return 0
@@ -722,7 +705,7 @@ class WirelessService:
 
         try:
             try:
-                output = await ssh_client.execute("/caps-man/remote-cap/print without-paging")
+                output = await ssh_client.execute("/caps-man/remote-cap/print terse without-paging")
                 return self._parse_capsman_remote_caps_output(output)
             except Exception as e:
                 msg = str(e).lower()
@@ -777,6 +760,25 @@ class WirelessService:
             ):
                 continue
 
+            # print terse rows: "0 name=cap1 address=... identity=... state=Run"
+            if "=" in line:
+                for record in iter_print_records(line, flag_chars=_CAPSMAN_FLAG_CHARS):
+                    values = record.values
+                    caps.append({
+                        "id": record.id,
+                        "name": values.get("name", ""),
+                        "address": values.get("address", ""),
+                        "identity": values.get("identity", ""),
+                        "version": values.get("version", ""),
+                        "state": values.get("state", ""),
+                        "base_mac": values.get("base-mac", ""),
+                        "radio_mac": values.get("radio-mac", ""),
+                        "board": values.get("board", ""),
+                        "rx_signal": values.get("rx-signal", ""),
+                        "uptime": values.get("uptime", ""),
+                    })
+                continue
+
             # Parse data lines (start with number)
             parts = line.split()
             if not parts or not parts[0][0].isdigit():
@@ -876,7 +878,7 @@ class WirelessService:
         try:
             # Try registration-table; return empty when not available.
             try:
-                output = await ssh_client.execute("/caps-man/registration-table/print without-paging")
+                output = await ssh_client.execute("/caps-man/registration-table/print terse without-paging")
             except Exception as e:
                 msg = str(e).lower()
                 if "no such command" in msg or "bad command" in msg or "not found" in msg:
@@ -907,6 +909,25 @@ class WirelessService:
             ):
                 continue
 
+            # print terse rows: "0 interface=cap1 mac-address=... ssid=... rx-signal=-60"
+            if "=" in line:
+                for record in iter_print_records(line, flag_chars=_CAPSMAN_FLAG_CHARS):
+                    values = record.values
+                    registrations.append({
+                        "id": record.id,
+                        "interface": values.get("interface", ""),
+                        "mac_address": values.get("mac-address", ""),
+                        "ssid": values.get("ssid", ""),
+                        "ap": values.get("ap", ""),
+                        "radio_name": values.get("radio-name", ""),
+                        "rx_signal": values.get("rx-signal", ""),
+                        "tx_signal": values.get("tx-signal", ""),
+                        "uptime": values.get("uptime", ""),
+                        "packets": values.get("packets", ""),
+                        "bytes": values.get("bytes", ""),
+                    })
+                continue
+
             # Parse data lines
             parts = line.split()
             if not parts or not parts[0][0].isdigit():
@@ -51,3 +51,29 @@ def parse_routeros_uptime(uptime_str: str) -> int:
             current_num = ""
 
     return seconds
+
+
+def parse_routeros_bool(value: object) -> bool:
+    """Parse a RouterOS boolean field.
+
+    The REST API returns flags such as ``disabled`` and ``dynamic`` as the
+    strings "true"/"false" (CLI output uses "yes"/"no"), so a plain truth
+    test treats "false" as set.
+
+    Args:
+        value: Field value (bool, string or None)
+
+    Returns:
+        Parsed boolean (False when missing)
+
+    Example:
+        >>> parse_routeros_bool("false")
+        False
+        >>> parse_routeros_bool("yes")
+        True
+    """
+    if isinstance(value, bool):
+        return value
+    if value is None:
+        return False
+    return str(value).strip().lower() in {"true", "yes", "on", "1"}
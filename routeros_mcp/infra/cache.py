@@ -68,6 +68,8 @@ class RedisResourceCache:
     - interfaces: Network interface data
     - ips: IP address assignments
     - routes: Routing table entries
+    - hosts: Host locator sightings (persisted index, not invalidated on
+      device updates)
     """
 
     def __init__(
@@ -79,6 +81,7 @@ class RedisResourceCache:
         pool_size: int = 10,
         timeout_seconds: float = 5.0,
         key_prefix: str = "resource:",
+        ttl_hosts: int = 86400,
         enabled: bool = True,
     ) -> None:
         """Initialize Redis resource cache.
@@ -91,12 +94,14 @@ class RedisResourceCache:
             pool_size: Connection pool size
             timeout_seconds: Operation timeout
             key_prefix: Redis key prefix for cache entries
+            ttl_hosts: TTL for persisted host locator sightings (seconds)
             enabled: Whether caching is enabled
         """
         self.redis_url = redis_url
         self.ttl_interfaces = ttl_interfaces
         self.ttl_ips = ttl_ips
         self.ttl_routes = ttl_routes
+        self.ttl_hosts = ttl_hosts
         self.pool_size = pool_size
         self.timeout_seconds = timeout_seconds
         self.key_prefix = key_prefix
@@ -235,6 +240,26 @@ class RedisResourceCache:
         """
         await self._set(device_id, "routes", data, self.ttl_routes)
 
+    async def get_hosts(self, device_id: str) -> list[list[Any]] | None:
+        """Get persisted host locator sightings for device.
+
+        Args:
+            device_id: Device identifier
+
+        Returns:
+            Sighting rows or None if not found
+        """
+        return await self._get(device_id, "hosts")
+
+    async def set_hosts(self, device_id: str, data: list[list[Any]]) -> None:
+        """Persist host locator sightings for device.
+
+        Args:
+            device_id: Device identifier
+            data: Sighting rows (HostSighting field values)
+        """
+        await self._set(device_id, "hosts", data, self.ttl_hosts)
+
     async def _get(
         self, device_id: str, resource_type: str
     ) -> Any | None:
@@ -457,6 +482,7 @@ def initialize_redis_cache(
     pool_size: int = 10,
     timeout_seconds: float = 5.0,
     enabled: bool = True,
+    ttl_hosts: int = 86400,
 ) -> RedisResourceCache:
     """Initialize global Redis cache instance.
     
@@ -468,6 +494,7 @@ def initialize_redis_cache(
         pool_size: Connection pool size
         timeout_seconds: Operation timeout
         enabled: Whether caching is enabled
+        ttl_hosts: TTL for persisted host locator sightings
     
     Returns:
         Initialized RedisResourceCache instance
@@ -481,6 +508,7 @@ def initialize_redis_cache(
         pool_size=pool_size,
         timeout_seconds=timeout_seconds,
         enabled=enabled,
+        ttl_hosts=ttl_hosts,
     )
     logger.info("Global RedisResourceCache initialized")
     return _cache_instance
@@ -13,7 +13,10 @@ from routeros_mcp.infra.db.models import (
     Base,
     Credential,
     Device,
+    DeviceLog,
+    DeviceLogTopic,
     HealthCheck,
+    HealthCheckRollup,
     Job,
     Plan,
     Snapshot,
@@ -29,8 +32,11 @@ __all__ = [
     # Models
     "Base",
     "Device",
+    "DeviceLog",
+    "DeviceLogTopic",
     "Credential",
     "HealthCheck",
+    "HealthCheckRollup",
     "Snapshot",
     "Plan",
     "Job",
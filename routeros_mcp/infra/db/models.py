@@ -403,6 +403,132 @@ class HealthCheck(Base):
     )
 
 
+class HealthCheckRollup(Base):
+    """Downsampled health check aggregate.
+
+    Portable replacement for the TimescaleDB continuous aggregate: one row
+    per device, resolution tier (1m/1h/1d) and bucket, holding min/avg/max
+    for CPU, memory and uptime. Coarser tiers are built from finer ones by
+    the health rollup job, so history queries never scan raw health_checks.
+    """
+
+    __tablename__ = "health_check_rollups"
+
+    device_id: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("devices.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    resolution: Mapped[str] = mapped_column(
+        String(8), primary_key=True, comment="Rollup tier: 1m/1h/1d"
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, comment="Bucket start (UTC)"
+    )
+
+    sample_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Raw samples aggregated into bucket"
+    )
+
+    cpu_min: Mapped[float | None] = mapped_column(Float, nullable=True)
+    cpu_avg: Mapped[float | None] = mapped_column(Float, nullable=True)
+    cpu_max: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    memory_min: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Minimum memory usage percent"
+    )
+    memory_avg: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Average memory usage percent"
+    )
+    memory_max: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Maximum memory usage percent"
+    )
+
+    uptime_min: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    uptime_avg: Mapped[float | None] = mapped_column(Float, nullable=True)
+    uptime_max: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
+    __table_args__ = (
+        Index("idx_healthrollup_resolution_bucket", "resolution", "bucket_start"),
+    )
+
+
+class DeviceLog(Base):
+    """Archived RouterOS log entry.
+
+    RouterOS keeps only a small in-memory log; the log archive job (and the
+    optional syslog receiver) copy entries here so they stay searchable
+    after they roll out of the device buffer.
+
+    ``day`` (days since the epoch, UTC) is the partition key: every search
+    is pruned to the days its time range covers and retention deletes whole
+    days. Topics are indexed through device_log_topics; the message is
+    full-text indexed by migration 41 (tsvector on PostgreSQL, an FTS5
+    external-content table on SQLite).
+    """
+
+    __tablename__ = "device_logs"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+
+    device_id: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("devices.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    day: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Partition key: days since 1970-01-01 (UTC)"
+    )
+
+    logged_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, comment="Entry time (device clock, UTC)"
+    )
+
+    topics: Mapped[str] = mapped_column(
+        String(255), nullable=False, default="", comment="Comma-separated topics"
+    )
+
+    message: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+    source: Mapped[str] = mapped_column(
+        String(8), nullable=False, default="poll", comment="Ingest path: poll/syslog"
+    )
+
+    __table_args__ = (
+        Index("idx_device_log_day_device", "day", "device_id"),
+        Index("idx_device_log_device_logged_at", "device_id", "logged_at"),
+        Index("idx_device_log_logged_at", "logged_at"),
+    )
+
+
+class DeviceLogTopic(Base):
+    """Topic index for archived log entries (one row per entry topic)."""
+
+    __tablename__ = "device_log_topics"
+
+    log_id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        ForeignKey("device_logs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    topic: Mapped[str] = mapped_column(String(32), primary_key=True)
+
+    day: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Copy of device_logs.day for pruning"
+    )
+
+    __table_args__ = (
+        Index("idx_device_log_topic_topic_day", "topic", "day"),
+        Index("idx_device_log_topic_day", "day"),
+    )
+
+
 class Snapshot(Base):
     """Configuration snapshot.
 
@@ -687,7 +813,6 @@ class AuditEvent(Base):
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
         comment="Event timestamp",
     )
 
@@ -709,7 +834,6 @@ class AuditEvent(Base):
     user_id: Mapped[str | None] = mapped_column(
         String(255),
         nullable=True,
-        index=True,
         comment="User identifier who performed the action (Phase 5)",
     )
 
@@ -733,7 +857,6 @@ class AuditEvent(Base):
         String(64),
         ForeignKey("devices.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
 
     environment: Mapped[str | None] = mapped_column(
@@ -748,9 +871,7 @@ class AuditEvent(Base):
         comment="Action type: WRITE/READ_SENSITIVE/AUTHZ_DENIED",
     )
 
-    tool_name: Mapped[str] = mapped_column(
-        String(128), nullable=False, index=True, comment="MCP tool name"
-    )
+    tool_name: Mapped[str] = mapped_column(String(128), nullable=False, comment="MCP tool name")
 
     tool_tier: Mapped[str] = mapped_column(
         String(32), nullable=False, comment="Tool tier: fundamental/advanced/professional"
@@ -785,13 +906,16 @@ class AuditEvent(Base):
     )
 
     __table_args__ = (
-        Index("idx_audit_timestamp", "timestamp"),
         Index("idx_audit_user_action", "user_sub", "action"),
-        Index("idx_audit_tool", "tool_name"),
         Index("idx_audit_result", "result"),
-        Index("idx_audit_user_id", "user_id"),
         Index("idx_audit_approver_id", "approver_id"),
         Index("idx_audit_approval_request_id", "approval_request_id"),
+        # Keyset pagination: (timestamp, id) ordering per common filter. These
+        # also serve plain timestamp/device/tool/user lookups by prefix.
+        Index("idx_audit_timestamp_id", "timestamp", "id"),
+        Index("idx_audit_device_timestamp", "device_id", "timestamp", "id"),
+        Index("idx_audit_tool_timestamp", "tool_name", "timestamp", "id"),
+        Index("idx_audit_user_timestamp", "user_id", "timestamp", "id"),
     )
 
 
@@ -0,0 +1,67 @@
+"""Dialect-portable SQL helpers for time-series queries.
+
+health_checks and its rollup tables are queried on SQLite (development),
+plain PostgreSQL and TimescaleDB. ``time_bucket()``/``date_trunc()`` are not
+available everywhere, so bucketing is expressed in integer epoch seconds,
+which every supported backend can compute and group on.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, Integer, cast, func
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def epoch_seconds(column: Any, dialect_name: str) -> ColumnElement[int]:
+    """Build an expression converting a timestamp column to epoch seconds.
+
+    Args:
+        column: DateTime column or expression
+        dialect_name: SQLAlchemy dialect name ("sqlite" or "postgresql")
+
+    Returns:
+        Integer SQL expression (seconds since 1970-01-01 UTC)
+    """
+    if dialect_name == "sqlite":
+        return cast(func.strftime("%s", column), Integer)
+    return cast(func.floor(func.extract("epoch", column)), BigInteger)
+
+
+def epoch_bucket(column: Any, bucket_seconds: int, dialect_name: str) -> ColumnElement[int]:
+    """Build an expression flooring a timestamp column to a bucket boundary.
+
+    Args:
+        column: DateTime column or expression
+        bucket_seconds: Bucket width in seconds
+        dialect_name: SQLAlchemy dialect name ("sqlite" or "postgresql")
+
+    Returns:
+        Integer SQL expression holding the bucket start in epoch seconds
+    """
+    # Floor division renders as integer division on both SQLite and PostgreSQL
+    return (epoch_seconds(column, dialect_name) // bucket_seconds) * bucket_seconds
+
+
+def floor_datetime(value: datetime, bucket_seconds: int) -> datetime:
+    """Floor a datetime to a bucket boundary (UTC).
+
+    Args:
+        value: Timezone-aware or naive-UTC datetime
+        bucket_seconds: Bucket width in seconds
+
+    Returns:
+        Timezone-aware UTC datetime at the bucket start
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    epoch = int(value.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % bucket_seconds, UTC)
+
+
+def from_epoch(value: int | float) -> datetime:
+    """Convert epoch seconds returned by :func:`epoch_bucket` to a UTC datetime."""
+    return datetime.fromtimestamp(int(value), UTC)
+
+
+__all__ = ["epoch_bucket", "epoch_seconds", "floor_datetime", "from_epoch"]
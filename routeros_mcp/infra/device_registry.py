@@ -0,0 +1,276 @@
+"""In-memory, write-through registry of device metadata.
+
+Device metadata (management address, environment, capability flags) changes
+rarely but is read by every tool call, resource read, health check and
+authorization decision. The registry keeps all devices in memory with
+secondary indexes by environment, status and tag so that
+``DeviceService.get_device`` and ``list_devices`` are served without a
+database round-trip.
+
+Consistency model:
+- The database stays the source of truth; the registry is loaded from it at
+  startup (``RouterOSMCPServer.start``).
+- Writes made by this process go through DeviceService / the admin API,
+  which update the registry immediately (write-through).
+- Writes made by other replicas (or other processes sharing the database)
+  are picked up by a periodic sync that reloads devices whose ``updated_at``
+  advanced since the last sync and drops devices that no longer exist.
+
+Example:
+    registry = initialize_device_registry()
+    await registry.load(session_factory)
+    registry.start_sync(session_factory, interval_seconds=30)
+
+    lab_devices = registry.find(environment="lab", tag="site=hq")
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from routeros_mcp.domain.models import Device as DeviceDomain
+from routeros_mcp.infra.db.models import Device as DeviceORM
+from routeros_mcp.infra.db.session import DatabaseSessionManager
+
+logger = logging.getLogger(__name__)
+
+# Overlap applied to the sync watermark so late-committing writes are not missed
+SYNC_LOOKBACK = timedelta(seconds=5)
+
+
+def _tag_keys(tags: dict[str, str] | None) -> set[str]:
+    """Index keys for a tag dict: both ``key`` and ``key=value``."""
+    keys: set[str] = set()
+    for key, value in (tags or {}).items():
+        keys.add(key)
+        keys.add(f"{key}={value}")
+    return keys
+
+
+class DeviceRegistry:
+    """Device metadata held in memory with environment/status/tag indexes.
+
+    All mutations are synchronous dictionary updates, so readers in the same
+    event loop never observe a half-applied change.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, unloaded registry."""
+        self._devices: dict[str, DeviceDomain] = {}
+        self._by_environment: dict[str, set[str]] = defaultdict(set)
+        self._by_status: dict[str, set[str]] = defaultdict(set)
+        self._by_tag: dict[str, set[str]] = defaultdict(set)
+        self._watermark: datetime | None = None
+        self._sync_task: asyncio.Task[None] | None = None
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def get(self, device_id: str) -> DeviceDomain | None:
+        """Get a device by ID, or None if not registered."""
+        return self._devices.get(device_id)
+
+    def find(
+        self,
+        environment: str | None = None,
+        status: str | None = None,
+        tag: str | None = None,
+        exclude_status: str | None = None,
+        device_ids: Iterable[str] | None = None,
+    ) -> list[DeviceDomain]:
+        """Find devices matching all given filters using the indexes.
+
+        Args:
+            environment: Environment to match
+            status: Status to match
+            tag: Tag key (``site``) or key/value pair (``site=hq``) to match
+            exclude_status: Status to exclude (e.g. ``decommissioned``)
+            device_ids: Restrict results to these device IDs
+
+        Returns:
+            Matching devices ordered by device ID
+        """
+        candidates: set[str] | None = None
+        for index, key in (
+            (self._by_environment, environment),
+            (self._by_status, status),
+            (self._by_tag, tag),
+        ):
+            if key is None:
+                continue
+            matched = index.get(key, set())
+            candidates = set(matched) if candidates is None else candidates & matched
+
+        if device_ids is not None:
+            requested = set(device_ids)
+            candidates = requested if candidates is None else candidates & requested
+
+        if candidates is None:
+            candidates = set(self._devices)
+        if exclude_status is not None:
+            candidates -= self._by_status.get(exclude_status, set())
+
+        return [
+            self._devices[device_id] for device_id in sorted(candidates) if device_id in self._devices
+        ]
+
+    def upsert(self, device: DeviceDomain) -> None:
+        """Add or replace a device and re-index it."""
+        self._unindex(device.id)
+        self._devices[device.id] = device
+        self._by_environment[device.environment].add(device.id)
+        self._by_status[device.status].add(device.id)
+        for key in _tag_keys(device.tags):
+            self._by_tag[key].add(device.id)
+
+    def remove(self, device_id: str) -> None:
+        """Remove a device (no-op if absent)."""
+        self._unindex(device_id)
+        self._devices.pop(device_id, None)
+
+    def _unindex(self, device_id: str) -> None:
+        existing = self._devices.get(device_id)
+        if existing is None:
+            return
+        self._by_environment[existing.environment].discard(device_id)
+        self._by_status[existing.status].discard(device_id)
+        for key in _tag_keys(existing.tags):
+            self._by_tag[key].discard(device_id)
+
+    def _advance_watermark(self, devices: list[DeviceDomain]) -> None:
+        timestamps = [device.updated_at for device in devices if device.updated_at]
+        if timestamps and (self._watermark is None or max(timestamps) > self._watermark):
+            self._watermark = max(timestamps)
+
+    async def load(self, session_factory: DatabaseSessionManager) -> None:
+        """Replace the registry contents with every device in the database.
+
+        Args:
+            session_factory: Database session factory
+        """
+        async with session_factory.session() as session:
+            result = await session.execute(select(DeviceORM))
+            devices = [DeviceDomain.model_validate(d) for d in result.scalars().all()]
+
+        for device_id in list(self._devices):
+            self.remove(device_id)
+        for device in devices:
+            self.upsert(device)
+        self._advance_watermark(devices)
+        self.loaded = True
+
+        logger.info("Device registry loaded", extra={"device_count": len(devices)})
+
+    async def refresh(self, session_factory: DatabaseSessionManager) -> int:
+        """Apply changes made elsewhere since the last load or refresh.
+
+        Reloads devices updated since the newest ``updated_at`` seen by the
+        previous sync, minus SYNC_LOOKBACK to tolerate coarse timestamps and
+        transactions committing out of order, and removes devices deleted
+        from the database. Rows identical to the registry copy are skipped.
+
+        Args:
+            session_factory: Database session factory
+
+        Returns:
+            Number of devices added, updated or removed
+        """
+        async with session_factory.session() as session:
+            stmt = select(DeviceORM)
+            if self._watermark is not None:
+                stmt = stmt.where(DeviceORM.updated_at >= self._watermark - SYNC_LOOKBACK)
+            result = await session.execute(stmt)
+            changed = [DeviceDomain.model_validate(d) for d in result.scalars().all()]
+            ids_result = await session.execute(select(DeviceORM.id))
+            existing_ids = set(ids_result.scalars().all())
+
+        applied = 0
+        for device in changed:
+            if device != self._devices.get(device.id):
+                self.upsert(device)
+                applied += 1
+        for device_id in set(self._devices) - existing_ids:
+            self.remove(device_id)
+            applied += 1
+        self._advance_watermark(changed)
+
+        if applied:
+            logger.debug("Device registry refreshed", extra={"changed_devices": applied})
+        return applied
+
+    def start_sync(self, session_factory: DatabaseSessionManager, interval_seconds: int) -> None:
+        """Start the background task that refreshes the registry periodically.
+
+        Args:
+            session_factory: Database session factory
+            interval_seconds: Seconds between refreshes (0 disables sync)
+        """
+        if interval_seconds <= 0 or self._sync_task is not None:
+            return
+
+        async def sync_loop() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                try:
+                    await self.refresh(session_factory)
+                except Exception as e:
+                    logger.warning(f"Device registry refresh failed: {e}")
+
+        self._sync_task = asyncio.create_task(sync_loop())
+
+    async def stop_sync(self) -> None:
+        """Cancel the background sync task, if running."""
+        if self._sync_task is None:
+            return
+        self._sync_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sync_task
+        self._sync_task = None
+
+
+# Global registry instance (initialized by application)
+_registry_instance: DeviceRegistry | None = None
+
+
+def reset_device_registry() -> None:
+    """Reset the global registry instance (primarily for testing)."""
+    global _registry_instance
+    _registry_instance = None
+
+
+def get_device_registry() -> DeviceRegistry | None:
+    """Get the global registry if it has been loaded.
+
+    Returns:
+        Loaded DeviceRegistry, or None when the registry is not in use
+        (callers then fall back to the database)
+    """
+    if _registry_instance is None or not _registry_instance.loaded:
+        return None
+    return _registry_instance
+
+
+def initialize_device_registry() -> DeviceRegistry:
+    """Initialize the global registry instance (empty until loaded).
+
+    Returns:
+        New DeviceRegistry instance
+    """
+    global _registry_instance
+    _registry_instance = DeviceRegistry()
+    return _registry_instance
+
+
+__all__ = [
+    "SYNC_LOOKBACK",
+    "DeviceRegistry",
+    "get_device_registry",
+    "initialize_device_registry",
+    "reset_device_registry",
+]
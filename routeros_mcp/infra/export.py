@@ -0,0 +1,105 @@
+"""Incremental CSV/NDJSON encoders for streamed exports.
+
+Export endpoints feed database rows through these async generators straight
+into a streaming HTTP response, so memory use depends on the batch size
+rather than on the number of exported rows.
+
+Example:
+    rows = audit_service.stream_events(date_from=start)
+    body = encode_csv(rows, AUDIT_EXPORT_COLUMNS)
+    return StreamingResponse(gzip_chunks(body), media_type="application/gzip")
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from typing import Any
+
+# Rows encoded per yielded chunk; keeps chunks around tens of KB
+DEFAULT_ROWS_PER_CHUNK = 500
+
+
+def _cell(value: Any) -> Any:
+    """Render None as an empty CSV cell."""
+    return "" if value is None else value
+
+
+async def encode_csv(
+    records: AsyncIterable[dict[str, Any]],
+    columns: Sequence[tuple[str, str]],
+    rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+) -> AsyncIterator[str]:
+    """Encode records as CSV text chunks.
+
+    Args:
+        records: Async iterable of record dicts
+        columns: (header, record key) pairs in output order
+        rows_per_chunk: Rows buffered before a chunk is yielded
+
+    Yields:
+        CSV text chunks; the first one starts with the header row
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for header, _key in columns])
+
+    pending = 0
+    async for record in records:
+        writer.writerow([_cell(record.get(key)) for _header, key in columns])
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue()
+
+
+async def encode_ndjson(
+    records: AsyncIterable[dict[str, Any]],
+    rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+) -> AsyncIterator[str]:
+    """Encode records as newline-delimited JSON chunks.
+
+    Args:
+        records: Async iterable of record dicts
+        rows_per_chunk: Records buffered before a chunk is yielded
+
+    Yields:
+        NDJSON text chunks (one JSON object per line)
+    """
+    lines: list[str] = []
+    async for record in records:
+        lines.append(json.dumps(record, default=str, separators=(",", ":")))
+        if len(lines) >= rows_per_chunk:
+            yield "\n".join(lines) + "\n"
+            lines = []
+
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+async def gzip_chunks(chunks: AsyncIterable[str], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip-compress text chunks incrementally.
+
+    Args:
+        chunks: Async iterable of text chunks
+        level: zlib compression level (1-9)
+
+    Yields:
+        Gzip-framed byte chunks forming a single .gz stream
+    """
+    # wbits=31 selects the gzip container rather than raw zlib
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+
+__all__ = ["DEFAULT_ROWS_PER_CHUNK", "encode_csv", "encode_ndjson", "gzip_chunks"]
@@ -1,4 +1,4 @@
-"""Job runner for executing periodic snapshot capture.
+"""Job runner for periodic snapshot capture, health rollups, log archiving and traffic sampling.
 
 Implements the snapshot capture workflow:
 1. Query eligible devices
@@ -7,6 +7,12 @@ Implements the snapshot capture workflow:
 4. Handle failures gracefully
 5. Prune old snapshots based on retention policy
 
+Also runs the health history rollup job (1m/1h/1d downsampling of
+health_checks plus tiered retention) and the log archive job (incremental
+log pulls into device_logs plus retention), samples interface counters of
+watched devices for locally computed traffic rates, probes the reachability
+mesh, refreshes the host locator index, and ingests syslog batches.
+
 Design principles:
 - Concurrent execution with semaphore limit
 - Graceful failure handling (log and continue)
@@ -18,17 +24,43 @@ See docs/18-database-schema-and-orm-specification.md (Snapshot Model)
 
 import asyncio
 import logging
+import random
+from collections.abc import Awaitable
 from datetime import UTC, datetime
+from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import Device as DeviceDomain
+from routeros_mcp.domain.services.bridge import BridgeService
+from routeros_mcp.domain.services.dhcp import DHCPService
+from routeros_mcp.domain.services.diagnostics import DiagnosticsService
+from routeros_mcp.domain.services.firewall_logs import FirewallLogsService
+from routeros_mcp.domain.services.health_rollup import HealthRollupService
+from routeros_mcp.domain.services.interface import InterfaceService
+from routeros_mcp.domain.services.ip import IPService
+from routeros_mcp.domain.services.log_archive import LogArchiveService
 from routeros_mcp.domain.services.snapshot import SnapshotService
 from routeros_mcp.infra.db.models import Device as DeviceORM
 from routeros_mcp.infra.db.session import DatabaseSessionManager
+from routeros_mcp.infra.device_registry import get_device_registry
 from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.routeros.host_locator import (
+    HostSighting,
+    collect_sightings,
+    get_host_locator_index,
+)
+from routeros_mcp.infra.routeros.log_tail import LogEntry, get_archive_log_tailer
+from routeros_mcp.infra.routeros.reachability import (
+    get_reachability_store,
+    mesh_pairs,
+    probe_offsets,
+)
+from routeros_mcp.infra.routeros.syslog_receiver import SyslogMessage
+from routeros_mcp.infra.routeros.topology import get_topology_graph
+from routeros_mcp.infra.routeros.traffic_counters import get_traffic_store
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +69,10 @@ logger = logging.getLogger(__name__)
 # Value chosen based on typical network latency and resource constraints
 MAX_CONCURRENT_CAPTURES = 5
 
+# Share of the mesh interval its probes are spread over; the rest is
+# headroom for the last probes to finish before the next run
+MESH_SPREAD_FRACTION = 0.8
+
 
 async def run_snapshot_capture_job(
     session_factory: DatabaseSessionManager,
@@ -157,10 +193,7 @@ async def run_retention_cleanup_job(
                 results["total_pruned"] += pruned
 
                 if pruned > 0:
-                    metrics.snapshot_retention_pruned.labels(
-                        device_id=device_orm.id,
-                        kind="config",
-                    ).inc(pruned)
+                    metrics.record_snapshot_pruned(device_orm.id, "config", pruned)
 
             except Exception as e:
                 error_msg = f"Failed to prune snapshots for device {device_orm.id}: {e}"
@@ -183,6 +216,592 @@ async def run_retention_cleanup_job(
     return results
 
 
+async def run_health_rollup_job(
+    session_factory: DatabaseSessionManager,
+    settings: Settings,
+) -> dict:
+    """Execute periodic health check downsampling and retention.
+
+    Rollups are built before retention runs so raw health_checks rows are
+    always aggregated before they are deleted.
+
+    Args:
+        session_factory: Database session factory
+        settings: Application settings
+
+    Returns:
+        Job execution summary
+    """
+    if not settings.health_rollup_enabled:
+        logger.debug("Health rollups disabled, skipping job")
+        return {
+            "status": "skipped",
+            "reason": "disabled",
+        }
+
+    start_time = datetime.now(UTC)
+
+    async with session_factory.session() as session:
+        rollup_service = HealthRollupService(session, settings)
+        buckets_written = await rollup_service.build_rollups(now=start_time)
+        rows_deleted = await rollup_service.apply_retention(now=start_time)
+
+    duration = (datetime.now(UTC) - start_time).total_seconds()
+    logger.info(
+        f"Health rollup job completed in {duration:.2f}s",
+        extra={
+            "duration_seconds": duration,
+            "buckets_written": buckets_written,
+            "rows_deleted": rows_deleted,
+        },
+    )
+
+    return {
+        "status": "success",
+        "buckets_written": buckets_written,
+        "rows_deleted": rows_deleted,
+    }
+
+
+async def run_log_archive_job(
+    session_factory: DatabaseSessionManager,
+    settings: Settings,
+) -> dict:
+    """Pull new log entries from every eligible device into the log archive.
+
+    Each device is read through the archive's own log tailer, so only
+    entries newer than its cursor are transferred and tail reads elsewhere
+    (``get_recent_logs``, logs subscriptions) never make the archive skip
+    entries. Every device is archived in its own session so one unreachable
+    device does not hold back the others. Retention runs last.
+
+    Args:
+        session_factory: Database session factory
+        settings: Application settings
+
+    Returns:
+        Job execution summary
+    """
+    if not settings.log_archive_enabled:
+        logger.debug("Log archive disabled, skipping job")
+        return {
+            "status": "skipped",
+            "reason": "disabled",
+        }
+
+    start_time = datetime.now(UTC)
+
+    async with session_factory.session() as session:
+        devices = await _get_eligible_devices(session, settings)
+
+    results: dict = {
+        "status": "success",
+        "total": len(devices),
+        "success": 0,
+        "failed": 0,
+        "entries_archived": 0,
+        "rows_deleted": 0,
+    }
+    semaphore = asyncio.Semaphore(settings.log_archive_max_concurrent_devices)
+    tailer = get_archive_log_tailer()
+
+    async def archive_device(device: DeviceDomain) -> None:
+        async with semaphore:
+            try:
+                # Without a cursor the whole device buffer is re-read
+                resync = tailer.cursor(device.id) is None
+                async with session_factory.session() as session:
+                    new_entries = await FirewallLogsService(session, settings).tail_logs(
+                        device.id, tailer=tailer
+                    )
+                    archived = await LogArchiveService(session, settings).archive_entries(
+                        device.id, new_entries, now=start_time, skip_archived=resync
+                    )
+                results["success"] += 1
+                results["entries_archived"] += archived
+            except Exception as e:
+                # Resynchronize next run so entries read but not stored are retried
+                tailer.forget(device.id)
+                results["failed"] += 1
+                logger.warning(
+                    f"Log archive failed for device {device.id}: {e}",
+                    extra={"device_id": device.id},
+                )
+
+    await asyncio.gather(*(archive_device(device) for device in devices))
+
+    async with session_factory.session() as session:
+        results["rows_deleted"] = await LogArchiveService(session, settings).apply_retention(
+            now=start_time
+        )
+
+    duration = (datetime.now(UTC) - start_time).total_seconds()
+    logger.info(
+        f"Log archive job completed in {duration:.2f}s",
+        extra={
+            "duration_seconds": duration,
+            "total_devices": results["total"],
+            "failed": results["failed"],
+            "entries_archived": results["entries_archived"],
+            "rows_deleted": results["rows_deleted"],
+        },
+    )
+
+    return results
+
+
+async def ingest_syslog_batch(
+    session_factory: DatabaseSessionManager,
+    settings: Settings,
+    batch: list[SyslogMessage],
+) -> int:
+    """Archive a batch of syslog messages, attributing them by source address.
+
+    Messages from addresses that are not a registered device's management
+    IP are dropped.
+
+    Args:
+        session_factory: Database session factory
+        settings: Application settings
+        batch: (source address, raw log entry) pairs from SyslogReceiver
+
+    Returns:
+        Number of entries archived
+    """
+    by_address: dict[str, list[LogEntry]] = {}
+    for address, raw in batch:
+        by_address.setdefault(address, []).append(LogEntry.from_raw(raw, transport="syslog"))
+
+    archived = 0
+    async with session_factory.session() as session:
+        registry = get_device_registry()
+        if registry is not None:
+            device_by_address = {
+                device.management_ip: device.id
+                for device in registry.find()
+                if device.management_ip in by_address
+            }
+        else:
+            rows = await session.execute(
+                select(DeviceORM.management_ip, DeviceORM.id).where(
+                    DeviceORM.management_ip.in_(list(by_address))
+                )
+            )
+            device_by_address: dict[str, str] = dict(rows.tuples().all())
+
+        archive = LogArchiveService(session, settings)
+        for address, entries in by_address.items():
+            device_id = device_by_address.get(address)
+            if device_id is None:
+                logger.debug(
+                    "Dropping syslog messages from unknown address",
+                    extra={"address": address, "count": len(entries)},
+                )
+                continue
+            archived += await archive.archive_entries(device_id, entries, source="syslog")
+
+    return archived
+
+
+async def run_interface_traffic_job(
+    session_factory: DatabaseSessionManager,
+    settings: Settings,
+) -> dict:
+    """Sample interface counters of every watched device.
+
+    Devices are watched while their traffic stats are read (see
+    TrafficCounterStore.watch), so idle devices cost nothing. Rates are
+    computed from consecutive samples when read.
+
+    Args:
+        session_factory: Database session factory
+        settings: Application settings
+
+    Returns:
+        Job execution summary
+    """
+    if not settings.interface_traffic_enabled:
+        logger.debug("Interface traffic collection disabled, skipping job")
+        return {
+            "status": "skipped",
+            "reason": "disabled",
+        }
+
+    device_ids = get_traffic_store().watched()
+    results: dict = {
+        "status": "success",
+        "total": len(device_ids),
+        "success": 0,
+        "failed": 0,
+        "interfaces_sampled": 0,
+    }
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CAPTURES)
+
+    async def sample_device(device_id: str) -> None:
+        async with semaphore:
+            try:
+                async with session_factory.session() as session:
+                    sampled = await InterfaceService(
+                        session, settings
+                    ).collect_traffic_counters(device_id)
+                results["success"] += 1
+                results["interfaces_sampled"] += sampled
+            except Exception as e:
+                results["failed"] += 1
+                logger.warning(
+                    f"Interface counter sampling failed for device {device_id}: {e}",
+                    extra={"device_id": device_id},
+                )
+
+    await asyncio.gather(*(sample_device(device_id) for device_id in device_ids))
+
+    logger.debug(
+        "Interface traffic job completed",
+        extra={
+            "total_devices": results["total"],
+            "failed": results["failed"],
+            "interfaces_sampled": results["interfaces_sampled"],
+        },
+    )
+    return results
+
+
+async def run_reachability_mesh_job(
+    session_factory: DatabaseSessionManager,
+    settings: Settings,
+    spread_seconds: float | None = None,
+    rng: random.Random | None = None,
+) -> dict:
+    """Ping every mesh target from every mesh device once.
+
+    Probes are spread over MESH_SPREAD_FRACTION of the interval, each at a
+    random point of its own slot and ordered so consecutive probes come
+    from different devices; per device, at most
+    routeros_max_concurrent_per_device probes run at a time. Results go to
+    the reachability store.
+
+    Args:
+        session_factory: Database session factory
+        settings: Application settings
+        spread_seconds: Window the probes are spread over (default: from settings)
+        rng: Random source for probe jitter
+
+    Returns:
+        Job execution summary
+    """
+    if not settings.reachability_mesh_enabled:
+        logger.debug("Reachability mesh disabled, skipping job")
+        return {
+            "status": "skipped",
+            "reason": "disabled",
+        }
+
+    pairs = mesh_pairs(
+        (d.strip() for d in settings.reachability_mesh_devices.split(",") if d.strip()),
+        (t.strip() for t in settings.reachability_mesh_targets.split(",") if t.strip()),
+    )
+    if not pairs:
+        logger.debug("Reachability mesh has no device/target pairs, skipping job")
+        return {
+            "status": "skipped",
+            "reason": "no_pairs",
+        }
+
+    store = get_reachability_store()
+    store.configure(pairs)
+    if spread_seconds is None:
+        spread_seconds = settings.reachability_mesh_interval_seconds * MESH_SPREAD_FRACTION
+    offsets = probe_offsets(len(pairs), spread_seconds, rng)
+
+    results: dict = {
+        "status": "success",
+        "total": len(pairs),
+        "success": 0,
+        "failed": 0,
+    }
+    semaphores = {
+        device_id: asyncio.Semaphore(settings.routeros_max_concurrent_per_device)
+        for device_id, _ in pairs
+    }
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def probe(offset: float, device_id: str, target: str) -> None:
+        await asyncio.sleep(max(0.0, started + offset - loop.time()))
+        async with semaphores[device_id]:
+            try:
+                async with session_factory.session() as session:
+                    result = await DiagnosticsService(session, settings).ping(
+                        device_id, target, count=settings.reachability_mesh_ping_count
+                    )
+            except Exception as e:
+                results["failed"] += 1
+                store.record_failure(device_id, target, str(e) or type(e).__name__)
+                logger.warning(
+                    f"Reachability probe {device_id} -> {target} failed: {e}",
+                    extra={"device_id": device_id, "target": target},
+                )
+                return
+        results["success"] += 1
+        store.record(
+            device_id,
+            target,
+            result["packet_loss_percent"],
+            result["avg_rtt_ms"] if result["packets_received"] else None,
+        )
+
+    await asyncio.gather(
+        *(
+            probe(offset, device_id, target)
+            for offset, (device_id, target) in zip(offsets, pairs, strict=True)
+        )
+    )
+
+    logger.debug(
+        "Reachability mesh job completed",
+        extra={
+            "pairs": results["total"],
+            "failed": results["failed"],
+        },
+    )
+    return results
+
+
+async def run_host_locator_job(
+    session_factory: DatabaseSessionManager,
+    settings: Settings,
+) -> dict:
+    """Refresh the host locator index from every eligible device.
+
+    Reads the ARP table, active DHCP leases and learned bridge hosts of each
+    device (one session per device, MAX_CONCURRENT_CAPTURES at a time) and
+    merges them into the index. A table that cannot be read is skipped, so
+    its earlier sightings age out instead of vanishing; a device fails only
+    when none of its tables could be read. Devices no longer eligible are
+    dropped from the index.
+
+    With host_locator_redis_persistence, each device's sightings are
+    written to the Redis resource cache after its poll and restored the
+    first time the device is polled after a restart.
+
+    Args:
+        session_factory: Database session factory
+        settings: Application settings
+
+    Returns:
+        Job execution summary
+    """
+    if not settings.host_locator_enabled:
+        logger.debug("Host locator disabled, skipping job")
+        return {
+            "status": "skipped",
+            "reason": "disabled",
+        }
+
+    start_time = datetime.now(UTC)
+
+    async with session_factory.session() as session:
+        devices = await _get_eligible_devices(session, settings)
+
+    index = get_host_locator_index()
+    eligible = {device.id for device in devices}
+    for device_id in index.device_ids():
+        if device_id not in eligible:
+            index.remove_device(device_id)
+
+    cache = None
+    if settings.host_locator_redis_persistence and settings.redis_cache_enabled:
+        from routeros_mcp.infra.cache import get_redis_cache
+
+        try:
+            cache = get_redis_cache()
+        except RuntimeError:
+            logger.warning("Redis cache not initialized, host locator runs without persistence")
+
+    results: dict = {
+        "status": "success",
+        "total": len(devices),
+        "success": 0,
+        "failed": 0,
+        "sightings": 0,
+    }
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CAPTURES)
+
+    async def read_table(device_id: str, name: str, read: Awaitable[Any]) -> Any | None:
+        try:
+            return await read
+        except Exception as e:
+            logger.warning(
+                f"Host locator could not read {name} of device {device_id}: {e}",
+                extra={"device_id": device_id},
+            )
+            return None
+
+    async def index_device(device: DeviceDomain) -> None:
+        if cache is not None and not index.has_device(device.id):
+            rows = await cache.get_hosts(device.id)
+            try:
+                index.update_device(device.id, [HostSighting(*row) for row in rows or []])
+            except (TypeError, ValueError) as e:
+                logger.warning(
+                    f"Ignoring persisted host sightings of device {device.id}: {e}",
+                    extra={"device_id": device.id},
+                )
+
+        async with semaphore, session_factory.session() as session:
+            arp = await read_table(
+                device.id, "ARP table", IPService(session, settings).get_arp_table(device.id)
+            )
+            leases = await read_table(
+                device.id, "DHCP leases", DHCPService(session, settings).get_dhcp_leases(device.id)
+            )
+            hosts = await read_table(
+                device.id,
+                "bridge hosts",
+                BridgeService(session, settings).list_bridge_hosts(device.id),
+            )
+
+        if arp is None and leases is None and hosts is None:
+            results["failed"] += 1
+            return
+
+        sightings = collect_sightings(
+            device.id,
+            arp_entries=arp or [],
+            leases=(leases or {}).get("leases", []),
+            bridge_hosts=hosts or [],
+        )
+        index.update_device(device.id, sightings)
+        results["success"] += 1
+        results["sightings"] += len(sightings)
+
+        if cache is not None:
+            await cache.set_hosts(device.id, [list(s) for s in index.device_sightings(device.id)])
+
+    await asyncio.gather(*(index_device(device) for device in devices))
+
+    duration = (datetime.now(UTC) - start_time).total_seconds()
+    logger.info(
+        f"Host locator job completed in {duration:.2f}s",
+        extra={
+            "duration_seconds": duration,
+            "total_devices": results["total"],
+            "failed": results["failed"],
+            "sightings": results["sightings"],
+        },
+    )
+    return results
+
+
+async def run_topology_job(
+    session_factory: DatabaseSessionManager,
+    settings: Settings,
+) -> dict:
+    """Refresh the topology graph from every eligible device.
+
+    Reads the interfaces, bridge ports, IP addresses and neighbours of each
+    device (one session per device, MAX_CONCURRENT_CAPTURES at a time) and
+    merges them into the graph. A list that cannot be read keeps its
+    previous value; a device fails only when none could be read. Devices
+    no longer eligible are dropped from the graph.
+
+    Args:
+        session_factory: Database session factory
+        settings: Application settings
+
+    Returns:
+        Job execution summary
+    """
+    if not settings.topology_enabled:
+        logger.debug("Topology graph disabled, skipping job")
+        return {
+            "status": "skipped",
+            "reason": "disabled",
+        }
+
+    start_time = datetime.now(UTC)
+
+    async with session_factory.session() as session:
+        devices = await _get_eligible_devices(session, settings)
+
+    graph = get_topology_graph()
+    eligible = {device.id for device in devices}
+    for device_id in graph.device_ids():
+        if device_id not in eligible:
+            graph.remove_device(device_id)
+
+    results: dict = {
+        "status": "success",
+        "total": len(devices),
+        "success": 0,
+        "failed": 0,
+    }
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CAPTURES)
+
+    async def read_list(device_id: str, name: str, read: Awaitable[Any]) -> Any | None:
+        try:
+            return await read
+        except Exception as e:
+            logger.warning(
+                f"Topology job could not read {name} of device {device_id}: {e}",
+                extra={"device_id": device_id},
+            )
+            return None
+
+    async def refresh_device(device: DeviceDomain) -> None:
+        async with semaphore, session_factory.session() as session:
+            ip_service = IPService(session, settings)
+            bridge_service = BridgeService(session, settings)
+            interfaces = await read_list(
+                device.id,
+                "interfaces",
+                InterfaceService(session, settings).list_interfaces(device.id),
+            )
+            bridge_ports = await read_list(
+                device.id, "bridge ports", bridge_service.list_bridge_ports(device.id)
+            )
+            addresses = await read_list(
+                device.id, "IP addresses", ip_service.list_addresses(device.id)
+            )
+            neighbors = await read_list(
+                device.id, "neighbors", ip_service.list_neighbors(device.id)
+            )
+
+        if interfaces is None and bridge_ports is None and addresses is None and neighbors is None:
+            results["failed"] += 1
+            return
+
+        # Fresh reads already fed the graph; cached ones and the name go in here
+        graph.update_device(
+            device.id,
+            name=device.name,
+            interfaces=interfaces,
+            bridge_ports=bridge_ports,
+            ip_addresses=addresses,
+            neighbors=neighbors,
+        )
+        results["success"] += 1
+
+    await asyncio.gather(*(refresh_device(device) for device in devices))
+
+    stats = graph.get_stats()
+    results["nodes"] = sum(stats["nodes"].values())
+    results["edges"] = stats["edges"]
+
+    duration = (datetime.now(UTC) - start_time).total_seconds()
+    logger.info(
+        f"Topology job completed in {duration:.2f}s",
+        extra={
+            "duration_seconds": duration,
+            "total_devices": results["total"],
+            "failed": results["failed"],
+            "nodes": results["nodes"],
+            "edges": results["edges"],
+        },
+    )
+    return results
+
+
 async def _get_eligible_devices(
     session: AsyncSession,
     settings: Settings,
@@ -200,6 +819,13 @@ async def _get_eligible_devices(
     Returns:
         List of eligible devices
     """
+    registry = get_device_registry()
+    if registry is not None:
+        return registry.find(
+            environment=settings.environment,
+            exclude_status="decommissioned",
+        )
+
     stmt = select(DeviceORM).where(
         DeviceORM.environment == settings.environment,
         DeviceORM.status != "decommissioned",
@@ -250,6 +876,11 @@ async def _capture_device_snapshot(
 
             await session.commit()
 
+            registry = get_device_registry()
+            if device_orm and registry is not None:
+                await session.refresh(device_orm)
+                registry.upsert(DeviceDomain.model_validate(device_orm))
+
             async with results_lock:
                 results["success"] += 1
 
@@ -274,15 +905,22 @@ async def _capture_device_snapshot(
         )
 
         # Record failure metric
-        metrics.snapshot_capture_total.labels(
+        metrics.record_snapshot_result(
             device_id=device.id,
             kind="config",
             source="unknown",
             status="failed",
-        ).inc()
+        )
 
 
 __all__ = [
     "run_snapshot_capture_job",
     "run_retention_cleanup_job",
+    "run_health_rollup_job",
+    "run_log_archive_job",
+    "run_interface_traffic_job",
+    "run_reachability_mesh_job",
+    "run_host_locator_job",
+    "run_topology_job",
+    "ingest_syslog_batch",
 ]
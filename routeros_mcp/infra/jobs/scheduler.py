@@ -4,6 +4,10 @@ Provides scheduling infrastructure for:
 - Periodic configuration snapshot capture
 - Health check execution
 - Retention policy enforcement
+- Health history rollups
+- Log archive ingestion
+- Interface traffic counter sampling
+- Reachability mesh probes
 
 Design principles:
 - Use AsyncIOScheduler for async compatibility
@@ -169,6 +173,213 @@ class JobScheduler:
 
         return job.id
 
+    def add_health_rollup_job(
+        self,
+        job_func: Callable,
+        interval_seconds: int | None = None,
+    ) -> str:
+        """Add periodic health rollup (downsampling + retention) job.
+
+        Args:
+            job_func: Async function to execute
+            interval_seconds: Rollup interval (default: from settings)
+
+        Returns:
+            Job ID
+        """
+        interval = interval_seconds or self.settings.health_rollup_interval_seconds
+
+        job = self.scheduler.add_job(
+            job_func,
+            trigger=IntervalTrigger(seconds=interval),
+            id="health_rollup",
+            name="Health History Rollup",
+            replace_existing=True,
+        )
+
+        logger.info(
+            f"Added health rollup job (interval: {interval}s)",
+            extra={
+                "job_id": job.id,
+                "interval_seconds": interval,
+            },
+        )
+
+        return job.id
+
+    def add_log_archive_job(
+        self,
+        job_func: Callable,
+        interval_seconds: int | None = None,
+    ) -> str:
+        """Add periodic log archive (incremental ingest + retention) job.
+
+        Args:
+            job_func: Async function to execute
+            interval_seconds: Ingest interval (default: from settings)
+
+        Returns:
+            Job ID
+        """
+        interval = interval_seconds or self.settings.log_archive_interval_seconds
+
+        job = self.scheduler.add_job(
+            job_func,
+            trigger=IntervalTrigger(seconds=interval),
+            id="log_archive",
+            name="Device Log Archive",
+            replace_existing=True,
+        )
+
+        logger.info(
+            f"Added log archive job (interval: {interval}s)",
+            extra={
+                "job_id": job.id,
+                "interval_seconds": interval,
+            },
+        )
+
+        return job.id
+
+    def add_interface_traffic_job(
+        self,
+        job_func: Callable,
+        interval_seconds: int | None = None,
+    ) -> str:
+        """Add periodic interface traffic counter collection job.
+
+        Args:
+            job_func: Async function to execute
+            interval_seconds: Collection interval (default: from settings)
+
+        Returns:
+            Job ID
+        """
+        interval = interval_seconds or self.settings.metrics_collection_interval_seconds
+
+        job = self.scheduler.add_job(
+            job_func,
+            trigger=IntervalTrigger(seconds=interval),
+            id="interface_traffic",
+            name="Interface Traffic Counters",
+            replace_existing=True,
+        )
+
+        logger.info(
+            f"Added interface traffic job (interval: {interval}s)",
+            extra={
+                "job_id": job.id,
+                "interval_seconds": interval,
+            },
+        )
+
+        return job.id
+
+    def add_reachability_mesh_job(
+        self,
+        job_func: Callable,
+        interval_seconds: int | None = None,
+    ) -> str:
+        """Add periodic reachability mesh job.
+
+        Each run spreads its probes over most of the interval, so runs do
+        not overlap (max_instances=1 skips a run that would).
+
+        Args:
+            job_func: Async function to execute
+            interval_seconds: Mesh interval (default: from settings)
+
+        Returns:
+            Job ID
+        """
+        interval = interval_seconds or self.settings.reachability_mesh_interval_seconds
+
+        job = self.scheduler.add_job(
+            job_func,
+            trigger=IntervalTrigger(seconds=interval),
+            id="reachability_mesh",
+            name="Reachability Mesh",
+            replace_existing=True,
+        )
+
+        logger.info(
+            f"Added reachability mesh job (interval: {interval}s)",
+            extra={
+                "job_id": job.id,
+                "interval_seconds": interval,
+            },
+        )
+
+        return job.id
+
+    def add_host_locator_job(
+        self,
+        job_func: Callable,
+        interval_seconds: int | None = None,
+    ) -> str:
+        """Add periodic host locator index refresh job.
+
+        Args:
+            job_func: Async function to execute
+            interval_seconds: Poll interval (default: from settings)
+
+        Returns:
+            Job ID
+        """
+        interval = interval_seconds or self.settings.host_locator_interval_seconds
+
+        job = self.scheduler.add_job(
+            job_func,
+            trigger=IntervalTrigger(seconds=interval),
+            id="host_locator",
+            name="Host Locator",
+            replace_existing=True,
+        )
+
+        logger.info(
+            f"Added host locator job (interval: {interval}s)",
+            extra={
+                "job_id": job.id,
+                "interval_seconds": interval,
+            },
+        )
+
+        return job.id
+
+    def add_topology_job(
+        self,
+        job_func: Callable,
+        interval_seconds: int | None = None,
+    ) -> str:
+        """Add periodic topology graph refresh job.
+
+        Args:
+            job_func: Async function to execute
+            interval_seconds: Refresh interval (default: from settings)
+
+        Returns:
+            Job ID
+        """
+        interval = interval_seconds or self.settings.topology_interval_seconds
+
+        job = self.scheduler.add_job(
+            job_func,
+            trigger=IntervalTrigger(seconds=interval),
+            id="topology",
+            name="Topology Graph",
+            replace_existing=True,
+        )
+
+        logger.info(
+            f"Added topology job (interval: {interval}s)",
+            extra={
+                "job_id": job.id,
+                "interval_seconds": interval,
+            },
+        )
+
+        return job.id
+
     def add_health_check_job(
         self,
         device_id: str,
@@ -7,6 +7,7 @@ See docs/08-observability-logging-metrics-and-diagnostics.md for
 detailed requirements.
 """
 
+from routeros_mcp.infra.observability.exposition import MetricsExposition, accepts_gzip
 from routeros_mcp.infra.observability.logging import (
     CorrelationIDFilter,
     JSONFormatter,
@@ -16,6 +17,9 @@ from routeros_mcp.infra.observability.logging import (
     setup_logging,
 )
 from routeros_mcp.infra.observability.metrics import (
+    configure_metrics,
+    get_device_metrics,
+    get_device_metrics_text,
     get_metrics_text,
     get_registry,
     record_auth_check,
@@ -49,6 +53,11 @@ __all__ = [
     "JSONFormatter",
     "setup_logging",
     # Metrics
+    "MetricsExposition",
+    "accepts_gzip",
+    "configure_metrics",
+    "get_device_metrics",
+    "get_device_metrics_text",
     "get_registry",
     "get_metrics_text",
     "record_tool_call",
@@ -0,0 +1,162 @@
+"""Per-device metric series kept outside the Prometheus registry.
+
+Labelling registry metrics by ``device_id`` makes every scrape of
+``/metrics`` grow with the fleet (and multiplies histogram buckets by the
+device count). The registry therefore only carries bounded labels, and
+per-device values are kept here: one small dict of series per device and
+family, rendered in Prometheus text format one page of devices at a time
+(``/metrics/devices?page=N``).
+
+Histograms become summaries here (``_sum``/``_count`` per device), which
+keeps averages derivable without per-device buckets.
+
+Values are recorded on the event loop while ``/metrics`` may render in a
+worker thread; readers iterate over ``list()`` copies of the dicts (each
+taken in one step under the GIL) so concurrent inserts cannot break them.
+
+Example:
+    store = DeviceMetricsStore({"routeros_mcp_device_cpu_usage_percent": ("gauge", "CPU")})
+    store.set("routeros_mcp_device_cpu_usage_percent", "dev-1", 12.5, environment="lab")
+    text = store.render(page=1, page_size=500)
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from prometheus_client.utils import floatToGoString
+
+# Default devices per rendered page
+DEFAULT_PAGE_SIZE = 500
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _label_text(device_id: str, labels: LabelKey) -> str:
+    pairs = [f'device_id="{_escape(device_id)}"']
+    pairs.extend(f'{name}="{_escape(value)}"' for name, value in labels)
+    return "{" + ",".join(pairs) + "}"
+
+
+class DeviceMetricsStore:
+    """Per-device gauge, counter and summary series."""
+
+    def __init__(self, families: Mapping[str, tuple[str, str]]) -> None:
+        """Initialize the store.
+
+        Args:
+            families: Family name to (type, help); type is gauge, counter or summary
+        """
+        self.families = dict(families)
+        self._series: dict[str, dict[str, dict[LabelKey, list[float]]]] = {
+            name: {} for name in self.families
+        }
+        self._devices: set[str] = set()
+        self._sorted: list[str] | None = None
+
+    def _slot(self, family: str, device_id: str, labels: Mapping[str, Any]) -> list[float]:
+        if device_id not in self._devices:
+            self._devices.add(device_id)
+            self._sorted = None
+        key = tuple(sorted((name, str(value)) for name, value in labels.items()))
+        series = self._series[family].setdefault(device_id, {})
+        slot = series.get(key)
+        if slot is None:
+            slot = series[key] = [0.0, 0.0]
+        return slot
+
+    def set(self, family: str, device_id: str, value: float, **labels: Any) -> None:
+        """Set a gauge series."""
+        self._slot(family, device_id, labels)[0] = value
+
+    def inc(self, family: str, device_id: str, amount: float = 1.0, **labels: Any) -> None:
+        """Increment a counter series."""
+        self._slot(family, device_id, labels)[0] += amount
+
+    def observe(self, family: str, device_id: str, value: float, **labels: Any) -> None:
+        """Add an observation to a summary series (sum and count)."""
+        slot = self._slot(family, device_id, labels)
+        slot[0] += value
+        slot[1] += 1
+
+    def value(self, family: str, device_id: str, **labels: Any) -> float | None:
+        """Current value of a series (the sum for summaries), None if unset."""
+        key = tuple(sorted((name, str(value)) for name, value in labels.items()))
+        slot = self._series[family].get(device_id, {}).get(key)
+        return slot[0] if slot is not None else None
+
+    def values(self, family: str) -> list[tuple[str, LabelKey, float]]:
+        """All (device_id, labels, value) series of a family."""
+        return [
+            (device_id, key, slot[0])
+            for device_id, series in list(self._series[family].items())
+            for key, slot in list(series.items())
+        ]
+
+    def forget(self, device_id: str) -> None:
+        """Drop every series of a device."""
+        if device_id in self._devices:
+            self._devices.discard(device_id)
+            self._sorted = None
+            for series in self._series.values():
+                series.pop(device_id, None)
+
+    def clear(self) -> None:
+        """Drop every series."""
+        for series in self._series.values():
+            series.clear()
+        self._devices.clear()
+        self._sorted = None
+
+    @property
+    def device_count(self) -> int:
+        return len(self._devices)
+
+    def page_count(self, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        """Number of pages of ``page_size`` devices (at least 1)."""
+        return max(1, -(-len(self._devices) // page_size))
+
+    def render(self, page: int | None = None, page_size: int = DEFAULT_PAGE_SIZE) -> str:
+        """Series of one page of devices in Prometheus text format.
+
+        Devices are ordered by ID, so pages are stable while the device set
+        is unchanged.
+
+        Args:
+            page: 1-based page number (None renders every device)
+            page_size: Devices per page
+
+        Returns:
+            Exposition text (HELP/TYPE headers for every family, even empty)
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self._devices)
+        devices = self._sorted
+        if page is not None:
+            start = (page - 1) * page_size
+            devices = devices[start : start + page_size]
+
+        lines: list[str] = []
+        for family, (kind, help_text) in self.families.items():
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+            by_device = self._series[family]
+            for device_id in devices:
+                series = by_device.get(device_id)
+                if not series:
+                    continue
+                for key, (total, count) in list(series.items()):
+                    labels = _label_text(device_id, key)
+                    if kind == "summary":
+                        lines.append(f"{family}_sum{labels} {floatToGoString(total)}")
+                        lines.append(f"{family}_count{labels} {floatToGoString(count)}")
+                    else:
+                        lines.append(f"{family}{labels} {floatToGoString(total)}")
+        return "\n".join(lines) + "\n"
+
+
+__all__ = ["DEFAULT_PAGE_SIZE", "DeviceMetricsStore"]
@@ -0,0 +1,134 @@
+"""Cached ``/metrics`` exposition rendered off the event loop.
+
+Rendering the registry walks every metric family in Python; doing that on
+the event loop for each scrape stalls MCP requests, and several Prometheus
+servers scraping the same instance render identical text back to back.
+
+MetricsExposition renders in a worker thread (``asyncio.to_thread``) and
+keeps the payload for a short TTL: concurrent scrapes wait for the single
+render in progress, later scrapes within the TTL reuse it. The gzip body is
+compressed at most once per render, only when a scraper asks for it.
+
+Live fleet state is only safe to read on the event loop, so the renderer
+gets a copy of the fleet metrics snapshot taken before handing off (see
+metrics.fleet_metrics_source).
+
+Example:
+    exposition = MetricsExposition(ttl_seconds=5.0)
+    body = await exposition.get(gzip_encoded=accepts_gzip(accept_encoding))
+"""
+
+import asyncio
+import gzip
+import time
+from collections.abc import Callable
+
+from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.observability.fleet_metrics import (
+    FleetMetricsSnapshot,
+    get_fleet_metrics,
+)
+
+# Default time a rendered payload is reused
+DEFAULT_TTL_SECONDS = 5.0
+
+# gzip level: most of the size reduction of level 9 at a fraction of the CPU
+GZIP_LEVEL = 6
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an Accept-Encoding header allows gzip.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+
+    Returns:
+        True if gzip (or ``*``) is listed without ``q=0``
+    """
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class MetricsExposition:
+    """Short-lived cache of the rendered ``/metrics`` payload."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        render: Callable[[], str] = metrics.get_metrics_text,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Time a rendered payload is reused (0 renders per scrape)
+            render: Function returning the exposition text
+        """
+        self.ttl_seconds = ttl_seconds
+        self._render = render
+        self._lock = asyncio.Lock()
+        self._payload = b""
+        self._gzipped: bytes | None = None
+        self._rendered_at: float | None = None
+        self.renders = 0
+
+    def _stale(self) -> bool:
+        return (
+            self._rendered_at is None
+            or time.monotonic() - self._rendered_at >= self.ttl_seconds
+        )
+
+    def _render_in_thread(self, fleet: FleetMetricsSnapshot) -> tuple[bytes, float]:
+        start = time.perf_counter()
+        with metrics.fleet_metrics_source(fleet):
+            payload = self._render().encode("utf-8")
+        return payload, time.perf_counter() - start
+
+    async def _refresh(self) -> None:
+        fleet = get_fleet_metrics().copy()
+        payload, duration = await asyncio.to_thread(self._render_in_thread, fleet)
+        self._payload = payload
+        self._gzipped = None
+        self._rendered_at = time.monotonic()
+        self.renders += 1
+        metrics.record_metrics_render(duration, len(payload))
+
+    async def get(self, gzip_encoded: bool = False) -> bytes:
+        """Rendered exposition, from the cache while it is fresh.
+
+        Args:
+            gzip_encoded: Return the gzip-compressed payload
+
+        Returns:
+            Exposition bytes (UTF-8 text, or gzip of it)
+        """
+        seen = self.renders
+        async with self._lock:
+            # A render that finished while this scrape waited is shared
+            # even if it is already older than the TTL
+            if self.renders == seen and self._stale():
+                await self._refresh()
+            if not gzip_encoded:
+                return self._payload
+            if self._gzipped is None:
+                self._gzipped = await asyncio.to_thread(
+                    gzip.compress, self._payload, GZIP_LEVEL
+                )
+                metrics.record_metrics_render(0.0, len(self._gzipped), encoding="gzip")
+            return self._gzipped
+
+    def invalidate(self) -> None:
+        """Render again on the next scrape."""
+        self._rendered_at = None
+
+
+__all__ = ["DEFAULT_TTL_SECONDS", "MetricsExposition", "accepts_gzip"]
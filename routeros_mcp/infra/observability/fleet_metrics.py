@@ -0,0 +1,523 @@
+"""Columnar in-memory snapshot of the latest per-device health metrics.
+
+Fleet views (``fleet://health-summary``, ``get_fleet_metrics``) need
+percentiles, top-K devices and per-environment/per-tag breakdowns over
+the latest health result of every device. Walking HealthCheckResult
+objects for each read does not scale to large fleets, so
+HealthService.run_health_check records every result here instead.
+
+Storage is one row per device across flat columns:
+- metrics as ``array("d")`` (NaN when a device did not report a value)
+- dimensions (environment, status, hardware model, one column per tag
+  key) as dictionary-encoded ``array("I")`` codes, 0 meaning "absent"
+
+Queries combine dimension masks and finite-value masks with
+``itertools.compress``/``map`` and reduce with ``sorted``/``heapq``, so the
+per-device work runs in C rather than in a Python loop. Removing a device
+swaps the last row into its slot, keeping columns dense.
+
+Example:
+    snapshot = get_fleet_metrics()
+    snapshot.record_health(device, health_result)
+    snapshot.aggregate("cpu_usage_percent", environment="prod")
+    snapshot.top_k("memory_usage_percent", 5)
+    snapshot.breakdown("cpu_usage_percent", "tag:site")
+"""
+
+import heapq
+import math
+import time
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import compress
+from operator import and_
+from typing import Any
+
+from routeros_mcp.infra.observability.stats import percentile
+
+# Metric columns, in HealthCheckResult attribute names
+METRICS = ("cpu_usage_percent", "memory_usage_percent", "uptime_seconds")
+
+# Percentiles reported by aggregate()
+DEFAULT_PERCENTILES = (50, 95)
+
+# Dimensions usable for filtering and grouping besides "tag:<key>"
+_BUILTIN_DIMENSIONS = ("environment", "status", "model")
+_TAG_PREFIX = "tag:"
+
+_NAN = float("nan")
+
+
+class _Dimension:
+    """Dictionary-encoded string column (code 0 = absent)."""
+
+    __slots__ = ("values", "codes", "column")
+
+    def __init__(self, rows: int = 0) -> None:
+        # values[0] is a placeholder for the "absent" code and never reported
+        self.values: list[str] = [""]
+        self.codes: dict[str, int] = {}
+        self.column: array[int] = array("I", bytes(4 * rows))
+
+    def encode(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def copy(self) -> "_Dimension":
+        clone = _Dimension()
+        clone.values = list(self.values)
+        clone.codes = dict(self.codes)
+        clone.column = array("I", self.column)
+        return clone
+
+    def value(self, row: int) -> str | None:
+        code = self.column[row]
+        return self.values[code] if code else None
+
+    def mask(self, value: str) -> Iterator[bool]:
+        """Row selector for ``value`` (all False if never seen)."""
+        code = self.codes.get(value, -1)
+        return map(code.__eq__, self.column)
+
+
+def _summarize(values: Iterable[float], percentiles: Iterable[int]) -> dict[str, Any]:
+    """Count, min, mean, percentiles and max of the finite values."""
+    ordered = sorted(filter(math.isfinite, values))
+    if not ordered:
+        return {"count": 0}
+    summary: dict[str, Any] = {
+        "count": len(ordered),
+        "min": round(ordered[0], 2),
+        "mean": round(math.fsum(ordered) / len(ordered), 2),
+    }
+    for q in percentiles:
+        summary[f"p{q}"] = round(percentile(ordered, q), 2)
+    summary["max"] = round(ordered[-1], 2)
+    return summary
+
+
+class FleetMetricsSnapshot:
+    """Latest health metrics per device, stored column-wise.
+
+    Code querying from another thread (the /metrics renderer) works on a
+    copy() taken on the event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty snapshot."""
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._updated: array[float] = array("d")
+        self._metrics: dict[str, array[float]] = {name: array("d") for name in METRICS}
+        self._dimensions = {name: _Dimension() for name in _BUILTIN_DIMENSIONS}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def copy(self) -> "FleetMetricsSnapshot":
+        """Independent copy of the current rows."""
+        clone = FleetMetricsSnapshot()
+        clone._ids = list(self._ids)
+        clone._rows = dict(self._rows)
+        clone._updated = array("d", self._updated)
+        clone._metrics = {name: array("d", column) for name, column in self._metrics.items()}
+        clone._dimensions = {name: dim.copy() for name, dim in self._dimensions.items()}
+        return clone
+
+    def __contains__(self, device_id: object) -> bool:
+        return device_id in self._rows
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _append_row(self, device_id: str) -> int:
+        row = len(self._ids)
+        self._ids.append(device_id)
+        self._rows[device_id] = row
+        self._updated.append(0.0)
+        for column in self._metrics.values():
+            column.append(_NAN)
+        for dimension in self._dimensions.values():
+            dimension.column.append(0)
+        return row
+
+    def record(
+        self,
+        device_id: str,
+        *,
+        environment: str | None,
+        status: str,
+        tags: Mapping[str, Any] | Iterable[str] | None = None,
+        metrics: Mapping[str, float | None] | None = None,
+        model: str | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Store the latest metrics of a device, replacing earlier values.
+
+        Args:
+            device_id: Device identifier
+            environment: Device environment
+            status: Health status (healthy/degraded/unreachable)
+            tags: Device tags (key/value mapping; bare labels count as "true",
+                tags with a None or empty value are treated as absent)
+            metrics: Metric values by name (see METRICS); missing means unknown
+            model: Hardware model (None or empty when unknown)
+            timestamp: Result time (Unix seconds, default now)
+        """
+        row = self._rows.get(device_id)
+        if row is None:
+            row = self._append_row(device_id)
+
+        self._updated[row] = timestamp if timestamp is not None else time.time()
+        metrics = metrics or {}
+        for name, column in self._metrics.items():
+            value = metrics.get(name)
+            column[row] = _NAN if value is None else float(value)
+
+        dimensions = self._dimensions
+        dimensions["environment"].column[row] = dimensions["environment"].encode(environment)
+        dimensions["status"].column[row] = dimensions["status"].encode(status)
+        dimensions["model"].column[row] = dimensions["model"].encode(model or None)
+
+        if isinstance(tags, Mapping):
+            tag_items = {
+                str(key): str(value) for key, value in tags.items() if value not in (None, "")
+            }
+        else:
+            tag_items = {str(label): "true" for label in tags or ()}
+        for key in tag_items:
+            if _TAG_PREFIX + key not in dimensions:
+                dimensions[_TAG_PREFIX + key] = _Dimension(len(self._ids))
+        for name, dimension in dimensions.items():
+            if name.startswith(_TAG_PREFIX):
+                dimension.column[row] = dimension.encode(tag_items.get(name[len(_TAG_PREFIX) :]))
+
+    def record_health(self, device: Any, result: Any) -> None:
+        """Store a HealthCheckResult for a device.
+
+        Args:
+            device: Device (``id``, ``environment``, ``tags`` and
+                ``hardware_model`` are used)
+            result: Health check result
+        """
+        timestamp = getattr(result, "timestamp", None)
+        self.record(
+            device.id,
+            environment=getattr(device, "environment", None),
+            status=result.status,
+            tags=getattr(device, "tags", None),
+            metrics={name: getattr(result, name, None) for name in METRICS},
+            model=getattr(device, "hardware_model", None),
+            timestamp=timestamp.timestamp() if timestamp is not None else None,
+        )
+
+    def remove(self, device_id: str) -> bool:
+        """Drop a device, moving the last row into its slot.
+
+        Returns:
+            True if the device was present
+        """
+        row = self._rows.pop(device_id, None)
+        if row is None:
+            return False
+        last = len(self._ids) - 1
+        columns = [self._updated, *self._metrics.values()]
+        code_columns = [dimension.column for dimension in self._dimensions.values()]
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+            for column in columns:
+                column[row] = column[last]
+            for code_column in code_columns:
+                code_column[row] = code_column[last]
+        self._ids.pop()
+        for column in columns:
+            column.pop()
+        for code_column in code_columns:
+            code_column.pop()
+        return True
+
+    def retain(self, device_ids: Iterable[str]) -> int:
+        """Drop every device not in ``device_ids``.
+
+        Returns:
+            Number of devices removed
+        """
+        keep = set(device_ids)
+        removed = [device_id for device_id in self._ids if device_id not in keep]
+        for device_id in removed:
+            self.remove(device_id)
+        return len(removed)
+
+    def last_updated(self, device_id: str) -> float | None:
+        """Time of the latest recorded result of a device (Unix seconds)."""
+        row = self._rows.get(device_id)
+        return self._updated[row] if row is not None else None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _column(self, metric: str) -> "array[float]":
+        try:
+            return self._metrics[metric]
+        except KeyError:
+            raise ValueError(
+                f"Unknown metric {metric!r}; expected one of {', '.join(METRICS)}"
+            ) from None
+
+    def _dimension(self, name: str) -> _Dimension | None:
+        if name not in _BUILTIN_DIMENSIONS and not name.startswith(_TAG_PREFIX):
+            raise ValueError(
+                f"Unknown dimension {name!r}; expected environment, status, model or tag:<key>"
+            )
+        return self._dimensions.get(name)
+
+    def _selector(
+        self,
+        environment: str | None,
+        status: str | None,
+        tag: str | None,
+    ) -> Iterator[bool] | None:
+        """Combined row mask for the filters, or None to select every row."""
+        masks: list[Iterator[bool]] = []
+        if environment is not None:
+            masks.append(self._dimensions["environment"].mask(environment))
+        if status is not None:
+            masks.append(self._dimensions["status"].mask(status))
+        if tag is not None:
+            key, _, value = tag.partition("=")
+            dimension = self._dimensions.get(_TAG_PREFIX + key)
+            if dimension is None:
+                masks.append(iter([False] * len(self._ids)))
+            elif value:
+                masks.append(dimension.mask(value))
+            else:
+                masks.append(map(bool, dimension.column))
+        if not masks:
+            return None
+        selector = masks[0]
+        for mask in masks[1:]:
+            selector = map(and_, selector, mask)
+        return selector
+
+    def _values(self, column: "array[float]", selector: Iterator[bool] | None) -> Iterable[float]:
+        return column if selector is None else compress(column, selector)
+
+    def _codes(self, dimension: _Dimension, selector: Iterator[bool] | None) -> Iterable[int]:
+        column = dimension.column
+        return column if selector is None else compress(column, selector)
+
+    def status_counts(
+        self,
+        *,
+        environment: str | None = None,
+        tag: str | None = None,
+    ) -> dict[str, int]:
+        """Number of devices per health status."""
+        dimension = self._dimensions["status"]
+        codes = self._codes(dimension, self._selector(environment, None, tag))
+        counts = Counter(codes)
+        return {
+            dimension.values[code]: count
+            for code, count in sorted(counts.items())
+            if code
+        }
+
+    def status_counts_by(self, group_by: str) -> dict[str, dict[str, int]]:
+        """Number of devices per health status for each value of a dimension.
+
+        Args:
+            group_by: ``environment``, ``model`` or ``tag:<key>``
+
+        Returns:
+            Mapping of dimension value to status counts (devices without
+            the dimension are left out)
+
+        Raises:
+            ValueError: If the dimension is unknown
+        """
+        dimension = self._dimension(group_by)
+        if dimension is None:
+            return {}
+        status = self._dimensions["status"]
+        # Rows without the dimension or a status are left out before counting
+        present = (
+            (code, status_code)
+            for code, status_code in zip(dimension.column, status.column, strict=True)
+            if code and status_code
+        )
+        groups: dict[str, dict[str, int]] = {}
+        for (code, status_code), count in sorted(Counter(present).items()):
+            group = groups.setdefault(dimension.values[code], {})
+            group[status.values[status_code]] = count
+        return groups
+
+    def aggregate(
+        self,
+        metric: str,
+        *,
+        environment: str | None = None,
+        status: str | None = None,
+        tag: str | None = None,
+        percentiles: Iterable[int] = DEFAULT_PERCENTILES,
+    ) -> dict[str, Any]:
+        """Count, min, mean, percentiles and max of a metric.
+
+        Args:
+            metric: Metric name (see METRICS)
+            environment: Only devices in this environment
+            status: Only devices with this health status
+            tag: Only devices with this tag (``key=value``, or ``key`` for any value)
+            percentiles: Percentiles to report (0-100)
+
+        Returns:
+            Summary dict; ``count`` is 0 (and nothing else set) without data
+
+        Raises:
+            ValueError: If the metric is unknown
+        """
+        column = self._column(metric)
+        return _summarize(
+            self._values(column, self._selector(environment, status, tag)), percentiles
+        )
+
+    def breakdown(
+        self,
+        metric: str,
+        group_by: str,
+        *,
+        environment: str | None = None,
+        status: str | None = None,
+        tag: str | None = None,
+        percentiles: Iterable[int] = DEFAULT_PERCENTILES,
+    ) -> dict[str, dict[str, Any]]:
+        """Metric summary per value of a dimension.
+
+        Args:
+            metric: Metric name (see METRICS)
+            group_by: ``environment``, ``status``, ``model`` or ``tag:<key>``
+            environment: Only devices in this environment
+            status: Only devices with this health status
+            tag: Only devices with this tag (``key=value``, or ``key``)
+            percentiles: Percentiles to report (0-100)
+
+        Returns:
+            Mapping of dimension value to summary (devices without the
+            dimension are left out), plus ``devices`` per group
+
+        Raises:
+            ValueError: If the metric or dimension is unknown
+        """
+        column = self._column(metric)
+        dimension = self._dimension(group_by)
+        if dimension is None:
+            return {}
+        selector = self._selector(environment, status, tag)
+        codes = self._codes(dimension, selector)
+        if selector is not None:
+            # The selector is consumed by the first compress; rebuild it
+            selector = self._selector(environment, status, tag)
+        # One pass buckets every value by group code
+        buckets: dict[int, list[float]] = {}
+        for code, value in zip(codes, self._values(column, selector), strict=True):
+            bucket = buckets.get(code)
+            if bucket is None:
+                bucket = buckets[code] = []
+            bucket.append(value)
+        percentiles = tuple(percentiles)
+        return {
+            dimension.values[code]: {"devices": len(values), **_summarize(values, percentiles)}
+            for code, values in sorted(buckets.items())
+            if code
+        }
+
+    def top_k(
+        self,
+        metric: str,
+        k: int = 10,
+        *,
+        environment: str | None = None,
+        status: str | None = None,
+        tag: str | None = None,
+        lowest: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Devices with the highest (or lowest) value of a metric.
+
+        Args:
+            metric: Metric name (see METRICS)
+            k: Number of devices to return
+            environment: Only devices in this environment
+            status: Only devices with this health status
+            tag: Only devices with this tag (``key=value``, or ``key``)
+            lowest: Return the lowest values instead
+
+        Returns:
+            Rows with device_id, environment, status and the metric value
+
+        Raises:
+            ValueError: If the metric is unknown
+        """
+        column = self._column(metric)
+        selector: Iterator[bool] = map(math.isfinite, column)
+        mask = self._selector(environment, status, tag)
+        if mask is not None:
+            selector = map(and_, selector, mask)
+        rows = compress(range(len(self._ids)), selector)
+        pick = heapq.nsmallest if lowest else heapq.nlargest
+        return [
+            {
+                "device_id": self._ids[row],
+                "environment": self._dimensions["environment"].value(row),
+                "status": self._dimensions["status"].value(row),
+                metric: round(column[row], 2),
+            }
+            for row in pick(k, rows, key=column.__getitem__)
+        ]
+
+    def devices(
+        self,
+        *,
+        environment: str | None = None,
+        status: str | None = None,
+        tag: str | None = None,
+    ) -> list[str]:
+        """Device IDs matching the filters."""
+        selector = self._selector(environment, status, tag)
+        return list(self._ids if selector is None else compress(self._ids, selector))
+
+
+# Global snapshot instance
+_snapshot_instance: FleetMetricsSnapshot | None = None
+
+
+def reset_fleet_metrics() -> None:
+    """Reset the global snapshot instance (primarily for testing)."""
+    global _snapshot_instance
+    _snapshot_instance = None
+
+
+def get_fleet_metrics() -> FleetMetricsSnapshot:
+    """Get the global fleet metrics snapshot, creating it if needed."""
+    global _snapshot_instance
+    if _snapshot_instance is None:
+        _snapshot_instance = FleetMetricsSnapshot()
+    return _snapshot_instance
+
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "METRICS",
+    "FleetMetricsSnapshot",
+    "get_fleet_metrics",
+    "reset_fleet_metrics",
+]
@@ -3,11 +3,24 @@
 Provides metrics collection for MCP operations, RouterOS requests,
 health checks, and plan/job execution.
 
+Registry metrics only carry bounded labels (environment, kind, method,
+status, ...), so ``/metrics`` does not grow with the fleet:
+- device health gauges are fleet aggregates (device counts per status and
+  CPU/memory mean/p50/p95/max) per environment, hardware model and
+  configured tag keys, computed from the fleet metrics snapshot at scrape
+  time
+- per-device series live in a DeviceMetricsStore, served page by page
+  (get_device_metrics_text) and appended to ``/metrics`` only when
+  per-device mode is configured
+
 See docs/08-observability-logging-metrics-and-diagnostics.md for
 detailed requirements.
 """
 
 import logging
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import cast
 
 from prometheus_client import (
@@ -17,6 +30,16 @@ from prometheus_client import (
     Histogram,
     generate_latest,
 )
+from prometheus_client.core import GaugeMetricFamily, Metric
+
+from routeros_mcp.infra.observability.device_metrics import (
+    DEFAULT_PAGE_SIZE,
+    DeviceMetricsStore,
+)
+from routeros_mcp.infra.observability.fleet_metrics import (
+    FleetMetricsSnapshot,
+    get_fleet_metrics,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,51 +67,51 @@ mcp_tool_duration_seconds = Histogram(
 routeros_requests_total = Counter(
     "routeros_mcp_routeros_requests_total",
     "Total number of RouterOS API requests",
-    ["device_id", "environment", "method", "status"],
+    ["environment", "method", "status"],
     registry=_registry,
 )
 
 routeros_request_duration_seconds = Histogram(
     "routeros_mcp_routeros_request_duration_seconds",
     "Duration of RouterOS API requests in seconds",
-    ["device_id", "method"],
+    ["environment", "method"],
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
     registry=_registry,
 )
 
-# Health Check Metrics
-health_checks_total = Counter(
-    "routeros_mcp_health_checks_total",
-    "Total number of health checks performed",
-    ["device_id", "status"],
+# SSH Connection Pool Metrics
+ssh_pool_requests_total = Counter(
+    "routeros_mcp_ssh_pool_requests_total",
+    "Total number of SSH connection acquisitions by pool result",
+    ["result"],
     registry=_registry,
 )
 
-device_health_status = Gauge(
-    "routeros_mcp_device_health_status",
-    "Device health status (1=healthy, 0.5=degraded, 0=unreachable)",
-    ["device_id", "environment"],
+ssh_handshake_duration_seconds = Histogram(
+    "routeros_mcp_ssh_handshake_duration_seconds",
+    "Duration of SSH connect + key exchange + authentication",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
     registry=_registry,
 )
 
-device_cpu_usage_percent = Gauge(
-    "routeros_mcp_device_cpu_usage_percent",
-    "Device CPU usage percentage",
-    ["device_id", "environment"],
+ssh_pool_connections = Gauge(
+    "routeros_mcp_ssh_pool_connections",
+    "Current number of open pooled SSH connections",
     registry=_registry,
 )
 
-device_memory_usage_percent = Gauge(
-    "routeros_mcp_device_memory_usage_percent",
-    "Device memory usage percentage",
-    ["device_id", "environment"],
+ssh_pool_evictions_total = Counter(
+    "routeros_mcp_ssh_pool_evictions_total",
+    "Total number of pooled SSH connections closed by reason",
+    ["reason"],
     registry=_registry,
 )
 
-device_uptime_seconds = Gauge(
-    "routeros_mcp_device_uptime_seconds",
-    "Device uptime in seconds",
-    ["device_id", "environment"],
+# Health Check Metrics
+health_checks_total = Counter(
+    "routeros_mcp_health_checks_total",
+    "Total number of health checks performed",
+    ["environment", "status"],
     registry=_registry,
 )
 
@@ -197,14 +220,14 @@ cache_size_entries = Gauge(
 snapshot_capture_total = Counter(
     "routeros_mcp_snapshot_capture_total",
     "Total number of snapshot capture attempts",
-    ["device_id", "kind", "source", "status"],
+    ["kind", "source", "status"],
     registry=_registry,
 )
 
 snapshot_size_bytes = Histogram(
     "routeros_mcp_snapshot_size_bytes",
     "Size of captured snapshots in bytes (uncompressed)",
-    ["device_id", "kind"],
+    ["kind"],
     buckets=(1024, 10240, 102400, 1048576, 10485760),  # 1KB to 10MB
     registry=_registry,
 )
@@ -212,7 +235,7 @@ snapshot_size_bytes = Histogram(
 snapshot_compression_ratio = Histogram(
     "routeros_mcp_snapshot_compression_ratio",
     "Snapshot compression ratio (compressed_size / original_size)",
-    ["device_id", "kind"],
+    ["kind"],
     buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
     registry=_registry,
 )
@@ -220,29 +243,22 @@ snapshot_compression_ratio = Histogram(
 snapshot_retention_pruned = Counter(
     "routeros_mcp_snapshot_retention_pruned",
     "Number of snapshots pruned by retention policy",
-    ["device_id", "kind"],
+    ["kind"],
     registry=_registry,
 )
 
 snapshot_capture_duration_seconds = Histogram(
     "routeros_mcp_snapshot_capture_duration_seconds",
     "Duration of snapshot capture operations in seconds",
-    ["device_id", "kind"],
+    ["kind"],
     buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0),
     registry=_registry,
 )
 
-snapshot_age_seconds = Gauge(
-    "routeros_mcp_snapshot_age_seconds",
-    "Age of latest snapshot in seconds (time since capture)",
-    ["device_id", "kind"],
-    registry=_registry,
-)
-
 snapshot_missing_total = Counter(
     "routeros_mcp_snapshot_missing_total",
     "Number of times a snapshot was requested but not found",
-    ["device_id", "kind"],
+    ["kind"],
     registry=_registry,
 )
 
@@ -285,7 +301,7 @@ resource_notifications_dropped_total = Counter(
 sse_events_sent_total = Counter(
     "routeros_mcp_sse_events_sent_total",
     "Total number of SSE events sent to clients",
-    ["resource_type", "device_id"],
+    ["resource_type"],
     registry=_registry,
 )
 
@@ -323,6 +339,241 @@ authz_checks_total = Counter(
     registry=_registry,
 )
 
+# Exposition Metrics (the /metrics endpoint itself)
+metrics_render_duration_seconds = Histogram(
+    "routeros_mcp_metrics_render_duration_seconds",
+    "Time to render the /metrics exposition in seconds",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+    registry=_registry,
+)
+
+metrics_payload_bytes = Gauge(
+    "routeros_mcp_metrics_payload_bytes",
+    "Size of the latest /metrics payload in bytes",
+    ["encoding"],
+    registry=_registry,
+)
+
+
+# Per-device series (see device_metrics); histograms become summaries
+_device_metrics = DeviceMetricsStore(
+    {
+        "routeros_mcp_device_health_status": (
+            "gauge",
+            "Device health status (1=healthy, 0.5=degraded, 0=unreachable)",
+        ),
+        "routeros_mcp_device_cpu_usage_percent": ("gauge", "Device CPU usage percentage"),
+        "routeros_mcp_device_memory_usage_percent": ("gauge", "Device memory usage percentage"),
+        "routeros_mcp_device_uptime_seconds": ("gauge", "Device uptime in seconds"),
+        "routeros_mcp_device_health_checks_total": (
+            "counter",
+            "Health checks performed per device",
+        ),
+        "routeros_mcp_device_routeros_requests_total": (
+            "counter",
+            "RouterOS API requests per device",
+        ),
+        "routeros_mcp_device_routeros_request_duration_seconds": (
+            "summary",
+            "Duration of RouterOS API requests per device in seconds",
+        ),
+        "routeros_mcp_device_snapshot_capture_total": (
+            "counter",
+            "Snapshot capture attempts per device",
+        ),
+        "routeros_mcp_device_snapshot_capture_duration_seconds": (
+            "summary",
+            "Duration of snapshot capture operations per device in seconds",
+        ),
+        "routeros_mcp_device_snapshot_size_bytes": (
+            "gauge",
+            "Size of the latest captured snapshot in bytes (uncompressed)",
+        ),
+        "routeros_mcp_device_snapshot_compression_ratio": (
+            "gauge",
+            "Compression ratio of the latest captured snapshot",
+        ),
+        "routeros_mcp_device_snapshot_age_seconds": (
+            "gauge",
+            "Age of latest snapshot in seconds (time since capture)",
+        ),
+        "routeros_mcp_device_snapshot_missing_total": (
+            "counter",
+            "Snapshot requests per device that found no snapshot",
+        ),
+        "routeros_mcp_device_snapshot_retention_pruned_total": (
+            "counter",
+            "Snapshots pruned by retention policy per device",
+        ),
+        "routeros_mcp_device_sse_events_sent_total": (
+            "counter",
+            "SSE events sent to clients per device",
+        ),
+    }
+)
+
+# Metrics mode (see configure_metrics)
+_per_device_metrics = False
+_group_by_tags: tuple[str, ...] = ()
+
+# Fleet snapshot read by FleetMetricsCollector instead of the live one
+# (see fleet_metrics_source)
+_fleet_source: ContextVar[FleetMetricsSnapshot | None] = ContextVar(
+    "routeros_mcp_fleet_source", default=None
+)
+
+# Statistics exported for fleet CPU/memory gauges
+_FLEET_STATS = ("mean", "p50", "p95", "max")
+
+
+class FleetMetricsCollector:
+    """Fleet-level health gauges computed at scrape time.
+
+    Reads the fleet metrics snapshot (latest health result per device) and
+    exports, per environment, hardware model and configured tag key:
+    - ``routeros_mcp_fleet_devices{group_by, group, status}``
+    - ``routeros_mcp_fleet_cpu_usage_percent{group_by, group, stat}``
+    - ``routeros_mcp_fleet_memory_usage_percent{group_by, group, stat}``
+
+    plus ``routeros_mcp_snapshot_age_seconds{kind}``, the age of the oldest
+    latest snapshot across devices.
+    """
+
+    def describe(self) -> list[Metric]:
+        """Skip collection at registration time."""
+        return []
+
+    def collect(self) -> Iterator[Metric]:
+        """Yield fleet gauges from the current snapshot."""
+        snapshot = _fleet_source.get()
+        if snapshot is None:
+            snapshot = get_fleet_metrics()
+        group_bys = ["environment", "model", *(f"tag:{key}" for key in _group_by_tags)]
+
+        devices = GaugeMetricFamily(
+            "routeros_mcp_fleet_devices",
+            "Devices per health status (latest health check)",
+            labels=["group_by", "group", "status"],
+        )
+        usage = {
+            metric: GaugeMetricFamily(
+                f"routeros_mcp_fleet_{metric}",
+                f"Device {label} percentage across the group (latest health check)",
+                labels=["group_by", "group", "stat"],
+            )
+            for metric, label in (
+                ("cpu_usage_percent", "CPU usage"),
+                ("memory_usage_percent", "memory usage"),
+            )
+        }
+        for group_by in group_bys:
+            for group, counts in snapshot.status_counts_by(group_by).items():
+                for status, count in counts.items():
+                    devices.add_metric([group_by, group, status], count)
+            for metric, family in usage.items():
+                for group, summary in snapshot.breakdown(metric, group_by).items():
+                    if not summary["count"]:
+                        continue
+                    for stat in _FLEET_STATS:
+                        family.add_metric([group_by, group, stat], summary[stat])
+
+        snapshot_age = GaugeMetricFamily(
+            "routeros_mcp_snapshot_age_seconds",
+            "Age of the oldest latest snapshot across devices in seconds",
+            labels=["kind"],
+        )
+        oldest: dict[str, float] = {}
+        for _device_id, labels, age in _device_metrics.values(
+            "routeros_mcp_device_snapshot_age_seconds"
+        ):
+            kind = dict(labels).get("kind", "")
+            oldest[kind] = max(age, oldest.get(kind, 0.0))
+        for kind, age in sorted(oldest.items()):
+            snapshot_age.add_metric([kind], age)
+
+        yield devices
+        yield from usage.values()
+        yield snapshot_age
+
+
+_registry.register(FleetMetricsCollector())
+
+
+@contextmanager
+def fleet_metrics_source(snapshot: FleetMetricsSnapshot) -> Iterator[None]:
+    """Collect fleet gauges from ``snapshot`` instead of the live snapshot.
+
+    Used when rendering in a worker thread: the live snapshot is only safe
+    to read on the event loop, so the renderer gets a copy taken there.
+
+    Args:
+        snapshot: Snapshot to read while the context is active
+    """
+    token = _fleet_source.set(snapshot)
+    try:
+        yield
+    finally:
+        _fleet_source.reset(token)
+
+
+def configure_metrics(
+    per_device: bool = False,
+    group_by_tags: Iterable[str] = (),
+) -> None:
+    """Configure the metrics mode.
+
+    Args:
+        per_device: Append per-device series to get_metrics_text() (series
+            count grows with the fleet; the paged device exporter is
+            available either way)
+        group_by_tags: Device tag keys to break fleet gauges down by, in
+            addition to environment and hardware model
+    """
+    global _per_device_metrics, _group_by_tags
+    _per_device_metrics = per_device
+    _group_by_tags = tuple(group_by_tags)
+
+
+def get_device_metrics() -> DeviceMetricsStore:
+    """Get the per-device series store.
+
+    Returns:
+        DeviceMetricsStore shared by the record_* helpers
+    """
+    return _device_metrics
+
+
+def forget_device(device_id: str) -> None:
+    """Drop a deleted or decommissioned device from per-device and fleet metrics.
+
+    Args:
+        device_id: Device identifier
+    """
+    _device_metrics.forget(device_id)
+    get_fleet_metrics().remove(device_id)
+
+
+def reset_device_metrics() -> None:
+    """Drop per-device series and restore the default metrics mode (for tests)."""
+    _device_metrics.clear()
+    configure_metrics()
+
+
+def get_device_metrics_text(
+    page: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> str:
+    """Get one page of per-device series in Prometheus text format.
+
+    Args:
+        page: 1-based page number (devices ordered by ID)
+        page_size: Devices per page
+
+    Returns:
+        Per-device metrics in Prometheus exposition format
+    """
+    return _device_metrics.render(page=page, page_size=page_size)
+
 
 def get_registry() -> CollectorRegistry:
     """Get the metrics registry.
@@ -336,10 +587,29 @@ def get_registry() -> CollectorRegistry:
 def get_metrics_text() -> str:
     """Get metrics in Prometheus text format.
 
+    Per-device series are included only in per-device mode (see
+    configure_metrics).
+
     Returns:
         Metrics in Prometheus exposition format
     """
-    return cast(str, generate_latest(_registry).decode("utf-8"))
+    text = cast(str, generate_latest(_registry).decode("utf-8"))
+    if _per_device_metrics:
+        text += _device_metrics.render()
+    return text
+
+
+def record_metrics_render(duration: float, size_bytes: int, encoding: str = "identity") -> None:
+    """Record a /metrics render.
+
+    Args:
+        duration: Render time in seconds (0 to only update the payload size)
+        size_bytes: Payload size in bytes
+        encoding: Payload encoding (identity/gzip)
+    """
+    if duration:
+        metrics_render_duration_seconds.observe(duration)
+    metrics_payload_bytes.labels(encoding=encoding).set(size_bytes)
 
 
 def record_tool_call(
@@ -379,12 +649,52 @@ def record_routeros_request(
         success: Whether the request succeeded
     """
     status = "success" if success else "error"
-    routeros_requests_total.labels(
-        device_id=device_id, environment=environment, method=method, status=status
-    ).inc()
-    routeros_request_duration_seconds.labels(device_id=device_id, method=method).observe(
+    routeros_requests_total.labels(environment=environment, method=method, status=status).inc()
+    routeros_request_duration_seconds.labels(environment=environment, method=method).observe(
         duration
     )
+    _device_metrics.inc(
+        "routeros_mcp_device_routeros_requests_total", device_id, method=method, status=status
+    )
+    _device_metrics.observe(
+        "routeros_mcp_device_routeros_request_duration_seconds", device_id, duration, method=method
+    )
+
+
+def record_ssh_pool_request(hit: bool) -> None:
+    """Record an SSH connection acquisition.
+
+    Args:
+        hit: Whether an open pooled connection was reused
+    """
+    ssh_pool_requests_total.labels(result="hit" if hit else "miss").inc()
+
+
+def record_ssh_handshake(duration: float) -> None:
+    """Record the duration of a new SSH connection handshake.
+
+    Args:
+        duration: Connect + authentication time in seconds
+    """
+    ssh_handshake_duration_seconds.observe(duration)
+
+
+def update_ssh_pool_connections(count: int) -> None:
+    """Update the open pooled SSH connections gauge.
+
+    Args:
+        count: Current number of pooled connections
+    """
+    ssh_pool_connections.set(count)
+
+
+def record_ssh_pool_eviction(reason: str) -> None:
+    """Record a pooled SSH connection being closed.
+
+    Args:
+        reason: Why it was closed (idle, closed, capacity, shutdown)
+    """
+    ssh_pool_evictions_total.labels(reason=reason).inc()
 
 
 def record_health_check(
@@ -405,29 +715,39 @@ def record_health_check(
         memory_percent: Memory usage percentage
         uptime_seconds: Device uptime in seconds
     """
-    health_checks_total.labels(device_id=device_id, status=status).inc()
+    health_checks_total.labels(environment=environment, status=status).inc()
+    _device_metrics.inc("routeros_mcp_device_health_checks_total", device_id, status=status)
 
     # Convert status to numeric
     status_value = {"healthy": 1.0, "degraded": 0.5, "unreachable": 0.0}.get(
         status, 0.0
     )
-    device_health_status.labels(device_id=device_id, environment=environment).set(
-        status_value
+    _device_metrics.set(
+        "routeros_mcp_device_health_status", device_id, status_value, environment=environment
     )
 
     if cpu_percent is not None:
-        device_cpu_usage_percent.labels(device_id=device_id, environment=environment).set(
-            cpu_percent
+        _device_metrics.set(
+            "routeros_mcp_device_cpu_usage_percent",
+            device_id,
+            cpu_percent,
+            environment=environment,
         )
 
     if memory_percent is not None:
-        device_memory_usage_percent.labels(
-            device_id=device_id, environment=environment
-        ).set(memory_percent)
+        _device_metrics.set(
+            "routeros_mcp_device_memory_usage_percent",
+            device_id,
+            memory_percent,
+            environment=environment,
+        )
 
     if uptime_seconds is not None:
-        device_uptime_seconds.labels(device_id=device_id, environment=environment).set(
-            uptime_seconds
+        _device_metrics.set(
+            "routeros_mcp_device_uptime_seconds",
+            device_id,
+            uptime_seconds,
+            environment=environment,
         )
 
 
@@ -582,10 +902,72 @@ def record_snapshot_capture(
         kind: Snapshot kind (e.g., "config")
         duration: Capture duration in seconds
     """
-    snapshot_capture_duration_seconds.labels(
-        device_id=device_id,
+    snapshot_capture_duration_seconds.labels(kind=kind).observe(duration)
+    _device_metrics.observe(
+        "routeros_mcp_device_snapshot_capture_duration_seconds", device_id, duration, kind=kind
+    )
+
+
+def record_snapshot_result(
+    device_id: str,
+    kind: str,
+    source: str,
+    status: str,
+) -> None:
+    """Record a snapshot capture attempt.
+
+    Args:
+        device_id: Device identifier
+        kind: Snapshot kind (e.g., "config")
+        source: Capture source (e.g., "rest", "ssh", "unknown")
+        status: Attempt outcome (success/failed)
+    """
+    snapshot_capture_total.labels(kind=kind, source=source, status=status).inc()
+    _device_metrics.inc(
+        "routeros_mcp_device_snapshot_capture_total",
+        device_id,
         kind=kind,
-    ).observe(duration)
+        source=source,
+        status=status,
+    )
+
+
+def record_snapshot_size(
+    device_id: str,
+    kind: str,
+    size_bytes: int,
+    compressed_size_bytes: int | None = None,
+) -> None:
+    """Record the size of a captured snapshot.
+
+    Args:
+        device_id: Device identifier
+        kind: Snapshot kind (e.g., "config")
+        size_bytes: Uncompressed size in bytes
+        compressed_size_bytes: Compressed size in bytes, if compressed
+    """
+    snapshot_size_bytes.labels(kind=kind).observe(size_bytes)
+    _device_metrics.set("routeros_mcp_device_snapshot_size_bytes", device_id, size_bytes, kind=kind)
+    if compressed_size_bytes is not None and size_bytes > 0:
+        ratio = compressed_size_bytes / size_bytes
+        snapshot_compression_ratio.labels(kind=kind).observe(ratio)
+        _device_metrics.set(
+            "routeros_mcp_device_snapshot_compression_ratio", device_id, ratio, kind=kind
+        )
+
+
+def record_snapshot_pruned(device_id: str, kind: str, count: int) -> None:
+    """Record snapshots deleted by the retention policy.
+
+    Args:
+        device_id: Device identifier
+        kind: Snapshot kind (e.g., "config")
+        count: Number of snapshots pruned
+    """
+    snapshot_retention_pruned.labels(kind=kind).inc(count)
+    _device_metrics.inc(
+        "routeros_mcp_device_snapshot_retention_pruned_total", device_id, count, kind=kind
+    )
 
 
 def update_snapshot_age(
@@ -595,15 +977,18 @@ def update_snapshot_age(
 ) -> None:
     """Update snapshot age gauge.
 
+    The registry exports the oldest age per kind across devices
+    (routeros_mcp_snapshot_age_seconds); the per-device value is kept in
+    the device metrics store.
+
     Args:
         device_id: Device identifier
         kind: Snapshot kind (e.g., "config")
         age_seconds: Age of snapshot in seconds (time since capture)
     """
-    snapshot_age_seconds.labels(
-        device_id=device_id,
-        kind=kind,
-    ).set(age_seconds)
+    _device_metrics.set(
+        "routeros_mcp_device_snapshot_age_seconds", device_id, age_seconds, kind=kind
+    )
 
 
 def record_snapshot_missing(
@@ -616,10 +1001,8 @@ def record_snapshot_missing(
         device_id: Device identifier
         kind: Snapshot kind (e.g., "config")
     """
-    snapshot_missing_total.labels(
-        device_id=device_id,
-        kind=kind,
-    ).inc()
+    snapshot_missing_total.labels(kind=kind).inc()
+    _device_metrics.inc("routeros_mcp_device_snapshot_missing_total", device_id, kind=kind)
 
 
 def record_sse_connection_start() -> None:
@@ -687,10 +1070,10 @@ def record_sse_event_sent(resource_type: str, device_id: str, count: int = 1) ->
         device_id: Device identifier
         count: Number of events sent (default: 1)
     """
-    sse_events_sent_total.labels(
-        resource_type=resource_type,
-        device_id=device_id,
-    ).inc(count)
+    sse_events_sent_total.labels(resource_type=resource_type).inc(count)
+    _device_metrics.inc(
+        "routeros_mcp_device_sse_events_sent_total", device_id, count, resource_type=resource_type
+    )
 
 
 def record_sse_active_connection_start() -> None:
@@ -742,10 +1125,22 @@ def record_sse_subscription_error(error_type: str) -> None:
 
 
 __all__ = [
+    "FleetMetricsCollector",
+    "configure_metrics",
+    "fleet_metrics_source",
+    "get_device_metrics",
+    "forget_device",
+    "get_device_metrics_text",
+    "reset_device_metrics",
     "get_registry",
     "get_metrics_text",
+    "record_metrics_render",
     "record_tool_call",
     "record_routeros_request",
+    "record_ssh_pool_request",
+    "record_ssh_handshake",
+    "update_ssh_pool_connections",
+    "record_ssh_pool_eviction",
     "record_health_check",
     "record_plan_event",
     "record_job_event",
@@ -761,6 +1156,9 @@ __all__ = [
     "record_snapshot_capture",
     "update_snapshot_age",
     "record_snapshot_missing",
+    "record_snapshot_pruned",
+    "record_snapshot_result",
+    "record_snapshot_size",
     "record_sse_connection_start",
     "record_sse_connection_end",
     "update_resource_subscriptions",
@@ -0,0 +1,41 @@
+"""Small numeric helpers shared by metric summaries and diagnostics matrices.
+
+Fleet metric summaries, reachability summaries and ping sweep matrices all
+keep raw values as floats with NaN for "no value"; these helpers turn them
+into percentiles and JSON-safe numbers.
+"""
+
+import math
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Linear-interpolated percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Non-empty values in ascending order
+        q: Percentile (0-100)
+
+    Returns:
+        Interpolated value at the percentile
+    """
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    low_value = sorted_values[lower]
+    return low_value + (sorted_values[upper] - low_value) * (position - lower)
+
+
+def finite_or_none(value: float, digits: int = 2) -> float | None:
+    """Round a finite value, mapping NaN and infinities to None (JSON null).
+
+    Args:
+        value: Value to convert
+        digits: Decimal places to round to
+
+    Returns:
+        Rounded value, or None if the value is not finite
+    """
+    return round(value, digits) if math.isfinite(value) else None
+
+
+__all__ = ["finite_or_none", "percentile"]
@@ -8,12 +8,28 @@ import asyncio
 import logging
 import time
 from collections import defaultdict
+from collections.abc import Sequence
+from typing import NamedTuple
 
 from routeros_mcp.mcp.errors import RateLimitExceededError
 
 logger = logging.getLogger(__name__)
 
 
+class RateLimitCharge(NamedTuple):
+    """Operations one request consumes from a device's rate limit.
+
+    Attributes:
+        operation: Operation name (e.g., "ping", "traceroute")
+        limit: Maximum operations allowed in the window
+        cost: Operations the request performs
+    """
+
+    operation: str
+    limit: int
+    cost: int = 1
+
+
 class RateLimiter:
     """In-memory rate limiter for diagnostic tools.
 
@@ -78,6 +94,53 @@ class RateLimiter:
                 f"({len(self._records[key])}/{limit} in {window_seconds}s window)"
             )
 
+    async def check_and_record_many(
+        self,
+        device_ids: Sequence[str],
+        charges: Sequence[RateLimitCharge],
+        window_seconds: int = 60,
+    ) -> None:
+        """Check every charge on every device, recording them only if all pass.
+
+        Used by multi-target tools, which must be rejected before any work
+        starts rather than partway through.
+
+        Args:
+            device_ids: Device identifiers
+            charges: Operations consumed on each device
+            window_seconds: Time window in seconds (default: 60)
+
+        Raises:
+            RateLimitExceededError: If any device lacks budget for any charge
+        """
+        async with self._lock:
+            now = time.time()
+            cutoff = now - window_seconds
+
+            for device_id in device_ids:
+                for charge in charges:
+                    key = (device_id, charge.operation)
+                    self._records[key] = [ts for ts in self._records[key] if ts > cutoff]
+                    current = len(self._records[key])
+                    if current + charge.cost > charge.limit:
+                        raise RateLimitExceededError(
+                            f"Rate limit exceeded for {charge.operation} on device {device_id}: "
+                            f"{charge.cost} requested, {max(0, charge.limit - current)} of "
+                            f"{charge.limit} left per {window_seconds} seconds",
+                            data={
+                                "device_id": device_id,
+                                "operation": charge.operation,
+                                "limit": charge.limit,
+                                "window_seconds": window_seconds,
+                                "current_count": current,
+                                "requested": charge.cost,
+                            },
+                        )
+
+            for device_id in device_ids:
+                for charge in charges:
+                    self._records[(device_id, charge.operation)].extend([now] * charge.cost)
+
     def reset(self, device_id: str | None = None, operation: str | None = None) -> None:
         """Reset rate limit records.
 
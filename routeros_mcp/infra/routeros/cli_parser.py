@@ -0,0 +1,371 @@
+"""Compiled parser for RouterOS CLI ``print`` output.
+
+Shared by every SSH fallback. RouterOS prints items in a few shapes:
+
+- Table (``/ip/route/print``): a ``Flags:`` legend, an optional
+  ``Columns:`` line, a header row and one row per item. ``;;; comment``
+  lines sit above the row (v7) or after the item number (v6).
+- Detail (``print detail``): one record per item, starting with the item
+  number and flags, followed by ``key=value`` pairs that may wrap over
+  several indented lines. Values containing spaces are double-quoted.
+- as-value: ``key=value`` pairs, one record per line or per blank-line
+  separated block.
+- Key/value (``/system/resource/print``): one ``key: value`` per line.
+
+All regular expressions are compiled once at import time, table headers are
+turned into a column-offset layout once per output, and records are yielded
+lazily so callers can stream very large tables (100k routes) or stop early.
+
+Example:
+    for record in iter_print_records(output):
+        print(record.id, record.flags, record.values.get("chain"))
+
+    resource = parse_key_value_output(output)
+"""
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# Flag characters RouterOS uses across menus (X disabled, D dynamic, ...)
+DEFAULT_FLAG_CHARS = "XIDARSCBHLPMTVE*+"
+
+# Item number at the start of a row: "0", "12", "*1A"
+_ROW_START_RE = re.compile(r"^\s*(\*[0-9A-Za-z]+|\d+)(?=\s|$)")
+
+# key=value pair; quoted values may contain spaces and escaped quotes
+_KV_RE = re.compile(r'([^\s="]+)=("(?:[^"\\]|\\.)*"?|[^\s"]*)')
+
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+# "key: value" line (splits on the first colon)
+_COLON_KV_RE = re.compile(r"^\s*([^:\s][^:]*?)\s*:\s*(.*?)\s*$")
+
+# Column header row: "#  NAME  TYPE" or bare upper-case column names
+_HEADER_RE = re.compile(r"^\s*(?:#(?:\s+|$)|[A-Z][A-Z0-9./-]*(?:\s+[A-Z][A-Z0-9./-]*)*\s*$)")
+
+_TOKEN_RE = re.compile(r"\S+")
+
+_PREAMBLE_PREFIXES = ("Flags:", "Columns:")
+
+
+@lru_cache(maxsize=32)
+def _flags_re(flag_chars: str) -> re.Pattern[str]:
+    """Compiled matcher for a flags token made only of ``flag_chars``."""
+    return re.compile(f"[{re.escape(flag_chars)}]+")
+
+
+def unquote(value: str) -> str:
+    """Strip RouterOS double quotes and unescape ``\\"`` style sequences."""
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        value = value[1:-1]
+        return _ESCAPE_RE.sub(r"\1", value) if "\\" in value else value
+    return value
+
+
+def parse_kv(text: str, continuation: bool = False) -> dict[str, str]:
+    """Decode ``key=value`` pairs from a line or a joined multi-line record.
+
+    Args:
+        text: Text containing ``key=value`` pairs
+        continuation: Treat bare tokens between pairs as a continuation of
+            the previous value (unquoted values with spaces, as printed by
+            some as-value outputs, e.g. ``build-time=2025-12-04 12:00:39``)
+
+    Returns:
+        Mapping of keys to unquoted values, in output order
+    """
+    if not continuation:
+        return {key: unquote(value) for key, value in _KV_RE.findall(text)}
+
+    values: dict[str, str] = {}
+    last_key: str | None = None
+    last_end = 0
+    for match in _KV_RE.finditer(text):
+        if last_key is not None:
+            gap = text[last_end : match.start()].strip()
+            if gap:
+                values[last_key] = f"{values[last_key]} {gap}"
+        key = match.group(1)
+        values[key] = unquote(match.group(2))
+        last_key, last_end = key, match.end()
+
+    if last_key is not None:
+        tail = text[last_end:].strip()
+        if tail:
+            values[last_key] = f"{values[last_key]} {tail}"
+    return values
+
+
+def parse_key_value_output(output: str, keep_empty: bool = True) -> dict[str, str]:
+    """Parse ``key: value`` output (``/system/resource/print`` and similar).
+
+    Args:
+        output: CLI output
+        keep_empty: Keep keys whose value is empty
+
+    Returns:
+        Mapping of keys (as printed) to stripped values
+    """
+    result: dict[str, str] = {}
+    for line in output.splitlines():
+        match = _COLON_KV_RE.match(line)
+        if match is None:
+            continue
+        key, value = match.group(1), match.group(2)
+        if value or keep_empty:
+            result[key] = value
+    return result
+
+
+def iter_value_blocks(output: str) -> Iterator[dict[str, str]]:
+    """Yield records from as-value style ``key=value`` output.
+
+    A blank line ends a record. A line holding several pairs is a complete
+    record on its own (one row per line); lines with a single pair
+    accumulate into a block (one pair per line).
+
+    Args:
+        output: CLI output
+
+    Yields:
+        One mapping per record
+    """
+    current: dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if current:
+                yield current
+                current = {}
+            continue
+        if "=" not in line:
+            continue
+
+        pairs = parse_kv(line, continuation=True)
+        if not pairs:
+            continue
+        current.update(pairs)
+        if len(pairs) > 1:
+            yield current
+            current = {}
+
+    if current:
+        yield current
+
+
+@dataclass(frozen=True, slots=True)
+class TableLayout:
+    """Column offsets taken from a table header row.
+
+    Attributes:
+        names: Lower-case column names in order (``#`` for the item column)
+        starts: Character offset where each column starts
+    """
+
+    names: tuple[str, ...]
+    starts: tuple[int, ...]
+
+    @classmethod
+    def from_header(cls, header: str) -> "TableLayout":
+        """Build a layout from a header row such as ``#  NAME  TYPE  MTU``."""
+        tokens = list(_TOKEN_RE.finditer(header))
+        return cls(
+            names=tuple(token.group().lower() for token in tokens),
+            starts=tuple(token.start() for token in tokens),
+        )
+
+    def split(self, line: str) -> dict[str, str]:
+        """Assign the tokens of a row to columns by offset.
+
+        RouterOS left-aligns text and right-aligns numbers inside a column
+        that is at least as wide as its header, so each token belongs to the
+        last column starting at or before it. Tokens sharing a column (values
+        with spaces) are joined.
+        """
+        columns: dict[str, str] = {}
+        starts = self.starts
+        column = 0
+        for token in _TOKEN_RE.finditer(line):
+            position = token.start()
+            while column + 1 < len(starts) and starts[column + 1] <= position:
+                column += 1
+            name = self.names[column]
+            columns[name] = f"{columns[name]} {token.group()}" if name in columns else token.group()
+        return columns
+
+
+@dataclass(slots=True)
+class PrintRecord:
+    """One item of ``print`` output.
+
+    Attributes:
+        id: Item number or ``*`` ID as printed ("" when the row has none)
+        flags: Flag letters printed after the item number
+        comment: ``;;;`` comment attached to the item
+        tokens: Bare (non ``key=value``) tokens of the row after ID and flags
+        values: ``key=value`` pairs from all lines of the item
+    """
+
+    id: str = ""
+    flags: str = ""
+    comment: str = ""
+    tokens: list[str] = field(default_factory=list)
+    values: dict[str, str] = field(default_factory=dict)
+    _layout: "TableLayout | None" = field(default=None, repr=False, compare=False)
+    _lines: list[str] = field(default_factory=list, repr=False, compare=False)
+    _columns: dict[str, str] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def columns(self) -> dict[str, str]:
+        """Values by lower-case header name when a header row was seen.
+
+        Split from the raw row on first access only, so callers that work on
+        ``tokens`` or ``values`` do not pay for column alignment.
+        """
+        if self._columns is None:
+            self._columns = {}
+            if self._layout is not None:
+                for line in self._lines:
+                    self._columns.update(self._layout.split(line))
+        return self._columns
+
+    def get(self, key: str, default: str = "") -> str:
+        """Value from ``key=value`` pairs, else from the column of that name."""
+        value = self.values.get(key)
+        if value is None:
+            value = self.columns.get(key, default)
+        return value
+
+    @property
+    def empty(self) -> bool:
+        """Whether nothing but the ID, flags and comment has been parsed."""
+        return not self.tokens and not self.values
+
+
+def iter_print_records(
+    output: str,
+    flag_chars: str = DEFAULT_FLAG_CHARS,
+    multiline: bool = True,
+    require_id: bool = True,
+) -> Iterator[PrintRecord]:
+    """Lazily parse table or detail ``print`` output into records.
+
+    Args:
+        output: CLI output
+        flag_chars: Characters that make up a flags token after the item
+            number (menu specific; RouterOS v6 uses lower-case route flags)
+        multiline: Group indented lines without an item number into the
+            preceding record (detail output). When False every data line is
+            its own record.
+        require_id: Only lines starting with an item number begin a record.
+            When False (with ``multiline=False``), rows without an item
+            number are accepted with an empty ``id``.
+
+    Yields:
+        PrintRecord per item, in output order
+    """
+    flags_re = _flags_re(flag_chars)
+    layout: TableLayout | None = None
+    current: PrintRecord | None = None
+    pending_comment = ""
+    seen_rows = False
+
+    for line in output.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith(_PREAMBLE_PREFIXES):
+            continue
+
+        row_start = _ROW_START_RE.match(line)
+        if not seen_rows and row_start is None and _HEADER_RE.match(line):
+            layout = TableLayout.from_header(line) if stripped.startswith("#") else None
+            continue
+
+        if stripped.startswith(";;;"):
+            comment = stripped[3:].strip()
+            if current is not None and current.empty and not current.comment:
+                current.comment = comment
+            else:
+                pending_comment = comment
+            continue
+
+        if row_start is None:
+            # Continuation of the previous item: wrapped detail pairs, or the
+            # data line following a v6 "N ;;; comment" row
+            if current is not None and (multiline or current.empty):
+                _fill(current, stripped, line, layout, continuation=True)
+                if not multiline:
+                    yield current
+                    current = None
+                continue
+            if require_id or multiline:
+                continue
+
+        if current is not None:
+            yield current
+            current = None
+        seen_rows = True
+
+        record = PrintRecord(comment=pending_comment)
+        pending_comment = ""
+        rest = stripped
+        if row_start is not None:
+            record.id = row_start.group(1)
+            rest = line[row_start.end() :].strip()
+
+        if ";;;" in rest:
+            rest, _, comment = rest.partition(";;;")
+            record.comment = comment.strip()
+            rest = rest.strip()
+            line = line.partition(";;;")[0]
+
+        _fill(record, rest, line, layout, continuation=False)
+        if record.tokens and flags_re.fullmatch(record.tokens[0]):
+            if row_start is not None or len(record.tokens) > 1:
+                record.flags = record.tokens.pop(0)
+
+        if multiline or record.empty:
+            current = record
+        else:
+            yield record
+
+    if current is not None:
+        yield current
+
+
+def _fill(
+    record: PrintRecord,
+    text: str,
+    line: str,
+    layout: TableLayout | None,
+    continuation: bool,
+) -> None:
+    """Add the pairs, bare tokens and columns of one line to a record."""
+    if "=" not in text:
+        record.tokens.extend(text.split())
+    elif '"' in text:
+        record.values.update(parse_kv(text))
+        record.tokens.extend(_KV_RE.sub(" ", text).split())
+    else:
+        # No quoting: every pair is a single whitespace-separated token
+        for token in text.split():
+            key, sep, value = token.partition("=")
+            if sep and key:
+                record.values[key] = value
+            else:
+                record.tokens.append(token)
+    if layout is not None and not (continuation and record.values):
+        record._layout = layout
+        record._lines.append(line)
+
+
+__all__ = [
+    "DEFAULT_FLAG_CHARS",
+    "PrintRecord",
+    "TableLayout",
+    "iter_print_records",
+    "iter_value_blocks",
+    "parse_key_value_output",
+    "parse_kv",
+    "unquote",
+]
@@ -0,0 +1,368 @@
+"""In-memory host locator: where each MAC address and IP address was last seen.
+
+The host locator job reads the ARP table, active DHCP leases and learned
+bridge hosts of every eligible device and feeds them here, so "where is
+this host?" is answered with two dict lookups instead of a live scan of
+every router.
+
+Two inverted indexes are kept:
+
+- MAC address -> sightings, one per (device, source, interface), each with
+  the IP address (ARP/DHCP), DHCP host name and last_seen timestamp
+- IP address -> MAC addresses seen with it (with a sighting count, so a
+  sighting replaced or expired only drops its own reference)
+
+Updates are incremental: a device poll only touches the sightings it
+reports, and sightings not reported again are kept until they are older
+than the retention window. A host that moved or left the network can
+still be found with its last known location.
+
+Example:
+    index = get_host_locator_index()
+    index.update_device(
+        "dev-1",
+        collect_sightings("dev-1", arp_entries=arp, leases=leases, bridge_hosts=hosts),
+    )
+    sightings = index.locate_mac("aa:bb:cc:dd:ee:ff")
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Default seconds a sighting is kept after it was last seen (one day)
+DEFAULT_RETENTION_SECONDS = 86400
+
+# Sighting sources, in the order they are reported
+SOURCES = ("bridge", "arp", "dhcp")
+
+_SOURCE_ORDER = {source: order for order, source in enumerate(SOURCES)}
+
+# (device_id, source, interface) identifying one sighting of a MAC address
+SightingKey = tuple[str, str, str]
+
+
+def normalize_mac(mac_address: str) -> str:
+    """Upper-case, colon-separated MAC address (RouterOS notation)."""
+    return mac_address.strip().upper().replace("-", ":")
+
+
+class HostSighting(NamedTuple):
+    """One place a MAC address was seen.
+
+    Attributes:
+        mac_address: Normalized MAC address
+        device_id: Device that reported it
+        source: "bridge" (learned bridge host), "arp" or "dhcp" (bound lease)
+        interface: Bridge port, ARP interface or DHCP server name
+        address: IP address (ARP and DHCP only)
+        host_name: Host name from the DHCP lease
+        last_seen: Unix timestamp of the last poll that reported it
+    """
+
+    mac_address: str
+    device_id: str
+    source: str
+    interface: str
+    address: str | None
+    host_name: str | None
+    last_seen: float
+
+    @property
+    def key(self) -> SightingKey:
+        return (self.device_id, self.source, self.interface)
+
+    def to_dict(self, now: float | None = None) -> dict[str, Any]:
+        """Sighting as a JSON-friendly dict, with its age when ``now`` is given."""
+        data: dict[str, Any] = {
+            "mac_address": self.mac_address,
+            "device_id": self.device_id,
+            "source": self.source,
+            "interface": self.interface,
+            "address": self.address,
+            "host_name": self.host_name,
+            "last_seen": datetime.fromtimestamp(self.last_seen, UTC).isoformat(),
+        }
+        if now is not None:
+            data["age_seconds"] = round(max(0.0, now - self.last_seen), 1)
+        return data
+
+
+def collect_sightings(
+    device_id: str,
+    arp_entries: Iterable[dict[str, Any]] = (),
+    leases: Iterable[dict[str, Any]] = (),
+    bridge_hosts: Iterable[dict[str, Any]] = (),
+    timestamp: float | None = None,
+) -> list[HostSighting]:
+    """Build sightings from one device's ARP table, leases and bridge hosts.
+
+    Entries without a MAC address (incomplete ARP entries) and the bridge's
+    own local MAC addresses are skipped.
+
+    Args:
+        device_id: Device the tables were read from
+        arp_entries: IPService.get_arp_table entries
+        leases: Active leases from DHCPService.get_dhcp_leases
+        bridge_hosts: BridgeService.list_bridge_hosts entries
+        timestamp: Poll time (default: now)
+
+    Returns:
+        Sightings stamped with the poll time
+    """
+    now = time.time() if timestamp is None else timestamp
+    sightings: list[HostSighting] = []
+
+    for host in bridge_hosts:
+        mac = normalize_mac(host.get("mac_address") or "")
+        if mac and not host.get("local") and not host.get("disabled"):
+            sightings.append(
+                HostSighting(
+                    mac, device_id, "bridge", host.get("on_interface") or "", None, None, now
+                )
+            )
+    for entry in arp_entries:
+        mac = normalize_mac(entry.get("mac_address") or "")
+        if mac:
+            sightings.append(
+                HostSighting(
+                    mac,
+                    device_id,
+                    "arp",
+                    entry.get("interface") or "",
+                    entry.get("address") or None,
+                    None,
+                    now,
+                )
+            )
+    for lease in leases:
+        mac = normalize_mac(lease.get("mac_address") or "")
+        if mac:
+            sightings.append(
+                HostSighting(
+                    mac,
+                    device_id,
+                    "dhcp",
+                    lease.get("server") or "",
+                    lease.get("address") or None,
+                    lease.get("host_name") or None,
+                    now,
+                )
+            )
+
+    return sightings
+
+
+class HostLocatorIndex:
+    """MAC and IP inverted indexes over host sightings of the fleet."""
+
+    def __init__(self, retention_seconds: float = DEFAULT_RETENTION_SECONDS) -> None:
+        """Initialize an empty index.
+
+        Args:
+            retention_seconds: Seconds a sighting is kept after it was last seen
+        """
+        if retention_seconds <= 0:
+            raise ValueError("retention_seconds must be positive")
+        self.retention_seconds = retention_seconds
+        self._by_mac: dict[str, dict[SightingKey, HostSighting]] = {}
+        self._by_ip: dict[str, dict[str, int]] = {}
+        self._device_keys: dict[str, set[tuple[str, SightingKey]]] = {}
+        self._device_updated: dict[str, float] = {}
+
+    def _put(self, sighting: HostSighting) -> bool:
+        """Insert or replace a sighting; True if it is new."""
+        entries = self._by_mac.setdefault(sighting.mac_address, {})
+        previous = entries.get(sighting.key)
+        if previous is not None and previous.address != sighting.address:
+            self._unref_ip(previous)
+        if (previous is None or previous.address != sighting.address) and sighting.address:
+            macs = self._by_ip.setdefault(sighting.address, {})
+            macs[sighting.mac_address] = macs.get(sighting.mac_address, 0) + 1
+        entries[sighting.key] = sighting
+        self._device_keys.setdefault(sighting.device_id, set()).add(
+            (sighting.mac_address, sighting.key)
+        )
+        return previous is None
+
+    def _drop(self, mac_address: str, key: SightingKey) -> None:
+        entries = self._by_mac.get(mac_address)
+        if entries is None:
+            return
+        sighting = entries.pop(key, None)
+        if not entries:
+            del self._by_mac[mac_address]
+        if sighting is not None:
+            self._unref_ip(sighting)
+
+    def _unref_ip(self, sighting: HostSighting) -> None:
+        if not sighting.address:
+            return
+        macs = self._by_ip.get(sighting.address)
+        if macs is None or sighting.mac_address not in macs:
+            return
+        macs[sighting.mac_address] -= 1
+        if macs[sighting.mac_address] <= 0:
+            del macs[sighting.mac_address]
+            if not macs:
+                del self._by_ip[sighting.address]
+
+    def update_device(
+        self,
+        device_id: str,
+        sightings: Iterable[HostSighting],
+        timestamp: float | None = None,
+    ) -> dict[str, int]:
+        """Merge one device poll into the index.
+
+        Reported sightings are inserted or refreshed; the device's sightings
+        older than the retention window are dropped.
+
+        Args:
+            device_id: Device the sightings belong to
+            sightings: Sightings from collect_sightings for this device
+            timestamp: Poll time used for expiry (default: now)
+
+        Returns:
+            Counts of added, refreshed and expired sightings
+        """
+        now = time.time() if timestamp is None else timestamp
+        counts = {"added": 0, "refreshed": 0, "expired": 0}
+        for sighting in sightings:
+            if sighting.device_id != device_id:
+                raise ValueError(f"Sighting of {sighting.device_id} passed for {device_id}")
+            counts["added" if self._put(sighting) else "refreshed"] += 1
+
+        keys = self._device_keys.get(device_id, set())
+        cutoff = now - self.retention_seconds
+        expired = [
+            (mac, key)
+            for mac, key in keys
+            if self._by_mac.get(mac, {}).get(key) is None
+            or self._by_mac[mac][key].last_seen < cutoff
+        ]
+        for mac, key in expired:
+            self._drop(mac, key)
+            keys.discard((mac, key))
+        counts["expired"] = len(expired)
+        self._device_updated[device_id] = now
+        return counts
+
+    def remove_device(self, device_id: str) -> int:
+        """Drop every sighting reported by a device.
+
+        Returns:
+            Number of sightings removed
+        """
+        keys = self._device_keys.pop(device_id, set())
+        for mac, key in keys:
+            self._drop(mac, key)
+        self._device_updated.pop(device_id, None)
+        return len(keys)
+
+    def has_device(self, device_id: str) -> bool:
+        return device_id in self._device_updated or device_id in self._device_keys
+
+    def device_ids(self) -> list[str]:
+        """Devices with sightings or updates in the index."""
+        return sorted(self._device_updated.keys() | self._device_keys.keys())
+
+    def device_sightings(self, device_id: str) -> list[HostSighting]:
+        """Every sighting a device reported, e.g. for persisting the device."""
+        return [
+            self._by_mac[mac][key]
+            for mac, key in sorted(self._device_keys.get(device_id, ()))
+            if key in self._by_mac.get(mac, {})
+        ]
+
+    def locate_mac(self, mac_address: str) -> list[HostSighting]:
+        """Sightings of a MAC address, most recent first.
+
+        Args:
+            mac_address: MAC address in any case, ':' or '-' separated
+
+        Returns:
+            Sightings ordered by last_seen (newest first), then bridge, ARP, DHCP
+        """
+        entries = self._by_mac.get(normalize_mac(mac_address), {})
+        return sorted(
+            entries.values(),
+            key=lambda s: (-s.last_seen, s.device_id, _SOURCE_ORDER.get(s.source, 0), s.interface),
+        )
+
+    def macs_for_ip(self, address: str) -> list[str]:
+        """MAC addresses seen with an IP address (more than one means a conflict)."""
+        return sorted(self._by_ip.get(address.strip(), {}))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Index sizes and the time of the newest device update."""
+        last_update = max(self._device_updated.values(), default=None)
+        return {
+            "devices": len(self._device_updated),
+            "mac_addresses": len(self._by_mac),
+            "ip_addresses": len(self._by_ip),
+            "sightings": sum(len(entries) for entries in self._by_mac.values()),
+            "last_update": (
+                datetime.fromtimestamp(last_update, UTC).isoformat() if last_update else None
+            ),
+            "retention_seconds": self.retention_seconds,
+        }
+
+    def clear(self) -> None:
+        """Drop every sighting."""
+        self._by_mac.clear()
+        self._by_ip.clear()
+        self._device_keys.clear()
+        self._device_updated.clear()
+
+
+# Global index instance
+_index_instance: HostLocatorIndex | None = None
+
+
+def reset_host_locator_index() -> None:
+    """Reset the global index instance (primarily for testing)."""
+    global _index_instance
+    _index_instance = None
+
+
+def get_host_locator_index() -> HostLocatorIndex:
+    """Get the global index, creating one with default retention if needed."""
+    global _index_instance
+    if _index_instance is None:
+        _index_instance = HostLocatorIndex()
+    return _index_instance
+
+
+def initialize_host_locator_index(
+    retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+) -> HostLocatorIndex:
+    """Initialize the global index instance.
+
+    Args:
+        retention_seconds: Seconds a sighting is kept after it was last seen
+
+    Returns:
+        The new global HostLocatorIndex
+    """
+    global _index_instance
+    _index_instance = HostLocatorIndex(retention_seconds=retention_seconds)
+    logger.info("Host locator index initialized", extra={"retention_seconds": retention_seconds})
+    return _index_instance
+
+
+__all__ = [
+    "DEFAULT_RETENTION_SECONDS",
+    "SOURCES",
+    "HostLocatorIndex",
+    "HostSighting",
+    "collect_sightings",
+    "get_host_locator_index",
+    "initialize_host_locator_index",
+    "normalize_mac",
+    "reset_host_locator_index",
+]
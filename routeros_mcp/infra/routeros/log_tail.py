@@ -0,0 +1,405 @@
+"""Incremental tailing of RouterOS device logs.
+
+Agents poll ``/log`` every few seconds, and each poll used to re-download
+the whole memory log buffer (1000 lines by default) and re-parse every
+timestamp. The tailer keeps, per device:
+
+- a cursor: the ``.id`` of the newest entry seen (RouterOS log IDs are
+  ``*``-prefixed hex numbers that grow monotonically until reboot)
+- a bounded ring buffer of parsed entries, each with its timestamp parsed
+  once and its topics held as a frozenset for O(1) topic matching
+
+Fetching is left to the caller (``FirewallLogsService.tail_logs``), which
+asks only for entries after the cursor and hands the result to
+:meth:`LogTailer.ingest`. Ingest drops anything not newer than the cursor,
+so a device that ignores the incremental query still never yields
+duplicates. Entries without a numeric ``.id`` (SSH table output) are
+de-duplicated by overlapping the fetched batch with the newest buffered
+entry instead.
+
+Example:
+    tailer = get_log_tailer()
+    new_entries = tailer.ingest("dev-1", fetched, transport="rest")
+    errors = tailer.query("dev-1", limit=50, topics=["error"])
+"""
+
+import logging
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default per-device buffer size, matching RouterOS' default memory log lines
+DEFAULT_BUFFER_SIZE = 1000
+
+_TIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%b/%d/%Y %H:%M:%S",
+    "%B/%d/%Y %H:%M:%S",
+    "%b/%d %H:%M:%S",
+    "%H:%M:%S",
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_log_time(value: str) -> datetime | None:
+    """Parse a RouterOS log time string, or return None if the format is unknown.
+
+    Cached: a log buffer repeats the same second many times and time-window
+    filters parse the same bounds on every call.
+    """
+    if not value:
+        return None
+    for fmt in _TIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def log_id_number(log_id: str) -> int | None:
+    """Numeric value of a RouterOS ``*1A2B`` ID, or None for other IDs."""
+    if len(log_id) < 2 or log_id[0] != "*":
+        return None
+    try:
+        return int(log_id[1:], 16)
+    except ValueError:
+        return None
+
+
+def split_topics(topics: Any) -> tuple[str, ...]:
+    """Normalize REST (comma string or list) and SSH topics to a tuple."""
+    if isinstance(topics, str):
+        return tuple(t.strip() for t in topics.split(",") if t.strip())
+    if isinstance(topics, list | tuple):
+        return tuple(str(t) for t in topics)
+    return ()
+
+
+@dataclass(frozen=True, slots=True)
+class LogEntry:
+    """One parsed log line with precomputed filter keys.
+
+    Attributes:
+        id: RouterOS ``.id`` (or the time string when none was printed)
+        time: Time as printed by the device
+        topics: Topics in device order
+        message: Log message
+        timestamp: ``time`` parsed once at ingest (None if unparsable)
+        topic_set: ``topics`` as a frozenset for topic filters
+        transport: Transport that fetched the entry ("rest" or "ssh")
+        rest_error: REST error that caused an SSH fallback, if any
+    """
+
+    id: str
+    time: str
+    topics: tuple[str, ...]
+    message: str
+    timestamp: datetime | None = None
+    topic_set: frozenset[str] = frozenset()
+    transport: str = "rest"
+    rest_error: str | None = None
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw: dict[str, Any],
+        transport: str = "rest",
+        rest_error: str | None = None,
+    ) -> "LogEntry":
+        """Build an entry from a REST item or a parsed SSH line."""
+        topics = split_topics(raw.get("topics"))
+        time_str = str(raw.get("time", ""))
+        return cls(
+            id=str(raw.get(".id") or raw.get("id") or time_str),
+            time=time_str,
+            topics=topics,
+            message=str(raw.get("message", "")),
+            timestamp=parse_log_time(time_str),
+            topic_set=frozenset(topics),
+            transport=transport,
+            rest_error=rest_error,
+        )
+
+    @property
+    def dedupe_key(self) -> tuple[str, tuple[str, ...], str]:
+        """Identity used when the device printed no numeric ID."""
+        return (self.time, self.topics, self.message)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Entry in the ``get_recent_logs`` result shape."""
+        return {
+            "id": self.id,
+            "time": self.time,
+            "topics": list(self.topics),
+            "message": self.message,
+            "transport": self.transport,
+            "fallback_used": self.transport == "ssh",
+            "rest_error": self.rest_error,
+        }
+
+
+@dataclass(slots=True)
+class DeviceLogTail:
+    """Cursor and ring buffer for one device."""
+
+    entries: deque[LogEntry]
+    cursor: str | None = None
+    cursor_number: int | None = None
+    total_ingested: int = 0
+    resets: int = 0
+    last_ingest: datetime | None = None
+    query_supported: bool = True
+
+
+class LogTailer:
+    """Per-device log cursors and bounded ring buffers."""
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """Initialize the tailer.
+
+        Args:
+            buffer_size: Maximum entries kept per device (oldest dropped first)
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.buffer_size = buffer_size
+        self._devices: dict[str, DeviceLogTail] = {}
+
+    def _tail(self, device_id: str) -> DeviceLogTail:
+        tail = self._devices.get(device_id)
+        if tail is None:
+            tail = DeviceLogTail(entries=deque(maxlen=self.buffer_size))
+            self._devices[device_id] = tail
+        return tail
+
+    def cursor(self, device_id: str) -> str | None:
+        """``.id`` of the newest entry seen for a device, if any."""
+        tail = self._devices.get(device_id)
+        return tail.cursor if tail else None
+
+    def buffered(self, device_id: str) -> int:
+        """Number of entries currently buffered for a device."""
+        tail = self._devices.get(device_id)
+        return len(tail.entries) if tail else 0
+
+    def supports_query(self, device_id: str) -> bool:
+        """Whether the device has not rejected an incremental ``.id`` query."""
+        tail = self._devices.get(device_id)
+        return tail.query_supported if tail else True
+
+    def disable_query(self, device_id: str) -> None:
+        """Remember that the device rejects incremental ``.id`` queries."""
+        self._tail(device_id).query_supported = False
+
+    def ingest(
+        self,
+        device_id: str,
+        raw_entries: Iterable[dict[str, Any]],
+        transport: str = "rest",
+        rest_error: str | None = None,
+    ) -> list[LogEntry]:
+        """Add freshly fetched entries (oldest first) and return the new ones.
+
+        Entries not newer than the cursor are dropped. If the newest fetched
+        ID is below the cursor the device log restarted (reboot or
+        ``/system/logging`` change), so the buffer is reset and the batch
+        taken as-is.
+
+        Args:
+            device_id: Device identifier
+            raw_entries: REST log items or parsed SSH entries, oldest first
+            transport: Transport the entries came from
+            rest_error: REST error when the entries came from SSH fallback
+
+        Returns:
+            Entries that were not seen before, oldest first
+        """
+        tail = self._tail(device_id)
+        batch = [LogEntry.from_raw(raw, transport, rest_error) for raw in raw_entries]
+        if not batch:
+            return []
+
+        numbers = [log_id_number(entry.id) for entry in batch]
+        if all(number is not None for number in numbers):
+            fresh = self._after_cursor(tail, batch, numbers)  # type: ignore[arg-type]
+        else:
+            fresh = self._after_overlap(tail, batch)
+
+        if fresh:
+            tail.entries.extend(fresh)
+            tail.cursor = fresh[-1].id
+            tail.cursor_number = log_id_number(fresh[-1].id)
+            tail.total_ingested += len(fresh)
+            tail.last_ingest = datetime.now()
+        return fresh
+
+    def _after_cursor(
+        self, tail: DeviceLogTail, batch: list[LogEntry], numbers: list[int]
+    ) -> list[LogEntry]:
+        """Entries whose numeric ID is above the cursor."""
+        cursor = tail.cursor_number
+        if cursor is None:
+            return batch
+        if max(numbers) < cursor:
+            self._reset(tail)
+            return batch
+        return [entry for entry, number in zip(batch, numbers, strict=True) if number > cursor]
+
+    def _after_overlap(self, tail: DeviceLogTail, batch: list[LogEntry]) -> list[LogEntry]:
+        """Entries after the newest buffered entry, matched by content."""
+        if not tail.entries:
+            return batch
+        newest = tail.entries[-1].dedupe_key
+        for index in range(len(batch) - 1, -1, -1):
+            if batch[index].dedupe_key == newest:
+                return batch[index + 1 :]
+        # No overlap: the device log rotated past our buffer or restarted
+        self._reset(tail)
+        return batch
+
+    @staticmethod
+    def _reset(tail: DeviceLogTail) -> None:
+        tail.entries.clear()
+        tail.cursor = None
+        tail.cursor_number = None
+        tail.resets += 1
+
+    def query(
+        self,
+        device_id: str,
+        limit: int = 100,
+        topics: Iterable[str] | None = None,
+        start_time: str | None = None,
+        end_time: str | None = None,
+        message: str | None = None,
+    ) -> list[LogEntry]:
+        """Newest buffered entries matching the filters, oldest first.
+
+        Args:
+            device_id: Device identifier
+            limit: Maximum entries to return
+            topics: Match entries having any of these topics
+            start_time: Inclusive lower time bound (best-effort parsed)
+            end_time: Inclusive upper time bound (best-effort parsed)
+            message: Case-insensitive message substring
+
+        Returns:
+            Up to ``limit`` matching entries
+        """
+        tail = self._devices.get(device_id)
+        if tail is None or limit <= 0:
+            return []
+
+        wanted = frozenset(topics) if topics else None
+        start_dt = parse_log_time(start_time) if start_time else None
+        end_dt = parse_log_time(end_time) if end_time else None
+        needle = message.lower() if message else None
+
+        matched: list[LogEntry] = []
+        for entry in reversed(tail.entries):
+            if wanted is not None and wanted.isdisjoint(entry.topic_set):
+                continue
+            if entry.timestamp is not None:
+                if start_dt is not None and entry.timestamp < start_dt:
+                    continue
+                if end_dt is not None and entry.timestamp > end_dt:
+                    continue
+            if needle is not None and needle not in entry.message.lower():
+                continue
+            matched.append(entry)
+            if len(matched) >= limit:
+                break
+        matched.reverse()
+        return matched
+
+    def forget(self, device_id: str) -> None:
+        """Drop the cursor and buffer of a device."""
+        self._devices.pop(device_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Buffered entry counts and cursors per device."""
+        return {
+            "buffer_size": self.buffer_size,
+            "devices": {
+                device_id: {
+                    "buffered": len(tail.entries),
+                    "cursor": tail.cursor,
+                    "total_ingested": tail.total_ingested,
+                    "resets": tail.resets,
+                }
+                for device_id, tail in self._devices.items()
+            },
+        }
+
+
+# Global tailer instance
+_tailer_instance: LogTailer | None = None
+
+# Tailer owned by the log archive job (see get_archive_log_tailer)
+_archive_tailer_instance: LogTailer | None = None
+
+
+def reset_log_tailer() -> None:
+    """Reset the global and archive tailer instances (primarily for testing)."""
+    global _tailer_instance, _archive_tailer_instance
+    _tailer_instance = None
+    _archive_tailer_instance = None
+
+
+def get_log_tailer() -> LogTailer:
+    """Get the global tailer, creating one with default sizing if needed."""
+    global _tailer_instance
+    if _tailer_instance is None:
+        _tailer_instance = LogTailer()
+    return _tailer_instance
+
+
+def get_archive_log_tailer() -> LogTailer:
+    """Get the log archive job's tailer, creating it if needed.
+
+    The archive keeps cursors of its own: reads through the global tailer
+    (``get_recent_logs`` tail mode, ``device://{id}/logs`` subscriptions)
+    would otherwise advance past entries the archive has not stored yet.
+    Only the newest entry per device is buffered, which is all cursor and
+    overlap matching need.
+    """
+    global _archive_tailer_instance
+    if _archive_tailer_instance is None:
+        _archive_tailer_instance = LogTailer(buffer_size=1)
+    return _archive_tailer_instance
+
+
+def initialize_log_tailer(buffer_size: int = DEFAULT_BUFFER_SIZE) -> LogTailer:
+    """Initialize the global tailer instance.
+
+    Args:
+        buffer_size: Maximum entries kept per device
+
+    Returns:
+        The new global LogTailer
+    """
+    global _tailer_instance
+    _tailer_instance = LogTailer(buffer_size=buffer_size)
+    logger.info("Log tailer initialized", extra={"buffer_size": buffer_size})
+    return _tailer_instance
+
+
+__all__ = [
+    "DEFAULT_BUFFER_SIZE",
+    "DeviceLogTail",
+    "LogEntry",
+    "LogTailer",
+    "get_archive_log_tailer",
+    "get_log_tailer",
+    "initialize_log_tailer",
+    "log_id_number",
+    "parse_log_time",
+    "reset_log_tailer",
+    "split_topics",
+]
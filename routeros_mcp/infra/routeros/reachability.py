@@ -0,0 +1,357 @@
+"""In-memory reachability mesh: periodic ping results per device/target pair.
+
+The reachability mesh job pings every configured target from every
+configured device once per ``reachability_mesh_interval_seconds``. Probes
+are spread over the interval (see probe_offsets) instead of fired at once,
+and each result lands here.
+
+Per pair, the last N probes live in a ring backed by three flat ``array``
+buffers (timestamps as doubles, loss and average RTT as floats), so a day
+of 5-minute history costs 4.5 KiB per pair. Probes that could not run
+(device unreachable, authentication failure) are stored as NaN and counted
+separately from packet loss, so they do not read as target outages.
+
+Example:
+    store = get_reachability_store()
+    store.configure(mesh_pairs(["dev-1", "dev-2"], ["8.8.8.8", "1.1.1.1"]))
+    store.record("dev-1", "8.8.8.8", loss_percent=0.0, rtt_ms=12.3)
+    matrix = store.matrix()
+"""
+
+import logging
+import math
+import random
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+from routeros_mcp.infra.observability.stats import finite_or_none, percentile
+
+logger = logging.getLogger(__name__)
+
+# Default probes kept per pair (one day at the default 5-minute interval)
+DEFAULT_HISTORY_SAMPLES = 288
+
+# RTT percentiles reported per pair
+PERCENTILES = (50, 90, 99)
+
+_NAN = float("nan")
+
+Pair = tuple[str, str]
+
+
+def mesh_pairs(device_ids: Iterable[str], targets: Iterable[str]) -> list[Pair]:
+    """Every (device, target) pair, ordered so consecutive pairs change device.
+
+    Probes are started in this order, so one device's probes are spread
+    across the interval rather than started back to back.
+
+    Args:
+        device_ids: Source devices
+        targets: Target IPs or hostnames
+
+    Returns:
+        De-duplicated (device_id, target) pairs, target-major
+    """
+    devices = list(dict.fromkeys(device_ids))
+    return [(device_id, target) for target in dict.fromkeys(targets) for device_id in devices]
+
+
+def probe_offsets(
+    count: int, spread_seconds: float, rng: random.Random | None = None
+) -> list[float]:
+    """Start offsets for ``count`` probes spread over ``spread_seconds``.
+
+    The spread is cut into equal slots and each probe starts at a random
+    point of its own slot: probes never bunch up, and runs do not hit the
+    routers at the same instants every interval.
+
+    Args:
+        count: Number of probes
+        spread_seconds: Window the probes are spread over
+        rng: Random source (default: module random)
+
+    Returns:
+        Ascending offsets in seconds from the start of the run
+    """
+    if count <= 0:
+        return []
+    uniform = (rng or random).random
+    slot = spread_seconds / count
+    return [(index + uniform()) * slot for index in range(count)]
+
+
+class ProbeRing:
+    """Fixed-capacity ring of (timestamp, loss, rtt) probes for one pair."""
+
+    __slots__ = ("capacity", "_times", "_loss", "_rtt", "_count", "_next", "last_error")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty ring.
+
+        Args:
+            capacity: Maximum probes kept (oldest overwritten first)
+        """
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._loss = array("f", [_NAN]) * capacity
+        self._rtt = array("f", [_NAN]) * capacity
+        self._count = 0
+        self._next = 0
+        self.last_error: str | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, loss_percent: float, rtt_ms: float) -> None:
+        """Store a probe (NaN loss for a probe that could not run)."""
+        slot = self._next
+        self._times[slot] = timestamp
+        self._loss[slot] = loss_percent
+        self._rtt[slot] = rtt_ms
+        self._next = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def latest(self) -> tuple[float, float, float] | None:
+        """Newest probe, or None if empty."""
+        if not self._count:
+            return None
+        slot = (self._next - 1) % self.capacity
+        return self._times[slot], self._loss[slot], self._rtt[slot]
+
+    def __iter__(self) -> Iterator[tuple[float, float, float]]:
+        """Probes oldest first."""
+        for age in range(self._count - 1, -1, -1):
+            slot = (self._next - 1 - age) % self.capacity
+            yield self._times[slot], self._loss[slot], self._rtt[slot]
+
+
+class ReachabilityStore:
+    """Probe rings per (device, target) pair."""
+
+    def __init__(self, history_samples: int = DEFAULT_HISTORY_SAMPLES) -> None:
+        """Initialize the store.
+
+        Args:
+            history_samples: Probes kept per pair (at least 2)
+        """
+        if history_samples < 2:
+            raise ValueError("history_samples must be at least 2")
+        self.history_samples = history_samples
+        self._rings: dict[Pair, ProbeRing] = {}
+
+    def configure(self, pairs: Iterable[Pair]) -> None:
+        """Set the measured pairs; history of pairs no longer listed is dropped."""
+        rings: dict[Pair, ProbeRing] = {}
+        for pair in pairs:
+            ring = self._rings.get(pair)
+            rings[pair] = ring if ring is not None else ProbeRing(self.history_samples)
+        self._rings = rings
+
+    @property
+    def pairs(self) -> list[Pair]:
+        return list(self._rings)
+
+    def _ring(self, device_id: str, target: str) -> ProbeRing:
+        ring = self._rings.get((device_id, target))
+        if ring is None:
+            ring = self._rings[(device_id, target)] = ProbeRing(self.history_samples)
+        return ring
+
+    def record(
+        self,
+        device_id: str,
+        target: str,
+        loss_percent: float,
+        rtt_ms: float | None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Store a completed probe.
+
+        Args:
+            device_id: Source device
+            target: Target address
+            loss_percent: Packet loss (0-100)
+            rtt_ms: Average RTT, None when no reply came back
+            timestamp: Probe time (Unix seconds, default now)
+        """
+        ring = self._ring(device_id, target)
+        ring.append(
+            timestamp if timestamp is not None else time.time(),
+            loss_percent,
+            rtt_ms if rtt_ms is not None else _NAN,
+        )
+        ring.last_error = None
+
+    def record_failure(
+        self, device_id: str, target: str, error: str, timestamp: float | None = None
+    ) -> None:
+        """Store a probe that could not run (not counted as packet loss)."""
+        ring = self._ring(device_id, target)
+        ring.append(timestamp if timestamp is not None else time.time(), _NAN, _NAN)
+        ring.last_error = error
+
+    def matrix(self, now: float | None = None) -> dict[str, Any]:
+        """Latest probe per pair as a device x target matrix.
+
+        Args:
+            now: Reference time for ages (Unix seconds, default now)
+
+        Returns:
+            Devices, targets and row-per-device lists of loss, RTT and probe
+            age (None where a pair has no successful probe), plus the
+            current error of failing pairs
+        """
+        now = now if now is not None else time.time()
+        devices = list(dict.fromkeys(device_id for device_id, _ in self._rings))
+        targets = list(dict.fromkeys(target for _, target in self._rings))
+        loss: list[list[float | None]] = [[None] * len(targets) for _ in devices]
+        rtt: list[list[float | None]] = [[None] * len(targets) for _ in devices]
+        age: list[list[float | None]] = [[None] * len(targets) for _ in devices]
+        row_of = {device_id: row for row, device_id in enumerate(devices)}
+        column_of = {target: column for column, target in enumerate(targets)}
+        errors: list[dict[str, Any]] = []
+
+        for (device_id, target), ring in self._rings.items():
+            latest = ring.latest()
+            if latest is None:
+                continue
+            row, column = row_of[device_id], column_of[target]
+            timestamp, loss_percent, rtt_ms = latest
+            loss[row][column] = finite_or_none(loss_percent)
+            rtt[row][column] = finite_or_none(rtt_ms)
+            age[row][column] = round(now - timestamp, 1)
+            if ring.last_error is not None:
+                errors.append({"device_id": device_id, "target": target, "error": ring.last_error})
+
+        return {
+            "devices": devices,
+            "targets": targets,
+            "packet_loss_percent": loss,
+            "avg_rtt_ms": rtt,
+            "age_seconds": age,
+            "errors": errors,
+        }
+
+    def pair_stats(
+        self, device_id: str, target: str, since: float | None = None
+    ) -> dict[str, Any] | None:
+        """Loss and RTT percentiles of one pair over its history.
+
+        Args:
+            device_id: Source device
+            target: Target address
+            since: Only probes at or after this time (Unix seconds)
+
+        Returns:
+            Probe counts, availability, mean and max loss, RTT min, percentiles
+            and max; None for an unknown pair
+        """
+        ring = self._rings.get((device_id, target))
+        if ring is None:
+            return None
+        probes = failed = 0
+        losses: list[float] = []
+        rtts: list[float] = []
+        last_probe = None
+        for timestamp, loss_percent, rtt_ms in ring:
+            if since is not None and timestamp < since:
+                continue
+            probes += 1
+            last_probe = timestamp
+            if math.isnan(loss_percent):
+                failed += 1
+                continue
+            losses.append(loss_percent)
+            if math.isfinite(rtt_ms):
+                rtts.append(rtt_ms)
+
+        stats: dict[str, Any] = {
+            "device_id": device_id,
+            "target": target,
+            "probes": probes,
+            "failed_probes": failed,
+            "last_probe": (
+                datetime.fromtimestamp(last_probe, UTC).isoformat() if last_probe else None
+            ),
+        }
+        if losses:
+            answered = sum(1 for loss_percent in losses if loss_percent < 100)
+            stats["availability_percent"] = round(100 * answered / len(losses), 2)
+            stats["loss_percent_mean"] = round(sum(losses) / len(losses), 2)
+            stats["loss_percent_max"] = round(max(losses), 2)
+        if rtts:
+            rtts.sort()
+            stats["rtt_ms"] = {
+                "min": round(rtts[0], 2),
+                **{f"p{q}": round(percentile(rtts, q), 2) for q in PERCENTILES},
+                "max": round(rtts[-1], 2),
+            }
+        return stats
+
+    def percentiles(self, since: float | None = None) -> list[dict[str, Any]]:
+        """pair_stats of every pair, in matrix order."""
+        stats = (self.pair_stats(device_id, target, since) for device_id, target in self._rings)
+        return [entry for entry in stats if entry is not None]
+
+    def clear(self) -> None:
+        """Drop every pair."""
+        self._rings.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Pair and probe counts."""
+        return {
+            "history_samples": self.history_samples,
+            "pairs": len(self._rings),
+            "probes": sum(len(ring) for ring in self._rings.values()),
+        }
+
+
+# Global store instance
+_store_instance: ReachabilityStore | None = None
+
+
+def reset_reachability_store() -> None:
+    """Reset the global store instance (primarily for testing)."""
+    global _store_instance
+    _store_instance = None
+
+
+def get_reachability_store() -> ReachabilityStore:
+    """Get the global store, creating one with default sizing if needed."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = ReachabilityStore()
+    return _store_instance
+
+
+def initialize_reachability_store(
+    history_samples: int = DEFAULT_HISTORY_SAMPLES,
+) -> ReachabilityStore:
+    """Initialize the global store instance.
+
+    Args:
+        history_samples: Probes kept per pair
+
+    Returns:
+        The new global ReachabilityStore
+    """
+    global _store_instance
+    _store_instance = ReachabilityStore(history_samples=history_samples)
+    logger.info("Reachability store initialized", extra={"history_samples": history_samples})
+    return _store_instance
+
+
+__all__ = [
+    "DEFAULT_HISTORY_SAMPLES",
+    "PERCENTILES",
+    "ProbeRing",
+    "ReachabilityStore",
+    "get_reachability_store",
+    "initialize_reachability_store",
+    "mesh_pairs",
+    "probe_offsets",
+    "reset_reachability_store",
+]
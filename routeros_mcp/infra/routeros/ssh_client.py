@@ -7,7 +7,8 @@ Design principles:
 - Minimize SSH usage (prefer REST API)
 - Strict command whitelist (fail-safe: deny by default)
 - No arbitrary command execution
-- Connection pooling and retries
+- Connection pooling (shared per-device connections, see ssh_pool.py) and retries
+- Batched execution of several commands in one CLI session
 - Comprehensive error mapping
 
 Whitelisted commands:
@@ -20,7 +21,10 @@ See docs/03-routeros-integration-and-platform-constraints-rest-and-ssh.md
 """
 
 import asyncio
+import contextlib
 import logging
+import uuid
+from collections.abc import Sequence
 from typing import Final
 
 import asyncssh
@@ -31,6 +35,7 @@ from routeros_mcp.infra.routeros.exceptions import (
     RouterOSSSHError,
     RouterOSSSHTimeoutError,
 )
+from routeros_mcp.infra.routeros.ssh_pool import SSHConnectionPool, SSHPoolKey, secret_digest
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +77,16 @@ ALLOWED_SSH_COMMANDS: Final[set[str]] = {
 }
 
 
+# Marker echoed between batched commands to split their output. It is emitted
+# by the client itself (never caller-supplied) and carries a per-batch nonce so
+# device output cannot forge a boundary.
+BATCH_MARKER_PREFIX: Final[str] = "__routeros_mcp_batch"
+
+# Characters that would let a single "command" smuggle further commands into
+# the RouterOS script interpreter and bypass the whitelist
+COMMAND_SEPARATORS: Final[tuple[str, ...]] = ("\n", "\r", ";")
+
+
 class RouterOSSSHClient:
     """Async SSH client for RouterOS CLI with command whitelisting.
 
@@ -101,6 +116,7 @@ class RouterOSSSHClient:
         private_key: str | None = None,
         timeout_seconds: float = 60.0,
         max_retries: int = 3,
+        pool: SSHConnectionPool | None = None,
     ) -> None:
         """Initialize RouterOS SSH client.
 
@@ -112,6 +128,8 @@ class RouterOSSSHClient:
             private_key: SSH private key in PEM format (Phase 4)
             timeout_seconds: Command execution timeout
             max_retries: Maximum retry attempts for connection
+            pool: Shared connection pool; when set, the connection is leased
+                from the pool and ``close()`` returns it instead of closing it
         """
         self.host = host
         self.port = port
@@ -120,8 +138,10 @@ class RouterOSSSHClient:
         self.private_key = private_key
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
+        self.pool = pool
 
         self._connection: asyncssh.SSHClientConnection | None = None
+        self._lease_key: SSHPoolKey | None = None
 
     def set_credentials(self, username: str, password: str | None = None, private_key: str | None = None) -> None:
         """Set or update authentication credentials.
@@ -138,6 +158,8 @@ class RouterOSSSHClient:
     async def _get_connection(self) -> asyncssh.SSHClientConnection:
         """Get or create SSH connection with retries.
 
+        With a pool, the connection is leased from the pool (shared with other
+        clients for the same device and credentials) instead of opened here.
         Tries key authentication first (if private_key is provided),
         then falls back to password authentication.
 
@@ -158,16 +180,58 @@ class RouterOSSSHClient:
         if self._connection is not None and not self._connection.is_closed():
             return self._connection
 
-        # Create new connection with retries
+        if self.pool is None:
+            self._connection = await self._open_connection()
+            return self._connection
+
+        # Return a dead lease before asking the pool for a fresh connection
+        if self._connection is not None and self._lease_key is not None:
+            await self.pool.release(self._lease_key, self._connection)
+            self._connection = None
+
+        self._lease_key = SSHPoolKey(
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            secret_digest=secret_digest(self.password, self.private_key),
+        )
+        self._connection = await self.pool.acquire(self._lease_key, self._open_connection)
+        return self._connection
+
+    def _import_private_key(self, pem: str) -> asyncssh.SSHKey:
+        """Parse a PEM private key, reusing the pool's parsed-key cache if pooled."""
+        from asyncssh import public_key
+
+        if self.pool is not None:
+            return self.pool.get_private_key(pem, public_key.import_private_key)
+        return public_key.import_private_key(pem)
+
+    def _session_slot(self) -> contextlib.AbstractAsyncContextManager[None]:
+        """Hold a pool-wide session slot for one command channel (no-op unpooled)."""
+        if self.pool is None:
+            return contextlib.nullcontext()
+        return self.pool.session(self.host)
+
+    async def _open_connection(self) -> asyncssh.SSHClientConnection:
+        """Open and authenticate a new SSH connection with retries.
+
+        Returns:
+            SSH connection
+
+        Raises:
+            RouterOSSSHAuthenticationError: On auth failure
+            RouterOSSSHError: On connection errors
+        """
+        connect_options = self.pool.connect_options() if self.pool is not None else {}
+
         for attempt in range(self.max_retries):
             try:
                 # Phase 4: Try key auth first, fallback to password
                 if self.private_key:
                     try:
                         # Import asyncssh key from PEM string
-                        from asyncssh import public_key
                         try:
-                            key = public_key.import_private_key(self.private_key)
+                            key = self._import_private_key(self.private_key)
                         except (ValueError, KeyError, TypeError) as key_err:
                             # Key import failed - treat as authentication error (no retry)
                             logger.error(f"Failed to import SSH private key for {self.host}: {key_err}")
@@ -175,15 +239,16 @@ class RouterOSSSHClient:
                                 f"Invalid SSH private key format: {key_err}"
                             ) from key_err
                         
-                        self._connection = await asyncssh.connect(
+                        connection = await asyncssh.connect(
                             self.host,
                             port=self.port,
                             username=self.username,
                             client_keys=[key],
                             known_hosts=None,  # Skip host key verification (lab usage)
+                            **connect_options,
                         )
                         logger.info(f"SSH connection established (key auth): {self.host}:{self.port}")
-                        return self._connection
+                        return connection
                     except asyncssh.PermissionDenied:
                         # Key auth failed, try password if available
                         logger.warning(f"SSH key authentication failed for {self.host}, trying password fallback")
@@ -194,15 +259,16 @@ class RouterOSSSHClient:
                 
                 # Try password authentication (either as fallback or primary method)
                 if self.password:
-                    self._connection = await asyncssh.connect(
+                    connection = await asyncssh.connect(
                         self.host,
                         port=self.port,
                         username=self.username,
                         password=self.password,
                         known_hosts=None,  # Skip host key verification (lab usage)
+                        **connect_options,
                     )
                     logger.info(f"SSH connection established (password auth): {self.host}:{self.port}")
-                    return self._connection
+                    return connection
 
             except asyncssh.PermissionDenied as e:
                 raise RouterOSSSHAuthenticationError(
@@ -231,7 +297,14 @@ class RouterOSSSHClient:
         raise RuntimeError("Retry loop exited unexpectedly")
 
     async def close(self) -> None:
-        """Close SSH connection."""
+        """Close SSH connection (or return it to the pool when pooled)."""
+        if self.pool is not None and self._lease_key is not None:
+            if self._connection is not None:
+                await self.pool.release(self._lease_key, self._connection)
+            self._connection = None
+            self._lease_key = None
+            return
+
         if self._connection is not None and not self._connection.is_closed():
             self._connection.close()
             await self._connection.wait_closed()
@@ -250,6 +323,11 @@ class RouterOSSSHClient:
         # Normalize command (strip leading/trailing whitespace)
         normalized_command = command.strip()
 
+        if any(separator in normalized_command for separator in COMMAND_SEPARATORS):
+            raise RouterOSSSHCommandNotAllowedError(
+                f"SSH command not allowed: '{command}'. Command separators are not permitted"
+            )
+
         # Check whitelist - exact match or prefix match for parameterized commands
         exact_match = normalized_command in ALLOWED_SSH_COMMANDS
         if exact_match:
@@ -292,11 +370,12 @@ class RouterOSSSHClient:
         connection = await self._get_connection()
 
         try:
-            # Execute command with timeout
-            result = await asyncio.wait_for(
-                connection.run(command, check=True),
-                timeout=self.timeout_seconds,
-            )
+            # Execute command with timeout (its channel holds a pool session slot)
+            async with self._session_slot():
+                result = await asyncio.wait_for(
+                    connection.run(command, check=True),
+                    timeout=self.timeout_seconds,
+                )
 
             # Ensure stdout is string
             if result.stdout is None:
@@ -329,9 +408,99 @@ class RouterOSSSHClient:
                 f"Error: {stderr_text}"
             ) from e
 
+        except RouterOSSSHError:
+            raise
+
         except Exception as e:
             raise RouterOSSSHError(f"SSH command execution error: {command}") from e
 
+    async def execute_many(self, commands: Sequence[str]) -> list[str]:
+        """Execute several whitelisted commands in one SSH channel and CLI session.
+
+        ``execute`` opens a new channel (and RouterOS CLI session) per
+        command. This runs all commands as one script, with a client-generated
+        ``:put`` marker after each command, and splits the combined output on
+        those markers. Every command is validated against the whitelist before
+        anything is sent.
+
+        RouterOS stops a script at the first failing command, so a missing
+        marker fails the whole batch; callers that need per-command error
+        isolation should fall back to ``execute`` for the batch.
+
+        Args:
+            commands: Commands to execute in order (each must be whitelisted)
+
+        Returns:
+            Output of each command, in the same order as ``commands``
+
+        Raises:
+            RouterOSSSHCommandNotAllowedError: If any command is not whitelisted
+            RouterOSSSHTimeoutError: If the batch times out
+            RouterOSSSHError: If a command failed or the batch could not run
+
+        Example:
+            resource, identity = await client.execute_many(
+                ["/system/resource/print", "/system/identity/print"]
+            )
+        """
+        for command in commands:
+            self._validate_command(command)
+
+        if not commands:
+            return []
+
+        nonce = uuid.uuid4().hex[:12]
+        markers = [f"{BATCH_MARKER_PREFIX}:{nonce}:{index}__" for index in range(len(commands))]
+        script = "\n".join(
+            f'{command.strip()}\n:put "{marker}"' for command, marker in zip(commands, markers)
+        )
+
+        connection = await self._get_connection()
+
+        try:
+            async with self._session_slot():
+                result = await asyncio.wait_for(
+                    connection.run(script, check=False),
+                    timeout=self.timeout_seconds * len(commands),
+                )
+        except TimeoutError as e:
+            raise RouterOSSSHTimeoutError(
+                f"SSH batch timeout after {self.timeout_seconds * len(commands)}s: "
+                f"{len(commands)} command(s)"
+            ) from e
+        except RouterOSSSHError:
+            raise
+        except Exception as e:
+            raise RouterOSSSHError(f"SSH batch execution error: {len(commands)} command(s)") from e
+
+        stdout = result.stdout
+        if stdout is None:
+            stdout = ""
+        elif not isinstance(stdout, str):
+            stdout = stdout.decode("utf-8")
+
+        outputs: list[str] = []
+        segment: list[str] = []
+        for line in stdout.splitlines(keepends=True):
+            if len(outputs) < len(markers) and line.strip() == markers[len(outputs)]:
+                outputs.append("".join(segment))
+                segment = []
+            else:
+                segment.append(line)
+
+        if len(outputs) < len(commands):
+            failed = commands[len(outputs)]
+            raise RouterOSSSHError(
+                f"SSH batch aborted at command {len(outputs) + 1}/{len(commands)}: {failed}. "
+                f"Output: {''.join(segment).strip()[:200]}"
+            )
+
+        logger.info(
+            f"SSH batch executed: {len(commands)} command(s) in one session "
+            f"(output: {len(stdout)} bytes)"
+        )
+        return outputs
+
     async def export_config(self, compact: bool = True) -> str:
         """Export device configuration via SSH.
 
@@ -0,0 +1,382 @@
+"""Shared pool of authenticated SSH connections to RouterOS devices.
+
+Every SSH fallback used to open a fresh connection (TCP connect, key
+exchange, authentication) for a single command and close it right after.
+The pool keeps one authenticated connection per device/credential open and
+lets every RouterOSSSHClient created for that device multiplex its command
+channels over it.
+
+Behavior:
+- Connections are keyed by host, port, username and a digest of the secret,
+  so rotating credentials never reuses a connection authenticated with the
+  old ones.
+- Concurrent acquires for the same key share a single handshake.
+- ``max_connections`` caps pooled connections across all devices. When the
+  cap is reached the least recently used idle connection is evicted; if all
+  connections are in use, acquire waits up to ``acquire_timeout_seconds``.
+- ``max_sessions`` caps concurrent command channels across all devices.
+  Every command opens its own channel (a separate RouterOS CLI session) over
+  the leased connection, so callers hold a session slot for each channel
+  through ``session()``; when all slots are taken they wait up to
+  ``acquire_timeout_seconds``.
+- A periodic sweep health-checks idle connections, dropping those closed by
+  the peer (detected through SSH keepalives) or idle longer than
+  ``idle_timeout_seconds``.
+- Parsed private keys are cached by digest, so key authentication does not
+  re-import the PEM on every connect.
+
+Example:
+    pool = initialize_ssh_pool(max_connections=64, max_sessions=128, idle_timeout_seconds=300)
+    pool.start_sweeper(interval_seconds=30)
+
+    client = RouterOSSSHClient(host="192.168.1.1", username="admin",
+                               password="secret", pool=pool)
+    await client.execute("/system/resource/print")
+    await client.close()  # returns the connection to the pool
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+import asyncssh
+
+from routeros_mcp.infra.observability.metrics import (
+    record_ssh_handshake,
+    record_ssh_pool_eviction,
+    record_ssh_pool_request,
+    update_ssh_pool_connections,
+)
+from routeros_mcp.infra.routeros.exceptions import RouterOSSSHError
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on cached parsed private keys
+PRIVATE_KEY_CACHE_SIZE = 256
+
+
+class SSHPoolKey(NamedTuple):
+    """Identity of a pooled connection."""
+
+    host: str
+    port: int
+    username: str
+    secret_digest: str
+
+
+def secret_digest(*secrets: str | None) -> str:
+    """Digest credential material so it can key the pool without being stored."""
+    hasher = hashlib.sha256()
+    for secret in secrets:
+        hasher.update((secret or "").encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+@dataclass
+class _PoolEntry:
+    """A pooled connection and its lease bookkeeping."""
+
+    key: SSHPoolKey
+    connection: asyncssh.SSHClientConnection
+    leases: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SSHConnectionPool:
+    """Per-device pool of authenticated, multiplexed SSH connections."""
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        max_sessions: int = 128,
+        idle_timeout_seconds: float = 300.0,
+        acquire_timeout_seconds: float = 30.0,
+        keepalive_interval_seconds: float = 30.0,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_connections: Maximum pooled connections across all devices
+            max_sessions: Maximum concurrent command channels (RouterOS CLI
+                sessions) across all devices and connections
+            idle_timeout_seconds: Close connections unused for this long
+            acquire_timeout_seconds: Max wait for a free slot when at capacity
+            keepalive_interval_seconds: SSH keepalive interval for pooled
+                connections (dead peers are detected and closed)
+        """
+        self.max_connections = max_connections
+        self.max_sessions = max_sessions
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self.keepalive_interval_seconds = keepalive_interval_seconds
+
+        self._entries: dict[SSHPoolKey, _PoolEntry] = {}
+        self._key_locks: dict[SSHPoolKey, asyncio.Lock] = {}
+        self._capacity = asyncio.Condition()
+        self._reserved = 0
+        self._sessions = asyncio.Semaphore(max_sessions)
+        self._active_sessions = 0
+        self._private_keys: OrderedDict[str, Any] = OrderedDict()
+        self._sweep_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of command channels currently open through the pool."""
+        return self._active_sessions
+
+    def connect_options(self) -> dict[str, Any]:
+        """Extra ``asyncssh.connect`` options for connections owned by the pool."""
+        return {"keepalive_interval": self.keepalive_interval_seconds}
+
+    def get_private_key(self, pem: str, loader: Callable[[str], Any]) -> Any:
+        """Return a parsed private key, importing the PEM only on first use.
+
+        Args:
+            pem: Private key in PEM format
+            loader: Parser used on a cache miss (e.g. ``import_private_key``)
+
+        Returns:
+            Parsed key object
+        """
+        digest = secret_digest(pem)
+        key = self._private_keys.get(digest)
+        if key is not None:
+            self._private_keys.move_to_end(digest)
+            return key
+
+        key = loader(pem)
+        self._private_keys[digest] = key
+        if len(self._private_keys) > PRIVATE_KEY_CACHE_SIZE:
+            self._private_keys.popitem(last=False)
+        return key
+
+    async def acquire(
+        self,
+        key: SSHPoolKey,
+        connect: Callable[[], Awaitable[asyncssh.SSHClientConnection]],
+    ) -> asyncssh.SSHClientConnection:
+        """Lease the pooled connection for a key, connecting on a miss.
+
+        Args:
+            key: Pool key identifying device and credentials
+            connect: Coroutine factory performing connect + authentication
+
+        Returns:
+            Open SSH connection (release it with ``release`` when done)
+
+        Raises:
+            RouterOSSSHError: If no slot frees up within acquire_timeout_seconds
+            Exception: Whatever ``connect`` raises on handshake failure
+        """
+        lock = self._key_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.connection.is_closed():
+                await self._drop(entry, "closed")
+                entry = None
+
+            if entry is not None:
+                entry.leases += 1
+                entry.last_used = time.monotonic()
+                record_ssh_pool_request(hit=True)
+                return entry.connection
+
+            record_ssh_pool_request(hit=False)
+            await self._reserve_slot(key)
+            try:
+                started = time.perf_counter()
+                connection = await connect()
+                record_ssh_handshake(time.perf_counter() - started)
+            finally:
+                async with self._capacity:
+                    self._reserved -= 1
+                    self._capacity.notify_all()
+
+            self._entries[key] = _PoolEntry(key=key, connection=connection, leases=1)
+            update_ssh_pool_connections(len(self._entries))
+            logger.debug(f"SSH pool connection opened: {key.host}:{key.port}")
+            return connection
+
+    async def release(self, key: SSHPoolKey, connection: asyncssh.SSHClientConnection) -> None:
+        """Return a leased connection to the pool.
+
+        Connections that were meanwhile replaced or evicted are ignored.
+
+        Args:
+            key: Pool key the connection was acquired with
+            connection: The leased connection
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.connection is not connection:
+            return
+
+        entry.leases = max(0, entry.leases - 1)
+        entry.last_used = time.monotonic()
+        if connection.is_closed():
+            await self._drop(entry, "closed")
+        else:
+            async with self._capacity:
+                self._capacity.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def session(self, host: str) -> AsyncIterator[None]:
+        """Hold a session slot while a command channel is open.
+
+        Args:
+            host: Device host (for the error message)
+
+        Raises:
+            RouterOSSSHError: If no slot frees up within acquire_timeout_seconds
+        """
+        try:
+            await asyncio.wait_for(self._sessions.acquire(), timeout=self.acquire_timeout_seconds)
+        except TimeoutError as e:
+            raise RouterOSSSHError(
+                f"SSH session limit reached ({self.max_sessions} sessions open): {host}"
+            ) from e
+
+        self._active_sessions += 1
+        try:
+            yield
+        finally:
+            self._active_sessions -= 1
+            self._sessions.release()
+
+    async def sweep(self) -> int:
+        """Health-check idle connections, closing dead or expired ones.
+
+        Returns:
+            Number of connections evicted
+        """
+        now = time.monotonic()
+        evicted = 0
+        for entry in list(self._entries.values()):
+            if entry.leases > 0:
+                continue
+            if entry.connection.is_closed():
+                await self._drop(entry, "closed")
+            elif now - entry.last_used >= self.idle_timeout_seconds:
+                await self._drop(entry, "idle")
+            else:
+                continue
+            evicted += 1
+        return evicted
+
+    def start_sweeper(self, interval_seconds: float) -> None:
+        """Start the background task that sweeps idle connections.
+
+        Args:
+            interval_seconds: Seconds between sweeps (0 disables the task)
+        """
+        if interval_seconds <= 0 or self._sweep_task is not None:
+            return
+
+        async def sweep_loop() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                try:
+                    await self.sweep()
+                except Exception as e:
+                    logger.warning(f"SSH pool sweep failed: {e}")
+
+        self._sweep_task = asyncio.create_task(sweep_loop())
+
+    async def close(self) -> None:
+        """Stop the sweeper and close every pooled connection."""
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweep_task
+            self._sweep_task = None
+
+        for entry in list(self._entries.values()):
+            await self._drop(entry, "shutdown")
+        self._private_keys.clear()
+
+    async def _reserve_slot(self, key: SSHPoolKey) -> None:
+        """Reserve capacity for a new connection, evicting idle ones if needed."""
+        deadline = time.monotonic() + self.acquire_timeout_seconds
+        async with self._capacity:
+            while len(self._entries) + self._reserved >= self.max_connections:
+                idle = [entry for entry in self._entries.values() if entry.leases == 0]
+                if idle:
+                    lru = min(idle, key=lambda entry: entry.last_used)
+                    self._close_entry(lru, "capacity")
+                    continue
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RouterOSSSHError(
+                        f"SSH connection pool exhausted ({self.max_connections} connections "
+                        f"in use): {key.host}"
+                    )
+                try:
+                    await asyncio.wait_for(self._capacity.wait(), timeout=remaining)
+                except TimeoutError:
+                    continue
+            self._reserved += 1
+
+    async def _drop(self, entry: _PoolEntry, reason: str) -> None:
+        """Close an entry and wake acquirers waiting for capacity."""
+        async with self._capacity:
+            self._close_entry(entry, reason)
+            self._capacity.notify_all()
+
+    def _close_entry(self, entry: _PoolEntry, reason: str) -> None:
+        if self._entries.get(entry.key) is not entry:
+            return
+        del self._entries[entry.key]
+        if not entry.connection.is_closed():
+            entry.connection.close()
+        record_ssh_pool_eviction(reason)
+        update_ssh_pool_connections(len(self._entries))
+        logger.debug(f"SSH pool connection closed ({reason}): {entry.key.host}:{entry.key.port}")
+
+
+# Global pool instance (initialized by application)
+_pool_instance: SSHConnectionPool | None = None
+
+
+def reset_ssh_pool() -> None:
+    """Reset the global pool instance (primarily for testing)."""
+    global _pool_instance
+    _pool_instance = None
+
+
+def get_ssh_pool() -> SSHConnectionPool | None:
+    """Get the global pool, or None when SSH pooling is not in use."""
+    return _pool_instance
+
+
+def initialize_ssh_pool(**kwargs: Any) -> SSHConnectionPool:
+    """Initialize the global pool instance.
+
+    Args:
+        **kwargs: SSHConnectionPool constructor arguments
+
+    Returns:
+        New SSHConnectionPool instance
+    """
+    global _pool_instance
+    _pool_instance = SSHConnectionPool(**kwargs)
+    return _pool_instance
+
+
+__all__ = [
+    "SSHConnectionPool",
+    "SSHPoolKey",
+    "get_ssh_pool",
+    "initialize_ssh_pool",
+    "reset_ssh_pool",
+    "secret_digest",
+]
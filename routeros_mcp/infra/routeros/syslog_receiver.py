@@ -0,0 +1,178 @@
+"""UDP syslog receiver for RouterOS remote logging.
+
+Devices configured with a ``remote`` logging action push every entry as it
+is written, which catches lines that roll out of the memory log between
+archive polls. RouterOS sends BSD-style messages::
+
+    <30>Dec 11 22:52:33 MikroTik system,info,account user admin logged in
+    <30>system,info,account user admin logged in        (no bsd-syslog)
+
+Datagrams are parsed in the protocol callback and queued; a flush task hands
+batches to an async callback (the log archive ingest), so the event loop
+never waits on the database per datagram. The queue is bounded and drops
+(and counts) messages when the sink falls behind.
+
+Example:
+    receiver = SyslogReceiver(on_batch=ingest)
+    await receiver.start("0.0.0.0", 5514)
+    ...
+    await receiver.stop()
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# One received message: (source address, raw log entry dict)
+SyslogMessage = tuple[str, dict[str, Any]]
+
+# Syslog severities (PRI & 7) named the way RouterOS names its topics
+_SEVERITY_TOPICS = ("critical", "critical", "critical", "error", "warning", "info", "info", "debug")
+
+_SYSLOG_RE = re.compile(
+    r"^<(?P<pri>\d{1,3})>"
+    r"(?:(?P<month>[A-Za-z]{3}) +(?P<day>\d{1,2}) (?P<clock>\d{2}:\d{2}:\d{2}) )?"
+    r"(?P<rest>.*)$",
+    re.DOTALL,
+)
+
+# RouterOS topic lists always have at least two topics ("system,info")
+_TOPICS_RE = re.compile(r"^[a-z0-9-]+(?:,[a-z0-9-]+)+$")
+
+
+def parse_syslog_message(data: bytes, received_at: datetime | None = None) -> dict[str, Any] | None:
+    """Parse a RouterOS syslog datagram into a raw log entry.
+
+    Args:
+        data: Datagram payload
+        received_at: Receive time, used when the message carries no timestamp
+
+    Returns:
+        Dict with ``time``, ``topics`` and ``message`` (the shape produced by
+        the REST and SSH log readers), or None if the datagram is not syslog
+    """
+    text = data.decode("utf-8", errors="replace").strip()
+    match = _SYSLOG_RE.match(text)
+    if match is None:
+        return None
+
+    rest = match.group("rest").strip()
+    if match.group("clock"):
+        time_str = f"{match.group('month').lower()}/{int(match.group('day')):02d} {match.group('clock')}"
+        # The token after the timestamp is the host name unless it is a topic list
+        host, _, remainder = rest.partition(" ")
+        if not _TOPICS_RE.match(host):
+            rest = remainder
+    else:
+        time_str = (received_at or datetime.now(UTC)).strftime("%H:%M:%S")
+
+    first, _, message = rest.partition(" ")
+    if _TOPICS_RE.match(first):
+        topics = first.split(",")
+    else:
+        topics = [_SEVERITY_TOPICS[int(match.group("pri")) & 7]]
+        message = rest
+
+    return {"time": time_str, "topics": topics, "message": message}
+
+
+class SyslogReceiver(asyncio.DatagramProtocol):
+    """Receive syslog datagrams and deliver them to an async sink in batches."""
+
+    def __init__(
+        self,
+        on_batch: Callable[[list[SyslogMessage]], Awaitable[Any]],
+        batch_size: int = 500,
+        flush_interval_seconds: float = 2.0,
+        max_pending: int = 50_000,
+    ) -> None:
+        """Initialize the receiver.
+
+        Args:
+            on_batch: Async callback receiving lists of (source address, entry)
+            batch_size: Flush as soon as this many messages are queued
+            flush_interval_seconds: Flush at least this often while messages wait
+            max_pending: Queue bound; further messages are dropped until a flush
+        """
+        self.on_batch = on_batch
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self.received = 0
+        self.dropped = 0
+        self._pending: list[SyslogMessage] = []
+        self._wakeup = asyncio.Event()
+        self._transport: asyncio.DatagramTransport | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def start(self, host: str, port: int) -> None:
+        """Bind the UDP socket and start the flush task."""
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: self, local_addr=(host, port)
+        )
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info("Syslog receiver listening", extra={"host": host, "port": port})
+
+    async def stop(self) -> None:
+        """Close the socket, stop the flush task and deliver what is queued."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    @property
+    def sockname(self) -> tuple[str, int] | None:
+        """Bound (host, port), or None when not listening."""
+        if self._transport is None:
+            return None
+        return self._transport.get_extra_info("sockname")[:2]
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Parse a datagram and queue it for the next flush."""
+        entry = parse_syslog_message(data)
+        if entry is None:
+            return
+        self.received += 1
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append((str(addr[0]), entry))
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Deliver queued messages to the sink.
+
+        Returns:
+            Number of messages delivered
+        """
+        batch, self._pending = self._pending, []
+        self._wakeup.clear()
+        if not batch:
+            return 0
+        try:
+            await self.on_batch(batch)
+        except Exception as e:
+            logger.error(f"Syslog batch ingest failed: {e}", exc_info=True)
+        return len(batch)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval_seconds)
+            await self.flush()
+
+
+__all__ = ["SyslogMessage", "SyslogReceiver", "parse_syslog_message"]
@@ -0,0 +1,805 @@
+"""In-memory fleet topology graph: devices, interfaces, subnets and L2 neighbours.
+
+The services return per-device lists (interfaces, bridge ports, IP
+addresses, ``/ip/neighbor`` discoveries); this module links them into one
+undirected graph so path, blast-radius and "what is connected to X"
+questions are answered from memory instead of by polling routers.
+
+Nodes (interned to small integers, adjacency kept as one dict per node):
+
+- ``device:{device_id}``
+- ``iface:{device_id}:{name}``
+- ``subnet:{network}`` shared by every interface addressed in it
+- ``neighbor:{mac or identity}`` for discovered neighbours that are not a
+  known device of the fleet
+
+Edges:
+
+- device - interface (``interface``); bridge ports hang off their bridge
+  instead (``bridge-port``), so a bridge going down cuts its ports off
+- interface - subnet (``address``)
+- interface - remote interface, remote device or neighbour node
+  (``neighbor``), resolved by the neighbour's MAC address against known
+  interface MACs, then by its identity against known device names
+
+Updates are incremental: each device's facts are kept, an update rebuilds
+only that device's edge set and applies the difference, and devices whose
+neighbours point at the updated device (by MAC or name) are re-resolved.
+An unchanged poll leaves the graph untouched.
+
+Example:
+    graph = get_topology_graph()
+    graph.update_device("dev-1", interfaces=ifaces, ip_addresses=addrs, neighbors=nbrs)
+    graph.path("dev-1", "dev-7")
+    graph.blast_radius("dev-1:ether2")
+"""
+
+import ipaddress
+import logging
+import time
+from collections import deque
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from routeros_mcp.domain.utils import parse_routeros_bool
+from routeros_mcp.infra.routeros.host_locator import normalize_mac
+
+logger = logging.getLogger(__name__)
+
+# Node kinds, in the order they are reported
+NODE_KINDS = ("device", "interface", "subnet", "neighbor")
+
+_KIND_PREFIX = {
+    "device": "device:",
+    "interface": "iface:",
+    "subnet": "subnet:",
+    "neighbor": "neighbor:",
+}
+
+# (node key, node key, edge kind) with the node keys sorted
+EdgeKey = tuple[str, str, str]
+
+# Fact lists kept per device
+_FACTS = ("interfaces", "bridge_ports", "ip_addresses", "neighbors")
+
+
+def _edge(a: str, b: str, kind: str) -> EdgeKey:
+    return (a, b, kind) if a <= b else (b, a, kind)
+
+
+def _local_interface(name: str) -> str:
+    """Port a neighbour was seen on (RouterOS reports ``ether2,bridge`` on bridge ports)."""
+    return name.split(",", 1)[0].strip()
+
+
+class TopologyGraph:
+    """Undirected fleet topology graph with per-device incremental updates."""
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._reset()
+
+    def _reset(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._kinds: list[str] = []
+        self._attrs: list[dict[str, Any]] = []
+        self._adj: list[dict[int, str]] = []
+        self._free: list[int] = []
+        self._edge_refs: dict[tuple[int, int], int] = {}
+
+        self._facts: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        self._names: dict[str, str] = {}
+        self._owned: dict[str, set[EdgeKey]] = {}
+        self._device_updated: dict[str, float] = {}
+
+        # Resolution indexes: MAC -> (device, interface), name -> device
+        self._mac_owner: dict[str, tuple[str, str]] = {}
+        self._device_by_name: dict[str, str] = {}
+        self._iface_names: dict[str, set[str]] = {}
+        # Neighbour entry index -> edge, and how many entries share each edge
+        self._neighbor_edges: dict[str, dict[int, EdgeKey]] = {}
+        self._neighbor_refs: dict[str, dict[EdgeKey, int]] = {}
+        # Watch token ("mac:..", "name:..") -> (device, neighbour entry) using it
+        self._watchers: dict[str, set[tuple[str, int]]] = {}
+        self._watching: dict[str, set[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Node and edge storage
+    # ------------------------------------------------------------------
+
+    def _intern(self, key: str) -> int:
+        node = self._ids.get(key)
+        if node is not None:
+            return node
+        kind = next(k for k, prefix in _KIND_PREFIX.items() if key.startswith(prefix))
+        if self._free:
+            node = self._free.pop()
+            self._keys[node] = key
+            self._kinds[node] = kind
+            self._attrs[node] = {}
+            self._adj[node] = {}
+        else:
+            node = len(self._keys)
+            self._keys.append(key)
+            self._kinds.append(kind)
+            self._attrs.append({})
+            self._adj.append({})
+        self._ids[key] = node
+        return node
+
+    def _release(self, node: int) -> None:
+        key = self._keys[node]
+        if key is None:
+            return
+        del self._ids[key]
+        self._keys[node] = None
+        self._attrs[node] = {}
+        self._adj[node] = {}
+        self._free.append(node)
+
+    def _add_edge(self, edge: EdgeKey) -> None:
+        a, b = self._intern(edge[0]), self._intern(edge[1])
+        pair = (a, b) if a < b else (b, a)
+        self._edge_refs[pair] = self._edge_refs.get(pair, 0) + 1
+        self._adj[a][b] = edge[2]
+        self._adj[b][a] = edge[2]
+
+    def _remove_edge(self, edge: EdgeKey, touched: set[int]) -> None:
+        a, b = self._ids.get(edge[0]), self._ids.get(edge[1])
+        if a is None or b is None:
+            return
+        pair = (a, b) if a < b else (b, a)
+        refs = self._edge_refs.get(pair, 0) - 1
+        if refs > 0:
+            self._edge_refs[pair] = refs
+            return
+        self._edge_refs.pop(pair, None)
+        self._adj[a].pop(b, None)
+        self._adj[b].pop(a, None)
+        touched.update((a, b))
+
+    def _collect_orphans(self, touched: Iterable[int]) -> None:
+        """Release interface, subnet and neighbour nodes left without edges."""
+        for node in touched:
+            if (
+                self._keys[node] is not None
+                and not self._adj[node]
+                and self._kinds[node] != "device"
+            ):
+                self._release(node)
+
+    # ------------------------------------------------------------------
+    # Per-device edge sets
+    # ------------------------------------------------------------------
+
+    def _resolve_neighbor(
+        self, device_id: str, neighbor: dict[str, Any]
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Node key a discovered neighbour links to, with attrs for a neighbour node."""
+        mac = normalize_mac(neighbor.get("mac_address") or "")
+        identity = (neighbor.get("identity") or "").strip()
+
+        remote: str | None = None
+        remote_iface: str | None = None
+        if mac and mac in self._mac_owner and self._mac_owner[mac][0] != device_id:
+            remote, remote_iface = self._mac_owner[mac]
+        elif identity and self._device_by_name.get(identity, device_id) != device_id:
+            remote = self._device_by_name[identity]
+
+        if remote is not None:
+            port = _local_interface(neighbor.get("interface_name") or "")
+            remote_names = self._iface_names.get(remote, set())
+            if port in remote_names:
+                remote_iface = port
+            if remote_iface is not None and remote_iface in remote_names:
+                return f"iface:{remote}:{remote_iface}", None
+            return f"device:{remote}", None
+
+        attrs = {
+            "mac_address": mac or None,
+            "identity": identity or None,
+            "address": neighbor.get("address") or None,
+            "platform": neighbor.get("platform") or None,
+            "board": neighbor.get("board") or None,
+            "version": neighbor.get("version") or None,
+        }
+        return f"neighbor:{mac or identity}", attrs
+
+    def _interface_names(self, device_id: str) -> set[str]:
+        """Every interface name a device's facts mention."""
+        facts = self._facts.get(device_id, {})
+        names = {i.get("name") or "" for i in facts.get("interfaces", [])}
+        names.update(p.get("interface") or "" for p in facts.get("bridge_ports", []))
+        names.update(p.get("bridge") or "" for p in facts.get("bridge_ports", []))
+        names.update(a.get("interface") or "" for a in facts.get("ip_addresses", []))
+        names.update(_local_interface(n.get("interface") or "") for n in facts.get("neighbors", []))
+        names.discard("")
+        return names
+
+    def _neighbor_edge(
+        self, device_id: str, neighbor: dict[str, Any]
+    ) -> tuple[EdgeKey, dict[str, Any] | None] | None:
+        """Edge for one discovered neighbour, None if it cannot be placed."""
+        name = _local_interface(neighbor.get("interface") or "")
+        if not name or not (neighbor.get("mac_address") or neighbor.get("identity")):
+            return None
+        target, attrs = self._resolve_neighbor(device_id, neighbor)
+        return _edge(f"iface:{device_id}:{name}", target, "neighbor"), attrs
+
+    @staticmethod
+    def _watch_tokens(neighbor: dict[str, Any]) -> list[str]:
+        mac = normalize_mac(neighbor.get("mac_address") or "")
+        identity = (neighbor.get("identity") or "").strip()
+        return [token for token in (mac and f"mac:{mac}", identity and f"name:{identity}") if token]
+
+    def _build_edges(
+        self, device_id: str
+    ) -> tuple[set[EdgeKey], dict[str, dict[str, Any]], dict[int, EdgeKey]]:
+        """Edges, node attrs and neighbour edges (by entry) implied by a device's facts."""
+        facts = self._facts[device_id]
+        device_key = f"device:{device_id}"
+        edges: set[EdgeKey] = set()
+        attrs: dict[str, dict[str, Any]] = {
+            device_key: {"device_id": device_id, "name": self._names.get(device_id)}
+        }
+
+        def iface(name: str) -> str:
+            key = f"iface:{device_id}:{name}"
+            attrs.setdefault(key, {"device_id": device_id, "name": name})
+            return key
+
+        ports: dict[str, str] = {}
+        for port in facts.get("bridge_ports", []):
+            name, bridge = port.get("interface") or "", port.get("bridge") or ""
+            if name and bridge and name != bridge and not parse_routeros_bool(port.get("disabled")):
+                ports[name] = bridge
+
+        for item in facts.get("interfaces", []):
+            if item.get("name"):
+                attrs[iface(item["name"])].update(
+                    {
+                        "type": item.get("type") or None,
+                        "mac_address": normalize_mac(item.get("mac_address") or "") or None,
+                        "running": item.get("running"),
+                        "disabled": item.get("disabled"),
+                    }
+                )
+
+        for address in facts.get("ip_addresses", []):
+            name = address.get("interface") or ""
+            # REST facts carry flags as "true"/"false" strings
+            if (
+                not name
+                or parse_routeros_bool(address.get("disabled"))
+                or parse_routeros_bool(address.get("invalid"))
+            ):
+                continue
+            try:
+                network = ipaddress.ip_interface(address.get("address") or "").network
+            except ValueError:
+                continue
+            subnet = f"subnet:{network}"
+            attrs.setdefault(subnet, {"network": str(network)})
+            edges.add(_edge(iface(name), subnet, "address"))
+            attrs[iface(name)].setdefault("addresses", []).append(address["address"])
+
+        neighbor_edges: dict[int, EdgeKey] = {}
+        for entry, neighbor in enumerate(facts.get("neighbors", [])):
+            placed = self._neighbor_edge(device_id, neighbor)
+            if placed is None:
+                continue
+            edge, neighbor_attrs = placed
+            if neighbor_attrs is not None:
+                attrs[edge[0] if edge[0].startswith("neighbor:") else edge[1]] = neighbor_attrs
+            neighbor_edges[entry] = edge
+            edges.add(edge)
+
+        for name in self._iface_names[device_id]:
+            key = iface(name)
+            if name in ports:
+                edges.add(_edge(iface(ports[name]), key, "bridge-port"))
+            else:
+                edges.add(_edge(device_key, key, "interface"))
+
+        return edges, attrs, neighbor_edges
+
+    def _set_attrs(self, attrs: dict[str, dict[str, Any]]) -> None:
+        for key, values in attrs.items():
+            node = self._ids.get(key)
+            if node is not None:
+                self._attrs[node] = values
+
+    def _unwatch(self, device_id: str) -> None:
+        for token in self._watching.pop(device_id, set()):
+            watchers = self._watchers.get(token, set())
+            watchers.difference_update({w for w in watchers if w[0] == device_id})
+            if not watchers:
+                self._watchers.pop(token, None)
+
+    def _apply(self, device_id: str) -> None:
+        """Replace a device's edges with those implied by its current facts."""
+        edges, attrs, neighbor_edges = self._build_edges(device_id)
+        old = self._owned.get(device_id, set())
+
+        self._intern(f"device:{device_id}")
+        touched: set[int] = set()
+        for edge in old - edges:
+            self._remove_edge(edge, touched)
+        for edge in edges - old:
+            self._add_edge(edge)
+        self._owned[device_id] = edges
+        self._set_attrs(attrs)
+        self._collect_orphans(touched)
+
+        self._neighbor_edges[device_id] = neighbor_edges
+        refs: dict[EdgeKey, int] = {}
+        for edge in neighbor_edges.values():
+            refs[edge] = refs.get(edge, 0) + 1
+        self._neighbor_refs[device_id] = refs
+
+        self._unwatch(device_id)
+        neighbors = self._facts[device_id].get("neighbors", [])
+        tokens: set[str] = set()
+        for entry in neighbor_edges:
+            for token in self._watch_tokens(neighbors[entry]):
+                self._watchers.setdefault(token, set()).add((device_id, entry))
+                tokens.add(token)
+        self._watching[device_id] = tokens
+
+    def _reresolve(self, device_id: str, entry: int, touched: set[int]) -> None:
+        """Re-place one neighbour entry after the device it points at changed."""
+        neighbor = self._facts[device_id]["neighbors"][entry]
+        placed = self._neighbor_edge(device_id, neighbor)
+        old = self._neighbor_edges[device_id].get(entry)
+        if placed is None or old is None:
+            return
+        edge, attrs = placed
+        if edge != old:
+            refs = self._neighbor_refs[device_id]
+            refs[old] -= 1
+            if refs[old] == 0:
+                del refs[old]
+                self._owned[device_id].discard(old)
+                self._remove_edge(old, touched)
+            refs[edge] = refs.get(edge, 0) + 1
+            if refs[edge] == 1:
+                self._owned[device_id].add(edge)
+                self._add_edge(edge)
+            self._neighbor_edges[device_id][entry] = edge
+        if attrs is not None:
+            self._set_attrs({edge[0] if edge[0].startswith("neighbor:") else edge[1]: attrs})
+
+    def _index_device(self, device_id: str, add: bool) -> set[str]:
+        """Add or drop a device's MACs and name in the resolution indexes.
+
+        Returns:
+            Watch tokens affected by the change
+        """
+        tokens: set[str] = set()
+        name = self._names.get(device_id)
+        if name:
+            tokens.add(f"name:{name}")
+            if add:
+                self._device_by_name.setdefault(name, device_id)
+            elif self._device_by_name.get(name) == device_id:
+                del self._device_by_name[name]
+        for item in self._facts.get(device_id, {}).get("interfaces", []):
+            mac = normalize_mac(item.get("mac_address") or "")
+            if not mac or not item.get("name"):
+                continue
+            tokens.add(f"mac:{mac}")
+            if add:
+                self._mac_owner.setdefault(mac, (device_id, item["name"]))
+            elif self._mac_owner.get(mac, ("",))[0] == device_id:
+                del self._mac_owner[mac]
+        return tokens
+
+    def _refresh_watchers(self, tokens: set[str], exclude: str) -> None:
+        """Re-place other devices' neighbour entries that match the tokens."""
+        entries = set().union(*(self._watchers.get(token, set()) for token in tokens))
+        touched: set[int] = set()
+        for device_id, entry in sorted(entries):
+            if device_id != exclude and device_id in self._facts:
+                self._reresolve(device_id, entry, touched)
+        self._collect_orphans(touched)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update_device(
+        self,
+        device_id: str,
+        name: str | None = None,
+        interfaces: list[dict[str, Any]] | None = None,
+        bridge_ports: list[dict[str, Any]] | None = None,
+        ip_addresses: list[dict[str, Any]] | None = None,
+        neighbors: list[dict[str, Any]] | None = None,
+        timestamp: float | None = None,
+    ) -> dict[str, int]:
+        """Merge one device's facts into the graph.
+
+        Fact lists left as None keep their previous value, so a single
+        service read (e.g. only the IP addresses) updates just its part.
+
+        Args:
+            device_id: Device the facts were read from
+            name: Device name, matched against neighbour identities
+            interfaces: InterfaceService.list_interfaces entries
+            bridge_ports: BridgeService.list_bridge_ports entries
+            ip_addresses: IPService.list_addresses entries
+            neighbors: IPService.list_neighbors entries
+            timestamp: Update time (default: now)
+
+        Returns:
+            Counts of edges added and removed for the device
+        """
+        facts = self._facts.setdefault(device_id, {fact: [] for fact in _FACTS})
+        old_edges = set(self._owned.get(device_id, set()))
+
+        tokens = self._index_device(device_id, add=False)
+        if name is not None:
+            self._names[device_id] = name
+        for fact, value in zip(
+            _FACTS, (interfaces, bridge_ports, ip_addresses, neighbors), strict=True
+        ):
+            if value is not None:
+                facts[fact] = list(value)
+        self._iface_names[device_id] = self._interface_names(device_id)
+        tokens |= self._index_device(device_id, add=True)
+
+        self._apply(device_id)
+        self._refresh_watchers(tokens, exclude=device_id)
+        self._device_updated[device_id] = time.time() if timestamp is None else timestamp
+
+        new_edges = self._owned[device_id]
+        return {"added": len(new_edges - old_edges), "removed": len(old_edges - new_edges)}
+
+    def remove_device(self, device_id: str) -> int:
+        """Drop a device, its interfaces and every edge it reported.
+
+        Returns:
+            Number of edges the device owned
+        """
+        if device_id not in self._facts:
+            return 0
+        tokens = self._index_device(device_id, add=False)
+        self._names.pop(device_id, None)
+        self._refresh_watchers(tokens, exclude=device_id)
+
+        touched: set[int] = set()
+        edges = self._owned.pop(device_id, set())
+        for edge in edges:
+            self._remove_edge(edge, touched)
+        self._unwatch(device_id)
+        del self._facts[device_id]
+        self._iface_names.pop(device_id, None)
+        self._neighbor_edges.pop(device_id, None)
+        self._neighbor_refs.pop(device_id, None)
+        self._device_updated.pop(device_id, None)
+
+        device_node = self._ids[f"device:{device_id}"]
+        for other in list(self._adj[device_node]):
+            self._adj[other].pop(device_node, None)
+            pair = (device_node, other) if device_node < other else (other, device_node)
+            self._edge_refs.pop(pair, None)
+            touched.add(other)
+        self._release(device_node)
+        self._collect_orphans(touched)
+        return len(edges)
+
+    def has_device(self, device_id: str) -> bool:
+        return device_id in self._facts
+
+    def device_ids(self) -> list[str]:
+        """Devices with facts in the graph."""
+        return sorted(self._facts)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def resolve(self, ref: str) -> str:
+        """Node key for a reference.
+
+        Accepts a node key, a device ID (``dev-1``), a device interface
+        (``dev-1:ether2``), a subnet (``10.0.0.0/24``), an IP address (the
+        subnet containing it) or a MAC address (interface or neighbour).
+
+        Raises:
+            ValueError: If nothing in the graph matches
+        """
+        ref = ref.strip()
+        if ref in self._ids:
+            return ref
+        if f"device:{ref}" in self._ids:
+            return f"device:{ref}"
+        if f"iface:{ref}" in self._ids:
+            return f"iface:{ref}"
+
+        try:
+            network = ipaddress.ip_network(ref, strict=False)
+        except ValueError:
+            network = None
+        if network is not None:
+            if "/" in ref and f"subnet:{network}" in self._ids:
+                return f"subnet:{network}"
+            if "/" not in ref:
+                host = network.network_address
+                for key, node in self._ids.items():
+                    if self._kinds[node] == "subnet" and host in ipaddress.ip_network(
+                        key[len("subnet:") :]
+                    ):
+                        return key
+
+        mac = normalize_mac(ref)
+        if mac in self._mac_owner:
+            owner, iface = self._mac_owner[mac]
+            return f"iface:{owner}:{iface}"
+        if f"neighbor:{mac}" in self._ids:
+            return f"neighbor:{mac}"
+        raise ValueError(f"Unknown topology node: {ref}")
+
+    def node(self, ref: str) -> dict[str, Any]:
+        """Node key, kind, attributes and degree."""
+        node = self._ids[self.resolve(ref)]
+        return self._node_dict(node) | {"degree": len(self._adj[node])}
+
+    def _node_dict(self, node: int) -> dict[str, Any]:
+        return {"key": self._keys[node], "kind": self._kinds[node], **self._attrs[node]}
+
+    def connected(self, ref: str, depth: int = 1) -> list[dict[str, Any]]:
+        """Nodes within ``depth`` hops of a node (breadth-first).
+
+        Returns:
+            Nodes with their distance and the kind of edge they were reached by,
+            nearest first
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        start = self._ids[self.resolve(ref)]
+        seen = {start}
+        frontier = [start]
+        found: list[dict[str, Any]] = []
+        for distance in range(1, depth + 1):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for other, kind in sorted(
+                    self._adj[node].items(), key=lambda item: self._keys[item[0]] or ""
+                ):
+                    if other not in seen:
+                        seen.add(other)
+                        next_frontier.append(other)
+                        found.append(self._node_dict(other) | {"distance": distance, "via": kind})
+            frontier = next_frontier
+        return found
+
+    def path(self, src: str, dst: str) -> list[dict[str, Any]] | None:
+        """Shortest path (fewest hops) between two nodes.
+
+        Returns:
+            Nodes from src to dst, each with the kind of edge leading to it
+            (None for src), or None when they are not connected
+        """
+        start, goal = self._ids[self.resolve(src)], self._ids[self.resolve(dst)]
+        parent: dict[int, int] = {start: start}
+        queue = deque([start])
+        while queue and goal not in parent:
+            node = queue.popleft()
+            for other in self._adj[node]:
+                if other not in parent:
+                    parent[other] = node
+                    queue.append(other)
+        if goal not in parent:
+            return None
+
+        nodes = [goal]
+        while nodes[-1] != start:
+            nodes.append(parent[nodes[-1]])
+        nodes.reverse()
+        return [
+            self._node_dict(node) | {"via": self._adj[prev][node] if i else None}
+            for i, (prev, node) in enumerate(zip([start, *nodes], nodes, strict=False))
+        ]
+
+    def _split_without(self, target: int, anchor: int | None) -> tuple[list[list[int]], int | None]:
+        """Pieces the graph falls into around a removed node.
+
+        One breadth-first search per neighbour of the node runs in lock
+        step; searches that meet are merged. Once a single search is still
+        running and it holds the anchor (or no anchor was given), it is the
+        kept piece and is not walked to the end, so a port whose far side is
+        small costs the size of that side, not of the whole fleet.
+
+        Returns:
+            Members of every piece and the index of the kept piece (None if
+            the anchor is not connected to the node at all)
+        """
+        starts = list(self._adj[target])
+        parent = list(range(len(starts)))
+        members: list[list[int]] = [[node] for node in starts]
+        queues = [deque([node]) for node in starts]
+        owner = {node: piece for piece, node in enumerate(starts)}
+        active = set(range(len(starts)))
+
+        def find(piece: int) -> int:
+            while parent[piece] != piece:
+                parent[piece] = parent[parent[piece]]
+                piece = parent[piece]
+            return piece
+
+        while active:
+            if len(active) == 1:
+                (only,) = active
+                if anchor is None or (anchor in owner and find(owner[anchor]) == only):
+                    break
+            for piece in sorted(active):
+                if piece not in active:
+                    continue
+                node = queues[piece].popleft()
+                for other in self._adj[node]:
+                    if other == target:
+                        continue
+                    found = owner.get(other)
+                    if found is None:
+                        owner[other] = piece
+                        members[piece].append(other)
+                        queues[piece].append(other)
+                        continue
+                    found = find(found)
+                    if found == piece:
+                        continue
+                    # Two searches met: fold the smaller into the larger
+                    big, small = (
+                        (piece, found)
+                        if len(members[piece]) >= len(members[found])
+                        else (found, piece)
+                    )
+                    parent[small] = big
+                    members[big].extend(members[small])
+                    queues[big].extend(queues[small])
+                    members[small], queues[small] = [], deque()
+                    active.discard(small)
+                    active.add(big)
+                    piece = big
+                if not queues[piece]:
+                    active.discard(piece)
+
+        roots = sorted({find(piece) for piece in range(len(starts))})
+        pieces = [members[root] for root in roots]
+        if anchor is not None:
+            if anchor not in owner:
+                return pieces, None
+            return pieces, roots.index(find(owner[anchor]))
+        if active:
+            return pieces, roots.index(next(iter(active)))
+        if not pieces:
+            return pieces, None
+        return pieces, max(range(len(pieces)), key=lambda i: (len(pieces[i]), -i))
+
+    def blast_radius(self, ref: str, anchor: str | None = None) -> dict[str, Any]:
+        """What loses its connection to the anchor if a node goes down.
+
+        The node is taken out of the graph and every node that can no longer
+        reach the anchor is reported. The anchor defaults to the owning
+        device for an interface, otherwise to the largest remaining piece of
+        the node's network (reported as anchor None).
+
+        Args:
+            ref: Node going down (see resolve)
+            anchor: Node whose view of the network is reported
+
+        Returns:
+            Removed node, anchor and the isolated nodes grouped by kind
+        """
+        target = self._ids[self.resolve(ref)]
+        anchor_node: int | None = None
+        if anchor is not None:
+            anchor_node = self._ids[self.resolve(anchor)]
+            if anchor_node == target:
+                raise ValueError("anchor must differ from the node going down")
+        elif self._kinds[target] == "interface":
+            anchor_node = self._ids.get(f"device:{self._attrs[target]['device_id']}")
+
+        pieces, kept = self._split_without(target, anchor_node)
+
+        isolated: dict[str, list[str]] = {kind: [] for kind in NODE_KINDS}
+        if kept is not None:
+            for index, piece in enumerate(pieces):
+                if index == kept:
+                    continue
+                for node in piece:
+                    isolated[self._kinds[node]].append(self._keys[node] or "")
+        for keys in isolated.values():
+            keys.sort()
+
+        return {
+            "node": self._node_dict(target),
+            "anchor": self._keys[anchor_node] if anchor_node is not None else None,
+            "isolated": isolated,
+            "isolated_count": sum(len(keys) for keys in isolated.values()),
+            "isolated_devices": len(isolated["device"]) + len(isolated["neighbor"]),
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Node counts by kind, edge count and the time of the newest update."""
+        nodes = dict.fromkeys(NODE_KINDS, 0)
+        for node, key in enumerate(self._keys):
+            if key is not None:
+                nodes[self._kinds[node]] += 1
+        last_update = max(self._device_updated.values(), default=None)
+        return {
+            "devices": len(self._facts),
+            "nodes": nodes,
+            "edges": len(self._edge_refs),
+            "last_update": (
+                datetime.fromtimestamp(last_update, UTC).isoformat() if last_update else None
+            ),
+        }
+
+    def clear(self) -> None:
+        """Drop every node and edge."""
+        self._reset()
+
+
+def observe_device_facts(settings: Any, device_id: str, **facts: Any) -> None:
+    """Feed a fresh service read into the global graph when topology is enabled.
+
+    Failures are logged and swallowed; a topology problem never fails a read.
+
+    Args:
+        settings: Application settings (topology_enabled gates the update)
+        device_id: Device the facts were read from
+        **facts: update_device keyword arguments, e.g. ``interfaces=[...]``
+    """
+    if getattr(settings, "topology_enabled", False) is not True:
+        return
+    try:
+        get_topology_graph().update_device(device_id, **facts)
+    except Exception as e:
+        logger.warning(
+            f"Topology update failed for device {device_id}: {e}",
+            extra={"device_id": device_id},
+        )
+
+
+# Global graph instance
+_graph_instance: TopologyGraph | None = None
+
+
+def reset_topology_graph() -> None:
+    """Reset the global graph instance (primarily for testing)."""
+    global _graph_instance
+    _graph_instance = None
+
+
+def get_topology_graph() -> TopologyGraph:
+    """Get the global graph, creating an empty one if needed."""
+    global _graph_instance
+    if _graph_instance is None:
+        _graph_instance = TopologyGraph()
+    return _graph_instance
+
+
+def initialize_topology_graph() -> TopologyGraph:
+    """Initialize the global graph instance.
+
+    Returns:
+        The new global TopologyGraph
+    """
+    global _graph_instance
+    _graph_instance = TopologyGraph()
+    logger.info("Topology graph initialized")
+    return _graph_instance
+
+
+__all__ = [
+    "NODE_KINDS",
+    "TopologyGraph",
+    "get_topology_graph",
+    "initialize_topology_graph",
+    "observe_device_facts",
+    "reset_topology_graph",
+]
@@ -0,0 +1,397 @@
+"""In-memory interface counter samples and locally computed traffic rates.
+
+``monitor-traffic`` makes the router sample each interface for a second on
+every stats call. Cumulative counters (``rx-byte``, ``tx-packet``, ...)
+come back with the plain ``/interface`` listing, so a background collector
+reads them every ``metrics_collection_interval_seconds`` for devices
+someone is watching, and rates are computed here from consecutive samples.
+
+Per interface, the last N samples live in a ring backed by two flat
+``array`` buffers (timestamps as doubles, counters as unsigned 64-bit
+integers), so history costs 72 bytes per sample instead of a dict per
+sample.
+
+Counter decreases are handled locally: a 32-bit counter that wrapped is
+unwrapped, anything else is treated as a reset (reboot or
+``reset-counters``) and the new value is taken as the delta.
+
+Example:
+    store = get_traffic_store()
+    store.watch("dev-1")
+    store.record("dev-1", rest_interfaces)  # from the collector job
+    rates = store.rates("dev-1", ["ether1"], max_age=600)
+"""
+
+import logging
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default samples kept per interface
+DEFAULT_HISTORY_SAMPLES = 60
+
+# Devices are collected while read at least this often
+WATCH_TTL_SECONDS = 3600.0
+
+# Cumulative /interface counters, in ring column order
+COUNTER_FIELDS = (
+    "rx-byte",
+    "tx-byte",
+    "rx-packet",
+    "tx-packet",
+    "rx-error",
+    "tx-error",
+    "rx-drop",
+    "tx-drop",
+)
+
+# Output key per counter column (bytes are reported as bits)
+_RATE_KEYS = (
+    "rx_bits_per_second",
+    "tx_bits_per_second",
+    "rx_packets_per_second",
+    "tx_packets_per_second",
+    "rx_errors_per_second",
+    "tx_errors_per_second",
+    "rx_drops_per_second",
+    "tx_drops_per_second",
+)
+_RATE_SCALE = (8, 8, 1, 1, 1, 1, 1, 1)
+
+_WIDTH = len(COUNTER_FIELDS)
+_COUNTER_32_MAX = 1 << 32
+
+
+def counter_delta(previous: int, current: int) -> int:
+    """Increase of a cumulative counter between two samples.
+
+    Args:
+        previous: Earlier counter value
+        current: Later counter value
+
+    Returns:
+        Counter increase, unwrapping a 32-bit wrap and treating any other
+        decrease as a reset
+    """
+    if current >= previous:
+        return current - previous
+    if previous < _COUNTER_32_MAX:
+        wrapped = current + _COUNTER_32_MAX - previous
+        # A genuine wrap moves less than half the counter range
+        if wrapped < _COUNTER_32_MAX // 2:
+            return wrapped
+    return current
+
+
+def _parse_counter(value: Any) -> int:
+    """Counter value from a REST field (numeric string), 0 when absent."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return number if number >= 0 else 0
+
+
+class CounterRing:
+    """Fixed-capacity ring of (timestamp, counters) samples for one interface."""
+
+    __slots__ = ("capacity", "_times", "_values", "_count", "_next")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty ring.
+
+        Args:
+            capacity: Maximum samples kept (oldest overwritten first)
+        """
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("Q", bytes(8 * capacity * _WIDTH))
+        self._count = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, counters: Iterable[int]) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        slot = self._next
+        self._times[slot] = timestamp
+        base = slot * _WIDTH
+        for offset, value in enumerate(counters):
+            self._values[base + offset] = value
+        self._next = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def sample(self, age: int = 0) -> tuple[float, tuple[int, ...]]:
+        """Sample ``age`` steps back from the newest (0 = newest)."""
+        if age >= self._count:
+            raise IndexError("sample not in ring")
+        slot = (self._next - 1 - age) % self.capacity
+        base = slot * _WIDTH
+        return self._times[slot], tuple(self._values[base : base + _WIDTH])
+
+    def __iter__(self) -> Iterator[tuple[float, tuple[int, ...]]]:
+        """Samples oldest first."""
+        for age in range(self._count - 1, -1, -1):
+            yield self.sample(age)
+
+
+def _rates_between(
+    earlier: tuple[float, tuple[int, ...]], later: tuple[float, tuple[int, ...]]
+) -> dict[str, Any] | None:
+    """Per-second rates between two samples, or None for a zero interval."""
+    interval = later[0] - earlier[0]
+    if interval <= 0:
+        return None
+    rates: dict[str, Any] = {
+        key: int(counter_delta(before, after) * scale / interval)
+        for key, scale, before, after in zip(
+            _RATE_KEYS, _RATE_SCALE, earlier[1], later[1], strict=True
+        )
+    }
+    rates["interval_seconds"] = round(interval, 3)
+    return rates
+
+
+@dataclass(slots=True)
+class DeviceCounters:
+    """Counter rings for one device."""
+
+    interfaces: dict[str, CounterRing] = field(default_factory=dict)
+    watched_at: float | None = None
+    last_sample: float | None = None
+    samples: int = 0
+
+
+class TrafficCounterStore:
+    """Per-device interface counter rings and rate computation."""
+
+    def __init__(self, history_samples: int = DEFAULT_HISTORY_SAMPLES) -> None:
+        """Initialize the store.
+
+        Args:
+            history_samples: Samples kept per interface (at least 2)
+        """
+        if history_samples < 2:
+            raise ValueError("history_samples must be at least 2")
+        self.history_samples = history_samples
+        self._devices: dict[str, DeviceCounters] = {}
+
+    def _device(self, device_id: str) -> DeviceCounters:
+        device = self._devices.get(device_id)
+        if device is None:
+            device = DeviceCounters()
+            self._devices[device_id] = device
+        return device
+
+    def watch(self, device_id: str, now: float | None = None) -> bool:
+        """Mark a device as read, so the collector keeps sampling it.
+
+        Returns:
+            True if the device was not being watched before
+        """
+        device = self._device(device_id)
+        is_new = device.watched_at is None
+        device.watched_at = now if now is not None else time.time()
+        return is_new
+
+    def watched(self, now: float | None = None, ttl: float = WATCH_TTL_SECONDS) -> list[str]:
+        """Devices read within ``ttl`` seconds; idle devices are dropped."""
+        now = now if now is not None else time.time()
+        expired = [
+            device_id
+            for device_id, device in self._devices.items()
+            if device.watched_at is None or now - device.watched_at > ttl
+        ]
+        for device_id in expired:
+            del self._devices[device_id]
+        return list(self._devices)
+
+    def record(
+        self,
+        device_id: str,
+        interfaces: Iterable[dict[str, Any]],
+        timestamp: float | None = None,
+    ) -> int:
+        """Store one counter sample per interface from an ``/interface`` listing.
+
+        Interfaces missing from the listing (removed from the device) are
+        dropped.
+
+        Args:
+            device_id: Device identifier
+            interfaces: REST interface items with ``name`` and counter fields
+            timestamp: Sample time (Unix seconds, default now)
+
+        Returns:
+            Number of interfaces sampled
+        """
+        timestamp = timestamp if timestamp is not None else time.time()
+        device = self._device(device_id)
+        seen: dict[str, CounterRing] = {}
+        for item in interfaces:
+            name = item.get("name")
+            if not name:
+                continue
+            ring = device.interfaces.get(name) or CounterRing(self.history_samples)
+            ring.append(timestamp, [_parse_counter(item.get(f)) for f in COUNTER_FIELDS])
+            seen[name] = ring
+        device.interfaces = seen
+        device.last_sample = timestamp
+        device.samples += 1
+        return len(seen)
+
+    def samples(self, device_id: str) -> int:
+        """Number of collections recorded for a device."""
+        device = self._devices.get(device_id)
+        return device.samples if device else 0
+
+    def rates(
+        self,
+        device_id: str,
+        interface_names: list[str] | None = None,
+        max_age: float | None = None,
+        now: float | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Latest rates per interface from the two newest samples.
+
+        Args:
+            device_id: Device identifier
+            interface_names: Interfaces to return (default: all sampled)
+            max_age: Maximum age of the newest sample in seconds
+            now: Reference time (Unix seconds, default now)
+
+        Returns:
+            One rate dict per interface, or None if any requested interface
+            has fewer than two samples or the data is older than ``max_age``
+        """
+        device = self._devices.get(device_id)
+        if device is None or device.last_sample is None:
+            return None
+        now = now if now is not None else time.time()
+        if max_age is not None and now - device.last_sample > max_age:
+            return None
+
+        names = interface_names or list(device.interfaces)
+        result: list[dict[str, Any]] = []
+        for name in dict.fromkeys(names):
+            ring = device.interfaces.get(name)
+            if ring is None or len(ring) < 2:
+                return None
+            latest = ring.sample(0)
+            rates = _rates_between(ring.sample(1), latest)
+            if rates is None:
+                return None
+            result.append({
+                "name": name,
+                **rates,
+                "sampled_at": datetime.fromtimestamp(latest[0], UTC).isoformat(),
+            })
+        return result
+
+    def history(
+        self, device_id: str, interface_names: list[str] | None = None
+    ) -> dict[str, dict[str, list[Any]]]:
+        """Column-oriented rate history per interface, oldest first.
+
+        Args:
+            device_id: Device identifier
+            interface_names: Interfaces to return (default: all sampled)
+
+        Returns:
+            Mapping of interface name to columns (``sampled_at`` plus one
+            list per rate key), one row per consecutive sample pair
+        """
+        device = self._devices.get(device_id)
+        if device is None:
+            return {}
+        names = interface_names or list(device.interfaces)
+        history: dict[str, dict[str, list[Any]]] = {}
+        for name in names:
+            ring = device.interfaces.get(name)
+            if ring is None:
+                continue
+            columns: dict[str, list[Any]] = {key: [] for key in ("sampled_at", *_RATE_KEYS)}
+            previous = None
+            for sample in ring:
+                rates = _rates_between(previous, sample) if previous is not None else None
+                previous = sample
+                if rates is None:
+                    continue
+                columns["sampled_at"].append(datetime.fromtimestamp(sample[0], UTC).isoformat())
+                for key in _RATE_KEYS:
+                    columns[key].append(rates[key])
+            history[name] = columns
+        return history
+
+    def forget(self, device_id: str) -> None:
+        """Drop all samples of a device."""
+        self._devices.pop(device_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Sampled interface counts per device."""
+        return {
+            "history_samples": self.history_samples,
+            "devices": {
+                device_id: {
+                    "interfaces": len(device.interfaces),
+                    "samples": device.samples,
+                    "last_sample": device.last_sample,
+                }
+                for device_id, device in self._devices.items()
+            },
+        }
+
+
+# Global store instance
+_store_instance: TrafficCounterStore | None = None
+
+
+def reset_traffic_store() -> None:
+    """Reset the global store instance (primarily for testing)."""
+    global _store_instance
+    _store_instance = None
+
+
+def get_traffic_store() -> TrafficCounterStore:
+    """Get the global store, creating one with default sizing if needed."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = TrafficCounterStore()
+    return _store_instance
+
+
+def initialize_traffic_store(
+    history_samples: int = DEFAULT_HISTORY_SAMPLES,
+) -> TrafficCounterStore:
+    """Initialize the global store instance.
+
+    Args:
+        history_samples: Samples kept per interface
+
+    Returns:
+        The new global TrafficCounterStore
+    """
+    global _store_instance
+    _store_instance = TrafficCounterStore(history_samples=history_samples)
+    logger.info("Traffic counter store initialized", extra={"history_samples": history_samples})
+    return _store_instance
+
+
+__all__ = [
+    "COUNTER_FIELDS",
+    "DEFAULT_HISTORY_SAMPLES",
+    "WATCH_TTL_SECONDS",
+    "CounterRing",
+    "DeviceCounters",
+    "TrafficCounterStore",
+    "counter_delta",
+    "get_traffic_store",
+    "initialize_traffic_store",
+    "reset_traffic_store",
+]
@@ -14,6 +14,7 @@ See docs/02-security-oauth-integration-and-access-control.md for design.
 import logging
 
 from routeros_mcp.config import Settings
+from routeros_mcp.domain.request_context import get_request_context
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.infra.db.session import DatabaseSessionManager
 from routeros_mcp.mcp.errors import (
@@ -116,11 +117,24 @@ class AuthorizationMiddleware:
                 f"Valid roles: {', '.join([r.value for r in UserRole])}"
             ) from e
 
-        # Fetch device from database
+        # Decisions are memoized for the rest of the request; they were
+        # already logged when first made
+        context = get_request_context()
+        decision_key = (user.sub, user.role, tool_name, tool_tier.value, device_id)
+        if context is not None and decision_key in context.authorizations:
+            context.hits += 1
+            denial = context.authorizations[decision_key]
+            if denial is not None:
+                raise MCPAuthorizationError(denial)
+            return
+
+        # Fetch device (memoized per request when a scope is active)
         try:
-            async with self.session_factory.session() as session:
-                device_service = DeviceService(session, self.settings)
-                device = await device_service.get_device(device_id)
+            device = context.devices.get(device_id) if context is not None else None
+            if device is None:
+                async with self.session_factory.session() as session:
+                    device_service = DeviceService(session, self.settings)
+                    device = await device_service.get_device(device_id)
         except DeviceNotFoundError:
             # Log device not found as authorization failure
             logger.warning(
@@ -178,6 +192,8 @@ class AuthorizationMiddleware:
                     "decision": "ALLOW",
                 },
             )
+            if context is not None:
+                context.authorizations[decision_key] = None
 
         except (
             RoleInsufficientError,
@@ -202,6 +218,8 @@ class AuthorizationMiddleware:
                 log_extra["device_environment"] = device.environment
 
             logger.warning("Authorization denied", extra=log_extra)
+            if context is not None:
+                context.authorizations[decision_key] = str(e)
             # Convert to MCPError for proper JSON-RPC handling
             raise MCPAuthorizationError(str(e)) from e
 
@@ -0,0 +1,60 @@
+"""Request-scope middleware for MCP tool calls and resource reads.
+
+Opens a request scope (see routeros_mcp.domain.request_context) around each
+tools/call and resources/read message so that device rows, credentials and
+authorization decisions are fetched at most once per call, no matter how many
+services look them up.
+
+Example:
+    mcp = FastMCP(name="routeros-mcp")
+    mcp.add_middleware(RequestContextMiddleware())
+"""
+
+import logging
+from typing import Any
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from routeros_mcp.domain.request_context import RequestContext, request_scope
+
+logger = logging.getLogger(__name__)
+
+
+class RequestContextMiddleware(Middleware):
+    """FastMCP middleware giving each tool call its own request scope."""
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        """Run a tool call inside a request scope."""
+        with request_scope() as request_context:
+            try:
+                return await call_next(context)
+            finally:
+                self._log_scope(context, request_context)
+
+    async def on_read_resource(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        """Run a resource read inside a request scope."""
+        with request_scope() as request_context:
+            try:
+                return await call_next(context)
+            finally:
+                self._log_scope(context, request_context)
+
+    @staticmethod
+    def _log_scope(context: MiddlewareContext[Any], request_context: RequestContext) -> None:
+        """Log memo effectiveness for the finished request."""
+        logger.debug(
+            "Request scope closed",
+            extra={
+                "method": context.method,
+                "memo_hits": request_context.hits,
+                "memo_misses": request_context.misses,
+            },
+        )
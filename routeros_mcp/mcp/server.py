@@ -19,6 +19,7 @@ from routeros_mcp.infra.db.session import (
     initialize_session_manager,
 )
 from routeros_mcp.mcp.errors import MCPError, map_exception_to_error
+from routeros_mcp.mcp.middleware.request_context import RequestContextMiddleware
 from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
 
 if TYPE_CHECKING:
@@ -75,7 +76,8 @@ class RouterOSMCPServer:
         """
         self.settings = settings
         self.session_factory: DatabaseSessionManager | None = None  # Will be initialized in start()
-        self.scheduler: Any = None  # Will be initialized in start() if snapshot_capture_enabled
+        self.scheduler: Any = None  # Will be initialized in start() if any periodic job is enabled
+        self.syslog_receiver: Any = None  # Started in start() if log_archive_syslog_enabled
 
         # Create FastMCP instance
         self.mcp = FastMCP(
@@ -94,6 +96,8 @@ This service provides tools for:
 All operations respect environment boundaries (lab/staging/prod) and
 require appropriate device capabilities and permissions.
 """.strip(),
+            # Memoize device, credential and authorization lookups per request
+            middleware=[RequestContextMiddleware()],
         )
 
         # Register tools
@@ -122,10 +126,12 @@ require appropriate device capabilities and permissions.
             register_dns_ntp_tools,
             register_firewall_logs_tools,
             register_firewall_write_tools,
+            register_fleet_tools,
             register_interface_tools,
             register_ip_tools,
             register_routing_tools,
             register_system_tools,
+            register_topology_tools,
             register_wireless_tools,
         )
 
@@ -257,6 +263,8 @@ require appropriate device capabilities and permissions.
         register_config_tools(self.mcp, self.settings)
         register_wireless_tools(self.mcp, self.settings)
         register_diagnostics_tools(self.mcp, self.settings)
+        register_fleet_tools(self.mcp, self.settings)
+        register_topology_tools(self.mcp, self.settings)
 
         logger.info("Registered all MCP tools")
 
@@ -298,6 +306,66 @@ require appropriate device capabilities and permissions.
         self.session_factory = await initialize_session_manager(self.settings)
         logger.info("Database session manager initialized")
 
+        # Load the in-memory device registry (write-through, synced across replicas)
+        if self.settings.device_registry_enabled:
+            from routeros_mcp.infra.device_registry import (
+                initialize_device_registry,
+                reset_device_registry,
+            )
+
+            registry = initialize_device_registry()
+            try:
+                await registry.load(self.session_factory)
+                registry.start_sync(
+                    self.session_factory,
+                    self.settings.device_registry_sync_interval_seconds,
+                )
+            except Exception as e:
+                reset_device_registry()
+                logger.warning(
+                    f"Device registry load failed, reading devices from the database: {e}"
+                )
+
+        # Share authenticated SSH connections across services
+        if self.settings.ssh_pool_enabled:
+            from routeros_mcp.infra.routeros.ssh_pool import initialize_ssh_pool
+
+            ssh_pool = initialize_ssh_pool(
+                max_connections=self.settings.ssh_pool_max_connections,
+                max_sessions=self.settings.ssh_pool_max_sessions,
+                idle_timeout_seconds=self.settings.ssh_pool_idle_timeout_seconds,
+            )
+            ssh_pool.start_sweeper(min(30, self.settings.ssh_pool_idle_timeout_seconds))
+
+        # Per-device log cursors and buffers for incremental log tailing
+        from routeros_mcp.infra.routeros.log_tail import initialize_log_tailer
+
+        initialize_log_tailer(buffer_size=self.settings.log_tail_buffer_size)
+
+        # Interface counter rings for locally computed traffic rates
+        from routeros_mcp.infra.routeros.traffic_counters import initialize_traffic_store
+
+        initialize_traffic_store(history_samples=self.settings.interface_traffic_history_samples)
+
+        # Probe rings of the reachability mesh
+        from routeros_mcp.infra.routeros.reachability import initialize_reachability_store
+
+        initialize_reachability_store(
+            history_samples=self.settings.reachability_mesh_history_samples
+        )
+
+        # MAC/IP inverted indexes of the host locator
+        from routeros_mcp.infra.routeros.host_locator import initialize_host_locator_index
+
+        initialize_host_locator_index(
+            retention_seconds=self.settings.host_locator_retention_seconds
+        )
+
+        # Fleet topology graph
+        from routeros_mcp.infra.routeros.topology import initialize_topology_graph
+
+        initialize_topology_graph()
+
         # Initialize resource cache (in-memory)
         from routeros_mcp.infra.observability.resource_cache import initialize_cache
 
@@ -328,6 +396,7 @@ require appropriate device capabilities and permissions.
                     pool_size=self.settings.redis_pool_size,
                     timeout_seconds=self.settings.redis_timeout_seconds,
                     enabled=True,
+                    ttl_hosts=self.settings.host_locator_retention_seconds,
                 )
                 await cache.init()
                 logger.info(
@@ -368,16 +437,28 @@ require appropriate device capabilities and permissions.
             logger.error(f"Failed to register resources: {e}", exc_info=True)
 
         # Initialize and start job scheduler (Phase 2.1)
-        if self.settings.snapshot_capture_enabled:
+        if (
+            self.settings.snapshot_capture_enabled
+            or self.settings.health_rollup_enabled
+            or self.settings.log_archive_enabled
+            or self.settings.interface_traffic_enabled
+            or self.settings.reachability_mesh_enabled
+            or self.settings.host_locator_enabled
+            or self.settings.topology_enabled
+        ):
             from routeros_mcp.infra.jobs.scheduler import JobScheduler
-            from routeros_mcp.infra.jobs.runner import (
-                run_snapshot_capture_job,
-                run_retention_cleanup_job,
-            )
 
             self.scheduler = JobScheduler(self.settings)
             await self.scheduler.start()
             logger.info("Job scheduler started")
+        else:
+            logger.info("No periodic jobs enabled, scheduler not started")
+
+        if self.settings.snapshot_capture_enabled:
+            from routeros_mcp.infra.jobs.runner import (
+                run_snapshot_capture_job,
+                run_retention_cleanup_job,
+            )
 
             # Register periodic snapshot capture job
             async def snapshot_capture_job() -> None:
@@ -399,8 +480,120 @@ require appropriate device capabilities and permissions.
 
             self.scheduler.add_retention_cleanup_job(retention_cleanup_job)
             logger.info("Retention cleanup job registered")
-        else:
-            logger.info("Snapshot capture disabled, scheduler not started")
+
+        if self.settings.health_rollup_enabled:
+            from routeros_mcp.infra.jobs.runner import run_health_rollup_job
+
+            # Register health history rollup job (portable downsampling + retention)
+            async def health_rollup_job() -> None:
+                assert self.session_factory is not None
+                await run_health_rollup_job(self.session_factory, self.settings)
+
+            self.scheduler.add_health_rollup_job(health_rollup_job)
+            logger.info(
+                "Health rollup job registered",
+                extra={
+                    "interval_seconds": self.settings.health_rollup_interval_seconds,
+                },
+            )
+
+        if self.settings.log_archive_enabled:
+            from routeros_mcp.infra.jobs.runner import run_log_archive_job
+
+            # Register log archive job (incremental log pulls + retention)
+            async def log_archive_job() -> None:
+                assert self.session_factory is not None
+                await run_log_archive_job(self.session_factory, self.settings)
+
+            self.scheduler.add_log_archive_job(log_archive_job)
+            logger.info(
+                "Log archive job registered",
+                extra={
+                    "interval_seconds": self.settings.log_archive_interval_seconds,
+                },
+            )
+
+        if self.settings.interface_traffic_enabled:
+            from routeros_mcp.infra.jobs.runner import run_interface_traffic_job
+
+            # Register interface counter sampling job (watched devices only)
+            async def interface_traffic_job() -> None:
+                assert self.session_factory is not None
+                await run_interface_traffic_job(self.session_factory, self.settings)
+
+            self.scheduler.add_interface_traffic_job(interface_traffic_job)
+            logger.info(
+                "Interface traffic job registered",
+                extra={
+                    "interval_seconds": self.settings.metrics_collection_interval_seconds,
+                },
+            )
+
+        if self.settings.reachability_mesh_enabled:
+            from routeros_mcp.infra.jobs.runner import run_reachability_mesh_job
+
+            # Register reachability mesh job (probes spread over the interval)
+            async def reachability_mesh_job() -> None:
+                assert self.session_factory is not None
+                await run_reachability_mesh_job(self.session_factory, self.settings)
+
+            self.scheduler.add_reachability_mesh_job(reachability_mesh_job)
+            logger.info(
+                "Reachability mesh job registered",
+                extra={
+                    "interval_seconds": self.settings.reachability_mesh_interval_seconds,
+                },
+            )
+
+        if self.settings.host_locator_enabled:
+            from routeros_mcp.infra.jobs.runner import run_host_locator_job
+
+            # Register host locator job (ARP/DHCP/bridge host index)
+            async def host_locator_job() -> None:
+                assert self.session_factory is not None
+                await run_host_locator_job(self.session_factory, self.settings)
+
+            self.scheduler.add_host_locator_job(host_locator_job)
+            logger.info(
+                "Host locator job registered",
+                extra={
+                    "interval_seconds": self.settings.host_locator_interval_seconds,
+                },
+            )
+
+        if self.settings.topology_enabled:
+            from routeros_mcp.infra.jobs.runner import run_topology_job
+
+            # Register topology job (interfaces/bridge ports/addresses/neighbours)
+            async def topology_job() -> None:
+                assert self.session_factory is not None
+                await run_topology_job(self.session_factory, self.settings)
+
+            self.scheduler.add_topology_job(topology_job)
+            logger.info(
+                "Topology job registered",
+                extra={
+                    "interval_seconds": self.settings.topology_interval_seconds,
+                },
+            )
+
+        if self.settings.log_archive_syslog_enabled:
+            from routeros_mcp.infra.jobs.runner import ingest_syslog_batch
+            from routeros_mcp.infra.routeros.syslog_receiver import SyslogReceiver
+
+            async def syslog_sink(batch: list) -> None:
+                assert self.session_factory is not None
+                await ingest_syslog_batch(self.session_factory, self.settings, batch)
+
+            self.syslog_receiver = SyslogReceiver(on_batch=syslog_sink)
+            try:
+                await self.syslog_receiver.start(
+                    self.settings.log_archive_syslog_host,
+                    self.settings.log_archive_syslog_port,
+                )
+            except OSError as e:
+                self.syslog_receiver = None
+                logger.warning(f"Syslog receiver could not bind, syslog ingest disabled: {e}")
 
         if self.settings.mcp_transport == "stdio":
             # Configure logging to stderr only for stdio mode
@@ -458,6 +651,25 @@ require appropriate device capabilities and permissions.
             await self.scheduler.shutdown(wait=True)
             logger.info("Job scheduler stopped")
 
+        # Stop syslog receiver (delivers messages still queued)
+        if self.syslog_receiver:
+            await self.syslog_receiver.stop()
+            logger.info("Syslog receiver stopped")
+
+        # Stop device registry sync if running
+        from routeros_mcp.infra.device_registry import get_device_registry
+
+        registry = get_device_registry()
+        if registry is not None:
+            await registry.stop_sync()
+
+        # Close pooled SSH connections
+        from routeros_mcp.infra.routeros.ssh_pool import get_ssh_pool
+
+        ssh_pool = get_ssh_pool()
+        if ssh_pool is not None:
+            await ssh_pool.close()
+
         # FastMCP handles cleanup automatically
 
 
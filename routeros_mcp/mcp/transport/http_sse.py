@@ -114,6 +114,8 @@ class HTTPSSETransport:
             max_subscriptions_per_device=settings.sse_max_subscriptions_per_device,
             client_timeout_seconds=settings.sse_client_timeout_seconds,
             update_batch_interval_seconds=settings.sse_update_batch_interval_seconds,
+            log_update_interval_seconds=settings.sse_log_update_interval_seconds,
+            settings=settings,
         )
 
         # Register SSE manager globally so health service can broadcast updates
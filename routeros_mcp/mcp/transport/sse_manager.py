@@ -8,6 +8,7 @@ See docs/14-mcp-protocol-integration-and-transport-design.md
 """
 
 import asyncio
+import contextlib
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -89,6 +90,8 @@ class SSEManager:
         update_batch_interval_seconds: float = 1.0,
         health_update_interval_seconds: float = 30.0,  # 30 seconds
         session_factory: DatabaseSessionFactory | None = None,
+        log_update_interval_seconds: float = 5.0,
+        settings: Any = None,
     ) -> None:
         """Initialize SSE subscription manager.
 
@@ -98,12 +101,18 @@ class SSEManager:
             update_batch_interval_seconds: Debounce interval for batching updates
             health_update_interval_seconds: Interval for periodic health updates
             session_factory: Optional database session factory for health updates
+            log_update_interval_seconds: Interval at which the log tailer polls
+                devices with ``device://<id>/logs`` subscribers
+            settings: Application settings; required for log subscriptions
+                (the global session manager is used when no factory is given)
         """
         self.max_subscriptions_per_device = max_subscriptions_per_device
         self.client_timeout_seconds = client_timeout_seconds
         self.update_batch_interval_seconds = update_batch_interval_seconds
         self.health_update_interval_seconds = health_update_interval_seconds
         self.session_factory = session_factory
+        self.log_update_interval_seconds = log_update_interval_seconds
+        self.settings = settings
         self.allow_extended_resources = False
 
         # Subscription tracking
@@ -122,6 +131,9 @@ class SSEManager:
         # Health update tasks (one per device health subscription)
         self._health_update_tasks: dict[str, asyncio.Task[None]] = {}
 
+        # Log tail tasks (one per device logs subscription)
+        self._log_update_tasks: dict[str, asyncio.Task[None]] = {}
+
         # Statistics
         self._total_broadcasts = 0
         self._total_events_sent = 0
@@ -154,13 +166,14 @@ class SSEManager:
             ValueError: If subscription limit exceeded for this device or URI not subscribable
         """
         async with self._subscription_lock:
-            # Validate resource URI is subscribable (Phase 4: only device health)
+            # Validate resource URI is subscribable (device health and logs)
             if not self._is_subscribable_instance(resource_uri):
                 # Record subscription error
                 metrics.record_sse_subscription_error(error_type="invalid_uri")
                 raise ValueError(
                     f"Resource URI '{resource_uri}' is not subscribable. "
-                    "In Phase 4, only 'device://<device_id>/health' resources support subscriptions."
+                    "In Phase 4, only 'device://<device_id>/health' and "
+                    "'device://<device_id>/logs' resources support subscriptions."
                 )
 
             # Check subscription limits per device
@@ -210,6 +223,20 @@ class SSEManager:
                         extra={"resource_uri": resource_uri},
                     )
 
+            # Start tailing device logs on the first logs subscriber
+            if (
+                self._is_logs_resource(resource_uri)
+                and resource_uri not in self._log_update_tasks
+                and (self.session_factory or self.settings)
+            ):
+                self._log_update_tasks[resource_uri] = asyncio.create_task(
+                    self._periodic_log_updates(resource_uri)
+                )
+                logger.info(
+                    "Started log tail updates for resource",
+                    extra={"resource_uri": resource_uri},
+                )
+
             logger.info(
                 "Client subscribed to resource",
                 extra={
@@ -261,6 +288,18 @@ class SSEManager:
                     extra={"resource_uri": resource_uri},
                 )
 
+            # Stop log tail task if this was the last subscriber
+            log_task: asyncio.Task[None] | None = self._log_update_tasks.pop(resource_uri, None)
+            if log_task is not None:
+                log_task.cancel()
+                # Expected to raise CancelledError once the task is cancelled
+                with contextlib.suppress(asyncio.CancelledError):
+                    await log_task
+                logger.info(
+                    "Stopped log tail updates for resource",
+                    extra={"resource_uri": resource_uri},
+                )
+
         self._update_subscription_metrics(resource_pattern)
 
         # Phase 4: Update per-resource subscription count
@@ -529,7 +568,7 @@ class SSEManager:
     def _is_subscribable(resource_uri: str) -> bool:
         """Check if a resource URI supports subscriptions.
 
-        Phase 4: Only device health resources are subscribable by default.
+        Phase 4: Only device health and log resources are subscribable by default.
 
         Args:
             resource_uri: Resource URI to check
@@ -541,7 +580,7 @@ class SSEManager:
             return False
 
         parts = resource_uri.split("/")
-        return len(parts) >= 4 and parts[3] == "health"
+        return len(parts) >= 4 and parts[3] in {"health", "logs"}
 
     @staticmethod
     def _is_extended_subscribable(resource_uri: str) -> bool:
@@ -553,7 +592,7 @@ class SSEManager:
 
         if scheme == "device":
             parts = resource_uri.split("/")
-            return len(parts) >= 4 and parts[3] in {"health", "config"}
+            return len(parts) >= 4 and parts[3] in {"health", "config", "logs"}
 
         if scheme == "plan":
             parts = resource_uri.split("/")
@@ -570,6 +609,15 @@ class SSEManager:
         parts = resource_uri.split("/")
         return len(parts) >= 4 and parts[3] == "health"
 
+    @staticmethod
+    def _is_logs_resource(resource_uri: str) -> bool:
+        """Check if a resource URI is a device log tail resource."""
+        if not resource_uri.startswith("device://"):
+            return False
+
+        parts = resource_uri.split("/")
+        return len(parts) >= 4 and parts[3] == "logs"
+
     @staticmethod
     def _extract_device_id(resource_uri: str) -> str | None:
         """Extract device ID from resource URI.
@@ -811,5 +859,98 @@ class SSEManager:
             )
             raise
 
+    async def _periodic_log_updates(self, resource_uri: str) -> None:
+        """Tail device logs and broadcast new entries to subscribers.
+
+        Each poll fetches only entries newer than the device's tail cursor
+        (see routeros_mcp.infra.routeros.log_tail); the same per-device
+        buffer also answers ``get_recent_logs(tail=True)``. Polls that find
+        nothing new broadcast nothing.
+
+        Args:
+            resource_uri: Device logs resource URI (e.g., "device://dev-001/logs")
+        """
+        from routeros_mcp.domain.services.firewall_logs import FirewallLogsService
+
+        device_id = self._extract_device_id(resource_uri)
+        if not device_id:
+            logger.error(
+                "Cannot extract device ID from logs resource URI",
+                extra={"resource_uri": resource_uri},
+            )
+            return
+
+        settings = self.settings
+        if settings is None:
+            from routeros_mcp.config import get_settings
+
+            settings = get_settings()
+        session_factory = self.session_factory
+        if session_factory is None:
+            from routeros_mcp.infra.db.session import get_session_factory
+
+            session_factory = get_session_factory(settings)
+
+        logger.info(
+            "Starting log tail updates",
+            extra={
+                "resource_uri": resource_uri,
+                "device_id": device_id,
+                "interval_seconds": self.log_update_interval_seconds,
+            },
+        )
+
+        try:
+            while True:
+                try:
+                    async with session_factory.session() as session:
+                        service = FirewallLogsService(session, settings)
+                        new_entries = await service.tail_logs(device_id)
+
+                    if new_entries:
+                        entries = [entry.to_dict() for entry in new_entries]
+                        # Broadcasts are debounced to the latest payload; keep
+                        # entries from a poll that has not been delivered yet
+                        pending = self._pending_updates.get(resource_uri)
+                        if pending and pending["event"] == "logs":
+                            entries = pending["data"]["entries"] + entries
+                        await self.broadcast(
+                            resource_uri=resource_uri,
+                            data={
+                                "device_id": device_id,
+                                "cursor": new_entries[-1].id,
+                                "entries": entries,
+                            },
+                            event_type="logs",
+                        )
+                except Exception as e:
+                    logger.error(
+                        "Error tailing device logs",
+                        extra={
+                            "resource_uri": resource_uri,
+                            "device_id": device_id,
+                            "error": str(e),
+                        },
+                    )
+                    # Ignore broadcast errors
+                    with contextlib.suppress(Exception):
+                        await self.broadcast(
+                            resource_uri=resource_uri,
+                            data={
+                                "device_id": device_id,
+                                "error": f"Failed to tail logs: {str(e)}",
+                            },
+                            event_type="error",
+                        )
+
+                await asyncio.sleep(self.log_update_interval_seconds)
+
+        except asyncio.CancelledError:
+            logger.info(
+                "Log tail updates cancelled",
+                extra={"resource_uri": resource_uri, "device_id": device_id},
+            )
+            raise
+
 
 __all__ = ["SSEManager", "SSESubscription"]
@@ -2,7 +2,7 @@
 
 import gzip
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Optional
 
 from fastmcp import FastMCP
@@ -11,10 +11,14 @@ from sqlalchemy import desc, select
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.services.health import HealthService
+from routeros_mcp.domain.services.health_rollup import HealthRollupService
+from routeros_mcp.domain.services.interface import InterfaceService
 from routeros_mcp.domain.services.system import SystemService
+from routeros_mcp.domain.utils import parse_routeros_uptime
 from routeros_mcp.infra.db.session import DatabaseSessionManager
 from routeros_mcp.infra.db.models import AuditEvent, Snapshot
 from routeros_mcp.infra.observability.resource_cache import with_cache
+from routeros_mcp.infra.routeros.traffic_counters import get_traffic_store
 from routeros_mcp.mcp.errors import DeviceNotFoundError, MCPError
 from routeros_mcp.mcp_resources.utils import (
     create_resource_metadata,
@@ -187,6 +191,214 @@ def register_device_resources(
                     data={"device_id": device_id, "error": str(e)},
                 )
 
+    @mcp.resource("device://{device_id}/health/rollups/{window}")
+    async def device_health_rollups(device_id: str, window: str = "24h") -> str:
+        """Downsampled device health history (CPU, memory, uptime).
+
+        Served from the 1m/1h/1d rollup tables rather than raw health checks.
+        The finest tier whose retention covers the window and whose bucket
+        count fits the point budget is chosen automatically, so long windows
+        (e.g. "30d") land on the hourly or daily tier and stay cheap.
+
+        Args:
+            device_id: Device identifier
+            window: Lookback window in RouterOS duration format (e.g. "6h", "7d", "2w")
+
+        Returns:
+            JSON-formatted bucketed health history
+        """
+        window_seconds = parse_routeros_uptime(window)
+        if window_seconds <= 0:
+            raise MCPError(
+                code=-32602,
+                message="Invalid history window",
+                data={"device_id": device_id, "window": window},
+            )
+
+        async with session_factory.session() as session:
+            device_service = DeviceService(session, settings)
+            rollup_service = HealthRollupService(session, settings)
+
+            try:
+                device = await device_service.get_device(device_id)
+
+                end = datetime.now(UTC)
+                history = await rollup_service.get_health_history(
+                    device_id,
+                    start=end - timedelta(seconds=window_seconds),
+                    end=end,
+                )
+
+                result = {
+                    "device_id": device.id,
+                    "device_name": device.name,
+                    "environment": device.environment,
+                    "window": window,
+                    **history,
+                }
+
+                content = format_resource_content(result, "application/json")
+
+                logger.info(
+                    "Resource accessed: device://%s/health/rollups/%s", device_id, window
+                )
+
+                return content
+
+            except DeviceNotFoundError as e:
+                raise MCPError(
+                    code=-32000,
+                    message="Device not found",
+                    data={"device_id": device_id},
+                ) from e
+            except Exception as e:
+                logger.error(f"Error fetching device health rollups: {e}", exc_info=True)
+                raise MCPError(
+                    code=-32001,
+                    message="Failed to fetch device health history",
+                    data={"device_id": device_id, "error": str(e)},
+                ) from e
+
+    @mcp.resource("device://{device_id}/health/history{?window,bucket}")
+    async def device_health_history(
+        device_id: str, window: str = "24h", bucket: str = "auto"
+    ) -> str:
+        """Bucketed device health series (CPU and memory min/avg/max/p95).
+
+        Aggregated in SQL from raw health checks; windows reaching past raw
+        retention are served from the 1m/1h/1d rollups instead (``source``
+        names the tier, p95 columns are null). Series are column-oriented:
+        one array per metric, aligned with ``columns.bucket_start``.
+
+        Args:
+            device_id: Device identifier
+            window: Lookback window in RouterOS duration format (e.g. "6h", "7d")
+            bucket: Bucket width (e.g. "5m", "1h") or "auto"
+
+        Returns:
+            JSON-formatted column-oriented health series
+        """
+        window_seconds = parse_routeros_uptime(window)
+        bucket_seconds = None if bucket == "auto" else parse_routeros_uptime(bucket)
+        if window_seconds <= 0 or (bucket_seconds is not None and bucket_seconds <= 0):
+            raise MCPError(
+                code=-32602,
+                message="Invalid history window or bucket",
+                data={"device_id": device_id, "window": window, "bucket": bucket},
+            )
+
+        async with session_factory.session() as session:
+            device_service = DeviceService(session, settings)
+            rollup_service = HealthRollupService(session, settings)
+
+            try:
+                device = await device_service.get_device(device_id)
+
+                end = datetime.now(UTC)
+                series = await rollup_service.get_health_series(
+                    device_id,
+                    start=end - timedelta(seconds=window_seconds),
+                    end=end,
+                    bucket_seconds=bucket_seconds,
+                )
+
+                result = {
+                    "device_name": device.name,
+                    "environment": device.environment,
+                    "window": window,
+                    **series,
+                }
+
+                # Compact JSON: indenting would put every array element on its own line
+                content = format_resource_content(result, "application/json", indent=None)
+
+                logger.info(
+                    f"Resource accessed: device://{device_id}/health/history",
+                    extra={"device_id": device_id, "window": window, "bucket": bucket},
+                )
+
+                return content
+
+            except DeviceNotFoundError as e:
+                raise MCPError(
+                    code=-32000,
+                    message="Device not found",
+                    data={"device_id": device_id},
+                ) from e
+            except Exception as e:
+                logger.error(f"Error fetching device health history: {e}", exc_info=True)
+                raise MCPError(
+                    code=-32001,
+                    message="Failed to fetch device health history",
+                    data={"device_id": device_id, "error": str(e)},
+                ) from e
+
+    @mcp.resource("device://{device_id}/interfaces/traffic")
+    async def device_interface_traffic(device_id: str) -> str:
+        """Interface traffic rates computed from sampled counters.
+
+        Served from memory: reading the resource marks the device as watched,
+        and the interface traffic job samples its ``/interface`` counters every
+        ``metrics_collection_interval_seconds``. The first read takes an
+        initial sample; rates appear once a second sample exists. History is
+        column-oriented per interface (one array per rate, aligned with
+        ``sampled_at``).
+
+        Args:
+            device_id: Device identifier
+
+        Returns:
+            JSON-formatted current rates and rate history per interface
+        """
+        async with session_factory.session() as session:
+            device_service = DeviceService(session, settings)
+
+            try:
+                device = await device_service.get_device(device_id)
+
+                store = get_traffic_store()
+                store.watch(device_id)
+                if settings.interface_traffic_enabled and store.samples(device_id) == 0:
+                    await InterfaceService(session, settings).collect_traffic_counters(device_id)
+
+                interval = settings.metrics_collection_interval_seconds
+                rates = store.rates(device_id, max_age=2 * interval)
+
+                result = {
+                    "device_id": device.id,
+                    "device_name": device.name,
+                    "environment": device.environment,
+                    "collection_interval_seconds": interval,
+                    "samples": store.samples(device_id),
+                    "status": "ready" if rates is not None else "collecting",
+                    "interfaces": rates or [],
+                    "history": store.history(device_id),
+                }
+
+                # Compact JSON: indenting would put every array element on its own line
+                content = format_resource_content(result, "application/json", indent=None)
+
+                logger.info(
+                    f"Resource accessed: device://{device_id}/interfaces/traffic",
+                    extra={"device_id": device_id},
+                )
+
+                return content
+
+            except DeviceNotFoundError:
+                raise MCPError(
+                    code=-32000,
+                    message="Device not found",
+                    data={"device_id": device_id},
+                )
+            except Exception as e:
+                logger.error(f"Error fetching interface traffic: {e}", exc_info=True)
+                raise MCPError(
+                    code=-32001,
+                    message="Failed to fetch interface traffic",
+                    data={"device_id": device_id, "error": str(e)},
+                )
+
     @mcp.resource("device://{device_id}/config")
     @with_cache("device://{device_id}/config")
     async def device_config(device_id: str) -> str:
@@ -1,6 +1,7 @@
 """MCP resources for fleet data (fleet:// URI scheme)."""
 
 import logging
+import time
 from datetime import UTC, datetime
 
 from fastmcp import FastMCP
@@ -9,12 +10,17 @@ from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.services.health import HealthService
 from routeros_mcp.infra.db.session import DatabaseSessionManager
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
 from routeros_mcp.infra.observability.resource_cache import with_cache
+from routeros_mcp.infra.routeros.reachability import get_reachability_store
 from routeros_mcp.mcp.errors import MCPError
 from routeros_mcp.mcp_resources.utils import format_resource_content
 
 logger = logging.getLogger(__name__)
 
+# Devices listed per metric in the health summary's top consumers
+TOP_DEVICES = 5
+
 
 def register_fleet_resources(
     mcp: FastMCP,
@@ -37,9 +43,14 @@ def register_fleet_resources(
         Provides:
         - Total device count
         - Health status distribution
-        - Average CPU/memory usage
+        - CPU/memory distribution (mean, p50, p95, max)
+        - Top CPU/memory consumers
+        - Per-environment breakdown
         - Devices requiring attention
-        - Recent health trends
+
+        Aggregates come from the fleet metrics snapshot, which every health
+        check updates. Only devices without a recent result (none yet, or
+        older than two health check intervals) are checked during the read.
 
         Returns:
             JSON-formatted fleet health summary
@@ -52,93 +63,77 @@ def register_fleet_resources(
                 # Get all devices
                 devices = await device_service.list_devices()
 
-                # Collect health status for each device
-                healthy_count = 0
-                warning_count = 0
-                critical_count = 0
-                unreachable_count = 0
-
-                total_cpu = 0.0
-                total_memory = 0.0
-                devices_with_metrics = 0
-
-                devices_needing_attention = []
+                snapshot = get_fleet_metrics()
+                snapshot.retain(device.id for device in devices)
 
+                # Check devices the health check job has not covered recently
+                stale_before = time.time() - 2 * settings.health_check_interval_seconds
+                errors: dict[str, str] = {}
                 for device in devices:
+                    updated = snapshot.last_updated(device.id)
+                    if updated is not None and updated >= stale_before:
+                        continue
                     try:
                         health = await health_service.run_health_check(device.id)
-
-                        if health.status == "healthy":
-                            healthy_count += 1
-                        elif health.status == "warning":
-                            warning_count += 1
-                            devices_needing_attention.append(
-                                {
-                                    "device_id": device.id,
-                                    "name": device.name,
-                                    "status": "warning",
-                                    "environment": device.environment,
-                                }
-                            )
-                        elif health.status == "critical":
-                            critical_count += 1
-                            devices_needing_attention.append(
-                                {
-                                    "device_id": device.id,
-                                    "name": device.name,
-                                    "status": "critical",
-                                    "environment": device.environment,
-                                }
-                            )
-
-                        # Aggregate metrics
-                        if health.metrics:
-                            cpu = health.metrics.get("cpu_usage", 0)
-                            memory = health.metrics.get("memory_usage_percent", 0)
-                            if cpu > 0 or memory > 0:
-                                total_cpu += cpu
-                                total_memory += memory
-                                devices_with_metrics += 1
-
+                        snapshot.record_health(device, health)
                     except Exception as e:
                         logger.warning(
                             f"Could not fetch health for device {device.id}: {e}"
                         )
-                        unreachable_count += 1
-                        devices_needing_attention.append(
-                            {
-                                "device_id": device.id,
-                                "name": device.name,
-                                "status": "unreachable",
-                                "environment": device.environment,
-                                "error": str(e),
-                            }
+                        errors[device.id] = str(e)
+                        snapshot.record(
+                            device.id,
+                            environment=device.environment,
+                            status="unreachable",
+                            tags=device.tags,
                         )
 
-                total_devices = len(devices)
-                avg_cpu = total_cpu / devices_with_metrics if devices_with_metrics > 0 else 0
-                avg_memory = (
-                    total_memory / devices_with_metrics if devices_with_metrics > 0 else 0
-                )
+                distribution = {"healthy": 0, "degraded": 0, "unreachable": 0}
+                distribution.update(snapshot.status_counts())
+
+                devices_by_id = {device.id: device for device in devices}
+                devices_needing_attention = []
+                for status, count in distribution.items():
+                    if status == "healthy" or not count:
+                        continue
+                    for device_id in snapshot.devices(status=status):
+                        device = devices_by_id[device_id]
+                        entry = {
+                            "device_id": device.id,
+                            "name": device.name,
+                            "status": status,
+                            "environment": device.environment,
+                        }
+                        if device_id in errors:
+                            entry["error"] = errors[device_id]
+                        devices_needing_attention.append(entry)
+
+                cpu = snapshot.aggregate("cpu_usage_percent")
+                memory = snapshot.aggregate("memory_usage_percent")
 
                 result = {
                     "summary": {
-                        "total_devices": total_devices,
-                        "healthy_devices": healthy_count,
-                        "warning_devices": warning_count,
-                        "critical_devices": critical_count,
-                        "unreachable_devices": unreachable_count,
-                        "average_cpu_usage": round(avg_cpu, 2),
-                        "average_memory_usage": round(avg_memory, 2),
+                        "total_devices": len(devices),
+                        "healthy_devices": distribution["healthy"],
+                        "degraded_devices": distribution["degraded"],
+                        "unreachable_devices": distribution["unreachable"],
+                        "average_cpu_usage": cpu.get("mean", 0),
+                        "average_memory_usage": memory.get("mean", 0),
                         "timestamp": datetime.now(UTC).isoformat(),
                     },
-                    "devices_needing_attention": devices_needing_attention,
-                    "health_distribution": {
-                        "healthy": healthy_count,
-                        "warning": warning_count,
-                        "critical": critical_count,
-                        "unreachable": unreachable_count,
+                    "metrics": {
+                        "cpu_usage_percent": cpu,
+                        "memory_usage_percent": memory,
+                    },
+                    "top_devices": {
+                        "cpu_usage_percent": snapshot.top_k("cpu_usage_percent", TOP_DEVICES),
+                        "memory_usage_percent": snapshot.top_k(
+                            "memory_usage_percent", TOP_DEVICES
+                        ),
                     },
+                    "by_environment": snapshot.breakdown("cpu_usage_percent", "environment"),
+                    "devices_needing_attention": devices_needing_attention,
+                    "health_distribution": distribution,
                 }
 
                 content = format_resource_content(result, "application/json")
@@ -155,6 +150,46 @@ def register_fleet_resources(
                     data={"error": str(e)},
                 )
 
+    @mcp.resource("fleet://reachability")
+    async def fleet_reachability() -> str:
+        """Reachability mesh: current loss/latency matrix and per-pair percentiles.
+
+        Served from memory. The reachability mesh job pings every
+        ``reachability_mesh_targets`` entry from every
+        ``reachability_mesh_devices`` entry once per
+        ``reachability_mesh_interval_seconds``, spreading the probes over the
+        interval. The matrix holds the latest probe per pair (rows are
+        devices, columns are targets); percentiles cover every probe kept.
+
+        Returns:
+            JSON-formatted matrix and per-pair loss/RTT statistics
+        """
+        try:
+            store = get_reachability_store()
+            result = {
+                "enabled": settings.reachability_mesh_enabled,
+                "interval_seconds": settings.reachability_mesh_interval_seconds,
+                "history_samples": store.history_samples,
+                "matrix": store.matrix(),
+                "pairs": store.percentiles(),
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
+
+            # Compact JSON: indenting would put every matrix cell on its own line
+            content = format_resource_content(result, "application/json", indent=None)
+
+            logger.info("Resource accessed: fleet://reachability")
+
+            return content
+
+        except Exception as e:
+            logger.error(f"Error fetching reachability mesh: {e}", exc_info=True)
+            raise MCPError(
+                code=-32001,
+                message="Failed to fetch reachability mesh",
+                data={"error": str(e)},
+            )
+
     @mcp.resource("fleet://devices/{environment}")
     async def fleet_devices(
         environment: str = "all",
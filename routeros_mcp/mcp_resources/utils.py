@@ -81,14 +81,14 @@ def create_resource_metadata(
 def format_resource_content(
     data: Any,
     mime_type: str = "application/json",
-    indent: int = 2,
+    indent: int | None = 2,
 ) -> str:
     """Format resource data as string content.
 
     Args:
         data: Data to format
         mime_type: MIME type of content
-        indent: JSON indent level (if applicable)
+        indent: JSON indent level (if applicable; None for compact output)
 
     Returns:
         Formatted string content
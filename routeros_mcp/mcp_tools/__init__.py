@@ -12,6 +12,8 @@ This package contains all MCP tool implementations organized by topic:
 - firewall_logs: Firewall rules and system logs
 - diagnostics: Network diagnostics (ping, traceroute)
 - config: Multi-device configuration workflows (plan/apply)
+- fleet: Fleet-wide read tools (many devices per call)
+- topology: Fleet topology queries (path, blast radius, neighbourhood)
 """
 
 from routeros_mcp.mcp_tools.bridge import register_bridge_tools
@@ -22,10 +24,12 @@ from routeros_mcp.mcp_tools.diagnostics import register_diagnostics_tools
 from routeros_mcp.mcp_tools.dns_ntp import register_dns_ntp_tools
 from routeros_mcp.mcp_tools.firewall_logs import register_firewall_logs_tools
 from routeros_mcp.mcp_tools.firewall_write import register_firewall_write_tools
+from routeros_mcp.mcp_tools.fleet import register_fleet_tools
 from routeros_mcp.mcp_tools.interface import register_interface_tools
 from routeros_mcp.mcp_tools.ip import register_ip_tools
 from routeros_mcp.mcp_tools.routing import register_routing_tools
 from routeros_mcp.mcp_tools.system import register_system_tools
+from routeros_mcp.mcp_tools.topology import register_topology_tools
 from routeros_mcp.mcp_tools.wireless import register_wireless_tools
 
 __all__ = [
@@ -37,9 +41,11 @@ __all__ = [
     "register_dns_ntp_tools",
     "register_firewall_logs_tools",
     "register_firewall_write_tools",
+    "register_fleet_tools",
     "register_interface_tools",
     "register_ip_tools",
     "register_routing_tools",
     "register_system_tools",
+    "register_topology_tools",
     "register_wireless_tools",
 ]
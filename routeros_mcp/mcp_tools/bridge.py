@@ -8,14 +8,21 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import PHASE3_DEFAULT_ALLOWED_ENVIRONMENTS, DeviceCapability
 from routeros_mcp.domain.services.bridge import BridgePlanService, BridgeService
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.domain.services.health import HealthService
 from routeros_mcp.domain.services.plan import PlanService
+from routeros_mcp.domain.services.plan_executor import (
+    PlanExecutor,
+    context_progress_reporter,
+    health_check_gate,
+)
 from routeros_mcp.infra.db.session import get_session_factory
+from routeros_mcp.infra.routeros.topology import get_topology_graph
 from routeros_mcp.mcp.errors import MCPError, map_exception_to_error
 from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
 from routeros_mcp.security.authz import ToolTier, check_tool_authorization
@@ -86,6 +93,51 @@ async def _validate_devices_for_bridge_plan(
     return devices
 
 
+def _topology_impact(
+    settings: Settings,
+    devices: list[Any],
+    interface: str,
+) -> dict[str, dict[str, Any]]:
+    """Blast radius of an interface on each device, from the topology graph.
+
+    Devices whose interface the graph does not know yet are left out, and
+    nothing is returned while the topology graph is disabled.
+
+    Args:
+        settings: Application settings
+        devices: Validated plan devices
+        interface: Interface (bridge or port) the plan changes
+
+    Returns:
+        Impact per device ID: isolated nodes by kind and their counts
+    """
+    if not settings.topology_enabled:
+        return {}
+
+    graph = get_topology_graph()
+    impact: dict[str, dict[str, Any]] = {}
+    for device in devices:
+        try:
+            radius = graph.blast_radius(f"{device.id}:{interface}")
+        except ValueError:
+            continue
+        impact[device.id] = {
+            "interface": interface,
+            "isolated": radius["isolated"],
+            "isolated_count": radius["isolated_count"],
+            "isolated_devices": radius["isolated_devices"],
+        }
+    return impact
+
+
+def _topology_note(impact: dict[str, dict[str, Any]]) -> str:
+    """Content line summarizing topology impact (empty when nothing is cut off)."""
+    isolated = sum(item["isolated_devices"] for item in impact.values())
+    if not isolated:
+        return ""
+    return f"Topology: {isolated} device(s)/neighbour(s) reachable only via this interface\n"
+
+
 def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
     """Register bridge management tools with the MCP server.
 
@@ -447,8 +499,9 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                     "bridge/plan-remove-port",
                 )
 
-                # Port removal is high risk
+                # Port removal is high risk; the topology graph shows what it cuts off
                 risk_level = "high"
+                topology_impact = _topology_impact(settings, devices, interface)
 
                 # Generate preview for each device
                 device_previews = []
@@ -461,6 +514,8 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                         bridge_name=bridge_name,
                         interface=interface,
                     )
+                    if device.id in topology_impact:
+                        preview["topology_impact"] = topology_impact[device.id]
                     device_previews.append(preview)
 
                 # Create plan
@@ -484,7 +539,8 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                     f"Risk Level: {risk_level.upper()}\n"
                     f"Bridge: {bridge_name}\n"
                     f"Interface: {interface}\n"
-                    f"Devices: {len(device_ids)}\n\n"
+                    f"Devices: {len(device_ids)}\n"
+                    f"{_topology_note(topology_impact)}\n"
                     f"WARNING: Port removal may disrupt connectivity.\n\n"
                     f"To apply this plan, use bridge/apply-plan with:\n"
                     f"  plan_id: {plan['plan_id']}\n"
@@ -605,11 +661,15 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                 )
                 is_vlan_filtering_change = "vlan_filtering" in bridge_settings
 
+                topology_impact = _topology_impact(settings, devices, bridge_name)
                 risk_level = bridge_plan_service.assess_risk(
                     operation="modify_bridge_settings",
                     device_environment=highest_risk_env,
                     is_stp_change=is_stp_change,
                     is_vlan_filtering_change=is_vlan_filtering_change,
+                    isolated_devices=sum(
+                        item["isolated_devices"] for item in topology_impact.values()
+                    ),
                 )
 
                 # Generate preview for each device
@@ -623,6 +683,8 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                         bridge_name=bridge_name,
                         settings=bridge_settings,
                     )
+                    if device.id in topology_impact:
+                        preview["topology_impact"] = topology_impact[device.id]
                     device_previews.append(preview)
 
                 # Create plan
@@ -651,7 +713,8 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                     f"Bridge settings modification plan created successfully.\n\n"
                     f"Risk Level: {risk_level.upper()}\n"
                     f"Bridge: {bridge_name}\n"
-                    f"Devices: {len(device_ids)}{warning}\n\n"
+                    f"Devices: {len(device_ids)}{warning}\n"
+                    f"{_topology_note(topology_impact)}\n"
                     f"To apply this plan, use bridge/apply-plan with:\n"
                     f"  plan_id: {plan['plan_id']}\n"
                     f"  approval_token: {plan['approval_token']}"
@@ -689,6 +752,7 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
     async def apply_bridge_plan(
         plan_id: str,
         approval_token: str,
+        ctx: Context | None = None,
     ) -> dict[str, Any]:
         """Apply approved bridge plan with health checks and automatic rollback.
 
@@ -704,12 +768,17 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
         - Creates snapshot before changes for rollback
         - Performs health check after each device
         - Automatic rollback on health check failure
+        - Devices are applied in parallel (plan_apply_max_concurrency), with
+          per-device progress notifications and an optional fail-fast threshold
+        - Health checks after each batch (plan_apply_batch_size): a degraded or
+          unreachable device halts the rollout before the next batch
         - Updates plan status to completed/failed
         - Comprehensive audit logging
 
         Args:
             plan_id: Plan identifier from plan creation (e.g., 'plan-bridge-20250115-001')
             approval_token: Approval token from plan creation (must be valid and unexpired)
+            ctx: MCP request context (injected; used for progress notifications)
 
         Returns:
             Formatted tool result with execution status and results per device
@@ -724,7 +793,6 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
         try:
             async with session_factory.session() as session:
                 plan_service = PlanService(session, settings)
-                device_service = DeviceService(session, settings)
                 bridge_plan_service = BridgePlanService()
 
                 # Get plan details
@@ -759,24 +827,24 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                     raise ValueError("Invalid plan: missing operation type")
 
                 device_ids = plan["device_ids"]
-                device_results = []
-                snapshots = {}
-                failed_devices = []
-                successful_devices = []
 
-                # Execute plan for each device
-                for device_id in device_ids:
+                async def apply_device(device_id: str) -> dict[str, Any]:
+                    """Snapshot and execute the plan operation on one device."""
+                    snapshot = None
                     rest_client = None
                     try:
-                        device = await device_service.get_device(device_id)
-                        rest_client = await device_service.get_rest_client(device_id)
+                        # Workers run concurrently, so each one resolves the device
+                        # with its own short-lived session
+                        async with session_factory.session() as device_session:
+                            device_service = DeviceService(device_session, settings)
+                            device = await device_service.get_device(device_id)
+                            rest_client = await device_service.get_rest_client(device_id)
 
                         try:
                             # Create snapshot before changes
                             snapshot = await bridge_plan_service.create_bridge_snapshot(
                                 device_id, device.name, rest_client
                             )
-                            snapshots[device_id] = snapshot
 
                             # Execute operation (mock for now - would call RouterOS API)
                             # TODO: Implement actual RouterOS API calls for bridge operations
@@ -796,13 +864,12 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                                 ),
                             }
 
-                            failed_devices.append(device_id)
-                            device_results.append({
+                            return {
                                 "device_id": device_id,
                                 "status": "not_executed",
                                 "message": "Bridge operation skipped because it is not yet implemented",
                                 "health_check": health_result,
-                            })
+                            }
 
                         finally:
                             # Ensure REST client is always closed
@@ -811,19 +878,29 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
 
                     except Exception as e:
                         logger.error(f"Failed to execute plan on device {device_id}: {e}")
-                        failed_devices.append(device_id)
-                        snapshot = snapshots.get(device_id)
                         if snapshot is not None:
                             logger.info(
                                 "Using bridge snapshot for potential rollback on device %s",
                                 device_id,
                             )
-                        device_results.append({
+                        return {
                             "device_id": device_id,
                             "status": "failed",
                             "message": f"Execution failed: {str(e)}",
                             "rollback_snapshot": snapshot if snapshot is not None else None,
-                        })
+                        }
+
+                # Apply to devices in parallel (bounded by plan_apply_max_concurrency),
+                # halting after a batch that leaves a device degraded or unreachable
+                executor = PlanExecutor.from_settings(
+                    settings,
+                    health_gate=health_check_gate(HealthService(session, settings)),
+                    on_progress=context_progress_reporter(ctx),
+                )
+                execution = await executor.run(device_ids, apply_device)
+                device_results = execution.device_results
+                successful_devices = execution.successful_devices
+                failed_devices = execution.failed_devices + execution.skipped_devices
 
                 # Update plan status
                 if failed_devices:
@@ -833,6 +910,9 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                     await plan_service.update_plan_status(plan_id, "completed", DEFAULT_MCP_USER)
                     status_msg = f"Plan completed successfully on all {len(device_ids)} devices"
 
+                if execution.halted:
+                    status_msg += f" (execution halted: {execution.halt_reason})"
+
                 return format_tool_result(
                     content=status_msg,
                     meta={
@@ -842,6 +922,7 @@ def register_bridge_tools(mcp: FastMCP, settings: Settings) -> None:
                         "successful_devices": len(successful_devices),
                         "failed_devices": len(failed_devices),
                         "device_results": device_results,
+                        "execution": execution.summary(),
                     },
                 )
 
@@ -1,6 +1,7 @@
 """Device management MCP tools.
 
-Provides MCP tools for device registry operations and connectivity checks.
+Provides MCP tools for device registry operations, connectivity checks and
+fleet-wide health metric queries.
 """
 
 import logging
@@ -11,7 +12,11 @@ from fastmcp import FastMCP
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.infra.db.session import get_session_factory
-from routeros_mcp.mcp.errors import MCPError, map_exception_to_error
+from routeros_mcp.infra.observability.fleet_metrics import (
+    METRICS as FLEET_METRICS,
+    get_fleet_metrics as get_fleet_metrics_snapshot,
+)
+from routeros_mcp.mcp.errors import MCPError, ValidationError, map_exception_to_error
 from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
 from routeros_mcp.security.authz import ToolTier, check_tool_authorization
 
@@ -240,4 +245,90 @@ def register_device_tools(mcp: FastMCP, settings: Settings) -> None:
                 meta=error.data,
             )
 
+    @mcp.tool()
+    async def get_fleet_metrics(
+        metric: str = "cpu_usage_percent",
+        environment: str | None = None,
+        tag: str | None = None,
+        group_by: str | None = None,
+        top_k: int = 10,
+    ) -> dict[str, Any]:
+        """Aggregate the latest health metrics across the fleet.
+
+        Use when:
+        - User asks "which routers are busiest?" or "what is p95 memory in prod?"
+        - Comparing load between environments or sites
+        - Finding the worst devices before a maintenance window
+
+        Returns: Count, min, mean, p50, p95 and max of the metric, the top-K
+        devices by value, and optionally a breakdown per environment, status
+        or tag value.
+
+        Tip: Answers from the latest health check results in memory without
+        contacting devices; devices appear once they have been health checked.
+
+        Args:
+            metric: cpu_usage_percent, memory_usage_percent or uptime_seconds
+            environment: Optional filter by environment (lab/staging/prod)
+            tag: Optional tag filter ("site=dc1", or "site" for any value)
+            group_by: Optional breakdown: "environment", "status", "model" or
+                "tag:<key>"
+            top_k: Number of highest-value devices to list (0-100)
+
+        Returns:
+            Formatted tool result with metric summary, top devices and breakdown
+        """
+        try:
+            if metric not in FLEET_METRICS:
+                raise ValidationError(
+                    f"Invalid metric: expected one of {', '.join(FLEET_METRICS)}",
+                    data={"metric": metric},
+                )
+            if not 0 <= top_k <= 100:
+                raise ValidationError("Invalid top_k: expected 0-100", data={"top_k": top_k})
+
+            snapshot = get_fleet_metrics_snapshot()
+            filters = {"environment": environment, "tag": tag}
+            summary = snapshot.aggregate(metric, **filters)
+            top = snapshot.top_k(metric, top_k, **filters) if top_k else []
+            try:
+                groups = snapshot.breakdown(metric, group_by, **filters) if group_by else None
+            except ValueError as e:
+                raise ValidationError(str(e), data={"group_by": group_by}) from e
+
+            if summary["count"]:
+                content = (
+                    f"{metric} across {summary['count']} device(s): "
+                    f"p50 {summary['p50']}, p95 {summary['p95']}, max {summary['max']}"
+                )
+            else:
+                content = f"No {metric} data for the selected devices yet"
+
+            return format_tool_result(
+                content=content,
+                meta={
+                    "metric": metric,
+                    "filters": filters,
+                    "summary": summary,
+                    "top_devices": top,
+                    "group_by": group_by,
+                    "groups": groups,
+                    "total_devices": len(snapshot),
+                },
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
     logger.info("Registered device management tools")
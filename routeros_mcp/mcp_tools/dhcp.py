@@ -8,13 +8,19 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import PHASE3_DEFAULT_ALLOWED_ENVIRONMENTS, DeviceCapability
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.services.dhcp import DHCPPlanService, DHCPService
+from routeros_mcp.domain.services.health import HealthService
 from routeros_mcp.domain.services.plan import PlanService
+from routeros_mcp.domain.services.plan_executor import (
+    PlanExecutor,
+    context_progress_reporter,
+    health_check_gate,
+)
 from routeros_mcp.infra.db.session import get_session_factory
 from routeros_mcp.mcp.errors import MCPError, map_exception_to_error
 from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
@@ -685,6 +691,7 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
     async def apply_dhcp_plan(
         plan_id: str,
         approval_token: str,
+        ctx: Context | None = None,
     ) -> dict[str, Any]:
         """Apply approved DHCP plan with health checks and automatic rollback.
 
@@ -700,12 +707,17 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
         - Creates snapshot before changes for rollback
         - Performs health check after each device
         - Automatic rollback on health check failure
+        - Devices are applied in parallel (plan_apply_max_concurrency), with
+          per-device progress notifications and an optional fail-fast threshold
+        - Health checks after each batch (plan_apply_batch_size): a degraded or
+          unreachable device halts the rollout before the next batch
         - Updates plan status to completed/failed
         - Comprehensive audit logging
 
         Args:
             plan_id: Plan identifier from plan creation (e.g., 'plan-dhcp-20250115-001')
             approval_token: Approval token from plan creation (must be valid and unexpired)
+            ctx: MCP request context (injected; used for progress notifications)
 
         Returns:
             Formatted tool result with execution status and results per device
@@ -720,7 +732,6 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
         try:
             async with session_factory.session() as session:
                 plan_service = PlanService(session, settings)
-                device_service = DeviceService(session, settings)
                 dhcp_plan_service = DHCPPlanService()
 
                 # Get plan details
@@ -755,24 +766,24 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
                     raise ValueError("Invalid plan: missing operation type")
 
                 device_ids = plan["device_ids"]
-                device_results = []
-                snapshots = {}
-                failed_devices = []
-                successful_devices = []
 
-                # Execute plan for each device
-                for device_id in device_ids:
+                async def apply_device(device_id: str) -> dict[str, Any]:
+                    """Snapshot and execute the plan operation on one device."""
+                    snapshot = None
                     rest_client = None
                     try:
-                        device = await device_service.get_device(device_id)
-                        rest_client = await device_service.get_rest_client(device_id)
+                        # Workers run concurrently, so each one resolves the device
+                        # with its own short-lived session
+                        async with session_factory.session() as device_session:
+                            device_service = DeviceService(device_session, settings)
+                            device = await device_service.get_device(device_id)
+                            rest_client = await device_service.get_rest_client(device_id)
 
                         try:
                             # Create snapshot before changes
                             snapshot = await dhcp_plan_service.create_dhcp_snapshot(
                                 device_id, device.name, rest_client
                             )
-                            snapshots[device_id] = snapshot
 
                             # Execute operation (currently mocked - RouterOS API calls not implemented)
                             # TODO: Implement actual RouterOS API calls for DHCP operations
@@ -791,8 +802,7 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
                                 ),
                             }
 
-                            failed_devices.append(device_id)
-                            device_results.append({
+                            return {
                                 "device_id": device_id,
                                 "status": "skipped",
                                 "message": (
@@ -800,7 +810,7 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
                                     "not yet implemented; execution was mocked."
                                 ),
                                 "health_check": health_result,
-                            })
+                            }
 
                         finally:
                             # Ensure REST client is always closed
@@ -809,19 +819,29 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
 
                     except Exception as e:
                         logger.error(f"Failed to execute plan on device {device_id}: {e}")
-                        failed_devices.append(device_id)
-                        snapshot = snapshots.get(device_id)
                         if snapshot is not None:
                             logger.info(
                                 "Using DHCP snapshot for potential rollback on device %s",
                                 device_id,
                             )
-                        device_results.append({
+                        return {
                             "device_id": device_id,
                             "status": "failed",
                             "message": f"Execution failed: {str(e)}",
                             "rollback_snapshot": snapshot if snapshot is not None else None,
-                        })
+                        }
+
+                # Apply to devices in parallel (bounded by plan_apply_max_concurrency),
+                # halting after a batch that leaves a device degraded or unreachable
+                executor = PlanExecutor.from_settings(
+                    settings,
+                    health_gate=health_check_gate(HealthService(session, settings)),
+                    on_progress=context_progress_reporter(ctx),
+                )
+                execution = await executor.run(device_ids, apply_device)
+                device_results = execution.device_results
+                successful_devices = execution.successful_devices
+                failed_devices = execution.failed_devices + execution.skipped_devices
 
                 # Update plan status
                 if failed_devices:
@@ -831,6 +851,9 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
                     await plan_service.update_plan_status(plan_id, "completed", DEFAULT_MCP_USER)
                     status_msg = f"Plan completed successfully on all {len(device_ids)} devices"
 
+                if execution.halted:
+                    status_msg += f" (execution halted: {execution.halt_reason})"
+
                 return format_tool_result(
                     content=status_msg,
                     meta={
@@ -840,6 +863,7 @@ def register_dhcp_tools(mcp: FastMCP, settings: Settings) -> None:
                         "successful_devices": len(successful_devices),
                         "failed_devices": len(failed_devices),
                         "device_results": device_results,
+                        "execution": execution.summary(),
                     },
                 )
 
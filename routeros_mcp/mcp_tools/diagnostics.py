@@ -1,6 +1,7 @@
 """Diagnostics MCP tools.
 
-Provides MCP tools for running network diagnostic operations (ping, traceroute).
+Provides MCP tools for running network diagnostic operations (ping, traceroute,
+multi-device ping sweeps).
 """
 
 import ipaddress
@@ -10,13 +11,17 @@ import re
 from collections.abc import AsyncIterator
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from routeros_mcp.config import Settings
-from routeros_mcp.domain.services.diagnostics import DEFAULT_TRACEROUTE_HOPS, DiagnosticsService
+from routeros_mcp.domain.services.diagnostics import (
+    DEFAULT_TRACEROUTE_HOPS,
+    MAX_SWEEP_PAIRS,
+    DiagnosticsService,
+)
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.infra.db.session import get_session_factory
-from routeros_mcp.infra.rate_limiter import get_rate_limiter
+from routeros_mcp.infra.rate_limiter import RateLimitCharge, get_rate_limiter
 from routeros_mcp.mcp.errors import MCPError, ValidationError, map_exception_to_error
 from routeros_mcp.mcp.protocol.jsonrpc import create_progress_message, format_tool_result
 from routeros_mcp.security.authz import ToolTier, check_tool_authorization
@@ -26,6 +31,7 @@ logger = logging.getLogger(__name__)
 # Rate limiting constants for diagnostics
 PING_RATE_LIMIT = 10  # Max pings per device per minute
 PING_RATE_WINDOW = 60  # 60 seconds window
+TRACEROUTE_RATE_LIMIT = 10  # Max traceroutes per device per minute (same window)
 
 
 def _validate_target(target: str) -> None:
@@ -282,6 +288,14 @@ def register_diagnostics_tools(mcp: FastMCP, settings: Settings) -> None:
             and whether the target was reached.
         """
         try:
+            # Check rate limit before doing any work
+            await get_rate_limiter().check_and_record(
+                device_id=device_id,
+                operation="traceroute",
+                limit=TRACEROUTE_RATE_LIMIT,
+                window_seconds=PING_RATE_WINDOW,
+            )
+
             async with session_factory.session() as session:
                 device_service = DeviceService(session, settings)
 
@@ -645,3 +659,160 @@ def register_diagnostics_tools(mcp: FastMCP, settings: Settings) -> None:
         except Exception as e:
             logger.error(f"Bandwidth test tool unexpected error: {e}")
             raise map_exception_to_error(e)
+
+    @mcp.tool()
+    async def ping_sweep(
+        device_ids: list[str],
+        targets: list[str],
+        count: int = 4,
+        interval_ms: int = 1000,
+        packet_size: int = 64,
+        traceroute: bool = False,
+        max_hops: int = DEFAULT_TRACEROUTE_HOPS,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """Ping many targets from one or many RouterOS devices at once.
+
+        Use when:
+        - Troubleshooting an outage: which routers can still reach which hosts
+        - Checking a list of gateways, DNS servers or anchors from several sites
+        - Comparing latency to the same targets across devices
+
+        Performance:
+        - All pairs run concurrently: each device pings up to
+          routeros_max_concurrent_per_device targets at a time, devices in parallel
+        - Each completed pair is reported as an MCP progress notification
+          (device, target, loss, latency) while the sweep continues
+
+        Rate limits:
+        - Every target counts as one ping per device against the ping rate
+          limit (10 per device per minute), and as one traceroute against the
+          traceroute limit when traceroute=True. A sweep that exceeds either
+          budget on any device is rejected before anything runs.
+
+        Args:
+            device_ids: Source device identifiers
+            targets: Target IPs or hostnames
+            count: Pings per device/target pair (1-100, default: 4)
+            interval_ms: Interval between pings in milliseconds (10-5000, default: 1000)
+            packet_size: ICMP packet size in bytes (28-65500, default: 64)
+            traceroute: Also trace the path of every pair (default: False)
+            max_hops: Traceroute maximum hops (1-64, default: 30)
+            ctx: MCP request context (injected; used for progress notifications)
+
+        Returns:
+            Formatted tool result with the loss/latency matrix (rows are devices,
+            columns are targets), per-pair errors and a summary
+        """
+        try:
+            device_ids = list(dict.fromkeys(device_ids))
+            targets = list(dict.fromkeys(targets))
+            if not device_ids or not targets:
+                raise ValidationError("At least one device_id and one target are required")
+            if len(device_ids) * len(targets) > MAX_SWEEP_PAIRS:
+                raise ValidationError(
+                    f"Ping sweep cannot exceed {MAX_SWEEP_PAIRS} device x target pairs",
+                    data={"devices": len(device_ids), "targets": len(targets)},
+                )
+            for target in targets:
+                _validate_target(target)
+            if count < 1 or count > 100:
+                raise ValidationError(
+                    f"Invalid count {count}: must be between 1 and 100",
+                    data={"count": count, "min": 1, "max": 100},
+                )
+            if interval_ms < 10 or interval_ms > 5000:
+                raise ValidationError(
+                    f"Invalid interval_ms {interval_ms}: must be between 10 and 5000",
+                    data={"interval_ms": interval_ms, "min": 10, "max": 5000},
+                )
+            if packet_size < 28 or packet_size > 65500:
+                raise ValidationError(
+                    f"Invalid packet_size {packet_size}: must be between 28 and 65500",
+                    data={"packet_size": packet_size, "min": 28, "max": 65500},
+                )
+
+            # Every target is one ping (and one traceroute) on each device, charged
+            # up front so a sweep over the budget is rejected before any work starts
+            charges = [RateLimitCharge("ping", PING_RATE_LIMIT, cost=len(targets))]
+            if traceroute:
+                charges.append(
+                    RateLimitCharge("traceroute", TRACEROUTE_RATE_LIMIT, cost=len(targets))
+                )
+            await get_rate_limiter().check_and_record_many(
+                device_ids, charges, window_seconds=PING_RATE_WINDOW
+            )
+
+            async def report_pair(cell: dict[str, Any], completed: int, total: int) -> None:
+                if ctx is None:
+                    return
+                if "error" in cell:
+                    outcome = f"error: {cell['error']}"
+                else:
+                    outcome = f"{cell['packet_loss_percent']:.0f}% loss"
+                    if cell["avg_rtt_ms"] is not None:
+                        outcome += f", avg {cell['avg_rtt_ms']:.1f}ms"
+                await ctx.report_progress(
+                    progress=completed,
+                    total=total,
+                    message=f"{cell['device_id']} -> {cell['target']}: {outcome}",
+                )
+
+            async with session_factory.session() as session:
+                device_service = DeviceService(session, settings)
+                for device_id in device_ids:
+                    device = await device_service.get_device(device_id)
+
+                    # Authorization check - fundamental tier, read-only
+                    check_tool_authorization(
+                        device_environment=device.environment,
+                        service_environment=settings.environment,
+                        tool_tier=ToolTier.FUNDAMENTAL,
+                        allow_advanced_writes=device.allow_advanced_writes,
+                        allow_professional_workflows=device.allow_professional_workflows,
+                        device_id=device_id,
+                        tool_name="diagnostics/ping-sweep",
+                    )
+
+                diagnostics_service = DiagnosticsService(session, settings)
+                matrix = await diagnostics_service.ping_sweep(
+                    device_ids,
+                    targets,
+                    count=count,
+                    interval_ms=interval_ms,
+                    packet_size=packet_size,
+                    traceroute=traceroute,
+                    max_hops=max_hops,
+                    on_result=report_pair,
+                )
+
+            summary = matrix.summary()
+            content = (
+                f"Ping sweep of {len(targets)} target(s) from {len(device_ids)} device(s): "
+                f"{summary['reachable_pairs']} reachable, {summary['lossy_pairs']} with loss, "
+                f"{summary['unreachable_pairs']} unreachable, {summary['error_pairs']} failed"
+            )
+            if summary["unreachable_targets"]:
+                content += (
+                    "\nUnreachable from every device: "
+                    + ", ".join(summary["unreachable_targets"])
+                )
+
+            return format_tool_result(
+                content=content,
+                is_error=summary["error_pairs"] == len(matrix),
+                meta={
+                    "count": count,
+                    "interval_ms": interval_ms,
+                    "packet_size": packet_size,
+                    "summary": summary,
+                    "matrix": matrix.to_dict(),
+                },
+            )
+
+        except MCPError as e:
+            logger.warning(f"Ping sweep tool error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Ping sweep tool unexpected error: {e}")
+            raise map_exception_to_error(e) from e
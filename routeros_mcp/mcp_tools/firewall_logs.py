@@ -4,6 +4,7 @@ Provides MCP tools for querying firewall rules and system logs.
 """
 
 import logging
+from datetime import UTC, datetime
 from typing import Any
 
 from fastmcp import FastMCP
@@ -11,14 +12,29 @@ from fastmcp import FastMCP
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.services.firewall_logs import FirewallLogsService
+from routeros_mcp.domain.services.log_archive import LogArchiveService
 from routeros_mcp.infra.db.session import get_session_factory
-from routeros_mcp.mcp.errors import MCPError, map_exception_to_error
+from routeros_mcp.mcp.errors import MCPError, ValidationError, map_exception_to_error
 from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
 from routeros_mcp.security.authz import ToolTier, check_tool_authorization
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_search_time(value: str | None, name: str) -> datetime | None:
+    """Parse an ISO 8601 search bound (naive values are taken as UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValidationError(
+            f"Invalid {name}: expected ISO 8601 timestamp (e.g. 2025-12-11T22:52:33)",
+            data={name: value},
+        ) from e
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
 def register_firewall_logs_tools(mcp: FastMCP, settings: Settings) -> None:
     """Register firewall and logs management tools with the MCP server.
 
@@ -250,6 +266,7 @@ def register_firewall_logs_tools(mcp: FastMCP, settings: Settings) -> None:
         start_time: str | None = None,
         end_time: str | None = None,
         message: str | None = None,
+        tail: bool = False,
     ) -> dict[str, Any]:
         """Retrieve recent system logs with optional filtering.
 
@@ -271,6 +288,8 @@ def register_firewall_logs_tools(mcp: FastMCP, settings: Settings) -> None:
         - Bounded query - cannot stream unlimited logs
 
         Tip: Start with small limit (e.g., 100) and specific topics to avoid overwhelming response.
+        When polling the same device repeatedly, set tail=True: only entries newer
+        than the last poll are transferred and the newest matches are returned.
 
         Args:
             device_id: Device identifier (e.g., 'dev-lab-01')
@@ -279,6 +298,8 @@ def register_firewall_logs_tools(mcp: FastMCP, settings: Settings) -> None:
             start_time: Optional inclusive lower bound timestamp (string, best-effort parsed)
             end_time: Optional inclusive upper bound timestamp (string, best-effort parsed)
             message: Optional case-insensitive substring filter on message text
+            tail: Incremental mode - fetch only new entries since the last poll and
+                answer from the server-side per-device log buffer
 
         Returns:
             Formatted tool result with log entries
@@ -303,9 +324,14 @@ def register_firewall_logs_tools(mcp: FastMCP, settings: Settings) -> None:
                 )
 
                 # Get recent logs
-                log_entries, total_count = await fw_logs_service.get_recent_logs(
-                    device_id, limit, topics, start_time, end_time, message
-                )
+                if tail:
+                    log_entries, total_count = await fw_logs_service.get_recent_logs(
+                        device_id, limit, topics, start_time, end_time, message, tail=True
+                    )
+                else:
+                    log_entries, total_count = await fw_logs_service.get_recent_logs(
+                        device_id, limit, topics, start_time, end_time, message
+                    )
 
                 content = f"Retrieved {len(log_entries)} log entries"
                 if topics:
@@ -402,4 +428,90 @@ def register_firewall_logs_tools(mcp: FastMCP, settings: Settings) -> None:
                 meta=error.data,
             )
 
+    @mcp.tool()
+    async def search_logs(
+        query: str | None = None,
+        topics: list[str] | None = None,
+        device_ids: list[str] | None = None,
+        start_time: str | None = None,
+        end_time: str | None = None,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """Search archived device logs across the fleet.
+
+        Use when:
+        - User asks "which routers logged login failures this week?"
+        - Looking for log lines that already rolled out of a device's memory log
+        - Correlating events across devices (e.g. link flaps on several routers)
+        - Investigating incidents over a time range
+
+        Returns: Matching log entries (newest first) with device ID, timestamp,
+        topics, message and ingest source (poll/syslog).
+
+        Constraints:
+        - Only entries collected by the log archive (poll job or syslog) are searchable
+        - Default time range is the last 24 hours; narrower ranges scan less data
+        - Max 1000 entries per call; "truncated" is true when more entries matched
+
+        Args:
+            query: Words or "quoted phrases" that must all appear in the message
+            topics: Optional topics, matching entries having any of them (e.g. ['system', 'error'])
+            device_ids: Optional device IDs to restrict the search to (default: all devices)
+            start_time: Optional range start, ISO 8601 (default: 24h before end_time)
+            end_time: Optional range end, ISO 8601 (default: now)
+            limit: Maximum number of entries to return (default 100, max 1000)
+
+        Returns:
+            Formatted tool result with matching log entries
+        """
+        try:
+            start = _parse_search_time(start_time, "start_time")
+            end = _parse_search_time(end_time, "end_time")
+
+            async with session_factory.session() as session:
+                device_service = DeviceService(session, settings)
+
+                # Authorization check per requested device - fundamental tier, read-only
+                for device_id in device_ids or []:
+                    device = await device_service.get_device(device_id)
+                    check_tool_authorization(
+                        device_environment=device.environment,
+                        service_environment=settings.environment,
+                        tool_tier=ToolTier.FUNDAMENTAL,
+                        allow_advanced_writes=device.allow_advanced_writes,
+                        allow_professional_workflows=device.allow_professional_workflows,
+                        device_id=device_id,
+                        tool_name="logs/search",
+                    )
+
+                archive = LogArchiveService(session, settings)
+                result = await archive.search(
+                    query=query,
+                    topics=topics,
+                    device_ids=device_ids,
+                    start=start,
+                    end=end,
+                    limit=limit,
+                )
+
+                content = f"Found {result['count']} archived log entries"
+                if result["truncated"]:
+                    content += f" (limited to {limit}; narrow the search for more)"
+
+                return format_tool_result(content=content, meta=result)
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
     logger.info("Registered firewall and logs management tools")
@@ -1,7 +1,7 @@
 """Firewall address list management and rule planning MCP tools.
 
 Provides MCP tools for:
-- Managing firewall address lists (MCP-owned only)
+- Managing firewall address lists (MCP-owned only), including bulk sync
 - Planning firewall rule changes (plan/apply workflow)
 """
 
@@ -9,16 +9,22 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import PHASE3_DEFAULT_ALLOWED_ENVIRONMENTS, DeviceCapability
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.domain.services.firewall import FirewallService
 from routeros_mcp.domain.services.firewall_plan import FirewallPlanService
+from routeros_mcp.domain.services.health import HealthService
 from routeros_mcp.domain.services.plan import PlanService
+from routeros_mcp.domain.services.plan_executor import (
+    PlanExecutor,
+    context_progress_reporter,
+    health_check_gate,
+)
 from routeros_mcp.infra.db.session import get_session_factory
-from routeros_mcp.mcp.errors import MCPError, map_exception_to_error
+from routeros_mcp.mcp.errors import MCPError, ValidationError, map_exception_to_error
 from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
 from routeros_mcp.security.authz import ToolTier, check_tool_authorization
 
@@ -234,6 +240,187 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                 meta=error.data,
             )
 
+    @mcp.tool()
+    async def sync_firewall_address_list(
+        device_ids: list[str],
+        list_name: str,
+        addresses: list[str],
+        comment: str = "",
+        dry_run: bool = False,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """Synchronize an MCP-owned address list to a desired set of addresses.
+
+        Use when:
+        - Pushing a threat-intel or allow list (thousands of entries) to routers
+        - Replacing the contents of an mcp- list rather than editing single entries
+        - Previewing how far a device's list has drifted from the desired set
+
+        Side effects:
+        - Adds missing addresses and removes extra ones (unless dry_run=True)
+        - Leaves entries already present untouched; dynamic entries are never removed
+        - May affect active firewall rules referencing this list
+
+        Performance:
+        - Fetches only the target list once per device (server-side filter)
+        - Computes the add/remove diff with set operations on normalized addresses
+        - Applies changes with bounded REST concurrency per device
+          (routeros_max_concurrent_per_device) and devices in parallel
+          (plan_apply_max_concurrency), reporting progress as it goes
+        - Real syncs run in plan_apply_batch_size batches with health checks
+          after each; a degraded or unreachable device halts the rollout
+
+        Safety:
+        - Advanced tier (requires allow_advanced_writes=true on every device)
+        - Only modifies MCP-owned lists (prefix: mcp-)
+        - Supports dry_run for diff counts and samples without changes
+
+        Args:
+            device_ids: Device identifiers to synchronize
+            list_name: Address list name (must start with 'mcp-')
+            addresses: Desired IP addresses or networks (CIDR notation)
+            comment: Optional comment for added entries
+            dry_run: If True, only report the diff per device
+            ctx: MCP request context (injected; used for progress notifications)
+
+        Returns:
+            Formatted tool result with per-device diff counts, errors and timings
+
+        Examples:
+            # Preview drift of a blocklist on two routers
+            sync_firewall_address_list(
+                ["dev-lab-01", "dev-lab-02"],
+                "mcp-blocklist",
+                ["203.0.113.0/24", "198.51.100.7"],
+                dry_run=True
+            )
+        """
+        try:
+            from routeros_mcp.security.safeguards import (
+                validate_ip_address_format,
+                validate_mcp_owned_list,
+            )
+
+            if not device_ids:
+                raise ValidationError("At least one device_id is required")
+            validate_mcp_owned_list(list_name)
+            for address in addresses:
+                validate_ip_address_format(address)
+
+            # Entry-level progress is only meaningful for a single device
+            report_entries = None
+            if ctx is not None and len(device_ids) == 1:
+
+                async def report_entries(completed: int, total: int) -> None:
+                    await ctx.report_progress(
+                        progress=completed,
+                        total=total,
+                        message=f"{device_ids[0]}: {completed}/{total} changes applied",
+                    )
+
+            async def sync_device(device_id: str) -> dict[str, Any]:
+                """Authorize and synchronize the list on one device."""
+                async with session_factory.session() as device_session:
+                    device_service = DeviceService(device_session, settings)
+                    device = await device_service.get_device(device_id)
+
+                    # Authorization check - advanced tier
+                    check_tool_authorization(
+                        device_environment=device.environment,
+                        service_environment=settings.environment,
+                        tool_tier=ToolTier.ADVANCED,
+                        allow_advanced_writes=device.allow_advanced_writes,
+                        allow_professional_workflows=device.allow_professional_workflows,
+                        device_id=device_id,
+                        tool_name="firewall/sync-address-list",
+                    )
+
+                    firewall_service = FirewallService(device_session, settings)
+                    result = await firewall_service.sync_address_list(
+                        device_id,
+                        list_name,
+                        addresses,
+                        comment=comment,
+                        dry_run=dry_run,
+                        on_progress=report_entries,
+                    )
+
+                result["status"] = "success" if result["error_count"] == 0 else "failed"
+                return result
+
+            async with session_factory.session() as gate_session:
+                # Real syncs roll out in batches, halting after a batch that
+                # leaves a device degraded or unreachable; dry runs change nothing
+                health_gate = (
+                    None if dry_run else health_check_gate(HealthService(gate_session, settings))
+                )
+                executor = PlanExecutor.from_settings(
+                    settings,
+                    batch_size=0 if dry_run else settings.plan_apply_batch_size,
+                    max_failures=0,
+                    health_gate=health_gate,
+                    on_progress=(
+                        context_progress_reporter(ctx) if len(device_ids) > 1 else None
+                    ),
+                )
+                execution = await executor.run(device_ids, sync_device)
+            device_results = execution.device_results
+
+            synced = [r for r in device_results if "to_add" in r]
+            totals = {
+                "to_add": sum(r["to_add"] for r in synced),
+                "to_remove": sum(r["to_remove"] for r in synced),
+                "added": sum(r["added"] for r in synced),
+                "removed": sum(r["removed"] for r in synced),
+            }
+
+            if dry_run:
+                content = (
+                    f"DRY RUN: address list '{list_name}' on {len(synced)} device(s) "
+                    f"needs {totals['to_add']} addition(s) and "
+                    f"{totals['to_remove']} removal(s)"
+                )
+            else:
+                content = (
+                    f"Synchronized address list '{list_name}' on "
+                    f"{len(execution.successful_devices)}/{len(device_ids)} device(s): "
+                    f"added {totals['added']}, removed {totals['removed']}"
+                )
+            if execution.failed_devices:
+                content += f"\nFailed devices: {', '.join(execution.failed_devices)}"
+            if execution.halted:
+                content += f"\nExecution halted: {execution.halt_reason}"
+
+            return format_tool_result(
+                content=content,
+                is_error=not execution.successful_devices,
+                meta={
+                    "list_name": list_name,
+                    "dry_run": dry_run,
+                    "desired_count": len(set(addresses)),
+                    "device_count": len(device_ids),
+                    "successful_count": len(execution.successful_devices),
+                    "failed_count": len(execution.failed_devices),
+                    "totals": totals,
+                    "device_results": device_results,
+                    "execution": execution.summary(),
+                },
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
     @mcp.tool()
     async def plan_add_firewall_rule(
         device_ids: list[str],
@@ -723,6 +910,7 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
     async def apply_firewall_plan(
         plan_id: str,
         approval_token: str,
+        ctx: Context | None = None,
     ) -> dict[str, Any]:
         """Apply approved firewall plan with health checks and automatic rollback.
 
@@ -738,12 +926,17 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
         - Creates snapshot before changes for rollback
         - Performs health check after each device
         - Automatic rollback on health check failure
+        - Devices are applied in parallel (plan_apply_max_concurrency), with
+          per-device progress notifications and an optional fail-fast threshold
+        - Health checks after each batch (plan_apply_batch_size): a degraded or
+          unreachable device halts the rollout before the next batch
         - Updates plan status to completed/failed
         - Comprehensive audit logging
 
         Args:
             plan_id: Plan identifier from plan creation (e.g., 'plan-fw-20250115-001')
             approval_token: Approval token from plan creation (must be valid and unexpired)
+            ctx: MCP request context (injected; used for progress notifications)
 
         Returns:
             Formatted tool result with execution status and results per device
@@ -758,7 +951,6 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
         try:
             async with session_factory.session() as session:
                 plan_service = PlanService(session, settings)
-                device_service = DeviceService(session, settings)
                 firewall_plan_service = FirewallPlanService()
 
                 # Get plan details
@@ -799,30 +991,29 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                     raise ValueError("Invalid plan: missing operation type")
 
                 device_ids = plan["device_ids"]
-                device_results = []
-                snapshots = {}
-                failed_devices = []
-                successful_devices = []
-
-                # Process each device
-                for device_id in device_ids:
-                    device_result = {
+
+                async def apply_device(device_id: str) -> dict[str, Any]:
+                    """Snapshot, apply, verify and (if needed) roll back one device."""
+                    device_result: dict[str, Any] = {
                         "device_id": device_id,
                         "status": "pending",
                     }
 
+                    snapshot = None
                     rest_client = None
                     try:
-                        # Get device
-                        device = await device_service.get_device(device_id)
-                        rest_client = await device_service.get_rest_client(device_id)
+                        # Workers run concurrently, so each one resolves the device
+                        # with its own short-lived session
+                        async with session_factory.session() as device_session:
+                            device_service = DeviceService(device_session, settings)
+                            device = await device_service.get_device(device_id)
+                            rest_client = await device_service.get_rest_client(device_id)
 
                         # Step 1: Create snapshot before changes
                         logger.info(f"Creating snapshot for device {device_id}")
                         snapshot = await firewall_plan_service.create_firewall_snapshot(
                             device_id, device.name, rest_client
                         )
-                        snapshots[device_id] = snapshot
                         device_result["snapshot_id"] = snapshot["snapshot_id"]
 
                         # Step 2: Apply changes
@@ -839,8 +1030,6 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                         if apply_result["status"] != "success":
                             device_result["status"] = "failed"
                             device_result["error"] = apply_result.get("error", "Apply failed")
-                            failed_devices.append(device_id)
-                            device_results.append(device_result)
                         else:
                             # Step 3: Perform health check
                             logger.info(f"Performing health check for device {device_id}")
@@ -864,11 +1053,9 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                                 )
                                 device_result["rollback"] = rollback_result
                                 device_result["status"] = "rolled_back"
-                                failed_devices.append(device_id)
                             else:
                                 # Success
                                 device_result["status"] = "success"
-                                successful_devices.append(device_id)
 
                     except Exception as e:
                         logger.error(
@@ -879,13 +1066,10 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                         device_result["error"] = str(e)
 
                         # Attempt rollback if snapshot exists
-                        if device_id in snapshots:
+                        if snapshot is not None and rest_client is not None:
                             try:
-                                # rest_client may already be set, otherwise get a new one
-                                if rest_client is None:
-                                    rest_client = await device_service.get_rest_client(device_id)
                                 rollback_result = await firewall_plan_service.rollback_from_snapshot(
-                                    device_id, snapshots[device_id]["data"], rest_client, operation
+                                    device_id, snapshot["data"], rest_client, operation
                                 )
                                 device_result["rollback"] = rollback_result
                                 device_result["status"] = "rolled_back"
@@ -899,8 +1083,6 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                                     "error": str(rollback_error),
                                 }
 
-                        failed_devices.append(device_id)
-
                     finally:
                         # Ensure REST client is always closed
                         if rest_client is not None:
@@ -911,7 +1093,19 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                                     f"Failed to close REST client for device {device_id}: {close_error}"
                                 )
 
-                    device_results.append(device_result)
+                    return device_result
+
+                # Apply to devices in parallel (bounded by plan_apply_max_concurrency),
+                # halting after a batch that leaves a device degraded or unreachable
+                executor = PlanExecutor.from_settings(
+                    settings,
+                    health_gate=health_check_gate(HealthService(session, settings)),
+                    on_progress=context_progress_reporter(ctx),
+                )
+                execution = await executor.run(device_ids, apply_device)
+                device_results = execution.device_results
+                successful_devices = execution.successful_devices
+                failed_devices = execution.failed_devices + execution.skipped_devices
 
                 # Determine final plan status
                 if len(successful_devices) == len(device_ids):
@@ -941,6 +1135,9 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                         f"Failed devices: {', '.join(failed_devices)}"
                     )
 
+                if execution.halted:
+                    content += f"\n\nExecution halted: {execution.halt_reason}"
+
                 # Update plan status
                 await plan_service.update_plan_status(plan_id, final_status, DEFAULT_MCP_USER)
 
@@ -954,6 +1151,7 @@ def register_firewall_write_tools(mcp: FastMCP, settings: Settings) -> None:
                         "failed_count": len(failed_devices),
                         "final_status": final_status,
                         "device_results": device_results,
+                        "execution": execution.summary(),
                     },
                     is_error=(final_status == "failed" and len(successful_devices) == 0),
                 )
@@ -0,0 +1,386 @@
+"""Fleet-wide read MCP tools.
+
+Provides multi-device variants of read-only tools (interfaces, ARP table,
+DHCP leases). Devices are selected by IDs, environment or tags, authorized
+in one pass and queried concurrently; results are merged with every item
+tagged by device, and failed devices are reported without failing the call.
+
+Also provides host lookup (network/locate-host) from the host locator
+index, which the background host locator job keeps up to date.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastmcp import Context, FastMCP
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.dhcp import DHCPService
+from routeros_mcp.domain.services.fleet_read import (
+    DeviceRead,
+    FleetReadResult,
+    FleetReadService,
+)
+from routeros_mcp.domain.services.interface import InterfaceService
+from routeros_mcp.domain.services.ip import IPService
+from routeros_mcp.domain.services.plan_executor import context_progress_reporter
+from routeros_mcp.infra.db.session import get_session_factory
+from routeros_mcp.infra.routeros.host_locator import get_host_locator_index, normalize_mac
+from routeros_mcp.mcp.errors import MCPError, ValidationError, map_exception_to_error
+from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
+
+logger = logging.getLogger(__name__)
+
+
+def _host_filter(
+    mac_address: str | None, address: str | None
+) -> Callable[[dict[str, Any]], bool] | None:
+    """Item predicate matching a MAC and/or IP address, None if neither is given."""
+    if not mac_address and not address:
+        return None
+    mac = normalize_mac(mac_address) if mac_address else None
+
+    def matches(item: dict[str, Any]) -> bool:
+        if mac is not None and normalize_mac(item.get("mac_address") or "") != mac:
+            return False
+        return address is None or item.get("address") == address
+
+    return matches
+
+
+def _format_fleet_result(
+    result: FleetReadResult,
+    noun: str,
+    items_key: str,
+    filters: dict[str, Any],
+) -> dict[str, Any]:
+    """Tool result for a fleet read, an error only when every device failed."""
+    summary = result.summary()
+    content = f"Found {summary['items_total']} {noun} on {summary['devices_succeeded']} device(s)"
+    if result.errors:
+        content += f"; {summary['devices_failed']} device(s) failed: " + ", ".join(
+            error["device_id"] for error in result.errors
+        )
+    return format_tool_result(
+        content=content,
+        is_error=summary["devices_succeeded"] == 0 and summary["devices_failed"] > 0,
+        meta={
+            **summary,
+            "filters": {key: value for key, value in filters.items() if value},
+            items_key: result.items,
+            "device_counts": result.device_counts,
+            "errors": result.errors,
+        },
+    )
+
+
+def register_fleet_tools(mcp: FastMCP, settings: Settings) -> None:
+    """Register fleet-wide read tools with the MCP server.
+
+    Args:
+        mcp: FastMCP instance
+        settings: Application settings
+    """
+    session_factory = get_session_factory(settings)
+
+    async def fleet_read(
+        tool_name: str,
+        read: DeviceRead,
+        device_ids: list[str] | None,
+        environment: str | None,
+        tags: dict[str, str] | None,
+        ctx: Context | None,
+    ) -> FleetReadResult:
+        service = FleetReadService(session_factory, settings)
+        selection = await service.select_devices(
+            device_ids=device_ids,
+            environment=environment,
+            tags=tags,
+            tool_name=tool_name,
+        )
+        return await service.read(selection, read, on_progress=context_progress_reporter(ctx))
+
+    @mcp.tool()
+    async def fleet_list_interfaces(
+        device_ids: list[str] | None = None,
+        environment: str | None = None,
+        tags: dict[str, str] | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """List network interfaces of many devices in one call.
+
+        Use when:
+        - Comparing interface inventory or status across a site or environment
+        - Finding which devices have an interface down or disabled
+        - Auditing interface comments or MTUs fleet-wide
+
+        Devices are queried concurrently (fleet_read_max_concurrency at a time)
+        and reported as MCP progress notifications as they complete. Devices
+        that are unknown, not authorized or unreachable are listed under
+        errors; the others still return results.
+
+        Args:
+            device_ids: Device identifiers (combine with environment/tags to narrow)
+            environment: Select devices of this environment (lab/staging/prod)
+            tags: Select devices having all of these tags (e.g., {"site": "dc1"})
+            ctx: MCP request context (injected; used for progress notifications)
+
+        Returns:
+            Formatted tool result with interfaces tagged by device_id, per-device
+            counts and per-device errors
+        """
+        try:
+
+            async def read(session: Any, device_id: str) -> list[dict[str, Any]]:
+                return await InterfaceService(session, settings).list_interfaces(device_id)
+
+            result = await fleet_read(
+                "fleet/list-interfaces", read, device_ids, environment, tags, ctx
+            )
+            return _format_fleet_result(
+                result,
+                "interface(s)",
+                "interfaces",
+                {"environment": environment, "tags": tags},
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
+    @mcp.tool()
+    async def fleet_get_arp_table(
+        device_ids: list[str] | None = None,
+        environment: str | None = None,
+        tags: dict[str, str] | None = None,
+        mac_address: str | None = None,
+        address: str | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """Get ARP table entries of many devices in one call.
+
+        Use when:
+        - User asks "where is MAC aa:bb:cc:dd:ee:ff?" or "which router sees 10.0.0.5?"
+        - Detecting IP/MAC conflicts across sites
+        - Network discovery across an environment or site
+
+        Devices are queried concurrently (fleet_read_max_concurrency at a time)
+        and reported as MCP progress notifications as they complete. Devices
+        that are unknown, not authorized or unreachable are listed under
+        errors; the others still return results.
+
+        Args:
+            device_ids: Device identifiers (combine with environment/tags to narrow)
+            environment: Select devices of this environment (lab/staging/prod)
+            tags: Select devices having all of these tags (e.g., {"site": "dc1"})
+            mac_address: Only entries with this MAC (any case, ':' or '-' separated)
+            address: Only entries with this IP address
+            ctx: MCP request context (injected; used for progress notifications)
+
+        Returns:
+            Formatted tool result with ARP entries tagged by device_id, per-device
+            counts and per-device errors
+        """
+        try:
+            matches = _host_filter(mac_address, address)
+
+            async def read(session: Any, device_id: str) -> list[dict[str, Any]]:
+                entries = await IPService(session, settings).get_arp_table(device_id)
+                return entries if matches is None else [e for e in entries if matches(e)]
+
+            result = await fleet_read(
+                "fleet/get-arp-table", read, device_ids, environment, tags, ctx
+            )
+            return _format_fleet_result(
+                result,
+                "ARP entries",
+                "arp_entries",
+                {
+                    "environment": environment,
+                    "tags": tags,
+                    "mac_address": mac_address,
+                    "address": address,
+                },
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
+    @mcp.tool()
+    async def fleet_get_dhcp_leases(
+        device_ids: list[str] | None = None,
+        environment: str | None = None,
+        tags: dict[str, str] | None = None,
+        mac_address: str | None = None,
+        address: str | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """Get active DHCP leases of many devices in one call.
+
+        Use when:
+        - Finding which DHCP server handed out an address or serves a MAC
+        - Checking lease usage across sites
+        - Identifying clients by hostname fleet-wide
+
+        Devices are queried concurrently (fleet_read_max_concurrency at a time)
+        and reported as MCP progress notifications as they complete. Devices
+        that are unknown, not authorized or unreachable are listed under
+        errors; the others still return results.
+
+        Args:
+            device_ids: Device identifiers (combine with environment/tags to narrow)
+            environment: Select devices of this environment (lab/staging/prod)
+            tags: Select devices having all of these tags (e.g., {"site": "dc1"})
+            mac_address: Only leases for this MAC (any case, ':' or '-' separated)
+            address: Only leases of this IP address
+            ctx: MCP request context (injected; used for progress notifications)
+
+        Returns:
+            Formatted tool result with active leases tagged by device_id,
+            per-device counts and per-device errors
+        """
+        try:
+            matches = _host_filter(mac_address, address)
+
+            async def read(session: Any, device_id: str) -> list[dict[str, Any]]:
+                leases_data = await DHCPService(session, settings).get_dhcp_leases(device_id)
+                leases = leases_data["leases"]
+                return leases if matches is None else [lease for lease in leases if matches(lease)]
+
+            result = await fleet_read(
+                "fleet/get-dhcp-leases", read, device_ids, environment, tags, ctx
+            )
+            return _format_fleet_result(
+                result,
+                "active DHCP lease(s)",
+                "leases",
+                {
+                    "environment": environment,
+                    "tags": tags,
+                    "mac_address": mac_address,
+                    "address": address,
+                },
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
+    @mcp.tool()
+    async def locate_host(
+        mac_address: str | None = None,
+        address: str | None = None,
+    ) -> dict[str, Any]:
+        """Find where a host is connected, by MAC or IP address, across the fleet.
+
+        Use when:
+        - User asks "where is aa:bb:cc:dd:ee:ff?" or "which port is 10.0.0.5 on?"
+        - Finding the switch port, VLAN interface or DHCP server of a client
+        - Checking whether an IP address is used by more than one MAC (conflict)
+
+        Answered from the host locator index (ARP tables, DHCP leases and
+        learned bridge hosts of every device, refreshed by the host locator
+        job) without querying any device. Every sighting carries last_seen,
+        so it may be up to host_locator_interval_seconds old, and hosts that
+        left are still reported with their last known location. For a live
+        read use fleet_get_arp_table or fleet_get_dhcp_leases.
+
+        Bridge sightings give the port a MAC was learned on; ARP and DHCP
+        sightings give its IP address, ARP interface or DHCP server.
+
+        Args:
+            mac_address: MAC address (any case, ':' or '-' separated)
+            address: IP address (looked up through the IP -> MAC index)
+
+        Returns:
+            Formatted tool result with sightings (newest first), the MAC and
+            IP addresses involved and index statistics
+        """
+        try:
+            if bool(mac_address) == bool(address):
+                raise ValidationError(
+                    "Provide either mac_address or address",
+                    data={"mac_address": mac_address, "address": address},
+                )
+
+            index = get_host_locator_index()
+            macs = [normalize_mac(mac_address)] if mac_address else index.macs_for_ip(address)
+            query = mac_address or address
+            now = time.time()
+            sightings = [sighting for mac in macs for sighting in index.locate_mac(mac)]
+            sightings.sort(key=lambda s: -s.last_seen)
+
+            if not sightings:
+                content = f"No sightings of {query} in the host locator index"
+                if not settings.host_locator_enabled:
+                    content += " (host locator is disabled; set host_locator_enabled)"
+            else:
+                newest = sightings[0]
+                content = (
+                    f"{query} last seen on {newest.device_id} {newest.interface or '-'} "
+                    f"({newest.source}, {max(0.0, now - newest.last_seen):.0f}s ago); "
+                    f"{len(sightings)} sighting(s) on "
+                    f"{len({s.device_id for s in sightings})} device(s)"
+                )
+                if len(macs) > 1:
+                    content += f"; {address} is used by {len(macs)} MAC addresses"
+
+            return format_tool_result(
+                content=content,
+                meta={
+                    "query": {"mac_address": mac_address, "address": address},
+                    "mac_addresses": macs,
+                    "addresses": sorted({s.address for s in sightings if s.address}),
+                    "sightings": [sighting.to_dict(now) for sighting in sightings],
+                    "index": index.get_stats(),
+                },
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
+    logger.info("Registered fleet-wide read tools")
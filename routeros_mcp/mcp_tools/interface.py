@@ -184,8 +184,10 @@ def register_interface_tools(mcp: FastMCP, settings: Settings) -> None:
 
         Returns: Real-time RX/TX rates in bits per second and packets per second.
 
-        Tip: This is a snapshot at the time of the call. For trends, compare multiple 
-        calls over time.
+        Tip: The first calls take a live snapshot. Once the device's interface counters
+        have been sampled twice (every metrics_collection_interval_seconds while stats are
+        being read), rates are averages over the last interval, answered from memory
+        (source: "counters"). For history, read device://{device_id}/interfaces/traffic.
 
         Args:
             device_id: Device identifier (e.g., 'dev-lab-01')
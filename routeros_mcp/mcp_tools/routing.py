@@ -8,12 +8,18 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import PHASE3_DEFAULT_ALLOWED_ENVIRONMENTS, DeviceCapability
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.domain.services.health import HealthService
 from routeros_mcp.domain.services.plan import PlanService
+from routeros_mcp.domain.services.plan_executor import (
+    PlanExecutor,
+    context_progress_reporter,
+    health_check_gate,
+)
 from routeros_mcp.domain.services.routing import RoutingService
 from routeros_mcp.domain.services.routing_plan import RoutingPlanService
 from routeros_mcp.infra.db.session import get_session_factory
@@ -724,6 +730,7 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
     async def apply_routing_plan(
         plan_id: str,
         approval_token: str,
+        ctx: Context | None = None,
     ) -> dict[str, Any]:
         """Apply approved routing plan with health checks and automatic rollback.
 
@@ -739,12 +746,17 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
         - Creates snapshot before changes for rollback
         - Performs health check after each device
         - Automatic rollback on health check failure
+        - Devices are applied in parallel (plan_apply_max_concurrency), with
+          per-device progress notifications and an optional fail-fast threshold
+        - Health checks after each batch (plan_apply_batch_size): a degraded or
+          unreachable device halts the rollout before the next batch
         - Updates plan status to completed/failed
         - Comprehensive audit logging
 
         Args:
             plan_id: Plan identifier from plan creation (e.g., 'plan-rt-20250115-001')
             approval_token: Approval token from plan creation (must be valid and unexpired)
+            ctx: MCP request context (injected; used for progress notifications)
 
         Returns:
             Formatted tool result with execution status and results per device
@@ -759,7 +771,6 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
         try:
             async with session_factory.session() as session:
                 plan_service = PlanService(session, settings)
-                device_service = DeviceService(session, settings)
                 routing_plan_service = RoutingPlanService()
 
                 # Get plan details
@@ -794,30 +805,29 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                     raise ValueError("Invalid plan: missing operation type")
 
                 device_ids = plan["device_ids"]
-                device_results = []
-                snapshots = {}
-                failed_devices = []
-                successful_devices = []
-
-                # Process each device
-                for device_id in device_ids:
-                    device_result = {
+
+                async def apply_device(device_id: str) -> dict[str, Any]:
+                    """Snapshot, apply, verify and (if needed) roll back one device."""
+                    device_result: dict[str, Any] = {
                         "device_id": device_id,
                         "status": "pending",
                     }
 
+                    snapshot = None
                     rest_client = None
                     try:
-                        # Get device
-                        device = await device_service.get_device(device_id)
-                        rest_client = await device_service.get_rest_client(device_id)
+                        # Workers run concurrently, so each one resolves the device
+                        # with its own short-lived session
+                        async with session_factory.session() as device_session:
+                            device_service = DeviceService(device_session, settings)
+                            device = await device_service.get_device(device_id)
+                            rest_client = await device_service.get_rest_client(device_id)
 
                         # Step 1: Create snapshot before changes
                         logger.info(f"Creating snapshot for device {device_id}")
                         snapshot = await routing_plan_service.create_routing_snapshot(
                             device_id, device.name, rest_client
                         )
-                        snapshots[device_id] = snapshot
                         device_result["snapshot_id"] = snapshot["snapshot_id"]
 
                         # Step 2: Apply changes
@@ -834,8 +844,6 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                         if apply_result["status"] != "success":
                             device_result["status"] = "failed"
                             device_result["error"] = apply_result.get("error", "Apply failed")
-                            failed_devices.append(device_id)
-                            device_results.append(device_result)
                         else:
                             # Step 3: Perform health check
                             logger.info(f"Performing health check for device {device_id}")
@@ -859,11 +867,9 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                                 )
                                 device_result["rollback"] = rollback_result
                                 device_result["status"] = "rolled_back"
-                                failed_devices.append(device_id)
                             else:
                                 # Success
                                 device_result["status"] = "success"
-                                successful_devices.append(device_id)
 
                     except Exception as e:
                         logger.error(
@@ -874,13 +880,10 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                         device_result["error"] = str(e)
 
                         # Attempt rollback if snapshot exists
-                        if device_id in snapshots:
+                        if snapshot is not None and rest_client is not None:
                             try:
-                                # rest_client may already be set, otherwise get a new one
-                                if rest_client is None:
-                                    rest_client = await device_service.get_rest_client(device_id)
                                 rollback_result = await routing_plan_service.rollback_from_snapshot(
-                                    device_id, snapshots[device_id]["data"], rest_client, operation
+                                    device_id, snapshot["data"], rest_client, operation
                                 )
                                 device_result["rollback"] = rollback_result
                                 device_result["status"] = "rolled_back"
@@ -894,8 +897,6 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                                     "error": str(rollback_error),
                                 }
 
-                        failed_devices.append(device_id)
-
                     finally:
                         # Ensure REST client is always closed
                         if rest_client is not None:
@@ -906,11 +907,19 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                                     f"Failed to close REST client for device {device_id}: {close_error}"
                                 )
 
-                    if not any(
-                        r.get("device_id") == device_result.get("device_id")
-                        for r in device_results
-                    ):
-                        device_results.append(device_result)
+                    return device_result
+
+                # Apply to devices in parallel (bounded by plan_apply_max_concurrency),
+                # halting after a batch that leaves a device degraded or unreachable
+                executor = PlanExecutor.from_settings(
+                    settings,
+                    health_gate=health_check_gate(HealthService(session, settings)),
+                    on_progress=context_progress_reporter(ctx),
+                )
+                execution = await executor.run(device_ids, apply_device)
+                device_results = execution.device_results
+                successful_devices = execution.successful_devices
+                failed_devices = execution.failed_devices + execution.skipped_devices
 
                 # Determine final plan status
                 if len(successful_devices) == len(device_ids):
@@ -940,6 +949,9 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                         f"Failed devices: {', '.join(failed_devices)}"
                     )
 
+                if execution.halted:
+                    content += f"\n\nExecution halted: {execution.halt_reason}"
+
                 # Update plan status
                 await plan_service.update_plan_status(plan_id, final_status, DEFAULT_MCP_USER)
 
@@ -953,6 +965,7 @@ def register_routing_tools(mcp: FastMCP, settings: Settings) -> None:
                         "failed_count": len(failed_devices),
                         "final_status": final_status,
                         "device_results": device_results,
+                        "execution": execution.summary(),
                     },
                     is_error=(final_status == "failed" and len(successful_devices) == 0),
                 )
@@ -1,18 +1,22 @@
 """System information MCP tools.
 
-Provides MCP tools for system overview, packages, and clock information.
+Provides MCP tools for system overview, packages, clock information and
+stored health history.
 """
 
 import logging
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from fastmcp import FastMCP
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.domain.services.health_rollup import HealthRollupService
 from routeros_mcp.domain.services.system import SystemService
+from routeros_mcp.domain.utils import parse_routeros_uptime
 from routeros_mcp.infra.db.session import get_session_factory
-from routeros_mcp.mcp.errors import MCPError, map_exception_to_error
+from routeros_mcp.mcp.errors import MCPError, ValidationError, map_exception_to_error
 from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
 from routeros_mcp.security.authz import ToolTier, check_tool_authorization
 
@@ -294,6 +298,113 @@ def register_system_tools(mcp: FastMCP, settings: Settings) -> None:
                 meta=error.data,
             )
 
+    @mcp.tool()
+    async def get_health_history(
+        device_id: str, window: str = "7d", bucket: str = "auto"
+    ) -> dict[str, Any]:
+        """Get CPU and memory trend for a device from stored health checks.
+
+        Use when:
+        - User asks "what was CPU like on router X over the last week?"
+        - Looking for load spikes or memory growth over time
+        - Comparing current usage against recent history
+        - Correlating a reported incident with resource usage
+
+        Returns: Per-bucket sample count plus CPU and memory min/avg/max/p95,
+        as column-oriented arrays aligned with bucket_start.
+
+        Tip: No live device call is made. Windows older than raw health check
+        retention come from hourly/daily rollups (no p95). Use
+        system/get-overview for current usage.
+
+        Args:
+            device_id: Device identifier (e.g., 'dev-lab-01')
+            window: Lookback window in RouterOS duration format (e.g., '24h', '7d')
+            bucket: Bucket width (e.g., '5m', '1h') or 'auto' for about 500 points max
+
+        Returns:
+            Formatted tool result with bucketed health series
+        """
+        try:
+            window_seconds = parse_routeros_uptime(window)
+            if window_seconds <= 0:
+                raise ValidationError(
+                    f"Invalid window '{window}': expected a duration such as '24h' or '7d'",
+                    data={"window": window},
+                )
+
+            bucket_seconds = None if bucket == "auto" else parse_routeros_uptime(bucket)
+            if bucket_seconds is not None and bucket_seconds <= 0:
+                raise ValidationError(
+                    f"Invalid bucket '{bucket}': expected a duration such as '5m' or 'auto'",
+                    data={"bucket": bucket},
+                )
+
+            async with session_factory.session() as session:
+                device_service = DeviceService(session, settings)
+
+                # Get device first to validate it exists
+                device = await device_service.get_device(device_id)
+
+                # Authorization check - fundamental tier, read-only
+                check_tool_authorization(
+                    device_environment=device.environment,
+                    service_environment=settings.environment,
+                    tool_tier=ToolTier.FUNDAMENTAL,
+                    allow_advanced_writes=device.allow_advanced_writes,
+                    allow_professional_workflows=device.allow_professional_workflows,
+                    device_id=device_id,
+                    tool_name="system/get-health-history",
+                )
+
+                rollup_service = HealthRollupService(session, settings)
+
+                end = datetime.now(UTC)
+                series = await rollup_service.get_health_series(
+                    device_id,
+                    start=end - timedelta(seconds=window_seconds),
+                    end=end,
+                    bucket_seconds=bucket_seconds,
+                )
+
+                columns = series["columns"]
+                content_parts = [
+                    f"Device: {device.name}",
+                    f"Window: {window} ({series['count']} buckets of "
+                    f"{series['bucket_seconds']}s from {series['source']})",
+                ]
+                cpu_max = [v for v in columns["cpu_max"] if v is not None]
+                cpu_p95 = [v for v in columns["cpu_p95"] if v is not None]
+                memory_max = [v for v in columns["memory_max"] if v is not None]
+                if cpu_max:
+                    cpu_line = f"CPU: peak {max(cpu_max):.1f}%"
+                    if cpu_p95:
+                        cpu_line += f", worst bucket p95 {max(cpu_p95):.1f}%"
+                    content_parts.append(cpu_line)
+                if memory_max:
+                    content_parts.append(f"Memory: peak {max(memory_max):.1f}%")
+                if not series["count"]:
+                    content_parts.append("No health checks recorded in this window")
+
+                return format_tool_result(
+                    content="\n".join(content_parts),
+                    meta={"window": window, **series},
+                )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
     logger.info("Registered system information tools")
 
     @mcp.tool()
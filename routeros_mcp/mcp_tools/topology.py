@@ -0,0 +1,216 @@
+"""Fleet topology MCP tools.
+
+Provides path, blast-radius and neighbourhood queries over the topology
+graph (devices, interfaces, subnets and L2 neighbours), which the topology
+job and fresh interface, bridge port, IP address and neighbour reads keep
+up to date. Queries never contact a device.
+"""
+
+import logging
+from typing import Any
+
+from fastmcp import FastMCP
+
+from routeros_mcp.config import Settings
+from routeros_mcp.infra.routeros.topology import get_topology_graph
+from routeros_mcp.mcp.errors import MCPError, ValidationError, map_exception_to_error
+from routeros_mcp.mcp.protocol.jsonrpc import format_tool_result
+
+logger = logging.getLogger(__name__)
+
+# Deepest neighbourhood topology_get_connected will walk
+MAX_CONNECTED_DEPTH = 6
+
+
+def register_topology_tools(mcp: FastMCP, settings: Settings) -> None:
+    """Register fleet topology tools with the MCP server.
+
+    Args:
+        mcp: FastMCP instance
+        settings: Application settings
+    """
+
+    def unknown_node(exc: ValueError, **query: Any) -> ValidationError:
+        message = str(exc)
+        if not settings.topology_enabled:
+            message += " (topology is disabled; set topology_enabled)"
+        return ValidationError(message, data=query)
+
+    @mcp.tool()
+    async def topology_get_path(source: str, target: str) -> dict[str, Any]:
+        """Find the shortest path between two points of the fleet topology.
+
+        Use when:
+        - User asks "how is dev-1 connected to dev-7?" or "what sits between X and Y?"
+        - Checking whether two devices, interfaces or subnets are linked at all
+        - Explaining which interfaces and subnets traffic could cross
+
+        Nodes can be given as a device ID ("dev-1"), a device interface
+        ("dev-1:ether2"), a subnet ("10.0.0.0/24"), an IP address (its
+        subnet) or a MAC address. Paths follow device-interface, bridge-port,
+        address (interface-subnet) and neighbour (/ip/neighbor) links; the
+        graph is as fresh as the last topology refresh.
+
+        Args:
+            source: Start node
+            target: End node
+
+        Returns:
+            Formatted tool result with the hops of the path (empty if none)
+        """
+        try:
+            graph = get_topology_graph()
+            try:
+                hops = graph.path(source, target)
+            except ValueError as e:
+                raise unknown_node(e, source=source, target=target) from e
+            if hops is None:
+                content = f"No path between {source} and {target}"
+            else:
+                content = f"{len(hops) - 1} hop(s): " + " -> ".join(hop["key"] for hop in hops)
+
+            return format_tool_result(
+                content=content,
+                meta={
+                    "source": source,
+                    "target": target,
+                    "connected": hops is not None,
+                    "hops": hops or [],
+                    "graph": graph.get_stats(),
+                },
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
+    @mcp.tool()
+    async def topology_get_blast_radius(node: str, anchor: str | None = None) -> dict[str, Any]:
+        """Show what loses connectivity if a device, interface or subnet goes down.
+
+        Use when:
+        - User asks "what breaks if ether2 on dev-1 goes down?"
+        - Assessing the impact of disabling a port, bridge or device before a change
+        - Finding devices and neighbours reachable only through one link
+
+        The node is taken out of the topology graph and every device,
+        interface, subnet and L2 neighbour that can no longer reach the
+        anchor is reported. The anchor defaults to the interface's own
+        device, otherwise to the largest remaining part of the network.
+        Redundant links (a second uplink, a shared subnet) keep nodes out
+        of the blast radius.
+
+        Args:
+            node: Node going down (device, "device:interface", subnet, IP or MAC)
+            anchor: Node whose view of the network is reported (optional)
+
+        Returns:
+            Formatted tool result with the isolated nodes grouped by kind
+        """
+        try:
+            graph = get_topology_graph()
+            try:
+                impact = graph.blast_radius(node, anchor=anchor)
+            except ValueError as e:
+                raise unknown_node(e, node=node, anchor=anchor) from e
+            isolated = impact["isolated"]
+            content = (
+                f"Losing {impact['node']['key']} cuts off {impact['isolated_count']} node(s) "
+                f"from {impact['anchor'] or 'the network'}: "
+                f"{len(isolated['device'])} device(s), {len(isolated['neighbor'])} neighbour(s), "
+                f"{len(isolated['interface'])} interface(s), {len(isolated['subnet'])} subnet(s)"
+            )
+
+            return format_tool_result(
+                content=content,
+                meta={**impact, "graph": graph.get_stats()},
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
+    @mcp.tool()
+    async def topology_get_connected(node: str, depth: int = 1) -> dict[str, Any]:
+        """List what is connected to a device, interface, subnet or neighbour.
+
+        Use when:
+        - User asks "what is connected to dev-1?" or "what is behind ether5?"
+        - Listing the interfaces sharing a subnet across the fleet
+        - Finding the L2 neighbours discovered on a port
+
+        Walks the topology graph breadth-first up to ``depth`` hops (device
+        -> interface is one hop, interface -> subnet or neighbour another).
+
+        Args:
+            node: Start node (device, "device:interface", subnet, IP or MAC)
+            depth: Hops to walk (1-6, default: 1)
+
+        Returns:
+            Formatted tool result with the node and its neighbourhood, nearest first
+        """
+        try:
+            if not 1 <= depth <= MAX_CONNECTED_DEPTH:
+                raise ValidationError(
+                    f"depth must be between 1 and {MAX_CONNECTED_DEPTH}",
+                    data={"depth": depth},
+                )
+
+            graph = get_topology_graph()
+            try:
+                start = graph.node(node)
+                connected = graph.connected(node, depth=depth)
+            except ValueError as e:
+                raise unknown_node(e, node=node, depth=depth) from e
+            kinds = sorted({item["kind"] for item in connected})
+            content = f"{len(connected)} node(s) within {depth} hop(s) of {start['key']}"
+            if kinds:
+                content += ": " + ", ".join(
+                    f"{sum(item['kind'] == kind for item in connected)} {kind}(s)" for kind in kinds
+                )
+
+            return format_tool_result(
+                content=content,
+                meta={
+                    "node": start,
+                    "depth": depth,
+                    "connected": connected,
+                    "graph": graph.get_stats(),
+                },
+            )
+
+        except MCPError as e:
+            return format_tool_result(
+                content=e.message,
+                is_error=True,
+                meta=e.data,
+            )
+        except Exception as e:
+            error = map_exception_to_error(e)
+            return format_tool_result(
+                content=error.message,
+                is_error=True,
+                meta=error.data,
+            )
+
+    logger.info("Registered topology tools")
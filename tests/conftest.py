@@ -15,13 +15,23 @@ from __future__ import annotations
 import pytest
 
 from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.audit import reset_audit_count_cache
 from routeros_mcp.infra.db.models import Base
 from routeros_mcp.infra.db.session import (
     DatabaseSessionManager,
     initialize_session_manager as _initialize_session_manager,
     reset_session_manager,
 )
+from routeros_mcp.infra.device_registry import reset_device_registry
+from routeros_mcp.infra.observability.fleet_metrics import reset_fleet_metrics
+from routeros_mcp.infra.observability.metrics import reset_device_metrics
 from routeros_mcp.infra.observability.resource_cache import reset_cache
+from routeros_mcp.infra.routeros.host_locator import reset_host_locator_index
+from routeros_mcp.infra.routeros.log_tail import reset_log_tailer
+from routeros_mcp.infra.routeros.reachability import reset_reachability_store
+from routeros_mcp.infra.routeros.ssh_pool import reset_ssh_pool
+from routeros_mcp.infra.routeros.topology import reset_topology_graph
+from routeros_mcp.infra.routeros.traffic_counters import reset_traffic_store
 
 
 @pytest.fixture(autouse=True)
@@ -29,9 +39,29 @@ def _reset_global_singletons() -> None:
     """Ensure global singletons do not leak between tests."""
     reset_cache()
     reset_session_manager()
+    reset_device_registry()
+    reset_ssh_pool()
+    reset_log_tailer()
+    reset_traffic_store()
+    reset_reachability_store()
+    reset_host_locator_index()
+    reset_topology_graph()
+    reset_fleet_metrics()
+    reset_device_metrics()
+    reset_audit_count_cache()
     yield
     reset_cache()
     reset_session_manager()
+    reset_device_registry()
+    reset_ssh_pool()
+    reset_log_tailer()
+    reset_traffic_store()
+    reset_reachability_store()
+    reset_host_locator_index()
+    reset_topology_graph()
+    reset_fleet_metrics()
+    reset_device_metrics()
+    reset_audit_count_cache()
 
 
 @pytest.fixture
@@ -0,0 +1,219 @@
+"""Throughput benchmark for the shared RouterOS CLI output parser.
+
+Parses synthetic SSH outputs the size of large production devices through
+the service-level parsers built on routeros_mcp.infra.routeros.cli_parser:
+- Route table: /ip/route/print with 100k rows (v7 table format)
+- Route terse: /ip/route/print terse with 100k rows (what the SSH fallback requests)
+- DHCP leases: /ip/dhcp-server/lease/print detail with 50k multi-line records
+- Firewall filter: /ip/firewall/filter/print with 20k key=value rules
+
+Reports parsed rows per second for each.
+
+Run standalone:
+    python tests/e2e/cli_parser_benchmark_test.py --routes 100000 --leases 50000
+
+As a pytest e2e test, CLI_PARSER_BENCH_SCALE scales the row counts.
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from routeros_mcp.domain.services.dhcp import DHCPService
+from routeros_mcp.domain.services.firewall_logs import FirewallLogsService
+from routeros_mcp.domain.services.routing import RoutingService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParserBenchmarkResult:
+    """Throughput of one parser over one synthetic output."""
+
+    name: str
+    rows: int
+    parsed: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "rows": self.rows,
+            "parsed": self.parsed,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second),
+        }
+
+
+def generate_route_output(rows: int) -> str:
+    """Build /ip/route/print output with ``rows`` routes."""
+    lines = [
+        "Flags: D - DYNAMIC; A - ACTIVE; c - CONNECT, s - STATIC, b - BGP",
+        "Columns: DST-ADDRESS, GATEWAY, DISTANCE",
+        "#      DST-ADDRESS        GATEWAY          DISTANCE",
+    ]
+    for i in range(rows):
+        prefix = f"10.{(i >> 16) & 0xFF}.{(i >> 8) & 0xFF}.{i & 0xFF}/32"
+        lines.append(f"{i:<6d} DAb {prefix:<18s} 192.0.2.{i % 250 + 1:<8d}       20")
+    return "\n".join(lines) + "\n"
+
+
+def generate_route_terse_output(rows: int) -> str:
+    """Build /ip/route/print terse output with ``rows`` routes."""
+    lines = []
+    for i in range(rows):
+        prefix = f"10.{(i >> 16) & 0xFF}.{(i >> 8) & 0xFF}.{i & 0xFF}/32"
+        lines.append(
+            f"{i:>6d} DAb dst-address={prefix} routing-table=main gateway=192.0.2.{i % 250 + 1} "
+            f"immediate-gw=192.0.2.{i % 250 + 1}%ether1 distance=20 scope=40 target-scope=30"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def generate_lease_output(rows: int) -> str:
+    """Build /ip/dhcp-server/lease/print detail output with ``rows`` leases."""
+    lines = ["Flags: X - disabled, R - radius, D - dynamic, B - blocked"]
+    for i in range(rows):
+        mac = ":".join(f"{(i >> shift) & 0xFF:02X}" for shift in (0, 8, 16, 0, 8, 16))
+        if i % 10 == 0:
+            lines.append(f"{i:>3d}   ;;; reserved host {i}")
+            lines.append(f"       address=10.1.{(i >> 8) & 0xFF}.{i & 0xFF} mac-address={mac}")
+        else:
+            lines.append(
+                f"{i:>3d} D address=10.1.{(i >> 8) & 0xFF}.{i & 0xFF} mac-address={mac}"
+            )
+        lines.append(
+            f'       server=dhcp-lan status=bound host-name="host {i}" last-seen={i % 59}s'
+        )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def generate_filter_output(rows: int) -> str:
+    """Build /ip/firewall/filter/print output with ``rows`` rules."""
+    lines = ["Flags: X - disabled, I - invalid; D - dynamic"]
+    for i in range(rows):
+        flag = "X" if i % 7 == 0 else " "
+        lines.append(f' {i:>4d} {flag} ;;; rule {i}')
+        lines.append(
+            f"       chain=forward action=accept protocol=tcp dst-port={1024 + i % 5000} "
+            f'src-address-list="trusted {i % 10}" log=no'
+        )
+    return "\n".join(lines) + "\n"
+
+
+def measure(name: str, rows: int, output: str, parse: Callable[[str], list[Any]]) -> ParserBenchmarkResult:
+    """Time one parse of ``output``."""
+    start = time.perf_counter()
+    parsed = parse(output)
+    elapsed = time.perf_counter() - start
+    return ParserBenchmarkResult(name=name, rows=rows, parsed=len(parsed), seconds=elapsed)
+
+
+def run_cli_parser_benchmark(
+    routes: int = 100_000,
+    leases: int = 50_000,
+    rules: int = 20_000,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Measure parser throughput on synthetic large outputs.
+
+    Args:
+        routes: Route table rows
+        leases: DHCP lease detail records
+        rules: Firewall filter rules
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    results = [
+        measure(
+            "route_table",
+            routes,
+            generate_route_output(routes),
+            RoutingService._parse_route_print_output,
+        ),
+        measure(
+            "route_terse",
+            routes,
+            generate_route_terse_output(routes),
+            RoutingService._parse_route_print_output,
+        ),
+        measure(
+            "dhcp_lease_detail",
+            leases,
+            generate_lease_output(leases),
+            DHCPService._parse_dhcp_lease_detail_output,
+        ),
+        measure(
+            "firewall_filter",
+            rules,
+            generate_filter_output(rules),
+            FirewallLogsService._parse_firewall_filter_print_output,
+        ),
+    ]
+
+    summary = {"results": [r.to_dict() for r in results]}
+
+    logger.info("=" * 80)
+    logger.info("CLI PARSER BENCHMARK")
+    for result in results:
+        logger.info(
+            f"{result.name:18s} {result.rows:7d} rows  {result.seconds * 1000:8.1f}ms  "
+            f"{result.rows_per_second:10.0f} rows/s"
+        )
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.e2e
+def test_benchmark_cli_parser_throughput():
+    """Every generated row must be parsed, at a usable rate."""
+    scale = float(os.environ.get("CLI_PARSER_BENCH_SCALE", "0.1"))
+    summary = run_cli_parser_benchmark(
+        routes=int(100_000 * scale),
+        leases=int(50_000 * scale),
+        rules=int(20_000 * scale),
+        output_file=Path("reports/cli_parser_benchmark.json"),
+    )
+
+    for result in summary["results"]:
+        assert result["parsed"] == result["rows"], result["name"]
+        assert result["rows_per_second"] > 10_000, result["name"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", type=int, default=100_000)
+    parser.add_argument("--leases", type=int, default=50_000)
+    parser.add_argument("--rules", type=int, default=20_000)
+    parser.add_argument("--output", type=Path, default=Path("reports/cli_parser_benchmark.json"))
+    args = parser.parse_args()
+
+    run_cli_parser_benchmark(
+        routes=args.routes,
+        leases=args.leases,
+        rules=args.rules,
+        output_file=args.output,
+    )
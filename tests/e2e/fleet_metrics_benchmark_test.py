@@ -0,0 +1,285 @@
+"""Benchmark for fleet metrics aggregation over the columnar snapshot.
+
+Compares fleet queries answered by walking per-device HealthCheckResult
+objects in Python (how fleet summaries were computed before) with the
+same queries on FleetMetricsSnapshot, for fleets of 1k and 10k devices:
+
+- summary: count/min/mean/p50/p95/max of CPU usage
+- top_k: 10 devices with the highest memory usage
+- by_environment / by_site: CPU summary per environment / per site tag
+- filtered: CPU summary for one environment and tag
+
+Run standalone:
+    python tests/e2e/fleet_metrics_benchmark_test.py --devices 10000 --iterations 50
+
+As a pytest e2e test, FLEET_METRICS_BENCH_ITERATIONS controls the repetitions.
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import logging
+import math
+import os
+import random
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from routeros_mcp.domain.models import HealthCheckResult
+from routeros_mcp.infra.observability.fleet_metrics import FleetMetricsSnapshot
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FLEET_SIZES = (1_000, 10_000)
+ENVIRONMENTS = ("lab", "staging", "prod")
+SITES = tuple(f"site-{i:02d}" for i in range(20))
+
+# Target latency for any single snapshot query at 10k devices
+TARGET_MS = 10.0
+
+
+@dataclass
+class FleetMetricsBenchmarkResult:
+    """Latency samples for one fleet size, query and implementation."""
+
+    devices: int
+    query: str
+    mode: str
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def p50_latency(self) -> float:
+        return statistics.median(self.latencies) if self.latencies else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "devices": self.devices,
+            "query": self.query,
+            "mode": self.mode,
+            "iterations": len(self.latencies),
+            "p50_ms": round(self.p50_latency * 1000, 3),
+            "max_ms": round(max(self.latencies) * 1000, 3) if self.latencies else 0.0,
+        }
+
+
+def _build_fleet(count: int, seed: int = 7) -> list[tuple[Any, HealthCheckResult]]:
+    """Devices with random environment, site and health metrics."""
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    fleet = []
+    for index in range(count):
+        device = SimpleNamespace(
+            id=f"dev-{index:05d}",
+            environment=rng.choice(ENVIRONMENTS),
+            tags={"site": rng.choice(SITES), "role": rng.choice(("edge", "core"))},
+        )
+        unreachable = rng.random() < 0.02
+        result = HealthCheckResult(
+            device_id=device.id,
+            status="unreachable" if unreachable else rng.choice(("healthy",) * 9 + ("degraded",)),
+            timestamp=now,
+            cpu_usage_percent=None if unreachable else rng.uniform(0, 100),
+            memory_usage_percent=None if unreachable else rng.uniform(10, 95),
+            uptime_seconds=None if unreachable else rng.randrange(86_400 * 90),
+        )
+        fleet.append((device, result))
+    return fleet
+
+
+def _loop_summary(values: list[float]) -> dict[str, Any]:
+    """Summary statistics computed the way per-object loops do it."""
+    if not values:
+        return {"count": 0}
+    values.sort()
+    total = 0.0
+    for value in values:
+        total += value
+
+    def percentile(q: float) -> float:
+        position = (len(values) - 1) * q / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    return {
+        "count": len(values),
+        "min": round(values[0], 2),
+        "mean": round(total / len(values), 2),
+        "p50": round(percentile(50), 2),
+        "p95": round(percentile(95), 2),
+        "max": round(values[-1], 2),
+    }
+
+
+def _loop_queries(fleet: list[tuple[Any, HealthCheckResult]]) -> dict[str, Callable[[], Any]]:
+    """Fleet queries over per-device result objects."""
+
+    def summary() -> Any:
+        return _loop_summary(
+            [r.cpu_usage_percent for _, r in fleet if r.cpu_usage_percent is not None]
+        )
+
+    def top_k() -> Any:
+        rows = [(r.memory_usage_percent, d.id) for d, r in fleet if r.memory_usage_percent is not None]
+        return heapq.nlargest(10, rows)
+
+    def grouped(key: Callable[[Any], str | None]) -> Any:
+        groups: dict[str, list[float]] = {}
+        for device, result in fleet:
+            group = key(device)
+            if group is not None and result.cpu_usage_percent is not None:
+                groups.setdefault(group, []).append(result.cpu_usage_percent)
+        return {name: _loop_summary(values) for name, values in groups.items()}
+
+    def filtered() -> Any:
+        return _loop_summary(
+            [
+                r.cpu_usage_percent
+                for d, r in fleet
+                if d.environment == "prod"
+                and d.tags.get("role") == "edge"
+                and r.cpu_usage_percent is not None
+            ]
+        )
+
+    return {
+        "summary": summary,
+        "top_k": top_k,
+        "by_environment": lambda: grouped(lambda d: d.environment),
+        "by_site": lambda: grouped(lambda d: d.tags.get("site")),
+        "filtered": filtered,
+    }
+
+
+def _snapshot_queries(snapshot: FleetMetricsSnapshot) -> dict[str, Callable[[], Any]]:
+    """The same fleet queries on the columnar snapshot."""
+    return {
+        "summary": lambda: snapshot.aggregate("cpu_usage_percent"),
+        "top_k": lambda: snapshot.top_k("memory_usage_percent", 10),
+        "by_environment": lambda: snapshot.breakdown("cpu_usage_percent", "environment"),
+        "by_site": lambda: snapshot.breakdown("cpu_usage_percent", "tag:site"),
+        "filtered": lambda: snapshot.aggregate(
+            "cpu_usage_percent", environment="prod", tag="role=edge"
+        ),
+    }
+
+
+def _time(query: Callable[[], Any], result: FleetMetricsBenchmarkResult, iterations: int) -> Any:
+    value = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        value = query()
+        result.latencies.append(time.perf_counter() - start)
+    return value
+
+
+def measure_fleet_size(count: int, iterations: int) -> list[FleetMetricsBenchmarkResult]:
+    """Time every query for both implementations on a fleet of ``count`` devices."""
+    fleet = _build_fleet(count)
+    snapshot = FleetMetricsSnapshot()
+    for device, result in fleet:
+        snapshot.record_health(device, result)
+
+    loop_queries = _loop_queries(fleet)
+    results = []
+    for name, query in _snapshot_queries(snapshot).items():
+        loop = FleetMetricsBenchmarkResult(count, name, "object_loop")
+        columnar = FleetMetricsBenchmarkResult(count, name, "snapshot")
+        expected = _time(loop_queries[name], loop, iterations)
+        actual = _time(query, columnar, iterations)
+        results.extend((loop, columnar))
+
+        # Both implementations must agree
+        if name == "top_k":
+            assert [row["device_id"] for row in actual] == [device_id for _, device_id in expected]
+        elif name.startswith("by_"):
+            assert {k: {**v, "devices": None} for k, v in actual.items()} == {
+                k: {**v, "devices": None} for k, v in expected.items()
+            }
+        else:
+            assert actual == expected
+    return results
+
+
+async def run_fleet_metrics_benchmark(
+    iterations: int = 20,
+    sizes: tuple[int, ...] = FLEET_SIZES,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare per-object loops with columnar snapshot queries.
+
+    Args:
+        iterations: Repetitions per query, fleet size and implementation
+        sizes: Fleet sizes to measure
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    results: list[FleetMetricsBenchmarkResult] = []
+    for count in sizes:
+        results.extend(measure_fleet_size(count, iterations))
+
+    summary = {"results": [r.to_dict() for r in results]}
+
+    logger.info("=" * 80)
+    logger.info("FLEET METRICS BENCHMARK")
+    for loop, columnar in zip(results[::2], results[1::2]):
+        speedup = loop.p50_latency / columnar.p50_latency if columnar.p50_latency else 0.0
+        logger.info(
+            f"{loop.devices:6d} devices  {loop.query:15s} "
+            f"object loop {loop.p50_latency * 1000:8.2f}ms  "
+            f"snapshot {columnar.p50_latency * 1000:7.2f}ms  ({speedup:.1f}x)"
+        )
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_fleet_metrics():
+    """Every snapshot query must stay under the target at 10k devices."""
+    iterations = int(os.environ.get("FLEET_METRICS_BENCH_ITERATIONS", "10"))
+    summary = await run_fleet_metrics_benchmark(
+        iterations=iterations,
+        output_file=Path("reports/fleet_metrics_benchmark.json"),
+    )
+
+    for result in summary["results"]:
+        if result["mode"] == "snapshot" and result["devices"] == 10_000:
+            assert result["p50_ms"] < TARGET_MS, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--devices", type=int, nargs="*", default=list(FLEET_SIZES))
+    parser.add_argument(
+        "--output", type=Path, default=Path("reports/fleet_metrics_benchmark.json")
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_fleet_metrics_benchmark(
+            iterations=args.iterations,
+            sizes=tuple(args.devices),
+            output_file=args.output,
+        )
+    )
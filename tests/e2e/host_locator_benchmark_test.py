@@ -0,0 +1,209 @@
+"""Benchmark for host lookups: host locator index vs scanning device tables.
+
+Builds ARP tables and bridge host tables for a simulated fleet (every host
+is seen by its access device and by a core router) and looks up random
+MAC and IP addresses. Compares:
+
+- scan: filter every device's tables per lookup (what a live fleet-wide
+  ARP read does after the tables arrive; network time not included)
+- index: HostLocatorIndex.locate_mac / macs_for_ip
+
+Also measures an incremental index refresh of the whole fleet.
+
+Run standalone:
+    python tests/e2e/host_locator_benchmark_test.py --devices 200 --hosts 250
+
+As a pytest e2e test, HOST_LOCATOR_BENCH_DEVICES controls the device count.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from routeros_mcp.infra.routeros.host_locator import (
+    HostLocatorIndex,
+    collect_sightings,
+    normalize_mac,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEVICES = 200
+HOSTS_PER_DEVICE = 250
+LOOKUPS = 2000
+
+
+@dataclass
+class HostLocatorBenchmarkResult:
+    """Lookup throughput for one lookup mode."""
+
+    mode: str
+    lookups: int
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "lookups": self.lookups,
+            "elapsed_ms": round(self.elapsed_seconds * 1000, 3),
+            "us_per_lookup": round(self.elapsed_seconds / self.lookups * 1e6, 2)
+            if self.lookups
+            else 0.0,
+        }
+
+
+def _fleet_tables(
+    devices: int, hosts_per_device: int
+) -> dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]]:
+    """ARP and bridge host tables per device; dev-000 is the core router."""
+    tables: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]] = {
+        f"dev-{n:03d}": ([], []) for n in range(devices)
+    }
+    core_arp = tables["dev-000"][0]
+    for device in range(1, devices):
+        device_id = f"dev-{device:03d}"
+        for host in range(hosts_per_device):
+            mac = f"02:00:{device >> 8:02X}:{device & 0xFF:02X}:{host >> 8:02X}:{host & 0xFF:02X}"
+            address = f"10.{device >> 8}.{device & 0xFF}.{host % 250 + 1}"
+            tables[device_id][1].append({"mac_address": mac, "on_interface": f"ether{host % 24}"})
+            entry = {"address": address, "mac_address": mac, "interface": "vlan10"}
+            tables[device_id][0].append(entry)
+            core_arp.append(entry)
+    return tables
+
+
+def _scan(tables, mac: str | None, address: str | None) -> list[tuple[str, dict[str, Any]]]:
+    matches: list[tuple[str, dict[str, Any]]] = []
+    for device_id, (arp, hosts) in tables.items():
+        for item in (*arp, *hosts):
+            if (mac is not None and normalize_mac(item["mac_address"]) == mac) or (
+                address is not None and item.get("address") == address
+            ):
+                matches.append((device_id, item))
+    return matches
+
+
+async def run_host_locator_benchmark(
+    devices: int = DEVICES,
+    hosts_per_device: int = HOSTS_PER_DEVICE,
+    lookups: int = LOOKUPS,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare table scans with index lookups.
+
+    Args:
+        devices: Simulated devices (one core router plus access devices)
+        hosts_per_device: Hosts behind each access device
+        lookups: Lookups per mode (half by MAC, half by IP)
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    tables = _fleet_tables(devices, hosts_per_device)
+    entries = [entry for arp, _ in tables.values() for entry in arp]
+    rng = random.Random(7)
+    queries = [
+        (normalize_mac(e["mac_address"]), None) if i % 2 else (None, e["address"])
+        for i, e in enumerate(rng.choice(entries) for _ in range(lookups))
+    ]
+
+    index = HostLocatorIndex()
+    start = time.perf_counter()
+    for device_id, (arp, hosts) in tables.items():
+        index.update_device(device_id, collect_sightings(device_id, arp, bridge_hosts=hosts))
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for device_id, (arp, hosts) in tables.items():
+        index.update_device(device_id, collect_sightings(device_id, arp, bridge_hosts=hosts))
+    refresh_seconds = time.perf_counter() - start
+
+    scan_lookups = max(1, lookups // 20)
+    scan = HostLocatorBenchmarkResult("scan", scan_lookups)
+    start = time.perf_counter()
+    for mac, address in queries[:scan_lookups]:
+        _scan(tables, mac, address)
+    scan.elapsed_seconds = time.perf_counter() - start
+
+    indexed = HostLocatorBenchmarkResult("index", lookups)
+    found = 0
+    start = time.perf_counter()
+    for mac, address in queries:
+        macs = [mac] if mac else index.macs_for_ip(address)
+        found += bool([s for m in macs for s in index.locate_mac(m)])
+    indexed.elapsed_seconds = time.perf_counter() - start
+
+    summary = {
+        "devices": devices,
+        "hosts_per_device": hosts_per_device,
+        "index": index.get_stats(),
+        "build_ms": round(build_seconds * 1000, 3),
+        "refresh_ms": round(refresh_seconds * 1000, 3),
+        "found": found,
+        "results": [scan.to_dict(), indexed.to_dict()],
+    }
+
+    logger.info("=" * 80)
+    logger.info("HOST LOCATOR BENCHMARK")
+    logger.info(
+        f"{devices} devices, {hosts_per_device} hosts per device, "
+        f"{summary['index']['sightings']} sightings"
+    )
+    logger.info(f"index build {summary['build_ms']:.1f}ms, refresh {summary['refresh_ms']:.1f}ms")
+    for result in summary["results"]:
+        logger.info(f"{result['mode']:6s} {result['us_per_lookup']:12.2f} us/lookup")
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_host_locator():
+    """Index lookups are much faster than scanning every device's tables."""
+    devices = int(os.environ.get("HOST_LOCATOR_BENCH_DEVICES", "50"))
+    summary = await run_host_locator_benchmark(
+        devices=devices,
+        hosts_per_device=100,
+        lookups=1000,
+        output_file=Path("reports/host_locator_benchmark.json"),
+    )
+
+    scan, indexed = summary["results"]
+    assert summary["found"] == 1000
+    assert indexed["us_per_lookup"] * 50 < scan["us_per_lookup"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEVICES)
+    parser.add_argument("--hosts", type=int, default=HOSTS_PER_DEVICE)
+    parser.add_argument("--lookups", type=int, default=LOOKUPS)
+    parser.add_argument("--output", type=Path, default=Path("reports/host_locator_benchmark.json"))
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_host_locator_benchmark(
+            devices=args.devices,
+            hosts_per_device=args.hosts,
+            lookups=args.lookups,
+            output_file=args.output,
+        )
+    )
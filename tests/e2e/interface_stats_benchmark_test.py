@@ -0,0 +1,258 @@
+"""Benchmark for batched vs per-interface REST traffic sampling.
+
+Compares the previous InterfaceService REST path (one
+``/rest/interface/monitor-traffic once`` request per interface, issued
+serially) with the batched sampler (comma-separated interface lists, one
+request per batch) for fleets of 8, 24 and 60 interfaces.
+
+The RouterOS REST API is emulated in-process by an httpx mock transport
+that charges a round-trip cost per request plus the monitor-traffic
+sampling period, and answers comma-separated interface lists with one
+sample per interface, like RouterOS does. Requests go through the real
+RouterOSRestClient.
+
+Run standalone:
+    python tests/e2e/interface_stats_benchmark_test.py --rtt-ms 20 --sample-ms 250
+
+As a pytest e2e test, IFSTATS_BENCH_ITERATIONS controls the repetitions.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.interface import InterfaceService
+from routeros_mcp.infra.routeros.rest_client import RouterOSRestClient
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INTERFACE_COUNTS = (8, 24, 60)
+
+
+@dataclass
+class InterfaceStatsBenchmarkResult:
+    """Latency samples for one interface count and sampling mode."""
+
+    interfaces: int
+    mode: str
+    requests: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def p50_latency(self) -> float:
+        return statistics.median(self.latencies) if self.latencies else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "interfaces": self.interfaces,
+            "mode": self.mode,
+            "requests": self.requests,
+            "iterations": len(self.latencies),
+            "p50_ms": round(self.p50_latency * 1000, 2),
+            "min_ms": round(min(self.latencies) * 1000, 2) if self.latencies else 0.0,
+        }
+
+
+class _EmulatedRouterOSRest:
+    """monitor-traffic endpoint with per-request and per-sample latency."""
+
+    def __init__(self, rtt_s: float, sample_s: float) -> None:
+        self.rtt_s = rtt_s
+        self.sample_s = sample_s
+        self.requests = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        names = request.url.params.get("interface", "").split(",")
+        # Round trip plus one sampling period, shared by all listed interfaces
+        await asyncio.sleep(self.rtt_s + self.sample_s)
+        samples = [
+            {
+                "name": name,
+                "rx-bits-per-second": str(1000 * index),
+                "tx-bits-per-second": str(500 * index),
+                "rx-packets-per-second": str(index),
+                "tx-packets-per-second": str(index),
+            }
+            for index, name in enumerate(names, start=1)
+            if name
+        ]
+        return httpx.Response(200, json=samples)
+
+
+class _BenchDeviceService:
+    """Hands out REST clients wired to the emulated device."""
+
+    def __init__(self, emulator: _EmulatedRouterOSRest) -> None:
+        self.emulator = emulator
+
+    async def get_device(self, _device_id: str) -> object:
+        return object()
+
+    async def get_rest_client(self, _device_id: str) -> RouterOSRestClient:
+        client = RouterOSRestClient(host="bench.invalid", username="bench", password="bench")
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(self.emulator.handle),
+        )
+        return client
+
+
+async def _legacy_interface_stats(
+    client: RouterOSRestClient, names: list[str]
+) -> list[dict[str, Any]]:
+    """Previous REST path: one serial monitor-traffic request per interface."""
+    result = []
+    try:
+        for name in names:
+            stats_data = await client.get(
+                "/rest/interface/monitor-traffic",
+                params={"interface": name, "once": "true", "without-paging": "true"},
+            )
+            candidates = stats_data if isinstance(stats_data, list) else [stats_data]
+            for stat in candidates:
+                result.append({
+                    "name": stat.get("name", name),
+                    "rx_bits_per_second": stat.get("rx-bits-per-second", 0),
+                    "tx_bits_per_second": stat.get("tx-bits-per-second", 0),
+                    "rx_packets_per_second": stat.get("rx-packets-per-second", 0),
+                    "tx_packets_per_second": stat.get("tx-packets-per-second", 0),
+                })
+    finally:
+        await client.close()
+    return result
+
+
+async def measure_interface_count(
+    service: InterfaceService,
+    emulator: _EmulatedRouterOSRest,
+    count: int,
+    iterations: int,
+) -> tuple[InterfaceStatsBenchmarkResult, InterfaceStatsBenchmarkResult]:
+    """Time the legacy and batched paths for ``count`` interfaces."""
+    names = [f"vlan{i}" for i in range(1, count + 1)]
+    legacy = InterfaceStatsBenchmarkResult(count, "per_interface")
+    batched = InterfaceStatsBenchmarkResult(count, "batched")
+
+    for _ in range(iterations):
+        emulator.requests = 0
+        start = time.perf_counter()
+        expected = await _legacy_interface_stats(
+            await service.device_service.get_rest_client("bench"), names
+        )
+        legacy.latencies.append(time.perf_counter() - start)
+        legacy.requests = emulator.requests
+
+        emulator.requests = 0
+        start = time.perf_counter()
+        stats = await service._get_interface_stats_via_rest("bench", names)
+        batched.latencies.append(time.perf_counter() - start)
+        batched.requests = emulator.requests
+
+        # Same values per interface; the emulator numbers interfaces per request
+        assert [s["name"] for s in stats] == [s["name"] for s in expected]
+
+    return legacy, batched
+
+
+async def run_interface_stats_benchmark(
+    iterations: int = 5,
+    rtt_ms: float = 20.0,
+    sample_ms: float = 250.0,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare per-interface and batched monitor-traffic sampling.
+
+    Args:
+        iterations: Repetitions per interface count and mode
+        rtt_ms: Emulated REST round-trip time per request
+        sample_ms: Emulated monitor-traffic sampling period per request
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    emulator = _EmulatedRouterOSRest(rtt_ms / 1000, sample_ms / 1000)
+    service = InterfaceService(MagicMock(), Settings())
+    service.device_service = _BenchDeviceService(emulator)  # type: ignore[assignment]
+
+    results: list[InterfaceStatsBenchmarkResult] = []
+    for count in INTERFACE_COUNTS:
+        results.extend(await measure_interface_count(service, emulator, count, iterations))
+
+    summary = {
+        "rtt_ms": rtt_ms,
+        "sample_ms": sample_ms,
+        "results": [r.to_dict() for r in results],
+    }
+
+    logger.info("=" * 80)
+    logger.info(f"INTERFACE STATS BENCHMARK (rtt {rtt_ms}ms, sample {sample_ms}ms)")
+    for legacy, batched in zip(results[::2], results[1::2]):
+        speedup = legacy.p50_latency / batched.p50_latency if batched.p50_latency else 0.0
+        logger.info(
+            f"{legacy.interfaces:3d} interfaces  "
+            f"per-interface {legacy.p50_latency * 1000:8.1f}ms ({legacy.requests} req)  "
+            f"batched {batched.p50_latency * 1000:7.1f}ms ({batched.requests} req)  "
+            f"({speedup:.1f}x)"
+        )
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_interface_stats():
+    """Batched sampling must use one request per batch and beat the serial path."""
+    iterations = int(os.environ.get("IFSTATS_BENCH_ITERATIONS", "3"))
+    summary = await run_interface_stats_benchmark(
+        iterations=iterations,
+        sample_ms=50.0,
+        output_file=Path("reports/interface_stats_benchmark.json"),
+    )
+
+    by_key = {(r["interfaces"], r["mode"]): r for r in summary["results"]}
+    for count in INTERFACE_COUNTS:
+        assert by_key[(count, "per_interface")]["requests"] == count
+        assert by_key[(count, "batched")]["requests"] == 1
+        assert by_key[(count, "batched")]["p50_ms"] < by_key[(count, "per_interface")]["p50_ms"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--rtt-ms", type=float, default=20.0)
+    parser.add_argument("--sample-ms", type=float, default=250.0)
+    parser.add_argument(
+        "--output", type=Path, default=Path("reports/interface_stats_benchmark.json")
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_interface_stats_benchmark(
+            iterations=args.iterations,
+            rtt_ms=args.rtt_ms,
+            sample_ms=args.sample_ms,
+            output_file=args.output,
+        )
+    )
@@ -0,0 +1,209 @@
+"""Benchmark for event-loop stalls caused by /metrics scrapes.
+
+Several Prometheus servers scrape at the same moment while a ticker task
+measures how late the event loop wakes it up. Compares:
+
+- inline: get_metrics_text() and gzip on the event loop for every scrape
+  (how /metrics rendered before)
+- exposition: MetricsExposition (worker-thread render, shared by
+  concurrent scrapes, gzip once per render)
+
+The fleet is 5k devices with per-device series enabled, the heaviest
+exposition the service produces.
+
+Run standalone:
+    python tests/e2e/metrics_exposition_benchmark_test.py --devices 5000 --rounds 5
+
+As a pytest e2e test, METRICS_EXPOSITION_BENCH_ROUNDS controls the scrape rounds.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.observability.exposition import GZIP_LEVEL, MetricsExposition
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEVICES = 5_000
+SCRAPERS = 3
+TICK_SECONDS = 0.005
+
+
+@dataclass
+class MetricsExpositionBenchmarkResult:
+    """Loop lag and render counts for one exposition mode."""
+
+    mode: str
+    scrapes: int = 0
+    renders: int = 0
+    payload_bytes: int = 0
+    lags: list[float] = field(default_factory=list)
+    scrape_latencies: list[float] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        lags = sorted(self.lags) or [0.0]
+        return {
+            "mode": self.mode,
+            "scrapes": self.scrapes,
+            "renders": self.renders,
+            "payload_bytes": self.payload_bytes,
+            "max_loop_lag_ms": round(lags[-1] * 1000, 3),
+            "p99_loop_lag_ms": round(lags[int(len(lags) * 0.99)] * 1000, 3),
+            "p50_scrape_ms": round(statistics.median(self.scrape_latencies) * 1000, 3)
+            if self.scrape_latencies
+            else 0.0,
+        }
+
+
+def _populate(count: int, seed: int = 5) -> None:
+    rng = random.Random(seed)
+    snapshot = get_fleet_metrics()
+    for index in range(count):
+        device_id = f"dev-{index:05d}"
+        environment = rng.choice(("lab", "staging", "prod"))
+        cpu, memory = rng.uniform(0, 100), rng.uniform(10, 95)
+        metrics.record_health_check(device_id, environment, "healthy", cpu, memory, 3600)
+        metrics.record_routeros_request(device_id, environment, "GET", rng.random(), True)
+        snapshot.record(
+            device_id,
+            environment=environment,
+            status="healthy",
+            metrics={"cpu_usage_percent": cpu, "memory_usage_percent": memory},
+        )
+    metrics.configure_metrics(per_device=True)
+
+
+async def _run_mode(
+    mode: str,
+    scrape: Callable[[], Awaitable[bytes]],
+    rounds: int,
+) -> MetricsExpositionBenchmarkResult:
+    result = MetricsExpositionBenchmarkResult(mode)
+    stop = asyncio.Event()
+
+    async def ticker() -> None:
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            result.lags.append(max(0.0, time.perf_counter() - start - TICK_SECONDS))
+
+    async def timed_scrape() -> None:
+        start = time.perf_counter()
+        body = await scrape()
+        result.scrape_latencies.append(time.perf_counter() - start)
+        result.payload_bytes = len(body)
+        result.scrapes += 1
+
+    tick_task = asyncio.create_task(ticker())
+    for _ in range(rounds):
+        await asyncio.gather(*(timed_scrape() for _ in range(SCRAPERS)))
+        await asyncio.sleep(0.05)
+    stop.set()
+    await tick_task
+    return result
+
+
+async def run_metrics_exposition_benchmark(
+    rounds: int = 5,
+    devices: int = DEVICES,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare inline rendering with the cached off-loop exposition.
+
+    Args:
+        rounds: Rounds of concurrent scrapes per mode
+        devices: Fleet size
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    _populate(devices)
+    inline_renders = 0
+
+    async def inline() -> bytes:
+        nonlocal inline_renders
+        inline_renders += 1
+        return gzip.compress(metrics.get_metrics_text().encode(), GZIP_LEVEL)
+
+    inline_result = await _run_mode("inline", inline, rounds)
+    inline_result.renders = inline_renders
+
+    # Every round of concurrent scrapes starts after the TTL expired
+    exposition = MetricsExposition(ttl_seconds=0.04)
+    cached_result = await _run_mode(
+        "exposition", lambda: exposition.get(gzip_encoded=True), rounds
+    )
+    cached_result.renders = exposition.renders
+
+    results = [inline_result, cached_result]
+    summary = {"devices": devices, "results": [r.to_dict() for r in results]}
+
+    logger.info("=" * 80)
+    logger.info("METRICS EXPOSITION BENCHMARK")
+    for result in summary["results"]:
+        logger.info(
+            f"{result['mode']:10s} scrapes {result['scrapes']:3d}  renders {result['renders']:3d}  "
+            f"max loop lag {result['max_loop_lag_ms']:8.2f}ms  "
+            f"p50 scrape {result['p50_scrape_ms']:8.2f}ms  "
+            f"{result['payload_bytes'] / 1024:8.1f} KiB gzip"
+        )
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_metrics_exposition():
+    """Concurrent scrapes share renders and stall the loop less."""
+    rounds = int(os.environ.get("METRICS_EXPOSITION_BENCH_ROUNDS", "3"))
+    summary = await run_metrics_exposition_benchmark(
+        rounds=rounds,
+        output_file=Path("reports/metrics_exposition_benchmark.json"),
+    )
+
+    inline, cached = summary["results"]
+    assert inline["renders"] == rounds * SCRAPERS
+    assert cached["renders"] <= rounds
+    assert cached["max_loop_lag_ms"] < inline["max_loop_lag_ms"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--devices", type=int, default=DEVICES)
+    parser.add_argument(
+        "--output", type=Path, default=Path("reports/metrics_exposition_benchmark.json")
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_metrics_exposition_benchmark(
+            rounds=args.rounds,
+            devices=args.devices,
+            output_file=args.output,
+        )
+    )
@@ -0,0 +1,273 @@
+"""Benchmark for /metrics scrape size and render time with bounded labels.
+
+Compares a registry labelled by ``device_id`` (how device metrics were
+exported before) with the bounded-label registry plus fleet aggregates that
+get_metrics_text() renders now, and with one page of the per-device
+exporter (``/metrics/devices``), for fleets of 1k and 5k devices.
+
+Every device gets one health check, two RouterOS request methods and one
+snapshot capture.
+
+Run standalone:
+    python tests/e2e/metrics_scrape_benchmark_test.py --devices 5000 --iterations 10
+
+As a pytest e2e test, METRICS_SCRAPE_BENCH_ITERATIONS controls the repetitions.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pytest
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+
+from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.observability.fleet_metrics import (
+    get_fleet_metrics,
+    reset_fleet_metrics,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FLEET_SIZES = (1_000, 5_000)
+ENVIRONMENTS = ("lab", "staging", "prod")
+MODELS = ("RB5009", "CCR2004", "hAP ax3", "CRS326")
+PAGE_SIZE = 500
+
+
+@dataclass
+class MetricsScrapeBenchmarkResult:
+    """Scrape size and render time for one fleet size and exporter."""
+
+    devices: int
+    mode: str
+    size_bytes: int = 0
+    series: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def p50_latency(self) -> float:
+        return statistics.median(self.latencies) if self.latencies else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "devices": self.devices,
+            "mode": self.mode,
+            "size_bytes": self.size_bytes,
+            "series": self.series,
+            "iterations": len(self.latencies),
+            "p50_ms": round(self.p50_latency * 1000, 3),
+        }
+
+
+def _legacy_registry() -> tuple[CollectorRegistry, dict[str, Any]]:
+    """Device metric families as they were defined with device_id labels."""
+    registry = CollectorRegistry()
+    families = {
+        "requests": Counter(
+            "routeros_mcp_routeros_requests_total",
+            "Total number of RouterOS API requests",
+            ["device_id", "environment", "method", "status"],
+            registry=registry,
+        ),
+        "duration": Histogram(
+            "routeros_mcp_routeros_request_duration_seconds",
+            "Duration of RouterOS API requests in seconds",
+            ["device_id", "method"],
+            buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+            registry=registry,
+        ),
+        "health_checks": Counter(
+            "routeros_mcp_health_checks_total",
+            "Total number of health checks performed",
+            ["device_id", "status"],
+            registry=registry,
+        ),
+        "snapshot_duration": Histogram(
+            "routeros_mcp_snapshot_capture_duration_seconds",
+            "Duration of snapshot capture operations in seconds",
+            ["device_id", "kind"],
+            buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+            registry=registry,
+        ),
+    }
+    for name in ("health_status", "cpu_usage_percent", "memory_usage_percent", "uptime_seconds"):
+        families[name] = Gauge(
+            f"routeros_mcp_device_{name}",
+            f"Device {name}",
+            ["device_id", "environment"],
+            registry=registry,
+        )
+    return registry, families
+
+
+def _populate(count: int, seed: int = 11) -> CollectorRegistry:
+    """Record the same fleet activity in the legacy and current exporters."""
+    rng = random.Random(seed)
+    legacy, families = _legacy_registry()
+    snapshot = get_fleet_metrics()
+    for index in range(count):
+        device_id = f"dev-{index:05d}"
+        environment = rng.choice(ENVIRONMENTS)
+        status = rng.choice(("healthy",) * 9 + ("degraded",))
+        cpu, memory, uptime = rng.uniform(0, 100), rng.uniform(10, 95), rng.randrange(86_400)
+        status_value = 1.0 if status == "healthy" else 0.5
+
+        families["health_checks"].labels(device_id=device_id, status=status).inc()
+        for name, value in (
+            ("health_status", status_value),
+            ("cpu_usage_percent", cpu),
+            ("memory_usage_percent", memory),
+            ("uptime_seconds", uptime),
+        ):
+            families[name].labels(device_id=device_id, environment=environment).set(value)
+        metrics.record_health_check(device_id, environment, status, cpu, memory, uptime)
+        snapshot.record(
+            device_id,
+            environment=environment,
+            status=status,
+            model=rng.choice(MODELS),
+            metrics={
+                "cpu_usage_percent": cpu,
+                "memory_usage_percent": memory,
+                "uptime_seconds": uptime,
+            },
+        )
+
+        for method in ("GET", "POST"):
+            duration = rng.uniform(0.01, 2.0)
+            families["requests"].labels(
+                device_id=device_id, environment=environment, method=method, status="success"
+            ).inc()
+            families["duration"].labels(device_id=device_id, method=method).observe(duration)
+            metrics.record_routeros_request(device_id, environment, method, duration, True)
+
+        capture = rng.uniform(0.2, 5.0)
+        families["snapshot_duration"].labels(device_id=device_id, kind="config").observe(capture)
+        metrics.record_snapshot_capture(device_id, "config", capture)
+    return legacy
+
+
+def _count_series(text: str) -> int:
+    return sum(1 for line in text.splitlines() if line and not line.startswith("#"))
+
+
+def _measure(
+    count: int, mode: str, render: Callable[[], str], iterations: int
+) -> MetricsScrapeBenchmarkResult:
+    result = MetricsScrapeBenchmarkResult(count, mode)
+    text = ""
+    for _ in range(iterations):
+        start = time.perf_counter()
+        text = render()
+        result.latencies.append(time.perf_counter() - start)
+    result.size_bytes = len(text.encode())
+    result.series = _count_series(text)
+    return result
+
+
+def measure_fleet_size(count: int, iterations: int) -> list[MetricsScrapeBenchmarkResult]:
+    """Render every exporter for a fleet of ``count`` devices."""
+    metrics.reset_device_metrics()
+    reset_fleet_metrics()
+    legacy = _populate(count)
+    return [
+        _measure(count, "device_id_labels", lambda: generate_latest(legacy).decode(), iterations),
+        _measure(count, "aggregated", metrics.get_metrics_text, iterations),
+        _measure(
+            count,
+            f"device_page_{PAGE_SIZE}",
+            lambda: metrics.get_device_metrics_text(page=1, page_size=PAGE_SIZE),
+            iterations,
+        ),
+    ]
+
+
+async def run_metrics_scrape_benchmark(
+    iterations: int = 10,
+    sizes: tuple[int, ...] = FLEET_SIZES,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare scrape size and render time of the metrics exporters.
+
+    Args:
+        iterations: Renders per exporter and fleet size
+        sizes: Fleet sizes to measure
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    results: list[MetricsScrapeBenchmarkResult] = []
+    for count in sizes:
+        results.extend(measure_fleet_size(count, iterations))
+
+    summary = {"results": [r.to_dict() for r in results]}
+
+    logger.info("=" * 80)
+    logger.info("METRICS SCRAPE BENCHMARK")
+    for result in results:
+        logger.info(
+            f"{result.devices:6d} devices  {result.mode:18s} "
+            f"{result.size_bytes / 1024:9.1f} KiB  {result.series:7d} series  "
+            f"{result.p50_latency * 1000:8.2f}ms"
+        )
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_metrics_scrape():
+    """/metrics must not grow with the fleet; device pages stay bounded."""
+    iterations = int(os.environ.get("METRICS_SCRAPE_BENCH_ITERATIONS", "3"))
+    summary = await run_metrics_scrape_benchmark(
+        iterations=iterations,
+        output_file=Path("reports/metrics_scrape_benchmark.json"),
+    )
+
+    by_mode: dict[str, list[dict[str, Any]]] = {}
+    for result in summary["results"]:
+        by_mode.setdefault(result["mode"], []).append(result)
+
+    small, large = by_mode["aggregated"]
+    assert large["series"] == small["series"]
+    for legacy, aggregated in zip(by_mode["device_id_labels"], by_mode["aggregated"]):
+        assert aggregated["size_bytes"] * 10 < legacy["size_bytes"]
+    small_page, large_page = by_mode[f"device_page_{PAGE_SIZE}"]
+    assert large_page["series"] == small_page["series"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--devices", type=int, nargs="*", default=list(FLEET_SIZES))
+    parser.add_argument(
+        "--output", type=Path, default=Path("reports/metrics_scrape_benchmark.json")
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_metrics_scrape_benchmark(
+            iterations=args.iterations,
+            sizes=tuple(args.devices),
+            output_file=args.output,
+        )
+    )
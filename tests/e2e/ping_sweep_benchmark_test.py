@@ -0,0 +1,205 @@
+"""Benchmark for multi-device ping sweeps.
+
+Pings every target from every device with a simulated RouterOS REST
+client whose ``/tool/ping`` call takes ``count x interval`` (scaled down).
+Compares:
+
+- sequential: one ping per device/target pair after another (how an
+  agent calling the ``ping`` tool pair by pair runs)
+- sweep: DiagnosticsService.ping_sweep (devices in parallel, up to
+  routeros_max_concurrent_per_device pings per device)
+
+Run standalone:
+    python tests/e2e/ping_sweep_benchmark_test.py --devices 10 --targets 20
+
+As a pytest e2e test, PING_SWEEP_BENCH_DEVICES controls the device count.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.diagnostics import DiagnosticsService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEVICES = 10
+TARGETS = 20
+PING_COUNT = 4
+# Simulated duration of one ping: count x interval, scaled from 1s to 5ms
+PING_SECONDS = PING_COUNT * 0.005
+
+
+@dataclass
+class PingSweepBenchmarkResult:
+    """Wall time and peak concurrency for one sweep mode."""
+
+    mode: str
+    pairs: int
+    elapsed_seconds: float = 0.0
+    peak_per_device: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "pairs": self.pairs,
+            "elapsed_ms": round(self.elapsed_seconds * 1000, 3),
+            "pairs_per_second": round(self.pairs / self.elapsed_seconds, 1)
+            if self.elapsed_seconds
+            else 0.0,
+            "peak_per_device": self.peak_per_device,
+        }
+
+
+class _SimulatedRestClient:
+    """REST client answering pings after a fixed delay, tracking concurrency."""
+
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)
+        self.active = 0
+        self.peak = 0
+
+    async def post(self, path: str, payload: dict[str, Any]) -> list[dict[str, Any]]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(PING_SECONDS)
+            return [
+                {"status": "echo reply", "time": f"{self._rng.uniform(1, 40):.1f}ms"}
+                if self._rng.random() > 0.05
+                else {"status": "timeout"}
+                for _ in range(payload.get("count", PING_COUNT))
+            ]
+        finally:
+            self.active -= 1
+
+    async def close(self) -> None:
+        return None
+
+
+class _SimulatedDeviceService:
+    def __init__(self, clients: dict[str, _SimulatedRestClient]) -> None:
+        self.clients = clients
+
+    async def get_device(self, device_id: str) -> Any:
+        return SimpleNamespace(id=device_id)
+
+    async def get_rest_client(self, device_id: str) -> _SimulatedRestClient:
+        return self.clients[device_id]
+
+
+def _service(device_ids: list[str]) -> tuple[DiagnosticsService, _SimulatedDeviceService]:
+    device_service = _SimulatedDeviceService(
+        {device_id: _SimulatedRestClient(seed) for seed, device_id in enumerate(device_ids)}
+    )
+    service = DiagnosticsService(session=None, settings=Settings())  # type: ignore[arg-type]
+    service.device_service = device_service  # type: ignore[assignment]
+    return service, device_service
+
+
+async def run_ping_sweep_benchmark(
+    devices: int = DEVICES,
+    targets: int = TARGETS,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare pair-by-pair pings with a concurrent ping sweep.
+
+    Args:
+        devices: Source devices
+        targets: Targets pinged from every device
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    device_ids = [f"dev-{n:03d}" for n in range(devices)]
+    target_ips = [f"10.0.{n // 250}.{n % 250 + 1}" for n in range(targets)]
+    pairs = devices * targets
+
+    service, device_service = _service(device_ids)
+    sequential = PingSweepBenchmarkResult("sequential", pairs)
+    start = time.perf_counter()
+    for device_id in device_ids:
+        for target in target_ips:
+            await service.ping(device_id, target, count=PING_COUNT)
+    sequential.elapsed_seconds = time.perf_counter() - start
+    sequential.peak_per_device = max(c.peak for c in device_service.clients.values())
+
+    service, device_service = _service(device_ids)
+    sweep = PingSweepBenchmarkResult("sweep", pairs)
+    start = time.perf_counter()
+    matrix = await service.ping_sweep(device_ids, target_ips, count=PING_COUNT)
+    sweep.elapsed_seconds = time.perf_counter() - start
+    sweep.peak_per_device = max(c.peak for c in device_service.clients.values())
+
+    summary = {
+        "devices": devices,
+        "targets": targets,
+        "limit_per_device": service.settings.routeros_max_concurrent_per_device,
+        "completed_pairs": matrix.completed,
+        "results": [sequential.to_dict(), sweep.to_dict()],
+    }
+
+    logger.info("=" * 80)
+    logger.info("PING SWEEP BENCHMARK")
+    logger.info(f"{devices} devices x {targets} targets, {PING_COUNT} pings per pair")
+    for result in summary["results"]:
+        logger.info(
+            f"{result['mode']:10s} {result['elapsed_ms']:10.1f}ms  "
+            f"{result['pairs_per_second']:8.1f} pairs/s  "
+            f"peak per device {result['peak_per_device']}"
+        )
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_ping_sweep():
+    """A sweep runs pairs concurrently without exceeding the per-device limit."""
+    devices = int(os.environ.get("PING_SWEEP_BENCH_DEVICES", "5"))
+    summary = await run_ping_sweep_benchmark(
+        devices=devices,
+        targets=12,
+        output_file=Path("reports/ping_sweep_benchmark.json"),
+    )
+
+    sequential, sweep = summary["results"]
+    assert summary["completed_pairs"] == devices * 12
+    assert sweep["peak_per_device"] <= summary["limit_per_device"]
+    assert sweep["elapsed_ms"] * 5 < sequential["elapsed_ms"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEVICES)
+    parser.add_argument("--targets", type=int, default=TARGETS)
+    parser.add_argument("--output", type=Path, default=Path("reports/ping_sweep_benchmark.json"))
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_ping_sweep_benchmark(
+            devices=args.devices,
+            targets=args.targets,
+            output_file=args.output,
+        )
+    )
@@ -0,0 +1,256 @@
+"""Benchmark for batched vs per-command SSH execution.
+
+Compares RouterOSSSHClient.execute (one SSH channel and RouterOS CLI session
+per command) with RouterOSSSHClient.execute_many (all commands in one
+session, split on client-generated markers) for the command groups the
+SSH fallbacks issue together:
+- System overview: resource + identity + packages + clock
+- DHCP: server status + leases
+- Wireless: interfaces + registrations
+- Interface stats: monitor-traffic for 8 interfaces
+
+By default an in-process SSH server emulates RouterOS, charging a fixed
+setup cost per channel (CLI session start) and per command. Point it at a
+lab device to measure real numbers.
+
+Run standalone:
+    python tests/e2e/ssh_batch_benchmark_test.py --session-setup-ms 80
+    python tests/e2e/ssh_batch_benchmark_test.py \\
+        --host 192.168.88.1 --username admin --password secret
+
+As a pytest e2e test, SSH_BENCH_ITERATIONS controls the repetitions.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import asyncssh
+import pytest
+
+from routeros_mcp.infra.routeros.ssh_client import RouterOSSSHClient
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BENCH_USERNAME = "bench"
+BENCH_PASSWORD = "bench-secret"
+
+COMMAND_GROUPS: dict[str, list[str]] = {
+    "system_overview": [
+        "/system/resource/print",
+        "/system/identity/print",
+        "/system/package/print",
+        "/system/clock/print",
+    ],
+    "dhcp": ["/ip/dhcp-server/print", "/ip/dhcp-server/lease/print"],
+    "wireless": ["/interface/wireless/print", "/interface/wireless/registration-table/print"],
+    "interface_stats": [f"/interface/monitor-traffic ether{i} once" for i in range(1, 9)],
+}
+
+
+@dataclass
+class BatchBenchmarkResult:
+    """Latency samples for one command group and execution mode."""
+
+    group: str
+    mode: str
+    commands: int
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def p50_latency(self) -> float:
+        return statistics.median(self.latencies) if self.latencies else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "group": self.group,
+            "mode": self.mode,
+            "commands": self.commands,
+            "iterations": len(self.latencies),
+            "p50_ms": round(self.p50_latency * 1000, 2),
+            "min_ms": round(min(self.latencies) * 1000, 2) if self.latencies else 0.0,
+        }
+
+
+class _EmulatedRouterOSServer(asyncssh.SSHServer):
+    """Password-authenticated server accepting the benchmark credentials."""
+
+    def begin_auth(self, username: str) -> bool:
+        return True
+
+    def password_auth_supported(self) -> bool:
+        return True
+
+    def validate_password(self, username: str, password: str) -> bool:
+        return username == BENCH_USERNAME and password == BENCH_PASSWORD
+
+
+def _emulated_process_factory(session_setup_s: float, command_s: float):
+    """Build a process handler interpreting scripts like the RouterOS CLI."""
+
+    async def handle(process: asyncssh.SSHServerProcess) -> None:
+        # Cost of spawning a CLI session for the channel
+        await asyncio.sleep(session_setup_s)
+        for line in (process.command or "").split("\n"):
+            line = line.strip()
+            if line.startswith(':put "'):
+                process.stdout.write(line[len(':put "') : -1] + "\r\n")
+            elif line:
+                await asyncio.sleep(command_s)
+                process.stdout.write(f"# output of {line}\r\n   name: value\r\n")
+        process.exit(0)
+
+    return handle
+
+
+async def _start_emulated_server(session_setup_s: float, command_s: float) -> Any:
+    host_key = asyncssh.generate_private_key("ssh-ed25519")
+    return await asyncssh.create_server(
+        _EmulatedRouterOSServer,
+        "127.0.0.1",
+        0,
+        server_host_keys=[host_key],
+        process_factory=_emulated_process_factory(session_setup_s, command_s),
+    )
+
+
+async def measure_group(
+    client: RouterOSSSHClient, group: str, commands: list[str], iterations: int
+) -> tuple[BatchBenchmarkResult, BatchBenchmarkResult]:
+    """Time a command group per-command and batched over the same connection."""
+    sequential = BatchBenchmarkResult(group, "per_command", len(commands))
+    batched = BatchBenchmarkResult(group, "batched", len(commands))
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        expected = [await client.execute(command) for command in commands]
+        sequential.latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        outputs = await client.execute_many(commands)
+        batched.latencies.append(time.perf_counter() - start)
+
+        assert outputs == expected, f"Batched output differs for {group}"
+
+    return sequential, batched
+
+
+async def run_ssh_batch_benchmark(
+    host: str | None = None,
+    port: int = 22,
+    username: str | None = None,
+    password: str | None = None,
+    iterations: int = 10,
+    session_setup_ms: float = 80.0,
+    command_ms: float = 5.0,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare per-command and batched SSH execution.
+
+    Args:
+        host: RouterOS host (default: in-process emulated server)
+        port: SSH port for a real host
+        username: SSH username for a real host
+        password: SSH password for a real host
+        iterations: Repetitions per command group and mode
+        session_setup_ms: Emulated per-channel CLI session setup cost
+        command_ms: Emulated per-command execution cost
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    server = None
+    if host is None:
+        server = await _start_emulated_server(session_setup_ms / 1000, command_ms / 1000)
+        host = "127.0.0.1"
+        port = server.sockets[0].getsockname()[1]
+        username, password = BENCH_USERNAME, BENCH_PASSWORD
+
+    client = RouterOSSSHClient(host=host, port=port, username=username, password=password)
+    results: list[BatchBenchmarkResult] = []
+    try:
+        for group, commands in COMMAND_GROUPS.items():
+            results.extend(await measure_group(client, group, commands, iterations))
+    finally:
+        await client.close()
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    summary = {
+        "target": "emulated" if server is not None else host,
+        "session_setup_ms": session_setup_ms if server is not None else None,
+        "results": [r.to_dict() for r in results],
+    }
+
+    logger.info("=" * 80)
+    logger.info(f"SSH BATCH BENCHMARK ({summary['target']}, {iterations} iterations)")
+    for sequential, batched in zip(results[::2], results[1::2]):
+        speedup = sequential.p50_latency / batched.p50_latency if batched.p50_latency else 0.0
+        logger.info(
+            f"{sequential.group:16s} {sequential.commands:2d} cmds  "
+            f"per-command p50 {sequential.p50_latency * 1000:8.1f}ms  "
+            f"batched p50 {batched.p50_latency * 1000:8.1f}ms  ({speedup:.1f}x)"
+        )
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_ssh_batch_execution():
+    """Batching must return identical output and beat per-command sessions."""
+    summary = await run_ssh_batch_benchmark(
+        iterations=int(os.environ.get("SSH_BENCH_ITERATIONS", "5")),
+        output_file=Path("reports/ssh_batch_benchmark.json"),
+    )
+
+    by_group: dict[str, dict[str, dict[str, Any]]] = {}
+    for result in summary["results"]:
+        by_group.setdefault(result["group"], {})[result["mode"]] = result
+
+    # One session setup instead of one per command
+    for group, modes in by_group.items():
+        assert modes["batched"]["p50_ms"] < modes["per_command"]["p50_ms"], group
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=22)
+    parser.add_argument("--username", default=None)
+    parser.add_argument("--password", default=None)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--session-setup-ms", type=float, default=80.0)
+    parser.add_argument("--command-ms", type=float, default=5.0)
+    parser.add_argument("--output", type=Path, default=Path("reports/ssh_batch_benchmark.json"))
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_ssh_batch_benchmark(
+            host=args.host,
+            port=args.port,
+            username=args.username,
+            password=args.password,
+            iterations=args.iterations,
+            session_setup_ms=args.session_setup_ms,
+            command_ms=args.command_ms,
+            output_file=args.output,
+        )
+    )
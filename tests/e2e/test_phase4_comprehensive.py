@@ -853,7 +853,7 @@ class TestMetricsAndAudit(unittest.TestCase):
             expected_metrics = [
                 "routeros_mcp_tool_calls_total",
                 "routeros_mcp_tool_duration_seconds",
-                "routeros_mcp_device_health_status",
+                "routeros_mcp_fleet_devices",
                 "routeros_mcp_plans_created_total",
             ]
             
@@ -0,0 +1,225 @@
+"""Benchmark for the topology graph: incremental updates and queries.
+
+Builds a simulated fleet (a core router, access switches hanging off it by
+/ip/neighbor-discovered uplinks, a /30 per uplink, a LAN bridge and a few
+discovered neighbours per access switch) and measures:
+
+- build: feeding every device into an empty graph
+- rebuild: what a device change costs without incremental updates (a new
+  graph from every device's facts)
+- update: TopologyGraph.update_device for one changed device
+- path / blast_radius / connected: query latency
+
+Run standalone:
+    python tests/e2e/topology_benchmark_test.py --devices 1000
+
+As a pytest e2e test, TOPOLOGY_BENCH_DEVICES controls the device count.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from routeros_mcp.infra.routeros.topology import TopologyGraph
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEVICES = 1000
+NEIGHBORS_PER_DEVICE = 8
+QUERIES = 200
+
+
+@dataclass
+class TopologyBenchmarkResult:
+    """Latency of one graph operation."""
+
+    operation: str
+    calls: int
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "calls": self.calls,
+            "elapsed_ms": round(self.elapsed_seconds * 1000, 3),
+            "ms_per_call": round(self.elapsed_seconds / self.calls * 1000, 4)
+            if self.calls
+            else 0.0,
+        }
+
+
+def _mac(device: int, port: int) -> str:
+    return f"02:00:{device >> 8:02X}:{device & 0xFF:02X}:00:{port:02X}"
+
+
+def _fleet_facts(devices: int, neighbors_per_device: int) -> dict[str, dict[str, Any]]:
+    """update_device keyword arguments per device; dev-0000 is the core router."""
+    core: dict[str, Any] = {
+        "name": "core",
+        "interfaces": [],
+        "bridge_ports": [],
+        "ip_addresses": [],
+        "neighbors": [],
+    }
+    facts = {"dev-0000": core}
+    for device in range(1, devices):
+        uplink = f"sfp{device}"
+        subnet = f"10.{device >> 6}.{(device & 0x3F) * 4}"
+        core["interfaces"].append({"name": uplink, "mac_address": _mac(0, device % 250)})
+        core["ip_addresses"].append({"address": f"{subnet}.1/30", "interface": uplink})
+        core["neighbors"].append(
+            {
+                "interface": uplink,
+                "mac_address": _mac(device, 1),
+                "interface_name": "ether1",
+            }
+        )
+        facts[f"dev-{device:04d}"] = {
+            "name": f"access-{device}",
+            "interfaces": [
+                {"name": "ether1", "mac_address": _mac(device, 1)},
+                {"name": "bridge", "mac_address": _mac(device, 2)},
+                *({"name": f"ether{p}", "mac_address": _mac(device, p)} for p in range(2, 10)),
+            ],
+            "bridge_ports": [{"interface": f"ether{p}", "bridge": "bridge"} for p in range(2, 10)],
+            "ip_addresses": [
+                {"address": f"{subnet}.2/30", "interface": "ether1"},
+                {
+                    "address": f"172.{16 + (device >> 8)}.{device & 0xFF}.1/24",
+                    "interface": "bridge",
+                },
+            ],
+            "neighbors": [
+                {"interface": f"ether{2 + n % 8},bridge", "mac_address": f"AA:{device:06X}:{n:04X}"}
+                for n in range(neighbors_per_device)
+            ],
+        }
+    return facts
+
+
+def _timed(operation: str, calls: int, func) -> TopologyBenchmarkResult:
+    result = TopologyBenchmarkResult(operation, calls)
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    result.elapsed_seconds = time.perf_counter() - start
+    return result
+
+
+async def run_topology_benchmark(
+    devices: int = DEVICES,
+    neighbors_per_device: int = NEIGHBORS_PER_DEVICE,
+    queries: int = QUERIES,
+    output_file: Path | None = None,
+) -> dict[str, Any]:
+    """Compare full rebuilds with incremental updates and time graph queries.
+
+    Args:
+        devices: Simulated devices (one core router plus access switches)
+        neighbors_per_device: Discovered neighbours per access switch
+        queries: Calls per query type
+        output_file: Optional path to save results JSON
+
+    Returns:
+        Benchmark summary dictionary
+    """
+    facts = _fleet_facts(devices, neighbors_per_device)
+    access = sorted(facts)[1:]
+    rng = random.Random(7)
+    pairs = [(rng.choice(access), rng.choice(access)) for _ in range(queries)]
+
+    def build() -> TopologyGraph:
+        graph = TopologyGraph()
+        for device_id, device_facts in facts.items():
+            graph.update_device(device_id, **device_facts)
+        return graph
+
+    build_result = _timed("build", 1, lambda _: build())
+    graph = build()
+    rebuild = _timed("rebuild", 3, lambda _: build())
+
+    def change_device(i: int) -> None:
+        device_id = access[i % len(access)]
+        neighbors = facts[device_id]["neighbors"]
+        graph.update_device(device_id, neighbors=neighbors[:-1] if i % 2 == 0 else neighbors)
+
+    results = [
+        build_result,
+        rebuild,
+        _timed("update", queries, change_device),
+        _timed("path", queries, lambda i: graph.path(*pairs[i])),
+        _timed("blast_radius", queries, lambda i: graph.blast_radius(f"{pairs[i][0]}:bridge")),
+        _timed("connected", queries, lambda i: graph.connected(pairs[i][0], depth=2)),
+    ]
+
+    summary = {
+        "devices": devices,
+        "neighbors_per_device": neighbors_per_device,
+        "graph": graph.get_stats(),
+        "results": [result.to_dict() for result in results],
+    }
+    summary["graph"].pop("last_update")
+
+    logger.info("=" * 80)
+    logger.info("TOPOLOGY GRAPH BENCHMARK")
+    logger.info(
+        f"{devices} devices, {sum(summary['graph']['nodes'].values())} nodes, "
+        f"{summary['graph']['edges']} edges"
+    )
+    for result in summary["results"]:
+        logger.info(f"{result['operation']:13s} {result['ms_per_call']:12.4f} ms/call")
+    logger.info("=" * 80)
+
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info(f"Results saved to {output_file}")
+
+    return summary
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_benchmark_topology_graph():
+    """Incremental updates beat rebuilds; queries answer in milliseconds."""
+    devices = int(os.environ.get("TOPOLOGY_BENCH_DEVICES", "300"))
+    summary = await run_topology_benchmark(
+        devices=devices,
+        queries=100,
+        output_file=Path("reports/topology_benchmark.json"),
+    )
+
+    timings = {result["operation"]: result["ms_per_call"] for result in summary["results"]}
+    assert summary["graph"]["devices"] == devices
+    assert timings["update"] * 20 < timings["rebuild"]
+    assert timings["path"] < 50
+    assert timings["blast_radius"] < 50
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEVICES)
+    parser.add_argument("--neighbors", type=int, default=NEIGHBORS_PER_DEVICE)
+    parser.add_argument("--queries", type=int, default=QUERIES)
+    parser.add_argument("--output", type=Path, default=Path("reports/topology_benchmark.json"))
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_topology_benchmark(
+            devices=args.devices,
+            neighbors_per_device=args.neighbors,
+            queries=args.queries,
+            output_file=args.output,
+        )
+    )
@@ -10,6 +10,12 @@ from fastapi.testclient import TestClient
 from routeros_mcp.api.http import create_http_app
 
 
+async def _async_iter(items):
+    """Yield items from an async generator (stands in for streamed rows)."""
+    for item in items:
+        yield item
+
+
 def create_mock_dependency(mock_service):
     """Create a dependency override that returns the mock service."""
 
@@ -124,6 +130,25 @@ class TestDevicesList:
         assert data["devices"][0]["environment"] == "lab"
         assert data["devices"][0]["status"] == "online"
 
+    def test_delete_device_drops_device_metrics(self, app, mock_device_service):
+        """Deleting a device removes its per-device series and fleet snapshot row."""
+        from routeros_mcp.api.admin import get_device_service
+        from routeros_mcp.infra.observability import metrics
+        from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
+
+        metrics.record_routeros_request("dev-1", "lab", "GET", duration=0.05, success=True)
+        get_fleet_metrics().record("dev-1", environment="lab", status="healthy", metrics={})
+
+        mock_device_service.get_device = AsyncMock(return_value=SimpleNamespace(name="router-1"))
+        mock_device_service.session = MagicMock(get=AsyncMock(return_value=None))
+        app.dependency_overrides[get_device_service] = create_mock_dependency(mock_device_service)
+
+        client = TestClient(app)
+        response = client.delete("/admin/api/admin/devices/dev-1")
+        assert response.status_code == 200
+        assert "dev-1" not in get_fleet_metrics()
+        assert "dev-1" not in metrics.get_device_metrics_text()
+
     def test_list_devices_offline(self, app, mock_device_service):
         """Test listing devices with offline status."""
         from routeros_mcp.api.admin import get_device_service
@@ -533,6 +558,23 @@ class TestAuditEvents:
         assert call_kwargs["page"] == 2
         assert call_kwargs["page_size"] == 50
 
+    def test_list_audit_events_cursor(self, app, mock_audit_service):
+        """Test audit events keyset cursor is passed through and validated."""
+        from routeros_mcp.api.admin import get_audit_service
+
+        app.dependency_overrides[get_audit_service] = create_mock_dependency(mock_audit_service)
+
+        client = TestClient(app)
+        response = client.get("/admin/api/audit/events", params={"cursor": "abc"})
+        assert response.status_code == 200
+        call_kwargs = mock_audit_service.list_events.call_args[1]
+        assert call_kwargs["cursor"] == "abc"
+
+        mock_audit_service.list_events.side_effect = ValueError("Invalid audit cursor: bad")
+        response = client.get("/admin/api/audit/events", params={"cursor": "bad"})
+        assert response.status_code == 400
+        assert "Invalid audit cursor" in response.json()["detail"]
+
     def test_export_audit_events_csv(self, app, mock_audit_service):
         """Test exporting audit events to CSV."""
         from routeros_mcp.api.admin import get_audit_service
@@ -560,13 +602,7 @@ class TestAuditEvents:
             }
         ]
 
-        mock_audit_service.list_events.return_value = {
-            "events": mock_events,
-            "total": 1,
-            "page": 1,
-            "page_size": 10000,
-            "total_pages": 1,
-        }
+        mock_audit_service.stream_events = MagicMock(return_value=_async_iter(mock_events))
 
         app.dependency_overrides[get_audit_service] = create_mock_dependency(mock_audit_service)
 
@@ -583,6 +619,73 @@ class TestAuditEvents:
         assert "user1@example.com" in content
         assert "device_create" in content
 
+    def test_export_audit_events_ndjson_gzip(self, app, mock_audit_service):
+        """Test streaming audit export as gzip-compressed NDJSON."""
+        import gzip
+        import json
+
+        from routeros_mcp.api.admin import get_audit_service
+
+        events = [{"id": f"evt-{i:03d}", "success": True} for i in range(1200)]
+        mock_audit_service.stream_events = MagicMock(return_value=_async_iter(events))
+        app.dependency_overrides[get_audit_service] = create_mock_dependency(mock_audit_service)
+
+        client = TestClient(app)
+        response = client.get(
+            "/admin/api/audit/events/export",
+            params={"format": "ndjson", "compression": "gzip", "tool_name": "dns/update"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in response.headers["content-disposition"]
+
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [e["id"] for e in events]
+        assert mock_audit_service.stream_events.call_args[1]["tool_name"] == "dns/update"
+
+    def test_export_audit_events_streams_before_dependency_cleanup(self, app, mock_audit_service):
+        """Test the audit service's session stays open while the export body streams."""
+        import json
+
+        from routeros_mcp.api.admin import get_audit_service
+
+        session_open = False
+
+        async def stream():
+            for i in range(3):
+                assert session_open, "session closed before the export finished streaming"
+                yield {"id": f"evt-{i:03d}", "success": True}
+
+        async def dependency():
+            nonlocal session_open
+            session_open = True
+            yield mock_audit_service
+            session_open = False
+
+        mock_audit_service.stream_events = MagicMock(return_value=stream())
+        app.dependency_overrides[get_audit_service] = dependency
+
+        client = TestClient(app)
+        response = client.get("/admin/api/audit/events/export", params={"format": "ndjson"})
+        assert response.status_code == 200
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == [
+            "evt-000",
+            "evt-001",
+            "evt-002",
+        ]
+
+    def test_export_audit_events_invalid_format(self, app, mock_audit_service):
+        """Test export rejects unknown formats and compressions."""
+        from routeros_mcp.api.admin import get_audit_service
+
+        app.dependency_overrides[get_audit_service] = create_mock_dependency(mock_audit_service)
+
+        client = TestClient(app)
+        response = client.get("/admin/api/audit/events/export", params={"format": "xml"})
+        assert response.status_code == 400
+        response = client.get("/admin/api/audit/events/export", params={"compression": "br"})
+        assert response.status_code == 400
+
     def test_get_audit_filters(self, app, mock_audit_service):
         """Test getting available audit filter options."""
         from routeros_mcp.api.admin import get_audit_service
@@ -1,11 +1,49 @@
 """Tests for audit service."""
 
+import importlib.util
+from pathlib import Path
+
 import pytest
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from routeros_mcp.domain.services.audit import AuditService
+from routeros_mcp.domain.services.audit import (
+    AuditService,
+    decode_audit_cursor,
+    encode_audit_cursor,
+    parse_audit_search,
+    reset_audit_count_cache,
+)
 from routeros_mcp.infra.db.models import AuditEvent, Base
 
+# Load the audit search migration to install the SQLite FTS5 index in tests
+_migration_path = (
+    Path(__file__).parents[4] / "alembic" / "versions" / "40_add_audit_search_index.py"
+)
+_spec = importlib.util.spec_from_file_location("migration_40", _migration_path)
+migration_40 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migration_40)
+
+
+def _event(event_id: str, **overrides) -> AuditEvent:
+    """Build an audit event with sensible defaults."""
+    values = {
+        "id": event_id,
+        "timestamp": datetime.now(UTC),
+        "user_sub": "user-1",
+        "user_email": "user1@example.com",
+        "user_role": "admin",
+        "device_id": "dev-001",
+        "environment": "lab",
+        "action": "WRITE",
+        "tool_name": "device_create",
+        "tool_tier": "fundamental",
+        "result": "SUCCESS",
+        "meta": {},
+    }
+    values.update(overrides)
+    return AuditEvent(**values)
+
 
 @pytest.fixture
 async def db_session() -> AsyncSession:
@@ -190,6 +228,111 @@ async def test_list_events_pagination(initialize_session_manager, db_session):
     assert result["page"] == 3
 
 
+@pytest.mark.asyncio
+async def test_list_events_total_is_cached_per_filter(initialize_session_manager, db_session):
+    """Offset totals are reused per filter and labelled approximate."""
+    for i in range(25):
+        db_session.add(_event(f"evt-{i:03d}", device_id="dev-001" if i % 5 else "dev-002"))
+    await db_session.commit()
+
+    service = AuditService(db_session)
+
+    first = await service.list_events(page=1, page_size=10)
+    assert first["total"] == 25
+    assert first["total_approximate"] is True
+
+    # New events do not trigger a recount within the cache TTL
+    for i in range(25, 30):
+        db_session.add(_event(f"evt-{i:03d}"))
+    await db_session.commit()
+
+    reloaded = await service.list_events(page=1, page_size=10)
+    assert reloaded["total"] == 25
+    assert reloaded["total_approximate"] is True
+
+    # Each filter combination has its own count
+    filtered = await service.list_events(page=1, page_size=2, device_id="dev-002")
+    assert filtered["total"] == 5
+    assert filtered["total_approximate"] is True
+
+    # A page that reaches the end of the results knows the exact total
+    last = await service.list_events(page=3, page_size=10)
+    assert len(last["events"]) == 10
+    assert last["total"] == 30
+    assert last["total_approximate"] is False
+
+    reset_audit_count_cache()
+    recounted = await service.list_events(page=1, page_size=10)
+    assert recounted["total"] == 30
+
+
+@pytest.mark.asyncio
+async def test_list_events_keyset_cursor(initialize_session_manager, db_session):
+    """Test cursor pagination walks all events once, including timestamp ties."""
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    for i in range(25):
+        event = AuditEvent(
+            id=f"evt-{i:03d}",
+            # Pairs of events share a timestamp so the id tiebreaker matters
+            timestamp=base + timedelta(seconds=i // 2),
+            user_sub="user-1",
+            user_email="user1@example.com",
+            user_role="admin",
+            user_id="user-1" if i % 5 else "user-2",
+            device_id="dev-001",
+            environment="lab",
+            action="WRITE",
+            tool_name="device_create",
+            tool_tier="fundamental",
+            result="SUCCESS",
+            meta={},
+        )
+        db_session.add(event)
+
+    await db_session.commit()
+
+    service = AuditService(db_session)
+
+    first_page = await service.list_events(page_size=10)
+    assert first_page["total"] == 25
+    assert first_page["page"] == 1
+
+    seen = [event["id"] for event in first_page["events"]]
+    cursor = first_page["next_cursor"]
+    while cursor is not None:
+        result = await service.list_events(page_size=10, cursor=cursor)
+        # Cursor pages carry neither a (stale) total nor a page number
+        assert "total" not in result
+        assert "page" not in result
+        seen.extend(event["id"] for event in result["events"])
+        cursor = result["next_cursor"]
+
+    assert seen == [f"evt-{i:03d}" for i in reversed(range(25))]
+
+    # Filters apply to keyset pages as well
+    first = await service.list_events(page_size=2, user_id="user-2")
+    second = await service.list_events(page_size=2, user_id="user-2", cursor=first["next_cursor"])
+    assert [e["id"] for e in first["events"] + second["events"]] == [
+        "evt-020",
+        "evt-015",
+        "evt-010",
+        "evt-005",
+    ]
+    assert second["next_cursor"] is not None
+
+    with pytest.raises(ValueError):
+        await service.list_events(cursor="not-a-cursor")
+
+
+def test_audit_cursor_roundtrip():
+    """Test cursor encoding round-trips timestamp and id."""
+    timestamp = datetime(2026, 1, 1, 12, 30, tzinfo=UTC)
+    cursor = encode_audit_cursor(timestamp, "evt-001")
+
+    assert "=" not in cursor
+    assert decode_audit_cursor(cursor) == (timestamp, "evt-001")
+
+
 @pytest.mark.asyncio
 async def test_get_unique_devices(initialize_session_manager, db_session):
     """Test getting unique device IDs."""
@@ -410,6 +553,149 @@ async def test_list_events_search_filter(initialize_session_manager, db_session)
     assert len(result["events"]) == 0
 
 
+@pytest.mark.asyncio
+async def test_stream_events_matches_list_events(initialize_session_manager, db_session):
+    """Test streaming iterates every matching event in list order."""
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    db_session.add_all(
+        [
+            _event(
+                f"evt-{i:03d}",
+                timestamp=base + timedelta(minutes=i),
+                device_id="dev-001" if i % 2 else "dev-002",
+            )
+            for i in range(30)
+        ]
+    )
+    await db_session.commit()
+
+    service = AuditService(db_session)
+
+    streamed = [e async for e in service.stream_events(device_id="dev-001", batch_size=4)]
+    listed = await service.list_events(device_id="dev-001", page_size=100)
+    assert streamed == listed["events"]
+    assert len(streamed) == 15
+
+    limited = [e async for e in service.stream_events(limit=3)]
+    assert [e["id"] for e in limited] == ["evt-029", "evt-028", "evt-027"]
+
+
+def test_parse_audit_search_field_scoped_terms():
+    """Test search parsing splits field-scoped values from free text."""
+    parsed = parse_audit_search('tool:firewall/* DEVICE:dev-001 user:"ops@example.com" rule added')
+
+    assert parsed.tool == ["firewall/*"]
+    assert parsed.device == ["dev-001"]
+    assert parsed.user == ["ops@example.com"]
+    assert parsed.terms == ["rule", "added"]
+
+    # Unknown prefixes and unbalanced quotes degrade to free text
+    parsed = parse_audit_search('url:http://x "unterminated')
+    assert parsed.terms == ["url:http://x", '"unterminated']
+
+
+@pytest.mark.asyncio
+async def test_list_events_field_scoped_search(initialize_session_manager, db_session):
+    """Test tool:/device:/user: search terms filter on indexed columns."""
+    db_session.add_all(
+        [
+            _event("evt-001", tool_name="firewall/add-rule", device_id="dev-001"),
+            _event("evt-002", tool_name="firewall/list-rules", device_id="dev-002"),
+            _event(
+                "evt-003",
+                tool_name="dns/update-servers",
+                device_id="dev-001",
+                user_id="ops",
+                user_email="ops@example.com",
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    service = AuditService(db_session)
+
+    result = await service.list_events(search="tool:firewall/*")
+    assert {e["id"] for e in result["events"]} == {"evt-001", "evt-002"}
+
+    result = await service.list_events(search="tool:firewall/* device:dev-001")
+    assert [e["id"] for e in result["events"]] == ["evt-001"]
+
+    result = await service.list_events(search="user:ops@example.com")
+    assert [e["id"] for e in result["events"]] == ["evt-003"]
+
+    # Literal wildcard characters in a prefix are escaped
+    result = await service.list_events(search="tool:firewall_*")
+    assert result["events"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_events_full_text_search_index(initialize_session_manager, db_session):
+    """Test free-text search through the SQLite FTS5 index from migration 40."""
+    # Existing rows are backfilled when the index is created
+    db_session.add(
+        _event("evt-001", meta={"parameters": {"name": "test-router"}}),
+    )
+    await db_session.commit()
+
+    for statement in migration_40._SQLITE_UPGRADE:
+        await db_session.execute(text(statement))
+    await db_session.commit()
+
+    # New rows are indexed by the insert trigger
+    db_session.add_all(
+        [
+            _event(
+                "evt-002",
+                tool_name="device_test",
+                result="FAILURE",
+                error_message="Connection timeout to device",
+            ),
+            _event(
+                "evt-003",
+                tool_name="firewall/add-rule",
+                meta={"result_summary": "Retrieved firewall configuration"},
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    service = AuditService(db_session)
+    assert await service._has_search_index("sqlite") is True
+
+    result = await service.list_events(search="timeout")
+    assert [e["id"] for e in result["events"]] == ["evt-002"]
+
+    # Index rows are keyed on the event id, not the unstable audit_events rowid
+    indexed = await db_session.execute(text("SELECT event_id FROM audit_events_fts"))
+    assert sorted(indexed.scalars()) == ["evt-001", "evt-002", "evt-003"]
+
+    # Whole-word matching: a word prefix does not match
+    result = await service.list_events(search="time")
+    assert result["events"] == []
+
+    result = await service.list_events(search="test-router")
+    assert [e["id"] for e in result["events"]] == ["evt-001"]
+
+    result = await service.list_events(search="tool:firewall/* configuration")
+    assert [e["id"] for e in result["events"]] == ["evt-003"]
+
+    result = await service.list_events(search="Connection device")
+    assert [e["id"] for e in result["events"]] == ["evt-002"]
+
+    result = await service.list_events(search='"quoted""term"')
+    assert result["events"] == []
+
+    # Update and delete triggers keep the index in sync
+    event = await db_session.get(AuditEvent, "evt-002")
+    event.error_message = "Authentication failed"
+    await db_session.commit()
+    assert (await service.list_events(search="timeout"))["events"] == []
+
+    await db_session.delete(await db_session.get(AuditEvent, "evt-003"))
+    await db_session.commit()
+    assert (await service.list_events(search="configuration"))["events"] == []
+
+
 @pytest.mark.asyncio
 async def test_list_events_filter_by_user_id(initialize_session_manager, db_session):
     """Test filtering audit events by user_id (Phase 5)."""
@@ -0,0 +1,362 @@
+"""Tests for portable health check rollups (1m/1h/1d downsampling)."""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.health_rollup import (
+    ROLLUP_TIERS,
+    HealthRollupService,
+    select_bucket_seconds,
+)
+from routeros_mcp.infra.db.models import Base, Device, HealthCheck, HealthCheckRollup
+from routeros_mcp.infra.jobs.runner import run_health_rollup_job
+from routeros_mcp.mcp.errors import MCPError
+from routeros_mcp.mcp_resources import device as device_resources
+from routeros_mcp.mcp_tools import system as system_tools
+
+from tests.unit.mcp_tools_test_utils import DummyMCP
+
+NOW = datetime(2026, 1, 14, 12, 0, 30, tzinfo=UTC)
+
+
+@pytest.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    yield maker
+    await engine.dispose()
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings(environment="lab")
+
+
+def _health_check(device_id: str, ts: datetime, cpu: float, mem_pct: float) -> HealthCheck:
+    return HealthCheck(
+        id=f"hc-{device_id}-{int(ts.timestamp())}",
+        device_id=device_id,
+        timestamp=ts,
+        status="healthy",
+        cpu_usage_percent=cpu,
+        memory_used_bytes=int(mem_pct * 10),
+        memory_total_bytes=1000,
+        uptime_seconds=int(ts.timestamp()) - 1_700_000_000,
+    )
+
+
+@pytest.fixture
+async def seeded(session_maker):
+    async with session_maker() as session:
+        session.add(
+            Device(
+                id="dev-1",
+                name="router-1",
+                management_ip="10.0.0.1",
+                management_port=443,
+                environment="lab",
+                status="healthy",
+                tags={},
+                allow_advanced_writes=False,
+                allow_professional_workflows=False,
+            )
+        )
+        # Two samples in 11:58, two in 11:59, one sample 30 days old
+        session.add_all(
+            [
+                _health_check("dev-1", NOW - timedelta(seconds=150), 10.0, 40.0),
+                _health_check("dev-1", NOW - timedelta(seconds=100), 30.0, 60.0),
+                _health_check("dev-1", NOW - timedelta(seconds=80), 50.0, 50.0),
+                _health_check("dev-1", NOW - timedelta(seconds=40), 70.0, 70.0),
+                _health_check("dev-1", NOW - timedelta(days=30), 99.0, 99.0),
+            ]
+        )
+        await session.commit()
+    return session_maker
+
+
+async def test_build_rollups_aggregates_minute_buckets(seeded, settings):
+    async with seeded() as session:
+        service = HealthRollupService(session, settings)
+        written = await service.build_rollups(now=NOW)
+
+        assert written["1m"] == 2
+        assert written["1h"] == 1
+        assert written["1d"] == 1
+
+        rows = (
+            (
+                await session.execute(
+                    select(HealthCheckRollup)
+                    .where(HealthCheckRollup.resolution == "1m")
+                    .order_by(HealthCheckRollup.bucket_start)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert [r.sample_count for r in rows] == [2, 2]
+        assert rows[0].cpu_min == 10.0
+        assert rows[0].cpu_max == 30.0
+        assert rows[0].cpu_avg == pytest.approx(20.0)
+        assert rows[1].memory_avg == pytest.approx(60.0)
+
+        hourly = (
+            await session.execute(
+                select(HealthCheckRollup).where(HealthCheckRollup.resolution == "1h")
+            )
+        ).scalar_one()
+        assert hourly.sample_count == 4
+        assert hourly.cpu_min == 10.0
+        assert hourly.cpu_max == 70.0
+        assert hourly.cpu_avg == pytest.approx(40.0)
+
+
+async def test_build_rollups_is_incremental_and_idempotent(seeded, settings):
+    async with seeded() as session:
+        service = HealthRollupService(session, settings)
+        await service.build_rollups(now=NOW)
+
+        session.add(_health_check("dev-1", NOW - timedelta(seconds=35), 90.0, 80.0))
+        await session.commit()
+
+        await service.build_rollups(now=NOW)
+        await service.build_rollups(now=NOW)
+
+        minute_rows = (
+            await session.execute(
+                select(func.count()).where(HealthCheckRollup.resolution == "1m")
+            )
+        ).scalar_one()
+        hourly = (
+            await session.execute(
+                select(HealthCheckRollup).where(HealthCheckRollup.resolution == "1h")
+            )
+        ).scalar_one()
+
+        assert minute_rows == 2
+        assert hourly.sample_count == 5
+        assert hourly.cpu_max == 90.0
+
+
+async def test_apply_retention_keeps_raw_rows_by_default(seeded, settings):
+    async with seeded() as session:
+        service = HealthRollupService(session, settings)
+        await service.build_rollups(now=NOW)
+        deleted = await service.apply_retention(now=NOW)
+
+        assert deleted["raw"] == 0
+        remaining = (await session.execute(select(func.count(HealthCheck.id)))).scalar_one()
+        assert remaining == 5
+
+
+async def test_apply_retention_deletes_expired_raw_rows(seeded):
+    async with seeded() as session:
+        service = HealthRollupService(
+            session, Settings(environment="lab", health_raw_retention_days=7)
+        )
+        await service.build_rollups(now=NOW)
+        deleted = await service.apply_retention(now=NOW)
+
+        assert deleted["raw"] == 1
+        remaining = (await session.execute(select(func.count(HealthCheck.id)))).scalar_one()
+        assert remaining == 4
+
+
+def test_select_resolution_prefers_coarser_tiers_for_long_windows(settings):
+    service = HealthRollupService(None, settings)  # type: ignore[arg-type]
+
+    assert service.select_resolution(NOW - timedelta(hours=6), NOW, now=NOW).name == "1m"
+    assert service.select_resolution(NOW - timedelta(days=7), NOW, now=NOW).name == "1h"
+    assert service.select_resolution(NOW - timedelta(days=90), NOW, now=NOW).name == "1d"
+    # Window beyond 1m retention falls through to hourly even if point budget is huge
+    assert (
+        service.select_resolution(
+            NOW - timedelta(days=20), NOW - timedelta(days=19), max_points=10_000, now=NOW
+        ).name
+        == "1h"
+    )
+    assert [t.name for t in ROLLUP_TIERS] == ["1m", "1h", "1d"]
+
+
+async def test_get_health_history_returns_selected_tier(seeded, settings):
+    async with seeded() as session:
+        service = HealthRollupService(session, settings)
+        await service.build_rollups(now=NOW)
+
+        history = await service.get_health_history(
+            "dev-1", start=NOW - timedelta(minutes=5), end=NOW, resolution="1m"
+        )
+
+    assert history["resolution"] == "1m"
+    assert history["count"] == 2
+    assert history["points"][0]["cpu"]["max"] == 30.0
+
+    with pytest.raises(ValueError):
+        await HealthRollupService(None, settings).get_health_history(  # type: ignore[arg-type]
+            "dev-1", start=NOW, resolution="5m"
+        )
+
+
+async def test_run_health_rollup_job(seeded, settings):
+    class Factory:
+        @asynccontextmanager
+        async def session(self):
+            async with seeded() as session:
+                yield session
+
+    summary = await run_health_rollup_job(Factory(), settings)
+    assert summary["status"] == "success"
+    assert set(summary["buckets_written"]) == {"1m", "1h", "1d"}
+
+    disabled = await run_health_rollup_job(
+        Factory(), Settings(environment="lab", health_rollup_enabled=False)
+    )
+    assert disabled == {"status": "skipped", "reason": "disabled"}
+
+
+async def test_device_health_rollups_resource(seeded, settings):
+    class Factory:
+        @asynccontextmanager
+        async def session(self):
+            async with seeded() as session:
+                yield session
+
+    mcp = DummyMCP()
+    device_resources.register_device_resources(mcp, Factory(), settings)
+    rollups_func = mcp.resources["device://{device_id}/health/rollups/{window}"]
+
+    payload = json.loads(await rollups_func("dev-1", "7d"))
+    assert payload["device_id"] == "dev-1"
+    assert payload["resolution"] == "1h"
+    assert payload["window"] == "7d"
+
+    with pytest.raises(MCPError):
+        await rollups_func("dev-1", "bogus")
+    with pytest.raises(MCPError):
+        await rollups_func("missing", "1d")
+
+
+async def test_get_health_series_is_column_oriented_with_p95(seeded, settings):
+    bucket_start = datetime(2026, 1, 14, 11, 50, tzinfo=UTC)
+    async with seeded() as session:
+        # 20 samples in one minute: cpu 1..20 -> nearest-rank p95 is the 19th value
+        session.add_all(
+            [
+                _health_check("dev-1", bucket_start + timedelta(seconds=i), float(i), 50.0)
+                for i in range(1, 21)
+            ]
+        )
+        # Sample without metrics must not shift the percentile rank
+        unknown = _health_check("dev-1", bucket_start + timedelta(seconds=30), 0.0, 0.0)
+        unknown.cpu_usage_percent = None
+        unknown.memory_total_bytes = None
+        session.add(unknown)
+        await session.commit()
+
+        service = HealthRollupService(session, settings)
+        series = await service.get_health_series(
+            "dev-1", start=NOW - timedelta(minutes=15), end=NOW, bucket_seconds=60
+        )
+
+    columns = series["columns"]
+    assert series["bucket_seconds"] == 60
+    assert series["count"] == 3
+    assert columns["bucket_start"] == [
+        "2026-01-14T11:50:00+00:00",
+        "2026-01-14T11:58:00+00:00",
+        "2026-01-14T11:59:00+00:00",
+    ]
+    assert columns["sample_count"] == [21, 2, 2]
+    assert columns["cpu_min"] == [1.0, 10.0, 50.0]
+    assert columns["cpu_avg"] == [10.5, 20.0, 60.0]
+    assert columns["cpu_p95"] == [19.0, 30.0, 70.0]
+    assert columns["memory_p95"] == [50.0, 60.0, 70.0]
+    assert all(len(values) == 3 for values in columns.values())
+
+    with pytest.raises(ValueError):
+        await HealthRollupService(None, settings).get_health_series(  # type: ignore[arg-type]
+            "dev-1", start=NOW, bucket_seconds=0
+        )
+
+
+def test_select_bucket_seconds_bounds_point_count():
+    assert select_bucket_seconds(NOW - timedelta(hours=6), NOW) == 60
+    assert select_bucket_seconds(NOW - timedelta(days=1), NOW) == 300
+    assert select_bucket_seconds(NOW - timedelta(days=7), NOW) == 3600
+    assert select_bucket_seconds(NOW - timedelta(days=3650), NOW) == 86400
+
+
+async def test_device_health_history_resource_and_tool(seeded, settings, monkeypatch):
+    class Factory:
+        @asynccontextmanager
+        async def session(self):
+            async with seeded() as session:
+                yield session
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return NOW
+
+    monkeypatch.setattr(device_resources, "datetime", FrozenDatetime)
+    monkeypatch.setattr(system_tools, "datetime", FrozenDatetime)
+
+    mcp = DummyMCP()
+    device_resources.register_device_resources(mcp, Factory(), settings)
+    history_func = mcp.resources["device://{device_id}/health/history{?window,bucket}"]
+
+    payload = json.loads(await history_func("dev-1", "1h", "1m"))
+    assert payload["device_name"] == "router-1"
+    assert payload["columns"]["cpu_max"] == [30.0, 70.0]
+
+    with pytest.raises(MCPError):
+        await history_func("dev-1", "bogus", "auto")
+    with pytest.raises(MCPError):
+        await history_func("missing", "1h", "auto")
+
+    monkeypatch.setattr(system_tools, "get_session_factory", lambda _settings: Factory())
+    mcp = DummyMCP()
+    system_tools.register_system_tools(mcp, settings)
+    tool = mcp.tools["get_health_history"]
+
+    result = await tool("dev-1", window="1h")
+    assert not result["isError"]
+    assert result["_meta"]["bucket_seconds"] == 60
+    assert result["_meta"]["columns"]["cpu_p95"] == [30.0, 70.0]
+    assert "peak 70.0%" in result["content"][0]["text"]
+
+    invalid = await tool("dev-1", window="1h", bucket="nope")
+    assert invalid["isError"]
+
+
+async def test_get_health_series_beyond_raw_retention_uses_rollups(seeded):
+    settings = Settings(environment="lab", health_raw_retention_days=1)
+    async with seeded() as session:
+        service = HealthRollupService(session, settings)
+        await service.build_rollups(now=NOW)
+
+        recent = await service.get_health_series(
+            "dev-1", start=NOW - timedelta(hours=1), end=NOW, bucket_seconds=60, now=NOW
+        )
+        week = await service.get_health_series(
+            "dev-1", start=NOW - timedelta(days=7), end=NOW, bucket_seconds=3600, now=NOW
+        )
+
+    assert recent["source"] == "raw"
+    assert week["source"] == "1m"
+    assert week["bucket_seconds"] == 3600
+    assert week["columns"]["bucket_start"] == ["2026-01-14T11:00:00+00:00"]
+    assert week["columns"]["sample_count"] == [4]
+    assert week["columns"]["cpu_avg"] == [40.0]
+    assert week["columns"]["cpu_max"] == [70.0]
+    assert week["columns"]["cpu_p95"] == [None]
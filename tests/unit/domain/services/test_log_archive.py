@@ -0,0 +1,438 @@
+"""Tests for the persistent device log archive and logs/search."""
+
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services import firewall_logs as firewall_logs_module
+from routeros_mcp.domain.services.firewall_logs import FirewallLogsService
+from routeros_mcp.domain.services.log_archive import (
+    LogArchiveService,
+    epoch_day,
+    parse_search_terms,
+    resolve_log_time,
+)
+from routeros_mcp.infra.db.models import Base, Device, DeviceLog, DeviceLogTopic
+from routeros_mcp.infra.jobs.runner import ingest_syslog_batch, run_log_archive_job
+from routeros_mcp.infra.routeros.log_tail import LogEntry
+from routeros_mcp.infra.routeros.syslog_receiver import SyslogReceiver, parse_syslog_message
+from routeros_mcp.mcp.errors import ValidationError
+from routeros_mcp.mcp_tools import firewall_logs as firewall_logs_tools
+
+from tests.unit.mcp_tools_test_utils import DummyMCP
+
+# Load the log archive migration to install the SQLite FTS5 index in tests
+_migration_path = (
+    Path(__file__).parents[4] / "alembic" / "versions" / "41_add_device_log_archive.py"
+)
+_spec = importlib.util.spec_from_file_location("migration_41", _migration_path)
+migration_41 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migration_41)
+
+NOW = datetime(2026, 1, 16, 12, 0, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with maker() as session:
+        for index, device_id in enumerate(("dev-1", "dev-2"), start=1):
+            session.add(
+                Device(
+                    id=device_id,
+                    name=f"router-{index}",
+                    management_ip=f"10.0.0.{index}",
+                    management_port=443,
+                    environment="lab",
+                    status="healthy",
+                    tags={},
+                    allow_advanced_writes=False,
+                    allow_professional_workflows=False,
+                )
+            )
+        await session.commit()
+    yield maker
+    await engine.dispose()
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings(environment="lab", log_archive_enabled=True)
+
+
+def _factory(maker):
+    class Factory:
+        @asynccontextmanager
+        async def session(self):
+            async with maker() as session:
+                yield session
+
+    return Factory()
+
+
+def _entry(time: str, topics: str, message: str, log_id: str | None = None) -> LogEntry:
+    raw = {"time": time, "topics": topics, "message": message}
+    if log_id:
+        raw[".id"] = log_id
+    return LogEntry.from_raw(raw)
+
+
+async def _seed(session, settings) -> None:
+    archive = LogArchiveService(session, settings)
+    await archive.archive_entries(
+        "dev-1",
+        [
+            _entry("2026-01-14 08:00:00", "system,info,account", "user admin logged in"),
+            _entry("2026-01-16 09:00:00", "system,error,critical", "login failure for user bob"),
+            _entry("2026-01-16 10:00:00", "interface,info", "ether1 link down"),
+        ],
+        now=NOW,
+    )
+    await archive.archive_entries(
+        "dev-2",
+        [
+            _entry("2026-01-16 11:00:00", "system,error", "login failure for user alice"),
+            _entry("11:30:00", "dhcp,info", "lease 10.0.0.50 assigned"),
+        ],
+        now=NOW,
+    )
+
+
+def test_resolve_log_time_completes_partial_device_times():
+    assert resolve_log_time(_entry("11:30:00", "x", "m"), NOW) == NOW.replace(
+        hour=11, minute=30
+    )
+    # A time-only entry "later" than now was written yesterday
+    assert resolve_log_time(_entry("23:59:00", "x", "m"), NOW) == datetime(
+        2026, 1, 15, 23, 59, tzinfo=UTC
+    )
+    # v6 "mon/dd" entries take the current year, or last year if in the future
+    assert resolve_log_time(_entry("jan/10 08:00:00", "x", "m"), NOW) == datetime(
+        2026, 1, 10, 8, tzinfo=UTC
+    )
+    assert resolve_log_time(_entry("dec/30 08:00:00", "x", "m"), NOW) == datetime(
+        2025, 12, 30, 8, tzinfo=UTC
+    )
+    assert resolve_log_time(_entry("garbage", "x", "m"), NOW) == NOW
+
+
+def test_parse_search_terms_keeps_quoted_phrases():
+    assert parse_search_terms('login "user bob"') == ["login", "user bob"]
+    assert parse_search_terms('unbalanced "quote') == ["unbalanced", '"quote']
+    assert parse_search_terms(None) == []
+
+
+async def test_archive_entries_stores_topics_and_skips_archived(session_maker, settings):
+    async with session_maker() as session:
+        await _seed(session, settings)
+        archive = LogArchiveService(session, settings)
+
+        # Re-reading a device buffer after a restart archives only newer entries
+        stored = await archive.archive_entries(
+            "dev-1",
+            [
+                _entry("2026-01-16 09:00:00", "system,error,critical", "login failure for user bob"),
+                _entry("2026-01-16 10:00:00", "interface,info", "ether1 link down"),
+                _entry("2026-01-16 10:00:00", "interface,info", "ether1 link up"),
+            ],
+            now=NOW,
+        )
+        assert stored == 1
+
+        total = (await session.execute(select(func.count(DeviceLog.id)))).scalar_one()
+        topics = (
+            await session.execute(
+                select(func.count()).where(DeviceLogTopic.topic == "info")
+            )
+        ).scalar_one()
+        row = (
+            await session.execute(select(DeviceLog).where(DeviceLog.message == "ether1 link up"))
+        ).scalar_one()
+
+    assert total == 6
+    assert topics == 4
+    assert row.day == epoch_day(NOW)
+    assert row.source == "poll"
+
+
+async def test_search_filters_by_topic_device_time_and_message(session_maker, settings):
+    async with session_maker() as session:
+        await _seed(session, settings)
+        archive = LogArchiveService(session, settings)
+
+        # Default window is the last 24 hours: the 2026-01-14 entry is pruned
+        result = await archive.search(end=NOW)
+        assert result["count"] == 4
+        assert result["days_scanned"] == 2
+        assert [e["message"] for e in result["entries"]][0] == "lease 10.0.0.50 assigned"
+
+        result = await archive.search(topics=["error"], end=NOW)
+        assert {e["device_id"] for e in result["entries"]} == {"dev-1", "dev-2"}
+
+        result = await archive.search(topics=["error"], device_ids=["dev-2"], end=NOW)
+        assert [e["message"] for e in result["entries"]] == ["login failure for user alice"]
+        assert result["entries"][0]["topics"] == ["system", "error"]
+
+        result = await archive.search(query='"user bob" login', end=NOW)
+        assert [e["device_id"] for e in result["entries"]] == ["dev-1"]
+
+        result = await archive.search(start=NOW - timedelta(days=3), end=NOW, limit=2)
+        assert result["count"] == 2
+        assert result["truncated"] is True
+        assert result["days_scanned"] == 4
+
+        with pytest.raises(ValidationError):
+            await archive.search(limit=0)
+        with pytest.raises(ValidationError):
+            await archive.search(start=NOW, end=NOW - timedelta(hours=1))
+
+
+async def test_search_uses_sqlite_full_text_index(session_maker, settings):
+    async with session_maker() as session:
+        # Existing rows are backfilled when the index is created
+        await LogArchiveService(session, settings).archive_entries(
+            "dev-1", [_entry("2026-01-16 08:00:00", "system,info", "backup completed")], now=NOW
+        )
+        for statement in migration_41._SQLITE_UPGRADE:
+            await session.execute(text(statement))
+        await session.commit()
+
+        await _seed(session, settings)
+        archive = LogArchiveService(session, settings)
+        assert await archive._has_search_index("sqlite") is True
+
+        result = await archive.search(query="failure", end=NOW)
+        assert {e["device_id"] for e in result["entries"]} == {"dev-1", "dev-2"}
+
+        result = await archive.search(query='"user alice"', end=NOW)
+        assert [e["device_id"] for e in result["entries"]] == ["dev-2"]
+
+        result = await archive.search(query="backup", end=NOW)
+        assert [e["message"] for e in result["entries"]] == ["backup completed"]
+
+        # Deleted rows leave the index through the delete trigger
+        deleted = await archive.apply_retention(now=NOW + timedelta(days=31))
+        assert deleted == 5
+        result = await archive.search(query="failure", end=NOW)
+        assert result["count"] == 0
+
+
+async def test_apply_retention_deletes_whole_days(session_maker, settings):
+    async with session_maker() as session:
+        await _seed(session, Settings(environment="lab"))
+        archive = LogArchiveService(session, Settings(environment="lab", log_archive_retention_days=1))
+
+        deleted = await archive.apply_retention(now=NOW)
+
+        assert deleted == 1
+        remaining_topics = (
+            await session.execute(select(func.count()).select_from(DeviceLogTopic))
+        ).scalar_one()
+        assert remaining_topics == 9
+
+
+def test_parse_syslog_message_formats():
+    received = datetime(2026, 1, 16, 12, 0, 5, tzinfo=UTC)
+
+    assert parse_syslog_message(
+        b"<30>Dec  1 22:52:33 MikroTik system,info,account user admin logged in"
+    ) == {
+        "time": "dec/01 22:52:33",
+        "topics": ["system", "info", "account"],
+        "message": "user admin logged in",
+    }
+    assert parse_syslog_message(b"<30>system,info ether1 link up", received) == {
+        "time": "12:00:05",
+        "topics": ["system", "info"],
+        "message": "ether1 link up",
+    }
+    # No RouterOS topic list: the topic comes from the syslog severity
+    assert parse_syslog_message(b"<27>something broke", received)["topics"] == ["error"]
+    assert parse_syslog_message(b"not syslog") is None
+
+
+async def test_syslog_receiver_batches_datagrams():
+    batches: list[list] = []
+
+    async def on_batch(batch):
+        batches.append(batch)
+
+    receiver = SyslogReceiver(on_batch=on_batch, batch_size=2, flush_interval_seconds=5)
+    await receiver.start("127.0.0.1", 0)
+    host, port = receiver.sockname
+
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=(host, port)
+    )
+    try:
+        transport.sendto(b"<30>system,info first")
+        transport.sendto(b"<30>system,info second")
+        transport.sendto(b"garbage")
+        transport.sendto(b"<30>system,info third")
+        for _ in range(50):
+            if batches:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        transport.close()
+        await receiver.stop()
+
+    messages = [entry["message"] for batch in batches for _, entry in batch]
+    assert messages == ["first", "second", "third"]
+    assert batches[0][0][0] == "127.0.0.1"
+    assert receiver.received == 3
+    assert receiver.sockname is None
+
+
+async def test_ingest_syslog_batch_maps_source_address(session_maker, settings):
+    batch = [
+        ("10.0.0.2", {"time": "11:00:00", "topics": ["system", "info"], "message": "hello"}),
+        ("192.0.2.9", {"time": "11:00:00", "topics": ["system", "info"], "message": "stranger"}),
+    ]
+
+    archived = await ingest_syslog_batch(_factory(session_maker), settings, batch)
+
+    assert archived == 1
+    async with session_maker() as session:
+        row = (await session.execute(select(DeviceLog))).scalar_one()
+    assert (row.device_id, row.source, row.message) == ("dev-2", "syslog", "hello")
+
+
+async def test_run_log_archive_job(session_maker, settings, monkeypatch):
+    async def fake_tail_logs(self, device_id, tailer=None):
+        if device_id == "dev-2":
+            raise RuntimeError("unreachable")
+        return [_entry("2026-01-16 09:00:00", "system,info", "config changed", "*1")]
+
+    monkeypatch.setattr(FirewallLogsService, "tail_logs", fake_tail_logs)
+
+    summary = await run_log_archive_job(_factory(session_maker), settings)
+
+    assert summary["status"] == "success"
+    assert (summary["total"], summary["success"], summary["failed"]) == (2, 1, 1)
+    assert summary["entries_archived"] == 1
+
+    disabled = await run_log_archive_job(_factory(session_maker), Settings(environment="lab"))
+    assert disabled == {"status": "skipped", "reason": "disabled"}
+
+
+class _LogRestClient:
+    """REST client serving a growing device log and answering ``.id`` queries."""
+
+    def __init__(self) -> None:
+        self.log: list[dict] = []
+
+    def append(self, log_id: str, message: str) -> None:
+        # Timestamped now, so the job's retention pass keeps the entry
+        now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        self.log.append(
+            {".id": log_id, "time": now, "topics": "system,info", "message": message}
+        )
+
+    async def get(self, path: str):
+        return list(self.log)
+
+    async def post(self, path: str, data: dict):
+        cursor = int(data[".query"][0].split("=*")[1], 16)
+        return [item for item in self.log if int(item[".id"][1:], 16) >= cursor]
+
+    async def close(self) -> None:
+        pass
+
+
+async def test_run_log_archive_job_keeps_own_cursor(session_maker, settings, monkeypatch):
+    client = _LogRestClient()
+
+    class FakeDeviceService:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        async def get_device(self, device_id: str):
+            return {"id": device_id}
+
+        async def get_rest_client(self, device_id: str):
+            if device_id == "dev-2":
+                raise RuntimeError("unreachable")
+            return client
+
+        async def get_ssh_client(self, device_id: str):
+            raise RuntimeError("unreachable")
+
+    monkeypatch.setattr(firewall_logs_module, "DeviceService", FakeDeviceService)
+
+    client.append("*1", "config changed")
+    first = await run_log_archive_job(_factory(session_maker), settings)
+    assert first["entries_archived"] == 1
+
+    # A tail read between runs advances the shared cursor, not the archive's
+    client.append("*2", "config changed")
+    client.append("*3", "config changed")
+    logs, _ = await FirewallLogsService(None, settings).get_recent_logs("dev-1", tail=True)
+    assert [entry["id"] for entry in logs][-2:] == ["*2", "*3"]
+
+    second = await run_log_archive_job(_factory(session_maker), settings)
+    assert second["entries_archived"] == 2
+
+    async with session_maker() as session:
+        total = (await session.execute(select(func.count(DeviceLog.id)))).scalar_one()
+    assert total == 3
+
+
+async def test_archive_entries_keeps_same_second_repeats(session_maker, settings):
+    repeat = ("2026-01-16 09:00:00", "system,info", "config changed")
+    async with session_maker() as session:
+        archive = LogArchiveService(session, settings)
+        assert await archive.archive_entries("dev-1", [_entry(*repeat)] * 2, now=NOW) == 2
+
+        # A resync re-reads both archived repeats plus a third in the same second
+        assert await archive.archive_entries("dev-1", [_entry(*repeat)] * 3, now=NOW) == 1
+
+        # Entries read after a live cursor are all new
+        stored = await archive.archive_entries(
+            "dev-1", [_entry(*repeat)], now=NOW, skip_archived=False
+        )
+        assert stored == 1
+
+        total = (await session.execute(select(func.count(DeviceLog.id)))).scalar_one()
+    assert total == 4
+
+
+async def test_search_logs_tool(session_maker, settings, monkeypatch):
+    async with session_maker() as session:
+        await _seed(session, settings)
+
+    monkeypatch.setattr(
+        firewall_logs_tools, "get_session_factory", lambda _settings: _factory(session_maker)
+    )
+    mcp = DummyMCP()
+    firewall_logs_tools.register_firewall_logs_tools(mcp, settings)
+    tool = mcp.tools["search_logs"]
+
+    result = await tool(
+        query="failure",
+        device_ids=["dev-1"],
+        start_time="2026-01-15T12:00:00",
+        end_time="2026-01-16T12:00:00+00:00",
+    )
+    assert not result["isError"]
+    assert result["_meta"]["count"] == 1
+    assert result["_meta"]["entries"][0]["message"] == "login failure for user bob"
+    assert "Found 1 archived log entries" in result["content"][0]["text"]
+
+    invalid = await tool(start_time="yesterday")
+    assert invalid["isError"]
+
+    missing = await tool(device_ids=["missing"])
+    assert missing["isError"]
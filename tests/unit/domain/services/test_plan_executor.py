@@ -0,0 +1,192 @@
+"""Tests for the shared concurrency-bounded plan executor."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.plan_executor import (
+    PlanExecutor,
+    context_progress_reporter,
+    health_check_gate,
+    split_batches,
+)
+
+DEVICE_IDS = [f"dev-{i}" for i in range(6)]
+
+
+def test_split_batches():
+    assert split_batches(DEVICE_IDS, 4) == [DEVICE_IDS[:4], DEVICE_IDS[4:]]
+    assert split_batches(DEVICE_IDS, 0) == [DEVICE_IDS]
+    assert split_batches([], 3) == []
+
+
+async def test_run_bounds_concurrency_and_preserves_order():
+    in_flight = 0
+    peak = 0
+
+    async def worker(device_id: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later devices finish first to prove results are re-ordered
+        await asyncio.sleep(0.01 * (len(DEVICE_IDS) - int(device_id[-1])))
+        in_flight -= 1
+        return {"device_id": device_id, "status": "success"}
+
+    result = await PlanExecutor(max_concurrency=2).run(DEVICE_IDS, worker)
+
+    assert peak == 2
+    assert [r["device_id"] for r in result.device_results] == DEVICE_IDS
+    assert result.successful_devices == DEVICE_IDS
+    assert result.batches_completed == 1
+    assert not result.halted
+
+
+async def test_health_gate_halts_remaining_batches():
+    gated: list[list[str]] = []
+
+    async def worker(device_id: str) -> dict[str, Any]:
+        return {"status": "failed" if device_id == "dev-0" else "success"}
+
+    async def gate(device_ids: list[str]) -> list[str]:
+        gated.append(device_ids)
+        return ["dev-1"]
+
+    result = await PlanExecutor(batch_size=2, health_gate=gate).run(DEVICE_IDS, worker)
+
+    # The gate sees failed devices too, and only the first batch ran
+    assert gated == [["dev-0", "dev-1"]]
+    assert result.halted
+    assert result.unhealthy_devices == ["dev-1"]
+    assert "dev-1" in result.halt_reason
+    assert result.batches_completed == 1
+    assert result.failed_devices == ["dev-0"]
+    assert result.skipped_devices == DEVICE_IDS[2:]
+    assert result.summary()["skipped"] == 4
+
+
+async def test_health_check_gate_halts_on_degraded_batch():
+    class FakeHealthService:
+        def __init__(self) -> None:
+            self.calls: list[tuple[list[str], float, float]] = []
+
+        async def run_batch_health_checks(self, device_ids, cpu_threshold, memory_threshold):
+            self.calls.append((device_ids, cpu_threshold, memory_threshold))
+            statuses = {"dev-1": "degraded", "dev-2": "unreachable"}
+            return {
+                device_id: SimpleNamespace(status=statuses.get(device_id, "healthy"))
+                for device_id in device_ids
+            }
+
+    async def worker(device_id: str) -> dict[str, Any]:
+        return {"device_id": device_id, "status": "success"}
+
+    health_service = FakeHealthService()
+    executor = PlanExecutor(batch_size=2, health_gate=health_check_gate(health_service))
+    result = await executor.run(DEVICE_IDS, worker)
+
+    assert health_service.calls == [(["dev-0", "dev-1"], 80.0, 85.0)]
+    assert result.halted
+    assert result.unhealthy_devices == ["dev-1"]
+    assert result.skipped_devices == DEVICE_IDS[2:]
+
+
+async def test_worker_skipped_status_is_not_a_halt_skip():
+    async def worker(device_id: str) -> dict[str, Any]:
+        # e.g. the DHCP apply mock, which attempts the device but applies nothing
+        return {"status": "skipped"}
+
+    result = await PlanExecutor().run(DEVICE_IDS[:2], worker)
+
+    assert result.failed_devices == DEVICE_IDS[:2]
+    assert result.skipped_devices == []
+    assert result.summary()["skipped"] == 0
+
+
+async def test_failure_threshold_stops_new_devices():
+    started: list[str] = []
+
+    async def worker(device_id: str) -> dict[str, Any]:
+        started.append(device_id)
+        raise RuntimeError("connection refused")
+
+    result = await PlanExecutor(max_concurrency=1, max_failures=2).run(DEVICE_IDS, worker)
+
+    assert started == ["dev-0", "dev-1"]
+    assert result.halted
+    assert "max_failures=2" in result.halt_reason
+    assert result.device_results[0] == {
+        "device_id": "dev-0",
+        "status": "failed",
+        "error": "connection refused",
+    }
+    assert result.skipped_devices == DEVICE_IDS[2:]
+
+
+async def test_progress_events_and_callback_errors():
+    events: list[dict[str, Any]] = []
+
+    def on_progress(event: dict[str, Any]) -> None:
+        events.append(event)
+        if event["event"] == "batch_started":
+            raise RuntimeError("observer failure must not abort the rollout")
+
+    async def worker(device_id: str) -> dict[str, Any]:
+        return {"status": "applied"}
+
+    result = await PlanExecutor(batch_size=3, on_progress=on_progress).run(
+        [DEVICE_IDS[:3], DEVICE_IDS[3:]], worker
+    )
+
+    assert len(result.successful_devices) == 6
+    device_events = [e for e in events if e["event"] == "device_completed"]
+    assert [e["completed"] for e in device_events] == [1, 2, 3, 4, 5, 6]
+    assert all(e["total"] == 6 for e in device_events)
+    assert [e["event"] for e in events if e["event"] != "device_completed"] == [
+        "batch_started",
+        "batch_completed",
+        "batch_started",
+        "batch_completed",
+    ]
+
+
+async def test_context_progress_reporter_forwards_device_events():
+    class FakeContext:
+        def __init__(self) -> None:
+            self.calls: list[tuple[float, float | None, str | None]] = []
+
+        async def report_progress(
+            self, progress: float, total: float | None = None, message: str | None = None
+        ) -> None:
+            self.calls.append((progress, total, message))
+
+    ctx = FakeContext()
+    reporter = context_progress_reporter(ctx)
+
+    async def worker(device_id: str) -> dict[str, Any]:
+        return {"status": "rolled_back" if device_id == "dev-1" else "success"}
+
+    await PlanExecutor(on_progress=reporter).run(DEVICE_IDS[:2], worker)
+
+    assert ctx.calls == [(1, 2, "dev-0: success"), (2, 2, "dev-1: rolled_back")]
+    assert context_progress_reporter(None) is None
+
+
+def test_from_settings_and_validation():
+    settings = Settings(
+        environment="lab",
+        plan_apply_max_concurrency=8,
+        plan_apply_batch_size=10,
+        plan_apply_max_failures=3,
+    )
+    executor = PlanExecutor.from_settings(settings, max_failures=1)
+
+    assert executor.max_concurrency == 8
+    assert executor.batch_size == 10
+    assert executor.max_failures == 1
+
+    with pytest.raises(ValueError):
+        PlanExecutor(max_concurrency=0)
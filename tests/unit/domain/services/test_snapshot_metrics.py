@@ -11,34 +11,19 @@ from routeros_mcp.domain.services.snapshot import SnapshotService
 from routeros_mcp.infra.observability import metrics
 
 
-def get_metric_value(metric_name, labels=None):
-    """Helper to get current metric value from the custom registry.
-    
+def get_device_metric_value(family, device_id, **labels):
+    """Helper to get a per-device series value from the device metrics store.
+
     Args:
-        metric_name: Name of the metric
-        labels: Optional dictionary of label filters
-        
+        family: Per-device metric family name
+        device_id: Device identifier
+        **labels: Remaining series labels
+
     Returns:
-        Metric value or 0 if not found
+        Series value or 0 if not recorded
     """
-    registry = metrics.get_registry()
-    for metric in registry.collect():
-        if metric.name == metric_name:
-            for sample in metric.samples:
-                # Check if this is the right sample
-                if sample.name.startswith(metric_name):
-                    # Check labels match if provided
-                    if labels:
-                        matches = all(
-                            sample.labels.get(k) == v
-                            for k, v in labels.items()
-                        )
-                        if matches:
-                            return sample.value
-                    else:
-                        # No label filter, return first match
-                        return sample.value
-    return 0
+    value = metrics.get_device_metrics().value(family, device_id, **labels)
+    return value if value is not None else 0
 
 
 @pytest.fixture
@@ -170,9 +155,8 @@ async def test_snapshot_age_metric_on_get_latest(mock_session, settings):
     
     # Age metric should be approximately 300 seconds (5 minutes)
     # Allow some variance for test execution time
-    recorded_age = get_metric_value(
-        "routeros_mcp_snapshot_age_seconds",
-        labels={"device_id": device_id, "kind": kind}
+    recorded_age = get_device_metric_value(
+        "routeros_mcp_device_snapshot_age_seconds", device_id, kind=kind
     )
     assert 295 <= recorded_age <= 305
 
@@ -192,9 +176,8 @@ async def test_missing_snapshot_metric_when_not_found(mock_session, settings):
     mock_session.execute.return_value = mock_result
     
     # Get initial missing count
-    initial_count = get_metric_value(
-        "routeros_mcp_snapshot_missing_total",
-        labels={"device_id": device_id, "kind": kind}
+    initial_count = get_device_metric_value(
+        "routeros_mcp_device_snapshot_missing_total", device_id, kind=kind
     )
     
     # Get latest snapshot (should be None)
@@ -204,9 +187,8 @@ async def test_missing_snapshot_metric_when_not_found(mock_session, settings):
     assert snapshot is None
     
     # Missing metric should be incremented
-    final_count = get_metric_value(
-        "routeros_mcp_snapshot_missing_total",
-        labels={"device_id": device_id, "kind": kind}
+    final_count = get_device_metric_value(
+        "routeros_mcp_device_snapshot_missing_total", device_id, kind=kind
     )
     assert final_count == initial_count + 1
 
@@ -274,8 +256,7 @@ async def test_snapshot_age_updated_after_capture(mock_session, settings, test_d
             assert snapshot_id is not None
             
             # Age metric should be set to 0 (newly captured)
-            age = get_metric_value(
-                "routeros_mcp_snapshot_age_seconds",
-                labels={"device_id": test_device.id, "kind": "config"}
+            age = get_device_metric_value(
+                "routeros_mcp_device_snapshot_age_seconds", test_device.id, kind="config"
             )
             assert age == 0.0
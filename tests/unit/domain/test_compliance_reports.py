@@ -344,6 +344,24 @@ async def test_export_audit_events_csv_format(
     assert "Action" in first_row
 
 
+@pytest.mark.asyncio
+async def test_stream_audit_events_yields_incrementally(
+    compliance_service: ComplianceService,
+    sample_audit_events: list[AuditEventORM],
+) -> None:
+    """Test streaming export yields events newest first without meta."""
+    streamed = [
+        event
+        async for event in compliance_service.stream_audit_events(device_id="dev-001", batch_size=1)
+    ]
+
+    assert [e["id"] for e in streamed] == ["evt-003", "evt-001"]
+    assert all("meta" not in e for e in streamed)
+
+    limited = [e async for e in compliance_service.stream_audit_events(limit=2)]
+    assert len(limited) == 2
+
+
 # ==================== Test: Approval Decisions ====================
 
 
@@ -284,6 +284,27 @@ class TestRedisResourceCache:
             json.dumps(test_data),
         )
 
+    @pytest.mark.asyncio
+    async def test_set_and_get_hosts(
+        self, cache: RedisResourceCache, mock_redis_client: AsyncMock
+    ) -> None:
+        """Host locator sightings should use the hosts key and TTL."""
+        cache._client = mock_redis_client
+        cache.enabled = True
+        cache.ttl_hosts = 3600
+
+        rows = [["AA:BB:CC:00:00:01", "dev-lab-01", "arp", "bridge", "10.0.0.5", None, 1.0]]
+
+        await cache.set_hosts("dev-lab-01", rows)
+        mock_redis_client.get.return_value = json.dumps(rows)
+
+        assert await cache.get_hosts("dev-lab-01") == rows
+        mock_redis_client.setex.assert_called_once_with(
+            "test:dev-lab-01:hosts",
+            3600,
+            json.dumps(rows),
+        )
+
     @pytest.mark.asyncio
     async def test_invalidate_device(
         self, cache: RedisResourceCache, mock_redis_client: AsyncMock
@@ -0,0 +1,96 @@
+"""Tests for the in-memory device registry."""
+
+from sqlalchemy import delete, update
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.models import DeviceCreate, DeviceUpdate
+from routeros_mcp.domain.services.device import DeviceService
+from routeros_mcp.infra.db.models import Device as DeviceORM
+from routeros_mcp.infra.device_registry import (
+    get_device_registry,
+    initialize_device_registry,
+)
+
+
+def _device(device_id: str, environment: str = "lab", **tags: str) -> DeviceCreate:
+    return DeviceCreate(
+        id=device_id,
+        name=f"router-{device_id}",
+        management_ip="192.0.2.1",
+        management_port=443,
+        environment=environment,
+        tags=tags,
+    )
+
+
+async def test_registry_serves_lookups_and_writes_through(initialize_session_manager):
+    manager = initialize_session_manager
+    settings = Settings(environment="lab")
+
+    async with manager.session() as session:
+        service = DeviceService(session, settings)
+        await service.register_device(_device("dev-a", site="hq"))
+        await service.register_device(_device("dev-b", site="branch"))
+
+    registry = initialize_device_registry()
+    assert get_device_registry() is None  # not used until loaded
+    await registry.load(manager)
+    assert get_device_registry() is registry
+    assert len(registry) == 2
+
+    assert [d.id for d in registry.find(tag="site=hq")] == ["dev-a"]
+    assert [d.id for d in registry.find(tag="site")] == ["dev-a", "dev-b"]
+    assert [d.id for d in registry.find(status="pending", device_ids=["dev-b"])] == ["dev-b"]
+    assert registry.find(environment="prod") == []
+
+    async with manager.session() as session:
+        service = DeviceService(session, settings)
+
+        # Reads are served from memory: no statement reaches the session
+        executed: list[object] = []
+        original_execute = session.execute
+
+        async def counting_execute(statement, *args, **kwargs):
+            executed.append(statement)
+            return await original_execute(statement, *args, **kwargs)
+
+        session.execute = counting_execute  # type: ignore[method-assign]
+        assert (await service.get_device("dev-a")).name == "router-dev-a"
+        assert [d.id for d in await service.list_devices(status="pending")] == ["dev-a", "dev-b"]
+        assert [d.id for d in await service.list_devices(allowed_device_ids=["dev-b"])] == [
+            "dev-b"
+        ]
+        assert executed == []
+
+        # Writes through this process update the indexes immediately
+        await service.update_device("dev-a", DeviceUpdate(status="healthy"))
+        assert [d.id for d in registry.find(status="healthy")] == ["dev-a"]
+        assert [d.id for d in registry.find(exclude_status="healthy")] == ["dev-b"]
+
+
+async def test_refresh_applies_changes_from_other_replicas(initialize_session_manager):
+    manager = initialize_session_manager
+    settings = Settings(environment="lab")
+
+    async with manager.session() as session:
+        service = DeviceService(session, settings)
+        await service.register_device(_device("dev-a"))
+        await service.register_device(_device("dev-b"))
+
+    registry = initialize_device_registry()
+    await registry.load(manager)
+    assert await registry.refresh(manager) == 0
+
+    # Simulate another replica writing directly to the shared database
+    async with manager.session() as session:
+        await session.execute(
+            update(DeviceORM).where(DeviceORM.id == "dev-a").values(name="renamed")
+        )
+        await session.execute(delete(DeviceORM).where(DeviceORM.id == "dev-b"))
+        await DeviceService(session, settings).register_device(_device("dev-c"))
+
+    # dev-c was already written through locally; the rename and delete are remote
+    assert await registry.refresh(manager) == 2
+    assert registry.get("dev-a").name == "renamed"
+    assert registry.get("dev-b") is None
+    assert [d.id for d in registry.find(environment="lab")] == ["dev-a", "dev-c"]
@@ -0,0 +1,51 @@
+"""Tests for streaming export encoders."""
+
+import csv
+import gzip
+import io
+import json
+
+from routeros_mcp.infra.export import encode_csv, encode_ndjson, gzip_chunks
+
+COLUMNS = [("ID", "id"), ("Device", "device_id")]
+
+
+async def _records(count: int):
+    for i in range(count):
+        yield {"id": f"evt-{i}", "device_id": None if i % 2 else f"dev-{i}"}
+
+
+async def _collect(chunks) -> list:
+    return [chunk async for chunk in chunks]
+
+
+async def test_encode_csv_chunks_rows_with_single_header():
+    chunks = await _collect(encode_csv(_records(5), COLUMNS, rows_per_chunk=2))
+
+    # 2 + 2 + 1 rows -> three chunks, header only in the first
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0] == ["ID", "Device"]
+    assert rows[1] == ["evt-0", "dev-0"]
+    assert rows[2] == ["evt-1", ""]
+    assert len(rows) == 6
+
+
+async def test_encode_csv_empty_input_yields_header():
+    chunks = await _collect(encode_csv(_records(0), COLUMNS))
+    assert chunks == ["ID,Device\r\n"]
+
+
+async def test_encode_ndjson_one_object_per_line():
+    chunks = await _collect(encode_ndjson(_records(3), rows_per_chunk=2))
+
+    assert len(chunks) == 2
+    lines = "".join(chunks).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["evt-0", "evt-1", "evt-2"]
+
+
+async def test_gzip_chunks_produces_single_gzip_stream():
+    text_chunks = await _collect(encode_ndjson(_records(2000), rows_per_chunk=100))
+    compressed = b"".join(await _collect(gzip_chunks(encode_ndjson(_records(2000), 100))))
+
+    assert gzip.decompress(compressed).decode() == "".join(text_chunks)
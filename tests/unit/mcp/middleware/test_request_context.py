@@ -0,0 +1,100 @@
+"""Tests for request-scoped memoization middleware."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.request_context import get_request_context, request_scope
+from routeros_mcp.mcp.errors import AuthorizationError
+from routeros_mcp.mcp.middleware.auth import AuthorizationMiddleware
+from routeros_mcp.mcp.middleware.request_context import RequestContextMiddleware
+from routeros_mcp.security.auth import User
+from routeros_mcp.security.authz import ToolTier
+
+
+async def test_tool_call_runs_in_fresh_scope():
+    middleware = RequestContextMiddleware()
+    seen = []
+
+    async def call_next(_context):
+        seen.append(get_request_context())
+        return "result"
+
+    context = SimpleNamespace(method="tools/call")
+    assert await middleware.on_call_tool(context, call_next) == "result"
+    assert await middleware.on_read_resource(context, call_next) == "result"
+
+    assert seen[0] is not None and seen[1] is not None
+    assert seen[0] is not seen[1]
+    assert get_request_context() is None
+
+
+def test_nested_scope_reuses_outer_context():
+    with request_scope() as outer:
+        with request_scope() as inner:
+            assert inner is outer
+        assert get_request_context() is outer
+    assert get_request_context() is None
+
+
+class _CountingSessionFactory:
+    def __init__(self, device) -> None:
+        self.device = device
+        self.sessions = 0
+
+    def session(self):
+        factory = self
+
+        class _Session:
+            async def __aenter__(self):
+                factory.sessions += 1
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, _statement):
+                return SimpleNamespace(scalar_one_or_none=lambda: factory.device)
+
+        return _Session()
+
+
+@pytest.mark.parametrize("role, allowed", [("admin", True), ("read_only", False)])
+async def test_authorization_decision_memoized_per_request(role: str, allowed: bool):
+    device = SimpleNamespace(
+        id="dev-lab-01",
+        name="router-lab-01",
+        management_ip="192.0.2.1",
+        management_port=443,
+        environment="lab",
+        status="healthy",
+        tags={},
+        allow_advanced_writes=True,
+        allow_professional_workflows=False,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    factory = _CountingSessionFactory(device)
+    middleware = AuthorizationMiddleware(factory, Settings(environment="lab"))
+    user = User(sub="user-1", email="user@example.com", role=role, device_scope=None)
+
+    async def check() -> None:
+        await middleware.check_authorization(
+            user=user,
+            tool_name="dns/update-servers",
+            tool_tier=ToolTier.ADVANCED,
+            device_id="dev-lab-01",
+        )
+
+    with request_scope() as context:
+        for _ in range(3):
+            if allowed:
+                await check()
+            else:
+                with pytest.raises(AuthorizationError):
+                    await check()
+
+    assert factory.sessions == 1
+    assert context.hits == 2
@@ -402,3 +402,46 @@ async def test_is_subscribable_validation() -> None:
     assert not SSEManager._is_subscribable("plan://plan-001")
     assert not SSEManager._is_subscribable("invalid-uri")
     assert not SSEManager._is_subscribable("")
+
+
+@pytest.mark.asyncio
+async def test_logs_subscription_streams_tailed_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A device://<id>/logs subscription is fed by the log tailer."""
+    from routeros_mcp.config import Settings
+    from routeros_mcp.domain.services import firewall_logs as firewall_logs_module
+    from routeros_mcp.infra.routeros.log_tail import get_log_tailer
+
+    batches = [
+        [{".id": "*1", "time": "00:00:01", "topics": "system,info", "message": "up"}],
+        [],
+        [{".id": "*2", "time": "00:00:02", "topics": "firewall", "message": "drop"}],
+    ]
+
+    async def fake_tail_logs(self, device_id: str):
+        return get_log_tailer().ingest(device_id, batches.pop(0) if batches else [])
+
+    monkeypatch.setattr(firewall_logs_module.FirewallLogsService, "tail_logs", fake_tail_logs)
+
+    class _SessionFactory:
+        @contextlib.asynccontextmanager
+        async def session(self):
+            yield None
+
+    assert SSEManager._is_subscribable("device://dev-001/logs")
+    manager = SSEManager(
+        update_batch_interval_seconds=0.01,
+        log_update_interval_seconds=0.02,
+        session_factory=_SessionFactory(),
+        settings=Settings(),
+    )
+    sub = await manager.subscribe("client-1", "device://dev-001/logs")
+
+    events = []
+    for _ in range(2):
+        events.append(await asyncio.wait_for(sub.queue.get(), timeout=2))
+    await manager.unsubscribe(sub.subscription_id)
+
+    assert [event["event"] for event in events] == ["logs", "logs"]
+    assert [e["message"] for e in events[0]["data"]["entries"]] == ["up"]
+    assert events[1]["data"]["cursor"] == "*2"
+    assert not manager._log_update_tasks
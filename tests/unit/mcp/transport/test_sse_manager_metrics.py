@@ -265,16 +265,15 @@ async def test_resource_pattern_extraction() -> None:
 # Phase 4: Additional SSE metrics tests
 @pytest.mark.asyncio
 async def test_sse_events_sent_total_metric() -> None:
-    """Test that sse_events_sent_total metric is recorded with correct labels."""
+    """Test that sse_events_sent_total is recorded per resource type and per device."""
     manager = SSEManager(update_batch_interval_seconds=0.05)
+    device_metrics = metrics.get_device_metrics()
 
     metric_name = "routeros_mcp_sse_events_sent"
+    device_family = "routeros_mcp_device_sse_events_sent_total"
 
     # Get initial count
-    initial_count = get_metric_value(
-        metric_name,
-        labels={"resource_type": "health", "device_id": "dev-001"}
-    )
+    initial_count = get_metric_value(metric_name, labels={"resource_type": "health"})
 
     # Subscribe and broadcast
     await manager.subscribe("client-1", "device://dev-001/health")
@@ -287,11 +286,9 @@ async def test_sse_events_sent_total_metric() -> None:
     await asyncio.sleep(0.15)
 
     # Should have recorded 1 event
-    final_count = get_metric_value(
-        metric_name,
-        labels={"resource_type": "health", "device_id": "dev-001"}
-    )
+    final_count = get_metric_value(metric_name, labels={"resource_type": "health"})
     assert final_count == initial_count + 1
+    assert device_metrics.value(device_family, "dev-001", resource_type="health") == 1
 
 
 @pytest.mark.asyncio
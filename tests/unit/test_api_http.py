@@ -149,3 +149,36 @@ class TestLoginEndpoint:
         # Returned state should match state in URL
         assert returned_state == url_state
         assert len(returned_state) >= 32  # Should be cryptographically secure
+
+
+def test_device_metrics_endpoint_pages(settings):
+    from routeros_mcp.infra.observability import metrics
+
+    for index in range(3):
+        metrics.record_health_check(
+            device_id=f"dev-{index}", environment="lab", status="healthy"
+        )
+    client = TestClient(create_http_app(settings))
+
+    resp = client.get("/metrics/devices", params={"page": 2, "page_size": 2})
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Total-Devices"] == "3"
+    assert resp.headers["X-Total-Pages"] == "2"
+    assert 'device_id="dev-2"' in resp.text
+    assert 'device_id="dev-0"' not in resp.text
+    assert client.get("/metrics/devices", params={"page": 0}).status_code == 422
+
+
+def test_metrics_endpoint_negotiates_gzip(monkeypatch, settings):
+    monkeypatch.setattr("routeros_mcp.api.http.get_metrics_text", lambda: "metrics-ok\n")
+    client = TestClient(create_http_app(settings))
+
+    resp = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.text == "metrics-ok\n"  # decoded by the client
+
+    resp = client.get("/metrics", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in resp.headers
+    assert resp.text == "metrics-ok\n"
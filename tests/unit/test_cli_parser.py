@@ -0,0 +1,121 @@
+"""Tests for the shared RouterOS CLI output parser."""
+
+from routeros_mcp.infra.routeros.cli_parser import (
+    TableLayout,
+    iter_print_records,
+    iter_value_blocks,
+    parse_key_value_output,
+    parse_kv,
+    unquote,
+)
+
+
+class TestParseKV:
+    """Tests for key=value decoding."""
+
+    def test_quoted_values_with_spaces_and_escapes(self) -> None:
+        pairs = parse_kv('name="my bridge" comment="say \\"hi\\"" mtu=auto')
+
+        assert pairs == {"name": "my bridge", "comment": 'say "hi"', "mtu": "auto"}
+
+    def test_unterminated_quote_is_kept(self) -> None:
+        assert parse_kv('comment="unterminated') == {"comment": '"unterminated'}
+        assert unquote('"x"') == "x"
+
+    def test_continuation_joins_bare_tokens(self) -> None:
+        pairs = parse_kv("0 name=routeros build-time=2025-12-04 12:00:39", continuation=True)
+
+        assert pairs == {"name": "routeros", "build-time": "2025-12-04 12:00:39"}
+
+
+class TestIterPrintRecords:
+    """Tests for table and detail print output."""
+
+    def test_detail_records_span_lines_and_carry_comments(self) -> None:
+        output = """Flags: X - disabled, D - dynamic
+ 0   ;;; cAP ac
+      address=192.168.20.251 mac-address=AA:BB:CC:DD:EE:01
+      host-name="ap-cAP-ac" status=bound
+
+ 1 D address=192.168.20.248 status=bound
+;;; static
+ 2 X address=192.168.20.10
+"""
+        records = list(iter_print_records(output))
+
+        assert [r.id for r in records] == ["0", "1", "2"]
+        assert records[0].comment == "cAP ac"
+        assert records[0].values["host-name"] == "ap-cAP-ac"
+        assert records[0].flags == ""
+        assert records[1].flags == "D"
+        assert records[2].comment == "static"
+        assert records[2].flags == "X"
+
+    def test_table_rows_expose_tokens_and_columns(self) -> None:
+        output = """Flags: X - disabled; D - dynamic
+Columns: NAME, INTERFACE, ADDRESS-POOL
+ #   NAME       INTERFACE  ADDRESS-POOL
+ 0   dhcp-lan   bridge     pool lan
+ 1 X dhcp-guest vlan30     guest
+"""
+        records = list(iter_print_records(output, multiline=False))
+
+        assert records[0].tokens == ["dhcp-lan", "bridge", "pool", "lan"]
+        assert records[0].get("address-pool") == "pool lan"
+        assert records[1].flags == "X"
+        assert records[1].get("name") == "dhcp-guest"
+
+    def test_rows_without_id_when_allowed(self) -> None:
+        output = """Flags: D - DYNAMIC; A - ACTIVE
+Columns: DST-ADDRESS, GATEWAY, DISTANCE
+    DST-ADDRESS      GATEWAY      DISTANCE
+DAv 0.0.0.0/0        10.0.0.1            1
+"""
+        assert list(iter_print_records(output, multiline=False)) == []
+
+        records = list(
+            iter_print_records(output, flag_chars="DAv", multiline=False, require_id=False)
+        )
+        assert len(records) == 1
+        assert records[0].id == ""
+        assert records[0].flags == "DAv"
+        assert records[0].tokens == ["0.0.0.0/0", "10.0.0.1", "1"]
+
+    def test_records_are_lazy(self) -> None:
+        output = "\n".join(f" {i} name=item{i}" for i in range(1000))
+        records = iter_print_records(output)
+
+        assert next(records).values == {"name": "item0"}
+
+
+class TestLayoutAndKeyValue:
+    """Tests for header layouts, colon key/value and as-value blocks."""
+
+    def test_layout_assigns_right_aligned_numbers(self) -> None:
+        layout = TableLayout.from_header(" #  NAME    MTU  TYPE")
+
+        assert layout.split(" 0  ether1  1500 ether") == {
+            "#": "0",
+            "name": "ether1",
+            "mtu": "1500",
+            "type": "ether",
+        }
+
+    def test_parse_key_value_output(self) -> None:
+        output = "  uptime: 1d2h\n  time: 12:00:01\n  board-name:\n"
+
+        assert parse_key_value_output(output) == {
+            "uptime": "1d2h",
+            "time": "12:00:01",
+            "board-name": "",
+        }
+        assert "board-name" not in parse_key_value_output(output, keep_empty=False)
+
+    def test_value_blocks(self) -> None:
+        output = "name=a\nversion=1\n\nname=b\nversion=2\n\n0 name=c version=3\n"
+
+        assert list(iter_value_blocks(output)) == [
+            {"name": "a", "version": "1"},
+            {"name": "b", "version": "2"},
+            {"name": "c", "version": "3"},
+        ]
@@ -9,6 +9,7 @@ import pytest
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services import bridge as bridge_module
 from routeros_mcp.infra.routeros.exceptions import RouterOSTimeoutError
+from routeros_mcp.infra.routeros.host_locator import collect_sightings
 
 
 class _FakeRestClient:
@@ -92,6 +93,27 @@ class _FakeRestClient:
                     "comment": "",
                 },
             ],
+            "/rest/interface/bridge/host": [
+                {
+                    ".id": "*1",
+                    "mac-address": "18:FD:74:7C:7B:4F",
+                    "on-interface": "ether2",
+                    "bridge": "bridge1",
+                    "vid": 20,
+                    "dynamic": True,
+                    "local": False,
+                    "external": False,
+                    "disabled": False,
+                },
+                {
+                    ".id": "*2",
+                    "mac-address": "78:9A:18:A2:F3:D4",
+                    "on-interface": "bridge1",
+                    "bridge": "bridge1",
+                    "dynamic": True,
+                    "local": True,
+                },
+            ],
         }
 
     async def get(self, path: str, params: dict | None = None):
@@ -232,6 +254,100 @@ async def test_list_bridge_ports_via_rest(fake_env):
     assert any(call[0] == "close" for call in client.calls)
 
 
+@pytest.mark.asyncio
+async def test_list_bridge_hosts_via_rest(fake_env):
+    """Test listing learned bridge hosts via REST API."""
+    client, _ = fake_env
+    service = bridge_module.BridgeService(session=None, settings=Settings())
+
+    hosts = await service.list_bridge_hosts("dev-1")
+
+    assert len(hosts) == 2
+    assert hosts[0]["mac_address"] == "18:FD:74:7C:7B:4F"
+    assert hosts[0]["on_interface"] == "ether2"
+    assert hosts[0]["vid"] == 20
+    assert hosts[0]["local"] is False
+    assert hosts[0]["transport"] == "rest"
+    assert hosts[1]["local"] is True
+    assert hosts[1]["vid"] is None
+    assert any(
+        call[0] == "get" and call[1] == "/rest/interface/bridge/host" for call in client.calls
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_bridge_hosts_parses_rest_string_values(fake_env):
+    """REST returns flags and vid as strings; "false" must not read as set."""
+    client, _ = fake_env
+    client.store["/rest/interface/bridge/host"] = [
+        {
+            ".id": "*1",
+            "mac-address": "18:FD:74:7C:7B:4F",
+            "on-interface": "ether2",
+            "bridge": "bridge1",
+            "vid": "20",
+            "dynamic": "true",
+            "local": "false",
+            "external": "false",
+            "disabled": "false",
+        },
+        {
+            ".id": "*2",
+            "mac-address": "78:9A:18:A2:F3:D4",
+            "on-interface": "bridge1",
+            "bridge": "bridge1",
+            "dynamic": "false",
+            "local": "true",
+            "disabled": "false",
+        },
+    ]
+    service = bridge_module.BridgeService(session=None, settings=Settings())
+
+    hosts = await service.list_bridge_hosts("dev-1")
+
+    assert [(host["local"], host["disabled"]) for host in hosts] == [(False, False), (True, False)]
+    assert hosts[0]["dynamic"] is True
+    assert hosts[0]["vid"] == 20
+    sightings = collect_sightings("dev-1", bridge_hosts=hosts, timestamp=0.0)
+    assert [sighting.mac_address for sighting in sightings] == ["18:FD:74:7C:7B:4F"]
+
+
+@pytest.mark.asyncio
+async def test_list_bridge_hosts_ssh_fallback(monkeypatch: pytest.MonkeyPatch):
+    """Test bridge host listing falls back to SSH terse output when REST fails."""
+    ssh_output = """Flags: X - disabled, I - invalid; D - dynamic; L - local; E - external
+ 0  D  mac-address=18:FD:74:7C:7B:4F vid=20 on-interface=ether2 bridge=bridge-lan
+ 1 DL  mac-address=78:9A:18:A2:F3:D3 on-interface=bridge-lan bridge=bridge-lan
+ 2 X   mac-address=00:E0:4C:34:5D:51 on-interface=ether5 bridge=bridge-lan
+"""
+    ssh_client = _FakeSSHClient(ssh_output)
+    device_service = _FakeDeviceService(_FakeRestClient(), ssh_client)
+    monkeypatch.setattr(bridge_module, "DeviceService", lambda *args, **kwargs: device_service)
+
+    async def failing_rest(*args, **kwargs):
+        raise RouterOSTimeoutError("Timeout")
+
+    service = bridge_module.BridgeService(session=None, settings=Settings())
+    monkeypatch.setattr(service, "_list_bridge_hosts_via_rest", failing_rest)
+
+    hosts = await service.list_bridge_hosts("dev-1")
+
+    assert [host["mac_address"] for host in hosts] == [
+        "18:FD:74:7C:7B:4F",
+        "78:9A:18:A2:F3:D3",
+        "00:E0:4C:34:5D:51",
+    ]
+    assert hosts[0]["on_interface"] == "ether2"
+    assert hosts[0]["vid"] == 20
+    assert hosts[0]["dynamic"] is True
+    assert hosts[0]["local"] is False
+    assert hosts[1]["local"] is True
+    assert hosts[2]["disabled"] is True
+    assert hosts[0]["transport"] == "ssh"
+    assert hosts[0]["fallback_used"] is True
+    assert any("/interface/bridge/host/print terse without-paging" in call for call in ssh_client.calls)
+
+
 @pytest.mark.asyncio
 async def test_list_bridges_ssh_fallback(monkeypatch: pytest.MonkeyPatch):
     """Test bridge listing falls back to SSH when REST fails."""
@@ -282,7 +398,7 @@ async def test_list_bridges_ssh_fallback(monkeypatch: pytest.MonkeyPatch):
     assert bridges[1]["vlan_filtering"] is False
 
     # Verify SSH client was called
-    assert any("/interface/bridge/print" in call for call in ssh_client.calls)
+    assert any("/interface/bridge/print terse without-paging" in call for call in ssh_client.calls)
 
 
 @pytest.mark.asyncio
@@ -361,7 +477,7 @@ Columns: INTERFACE, BRIDGE, HW, HORIZON, TRUSTED, FAST-LEAVE, BPDU-GUARD, EDGE,
     assert ports[8]["pvid"] == 40
 
     # Verify SSH client was called
-    assert any("/interface/bridge/port/print" in call for call in ssh_client.calls)
+    assert any("/interface/bridge/port/print terse without-paging" in call for call in ssh_client.calls)
 
 
 @pytest.mark.asyncio
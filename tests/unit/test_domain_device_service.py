@@ -10,6 +10,8 @@ from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.infra.db.models import Base
 from routeros_mcp.infra.db.models import Credential as CredentialORM
 from routeros_mcp.infra.db.models import Device as DeviceORM
+from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
 from routeros_mcp.infra.routeros.exceptions import RouterOSClientError, RouterOSSSHTimeoutError
 from routeros_mcp.mcp.errors import (
     AuthenticationError,
@@ -335,6 +337,36 @@ async def test_update_device_invalidates_cache_on_status_change(
     assert recorded == [("device", "status_change")]
 
 
+@pytest.mark.asyncio
+async def test_decommission_drops_device_metrics(
+    db_session: AsyncSession, settings: Settings
+) -> None:
+    service = DeviceService(db_session, settings)
+    await service.register_device(
+        DeviceCreate(
+            id="dev-retired",
+            name="router",
+            management_ip="192.0.2.31",
+            management_port=443,
+            environment="lab",
+        )
+    )
+
+    metrics.record_routeros_request("dev-retired", "lab", "GET", duration=0.05, success=True)
+    get_fleet_metrics().record(
+        "dev-retired", environment="lab", status="healthy", metrics={"cpu_usage_percent": 5.0}
+    )
+
+    await service.update_device("dev-retired", DeviceUpdate(status="degraded"))
+    assert "dev-retired" in get_fleet_metrics()
+    assert "dev-retired" in metrics.get_device_metrics_text()
+
+    await service.update_device("dev-retired", DeviceUpdate(status="decommissioned"))
+
+    assert "dev-retired" not in get_fleet_metrics()
+    assert "dev-retired" not in metrics.get_device_metrics_text()
+
+
 @pytest.mark.asyncio
 async def test_get_rest_client_raises_authentication_error_on_decrypt_failure(
     db_session: AsyncSession, settings: Settings, monkeypatch: pytest.MonkeyPatch
@@ -1520,3 +1552,60 @@ async def test_get_ssh_client_with_null_private_key_falls_back(
     assert client is fake_ssh_client
 
 
+
+
+@pytest.mark.asyncio
+async def test_request_scope_memoizes_device_and_credentials(
+    db_session: AsyncSession, settings: Settings, fake_rest_client
+):
+    from routeros_mcp.domain.request_context import get_request_context, request_scope
+
+    service = DeviceService(db_session, settings)
+    await service.register_device(
+        DeviceCreate(
+            id="dev-memo",
+            name="router-memo",
+            management_ip="192.0.2.10",
+            management_port=443,
+            environment="lab",
+        )
+    )
+    await service.add_credential(
+        CredentialCreate(
+            device_id="dev-memo", credential_type="rest", username="admin", password="pw"
+        )
+    )
+
+    statements: list[str] = []
+    original_execute = db_session.execute
+
+    async def counting_execute(statement, *args, **kwargs):
+        statements.append(str(statement))
+        return await original_execute(statement, *args, **kwargs)
+
+    db_session.execute = counting_execute  # type: ignore[method-assign]
+
+    with request_scope() as context:
+        # Tool authz check, service validation and client creation
+        await service.get_device("dev-memo")
+        await service.get_device("dev-memo")
+        await service.get_rest_client("dev-memo")
+        await service.get_rest_client("dev-memo")
+        assert len(statements) == 2
+        assert context.hits == 4
+
+        # Out-of-scope IDs are still rejected before consulting the memo
+        with pytest.raises(DeviceNotFoundError):
+            await service.get_device("dev-memo", allowed_device_ids=["dev-other"])
+
+        # Updates drop the memo so later reads see the new row
+        await service.update_device("dev-memo", DeviceUpdate(name="renamed"))
+        assert (await service.get_device("dev-memo")).name == "renamed"
+
+    assert get_request_context() is None
+
+    # Without a scope every call queries the database
+    statements.clear()
+    await service.get_device("dev-memo")
+    await service.get_device("dev-memo")
+    assert len(statements) == 2
@@ -78,7 +78,7 @@ class FakeSSHClient:
 
     async def execute(self, command):
         self.calls.append(("execute", command))
-        if command == "/ip/dhcp-server/print":
+        if command.startswith("/ip/dhcp-server/print"):
             return """Columns: NAME, INTERFACE, ADDRESS-POOL, LEASE-TIME
 # NAME                 INTERFACE       ADDRESS-POOL         LEASE-TIME
 0 dhcp-vlan20-mgmt     vlan20-mgmt     pool-vlan20-mgmt     30m       
@@ -3,14 +3,18 @@ from __future__ import annotations
 from types import SimpleNamespace
 from typing import Any
 
+import asyncio
+
 import pytest
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.diagnostics import (
     MAX_PING_COUNT,
     MAX_TRACEROUTE_COUNT,
+    MAX_SWEEP_PAIRS,
     MAX_TRACEROUTE_HOPS,
     DiagnosticsService,
+    PingSweepMatrix,
 )
 from routeros_mcp.infra.routeros.exceptions import RouterOSSSHError, RouterOSTimeoutError
 from routeros_mcp.mcp.errors import AuthenticationError, ValidationError
@@ -332,3 +336,169 @@ async def test_traceroute_rest_failure_falls_back_to_ssh() -> None:
     assert result["fallback_used"] is True
     assert "rest timeout" in (result["rest_error"] or "")
     assert result["hops"][1]["rtt_ms"] == 0.0
+
+
+class _SweepRestClient:
+    """REST client answering pings per target and tracking concurrency."""
+
+    def __init__(self, replies: dict[str, Any], delay: float = 0.0) -> None:
+        self._replies = replies
+        self._delay = delay
+        self.active = 0
+        self.peak = 0
+        self.closed = False
+
+    async def post(self, path: str, payload: dict[str, Any]) -> Any:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self._delay)
+            reply = self._replies[payload["address"]]
+            if isinstance(reply, Exception):
+                raise reply
+            if path == "/rest/tool/traceroute":
+                return [{"address": "192.0.2.1", "time": "1ms"}, {"address": payload["address"]}]
+            return reply
+        finally:
+            self.active -= 1
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _SweepDeviceService:
+    def __init__(self, clients: dict[str, Any]) -> None:
+        self._clients = clients
+
+    async def get_device(self, device_id: str) -> Any:
+        return SimpleNamespace(id=device_id)
+
+    async def get_rest_client(self, device_id: str) -> Any:
+        client = self._clients[device_id]
+        if isinstance(client, Exception):
+            raise client
+        return client
+
+
+_REPLY_OK = [{"status": "echo reply", "time": "10ms"}, {"status": "echo reply", "time": "20ms"}]
+_REPLY_LOSSY = [{"status": "echo reply", "time": "30ms"}, {"status": "timeout"}]
+_REPLY_DOWN = [{"status": "timeout"}, {"status": "timeout"}]
+
+
+def _sweep_service(clients: dict[str, Any], **settings: Any) -> DiagnosticsService:
+    service = DiagnosticsService(session=None, settings=Settings(**settings))
+    service.device_service = _SweepDeviceService(clients)
+    return service
+
+
+def test_ping_sweep_matrix_empty_cells_have_no_values() -> None:
+    matrix = PingSweepMatrix(["dev-1"], ["8.8.8.8", "1.1.1.1"])
+
+    cell = matrix.cell(1)
+
+    assert cell["device_id"] == "dev-1"
+    assert cell["target"] == "1.1.1.1"
+    assert cell["packet_loss_percent"] is None
+    assert cell["avg_rtt_ms"] is None
+    assert "hop_count" not in cell
+    assert matrix.to_dict()["avg_rtt_ms"] == [[None, None]]
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_fills_loss_latency_matrix() -> None:
+    replies = {"8.8.8.8": _REPLY_OK, "1.1.1.1": _REPLY_LOSSY, "192.0.2.9": _REPLY_DOWN}
+    clients = {"dev-1": _SweepRestClient(replies), "dev-2": _SweepRestClient(replies)}
+    service = _sweep_service(clients)
+
+    matrix = await service.ping_sweep(
+        ["dev-1", "dev-2"], ["8.8.8.8", "1.1.1.1", "192.0.2.9"], count=2
+    )
+    data = matrix.to_dict()
+    summary = matrix.summary()
+
+    assert data["devices"] == ["dev-1", "dev-2"]
+    assert data["packet_loss_percent"] == [[0.0, 50.0, 100.0], [0.0, 50.0, 100.0]]
+    assert data["avg_rtt_ms"][0] == [15.0, 30.0, None]
+    assert summary["pairs"] == 6
+    assert summary["completed"] == 6
+    assert summary["reachable_pairs"] == 4
+    assert summary["lossy_pairs"] == 2
+    assert summary["unreachable_pairs"] == 2
+    assert summary["unreachable_targets"] == ["192.0.2.9"]
+    assert all(client.closed for client in clients.values())
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_respects_per_device_concurrency() -> None:
+    targets = [f"10.0.0.{n}" for n in range(1, 9)]
+    clients = {
+        "dev-1": _SweepRestClient(dict.fromkeys(targets, _REPLY_OK), delay=0.01),
+        "dev-2": _SweepRestClient(dict.fromkeys(targets, _REPLY_OK), delay=0.01),
+    }
+    service = _sweep_service(clients, routeros_max_concurrent_per_device=2)
+
+    matrix = await service.ping_sweep(["dev-1", "dev-2"], targets, count=2)
+
+    assert matrix.completed == 16
+    assert clients["dev-1"].peak == 2
+    assert clients["dev-2"].peak == 2
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_records_errors_per_pair() -> None:
+    replies = {"8.8.8.8": _REPLY_OK, "1.1.1.1": RouterOSTimeoutError("ping timed out")}
+    clients = {
+        "dev-1": _SweepRestClient(replies),
+        "dev-2": AuthenticationError("bad token"),
+    }
+    service = _sweep_service(clients)
+
+    matrix = await service.ping_sweep(["dev-1", "dev-2"], ["8.8.8.8", "1.1.1.1"], count=2)
+    data = matrix.to_dict()
+
+    assert data["packet_loss_percent"][0] == [0.0, None]
+    assert {(e["device_id"], e["target"]) for e in data["errors"]} == {
+        ("dev-1", "1.1.1.1"),
+        ("dev-2", "8.8.8.8"),
+        ("dev-2", "1.1.1.1"),
+    }
+    assert "bad token" in matrix.cell(matrix.index(1, 0))["error"]
+    assert matrix.summary()["error_pairs"] == 3
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_streams_results_and_traceroute_hops() -> None:
+    clients = {"dev-1": _SweepRestClient({"8.8.8.8": _REPLY_OK, "1.1.1.1": _REPLY_OK})}
+    service = _sweep_service(clients)
+    received: list[tuple[str, int, int]] = []
+
+    async def on_result(cell: dict[str, Any], completed: int, total: int) -> None:
+        assert cell["hop_count"] == 2
+        received.append((cell["target"], completed, total))
+
+    matrix = await service.ping_sweep(
+        ["dev-1"], ["8.8.8.8", "1.1.1.1"], count=2, traceroute=True, on_result=on_result
+    )
+
+    assert sorted(target for target, _, _ in received) == ["1.1.1.1", "8.8.8.8"]
+    assert [completed for _, completed, _ in received] == [1, 2]
+    assert {total for _, _, total in received} == {2}
+    assert matrix.to_dict()["hop_count"] == [[2, 2]]
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_validates_limits() -> None:
+    service = _sweep_service({})
+
+    with pytest.raises(ValidationError):
+        await service.ping_sweep([], ["8.8.8.8"])
+    with pytest.raises(ValidationError):
+        await service.ping_sweep(["dev-1"], ["8.8.8.8"], count=MAX_PING_COUNT + 1)
+    with pytest.raises(ValidationError):
+        await service.ping_sweep(
+            ["dev-1"], ["8.8.8.8"], traceroute=True, max_hops=MAX_TRACEROUTE_HOPS + 1
+        )
+    with pytest.raises(ValidationError):
+        await service.ping_sweep(
+            [f"dev-{n}" for n in range(MAX_SWEEP_PAIRS + 1)], ["8.8.8.8"]
+        )
@@ -91,7 +91,7 @@ class _FakeSSHClient:
  0  info,warning     memory    sys
  1  firewall         disk      fw""",
         }
-        return outputs.get(command, "")
+        return outputs.get(command.split()[0], "")
 
     async def close(self):
         self.calls.append(("close", None))
@@ -273,7 +273,7 @@ async def test_list_address_lists_ssh_fallback_empty(fake_env):
     old_execute = device_service.ssh_client.execute
 
     async def execute_empty(command):
-        if command == "/ip/firewall/address-list/print":
+        if command.startswith("/ip/firewall/address-list/print"):
             return """ #    LIST         ADDRESS       COMMENT  TIMEOUT"""
         return await old_execute(command)
 
@@ -416,3 +416,85 @@ def test_parse_firewall_filter_print_output_uses_split_when_shlex_fails() -> Non
     assert parsed[0]["chain"] == "input"
     # The continuation line has an unbalanced quote; parser should fall back to line.split()
     assert parsed[0]["comment"] == '"unterminated'
+
+
+class _TailRestClient(_FakeRestClient):
+    """REST client whose log grows and which answers ``.id`` queries."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.store["/rest/log"] = [
+            {".id": "*1", "time": "00:00:01", "topics": "system,info", "message": "started"},
+            {".id": "*2", "time": "00:00:02", "topics": "firewall,info", "message": "drop"},
+        ]
+
+    async def post(self, path: str, data: dict):
+        self.calls.append(("post", path, data))
+        cursor = int(data[".query"][0].split("=*")[1], 16)
+        return [item for item in self.store["/rest/log"] if int(item[".id"][1:], 16) >= cursor]
+
+
+@pytest.mark.asyncio
+async def test_get_recent_logs_tail_mode_fetches_only_new_entries(monkeypatch):
+    client = _TailRestClient()
+    device_service = _FakeDeviceService(client)
+    monkeypatch.setattr(
+        firewall_logs_module, "DeviceService", lambda *args, **kwargs: device_service
+    )
+    service = firewall_logs_module.FirewallLogsService(session=None, settings=Settings())
+
+    logs, total = await service.get_recent_logs("dev-1", limit=10, tail=True)
+    assert [entry["id"] for entry in logs] == ["*1", "*2"]
+    assert total == 2
+    assert client.calls[0] == ("get", "/rest/log", None)
+
+    client.store["/rest/log"].append(
+        {".id": "*3", "time": "00:00:03", "topics": "firewall,warning", "message": "reject"}
+    )
+    client.calls.clear()
+
+    logs, total = await service.get_recent_logs("dev-1", limit=1, topics=["firewall"], tail=True)
+    assert [entry["id"] for entry in logs] == ["*3"]
+    assert logs[0]["transport"] == "rest"
+    assert total == 3
+    assert client.calls[0] == (
+        "post",
+        "/rest/log/print",
+        {".query": [".id=*2", ">.id=*2", "#|"]},
+    )
+    assert ("get", "/rest/log", None) not in client.calls
+
+
+@pytest.mark.asyncio
+async def test_tail_logs_resyncs_when_cursor_entry_is_gone(monkeypatch):
+    client = _TailRestClient()
+    device_service = _FakeDeviceService(client)
+    monkeypatch.setattr(
+        firewall_logs_module, "DeviceService", lambda *args, **kwargs: device_service
+    )
+    service = firewall_logs_module.FirewallLogsService(session=None, settings=Settings())
+    await service.tail_logs("dev-1")
+
+    # Device rebooted: log restarted with lower IDs
+    client.store["/rest/log"] = [
+        {".id": "*0", "time": "00:00:00", "topics": "system,info", "message": "booted"}
+    ]
+    fresh = await service.tail_logs("dev-1")
+
+    assert [entry.message for entry in fresh] == ["booted"]
+    assert client.calls[-2] == ("get", "/rest/log", None)
+
+
+@pytest.mark.asyncio
+async def test_tail_logs_ssh_fallback(fake_env):
+    _, device_service = fake_env
+    device_service.rest_fails = True
+    service = firewall_logs_module.FirewallLogsService(session=None, settings=Settings())
+
+    first = await service.tail_logs("dev-1")
+    again = await service.tail_logs("dev-1")
+
+    assert [entry.message for entry in first] == ["started", "drop"]
+    assert first[0].transport == "ssh"
+    assert first[0].rest_error == "Simulated REST timeout"
+    assert again == []
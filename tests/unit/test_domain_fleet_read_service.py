@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services import fleet_read
+from routeros_mcp.domain.services.fleet_read import FleetReadService, FleetSelection
+from routeros_mcp.mcp.errors import ValidationError
+from tests.unit.mcp_tools_test_utils import FakeSessionFactory
+
+
+def _device(
+    device_id: str,
+    environment: str = "lab",
+    status: str = "healthy",
+    tags: dict[str, str] | None = None,
+) -> Any:
+    return SimpleNamespace(
+        id=device_id,
+        environment=environment,
+        status=status,
+        tags=tags or {},
+        allow_advanced_writes=False,
+        allow_professional_workflows=False,
+    )
+
+
+FLEET = [
+    _device("dev-1", tags={"site": "dc1"}),
+    _device("dev-2", tags={"site": "dc2"}),
+    _device("dev-3", tags={"site": "dc1"}, status="decommissioned"),
+    _device("dev-prod", environment="prod", tags={"site": "dc1"}),
+]
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> FleetReadService:
+    class StubDeviceService:
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+        async def list_devices(
+            self, environment: str | None = None, allowed_device_ids: list[str] | None = None
+        ) -> list[Any]:
+            return [
+                d
+                for d in FLEET
+                if (environment is None or d.environment == environment)
+                and (not allowed_device_ids or d.id in allowed_device_ids)
+            ]
+
+    monkeypatch.setattr(fleet_read, "DeviceService", StubDeviceService)
+    return FleetReadService(FakeSessionFactory(), Settings(environment="lab"))
+
+
+@pytest.mark.asyncio
+async def test_select_devices_requires_a_selector(service: FleetReadService) -> None:
+    with pytest.raises(ValidationError):
+        await service.select_devices()
+
+
+@pytest.mark.asyncio
+async def test_select_devices_by_tags_skips_decommissioned(service: FleetReadService) -> None:
+    selection = await service.select_devices(environment="lab", tags={"site": "dc1"})
+
+    assert selection.device_ids == ["dev-1"]
+    assert selection.errors == []
+
+
+@pytest.mark.asyncio
+async def test_select_devices_reports_missing_and_unauthorized(
+    service: FleetReadService,
+) -> None:
+    selection = await service.select_devices(
+        device_ids=["dev-2", "dev-missing", "dev-prod", "dev-2"],
+        tool_name="fleet/get-arp-table",
+    )
+
+    assert selection.device_ids == ["dev-2"]
+    errors = {error["device_id"]: error["error"] for error in selection.errors}
+    assert errors["dev-missing"] == "Device not found"
+    assert "prod" in errors["dev-prod"]
+
+
+@pytest.mark.asyncio
+async def test_select_devices_enforces_max_devices(service: FleetReadService) -> None:
+    service.settings = Settings(environment="lab", fleet_read_max_devices=1)
+
+    with pytest.raises(ValidationError, match="limited to 1"):
+        await service.select_devices(environment="lab")
+
+
+@pytest.mark.asyncio
+async def test_read_merges_items_and_reports_failures(service: FleetReadService) -> None:
+    selection = FleetSelection(
+        devices=[_device(f"dev-{n}") for n in range(6)],
+        errors=[{"device_id": "dev-missing", "error": "Device not found"}],
+    )
+    service.settings = Settings(environment="lab", fleet_read_max_concurrency=2)
+    active = peak = 0
+    events: list[dict[str, Any]] = []
+
+    async def read(_session: Any, device_id: str) -> list[dict[str, Any]]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if device_id == "dev-4":
+            raise ConnectionError("connection refused")
+        return [{"address": f"10.0.0.{device_id[-1]}"}]
+
+    result = await service.read(selection, read, on_progress=events.append)
+
+    assert peak == 2
+    assert [item["device_id"] for item in result.items] == [
+        "dev-0",
+        "dev-1",
+        "dev-2",
+        "dev-3",
+        "dev-5",
+    ]
+    assert result.items[0] == {"device_id": "dev-0", "address": "10.0.0.0"}
+    assert [error["device_id"] for error in result.errors] == ["dev-missing", "dev-4"]
+    assert "connection refused" in result.errors[1]["error"]
+    assert result.summary() == {
+        "devices_total": 7,
+        "devices_succeeded": 5,
+        "devices_failed": 2,
+        "items_total": 5,
+    }
+    completed = [event for event in events if event["event"] == "device_completed"]
+    assert len(completed) == 6
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -8,6 +9,7 @@ import pytest
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services.interface import InterfaceService
 from routeros_mcp.infra.routeros.exceptions import RouterOSNetworkError
+from routeros_mcp.infra.routeros.traffic_counters import COUNTER_FIELDS, get_traffic_store
 
 
 class _FakeRestClient:
@@ -22,7 +24,10 @@ class _FakeRestClient:
         if self._exc:
             raise self._exc
         if self._responses:
-            return self._responses.pop(0)
+            response = self._responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
         return {}
 
     async def close(self) -> None:
@@ -40,6 +45,7 @@ class _FakeSSHClient:
         self._exc_for = exc_for or set()
         self.closed = False
         self.commands: list[str] = []
+        self.batches: list[list[str]] = []
 
     async def execute(self, command: str) -> str:
         self.commands.append(command)
@@ -47,6 +53,13 @@ class _FakeSSHClient:
             raise RuntimeError(f"ssh failed for {command}")
         return self._outputs.get(command, "")
 
+    async def execute_many(self, commands: list[str]) -> list[str]:
+        # Like a RouterOS script, the batch aborts at the first failing command
+        self.batches.append(list(commands))
+        if self._exc_for & set(commands):
+            raise RuntimeError("ssh batch aborted")
+        return [self._outputs.get(command, "") for command in commands]
+
     async def close(self) -> None:
         self.closed = True
 
@@ -141,7 +154,7 @@ async def test_get_interface_stats_via_ssh_skips_empty_name_and_filtered_names()
     rest_client = _FakeRestClient(exc=RouterOSNetworkError("rest down"))
     ssh_client = _FakeSSHClient(
         outputs={
-            "/interface/print": "ignored",
+            "/interface/print terse without-paging": "ignored",
             "/interface/monitor-traffic ether1 once": "rx-bits-per-second: 1bps\n",
         }
     )
@@ -211,7 +224,7 @@ Flags: D - DYNAMIC; R - RUNNING; S - SLAVE
  # NAME TYPE ACTUAL-MTU L2MTU MAX-L2MTU MAC-ADDRESS
  0  R ether1 ether 1500 1514 9796 78:9A:18:A2:F3:D2
 """
-    ssh_client = _FakeSSHClient(outputs={"/interface/print": ssh_output})
+    ssh_client = _FakeSSHClient(outputs={"/interface/print terse without-paging": ssh_output})
 
     service = InterfaceService(MagicMock(), _make_settings())
     service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=ssh_client)
@@ -229,7 +242,7 @@ Flags: D - DYNAMIC; R - RUNNING; S - SLAVE
 @pytest.mark.asyncio
 async def test_list_interfaces_when_both_transports_fail_raises_runtime_error() -> None:
     rest_client = _FakeRestClient(exc=RouterOSNetworkError("rest down"))
-    ssh_client = _FakeSSHClient(exc_for={"/interface/print"})
+    ssh_client = _FakeSSHClient(exc_for={"/interface/print terse without-paging"})
 
     service = InterfaceService(MagicMock(), _make_settings())
     service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=ssh_client)
@@ -277,7 +290,7 @@ Flags: D - DYNAMIC; R - RUNNING; S - SLAVE
  # NAME TYPE ACTUAL-MTU L2MTU MAX-L2MTU MAC-ADDRESS
  0  R ether1 ether 1500 1514 9796 78:9A:18:A2:F3:D2
 """
-    ssh_client = _FakeSSHClient(outputs={"/interface/print": ssh_output})
+    ssh_client = _FakeSSHClient(outputs={"/interface/print terse without-paging": ssh_output})
 
     service = InterfaceService(MagicMock(), _make_settings())
     service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=ssh_client)
@@ -292,7 +305,7 @@ Flags: D - DYNAMIC; R - RUNNING; S - SLAVE
 @pytest.mark.asyncio
 async def test_get_interface_when_both_transports_fail_raises_runtime_error() -> None:
     rest_client = _FakeRestClient(exc=RouterOSNetworkError("rest down"))
-    ssh_client = _FakeSSHClient(exc_for={"/interface/print"})
+    ssh_client = _FakeSSHClient(exc_for={"/interface/print terse without-paging"})
 
     service = InterfaceService(MagicMock(), _make_settings())
     service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=ssh_client)
@@ -309,7 +322,7 @@ Flags: D - DYNAMIC; R - RUNNING; S - SLAVE
  # NAME TYPE ACTUAL-MTU L2MTU MAX-L2MTU MAC-ADDRESS
  0  R ether1 ether 1500 1514 9796 78:9A:18:A2:F3:D2
 """
-    ssh_client = _FakeSSHClient(outputs={"/interface/print": ssh_output})
+    ssh_client = _FakeSSHClient(outputs={"/interface/print terse without-paging": ssh_output})
 
     service = InterfaceService(MagicMock(), _make_settings())
     service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=ssh_client)
@@ -365,6 +378,62 @@ async def test_get_interface_stats_via_rest_filters_out_unexpected_interface_nam
     assert stats == []
 
 
+@pytest.mark.asyncio
+async def test_get_interface_stats_via_rest_samples_interfaces_in_one_request() -> None:
+    rest_client = _FakeRestClient(
+        responses=[
+            [
+                {"name": "ether2", "rx-bits-per-second": 2},
+                {"name": "ether1", "rx-bits-per-second": 1},
+                {"name": "ether3", "rx-bits-per-second": 3},
+            ]
+        ]
+    )
+
+    service = InterfaceService(MagicMock(), _make_settings())
+    service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=None)
+
+    stats = await service.get_interface_stats("dev-1", ["ether1", "ether2", "ether3"])
+
+    assert [(s["name"], s["rx_bits_per_second"]) for s in stats] == [
+        ("ether1", 1),
+        ("ether2", 2),
+        ("ether3", 3),
+    ]
+    assert len(rest_client.calls) == 1
+    assert rest_client.calls[0][1]["interface"] == "ether1,ether2,ether3"
+
+
+@pytest.mark.asyncio
+async def test_get_interface_stats_via_rest_retries_interfaces_missing_from_batch() -> None:
+    rest_client = _FakeRestClient(
+        responses=[
+            # Batch response lacks ether3, which is then sampled on its own
+            [{"name": "ether1", "rx-bits-per-second": 1}, {"name": "ether2"}],
+            {"name": "ether3", "rx-bits-per-second": 3},
+            # Second call: the whole batch fails (e.g. unknown interface name)
+            RouterOSNetworkError("no such item"),
+            {"name": "ether1", "rx-bits-per-second": 10},
+            {"name": "ether2", "rx-bits-per-second": 20},
+        ]
+    )
+
+    service = InterfaceService(MagicMock(), _make_settings())
+    service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=None)
+
+    stats = await service._get_interface_stats_via_rest("dev-1", ["ether1", "ether2", "ether3"])
+    assert [s["rx_bits_per_second"] for s in stats] == [1, 0, 3]
+    assert [call[1]["interface"] for call in rest_client.calls] == ["ether1,ether2,ether3", "ether3"]
+
+    stats = await service._get_interface_stats_via_rest("dev-1", ["ether1", "ether2"])
+    assert [s["rx_bits_per_second"] for s in stats] == [10, 20]
+    assert [call[1]["interface"] for call in rest_client.calls[2:]] == [
+        "ether1,ether2",
+        "ether1",
+        "ether2",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_interface_stats_when_rest_fails_uses_ssh_and_falls_back_to_zeros() -> None:
     rest_client = _FakeRestClient(exc=RouterOSNetworkError("rest down"))
@@ -383,7 +452,7 @@ tx-bits-per-second: 2bps
 
     ssh_client = _FakeSSHClient(
         outputs={
-            "/interface/print": ssh_interfaces,
+            "/interface/print terse without-paging": ssh_interfaces,
             "/interface/monitor-traffic ether1 once": ssh_monitor_ok,
         },
         exc_for={"/interface/monitor-traffic ether2 once"},
@@ -401,11 +470,39 @@ tx-bits-per-second: 2bps
     assert ether2["rx_bits_per_second"] == 0
     assert ether2["transport"] == "ssh"
 
+    # The aborted batch fell back to one command per interface
+    assert ssh_client.batches == [
+        ["/interface/monitor-traffic ether1 once", "/interface/monitor-traffic ether2 once"]
+    ]
+    assert "/interface/monitor-traffic ether1 once" in ssh_client.commands
+
+
+@pytest.mark.asyncio
+async def test_get_interface_stats_ssh_batches_monitor_traffic_in_one_session() -> None:
+    rest_client = _FakeRestClient(exc=RouterOSNetworkError("rest down"))
+    ssh_client = _FakeSSHClient(
+        outputs={
+            "/interface/print terse without-paging": " 0  R ether1 ether 1500\n 1  R ether2 ether 1500\n",
+            "/interface/monitor-traffic ether1 once": "rx-bits-per-second: 1kbps\n",
+            "/interface/monitor-traffic ether2 once": "rx-bits-per-second: 2kbps\n",
+        },
+    )
+
+    service = InterfaceService(MagicMock(), _make_settings())
+    service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=ssh_client)
+
+    stats = await service.get_interface_stats("dev-1", ["ether2"])
+
+    assert [s["name"] for s in stats] == ["ether2"]
+    assert stats[0]["rx_bits_per_second"] == 2000
+    assert ssh_client.batches == [["/interface/monitor-traffic ether2 once"]]
+    assert ssh_client.commands == ["/interface/print terse without-paging"]
+
 
 @pytest.mark.asyncio
 async def test_get_interface_stats_when_both_transports_fail_raises_runtime_error() -> None:
     rest_client = _FakeRestClient(exc=RouterOSNetworkError("rest down"))
-    ssh_client = _FakeSSHClient(exc_for={"/interface/print"})
+    ssh_client = _FakeSSHClient(exc_for={"/interface/print terse without-paging"})
 
     service = InterfaceService(MagicMock(), _make_settings())
     service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=ssh_client)
@@ -440,3 +537,43 @@ async def test_get_interface_stats_via_rest_when_no_interface_names_uses_list_in
             "tx_packets_per_second": 0,
         }
     ]
+
+
+@pytest.mark.asyncio
+async def test_get_interface_stats_answers_from_sampled_counters() -> None:
+    rest_client = _FakeRestClient(exc=RouterOSNetworkError("must not be called"))
+    store = get_traffic_store()
+    now = time.time()
+    store.record("dev-1", [{"name": "ether1", "rx-byte": "0", "tx-byte": "0"}], now - 60)
+    store.record("dev-1", [{"name": "ether1", "rx-byte": "7500", "tx-byte": "1500"}], now)
+
+    service = InterfaceService(MagicMock(), _make_settings())
+    service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=None)
+
+    stats = await service.get_interface_stats("dev-1", ["ether1"])
+
+    assert len(stats) == 1
+    assert stats[0]["source"] == "counters"
+    assert stats[0]["transport"] == "rest"
+    assert stats[0]["rx_bits_per_second"] == 1000
+    assert stats[0]["tx_bits_per_second"] == 200
+    assert rest_client.calls == []
+    # The read marks the device for background collection
+    assert store.watched() == ["dev-1"]
+
+
+@pytest.mark.asyncio
+async def test_collect_traffic_counters_requests_counter_columns_only() -> None:
+    rest_client = _FakeRestClient(
+        responses=[[{"name": "ether1", "rx-byte": "10"}, {"name": "ether2", "rx-byte": "20"}]]
+    )
+
+    service = InterfaceService(MagicMock(), _make_settings())
+    service.device_service = _StubDeviceService(rest_client=rest_client, ssh_client=None)
+
+    assert await service.collect_traffic_counters("dev-1") == 2
+    assert rest_client.calls == [
+        ("/rest/interface", {".proplist": "name," + ",".join(COUNTER_FIELDS)})
+    ]
+    assert rest_client.closed is True
+    assert get_traffic_store().samples("dev-1") == 1
@@ -39,6 +39,17 @@ class FakeRestClient:
                     "status": "complete",
                 }
             ],
+            "/rest/ip/neighbor": [
+                {
+                    ".id": "*1",
+                    "interface": "ether2,bridge",
+                    "address": "10.0.0.9",
+                    "mac-address": "48:8F:5A:00:00:01",
+                    "identity": "access-1",
+                    "platform": "MikroTik",
+                    "interface-name": "ether1",
+                }
+            ],
         }
 
     async def get(self, path):
@@ -63,16 +74,21 @@ class FakeSSHClient:
 
     async def execute(self, command):
         self.calls.append(("execute", command))
-        if command == "/ip/address/print":
+        if command == "/ip/address/print terse without-paging":
             return """Flags: D - disabled, X - invalid
  #    ADDRESS            NETWORK         INTERFACE
  *1   10.0.0.2/24        10.0.0.0/24     ether1
  *2   10.0.0.5/24        10.0.0.0/24     ether2"""
-        elif command == "/ip/arp/print":
+        elif command == "/ip/arp/print terse without-paging":
             return """Flags: D - DYNAMIC; C - COMPLETE
 Columns: ADDRESS, MAC-ADDRESS, INTERFACE, STATUS
     #    ADDRESS         MAC-ADDRESS        INTERFACE    STATUS
 0 DC 10.0.0.3        00:11:22:33:44:55  ether1       reachable"""
+        elif command == "/ip/neighbor/print terse without-paging":
+            return (
+                " 0 interface=ether2,bridge address=10.0.0.9 mac-address=48:8F:5A:00:00:01 "
+                "identity=access-1 platform=MikroTik interface-name=ether1"
+            )
         return ""
 
     async def close(self):
@@ -251,6 +267,39 @@ Columns: ADDRESS, MAC-ADDRESS, INTERFACE, STATUS
     assert result[3]["status"] == "reachable"
 
 
+@pytest.mark.asyncio
+async def test_list_neighbors_rest_and_ssh_fallback(service):
+    """Neighbours are normalized the same way from REST and from print terse."""
+    svc, dev = service
+
+    rest = await svc.list_neighbors("dev1")
+    dev.rest_fails = True
+    ssh = await svc.list_neighbors("dev1")
+
+    assert rest[0]["interface"] == "ether2,bridge"
+    assert rest[0]["identity"] == "access-1"
+    assert rest[0]["interface_name"] == "ether1"
+    assert rest[0]["transport"] == "rest"
+    assert ssh[0]["transport"] == "ssh"
+    assert ssh[0]["fallback_used"] is True
+    for key in ("interface", "address", "mac_address", "identity", "platform", "interface_name"):
+        assert ssh[0][key] == rest[0][key]
+
+
+@pytest.mark.asyncio
+async def test_list_addresses_feeds_topology_graph(service):
+    """Fresh reads update the topology graph when it is enabled."""
+    from routeros_mcp.infra.routeros.topology import get_topology_graph
+
+    svc, _dev = service
+    svc.settings = Settings(topology_enabled=True)
+
+    await svc.list_addresses("dev1")
+
+    assert get_topology_graph().resolve("10.0.0.7") == "subnet:10.0.0.0/24"
+    assert get_topology_graph().node("dev1:ether1")["addresses"] == ["10.0.0.2/24"]
+
+
 @pytest.mark.asyncio
 async def test_add_secondary_address_dry_run(service):
     svc, _ = service
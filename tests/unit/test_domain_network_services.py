@@ -113,13 +113,13 @@ class _FakeRestClient:
     async def get(self, path: str, params: dict | None = None):
         self.calls.append(("get", path, params))
 
-        # Simulate monitor-traffic per-interface filtering
+        # Simulate monitor-traffic filtering (comma-separated interface lists)
         if path == "/rest/interface/monitor-traffic":
             data = self.store.get(path, [])
             if params and params.get("interface"):
-                iface = params["interface"]
+                ifaces = set(params["interface"].split(","))
                 if isinstance(data, list):
-                    filtered = [item for item in data if item.get("name") == iface]
+                    filtered = [item for item in data if item.get("name") in ifaces]
                     if filtered:
                         return filtered
                 return []
@@ -255,6 +255,79 @@ async def test_firewall_service_add_remove(fake_env, monkeypatch: pytest.MonkeyP
         )
 
 
+@pytest.mark.asyncio
+async def test_firewall_service_sync_address_list(fake_env):
+    client, _ = fake_env
+    client.store["/rest/ip/firewall/address-list"] += [
+        {".id": "*c", "list": "mcp-managed", "address": "203.0.113.0/24"},
+        {".id": "*d", "list": "mcp-managed", "address": "192.0.2.1"},
+        {".id": "*e", "list": "mcp-managed", "address": "192.0.2.50", "dynamic": True},
+    ]
+    service = firewall_module.FirewallService(session=None, settings=Settings())
+    desired = ["192.0.2.1/32", "198.51.100.0/24", "198.51.100.0/24"]
+
+    preview = await service.sync_address_list("dev-1", "mcp-managed", desired, dry_run=True)
+    assert preview["to_add"] == 1
+    # Stale network plus the duplicate 192.0.2.1 entry; dynamic entries are kept
+    assert preview["to_remove"] == 2
+    assert preview["sample_add"] == ["198.51.100.0/24"]
+    assert preview["sample_remove"] == ["203.0.113.0/24"]
+    assert not any(call[0] in ("put", "delete") for call in client.calls)
+    assert ("get", "/rest/ip/firewall/address-list", {"list": "mcp-managed"}) in client.calls
+
+    progress: list[tuple[int, int]] = []
+    result = await service.sync_address_list(
+        "dev-1",
+        "mcp-managed",
+        desired,
+        comment="feed",
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    assert (result["added"], result["removed"], result["error_count"]) == (1, 2, 0)
+    assert result["changed"] is True
+    assert progress == [(3, 3)]
+    assert set(result["timing"]) == {"fetch_ms", "diff_ms", "apply_ms", "total_ms"}
+    assert (
+        "put",
+        "/rest/ip/firewall/address-list",
+        {"list": "mcp-managed", "address": "198.51.100.0/24", "comment": "feed"},
+    ) in client.calls
+    deleted = {call[1] for call in client.calls if call[0] == "delete"}
+    assert deleted == {"/rest/ip/firewall/address-list/*c", "/rest/ip/firewall/address-list/*d"}
+
+
+@pytest.mark.asyncio
+async def test_firewall_service_address_list_rest_string_flags(fake_env):
+    client, _ = fake_env
+    # Real RouterOS REST responses carry flags as "true"/"false" strings
+    client.store["/rest/ip/firewall/address-list"] = [
+        {".id": "*a", "list": "mcp-managed", "address": "192.0.2.1", "dynamic": "false"},
+        {".id": "*b", "list": "mcp-managed", "address": "192.0.2.1", "dynamic": "false"},
+        {".id": "*c", "list": "mcp-managed", "address": "203.0.113.7", "dynamic": "false"},
+        {
+            ".id": "*d",
+            "list": "mcp-managed",
+            "address": "192.0.2.50",
+            "dynamic": "true",
+            "disabled": "false",
+        },
+    ]
+    service = firewall_module.FirewallService(session=None, settings=Settings())
+
+    entries = await service.list_address_lists("dev-1", "mcp-managed")
+    assert [(e["dynamic"], e["disabled"]) for e in entries] == [
+        (False, False),
+        (False, False),
+        (False, False),
+        (True, False),
+    ]
+
+    result = await service.sync_address_list("dev-1", "mcp-managed", ["192.0.2.1"])
+    assert (result["added"], result["removed"]) == (0, 2)
+    deleted = {call[1] for call in client.calls if call[0] == "delete"}
+    assert deleted == {"/rest/ip/firewall/address-list/*b", "/rest/ip/firewall/address-list/*c"}
+
+
 @pytest.mark.asyncio
 async def test_routing_service_summary(fake_env):
     client, _ = fake_env
@@ -231,7 +231,7 @@ async def test_get_capsman_remote_caps_via_ssh_fallback():
     assert caps[0]["fallback_used"] is True
 
     # Verify SSH was called
-    assert ("execute", "/caps-man/remote-cap/print without-paging") in ssh_client.calls
+    assert ("execute", "/caps-man/remote-cap/print terse without-paging") in ssh_client.calls
 
 
 @pytest.mark.asyncio
@@ -319,7 +319,7 @@ async def test_get_capsman_registrations_via_ssh_fallback():
     assert registrations[0]["fallback_used"] is True
 
     # Verify SSH was called
-    assert ("execute", "/caps-man/registration-table/print without-paging") in ssh_client.calls
+    assert ("execute", "/caps-man/registration-table/print terse without-paging") in ssh_client.calls
 
 
 @pytest.mark.asyncio
@@ -220,7 +220,7 @@ async def test_get_wireless_interfaces_via_ssh_fallback():
     assert interfaces[0]["fallback_used"] is True
 
     # Verify SSH was called
-    assert ("execute", "/interface/wireless/print") in ssh_client.calls
+    assert ("execute", "/interface/wireless/print terse without-paging") in ssh_client.calls
 
 
 @pytest.mark.asyncio
@@ -297,7 +297,7 @@ async def test_get_wireless_clients_via_ssh_fallback():
     assert clients[0]["fallback_used"] is True
 
     # Verify SSH was called
-    assert ("execute", "/interface/wireless/registration-table/print") in ssh_client.calls
+    assert ("execute", "/interface/wireless/registration-table/print terse without-paging") in ssh_client.calls
 
 
 def test_parse_signal_strength():
@@ -0,0 +1,199 @@
+"""Tests for the columnar fleet metrics snapshot and get_fleet_metrics tool."""
+
+import math
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.models import HealthCheckResult
+from routeros_mcp.infra.observability.fleet_metrics import (
+    FleetMetricsSnapshot,
+    get_fleet_metrics,
+)
+from routeros_mcp.mcp_tools import device as device_tools
+
+from tests.unit.mcp_tools_test_utils import DummyMCP
+
+
+def _snapshot() -> FleetMetricsSnapshot:
+    snapshot = FleetMetricsSnapshot()
+    rows = [
+        ("dev-1", "prod", "healthy", {"site": "dc1", "role": "core"}, 10.0),
+        ("dev-2", "prod", "degraded", {"site": "dc1"}, 95.0),
+        ("dev-3", "prod", "healthy", {"site": "dc2"}, 40.0),
+        ("dev-4", "lab", "healthy", {}, 20.0),
+        ("dev-5", "lab", "unreachable", {"site": "dc2"}, None),
+    ]
+    for device_id, environment, status, tags, cpu in rows:
+        snapshot.record(
+            device_id,
+            environment=environment,
+            status=status,
+            tags=tags,
+            metrics={"cpu_usage_percent": cpu},
+            timestamp=1000.0,
+        )
+    return snapshot
+
+
+class TestFleetMetricsSnapshot:
+    """Aggregation, filtering and row maintenance."""
+
+    def test_aggregate_skips_missing_values(self) -> None:
+        summary = _snapshot().aggregate("cpu_usage_percent", percentiles=(50, 95))
+
+        assert summary == {
+            "count": 4,
+            "min": 10.0,
+            "mean": 41.25,
+            "p50": 30.0,
+            "p95": 86.75,
+            "max": 95.0,
+        }
+
+    def test_filters_combine(self) -> None:
+        snapshot = _snapshot()
+
+        assert snapshot.aggregate("cpu_usage_percent", environment="prod")["count"] == 3
+        assert snapshot.aggregate("cpu_usage_percent", tag="site=dc1")["max"] == 95.0
+        assert snapshot.aggregate("cpu_usage_percent", tag="role")["count"] == 1
+        assert snapshot.aggregate("cpu_usage_percent", tag="rack=7") == {"count": 0}
+        assert snapshot.devices(environment="prod", status="healthy") == ["dev-1", "dev-3"]
+        assert snapshot.status_counts(environment="lab") == {"healthy": 1, "unreachable": 1}
+
+    def test_top_k(self) -> None:
+        snapshot = _snapshot()
+
+        top = snapshot.top_k("cpu_usage_percent", 2)
+        assert [row["device_id"] for row in top] == ["dev-2", "dev-3"]
+        assert top[0] == {
+            "device_id": "dev-2",
+            "environment": "prod",
+            "status": "degraded",
+            "cpu_usage_percent": 95.0,
+        }
+        lowest = snapshot.top_k("cpu_usage_percent", 10, environment="lab", lowest=True)
+        assert [row["device_id"] for row in lowest] == ["dev-4"]
+
+    def test_breakdown_by_environment_and_tag(self) -> None:
+        snapshot = _snapshot()
+
+        by_env = snapshot.breakdown("cpu_usage_percent", "environment")
+        assert by_env["prod"]["devices"] == 3
+        assert by_env["prod"]["p50"] == 40.0
+        # The unreachable lab device counts as a device but has no value
+        assert (by_env["lab"]["devices"], by_env["lab"]["count"]) == (2, 1)
+
+        by_site = snapshot.breakdown("cpu_usage_percent", "tag:site", environment="prod")
+        assert {site: group["devices"] for site, group in by_site.items()} == {
+            "dc1": 2,
+            "dc2": 1,
+        }
+        assert snapshot.breakdown("cpu_usage_percent", "tag:rack") == {}
+        with pytest.raises(ValueError):
+            snapshot.breakdown("cpu_usage_percent", "name")
+        with pytest.raises(ValueError):
+            snapshot.aggregate("temperature")
+
+    def test_record_replaces_and_remove_keeps_columns_aligned(self) -> None:
+        snapshot = _snapshot()
+        snapshot.record(
+            "dev-2",
+            environment="prod",
+            status="healthy",
+            tags={"site": "dc3"},
+            metrics={"cpu_usage_percent": 5.0},
+        )
+
+        assert snapshot.remove("dev-1") is True
+        assert snapshot.remove("dev-1") is False
+        assert snapshot.retain(["dev-2", "dev-3", "dev-4"]) == 1
+
+        assert len(snapshot) == 3
+        assert "dev-5" not in snapshot
+        assert snapshot.top_k("cpu_usage_percent", 1, tag="site=dc3")[0]["device_id"] == "dev-2"
+        assert snapshot.aggregate("cpu_usage_percent")["max"] == 40.0
+        assert snapshot.status_counts() == {"healthy": 3}
+
+    def test_missing_model_and_tag_values_are_not_grouped(self) -> None:
+        snapshot = FleetMetricsSnapshot()
+        snapshot.record("dev-1", environment="lab", status="healthy", tags={"site": None})
+        snapshot.record("dev-2", environment="lab", status="healthy", model="", tags={"site": ""})
+        snapshot.record("dev-3", environment="lab", status="degraded", model="RB5009",
+                        tags={"site": "dc1"})
+
+        assert snapshot.status_counts_by("model") == {"RB5009": {"degraded": 1}}
+        assert snapshot.status_counts_by("tag:site") == {"dc1": {"degraded": 1}}
+        assert snapshot.devices(tag="site") == ["dev-3"]
+
+    def test_copy_is_independent(self) -> None:
+        snapshot = _snapshot()
+        clone = snapshot.copy()
+        snapshot.record("dev-6", environment="lab", status="healthy", tags={"rack": "r1"})
+        snapshot.remove("dev-2")
+
+        assert len(clone) == 5
+        assert clone.breakdown("cpu_usage_percent", "tag:rack") == {}
+        assert clone.top_k("cpu_usage_percent", 1)[0]["device_id"] == "dev-2"
+
+    def test_record_health(self) -> None:
+        snapshot = FleetMetricsSnapshot()
+        timestamp = datetime(2026, 1, 16, 8, 0, tzinfo=UTC)
+        device = SimpleNamespace(id="dev-1", environment="lab", tags={"site": "dc1"})
+        result = HealthCheckResult(
+            device_id="dev-1",
+            status="degraded",
+            timestamp=timestamp,
+            cpu_usage_percent=80.0,
+            memory_usage_percent=50.5,
+        )
+
+        snapshot.record_health(device, result)
+
+        assert snapshot.last_updated("dev-1") == timestamp.timestamp()
+        assert snapshot.aggregate("memory_usage_percent")["mean"] == 50.5
+        assert snapshot.aggregate("uptime_seconds") == {"count": 0}
+        assert math.isnan(snapshot._metrics["uptime_seconds"][0])
+
+
+class TestGetFleetMetricsTool:
+    """get_fleet_metrics MCP tool."""
+
+    @pytest.fixture
+    def tool(self):
+        mcp = DummyMCP()
+        device_tools.register_device_tools(mcp, Settings())
+        return mcp.tools["get_fleet_metrics"]
+
+    async def test_summary_top_devices_and_groups(self, tool) -> None:
+        snapshot = get_fleet_metrics()
+        for device_id, cpu in (("dev-1", 10.0), ("dev-2", 90.0)):
+            snapshot.record(
+                device_id,
+                environment="prod",
+                status="healthy",
+                metrics={"cpu_usage_percent": cpu},
+            )
+
+        result = await tool(group_by="environment", top_k=1)
+
+        assert result["isError"] is False
+        meta = result["_meta"]
+        assert meta["summary"]["max"] == 90.0
+        assert [row["device_id"] for row in meta["top_devices"]] == ["dev-2"]
+        assert meta["groups"]["prod"]["devices"] == 2
+        assert "p95" in result["content"][0]["text"]
+
+    async def test_validation_errors(self, tool) -> None:
+        assert (await tool(metric="temperature"))["isError"] is True
+        assert (await tool(top_k=1000))["isError"] is True
+        result = await tool(group_by="site")
+        assert result["isError"] is True
+        assert result["_meta"]["group_by"] == "site"
+
+    async def test_empty_snapshot(self, tool) -> None:
+        result = await tool()
+        assert result["isError"] is False
+        assert result["_meta"]["summary"] == {"count": 0}
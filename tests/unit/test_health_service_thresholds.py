@@ -7,6 +7,8 @@ import pytest
 
 from routeros_mcp.config import Settings
 from routeros_mcp.domain.services import health as health_module
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
+from routeros_mcp.infra.observability.metrics import get_device_metrics
 
 if TYPE_CHECKING:
     from routeros_mcp.domain.models import HealthCheckResult
@@ -88,6 +90,15 @@ async def test_run_health_check_with_issues(monkeypatch: pytest.MonkeyPatch):
     assert any("CPU" in issue for issue in result.issues) or any(
         "memory" in issue.lower() for issue in result.issues
     )
+
+    # The result also lands in the fleet metrics snapshot
+    snapshot = get_fleet_metrics()
+    assert snapshot.status_counts() == {"degraded": 1}
+    assert snapshot.aggregate("cpu_usage_percent")["max"] == 95.0
+    # ... and in the per-device metrics store
+    assert get_device_metrics().value(
+        "routeros_mcp_device_cpu_usage_percent", "dev-issue", environment="unknown"
+    ) == 95.0
     assert client.closed is True
 
 
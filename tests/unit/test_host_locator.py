@@ -0,0 +1,244 @@
+"""Tests for the host locator index and the host locator job."""
+
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.bridge import BridgeService
+from routeros_mcp.domain.services.dhcp import DHCPService
+from routeros_mcp.domain.services.ip import IPService
+from routeros_mcp.infra import cache as cache_module
+from routeros_mcp.infra.jobs import runner
+from routeros_mcp.infra.jobs.runner import run_host_locator_job
+from routeros_mcp.infra.routeros.host_locator import (
+    HostLocatorIndex,
+    HostSighting,
+    collect_sightings,
+    get_host_locator_index,
+    initialize_host_locator_index,
+    normalize_mac,
+)
+
+T0 = 1_768_550_400.0  # 2026-01-16T08:00:00Z
+
+MAC = "AA:BB:CC:00:00:05"
+
+
+def _arp(address: str, mac: str = MAC, interface: str = "bridge") -> dict[str, Any]:
+    return {"address": address, "mac_address": mac, "interface": interface}
+
+
+class TestCollectSightings:
+    """Building sightings from device tables."""
+
+    def test_sources_and_skipped_entries(self) -> None:
+        sightings = collect_sightings(
+            "dev-1",
+            arp_entries=[_arp("10.0.0.5", mac="aa-bb-cc-00-00-05"), _arp("10.0.0.9", mac="")],
+            leases=[
+                {
+                    "address": "10.0.0.5",
+                    "mac_address": MAC,
+                    "server": "dhcp-lan",
+                    "host_name": "printer",
+                }
+            ],
+            bridge_hosts=[
+                {"mac_address": MAC, "on_interface": "ether3", "local": False},
+                {"mac_address": "78:9A:18:A2:F3:D3", "on_interface": "bridge", "local": True},
+            ],
+            timestamp=T0,
+        )
+
+        assert [(s.source, s.interface, s.address) for s in sightings] == [
+            ("bridge", "ether3", None),
+            ("arp", "bridge", "10.0.0.5"),
+            ("dhcp", "dhcp-lan", "10.0.0.5"),
+        ]
+        assert {s.mac_address for s in sightings} == {MAC}
+        assert sightings[2].host_name == "printer"
+        assert normalize_mac(" aa-bb-cc-00-00-05 ") == MAC
+
+
+class TestHostLocatorIndex:
+    """Incremental updates and lookups."""
+
+    def test_locate_by_mac_and_ip(self) -> None:
+        index = HostLocatorIndex()
+        index.update_device(
+            "dev-1",
+            collect_sightings(
+                "dev-1",
+                arp_entries=[_arp("10.0.0.5")],
+                bridge_hosts=[{"mac_address": MAC, "on_interface": "ether3"}],
+                timestamp=T0,
+            ),
+            timestamp=T0,
+        )
+        index.update_device(
+            "dev-2",
+            collect_sightings("dev-2", arp_entries=[_arp("10.0.0.5")], timestamp=T0 + 10),
+            timestamp=T0 + 10,
+        )
+
+        sightings = index.locate_mac("aa:bb:cc:00:00:05")
+
+        assert [(s.device_id, s.source) for s in sightings] == [
+            ("dev-2", "arp"),
+            ("dev-1", "bridge"),
+            ("dev-1", "arp"),
+        ]
+        assert index.macs_for_ip("10.0.0.5") == [MAC]
+        assert index.locate_mac("00:00:00:00:00:00") == []
+        assert index.get_stats()["sightings"] == 3
+
+    def test_refresh_replaces_address_references(self) -> None:
+        index = HostLocatorIndex()
+        index.update_device(
+            "dev-1", collect_sightings("dev-1", [_arp("10.0.0.5")], timestamp=T0), timestamp=T0
+        )
+
+        counts = index.update_device(
+            "dev-1",
+            collect_sightings("dev-1", [_arp("10.0.0.6")], timestamp=T0 + 60),
+            timestamp=T0 + 60,
+        )
+
+        assert counts == {"added": 0, "refreshed": 1, "expired": 0}
+        assert index.macs_for_ip("10.0.0.5") == []
+        assert index.macs_for_ip("10.0.0.6") == [MAC]
+        assert index.locate_mac(MAC)[0].last_seen == T0 + 60
+
+    def test_ip_conflict_lists_every_mac(self) -> None:
+        index = HostLocatorIndex()
+        index.update_device(
+            "dev-1",
+            collect_sightings(
+                "dev-1",
+                [_arp("10.0.0.5"), _arp("10.0.0.5", mac="AA:BB:CC:00:00:99", interface="vlan20")],
+                timestamp=T0,
+            ),
+            timestamp=T0,
+        )
+
+        assert index.macs_for_ip("10.0.0.5") == [MAC, "AA:BB:CC:00:00:99"]
+
+    def test_unreported_sightings_expire_after_retention(self) -> None:
+        index = HostLocatorIndex(retention_seconds=3600)
+        index.update_device(
+            "dev-1", collect_sightings("dev-1", [_arp("10.0.0.5")], timestamp=T0), timestamp=T0
+        )
+
+        kept = index.update_device("dev-1", [], timestamp=T0 + 1800)
+        assert kept["expired"] == 0
+        assert len(index.locate_mac(MAC)) == 1
+
+        expired = index.update_device("dev-1", [], timestamp=T0 + 3601)
+        assert expired["expired"] == 1
+        assert index.locate_mac(MAC) == []
+        assert index.macs_for_ip("10.0.0.5") == []
+
+    def test_remove_device_and_foreign_sightings(self) -> None:
+        index = HostLocatorIndex()
+        index.update_device("dev-1", collect_sightings("dev-1", [_arp("10.0.0.5")]))
+
+        with pytest.raises(ValueError):
+            index.update_device("dev-2", collect_sightings("dev-1", [_arp("10.0.0.5")]))
+
+        assert index.remove_device("dev-1") == 1
+        assert index.device_ids() == []
+        assert index.get_stats()["mac_addresses"] == 0
+
+    def test_initialize_replaces_global_index(self) -> None:
+        index = initialize_host_locator_index(retention_seconds=600)
+
+        assert get_host_locator_index() is index
+        assert index.get_stats()["retention_seconds"] == 600
+        with pytest.raises(ValueError):
+            HostLocatorIndex(retention_seconds=0)
+
+
+class _NullSessionFactory:
+    @asynccontextmanager
+    async def session(self):
+        yield None
+
+
+class _FakeRedisCache:
+    def __init__(self, rows: dict[str, list[list[Any]]]) -> None:
+        self.rows = rows
+        self.written: dict[str, list[list[Any]]] = {}
+
+    async def get_hosts(self, device_id: str) -> list[list[Any]] | None:
+        return self.rows.get(device_id)
+
+    async def set_hosts(self, device_id: str, data: list[list[Any]]) -> None:
+        self.written[device_id] = data
+
+
+@pytest.fixture
+def fleet(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def eligible_devices(_session, _settings):
+        return [SimpleNamespace(id="dev-1"), SimpleNamespace(id="dev-2")]
+
+    async def fake_arp(self, device_id: str):
+        if device_id == "dev-2":
+            raise ConnectionError("connection refused")
+        return [_arp("10.0.0.5")]
+
+    async def fake_leases(self, device_id: str):
+        if device_id == "dev-2":
+            raise ConnectionError("connection refused")
+        return {"leases": [], "total_count": 0}
+
+    async def fake_bridge_hosts(self, device_id: str):
+        if device_id == "dev-2":
+            raise ConnectionError("connection refused")
+        return [{"mac_address": MAC, "on_interface": "ether3"}]
+
+    monkeypatch.setattr(runner, "_get_eligible_devices", eligible_devices)
+    monkeypatch.setattr(IPService, "get_arp_table", fake_arp)
+    monkeypatch.setattr(DHCPService, "get_dhcp_leases", fake_leases)
+    monkeypatch.setattr(BridgeService, "list_bridge_hosts", fake_bridge_hosts)
+
+
+async def test_run_host_locator_job_indexes_fleet(fleet) -> None:
+    index = get_host_locator_index()
+    index.update_device("dev-gone", collect_sightings("dev-gone", [_arp("10.0.0.7")]))
+
+    summary = await run_host_locator_job(_NullSessionFactory(), Settings(host_locator_enabled=True))
+
+    assert summary == {"status": "success", "total": 2, "success": 1, "failed": 1, "sightings": 2}
+    assert [(s.device_id, s.source) for s in index.locate_mac(MAC)] == [
+        ("dev-1", "bridge"),
+        ("dev-1", "arp"),
+    ]
+    assert index.device_ids() == ["dev-1"]
+
+
+async def test_run_host_locator_job_restores_and_persists(fleet, monkeypatch) -> None:
+    persisted = HostSighting(
+        "AA:BB:CC:00:00:99", "dev-2", "arp", "vlan20", "10.0.0.9", None, time.time() - 60
+    )
+    fake_cache = _FakeRedisCache({"dev-2": [list(persisted)]})
+    monkeypatch.setattr(cache_module, "get_redis_cache", lambda: fake_cache)
+
+    await run_host_locator_job(
+        _NullSessionFactory(),
+        Settings(host_locator_enabled=True, host_locator_redis_persistence=True),
+    )
+
+    index = get_host_locator_index()
+    assert index.locate_mac("AA:BB:CC:00:00:99") == [persisted]
+    assert [row[0] for row in fake_cache.written["dev-1"]] == [MAC, MAC]
+    assert "dev-2" not in fake_cache.written
+
+
+async def test_run_host_locator_job_skips_when_disabled() -> None:
+    summary = await run_host_locator_job(_NullSessionFactory(), Settings())
+
+    assert summary == {"status": "skipped", "reason": "disabled"}
@@ -0,0 +1,109 @@
+"""Tests for per-device incremental log tailing."""
+
+import pytest
+
+from routeros_mcp.infra.routeros.log_tail import (
+    LogTailer,
+    get_log_tailer,
+    initialize_log_tailer,
+    log_id_number,
+    parse_log_time,
+)
+
+
+def _items(*ids: int, topics: str = "system,info") -> list[dict]:
+    return [
+        {".id": f"*{i:X}", "time": f"2025-12-11 10:00:{i % 60:02d}", "topics": topics,
+         "message": f"line {i}"}
+        for i in ids
+    ]
+
+
+class TestIngest:
+    """Cursor handling when new batches arrive."""
+
+    def test_only_entries_after_cursor_are_new(self) -> None:
+        tailer = LogTailer()
+
+        assert [e.id for e in tailer.ingest("dev-1", _items(1, 2, 3))] == ["*1", "*2", "*3"]
+        # Overlapping batch (cursor entry included, or a device ignoring the query)
+        assert [e.id for e in tailer.ingest("dev-1", _items(2, 3, 4))] == ["*4"]
+        assert tailer.ingest("dev-1", _items(3, 4)) == []
+        assert tailer.cursor("dev-1") == "*4"
+        assert tailer.buffered("dev-1") == 4
+
+    def test_ids_below_cursor_reset_the_tail(self) -> None:
+        tailer = LogTailer()
+        tailer.ingest("dev-1", _items(0x100, 0x101))
+
+        fresh = tailer.ingest("dev-1", _items(1, 2))
+
+        assert [e.id for e in fresh] == ["*1", "*2"]
+        assert tailer.buffered("dev-1") == 2
+        assert tailer.get_stats()["devices"]["dev-1"]["resets"] == 1
+
+    def test_entries_without_numeric_ids_dedupe_by_overlap(self) -> None:
+        tailer = LogTailer()
+        first = [
+            {"id": "00:00:01", "time": "00:00:01", "topics": ["system"], "message": "a"},
+            {"id": "00:00:02", "time": "00:00:02", "topics": ["system"], "message": "b"},
+        ]
+        tailer.ingest("dev-1", first, transport="ssh")
+
+        fresh = tailer.ingest(
+            "dev-1",
+            first + [{"time": "00:00:03", "topics": ["firewall"], "message": "c"}],
+            transport="ssh",
+        )
+
+        assert [e.message for e in fresh] == ["c"]
+        assert fresh[0].to_dict()["fallback_used"] is True
+
+    def test_buffer_is_bounded_per_device(self) -> None:
+        tailer = LogTailer(buffer_size=3)
+        tailer.ingest("dev-1", _items(*range(1, 11)))
+        tailer.ingest("dev-2", _items(1))
+
+        assert [e.id for e in tailer.query("dev-1", limit=10)] == ["*8", "*9", "*A"]
+        assert tailer.buffered("dev-2") == 1
+
+        with pytest.raises(ValueError):
+            LogTailer(buffer_size=0)
+
+
+class TestQuery:
+    """Filtering buffered entries."""
+
+    def test_precomputed_keys(self) -> None:
+        tailer = LogTailer()
+        entry = tailer.ingest("dev-1", _items(5, topics="firewall,warning"))[0]
+
+        assert entry.topic_set == frozenset({"firewall", "warning"})
+        assert entry.timestamp is not None and entry.timestamp.second == 5
+
+    def test_filters_return_newest_matches_in_order(self) -> None:
+        tailer = LogTailer()
+        tailer.ingest("dev-1", _items(1, 2, 3) + _items(4, 5, 6, topics="firewall,info"))
+
+        newest = tailer.query("dev-1", limit=2, topics=["firewall"])
+        assert [e.id for e in newest] == ["*5", "*6"]
+
+        window = tailer.query(
+            "dev-1", start_time="2025-12-11 10:00:02", end_time="2025-12-11 10:00:04"
+        )
+        assert [e.id for e in window] == ["*2", "*3", "*4"]
+
+        assert [e.id for e in tailer.query("dev-1", message="LINE 3")] == ["*3"]
+        assert tailer.query("unknown") == []
+
+
+def test_helpers_and_singleton() -> None:
+    assert log_id_number("*1A") == 0x1A
+    assert log_id_number("00:00:01") is None
+    assert log_id_number("*l1") is None
+    assert parse_log_time("dec/11/2025 10:00:00") is not None
+    assert parse_log_time("yesterday") is None
+
+    tailer = initialize_log_tailer(buffer_size=50)
+    assert get_log_tailer() is tailer
+    assert tailer.buffer_size == 50
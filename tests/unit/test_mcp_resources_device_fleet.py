@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 import uuid
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
@@ -12,6 +13,9 @@ from routeros_mcp.config import Settings
 from routeros_mcp.domain.models import DeviceCreate
 from routeros_mcp.domain.services.device import DeviceService
 from routeros_mcp.infra.db.models import AuditEvent, Base, Snapshot
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
+from routeros_mcp.infra.routeros.reachability import get_reachability_store
+from routeros_mcp.infra.routeros.traffic_counters import get_traffic_store
 from routeros_mcp.mcp.errors import MCPError
 from routeros_mcp.mcp_resources import device as device_resources
 from routeros_mcp.mcp_resources import fleet as fleet_resources
@@ -225,6 +229,46 @@ async def test_device_health_not_found(session_factory, settings):
         await health_func("missing")
 
 
+@pytest.mark.asyncio
+async def test_device_interface_traffic_seeds_then_serves_rates(
+    monkeypatch: pytest.MonkeyPatch, session_factory, settings, seed_devices
+):
+    now = time.time()
+    samples = iter([(now - 60, "0"), (now, "7500")])
+
+    class _FakeInterfaceService:
+        async def collect_traffic_counters(self, device_id: str) -> int:
+            sampled_at, rx_byte = next(samples)
+            return get_traffic_store().record(
+                device_id, [{"name": "ether1", "rx-byte": rx_byte}], sampled_at
+            )
+
+    monkeypatch.setattr(
+        device_resources, "InterfaceService", lambda *args, **kwargs: _FakeInterfaceService()
+    )
+
+    mcp = DummyMCP()
+    device_resources.register_device_resources(mcp, session_factory, settings)
+    traffic_func = mcp.resources["device://{device_id}/interfaces/traffic"]
+
+    payload = json.loads(await traffic_func("dev-1"))
+    assert payload["status"] == "collecting"
+    assert payload["samples"] == 1
+    assert payload["interfaces"] == []
+
+    # Second sample arrives from the collector job, not from the read
+    await _FakeInterfaceService().collect_traffic_counters("dev-1")
+    payload = json.loads(await traffic_func("dev-1"))
+    assert payload["status"] == "ready"
+    assert payload["interfaces"][0]["name"] == "ether1"
+    assert payload["interfaces"][0]["rx_bits_per_second"] == 1000
+    assert payload["history"]["ether1"]["rx_bits_per_second"] == [1000]
+    assert get_traffic_store().watched() == ["dev-1"]
+
+    with pytest.raises(MCPError):
+        await traffic_func("missing")
+
+
 @pytest.mark.asyncio
 async def test_device_overview_generic_error(
     monkeypatch: pytest.MonkeyPatch, session_factory, settings
@@ -284,6 +328,40 @@ async def test_fleet_health_summary(_setup_fleet_resources):
     assert payload["health_distribution"]["unreachable"] == 1
 
 
+@pytest.mark.asyncio
+async def test_fleet_health_summary_reads_fresh_results_from_snapshot(
+    monkeypatch: pytest.MonkeyPatch, session_factory, settings, seed_devices
+):
+    class _NoChecksHealthService:
+        async def run_health_check(self, device_id: str):
+            raise AssertionError("fresh devices must not be checked again")
+
+    monkeypatch.setattr(
+        fleet_resources, "HealthService", lambda *args, **kwargs: _NoChecksHealthService()
+    )
+    snapshot = get_fleet_metrics()
+    for device_id, status, cpu in (("dev-1", "healthy", 20.0), ("dev-2", "degraded", 92.0)):
+        snapshot.record(
+            device_id,
+            environment="lab",
+            status=status,
+            metrics={"cpu_usage_percent": cpu, "memory_usage_percent": 50.0},
+        )
+    # Removed from the registry: dropped from the snapshot
+    snapshot.record("dev-gone", environment="lab", status="unreachable")
+
+    mcp = DummyMCP()
+    fleet_resources.register_fleet_resources(mcp, session_factory, settings)
+    payload = json.loads(await mcp.resources["fleet://health-summary"]())
+
+    assert payload["health_distribution"] == {"healthy": 1, "degraded": 1, "unreachable": 0}
+    assert payload["summary"]["average_cpu_usage"] == 56.0
+    assert payload["metrics"]["cpu_usage_percent"]["max"] == 92.0
+    assert payload["top_devices"]["cpu_usage_percent"][0]["device_id"] == "dev-2"
+    assert payload["by_environment"]["lab"]["devices"] == 2
+    assert [d["device_id"] for d in payload["devices_needing_attention"]] == ["dev-2"]
+
+
 @pytest.mark.asyncio
 async def test_fleet_devices_filter(session_factory, settings, seed_devices):
     mcp = DummyMCP()
@@ -296,6 +374,27 @@ async def test_fleet_devices_filter(session_factory, settings, seed_devices):
     assert {"dev-1", "dev-2"} == device_ids
 
 
+@pytest.mark.asyncio
+async def test_fleet_reachability_serves_matrix_and_percentiles(session_factory, settings):
+    store = get_reachability_store()
+    store.configure([("dev-1", "8.8.8.8"), ("dev-2", "8.8.8.8")])
+    for rtt in (10.0, 20.0, 30.0):
+        store.record("dev-1", "8.8.8.8", 0.0, rtt)
+    store.record("dev-2", "8.8.8.8", 100.0, None)
+
+    mcp = DummyMCP()
+    fleet_resources.register_fleet_resources(mcp, session_factory, settings)
+    payload = json.loads(await mcp.resources["fleet://reachability"]())
+
+    assert payload["matrix"]["devices"] == ["dev-1", "dev-2"]
+    assert payload["matrix"]["packet_loss_percent"] == [[0.0], [100.0]]
+    assert payload["matrix"]["avg_rtt_ms"] == [[30.0], [None]]
+    dev1, dev2 = payload["pairs"]
+    assert dev1["rtt_ms"]["p50"] == 20.0
+    assert dev2["availability_percent"] == 0.0
+    assert "rtt_ms" not in dev2
+
+
 @pytest.mark.asyncio
 async def test_fleet_health_summary_error(
     monkeypatch: pytest.MonkeyPatch, session_factory, settings
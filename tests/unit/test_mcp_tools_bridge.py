@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from routeros_mcp.config import Settings
@@ -517,6 +518,43 @@ class TestBridgePlanService(unittest.TestCase):
         
         self.assertEqual(risk, "medium")
 
+    def test_assess_risk_topology_isolation(self) -> None:
+        """Devices reachable only through the changed interface make it high risk."""
+        from routeros_mcp.domain.services.bridge import BridgePlanService
+
+        service = BridgePlanService()
+
+        risk = service.assess_risk(
+            operation="modify_bridge_settings",
+            device_environment="lab",
+            isolated_devices=2,
+        )
+
+        self.assertEqual(risk, "high")
+
+
+class TestBridgeTopologyImpact(unittest.TestCase):
+    """Topology blast radius used by the bridge plan tools."""
+
+    def test_topology_impact_per_device(self) -> None:
+        from routeros_mcp.infra.routeros.topology import get_topology_graph
+
+        get_topology_graph().update_device(
+            "dev-1",
+            interfaces=[{"name": "ether2"}, {"name": "bridge-lan"}],
+            bridge_ports=[{"interface": "ether2", "bridge": "bridge-lan"}],
+            neighbors=[{"interface": "ether2", "mac_address": "AA:BB:CC:00:00:02"}],
+        )
+        devices = [SimpleNamespace(id="dev-1"), SimpleNamespace(id="dev-2")]
+
+        impact = bridge_tools._topology_impact(Settings(topology_enabled=True), devices, "ether2")
+
+        self.assertEqual(list(impact), ["dev-1"])
+        self.assertEqual(impact["dev-1"]["isolated"]["neighbor"], ["neighbor:AA:BB:CC:00:00:02"])
+        self.assertEqual(impact["dev-1"]["isolated_devices"], 1)
+        self.assertIn("1 device(s)/neighbour(s)", bridge_tools._topology_note(impact))
+        self.assertEqual(bridge_tools._topology_impact(Settings(), devices, "ether2"), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -1373,3 +1374,134 @@ def test_diagnostics_service_parse_throughput_value() -> None:
     # Test plain numbers (fallback)
     assert DiagnosticsService._parse_throughput_value("950000000") == 950_000_000
     assert DiagnosticsService._parse_throughput_value("1500.5") == 1500
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_reports_progress_and_matrix(monkeypatch: pytest.MonkeyPatch) -> None:
+    import routeros_mcp.mcp_tools.diagnostics as diagnostics_tools
+    from routeros_mcp.domain.services.diagnostics import PingSweepMatrix
+    from routeros_mcp.infra.rate_limiter import reset_rate_limiter
+
+    reset_rate_limiter()
+    authorized: list[str] = []
+
+    class StubDeviceService:
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+        async def get_device(self, device_id: str) -> object:
+            authorized.append(device_id)
+            return SimpleNamespace(
+                environment="lab",
+                allow_advanced_writes=False,
+                allow_professional_workflows=False,
+                name=device_id,
+            )
+
+    class StubDiagnosticsService:
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+        async def ping_sweep(
+            self, device_ids: list[str], targets: list[str], on_result: Any, **_kwargs: object
+        ) -> PingSweepMatrix:
+            matrix = PingSweepMatrix(device_ids, targets)
+            replies = [
+                {"packets_sent": 4, "packets_received": 4, "packet_loss_percent": 0.0,
+                 "min_rtt_ms": 1.0, "avg_rtt_ms": 2.0, "max_rtt_ms": 3.0},
+                {"packets_sent": 4, "packets_received": 0, "packet_loss_percent": 100.0,
+                 "min_rtt_ms": 0.0, "avg_rtt_ms": 0.0, "max_rtt_ms": 0.0},
+            ]
+            for index in range(len(matrix)):
+                matrix.set_ping(index, replies[index % 2])
+                await on_result(matrix.cell(index), matrix.completed, len(matrix))
+            return matrix
+
+    class StubContext:
+        def __init__(self) -> None:
+            self.progress: list[tuple[float, float | None, str | None]] = []
+
+        async def report_progress(
+            self, progress: float, total: float | None = None, message: str | None = None
+        ) -> None:
+            self.progress.append((progress, total, message))
+
+    monkeypatch.setattr(diagnostics_tools, "get_session_factory", lambda _settings: FakeSessionFactory())
+    monkeypatch.setattr(diagnostics_tools, "DeviceService", StubDeviceService)
+    monkeypatch.setattr(diagnostics_tools, "DiagnosticsService", StubDiagnosticsService)
+
+    mcp = DummyMCP()
+    settings = Settings(database_url="sqlite+aiosqlite:///:memory:", environment="lab")
+    diagnostics_tools.register_diagnostics_tools(mcp, settings)
+    ctx = StubContext()
+
+    result = await mcp.tools["ping_sweep"](
+        device_ids=["dev-1", "dev-2"], targets=["8.8.8.8", "192.0.2.1"], ctx=ctx
+    )
+
+    assert result["isError"] is False
+    assert authorized == ["dev-1", "dev-2"]
+    assert "2 reachable" in result["content"][0]["text"]
+    assert "192.0.2.1" in result["content"][0]["text"]
+    assert result["_meta"]["matrix"]["packet_loss_percent"] == [[0.0, 100.0], [0.0, 100.0]]
+    assert [progress for progress, _, _ in ctx.progress] == [1, 2, 3, 4]
+    assert ctx.progress[0][2] == "dev-1 -> 8.8.8.8: 0% loss, avg 2.0ms"
+    assert ctx.progress[1][2] == "dev-1 -> 192.0.2.1: 100% loss"
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_validates_targets_and_pair_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    import routeros_mcp.mcp_tools.diagnostics as diagnostics_tools
+    from routeros_mcp.mcp.errors import ValidationError
+
+    monkeypatch.setattr(diagnostics_tools, "get_session_factory", lambda _settings: FakeSessionFactory())
+
+    mcp = DummyMCP()
+    settings = Settings(database_url="sqlite+aiosqlite:///:memory:", environment="lab")
+    diagnostics_tools.register_diagnostics_tools(mcp, settings)
+
+    with pytest.raises(ValidationError, match="Invalid target"):
+        await mcp.tools["ping_sweep"](device_ids=["dev-1"], targets=["8.8.8.8", "bad target!"])
+
+    with pytest.raises(ValidationError, match="cannot exceed"):
+        await mcp.tools["ping_sweep"](
+            device_ids=[f"dev-{n}" for n in range(40)],
+            targets=[f"10.0.0.{n}" for n in range(1, 31)],
+        )
+
+
+@pytest.mark.asyncio
+async def test_ping_sweep_charges_rate_limit_per_target(monkeypatch: pytest.MonkeyPatch) -> None:
+    import routeros_mcp.mcp_tools.diagnostics as diagnostics_tools
+    from routeros_mcp.infra.rate_limiter import get_rate_limiter, reset_rate_limiter
+    from routeros_mcp.mcp.errors import RateLimitExceededError
+
+    reset_rate_limiter()
+
+    class FailingSessionFactory:
+        def session(self) -> object:
+            raise AssertionError("sweep over budget must not start")
+
+    monkeypatch.setattr(
+        diagnostics_tools, "get_session_factory", lambda _settings: FailingSessionFactory()
+    )
+
+    mcp = DummyMCP()
+    settings = Settings(database_url="sqlite+aiosqlite:///:memory:", environment="lab")
+    diagnostics_tools.register_diagnostics_tools(mcp, settings)
+    targets = [f"10.0.0.{n}" for n in range(1, 12)]
+
+    limiter = get_rate_limiter()
+    for _ in range(5):
+        await limiter.check_and_record("dev-1", "traceroute", limit=10)
+
+    # 11 targets are 11 pings against a budget of 10
+    with pytest.raises(RateLimitExceededError):
+        await mcp.tools["ping_sweep"](device_ids=["dev-1"], targets=targets)
+    # 6 pings fit, 6 more traceroutes do not
+    with pytest.raises(RateLimitExceededError, match="traceroute"):
+        await mcp.tools["ping_sweep"](
+            device_ids=["dev-1"], targets=targets[:6], traceroute=True, max_hops=5
+        )
+
+    assert await limiter.get_remaining("dev-1", "ping", limit=10) == 10
@@ -1063,6 +1063,111 @@ class TestFirewallApplyTool(unittest.TestCase):
 
         asyncio.run(_run())
 
+    def test_apply_firewall_plan_runs_devices_concurrently_with_progress(self) -> None:
+        """Test multi-device apply runs in parallel and streams per-device progress."""
+
+        async def _run() -> None:
+            from datetime import UTC, datetime, timedelta
+            from unittest.mock import AsyncMock
+
+            device_ids = ["dev-lab-01", "dev-lab-02", "dev-lab-03"]
+            in_flight = 0
+            peak = 0
+
+            class SlowRestClient:
+                """REST client whose snapshot read yields to other devices."""
+
+                def __init__(self) -> None:
+                    self.responses = [
+                        [{"id": "*1", "chain": "input", "action": "accept"}],
+                        {"uptime": "1d2h3m"},
+                        [{"id": "*1", "chain": "input", "action": "accept"}],
+                    ]
+                    self.post = AsyncMock(return_value={".id": "*2"})
+                    self.close = AsyncMock(return_value=None)
+
+                async def get(self, *_args, **_kwargs):
+                    nonlocal in_flight, peak
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                    await asyncio.sleep(0.01)
+                    in_flight -= 1
+                    return self.responses.pop(0)
+
+            fake_plan_service = AsyncMock()
+            fake_plan_service.get_plan = AsyncMock(
+                return_value={
+                    "plan_id": "plan-test-001",
+                    "created_by": "test-user",
+                    "status": "pending",
+                    "device_ids": device_ids,
+                    "changes": {
+                        "operation": "add_firewall_rule",
+                        "chain": "forward",
+                        "action": "accept",
+                        "approval_token_timestamp": datetime.now(UTC).isoformat(),
+                        "approval_expires_at": (datetime.now(UTC) + timedelta(minutes=15)).isoformat(),
+                    },
+                }
+            )
+            fake_plan_service.validate_approval_token = Mock(return_value=None)
+            fake_plan_service.update_plan_status = AsyncMock(return_value=None)
+
+            fake_device_service = AsyncMock()
+            fake_device_service.get_device = AsyncMock(
+                side_effect=lambda device_id: FakeDevice(device_id, "lab")
+            )
+            fake_device_service.get_rest_client = AsyncMock(
+                side_effect=lambda _device_id: SlowRestClient()
+            )
+
+            class FakeContext:
+                def __init__(self) -> None:
+                    self.messages: list[str] = []
+
+                async def report_progress(self, progress, total=None, message=None) -> None:
+                    self.messages.append(f"{progress}/{total} {message}")
+
+            ctx = FakeContext()
+
+            with (
+                patch.object(
+                    firewall_write_module,
+                    "get_session_factory",
+                    return_value=FakeSessionFactory(),
+                ),
+                patch.object(
+                    firewall_write_module,
+                    "PlanService",
+                    return_value=fake_plan_service,
+                ),
+                patch.object(
+                    firewall_write_module,
+                    "DeviceService",
+                    return_value=fake_device_service,
+                ),
+            ):
+                mcp = self._register_tools()
+                fn = mcp.tools["apply_firewall_plan"]
+                result = await fn(
+                    plan_id="plan-test-001",
+                    approval_token="approve-test-abc123",
+                    ctx=ctx,
+                )
+
+            meta = result["_meta"]
+            self.assertEqual(meta["final_status"], "completed")
+            self.assertEqual(meta["successful_count"], 3)
+            self.assertEqual(
+                [r["device_id"] for r in meta["device_results"]], device_ids
+            )
+            self.assertEqual(meta["execution"]["skipped"], 0)
+            self.assertGreater(peak, 1)
+            self.assertEqual(len(ctx.messages), 3)
+            self.assertTrue(ctx.messages[-1].startswith("3/3 "))
+
+        asyncio.run(_run())
+
     def test_apply_firewall_plan_device_unreachable(self) -> None:
         """Test apply with unreachable device."""
 
@@ -1361,5 +1466,67 @@ class TestFirewallApplyTool(unittest.TestCase):
         asyncio.run(_run())
 
 
+class TestSyncAddressListTool(unittest.TestCase):
+    """Tests for the bulk address-list sync MCP tool."""
+
+    def _register_tools(self) -> DummyMCP:
+        mcp = DummyMCP()
+        firewall_write_module.register_firewall_write_tools(mcp, Settings())
+        return mcp
+
+    def test_sync_address_list_across_devices(self) -> None:
+        async def _run() -> None:
+            calls: list[tuple[str, list[str], bool]] = []
+
+            class FakeFirewallService:
+                def __init__(self, *_args, **_kwargs) -> None:
+                    pass
+
+                async def sync_address_list(
+                    self, device_id, list_name, addresses, comment="", dry_run=False, on_progress=None
+                ) -> dict:
+                    calls.append((device_id, list(addresses), dry_run))
+                    errors = 1 if device_id == "dev-lab-02" else 0
+                    return {
+                        "device_id": device_id,
+                        "to_add": 2,
+                        "to_remove": 1,
+                        "added": 2 - errors,
+                        "removed": 1,
+                        "error_count": errors,
+                    }
+
+            with (
+                patch.object(
+                    firewall_write_module, "get_session_factory", return_value=FakeSessionFactory()
+                ),
+                patch.object(firewall_write_module, "DeviceService", FakeDeviceService),
+                patch.object(firewall_write_module, "FirewallService", FakeFirewallService),
+            ):
+                fn = self._register_tools().tools["sync_firewall_address_list"]
+                result = await fn(
+                    device_ids=["dev-lab-01", "dev-lab-02"],
+                    list_name="mcp-blocklist",
+                    addresses=["203.0.113.0/24", "198.51.100.7"],
+                )
+
+                self.assertFalse(result.get("isError", False))
+                meta = result["_meta"]
+                self.assertEqual(meta["successful_count"], 1)
+                self.assertEqual(meta["failed_count"], 1)
+                self.assertEqual(meta["totals"], {"to_add": 4, "to_remove": 2, "added": 3, "removed": 2})
+                self.assertEqual(meta["execution"]["total"], 2)
+                self.assertIn("dev-lab-02", result["content"][0]["text"])
+                self.assertEqual(len(calls), 2)
+
+                invalid = await fn(
+                    device_ids=["dev-lab-01"], list_name="blocklist", addresses=["192.0.2.1"]
+                )
+                self.assertTrue(invalid["isError"])
+                self.assertEqual(len(calls), 2)
+
+        asyncio.run(_run())
+
+
 if __name__ == "__main__":
     unittest.main()
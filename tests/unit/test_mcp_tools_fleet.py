@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from routeros_mcp.config import Settings
+from tests.unit.mcp_tools_test_utils import DummyMCP, FakeSessionFactory
+
+
+def _device(device_id: str) -> Any:
+    return SimpleNamespace(
+        id=device_id,
+        environment="lab",
+        status="healthy",
+        tags={"site": "dc1"},
+        allow_advanced_writes=False,
+        allow_professional_workflows=False,
+    )
+
+
+@pytest.fixture
+def fleet_mcp(monkeypatch: pytest.MonkeyPatch) -> DummyMCP:
+    import routeros_mcp.domain.services.fleet_read as fleet_read
+    import routeros_mcp.mcp_tools.fleet as fleet_tools
+
+    class StubDeviceService:
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+        async def list_devices(
+            self, environment: str | None = None, allowed_device_ids: list[str] | None = None
+        ) -> list[Any]:
+            devices = [_device("dev-1"), _device("dev-2"), _device("dev-3")]
+            return [d for d in devices if not allowed_device_ids or d.id in allowed_device_ids]
+
+    class StubIPService:
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+        async def get_arp_table(self, device_id: str) -> list[dict[str, Any]]:
+            if device_id == "dev-3":
+                raise TimeoutError("timed out")
+            return [
+                {"address": "10.0.0.5", "mac_address": "AA:BB:CC:00:00:05"},
+                {"address": f"10.0.0.{device_id[-1]}", "mac_address": "AA:BB:CC:00:00:01"},
+            ]
+
+    class StubDHCPService:
+        def __init__(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+        async def get_dhcp_leases(self, device_id: str) -> dict[str, Any]:
+            leases = [{"address": "10.0.0.5", "mac_address": "aa:bb:cc:00:00:05"}]
+            return {"leases": leases, "total_count": len(leases)}
+
+    monkeypatch.setattr(fleet_tools, "get_session_factory", lambda _settings: FakeSessionFactory())
+    monkeypatch.setattr(fleet_read, "DeviceService", StubDeviceService)
+    monkeypatch.setattr(fleet_tools, "IPService", StubIPService)
+    monkeypatch.setattr(fleet_tools, "DHCPService", StubDHCPService)
+
+    mcp = DummyMCP()
+    fleet_tools.register_fleet_tools(mcp, Settings(environment="lab"))
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_fleet_get_arp_table_filters_by_mac_and_reports_failures(fleet_mcp) -> None:
+    result = await fleet_mcp.tools["fleet_get_arp_table"](
+        environment="lab", mac_address="aa-bb-cc-00-00-05"
+    )
+
+    assert result["isError"] is False
+    meta = result["_meta"]
+    assert [entry["device_id"] for entry in meta["arp_entries"]] == ["dev-1", "dev-2"]
+    assert {entry["address"] for entry in meta["arp_entries"]} == {"10.0.0.5"}
+    assert meta["device_counts"] == {"dev-1": 1, "dev-2": 1}
+    assert meta["errors"][0]["device_id"] == "dev-3"
+    assert meta["filters"] == {"environment": "lab", "mac_address": "aa-bb-cc-00-00-05"}
+    assert "1 device(s) failed: dev-3" in result["content"][0]["text"]
+
+
+@pytest.mark.asyncio
+async def test_fleet_get_dhcp_leases_merges_devices(fleet_mcp) -> None:
+    result = await fleet_mcp.tools["fleet_get_dhcp_leases"](
+        device_ids=["dev-1", "dev-2"], address="10.0.0.5"
+    )
+
+    assert result["isError"] is False
+    assert result["_meta"]["devices_succeeded"] == 2
+    assert [lease["device_id"] for lease in result["_meta"]["leases"]] == ["dev-1", "dev-2"]
+
+
+@pytest.mark.asyncio
+async def test_fleet_tools_require_a_selector(fleet_mcp) -> None:
+    result = await fleet_mcp.tools["fleet_list_interfaces"]()
+
+    assert result["isError"] is True
+    assert "device_ids, environment or tags" in result["content"][0]["text"]
+
+
+@pytest.mark.asyncio
+async def test_locate_host_answers_from_index(fleet_mcp) -> None:
+    from routeros_mcp.infra.routeros.host_locator import collect_sightings, get_host_locator_index
+
+    index = get_host_locator_index()
+    index.update_device(
+        "dev-1",
+        collect_sightings(
+            "dev-1",
+            arp_entries=[{"address": "10.0.0.5", "mac_address": "AA:BB:CC:00:00:05"}],
+            bridge_hosts=[{"mac_address": "AA:BB:CC:00:00:05", "on_interface": "ether3"}],
+        ),
+    )
+
+    by_ip = await fleet_mcp.tools["locate_host"](address="10.0.0.5")
+    by_mac = await fleet_mcp.tools["locate_host"](mac_address="aa-bb-cc-00-00-05")
+
+    assert by_ip["isError"] is False
+    assert by_ip["_meta"]["mac_addresses"] == ["AA:BB:CC:00:00:05"]
+    assert [s["source"] for s in by_ip["_meta"]["sightings"]] == ["bridge", "arp"]
+    assert "last seen on dev-1 ether3 (bridge" in by_ip["content"][0]["text"]
+    assert by_mac["_meta"]["sightings"] == by_ip["_meta"]["sightings"]
+    assert by_mac["_meta"]["addresses"] == ["10.0.0.5"]
+
+
+@pytest.mark.asyncio
+async def test_locate_host_reports_unknown_host_and_bad_query(fleet_mcp) -> None:
+    unknown = await fleet_mcp.tools["locate_host"](address="10.0.0.77")
+    invalid = await fleet_mcp.tools["locate_host"]()
+
+    assert unknown["isError"] is False
+    assert unknown["_meta"]["sightings"] == []
+    assert "host locator is disabled" in unknown["content"][0]["text"]
+    assert invalid["isError"] is True
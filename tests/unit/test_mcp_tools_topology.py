@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.infra.routeros.topology import get_topology_graph
+from routeros_mcp.mcp_tools import topology as topology_tools
+from tests.unit.mcp_tools_test_utils import DummyMCP
+
+
+@pytest.fixture
+def topology_mcp() -> DummyMCP:
+    graph = get_topology_graph()
+    graph.update_device(
+        "dev-1",
+        interfaces=[{"name": "ether1", "mac_address": "02:00:00:00:01:01"}, {"name": "ether2"}],
+        ip_addresses=[{"address": "10.9.0.1/30", "interface": "ether1"}],
+        neighbors=[{"interface": "ether2", "mac_address": "AA:BB:CC:00:00:09"}],
+    )
+    graph.update_device(
+        "dev-2",
+        interfaces=[{"name": "ether1"}],
+        ip_addresses=[{"address": "10.9.0.2/30", "interface": "ether1"}],
+    )
+
+    mcp = DummyMCP()
+    topology_tools.register_topology_tools(mcp, Settings(environment="lab"))
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_topology_get_path(topology_mcp) -> None:
+    result = await topology_mcp.tools["topology_get_path"](source="dev-1", target="dev-2")
+
+    assert result["isError"] is False
+    assert result["_meta"]["connected"] is True
+    assert [hop["key"] for hop in result["_meta"]["hops"]] == [
+        "device:dev-1",
+        "iface:dev-1:ether1",
+        "subnet:10.9.0.0/30",
+        "iface:dev-2:ether1",
+        "device:dev-2",
+    ]
+    assert result["content"][0]["text"].startswith("4 hop(s): device:dev-1 -> ")
+
+
+@pytest.mark.asyncio
+async def test_topology_get_blast_radius(topology_mcp) -> None:
+    subnet = await topology_mcp.tools["topology_get_blast_radius"](node="10.9.0.0/30")
+    port = await topology_mcp.tools["topology_get_blast_radius"](node="dev-1:ether2")
+
+    assert subnet["_meta"]["anchor"] is None
+    assert subnet["_meta"]["isolated"]["device"] == ["device:dev-2"]
+    assert port["_meta"]["isolated"]["neighbor"] == ["neighbor:AA:BB:CC:00:00:09"]
+    assert "1 neighbour(s)" in port["content"][0]["text"]
+
+
+@pytest.mark.asyncio
+async def test_topology_get_connected_and_errors(topology_mcp) -> None:
+    connected = await topology_mcp.tools["topology_get_connected"](node="10.9.0.1")
+    unknown = await topology_mcp.tools["topology_get_connected"](node="dev-9")
+    too_deep = await topology_mcp.tools["topology_get_connected"](node="dev-1", depth=9)
+
+    assert connected["_meta"]["node"]["key"] == "subnet:10.9.0.0/30"
+    assert [item["key"] for item in connected["_meta"]["connected"]] == [
+        "iface:dev-1:ether1",
+        "iface:dev-2:ether1",
+    ]
+    assert unknown["isError"] is True
+    assert "topology is disabled" in unknown["content"][0]["text"]
+    assert too_deep["isError"] is True
@@ -0,0 +1,94 @@
+"""Tests for the cached, off-loop /metrics exposition."""
+
+import asyncio
+import gzip
+import threading
+
+import pytest
+from prometheus_client.parser import text_string_to_metric_families
+
+from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.observability.exposition import MetricsExposition, accepts_gzip
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
+
+
+class _CountingRender:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.threads: set[int] = set()
+
+    def __call__(self) -> str:
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        return f"# render {self.calls}\n"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", True),
+        ("deflate;q=1.0, GZIP;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("identity", False),
+        (None, False),
+    ],
+)
+def test_accepts_gzip(header, expected) -> None:
+    assert accepts_gzip(header) is expected
+
+
+async def test_concurrent_scrapes_share_one_render_off_the_loop() -> None:
+    render = _CountingRender()
+    exposition = MetricsExposition(ttl_seconds=60, render=render)
+
+    bodies = await asyncio.gather(*(exposition.get() for _ in range(5)))
+
+    assert render.calls == 1
+    assert set(bodies) == {b"# render 1\n"}
+    assert threading.get_ident() not in render.threads
+
+    exposition.invalidate()
+    assert await exposition.get() == b"# render 2\n"
+
+
+async def test_zero_ttl_renders_every_scrape() -> None:
+    render = _CountingRender()
+    exposition = MetricsExposition(ttl_seconds=0, render=render)
+
+    await exposition.get()
+    await exposition.get()
+
+    assert render.calls == 2
+
+
+async def test_gzip_payload_and_self_metrics() -> None:
+    exposition = MetricsExposition(ttl_seconds=60)
+
+    plain = await exposition.get()
+    compressed = await exposition.get(gzip_encoded=True)
+
+    assert exposition.renders == 1
+    assert gzip.decompress(compressed) == plain
+    assert await exposition.get(gzip_encoded=True) is compressed
+
+    samples = {
+        (sample.name, sample.labels.get("encoding")): sample.value
+        for family in text_string_to_metric_families(metrics.get_metrics_text())
+        for sample in family.samples
+    }
+    assert samples[("routeros_mcp_metrics_payload_bytes", "identity")] == len(plain)
+    assert samples[("routeros_mcp_metrics_payload_bytes", "gzip")] == len(compressed)
+    assert samples[("routeros_mcp_metrics_render_duration_seconds_count", None)] >= 1
+
+
+async def test_fleet_gauges_render_from_a_copy() -> None:
+    get_fleet_metrics().record("dev-1", environment="lab", status="healthy")
+    exposition = MetricsExposition(ttl_seconds=0)
+
+    text = (await exposition.get()).decode()
+
+    assert (
+        'routeros_mcp_fleet_devices{group="lab",group_by="environment",status="healthy"} 1.0'
+        in text
+    )
@@ -0,0 +1,71 @@
+"""Tests for the per-device metrics store and its paged exposition."""
+
+from prometheus_client.parser import text_string_to_metric_families
+
+from routeros_mcp.infra.observability.device_metrics import DeviceMetricsStore
+
+FAMILIES = {
+    "cpu": ("gauge", "CPU usage"),
+    "requests": ("counter", "Requests"),
+    "latency": ("summary", "Latency"),
+}
+
+
+def _store(devices: int = 0) -> DeviceMetricsStore:
+    store = DeviceMetricsStore(FAMILIES)
+    for index in range(devices):
+        store.set("cpu", f"dev-{index:03d}", float(index), environment="lab")
+    return store
+
+
+def test_gauge_counter_and_summary_series() -> None:
+    store = _store()
+    store.set("cpu", "dev-1", 10.0)
+    store.set("cpu", "dev-1", 12.5)
+    store.inc("requests", "dev-1", method="GET")
+    store.inc("requests", "dev-1", 2, method="GET")
+    store.observe("latency", "dev-1", 0.25, method="GET")
+    store.observe("latency", "dev-1", 0.75, method="GET")
+
+    assert store.value("cpu", "dev-1") == 12.5
+    assert store.value("requests", "dev-1", method="GET") == 3
+    assert store.value("requests", "dev-1", method="POST") is None
+
+    samples = {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(store.render())
+        for sample in family.samples
+    }
+    labels = (("device_id", "dev-1"), ("method", "GET"))
+    assert samples[("requests_total", labels)] == 3
+    assert samples[("latency_sum", labels)] == 1.0
+    assert samples[("latency_count", labels)] == 2
+
+
+def test_pages_are_ordered_by_device_id() -> None:
+    store = _store(25)
+
+    assert store.device_count == 25
+    assert store.page_count(10) == 3
+    assert _store().page_count(10) == 1
+
+    page = store.render(page=3, page_size=10)
+    assert 'device_id="dev-020"' in page
+    assert 'device_id="dev-019"' not in page
+    # Empty pages keep the HELP/TYPE headers
+    empty = store.render(page=4, page_size=10)
+    assert "# TYPE cpu gauge" in empty
+    assert "dev-" not in empty
+
+
+def test_forget_and_label_escaping() -> None:
+    store = _store(2)
+    store.set("cpu", 'dev-"x"', 1.0, site="a\\b")
+    store.forget("dev-000")
+
+    assert store.device_count == 2
+    assert store.value("cpu", "dev-000", environment="lab") is None
+    assert 'device_id="dev-\\"x\\"",site="a\\\\b"' in store.render()
+
+    store.clear()
+    assert store.device_count == 0
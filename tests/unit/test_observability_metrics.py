@@ -3,6 +3,7 @@
 from prometheus_client.parser import text_string_to_metric_families
 
 from routeros_mcp.infra.observability import metrics
+from routeros_mcp.infra.observability.fleet_metrics import get_fleet_metrics
 
 
 def _metric_value(sample_name: str) -> float:
@@ -69,3 +70,81 @@ def test_resource_and_auth_metrics() -> None:
     assert _metric_value("routeros_mcp_resource_reads_total") >= 1
     assert _metric_value("routeros_mcp_auth_checks_total") >= 1
     assert _metric_value("routeros_mcp_authz_checks_total") >= 1
+
+
+def test_registry_has_no_device_id_labels() -> None:
+    metrics.record_routeros_request("dev-1", "lab", "GET", duration=0.05, success=True)
+    metrics.record_health_check(device_id="dev-1", environment="lab", status="healthy")
+    metrics.record_snapshot_result("dev-1", "config", "ssh", "success")
+    metrics.record_snapshot_size("dev-1", "config", 1000, compressed_size_bytes=250)
+    metrics.update_snapshot_age("dev-1", "config", 120.0)
+    metrics.record_sse_event_sent("health", "dev-1")
+
+    for family in text_string_to_metric_families(metrics.get_metrics_text()):
+        for sample in family.samples:
+            assert "device_id" not in sample.labels, sample
+
+    # Per-device values are kept outside the registry
+    device_metrics = metrics.get_device_metrics()
+    assert device_metrics.value(
+        "routeros_mcp_device_snapshot_compression_ratio", "dev-1", kind="config"
+    ) == 0.25
+    assert device_metrics.value(
+        "routeros_mcp_device_routeros_requests_total", "dev-1", method="GET", status="success"
+    ) == 1
+
+
+def test_fleet_gauges_and_snapshot_age_aggregate() -> None:
+    snapshot = get_fleet_metrics()
+    rows = [
+        ("dev-1", "prod", "healthy", "RB5009", {"site": "dc1"}, 10.0),
+        ("dev-2", "prod", "degraded", "RB5009", {"site": "dc2"}, 90.0),
+        ("dev-3", "lab", "unreachable", None, {}, None),
+    ]
+    for device_id, environment, status, model, tags, cpu in rows:
+        snapshot.record(
+            device_id,
+            environment=environment,
+            status=status,
+            model=model,
+            tags=tags,
+            metrics={"cpu_usage_percent": cpu},
+        )
+    metrics.update_snapshot_age("dev-1", "config", 60.0)
+    metrics.update_snapshot_age("dev-2", "config", 600.0)
+    metrics.configure_metrics(group_by_tags=["site"])
+
+    samples = {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(metrics.get_metrics_text())
+        for sample in family.samples
+    }
+
+    def value(name: str, **labels: str) -> float | None:
+        return samples.get((name, tuple(sorted(labels.items()))))
+
+    devices = "routeros_mcp_fleet_devices"
+    assert value(devices, group_by="environment", group="prod", status="healthy") == 1
+    assert value(devices, group_by="environment", group="lab", status="unreachable") == 1
+    assert value(devices, group_by="model", group="RB5009", status="degraded") == 1
+    assert value(devices, group_by="tag:site", group="dc2", status="degraded") == 1
+    cpu = "routeros_mcp_fleet_cpu_usage_percent"
+    assert value(cpu, group_by="environment", group="prod", stat="max") == 90.0
+    assert value(cpu, group_by="environment", group="lab", stat="max") is None
+    assert value("routeros_mcp_snapshot_age_seconds", kind="config") == 600.0
+
+
+def test_per_device_mode_appends_device_series() -> None:
+    metrics.record_health_check(
+        device_id="dev-9", environment="lab", status="degraded", cpu_percent=55.0
+    )
+    assert 'device_id="dev-9"' not in metrics.get_metrics_text()
+
+    metrics.configure_metrics(per_device=True)
+    text = metrics.get_metrics_text()
+
+    assert 'routeros_mcp_device_cpu_usage_percent{device_id="dev-9",environment="lab"} 55.0' in text
+    assert 'routeros_mcp_device_health_status{device_id="dev-9",environment="lab"} 0.5' in text
+    # Still valid exposition text
+    names = {family.name for family in text_string_to_metric_families(text)}
+    assert "routeros_mcp_device_health_status" in names
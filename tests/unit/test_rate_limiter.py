@@ -4,7 +4,12 @@ import time
 
 import pytest
 
-from routeros_mcp.infra.rate_limiter import RateLimiter, get_rate_limiter, reset_rate_limiter
+from routeros_mcp.infra.rate_limiter import (
+    RateLimitCharge,
+    RateLimiter,
+    get_rate_limiter,
+    reset_rate_limiter,
+)
 from routeros_mcp.mcp.errors import RateLimitExceededError
 
 
@@ -195,3 +200,24 @@ async def test_rate_limiter_get_remaining_accuracy() -> None:
 
     # Should have 7 remaining
     assert await limiter.get_remaining("dev-001", "ping", limit=10, window_seconds=60) == 7
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_check_and_record_many_is_all_or_nothing() -> None:
+    """Multi-target charges are recorded only when every device has budget."""
+    limiter = RateLimiter()
+    await limiter.check_and_record("dev-002", "ping", limit=10, window_seconds=60)
+    charges = [RateLimitCharge("ping", 10, cost=9), RateLimitCharge("traceroute", 10, cost=9)]
+
+    await limiter.check_and_record_many(["dev-001"], charges)
+    assert await limiter.get_remaining("dev-001", "ping", limit=10) == 1
+    assert await limiter.get_remaining("dev-001", "traceroute", limit=10) == 1
+
+    # dev-002 has room for 9 pings, but dev-001 does not: nothing is recorded
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        await limiter.check_and_record_many(["dev-002", "dev-001"], charges)
+
+    assert exc_info.value.data["device_id"] == "dev-001"
+    assert exc_info.value.data["requested"] == 9
+    assert await limiter.get_remaining("dev-002", "ping", limit=10) == 9
+    assert await limiter.get_remaining("dev-002", "traceroute", limit=10) == 10
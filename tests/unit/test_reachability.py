@@ -0,0 +1,190 @@
+"""Tests for the reachability mesh store, probe scheduling and mesh job."""
+
+import random
+from contextlib import asynccontextmanager
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.diagnostics import DiagnosticsService
+from routeros_mcp.infra.jobs.runner import run_reachability_mesh_job
+from routeros_mcp.infra.routeros.reachability import (
+    ProbeRing,
+    ReachabilityStore,
+    get_reachability_store,
+    initialize_reachability_store,
+    mesh_pairs,
+    probe_offsets,
+)
+
+T0 = 1_768_550_400.0  # 2026-01-16T08:00:00Z
+
+
+class TestProbeScheduling:
+    """Pair ordering and spread of probe start times."""
+
+    def test_pairs_alternate_devices(self) -> None:
+        pairs = mesh_pairs(["dev-1", "dev-2", "dev-1"], ["8.8.8.8", "1.1.1.1"])
+
+        assert pairs == [
+            ("dev-1", "8.8.8.8"),
+            ("dev-2", "8.8.8.8"),
+            ("dev-1", "1.1.1.1"),
+            ("dev-2", "1.1.1.1"),
+        ]
+
+    def test_offsets_take_one_slot_each(self) -> None:
+        offsets = probe_offsets(10, 100.0, random.Random(7))
+
+        assert len(offsets) == 10
+        for index, offset in enumerate(offsets):
+            assert index * 10.0 <= offset < (index + 1) * 10.0
+        assert offsets == sorted(offsets)
+
+    def test_offsets_are_jittered_between_runs(self) -> None:
+        rng = random.Random(7)
+
+        assert probe_offsets(5, 60.0, rng) != probe_offsets(5, 60.0, rng)
+        assert probe_offsets(0, 60.0) == []
+
+
+class TestProbeRing:
+    """Array-backed probe ring."""
+
+    def test_overwrites_oldest_probe(self) -> None:
+        ring = ProbeRing(3)
+        for i in range(5):
+            ring.append(T0 + i, 0.0, float(i))
+
+        assert len(ring) == 3
+        assert [rtt for _, _, rtt in ring] == [2.0, 3.0, 4.0]
+        assert ring.latest() == (T0 + 4, 0.0, 4.0)
+        assert ProbeRing(3).latest() is None
+
+
+class TestReachabilityStore:
+    """Matrix and percentile queries."""
+
+    def test_matrix_holds_latest_probe_per_pair(self) -> None:
+        store = ReachabilityStore(history_samples=10)
+        store.configure(mesh_pairs(["dev-1", "dev-2"], ["8.8.8.8", "1.1.1.1"]))
+        store.record("dev-1", "8.8.8.8", 0.0, 12.0, timestamp=T0)
+        store.record("dev-1", "8.8.8.8", 33.33, 14.5, timestamp=T0 + 60)
+        store.record("dev-2", "8.8.8.8", 100.0, None, timestamp=T0 + 60)
+        store.record_failure("dev-2", "1.1.1.1", "connection refused", timestamp=T0 + 60)
+
+        matrix = store.matrix(now=T0 + 90)
+
+        assert matrix["devices"] == ["dev-1", "dev-2"]
+        assert matrix["targets"] == ["8.8.8.8", "1.1.1.1"]
+        assert matrix["packet_loss_percent"] == [[33.33, None], [100.0, None]]
+        assert matrix["avg_rtt_ms"] == [[14.5, None], [None, None]]
+        assert matrix["age_seconds"] == [[30.0, None], [30.0, 30.0]]
+        assert matrix["errors"] == [
+            {"device_id": "dev-2", "target": "1.1.1.1", "error": "connection refused"}
+        ]
+
+    def test_pair_stats_percentiles_and_availability(self) -> None:
+        store = ReachabilityStore(history_samples=200)
+        for i in range(100):
+            store.record("dev-1", "8.8.8.8", 0.0, float(i + 1), timestamp=T0 + i)
+        store.record("dev-1", "8.8.8.8", 100.0, None, timestamp=T0 + 100)
+        store.record_failure("dev-1", "8.8.8.8", "timeout", timestamp=T0 + 101)
+
+        stats = store.pair_stats("dev-1", "8.8.8.8")
+
+        assert stats is not None
+        assert stats["probes"] == 102
+        assert stats["failed_probes"] == 1
+        assert stats["availability_percent"] == pytest.approx(99.01, abs=0.01)
+        assert stats["loss_percent_max"] == 100.0
+        assert stats["rtt_ms"]["min"] == 1.0
+        assert stats["rtt_ms"]["p50"] == pytest.approx(50.5)
+        assert stats["rtt_ms"]["p99"] == pytest.approx(99.01)
+        assert stats["rtt_ms"]["max"] == 100.0
+        assert store.pair_stats("dev-9", "8.8.8.8") is None
+
+    def test_pair_stats_since_limits_window(self) -> None:
+        store = ReachabilityStore(history_samples=10)
+        store.record("dev-1", "8.8.8.8", 0.0, 100.0, timestamp=T0)
+        store.record("dev-1", "8.8.8.8", 0.0, 10.0, timestamp=T0 + 60)
+
+        stats = store.pair_stats("dev-1", "8.8.8.8", since=T0 + 30)
+
+        assert stats is not None
+        assert stats["probes"] == 1
+        assert stats["rtt_ms"]["max"] == 10.0
+
+    def test_configure_keeps_history_of_remaining_pairs(self) -> None:
+        store = ReachabilityStore(history_samples=10)
+        store.record("dev-1", "8.8.8.8", 0.0, 5.0, timestamp=T0)
+        store.record("dev-2", "8.8.8.8", 0.0, 5.0, timestamp=T0)
+
+        store.configure([("dev-1", "8.8.8.8"), ("dev-1", "1.1.1.1")])
+
+        assert store.pairs == [("dev-1", "8.8.8.8"), ("dev-1", "1.1.1.1")]
+        assert [entry["probes"] for entry in store.percentiles()] == [1, 0]
+
+    def test_history_samples_minimum(self) -> None:
+        with pytest.raises(ValueError):
+            ReachabilityStore(history_samples=1)
+
+    def test_initialize_replaces_global_store(self) -> None:
+        store = initialize_reachability_store(history_samples=12)
+
+        assert get_reachability_store() is store
+        assert store.get_stats() == {"history_samples": 12, "pairs": 0, "probes": 0}
+
+
+class _NullSessionFactory:
+    @asynccontextmanager
+    async def session(self):
+        yield None
+
+
+async def test_run_reachability_mesh_job_probes_every_pair(monkeypatch) -> None:
+    calls: list[tuple[str, str, int]] = []
+
+    async def fake_ping(self, device_id, address, count=4, **_kwargs):
+        calls.append((device_id, address, count))
+        if device_id == "dev-2":
+            raise RuntimeError("unreachable")
+        return {
+            "packets_sent": count,
+            "packets_received": count,
+            "packet_loss_percent": 0.0,
+            "avg_rtt_ms": 8.0,
+        }
+
+    monkeypatch.setattr(DiagnosticsService, "ping", fake_ping)
+    settings = Settings(
+        reachability_mesh_enabled=True,
+        reachability_mesh_devices="dev-1, dev-2",
+        reachability_mesh_targets="8.8.8.8,1.1.1.1",
+        reachability_mesh_ping_count=2,
+    )
+
+    summary = await run_reachability_mesh_job(
+        _NullSessionFactory(), settings, spread_seconds=0.01, rng=random.Random(1)
+    )
+
+    assert summary == {"status": "success", "total": 4, "success": 2, "failed": 2}
+    assert sorted(calls) == [
+        ("dev-1", "1.1.1.1", 2),
+        ("dev-1", "8.8.8.8", 2),
+        ("dev-2", "1.1.1.1", 2),
+        ("dev-2", "8.8.8.8", 2),
+    ]
+    matrix = get_reachability_store().matrix()
+    assert matrix["avg_rtt_ms"] == [[8.0, 8.0], [None, None]]
+    assert {error["error"] for error in matrix["errors"]} == {"unreachable"}
+
+
+async def test_run_reachability_mesh_job_skips_without_pairs() -> None:
+    disabled = await run_reachability_mesh_job(_NullSessionFactory(), Settings())
+    assert disabled == {"status": "skipped", "reason": "disabled"}
+
+    empty = await run_reachability_mesh_job(
+        _NullSessionFactory(), Settings(reachability_mesh_enabled=True)
+    )
+    assert empty == {"status": "skipped", "reason": "no_pairs"}
@@ -607,3 +607,89 @@ class TestRouterOSSSHClient:
         connection = await client._get_connection()
 
         assert connection == mock_connection
+
+
+class TestRouterOSSSHClientBatch:
+    """Tests for batched multi-command execution."""
+
+    @staticmethod
+    def _routeros_script_runner(outputs: dict[str, str], fail_on: str | None = None):
+        """Fake connection.run interpreting a batch script like RouterOS would."""
+        scripts: list[str] = []
+
+        async def run(script: str, check: bool = False):
+            scripts.append(script)
+            stdout = []
+            for line in script.split("\n"):
+                if line.startswith(':put "'):
+                    stdout.append(line[len(':put "') : -1] + "\r\n")
+                elif line == fail_on:
+                    stdout.append("bad command name\r\n")
+                    break
+                else:
+                    stdout.append(outputs.get(line, ""))
+            result = MagicMock()
+            result.stdout = "".join(stdout)
+            return result
+
+        return run, scripts
+
+    @pytest.mark.asyncio
+    async def test_execute_many_splits_output_per_command(self) -> None:
+        client = RouterOSSSHClient(host="127.0.0.1", username="admin", password="secret")
+        run, scripts = self._routeros_script_runner(
+            {
+                "/system/resource/print": "uptime: 1d\r\ncpu-load: 3%\r\n",
+                "/system/identity/print": "name: router-1\r\n",
+                "/system/clock/print": "",
+            }
+        )
+        mock_connection = AsyncMock()
+        mock_connection.run = run
+
+        with patch.object(client, "_get_connection", return_value=mock_connection):
+            outputs = await client.execute_many(
+                ["/system/resource/print", "/system/identity/print", "/system/clock/print"]
+            )
+
+        assert outputs == ["uptime: 1d\r\ncpu-load: 3%\r\n", "name: router-1\r\n", ""]
+        # All three commands went through a single channel
+        assert len(scripts) == 1
+        assert await client.execute_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_execute_many_reports_aborted_command(self) -> None:
+        client = RouterOSSSHClient(host="127.0.0.1", username="admin", password="secret")
+        run, _ = self._routeros_script_runner(
+            {"/ip/address/print": "0 192.0.2.1/24 ether1\r\n"},
+            fail_on="/ip/route/print",
+        )
+        mock_connection = AsyncMock()
+        mock_connection.run = run
+
+        with patch.object(client, "_get_connection", return_value=mock_connection):
+            with pytest.raises(RouterOSSSHError, match=r"command 2/2: /ip/route/print"):
+                await client.execute_many(["/ip/address/print", "/ip/route/print"])
+
+    @pytest.mark.asyncio
+    async def test_execute_many_validates_every_command_before_sending(self) -> None:
+        client = RouterOSSSHClient(host="127.0.0.1", username="admin", password="secret")
+        mock_connection = AsyncMock()
+
+        with patch.object(client, "_get_connection", return_value=mock_connection):
+            with pytest.raises(RouterOSSSHCommandNotAllowedError):
+                await client.execute_many(["/system/resource/print", "/system/reboot"])
+            with pytest.raises(RouterOSSSHCommandNotAllowedError):
+                await client.execute_many(["/ip/route/print; /system/reboot"])
+
+        mock_connection.run.assert_not_called()
+
+    def test_validate_command_rejects_command_separators(self) -> None:
+        client = RouterOSSSHClient(host="127.0.0.1", username="admin", password="secret")
+
+        for command in (
+            "/interface/monitor-traffic ether1 once; /system/reboot",
+            "/interface/monitor-traffic ether1\n/system/reboot",
+        ):
+            with pytest.raises(RouterOSSSHCommandNotAllowedError):
+                client._validate_command(command)
@@ -0,0 +1,195 @@
+"""Tests for the shared SSH connection pool."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import asyncssh
+import pytest
+
+from routeros_mcp.infra.routeros.exceptions import RouterOSSSHError
+from routeros_mcp.infra.routeros.ssh_client import RouterOSSSHClient
+from routeros_mcp.infra.routeros.ssh_pool import SSHConnectionPool, SSHPoolKey
+
+
+def _connection() -> MagicMock:
+    connection = MagicMock()
+    connection.closed = False
+    connection.is_closed.side_effect = lambda: connection.closed
+
+    def close() -> None:
+        connection.closed = True
+
+    connection.close.side_effect = close
+    return connection
+
+
+def _key(host: str) -> SSHPoolKey:
+    return SSHPoolKey(host=host, port=22, username="admin", secret_digest="digest")
+
+
+class TestSSHConnectionPool:
+    """Tests for SSHConnectionPool."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_handshake_per_device(self, monkeypatch) -> None:
+        """Concurrent clients for one device reuse a single authenticated connection."""
+        pool = SSHConnectionPool()
+        connects: list[dict] = []
+        key_imports: list[str] = []
+
+        async def mock_connect(host, **kwargs):
+            connects.append(kwargs)
+            await asyncio.sleep(0.01)
+            return _connection()
+
+        def mock_import(pem):
+            key_imports.append(pem)
+            return MagicMock()
+
+        from asyncssh import public_key as pk_module
+
+        monkeypatch.setattr(asyncssh, "connect", mock_connect)
+        monkeypatch.setattr(pk_module, "import_private_key", mock_import)
+
+        clients = [
+            RouterOSSSHClient(host="10.0.0.1", username="admin", private_key="PEM", pool=pool)
+            for _ in range(5)
+        ]
+        connections = await asyncio.gather(*(client._get_connection() for client in clients))
+
+        assert len({id(connection) for connection in connections}) == 1
+        assert len(connects) == 1
+        assert key_imports == ["PEM"]
+        assert connects[0]["keepalive_interval"] == pool.keepalive_interval_seconds
+
+        # Closing a pooled client releases its lease without closing the connection
+        for client in clients:
+            await client.close()
+        assert not connections[0].closed
+        assert len(pool) == 1
+
+        # Different credentials get their own connection
+        other = RouterOSSSHClient(host="10.0.0.1", username="admin", password="pw", pool=pool)
+        assert await other._get_connection() is not connections[0]
+        assert len(connects) == 2
+
+        await pool.close()
+        assert connections[0].closed
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_dead_connection_is_replaced(self) -> None:
+        """A connection closed by the peer is dropped and re-established on acquire."""
+        pool = SSHConnectionPool()
+        first = _connection()
+        second = _connection()
+        pending = [first, second]
+
+        async def connect():
+            return pending.pop(0)
+
+        assert await pool.acquire(_key("a"), connect) is first
+        await pool.release(_key("a"), first)
+
+        first.closed = True  # keepalive detected a dead peer
+        assert await pool.acquire(_key("a"), connect) is second
+
+    @pytest.mark.asyncio
+    async def test_capacity_evicts_lru_idle_and_waits_when_busy(self) -> None:
+        """The global cap evicts idle connections first, then times out."""
+        pool = SSHConnectionPool(max_connections=2, acquire_timeout_seconds=0.05)
+
+        async def connect():
+            return _connection()
+
+        conn_a = await pool.acquire(_key("a"), connect)
+        conn_b = await pool.acquire(_key("b"), connect)
+        await pool.release(_key("a"), conn_a)
+
+        # "a" is idle, so it makes room for "c"
+        conn_c = await pool.acquire(_key("c"), connect)
+        assert conn_a.closed
+        assert len(pool) == 2
+
+        # Everything is leased: a fourth device waits, then fails
+        with pytest.raises(RouterOSSSHError, match="pool exhausted"):
+            await pool.acquire(_key("d"), connect)
+
+        # A release while waiting frees a slot for the waiter
+        async def release_later():
+            await asyncio.sleep(0.01)
+            await pool.release(_key("b"), conn_b)
+
+        pool.acquire_timeout_seconds = 1.0
+        _, conn_d = await asyncio.gather(release_later(), pool.acquire(_key("d"), connect))
+        assert conn_b.closed
+        assert not conn_c.closed and not conn_d.closed
+
+    @pytest.mark.asyncio
+    async def test_sweep_evicts_idle_and_closed_connections(self) -> None:
+        """The health-check sweep drops expired and dead idle connections only."""
+        pool = SSHConnectionPool(idle_timeout_seconds=60)
+
+        async def connect():
+            return _connection()
+
+        idle = await pool.acquire(_key("idle"), connect)
+        dead = await pool.acquire(_key("dead"), connect)
+        busy = await pool.acquire(_key("busy"), connect)
+        await pool.release(_key("idle"), idle)
+        await pool.release(_key("dead"), dead)
+
+        pool._entries[_key("idle")].last_used = time.monotonic() - 120
+        pool._entries[_key("busy")].last_used = time.monotonic() - 120
+        dead.closed = True
+
+        assert await pool.sweep() == 2
+        assert idle.closed
+        assert not busy.closed
+        assert len(pool) == 1
+
+    @pytest.mark.asyncio
+    async def test_session_limit_caps_channels_across_clients(self, monkeypatch) -> None:
+        """Commands over one shared connection each hold a global session slot."""
+        pool = SSHConnectionPool(max_sessions=2, acquire_timeout_seconds=0.02)
+        connection = _connection()
+        peak = 0
+
+        async def run(command, check):
+            nonlocal peak
+            peak = max(peak, pool.active_sessions)
+            await asyncio.sleep(0.1)
+            return MagicMock(stdout="ok")
+
+        connection.run.side_effect = run
+
+        async def mock_connect(host, **kwargs):
+            return connection
+
+        monkeypatch.setattr(asyncssh, "connect", mock_connect)
+
+        clients = [
+            RouterOSSSHClient(host="10.0.0.1", username="admin", password="pw", pool=pool)
+            for _ in range(3)
+        ]
+
+        # A third concurrent channel waits past the timeout and fails
+        results = await asyncio.gather(
+            *(client.execute("/system/resource/print") for client in clients),
+            return_exceptions=True,
+        )
+        assert peak == 2
+        assert [r for r in results if r == "ok"] == ["ok", "ok"]
+        failures = [r for r in results if isinstance(r, RouterOSSSHError)]
+        assert len(failures) == 1
+        assert "session limit" in str(failures[0])
+        assert pool.active_sessions == 0
+
+        # With time to wait, every channel eventually runs
+        pool.acquire_timeout_seconds = 1.0
+        results = await asyncio.gather(
+            *(client.execute("/system/resource/print") for client in clients)
+        )
+        assert results == ["ok", "ok", "ok"]
+        assert peak == 2
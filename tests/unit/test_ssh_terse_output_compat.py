@@ -0,0 +1,199 @@
+"""Compatibility matrix for `print terse` output on RouterOS v6 and v7.
+
+SSH fallbacks request `print terse without-paging`. These fixtures capture
+the per-version differences (flag letters, property names, quoting) and
+check every service parser decodes them to the same normalized fields.
+"""
+
+import pytest
+
+from routeros_mcp.domain.services.bridge import BridgeService
+from routeros_mcp.domain.services.dhcp import DHCPService
+from routeros_mcp.domain.services.firewall_logs import FirewallLogsService
+from routeros_mcp.domain.services.interface import InterfaceService
+from routeros_mcp.domain.services.ip import IPService
+from routeros_mcp.domain.services.routing import RoutingService
+from routeros_mcp.domain.services.wireless import WirelessService
+
+INTERFACE_TERSE = {
+    "v6": (
+        " 0  R name=ether1 default-name=ether1 type=ether mtu=1500 actual-mtu=1500 l2mtu=1598 "
+        "max-l2mtu=4074 mac-address=64:D1:54:00:00:01 fast-path=yes link-downs=0\n"
+        " 1 X  name=ether5 default-name=ether5 type=ether mtu=1500 actual-mtu=1500 l2mtu=1598 "
+        'max-l2mtu=4074 mac-address=64:D1:54:00:00:05 comment="spare uplink"\n'
+    ),
+    "v7": (
+        " 0  R  name=ether1 default-name=ether1 type=ether mtu=1500 actual-mtu=1500 l2mtu=1514 "
+        "max-l2mtu=9796 mac-address=78:9A:18:A2:F3:D2 last-link-up-time=2025-12-01 10:00:00\n"
+        " 1 X   name=ether5 default-name=ether5 type=ether mtu=1500 actual-mtu=1500 l2mtu=1514 "
+        'max-l2mtu=9796 mac-address=78:9A:18:A2:F3:D5 comment="spare uplink"\n'
+    ),
+}
+
+ROUTE_TERSE = {
+    "v6": (
+        " 0 ADS  dst-address=0.0.0.0/0 gateway=10.0.0.1 "
+        'gateway-status="10.0.0.1 reachable via  ether1" distance=1 scope=30 '
+        "target-scope=10 routing-mark=wan2\n"
+        " 1 ADC  dst-address=10.0.0.0/24 pref-src=10.0.0.2 gateway=ether1 "
+        "gateway-status=ether1 reachable distance=0 scope=10\n"
+    ),
+    "v7": (
+        ' 0  As  dst-address=0.0.0.0/0 routing-table=wan2 pref-src="" gateway=10.0.0.1 '
+        "immediate-gw=10.0.0.1%ether1 distance=1 scope=30 target-scope=10\n"
+        " 1 ADc  dst-address=10.0.0.0/24 routing-table=main gateway=ether1 "
+        "immediate-gw=ether1 distance=0 scope=10 local-address=10.0.0.2%ether1\n"
+    ),
+}
+
+FILTER_TERSE = {
+    "v6": (
+        ' 0  D chain=forward action=passthrough comment="special dummy rule"\n'
+        ' 1    chain=input action=accept protocol=tcp dst-port=22 comment="ssh access"\n'
+        " 2 X  chain=input action=drop in-interface=ether1\n"
+    ),
+    "v7": (
+        ' 0  D chain=forward action=passthrough comment="special dummy rule"\n'
+        ' 1    chain=input action=accept protocol=tcp dst-port=22 log=no log-prefix="" '
+        'comment="ssh access"\n'
+        " 2 X  chain=input action=drop in-interface=ether1 log=no log-prefix=\"\"\n"
+    ),
+}
+
+LEASE_TERSE = {
+    "v6": (
+        " 0 D address=192.168.88.254 mac-address=AA:BB:CC:DD:EE:01 host-name=phone "
+        "server=dhcp1 status=bound last-seen=1m2s\n"
+        " 1   address=192.168.88.10 mac-address=AA:BB:CC:DD:EE:02 server=dhcp1 "
+        'status=waiting last-seen=never comment="printer"\n'
+    ),
+    "v7": (
+        " 0 D address=192.168.88.254 mac-address=AA:BB:CC:DD:EE:01 host-name=phone "
+        "server=dhcp1 status=bound last-seen=1m2s\n"
+        " 1   address=192.168.88.10 mac-address=AA:BB:CC:DD:EE:02 server=dhcp1 "
+        'status=waiting last-seen=never comment="printer"\n'
+    ),
+}
+
+REGISTRATION_TERSE = {
+    # Legacy wireless package (v6 and v7)
+    "v6": (
+        " 0    interface=wlan1 mac-address=AA:BB:CC:00:00:01 ap=no wds=no "
+        "rx-rate=144.4Mbps-20MHz/2S/SGI tx-rate=130Mbps-20MHz/2S/SGI uptime=1h2m "
+        "signal-strength=-61@HT20-7 signal-to-noise=35\n"
+    ),
+    # v7 wifi package
+    "v7": (
+        " 0   interface=wifi1 ssid=home mac-address=AA:BB:CC:00:00:01 uptime=1h2m "
+        "signal=-61 tx-rate=130Mbps-20MHz/2S/SGI rx-rate=144.4Mbps-20MHz/2S/SGI\n"
+    ),
+}
+
+
+@pytest.mark.parametrize("version", ["v6", "v7"])
+def test_interface_terse(version: str) -> None:
+    interfaces = InterfaceService._parse_interface_print_output(INTERFACE_TERSE[version])
+
+    assert [i["name"] for i in interfaces] == ["ether1", "ether5"]
+    assert interfaces[0]["running"] is True
+    assert interfaces[0]["disabled"] is False
+    assert interfaces[0]["mtu"] == 1500
+    assert interfaces[0]["mac_address"].count(":") == 5
+    assert interfaces[1]["disabled"] is True
+    assert interfaces[1]["comment"] == "spare uplink"
+
+
+@pytest.mark.parametrize("version", ["v6", "v7"])
+def test_route_terse(version: str) -> None:
+    routes = RoutingService._parse_route_print_output(ROUTE_TERSE[version])
+
+    assert [r["dst_address"] for r in routes] == ["0.0.0.0/0", "10.0.0.0/24"]
+    assert routes[0]["gateway"] == "10.0.0.1"
+    assert routes[0]["routing_table"] == "wan2"
+    assert routes[0]["distance"] == 1
+    assert routes[0]["static"] is True
+    assert routes[1]["connected"] is True
+    assert routes[1]["dynamic"] is True
+    assert routes[1]["gateway"] == "ether1"
+
+
+@pytest.mark.parametrize("version", ["v6", "v7"])
+def test_firewall_filter_terse(version: str) -> None:
+    rules = FirewallLogsService._parse_firewall_filter_print_output(FILTER_TERSE[version])
+
+    assert [r["id"] for r in rules] == ["0", "1", "2"]
+    assert rules[0]["comment"] == "special dummy rule"
+    assert rules[1]["dst_port"] == "22"
+    assert rules[1]["comment"] == "ssh access"
+    assert rules[1]["disabled"] is False
+    assert rules[2]["disabled"] is True
+    assert rules[2]["extras"]["in-interface"] == "ether1"
+
+
+@pytest.mark.parametrize("version", ["v6", "v7"])
+def test_dhcp_lease_terse(version: str) -> None:
+    leases = DHCPService._parse_dhcp_lease_detail_output(LEASE_TERSE[version])
+
+    assert leases == [
+        {
+            "address": "192.168.88.254",
+            "mac_address": "AA:BB:CC:DD:EE:01",
+            "host_name": "phone",
+            "server": "dhcp1",
+            "status": "bound",
+            "last_seen": "1m2s",
+            "dynamic": True,
+        }
+    ]
+
+
+@pytest.mark.parametrize("version", ["v6", "v7"])
+def test_wireless_registration_terse(version: str) -> None:
+    clients = WirelessService._parse_wireless_clients_output(REGISTRATION_TERSE[version])
+
+    assert len(clients) == 1
+    assert clients[0]["mac_address"] == "AA:BB:CC:00:00:01"
+    assert clients[0]["signal_strength"] == -61
+    assert clients[0]["tx_rate"].startswith("130Mbps")
+
+
+def test_address_and_list_terse() -> None:
+    addresses = IPService._parse_ip_address_print_output(
+        " 0   address=10.0.0.2/24 network=10.0.0.0 interface=ether1\n"
+        ' 1 XI address=10.9.9.1/24 network=10.9.9.0 interface=ether9 comment="lab"\n'
+        " 2 D  address=100.64.0.5/32 network=100.64.0.1 interface=pppoe-out1\n"
+    )
+    assert [a["address"] for a in addresses] == ["10.0.0.2/24", "10.9.9.1/24", "100.64.0.5/32"]
+    assert addresses[1]["disabled"] is True
+    assert addresses[1]["invalid"] is True
+    assert addresses[1]["comment"] == "lab"
+    assert addresses[2]["dynamic"] is True
+
+    entries = FirewallLogsService._parse_address_list_print_output(
+        ' 0   list=blocked address=203.0.113.7 timeout=23h59m comment="scanner"\n'
+        " 1 D list=dyn address=198.51.100.2\n"
+    )
+    assert entries[0] == {
+        "id": "0",
+        "list": "blocked",
+        "address": "203.0.113.7",
+        "comment": "scanner",
+        "timeout": "23h59m",
+        "disabled": False,
+    }
+    assert entries[1]["list"] == "dyn"
+
+
+def test_bridge_port_terse() -> None:
+    ports = BridgeService._parse_bridge_port_print_output(
+        " 0   H interface=ether2 bridge=bridge-lan hw=yes pvid=20 horizon=none "
+        "trusted=no edge=auto point-to-point=auto frame-types=admit-all\n"
+        " 1 I   interface=cap1 bridge=bridge-lan pvid=30 bpdu-guard=yes\n"
+    )
+
+    assert [p["interface"] for p in ports] == ["ether2", "cap1"]
+    assert ports[0]["hw"] is True
+    assert ports[0]["hw_offload_flag"] is True
+    assert ports[0]["pvid"] == 20
+    assert ports[1]["disabled"] is True
+    assert ports[1]["bpdu_guard"] is True
@@ -0,0 +1,276 @@
+"""Tests for the topology graph and the topology job."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.bridge import BridgeService
+from routeros_mcp.domain.services.interface import InterfaceService
+from routeros_mcp.domain.services.ip import IPService
+from routeros_mcp.infra.jobs import runner
+from routeros_mcp.infra.jobs.runner import run_topology_job
+from routeros_mcp.infra.routeros.topology import (
+    TopologyGraph,
+    get_topology_graph,
+    initialize_topology_graph,
+    observe_device_facts,
+)
+
+CORE_UPLINK_MAC = "02:00:00:00:01:01"
+ACCESS_UPLINK_MAC = "02:00:00:00:02:01"
+
+
+def _iface(name: str, mac: str = "") -> dict[str, Any]:
+    return {"name": name, "mac_address": mac, "type": "ether"}
+
+
+def _core(graph: TopologyGraph) -> None:
+    """Core router: ether1 uplink to access-1, ether2 in the LAN bridge with a phone."""
+    graph.update_device(
+        "core",
+        name="core",
+        interfaces=[_iface("ether1", CORE_UPLINK_MAC), _iface("ether2"), _iface("bridge")],
+        bridge_ports=[{"interface": "ether2", "bridge": "bridge"}],
+        ip_addresses=[
+            {"address": "10.0.0.1/24", "interface": "bridge"},
+            {"address": "10.9.0.1/30", "interface": "ether1"},
+        ],
+        neighbors=[
+            {
+                "interface": "ether1",
+                "mac_address": ACCESS_UPLINK_MAC,
+                "identity": "access-1",
+                "interface_name": "ether1",
+            },
+            {"interface": "ether2,bridge", "mac_address": "aa:bb:cc:00:00:09", "identity": "phone"},
+        ],
+    )
+
+
+def _access(graph: TopologyGraph) -> None:
+    graph.update_device(
+        "access",
+        name="access-1",
+        interfaces=[_iface("ether1", ACCESS_UPLINK_MAC), _iface("ether5")],
+        ip_addresses=[{"address": "10.9.0.2/30", "interface": "ether1"}],
+        neighbors=[
+            {"interface": "ether1", "mac_address": CORE_UPLINK_MAC, "interface_name": "ether1"}
+        ],
+    )
+
+
+class TestTopologyGraph:
+    """Building, incremental updates and queries."""
+
+    def test_rest_string_flags(self) -> None:
+        graph = TopologyGraph()
+        graph.update_device(
+            "core",
+            interfaces=[_iface("ether2"), _iface("ether3"), _iface("bridge")],
+            bridge_ports=[
+                {"interface": "ether2", "bridge": "bridge", "disabled": "false"},
+                {"interface": "ether3", "bridge": "bridge", "disabled": "true"},
+            ],
+            ip_addresses=[
+                {"address": "10.0.0.1/24", "interface": "bridge", "disabled": "false",
+                 "invalid": "false"},
+                {"address": "10.1.0.1/24", "interface": "ether3", "disabled": "false",
+                 "invalid": "true"},
+            ],
+        )
+
+        assert graph.get_stats()["nodes"]["subnet"] == 1
+        assert [n["key"] for n in graph.connected("core:ether2")] == ["iface:core:bridge"]
+        assert [n["key"] for n in graph.connected("core:ether3")] == ["device:core"]
+
+    def test_neighbor_resolves_once_remote_device_is_known(self) -> None:
+        graph = TopologyGraph()
+        _core(graph)
+
+        assert graph.node("core:ether1")["degree"] == 3  # device, subnet, neighbour node
+        assert graph.resolve(ACCESS_UPLINK_MAC) == f"neighbor:{ACCESS_UPLINK_MAC}"
+
+        _access(graph)
+
+        stats = graph.get_stats()
+        assert stats["nodes"] == {"device": 2, "interface": 5, "subnet": 2, "neighbor": 1}
+        assert graph.resolve(ACCESS_UPLINK_MAC) == "iface:access:ether1"
+        link = next(n for n in graph.connected("core:ether1") if n["key"] == "iface:access:ether1")
+        assert link["via"] == "neighbor"
+
+    def test_path_prefers_fewest_hops(self) -> None:
+        graph = TopologyGraph()
+        _core(graph)
+        _access(graph)
+
+        hops = graph.path("core", "access")
+
+        assert [hop["key"] for hop in hops] == [
+            "device:core",
+            "iface:core:ether1",
+            "iface:access:ether1",
+            "device:access",
+        ]
+        assert [hop["via"] for hop in hops] == [None, "interface", "neighbor", "interface"]
+        assert graph.path("core", "10.0.0.77")[-1]["key"] == "subnet:10.0.0.0/24"
+
+    def test_blast_radius_of_bridge_and_uplink(self) -> None:
+        graph = TopologyGraph()
+        _core(graph)
+        _access(graph)
+
+        bridge = graph.blast_radius("core:bridge")
+        uplink = graph.blast_radius("core:ether1")
+
+        assert bridge["anchor"] == "device:core"
+        assert bridge["isolated"]["interface"] == ["iface:core:ether2"]
+        assert bridge["isolated"]["subnet"] == ["subnet:10.0.0.0/24"]
+        assert bridge["isolated"]["neighbor"] == ["neighbor:AA:BB:CC:00:00:09"]
+        assert uplink["isolated"]["device"] == ["device:access"]
+        assert uplink["isolated_devices"] == 1
+
+        from_access = graph.blast_radius("core:ether1", anchor="access")
+        assert from_access["isolated"]["device"] == ["device:core"]
+        assert "subnet:10.0.0.0/24" in from_access["isolated"]["subnet"]
+        with pytest.raises(ValueError):
+            graph.blast_radius("core", anchor="core")
+
+    def test_redundant_link_keeps_device_out_of_blast_radius(self) -> None:
+        graph = TopologyGraph()
+        _core(graph)
+        _access(graph)
+        graph.update_device(
+            "access",
+            ip_addresses=[
+                {"address": "10.9.0.2/30", "interface": "ether1"},
+                {"address": "10.0.0.2/24", "interface": "ether5"},
+            ],
+        )
+
+        assert graph.blast_radius("core:ether1")["isolated_devices"] == 0
+
+    def test_unchanged_update_is_a_no_op_and_changes_are_diffed(self) -> None:
+        graph = TopologyGraph()
+        _core(graph)
+        edges = graph.get_stats()["edges"]
+
+        assert graph.update_device("core") == {"added": 0, "removed": 0}
+        assert graph.get_stats()["edges"] == edges
+
+        counts = graph.update_device("core", neighbors=[])
+
+        assert counts == {"added": 0, "removed": 2}
+        assert graph.get_stats()["nodes"]["neighbor"] == 0
+
+    def test_remove_device_unresolves_watchers(self) -> None:
+        graph = TopologyGraph()
+        _core(graph)
+        _access(graph)
+
+        assert graph.remove_device("access") > 0
+
+        assert graph.device_ids() == ["core"]
+        assert graph.resolve(ACCESS_UPLINK_MAC) == f"neighbor:{ACCESS_UPLINK_MAC}"
+        with pytest.raises(ValueError):
+            graph.resolve("access:ether5")
+        assert graph.get_stats()["nodes"]["subnet"] == 2
+
+    def test_connected_depth_and_unknown_nodes(self) -> None:
+        graph = TopologyGraph()
+        _core(graph)
+
+        first = graph.connected("core")
+        second = graph.connected("core", depth=2)
+
+        assert {n["key"] for n in first} == {
+            "iface:core:ether1",
+            "iface:core:bridge",
+        }
+        assert {"iface:core:ether2", "subnet:10.0.0.0/24"} <= {n["key"] for n in second}
+        with pytest.raises(ValueError):
+            graph.connected("nowhere")
+        with pytest.raises(ValueError):
+            graph.connected("core", depth=0)
+
+    def test_initialize_and_observe_respect_settings(self) -> None:
+        graph = initialize_topology_graph()
+
+        observe_device_facts(Settings(), "dev-1", interfaces=[_iface("ether1")])
+        assert graph.device_ids() == []
+
+        observe_device_facts(
+            Settings(topology_enabled=True), "dev-1", interfaces=[_iface("ether1")]
+        )
+        assert get_topology_graph() is graph
+        assert graph.device_ids() == ["dev-1"]
+
+
+class _NullSessionFactory:
+    @asynccontextmanager
+    async def session(self):
+        yield None
+
+
+@pytest.fixture
+def fleet(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def eligible_devices(_session, _settings):
+        return [
+            SimpleNamespace(id="core", name="core"),
+            SimpleNamespace(id="access", name="access-1"),
+        ]
+
+    def failing_on_access(rows: dict[str, list[dict[str, Any]]]):
+        async def read(self, device_id: str):
+            if device_id == "access":
+                raise ConnectionError("connection refused")
+            return rows[device_id]
+
+        return read
+
+    monkeypatch.setattr(runner, "_get_eligible_devices", eligible_devices)
+    monkeypatch.setattr(
+        InterfaceService,
+        "list_interfaces",
+        failing_on_access({"core": [_iface("ether1", CORE_UPLINK_MAC)]}),
+    )
+    monkeypatch.setattr(BridgeService, "list_bridge_ports", failing_on_access({"core": []}))
+    monkeypatch.setattr(
+        IPService,
+        "list_addresses",
+        failing_on_access({"core": [{"address": "10.9.0.1/30", "interface": "ether1"}]}),
+    )
+    monkeypatch.setattr(
+        IPService,
+        "list_neighbors",
+        failing_on_access(
+            {"core": [{"interface": "ether1", "mac_address": "", "identity": "access-1"}]}
+        ),
+    )
+
+
+async def test_run_topology_job_builds_graph(fleet) -> None:
+    graph = get_topology_graph()
+    graph.update_device("gone", interfaces=[_iface("ether1")])
+
+    summary = await run_topology_job(_NullSessionFactory(), Settings(topology_enabled=True))
+
+    assert summary == {
+        "status": "success",
+        "total": 2,
+        "success": 1,
+        "failed": 1,
+        "nodes": 4,
+        "edges": 3,
+    }
+    assert graph.device_ids() == ["core"]
+    assert graph.resolve("10.9.0.2") == "subnet:10.9.0.0/30"
+    assert graph.node("core")["name"] == "core"
+
+
+async def test_run_topology_job_skips_when_disabled() -> None:
+    summary = await run_topology_job(_NullSessionFactory(), Settings())
+
+    assert summary == {"status": "skipped", "reason": "disabled"}
@@ -0,0 +1,173 @@
+"""Tests for interface counter rings and locally computed traffic rates."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from routeros_mcp.config import Settings
+from routeros_mcp.domain.services.interface import InterfaceService
+from routeros_mcp.infra.jobs.runner import run_interface_traffic_job
+from routeros_mcp.infra.routeros.traffic_counters import (
+    CounterRing,
+    TrafficCounterStore,
+    counter_delta,
+    get_traffic_store,
+    initialize_traffic_store,
+)
+
+T0 = 1_768_550_400.0  # 2026-01-16T08:00:00Z
+
+
+def _iface(name: str, rx_byte: int, tx_byte: int = 0, **extra: int) -> dict:
+    item = {"name": name, "rx-byte": str(rx_byte), "tx-byte": str(tx_byte)}
+    item.update({key.replace("_", "-"): str(value) for key, value in extra.items()})
+    return item
+
+
+class TestCounterDelta:
+    """Counter increase, wrap and reset handling."""
+
+    def test_increase(self) -> None:
+        assert counter_delta(100, 250) == 150
+
+    def test_32_bit_wrap_is_unwrapped(self) -> None:
+        assert counter_delta(2**32 - 100, 50) == 150
+
+    def test_decrease_without_wrap_is_a_reset(self) -> None:
+        # 64-bit counter dropping (reboot / reset-counters): count from zero
+        assert counter_delta(10**12, 5000) == 5000
+        # 32-bit value far from the top: not a plausible wrap either
+        assert counter_delta(1000, 10) == 10
+
+
+class TestCounterRing:
+    """Array-backed ring buffer."""
+
+    def test_overwrites_oldest_sample(self) -> None:
+        ring = CounterRing(3)
+        for i in range(5):
+            ring.append(float(i), [i] * 8)
+
+        assert len(ring) == 3
+        assert ring.sample(0) == (4.0, (4,) * 8)
+        assert [t for t, _ in ring] == [2.0, 3.0, 4.0]
+        with pytest.raises(IndexError):
+            ring.sample(3)
+
+    def test_stores_64_bit_counters(self) -> None:
+        ring = CounterRing(2)
+        ring.append(1.0, [2**64 - 1] + [0] * 7)
+        assert ring.sample(0)[1][0] == 2**64 - 1
+
+
+class TestTrafficCounterStore:
+    """Sampling and rate computation."""
+
+    def test_rates_from_two_newest_samples(self) -> None:
+        store = TrafficCounterStore(history_samples=4)
+        assert store.record("dev-1", [_iface("ether1", 0, 0, rx_packet=0)], T0) == 1
+        assert store.rates("dev-1") is None  # one sample only
+
+        store.record("dev-1", [_iface("ether1", 1_000_000, 500_000, rx_packet=2000)], T0 + 10)
+        rates = store.rates("dev-1", now=T0 + 11)
+
+        assert rates == [
+            {
+                "name": "ether1",
+                "rx_bits_per_second": 800_000,
+                "tx_bits_per_second": 400_000,
+                "rx_packets_per_second": 200,
+                "tx_packets_per_second": 0,
+                "rx_errors_per_second": 0,
+                "tx_errors_per_second": 0,
+                "rx_drops_per_second": 0,
+                "tx_drops_per_second": 0,
+                "interval_seconds": 10.0,
+                "sampled_at": "2026-01-16T08:00:10+00:00",
+            }
+        ]
+
+    def test_rates_require_fresh_samples_for_all_requested_interfaces(self) -> None:
+        store = TrafficCounterStore()
+        store.record("dev-1", [_iface("ether1", 0), _iface("ether2", 0)], T0)
+        store.record("dev-1", [_iface("ether1", 80), _iface("ether2", 160)], T0 + 60)
+
+        assert [r["name"] for r in store.rates("dev-1", ["ether2"])] == ["ether2"]
+        assert store.rates("dev-1", ["ether2", "vlan9"]) is None
+        assert store.rates("dev-1", max_age=120, now=T0 + 600) is None
+        assert store.rates("missing") is None
+
+    def test_removed_interfaces_are_dropped(self) -> None:
+        store = TrafficCounterStore()
+        store.record("dev-1", [_iface("ether1", 0), _iface("vlan9", 0)], T0)
+        store.record("dev-1", [_iface("ether1", 10)], T0 + 60)
+
+        assert list(store.history("dev-1")) == ["ether1"]
+        assert store.get_stats()["devices"]["dev-1"]["interfaces"] == 1
+
+    def test_history_is_column_oriented_and_handles_resets(self) -> None:
+        store = TrafficCounterStore(history_samples=3)
+        for i, rx in enumerate((0, 1000, 3000, 500)):
+            store.record("dev-1", [_iface("ether1", rx)], T0 + 10 * i)
+
+        columns = store.history("dev-1")["ether1"]
+
+        # Three samples kept -> two intervals; the drop to 500 is a reset
+        assert columns["rx_bits_per_second"] == [1600, 400]
+        assert columns["sampled_at"] == [
+            "2026-01-16T08:00:20+00:00",
+            "2026-01-16T08:00:30+00:00",
+        ]
+
+    def test_watched_devices_expire(self) -> None:
+        store = TrafficCounterStore()
+        assert store.watch("dev-1", now=T0) is True
+        assert store.watch("dev-1", now=T0 + 5) is False
+        store.watch("dev-2", now=T0 + 3000)
+        store.record("dev-3", [_iface("ether1", 0)], T0)  # never read
+
+        assert store.watched(now=T0 + 3700) == ["dev-2"]
+        assert store.samples("dev-3") == 0
+
+    def test_history_samples_validation(self) -> None:
+        with pytest.raises(ValueError):
+            TrafficCounterStore(history_samples=1)
+
+
+def test_global_store_lifecycle() -> None:
+    store = initialize_traffic_store(history_samples=10)
+    assert get_traffic_store() is store
+    assert store.history_samples == 10
+
+
+class _NullSessionFactory:
+    @asynccontextmanager
+    async def session(self):
+        yield None
+
+
+async def test_run_interface_traffic_job_samples_watched_devices(monkeypatch) -> None:
+    async def fake_collect(self, device_id):
+        if device_id == "dev-2":
+            raise RuntimeError("unreachable")
+        return 3
+
+    monkeypatch.setattr(InterfaceService, "collect_traffic_counters", fake_collect)
+    store = get_traffic_store()
+    store.watch("dev-1")
+    store.watch("dev-2")
+
+    summary = await run_interface_traffic_job(_NullSessionFactory(), Settings())
+
+    assert summary == {
+        "status": "success",
+        "total": 2,
+        "success": 1,
+        "failed": 1,
+        "interfaces_sampled": 3,
+    }
+
+    disabled = await run_interface_traffic_job(
+        _NullSessionFactory(), Settings(interface_traffic_enabled=False)
+    )
+    assert disabled == {"status": "skipped", "reason": "disabled"}